@@ -46,6 +46,9 @@ export interface Transcript {
     transcription_prompt_text: string;
     transcription_prompt_chars: number;
     transcription_prompt_words: number;
+    transcription_cached: boolean;
+    transcription_routed_from: string;
+    transcription_route_reason: string;
     retranscription_count: number;
     last_retranscription_at: string;
     last_retranscription_time_ms: number;
@@ -57,6 +60,7 @@ export interface Transcript {
     last_retranscription_prompt_text: string;
     last_retranscription_prompt_chars: number;
     last_retranscription_prompt_words: number;
+    last_retranscription_cached: boolean;
     refinement_provider: string;
     refinement_model_id: string;
     refinement_resolved_device: string;
@@ -70,6 +74,7 @@ export interface Transcript {
     refinement_prompt_tokens: number;
     refinement_completion_tokens: number;
     refinement_total_tokens: number;
+    refinement_cached: boolean;
     created_at: string;
     include_in_analytics: boolean;
     has_audio_cached: boolean;
@@ -146,9 +151,11 @@ export function refineTranscript(
     level: number,
     instructions = "",
     promptTranscriptId?: number | null,
+    auto = false,
 ): Promise<{ status: string }> {
     const body: Record<string, unknown> = { level, instructions };
     if (promptTranscriptId != null) body.prompt_transcript_id = promptTranscriptId;
+    if (auto) body.auto = true;
     return request(`/transcripts/${id}/refine`, {
         method: "POST",
         body: JSON.stringify(body),
@@ -650,6 +657,81 @@ export async function importAudioFile(file: File): Promise<{ status: string; fil
     return res.json();
 }
 
+export interface ImportJobFile {
+    position: number;
+    file_name: string;
+    status: "pending" | "completed" | "failed";
+    transcript_id: number | null;
+    failure_reason: string | null;
+    updated_at: string;
+}
+
+export interface ImportJob {
+    id: string;
+    status: "queued" | "running" | "completed" | "cancelled" | "interrupted";
+    created_at: string;
+    updated_at: string;
+    finished_at: string | null;
+    total: number;
+    completed: number;
+    failed: number;
+    pending: number;
+    files: ImportJobFile[];
+}
+
+export async function createImportJob(files: File[]): Promise<{ status: string; job_id: string; total: number }> {
+    const form = new FormData();
+    for (const file of files) form.append("data", file, file.name);
+    const res = await fetch(`${BASE}/import-jobs`, { method: "POST", body: form });
+    if (!res.ok) {
+        const body = await res.text();
+        throw new Error(`API ${res.status}: ${body}`);
+    }
+    return res.json();
+}
+
+export function getImportJobs(): Promise<{ items: ImportJob[]; total: number }> {
+    return request("/import-jobs");
+}
+
+export function resumeImportJob(jobId: string): Promise<{ status: string; job_id: string }> {
+    return request(`/import-jobs/${encodeURIComponent(jobId)}/resume`, { method: "POST" });
+}
+
+export function cancelImportJob(jobId: string): Promise<{ status: string; job_id: string }> {
+    return request(`/import-jobs/${encodeURIComponent(jobId)}/cancel`, { method: "POST" });
+}
+
+export interface CalibrationProfile {
+    kind: "asr" | "slm";
+    model_id: string;
+    cpu_model: string;
+    threads: number;
+    compute_type: string;
+    metric: "rtf" | "tokens_per_second";
+    value: number;
+    samples: Array<Record<string, string | number>>;
+    calibrated_at: number;
+}
+
+export interface CalibrationStatus {
+    running: boolean;
+    pending: Array<"asr" | "slm">;
+    current: "asr" | "slm" | null;
+    errors: Record<string, string>;
+    cpu_model: string;
+    profiles: CalibrationProfile[];
+    missing: Array<"asr" | "slm">;
+}
+
+export function getCalibration(): Promise<CalibrationStatus> {
+    return request("/calibration");
+}
+
+export function startCalibration(kinds: Array<"asr" | "slm"> = ["asr", "slm"]): Promise<CalibrationStatus> {
+    return request("/calibration", { method: "POST", body: JSON.stringify({ kinds }) });
+}
+
 export function restartEngine(): Promise<{ status: string }> {
     return request("/engine/restart", { method: "POST" });
 }
@@ -10,6 +10,15 @@ export interface VociferousConfig {
         language?: string;
         n_threads?: number;
         compute_type?: string;
+        batched_min_seconds?: number;
+        batch_size?: number;
+        worker_process?: boolean;
+        latency_budget_s?: number;
+        retranscribe_routed?: boolean;
+        two_pass?: boolean;
+        race_providers?: boolean;
+        race_hedge_ms?: number;
+        result_cache_max_entries?: number;
         initial_prompt?: string;
         groq?: {
             base_url?: string;
@@ -21,6 +30,10 @@ export interface VociferousConfig {
             temperature?: number;
             max_retries?: number;
             retry_backoff_seconds?: number;
+            upload_format?: "flac" | "opus" | "wav";
+            max_chunk_seconds?: number;
+            max_upload_bytes?: number;
+            upload_concurrency?: number;
         };
     };
     recording?: {
@@ -63,6 +76,18 @@ export interface VociferousConfig {
         n_gpu_layers?: number;
         n_threads?: number;
         smart_refinement?: boolean;
+        bulk_batch_size?: number;
+        worker_process?: boolean;
+        result_cache_max_entries?: number;
+        cache_sampled_results?: boolean;
+        selective_refinement?: boolean;
+        selective_threshold?: number;
+        chunk_threshold_words?: number;
+        chunk_max_tokens?: number;
+        chunk_overlap_tokens?: number;
+        chunk_concurrency?: number;
+        race_providers?: boolean;
+        race_hedge_ms?: number;
         use_thinking?: boolean;
         temperature?: number;
         top_p?: number;
@@ -79,6 +104,7 @@ export interface VociferousConfig {
             timeout_seconds?: number;
             max_output_tokens?: number;
             model_list_enabled?: boolean;
+            bulk_concurrency?: number;
         };
         groq?: {
             base_url?: string;
@@ -88,6 +114,7 @@ export interface VociferousConfig {
             timeout_seconds?: number;
             max_output_tokens?: number;
             model_list_enabled?: boolean;
+            bulk_concurrency?: number;
             max_retries?: number;
             retry_backoff_seconds?: number;
         };
@@ -95,6 +122,23 @@ export interface VociferousConfig {
     display?: {
         ui_scale?: number;
     };
+    residency?: {
+        ram_budget_mb?: number;
+        vram_budget_mb?: number;
+        asr_idle_minutes?: number;
+        slm_idle_minutes?: number;
+        predictive_reload?: boolean;
+        warmup_after_load?: boolean;
+        hot_swap?: boolean;
+    };
+    cpu?: {
+        partition?: boolean;
+        reserved_cores?: number;
+        asr_share?: number;
+    };
+    secrets?: {
+        credential_cache_ttl_seconds?: number;
+    };
     [key: string]: unknown;
 }
 
@@ -105,6 +149,15 @@ export interface ConfigValueByPath {
     "model.language": string;
     "model.model": string;
     "model.n_threads": number;
+    "model.batched_min_seconds": number;
+    "model.batch_size": number;
+    "model.worker_process": boolean;
+    "model.latency_budget_s": number;
+    "model.retranscribe_routed": boolean;
+    "model.two_pass": boolean;
+    "model.race_providers": boolean;
+    "model.race_hedge_ms": number;
+    "model.result_cache_max_entries": number;
     "model.provider": "local_faster_whisper" | "groq";
     "model.groq.base_url": string;
     "model.groq.model_id": string;
@@ -115,6 +168,10 @@ export interface ConfigValueByPath {
     "model.groq.temperature": number;
     "model.groq.max_retries": number;
     "model.groq.retry_backoff_seconds": number;
+    "model.groq.upload_format": "flac" | "opus" | "wav";
+    "model.groq.max_chunk_seconds": number;
+    "model.groq.max_upload_bytes": number;
+    "model.groq.upload_concurrency": number;
     "output.add_trailing_space": boolean;
     "output.auto_copy_to_clipboard": boolean;
     "output.auto_refine": boolean;
@@ -133,6 +190,18 @@ export interface ConfigValueByPath {
     "refinement.n_gpu_layers": number;
     "refinement.n_threads": number;
     "refinement.smart_refinement": boolean;
+    "refinement.bulk_batch_size": number;
+    "refinement.worker_process": boolean;
+    "refinement.result_cache_max_entries": number;
+    "refinement.cache_sampled_results": boolean;
+    "refinement.selective_refinement": boolean;
+    "refinement.selective_threshold": number;
+    "refinement.chunk_threshold_words": number;
+    "refinement.chunk_max_tokens": number;
+    "refinement.chunk_overlap_tokens": number;
+    "refinement.chunk_concurrency": number;
+    "refinement.race_providers": boolean;
+    "refinement.race_hedge_ms": number;
     "refinement.repetition_penalty": number;
     "refinement.temperature": number;
     "refinement.top_k": number;
@@ -145,6 +214,7 @@ export interface ConfigValueByPath {
     "refinement.lm_studio.timeout_seconds": number;
     "refinement.lm_studio.max_output_tokens": number;
     "refinement.lm_studio.model_list_enabled": boolean;
+    "refinement.lm_studio.bulk_concurrency": number;
     "refinement.groq.base_url": string;
     "refinement.groq.model_id": string;
     "refinement.groq.api_key_env": string | null;
@@ -152,8 +222,20 @@ export interface ConfigValueByPath {
     "refinement.groq.timeout_seconds": number;
     "refinement.groq.max_output_tokens": number;
     "refinement.groq.model_list_enabled": boolean;
+    "refinement.groq.bulk_concurrency": number;
     "refinement.groq.max_retries": number;
     "refinement.groq.retry_backoff_seconds": number;
+    "residency.ram_budget_mb": number;
+    "residency.vram_budget_mb": number;
+    "residency.asr_idle_minutes": number;
+    "residency.slm_idle_minutes": number;
+    "residency.predictive_reload": boolean;
+    "residency.warmup_after_load": boolean;
+    "residency.hot_swap": boolean;
+    "cpu.partition": boolean;
+    "cpu.reserved_cores": number;
+    "cpu.asr_share": number;
+    "secrets.credential_cache_ttl_seconds": number;
     "safety.confirm_delete": boolean;
     "user.name": string;
     "user.typing_wpm": number;
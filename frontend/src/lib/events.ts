@@ -27,6 +27,41 @@ export interface TranscriptionErrorData {
     message: string;
 }
 
+export interface ImportProgressData {
+    file_name: string;
+    decoded_seconds: number;
+    transcribed_seconds: number;
+    job_id?: string;
+    file_index?: number;
+}
+
+export interface ImportJobStartedData {
+    job_id: string;
+    total: number;
+    completed: number;
+    failed: number;
+    file_names: string[];
+}
+
+export interface ImportJobProgressData {
+    job_id: string;
+    total: number;
+    completed: number;
+    failed: number;
+    file_index: number;
+    file_name: string;
+    status: "completed" | "failed";
+}
+
+export interface ImportJobCompleteData {
+    job_id: string;
+    total: number;
+    completed: number;
+    failed: number;
+    cancelled: boolean;
+    status: "completed" | "cancelled" | "interrupted";
+}
+
 export interface AudioLevelData {
     level: number;
 }
@@ -107,7 +142,7 @@ export interface ConfigUpdatedData {
 export interface EngineStatusData {
     asr?: string;
     slm?: string;
-    // Input handler status events use a different shape.
+    // Input handler, startup stage and residency events use a different shape.
     component?: string;
     status?: string;
     message?: string;
@@ -166,6 +201,10 @@ export interface WSEventMap {
     recording_stopped: RecordingStoppedData;
     transcription_complete: TranscriptionCompleteData;
     transcription_error: TranscriptionErrorData;
+    import_progress: ImportProgressData;
+    import_job_started: ImportJobStartedData;
+    import_job_progress: ImportJobProgressData;
+    import_job_complete: ImportJobCompleteData;
     audio_level: AudioLevelData;
     refinement_started: RefinementStartedData;
     refinement_complete: RefinementCompleteData;
@@ -214,6 +253,9 @@ const isBoolean = (value: unknown): value is boolean => typeof value === "boolea
 const isNumberArray = (value: unknown): value is number[] =>
     Array.isArray(value) && value.every((item) => isNumber(item));
 
+const isStringArray = (value: unknown): value is string[] =>
+    Array.isArray(value) && value.every((item) => isString(item));
+
 const isDownloadStatus = (
     value: unknown,
 ): value is DownloadProgressData["status"] =>
@@ -236,6 +278,37 @@ export const wsEventValidators: {
         isNumber(data.speech_duration_ms),
     transcription_error: (data): data is TranscriptionErrorData =>
         isObject(data) && isString(data.message),
+    import_progress: (data): data is ImportProgressData =>
+        isObject(data) &&
+        isString(data.file_name) &&
+        isNumber(data.decoded_seconds) &&
+        isNumber(data.transcribed_seconds) &&
+        (data.job_id === undefined || isString(data.job_id)) &&
+        (data.file_index === undefined || isNumber(data.file_index)),
+    import_job_started: (data): data is ImportJobStartedData =>
+        isObject(data) &&
+        isString(data.job_id) &&
+        isNumber(data.total) &&
+        isNumber(data.completed) &&
+        isNumber(data.failed) &&
+        isStringArray(data.file_names),
+    import_job_progress: (data): data is ImportJobProgressData =>
+        isObject(data) &&
+        isString(data.job_id) &&
+        isNumber(data.total) &&
+        isNumber(data.completed) &&
+        isNumber(data.failed) &&
+        isNumber(data.file_index) &&
+        isString(data.file_name) &&
+        (data.status === "completed" || data.status === "failed"),
+    import_job_complete: (data): data is ImportJobCompleteData =>
+        isObject(data) &&
+        isString(data.job_id) &&
+        isNumber(data.total) &&
+        isNumber(data.completed) &&
+        isNumber(data.failed) &&
+        isBoolean(data.cancelled) &&
+        (data.status === "completed" || data.status === "cancelled" || data.status === "interrupted"),
     audio_level: (data): data is AudioLevelData =>
         isObject(data) && isNumber(data.level),
     refinement_started: (data): data is RefinementStartedData =>
@@ -0,0 +1,219 @@
+"""
+Local ASR Benchmark — sequential vs batched faster-whisper decoding.
+
+Tiles a fixture recording out to each target length, runs it through the
+full local ``transcribe()`` path (AudioPipeline VAD + faster-whisper) once
+window by window and once through ``BatchedInferencePipeline``, and reports
+the real-time factor of each plus the word error rate between them (and
+against a reference transcript when one is given).
+
+Usage:
+    python -m scripts.asr_benchmark --audio fixture.wav
+    python -m scripts.asr_benchmark --audio fixture.wav --reference fixture.txt --minutes 1 5 60
+    python -m scripts.asr_benchmark --audio fixture.wav --batch-size 4 8 16 --csv asr.csv
+
+Requires a provisioned ASR model (run provisioning first).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SAMPLE_RATE = 16_000
+# Pause inserted between fixture repetitions so VAD sees separate utterances.
+_GAP_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class AsrBenchmarkResult:
+    """One fixture length decoded sequentially and batched."""
+
+    minutes: float
+    batch_size: int
+    sequential_s: float
+    batched_s: float
+    sequential_rtf: float
+    batched_rtf: float
+    speedup: float
+    wer_batched_vs_sequential: float
+    wer_sequential: float | None
+    wer_batched: float | None
+    model_id: str
+
+
+def _normalise_words(text: str) -> list[str]:
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level Levenshtein distance over the reference length (0.0 = identical)."""
+    ref, hyp = _normalise_words(reference), _normalise_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, word in enumerate(ref, start=1):
+        current = [i]
+        for j, other in enumerate(hyp, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (word != other)))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def _tile(audio: np.ndarray, minutes: float) -> tuple[np.ndarray, int]:
+    """Repeat ``audio`` (int16) with short pauses until it is ``minutes`` long."""
+    rng = np.random.default_rng(0)
+    gap = rng.normal(0, 3, int(_GAP_SECONDS * SAMPLE_RATE)).astype(np.int16)
+    target = int(minutes * 60 * SAMPLE_RATE)
+    parts: list[np.ndarray] = []
+    total = repeats = 0
+    while total < target:
+        parts += [audio, gap]
+        total += len(audio) + len(gap)
+        repeats += 1
+    return np.concatenate(parts)[:target], repeats
+
+
+def _timed(audio: np.ndarray, settings, model, pipeline) -> tuple[str, float]:  # noqa: ANN001
+    from src.services.transcription_service import transcribe
+
+    start = time.perf_counter()
+    text, _, _ = transcribe(audio, settings, local_model=model, audio_pipeline=pipeline)
+    return text, time.perf_counter() - start
+
+
+def run_benchmark(
+    fixture: np.ndarray,
+    reference: str | None,
+    minutes: list[float],
+    batch_sizes: list[int],
+) -> list[AsrBenchmarkResult]:
+    from src.core.settings import get_settings
+    from src.services.audio_pipeline import AudioPipeline
+    from src.services.transcription_service import create_local_model
+
+    base = get_settings()
+    model = create_local_model(base)
+    pipeline = AudioPipeline(sample_rate=SAMPLE_RATE)
+    sequential_settings = base.model_copy(update={"model": base.model.model_copy(update={"batched_min_seconds": 0.0})})
+
+    results: list[AsrBenchmarkResult] = []
+    for length in minutes:
+        audio, repeats = _tile(fixture, length)
+        audio_s = len(audio) / SAMPLE_RATE
+        full_reference = " ".join([reference] * repeats) if reference else None
+        print(f"\n{length:g} min ({repeats} fixture repetitions)")
+
+        sequential_text, sequential_s = _timed(audio, sequential_settings, model, pipeline)
+        print(f"  sequential: {sequential_s:.1f}s (RTF {sequential_s / audio_s:.3f})")
+
+        for batch_size in batch_sizes:
+            batched_settings = base.model_copy(
+                update={"model": base.model.model_copy(update={"batched_min_seconds": 0.01, "batch_size": batch_size})}
+            )
+            batched_text, batched_s = _timed(audio, batched_settings, model, pipeline)
+            result = AsrBenchmarkResult(
+                minutes=length,
+                batch_size=batch_size,
+                sequential_s=round(sequential_s, 2),
+                batched_s=round(batched_s, 2),
+                sequential_rtf=round(sequential_s / audio_s, 4),
+                batched_rtf=round(batched_s / audio_s, 4),
+                speedup=round(sequential_s / batched_s, 2) if batched_s else 0.0,
+                wer_batched_vs_sequential=round(word_error_rate(sequential_text, batched_text), 4),
+                wer_sequential=round(word_error_rate(full_reference, sequential_text), 4) if full_reference else None,
+                wer_batched=round(word_error_rate(full_reference, batched_text), 4) if full_reference else None,
+                model_id=base.model.model,
+            )
+            results.append(result)
+            print(
+                f"  batched (batch_size={batch_size}): {batched_s:.1f}s (RTF {result.batched_rtf:.3f}, "
+                f"{result.speedup:.2f}x), WER vs sequential {result.wer_batched_vs_sequential:.3f}"
+            )
+    return results
+
+
+def _print_summary(results: list[AsrBenchmarkResult]) -> None:
+    print("\n" + "=" * 96)
+    print(
+        f"{'min':>5} {'batch':>5} {'seq RTF':>8} {'bat RTF':>8} {'speedup':>8} "
+        f"{'WER b/s':>8} {'WER seq':>8} {'WER bat':>8}"
+    )
+    for r in results:
+        wer_seq = f"{r.wer_sequential:.3f}" if r.wer_sequential is not None else "-"
+        wer_bat = f"{r.wer_batched:.3f}" if r.wer_batched is not None else "-"
+        print(
+            f"{r.minutes:>5g} {r.batch_size:>5} {r.sequential_rtf:>8.3f} {r.batched_rtf:>8.3f} "
+            f"{r.speedup:>7.2f}x {r.wer_batched_vs_sequential:>8.3f} {wer_seq:>8} {wer_bat:>8}"
+        )
+
+
+def _write_csv(results: list[AsrBenchmarkResult], path: Path) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(asdict(results[0])))
+        writer.writeheader()
+        for result in results:
+            writer.writerow(asdict(result))
+    print(f"\nResults written to {path}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Local ASR Benchmark — sequential vs batched faster-whisper decoding.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--audio", type=str, required=True, help="Fixture recording (any format ffmpeg reads).")
+    parser.add_argument("--reference", type=str, default="", help="Reference transcript of the fixture (text file).")
+    parser.add_argument(
+        "--minutes",
+        type=float,
+        nargs="+",
+        default=[1, 5, 60],
+        help="Lengths to tile the fixture out to (default: 1 5 60).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        nargs="+",
+        default=[8],
+        help="Batch sizes for the batched pipeline (default: 8).",
+    )
+    parser.add_argument("--csv", type=str, default="", help="Output CSV file path.")
+    return parser
+
+
+def main() -> int:
+    from faster_whisper import decode_audio
+
+    from src.core.settings import init_settings
+
+    args = _build_parser().parse_args()
+    init_settings()
+
+    audio_path = Path(args.audio)
+    if not audio_path.exists():
+        print(f"ERROR: Audio fixture not found: {audio_path}")
+        return 1
+    fixture = (np.clip(decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE), -1.0, 1.0) * 32767).astype(np.int16)
+    reference = Path(args.reference).read_text(encoding="utf-8").strip() if args.reference else None
+
+    results = run_benchmark(fixture, reference, sorted(args.minutes), args.batch_size)
+    _print_summary(results)
+    if args.csv and results:
+        _write_csv(results, Path(args.csv))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,225 @@
+"""
+CPU Partition Benchmark — concurrent dictation and refinement, pinned vs free-for-all.
+
+Loads the configured local Whisper model and local SLM on the CPU in a fresh
+process and runs both at once: one thread transcribes the fixture in a loop
+while another refines a transcript in a loop, the way auto-refine overlaps
+them during dictation. Runs once with ``cpu.partition`` off (both engines
+sized for the whole machine, scheduled anywhere) and once with it on
+(``src.services.cpu_partition``: disjoint core sets, reserved cores, capped
+thread counts), and reports per-engine throughput and p95 call latency.
+
+Usage:
+    python -m scripts.cpu_partition_benchmark --audio fixture.wav
+    python -m scripts.cpu_partition_benchmark --audio fixture.wav --seconds 120 --share 0.6
+    python -m scripts.cpu_partition_benchmark --audio fixture.wav --csv partition.csv
+
+Requires provisioned models (run provisioning first).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import multiprocessing
+import statistics
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SAMPLE_RATE = 16_000
+MODES = ("free", "partitioned")
+
+
+@dataclass(slots=True)
+class PartitionBenchmarkResult:
+    """One engine's throughput and latency while both engines run."""
+
+    mode: str
+    engine: str
+    threads: int
+    cpus: str
+    calls: int
+    per_minute: float
+    p50_ms: float
+    p95_ms: float
+
+
+def _summarise(mode: str, engine: str, threads: int, cpus: str, durations: list[float], seconds: float):
+    ordered = sorted(durations) or [0.0]
+    quantiles = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else ordered * 99
+    return PartitionBenchmarkResult(
+        mode=mode,
+        engine=engine,
+        threads=threads,
+        cpus=cpus,
+        calls=len(durations),
+        per_minute=round(len(durations) * 60.0 / seconds, 2),
+        p50_ms=round(statistics.median(ordered) * 1000, 1),
+        p95_ms=round(quantiles[94] * 1000, 1),
+    )
+
+
+def _child(mode: str, audio: np.ndarray, text: str, seconds: float, share: float, reserved: int) -> list[dict]:
+    from src.core.settings import init_settings
+    from src.refinement.providers import make_refinement_provider
+    from src.services.audio_pipeline import AudioPipeline
+    from src.services.cpu_partition import SLM, CorePartitioner, engine_busy, install_core_partitioner
+    from src.services.transcription_service import create_local_model, transcribe
+
+    settings = init_settings()
+    settings = settings.model_copy(
+        update={
+            "model": settings.model.model_copy(update={"device": "cpu", "worker_process": False}),
+            "refinement": settings.refinement.model_copy(
+                update={"enabled": True, "provider": "local_ct2", "n_gpu_layers": 0, "worker_process": False}
+            ),
+            "cpu": settings.cpu.model_copy(
+                update={"partition": mode == "partitioned", "asr_share": share, "reserved_cores": reserved}
+            ),
+        }
+    )
+    partitioner = CorePartitioner(lambda: settings)
+    install_core_partitioner(partitioner)
+
+    model = create_local_model(settings)
+    provider = make_refinement_provider(settings)
+    provider.load()
+    pipeline = AudioPipeline(sample_rate=SAMPLE_RATE)
+    pipeline._load_vad_model()
+    refine_kwargs = {"temperature": 0.0, "top_p": 1.0, "top_k": 1, "repetition_penalty": 1.0, "use_thinking": False}
+
+    def refine() -> None:
+        with engine_busy(SLM):  # what SLMRuntime does around each request
+            provider.refine(text, **refine_kwargs)
+
+    transcribe(audio, settings, local_model=model, audio_pipeline=pipeline)  # warm up both engines
+    refine()
+
+    stop = threading.Event()
+    timings: dict[str, list[float]] = {"asr": [], "slm": []}
+
+    def loop(engine: str, call) -> None:
+        while not stop.is_set():
+            start = time.perf_counter()
+            call()
+            timings[engine].append(time.perf_counter() - start)
+
+    workers = [
+        threading.Thread(
+            target=loop,
+            args=("asr", lambda: transcribe(audio, settings, local_model=model, audio_pipeline=pipeline)),
+            daemon=True,
+        ),
+        threading.Thread(target=loop, args=("slm", refine), daemon=True),
+    ]
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+
+    plan = partitioner.plan()
+    summaries = {
+        "asr": model._vociferous_runtime_summary,
+        "slm": provider.get_runtime_summary(),
+    }
+    rows = []
+    for engine in ("asr", "slm"):
+        cpus = ",".join(str(cpu) for cpu in plan.cpus(engine)) or "all"
+        threads = int(summaries[engine].get("cpu_threads") or 0)
+        rows.append(asdict(_summarise(mode, engine, threads, cpus, timings[engine], seconds)))
+    provider.unload()
+    install_core_partitioner(None)
+    return rows
+
+
+def run_benchmark(
+    audio: np.ndarray, text: str, seconds: float, share: float, reserved: int
+) -> list[PartitionBenchmarkResult]:
+    # A fresh interpreter per mode so neither inherits the other's pins or thread pools.
+    context = multiprocessing.get_context("spawn")
+    results: list[PartitionBenchmarkResult] = []
+    for mode in MODES:
+        with context.Pool(1) as pool:
+            rows = pool.apply(_child, (mode, audio, text, seconds, share, reserved))
+        for row in rows:
+            result = PartitionBenchmarkResult(**row)
+            results.append(result)
+            print(f"{mode} {result.engine}: {result.per_minute:.1f}/min, p95 {result.p95_ms:.0f} ms")
+    return results
+
+
+def _print_summary(results: list[PartitionBenchmarkResult]) -> None:
+    print("\n" + "=" * 84)
+    print(f"{'mode':>12} {'engine':>6} {'thr':>4} {'cpus':>16} {'calls':>6} {'/min':>8} {'p50 ms':>9} {'p95 ms':>9}")
+    for r in results:
+        print(
+            f"{r.mode:>12} {r.engine:>6} {r.threads:>4} {r.cpus[:16]:>16} {r.calls:>6} "
+            f"{r.per_minute:>8.1f} {r.p50_ms:>9.1f} {r.p95_ms:>9.1f}"
+        )
+
+
+def _write_csv(results: list[PartitionBenchmarkResult], path: Path) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(asdict(results[0])))
+        writer.writeheader()
+        for result in results:
+            writer.writerow(asdict(result))
+    print(f"\nResults written to {path}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="CPU Partition Benchmark — concurrent dictation and refinement, pinned vs free-for-all.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--audio", type=str, required=True, help="Fixture to transcribe (any format ffmpeg reads).")
+    parser.add_argument(
+        "--text",
+        type=str,
+        default="",
+        help="Transcript to refine in the loop (default: the fixture's own transcript).",
+    )
+    parser.add_argument("--seconds", type=float, default=60.0, help="Concurrent run length per mode (default: 60).")
+    parser.add_argument("--share", type=float, default=0.5, help="cpu.asr_share for the partitioned run.")
+    parser.add_argument("--reserved", type=int, default=1, help="cpu.reserved_cores for the partitioned run.")
+    parser.add_argument("--csv", type=str, default="", help="Output CSV file path.")
+    return parser
+
+
+def main() -> int:
+    from faster_whisper import decode_audio
+
+    args = _build_parser().parse_args()
+    audio_path = Path(args.audio)
+    if not audio_path.exists():
+        print(f"ERROR: Audio fixture not found: {audio_path}")
+        return 1
+    audio = (np.clip(decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE), -1.0, 1.0) * 32767).astype(np.int16)
+    text = args.text
+    if not text:
+        from src.core.settings import init_settings
+        from src.services.transcription_service import create_local_model, transcribe
+
+        settings = init_settings()
+        text, _, _ = transcribe(audio, settings, local_model=create_local_model(settings))
+
+    results = run_benchmark(audio, text, max(5.0, args.seconds), args.share, max(0, args.reserved))
+    _print_summary(results)
+    if args.csv and results:
+        _write_csv(results, Path(args.csv))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
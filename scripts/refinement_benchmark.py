@@ -10,6 +10,10 @@ Usage:
     python -m scripts.refinement_benchmark --corpus scripts/benchmark_corpus.json
     python -m scripts.refinement_benchmark --runs 3 --threads 4 8 --bucket short
     python -m scripts.refinement_benchmark --csv results.csv
+    python -m scripts.refinement_benchmark --bulk 200 --batch-sizes 1 2 4 8 16 --threads 8
+    python -m scripts.refinement_benchmark --preemption 900 --runs 5 --threads 8
+    python -m scripts.refinement_benchmark --selective --threads 8
+    python -m scripts.refinement_benchmark --chunked 500 2000 8000 --threads 8
 
 Requires a provisioned SLM model (run provisioning first).
 """
@@ -50,6 +54,71 @@ class BenchmarkResult:
     refinement_need_score: float
 
 
+@dataclass(slots=True)
+class BulkBenchmarkResult:
+    """One batched bulk-refinement sweep point."""
+
+    batch_size: int
+    thread_count: int
+    transcripts: int
+    wall_time_s: float
+    transcripts_per_min: float
+    output_tokens: int
+    model_id: str
+
+
+@dataclass(slots=True)
+class PreemptionBenchmarkResult:
+    """Interactive-refine wait while a long bulk item is mid-generation."""
+
+    trial: int
+    bulk_words: int
+    interrupt_at_s: float
+    bulk_full_s: float
+    wait_without_preemption_s: float
+    wait_with_preemption_s: float
+    interactive_refine_s: float
+    thread_count: int
+    model_id: str
+
+
+@dataclass(slots=True)
+class SelectiveBenchmarkResult:
+    """Full vs selective (sentence-level) refinement of one input."""
+
+    sample_id: str
+    bucket: str
+    variant: str
+    input_words: int
+    regions: int
+    refined_char_pct: float
+    full_tokens: int
+    selective_tokens: int
+    token_savings_pct: float
+    full_s: float
+    selective_s: float
+    edit_distance: float
+    thread_count: int
+    model_id: str
+
+
+@dataclass(slots=True)
+class ChunkedBenchmarkResult:
+    """Single-shot vs chunked refinement of one long input."""
+
+    words: int
+    chunks: int
+    single_s: float
+    chunked_s: float
+    first_chunk_s: float
+    max_chunk_s: float
+    single_tokens: int
+    chunked_tokens: int
+    edit_distance: float
+    thread_count: int
+    model_id: str
+
+
 class _SLMModelLike(Protocol):
     repo: str
     model_file: str
@@ -247,6 +316,385 @@ def run_benchmark(
     return results
 
 
+def run_bulk_benchmark(
+    thread_count: int,
+    corpus: dict[str, list[dict[str, str]]],
+    buckets: list[str],
+    transcript_count: int,
+    batch_sizes: list[int],
+    model_id: str,
+) -> list[BulkBenchmarkResult]:
+    """Bulk-refine ``transcript_count`` corpus samples once per batch size."""
+    from src.core.model_registry import get_slm_model
+    from src.core.settings import get_settings
+
+    settings = get_settings()
+    slm_model = get_slm_model(model_id)
+    if slm_model is None:
+        print(f"ERROR: Unknown model_id '{model_id}'")
+        sys.exit(1)
+
+    samples = [sample["text"] for bucket in buckets for sample in corpus.get(bucket, [])]
+    if not samples:
+        print("ERROR: No corpus samples in the selected buckets.")
+        sys.exit(1)
+    # Cycle the corpus to the requested size, mixing lengths like a real backlog.
+    texts = [samples[i % len(samples)] for i in range(transcript_count)]
+
+    ref_settings = settings.refinement
+    engine = _load_engine(_resolve_model_dir(slm_model), ref_settings, thread_count)
+
+    print(f"\n{'=' * 70}")
+    print("  Bulk Refinement Batch-Size Sweep")
+    print(f"  Model: {slm_model.name} ({model_id})  threads={thread_count}")
+    print(f"  Transcripts: {transcript_count}  Batch sizes: {batch_sizes}")
+    print(f"{'=' * 70}\n")
+
+    results: list[BulkBenchmarkResult] = []
+    for batch_size in batch_sizes:
+        t0 = time.perf_counter()
+        outputs = engine.refine_batch(
+            texts,
+            temperature=ref_settings.temperature,
+            top_p=ref_settings.top_p,
+            top_k=ref_settings.top_k,
+            repetition_penalty=ref_settings.repetition_penalty,
+            use_thinking=False,
+            allow_skip=False,
+            max_batch_size=batch_size,
+        )
+        wall_time = time.perf_counter() - t0
+        r = BulkBenchmarkResult(
+            batch_size=batch_size,
+            thread_count=thread_count,
+            transcripts=len(texts),
+            wall_time_s=round(wall_time, 3),
+            transcripts_per_min=round(len(texts) * 60.0 / wall_time, 2) if wall_time > 0 else 0.0,
+            output_tokens=sum(o.completion_tokens for o in outputs if o is not None),
+            model_id=model_id,
+        )
+        results.append(r)
+        print(
+            f"    batch={r.batch_size:>2} | {r.wall_time_s:>8.1f}s "
+            f"| {r.transcripts_per_min:>7.1f} transcripts/min "
+            f"| out={r.output_tokens}tok"
+        )
+
+    del engine
+    return results
+
+
+def _build_long_text(corpus: dict[str, list[dict[str, str]]], buckets: list[str], words: int) -> str:
+    """Concatenate corpus samples until the text is exactly ``words`` words long."""
+    samples = [sample["text"] for bucket in buckets for sample in corpus.get(bucket, [])]
+    collected: list[str] = []
+    while len(collected) < words and samples:
+        for text in samples:
+            collected.extend(text.split())
+    return " ".join(collected[:words])
+
+
+def _word_edit_distance(a: str, b: str) -> float:
+    """Word-level Levenshtein distance normalised by the longer text (0.0 = identical)."""
+    left, right = a.split(), b.split()
+    if not left and not right:
+        return 0.0
+    previous = list(range(len(right) + 1))
+    for i, word in enumerate(left, start=1):
+        current = [i]
+        for j, other in enumerate(right, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (word != other)))
+        previous = current
+    return previous[-1] / max(len(left), len(right))
+
+
+def run_selective_benchmark(
+    thread_count: int,
+    corpus: dict[str, list[dict[str, str]]],
+    buckets: list[str],
+    model_id: str,
+) -> list[SelectiveBenchmarkResult]:
+    """Compare full and selective refinement per corpus sample.
+
+    The corpus is raw, unpunctuated ASR, so every sentence scores as dirty
+    and the "raw" variant shows the planner's overhead floor. The "mixed"
+    variant prepends the sample's own full refinement as a clean paragraph,
+    approximating a long punctuated transcript with one messy stretch.
+    Edit distance compares the selective output with full refinement of the
+    same input.
+    """
+    from src.core.model_registry import get_slm_model
+    from src.core.settings import get_settings
+    from src.refinement.selective import plan_selective_refinement
+
+    settings = get_settings()
+    slm_model = get_slm_model(model_id)
+    if slm_model is None:
+        print(f"ERROR: Unknown model_id '{model_id}'")
+        sys.exit(1)
+
+    ref_settings = settings.refinement
+    engine = _load_engine(_resolve_model_dir(slm_model), ref_settings, thread_count)
+    options = {
+        "temperature": ref_settings.temperature,
+        "top_p": ref_settings.top_p,
+        "top_k": ref_settings.top_k,
+        "repetition_penalty": ref_settings.repetition_penalty,
+        "use_thinking": False,
+        "allow_skip": False,
+    }
+
+    print(f"\n{'=' * 70}")
+    print("  Selective Refinement Benchmark")
+    print(f"  Model: {slm_model.name} ({model_id})  threads={thread_count}")
+    print(f"  Threshold: {ref_settings.selective_threshold}")
+    print(f"{'=' * 70}\n")
+
+    def full(text: str) -> tuple[str, int, float]:
+        t0 = time.perf_counter()
+        result = engine.refine(text, **options)
+        return result.content, result.total_tokens, time.perf_counter() - t0
+
+    results: list[SelectiveBenchmarkResult] = []
+    for bucket in buckets:
+        for sample in corpus.get(bucket, []):
+            reference, _, _ = full(sample["text"])
+            variants = {"raw": sample["text"], "mixed": f"{reference}\n\n{sample['text']}"}
+            for variant, text in variants.items():
+                full_text, full_tokens, full_s = full(text)
+
+                plan = plan_selective_refinement(text, threshold=ref_settings.selective_threshold)
+                t0 = time.perf_counter()
+                outputs = engine.refine_batch(plan.regions, max_batch_size=ref_settings.bulk_batch_size, **options)
+                selective_s = time.perf_counter() - t0
+                selective_text = plan.stitch([o.content if o is not None else None for o in outputs])
+                selective_tokens = sum(o.total_tokens for o in outputs if o is not None)
+
+                r = SelectiveBenchmarkResult(
+                    sample_id=sample["id"],
+                    bucket=bucket,
+                    variant=variant,
+                    input_words=_count_words(text),
+                    regions=len(plan.regions),
+                    refined_char_pct=round(100.0 * plan.refine_chars / plan.total_chars, 1)
+                    if plan.total_chars
+                    else 0.0,
+                    full_tokens=full_tokens,
+                    selective_tokens=selective_tokens,
+                    token_savings_pct=round(100.0 * (1 - selective_tokens / full_tokens), 1) if full_tokens else 0.0,
+                    full_s=round(full_s, 3),
+                    selective_s=round(selective_s, 3),
+                    edit_distance=round(_word_edit_distance(selective_text, full_text), 3),
+                    thread_count=thread_count,
+                    model_id=model_id,
+                )
+                results.append(r)
+                print(
+                    f"    {r.sample_id:<12} {r.variant:<6} | regions={r.regions} ({r.refined_char_pct:>5.1f}% chars) "
+                    f"| tokens {r.full_tokens:>5} -> {r.selective_tokens:>5} "
+                    f"| {r.full_s:>6.1f}s -> {r.selective_s:>6.1f}s | edit={r.edit_distance:.3f}"
+                )
+
+    return results
+
+
+def run_chunked_benchmark(
+    thread_count: int,
+    corpus: dict[str, list[dict[str, str]]],
+    buckets: list[str],
+    word_counts: list[int],
+    model_id: str,
+) -> list[ChunkedBenchmarkResult]:
+    """Compare single-shot and chunked refinement at each input length.
+
+    Chunks run as one batched ``refine_batch`` call, as the app does for a
+    local engine. ``first_chunk_s`` and ``max_chunk_s`` show how soon
+    progress appears and how long the longest uninterruptible step is. If a
+    single-shot run fails (for example, the context is exceeded), it is
+    reported as NaN.
+    """
+    from src.core.model_registry import get_slm_model
+    from src.core.settings import get_settings
+    from src.refinement.chunking import plan_chunks
+
+    settings = get_settings()
+    slm_model = get_slm_model(model_id)
+    if slm_model is None:
+        print(f"ERROR: Unknown model_id '{model_id}'")
+        sys.exit(1)
+
+    ref_settings = settings.refinement
+    engine = _load_engine(_resolve_model_dir(slm_model), ref_settings, thread_count)
+    options = {
+        "temperature": ref_settings.temperature,
+        "top_p": ref_settings.top_p,
+        "top_k": ref_settings.top_k,
+        "repetition_penalty": ref_settings.repetition_penalty,
+        "use_thinking": False,
+        "allow_skip": False,
+    }
+
+    print(f"\n{'=' * 70}")
+    print("  Chunked Refinement Benchmark")
+    print(f"  Model: {slm_model.name} ({model_id})  threads={thread_count}")
+    print(
+        f"  Window: {ref_settings.chunk_max_tokens} tokens, overlap {ref_settings.chunk_overlap_tokens}  "
+        f"Inputs: {word_counts} words"
+    )
+    print(f"{'=' * 70}\n")
+
+    results: list[ChunkedBenchmarkResult] = []
+    for words in word_counts:
+        text = _build_long_text(corpus, buckets, words)
+
+        t0 = time.perf_counter()
+        try:
+            single = engine.refine(text, **options)
+            single_s = time.perf_counter() - t0
+            single_text, single_tokens = single.content, single.total_tokens
+        except (RuntimeError, ValueError) as exc:
+            # CTranslate2 reports an exceeded context or OOM as one of these;
+            # anything else is a benchmark bug and should surface.
+            print(f"    {words:>6} words: single-shot failed ({exc})")
+            single_s, single_text, single_tokens = float("nan"), "", 0
+
+        plan = plan_chunks(
+            text, max_tokens=ref_settings.chunk_max_tokens, overlap_tokens=ref_settings.chunk_overlap_tokens
+        )
+        finished: list[float] = []
+        t0 = time.perf_counter()
+        outputs = engine.refine_batch(
+            plan.regions,
+            max_batch_size=ref_settings.bulk_batch_size,
+            on_result=lambda _index, _result, _elapsed, finished=finished, t0=t0: finished.append(
+                time.perf_counter() - t0
+            ),
+            **options,
+        )
+        chunked_s = time.perf_counter() - t0
+        chunked_text = plan.stitch([o.content if o is not None else None for o in outputs])
+        steps = [b - a for a, b in zip([0.0, *finished], finished)]
+
+        r = ChunkedBenchmarkResult(
+            words=words,
+            chunks=len(plan.chunks),
+            single_s=round(single_s, 3),
+            chunked_s=round(chunked_s, 3),
+            first_chunk_s=round(finished[0], 3) if finished else 0.0,
+            max_chunk_s=round(max(steps), 3) if steps else 0.0,
+            single_tokens=single_tokens,
+            chunked_tokens=sum(o.total_tokens for o in outputs if o is not None),
+            edit_distance=round(_word_edit_distance(chunked_text, single_text), 3) if single_text else float("nan"),
+            thread_count=thread_count,
+            model_id=model_id,
+        )
+        results.append(r)
+        print(
+            f"    {r.words:>6} words | single {r.single_s:>7.1f}s | chunked {r.chunked_s:>7.1f}s "
+            f"({r.chunks} chunks, first {r.first_chunk_s:.1f}s) | edit={r.edit_distance:.3f}"
+        )
+
+    del engine
+    return results
+
+
+def run_preemption_benchmark(
+    thread_count: int,
+    corpus: dict[str, list[dict[str, str]]],
+    buckets: list[str],
+    bulk_words: int,
+    trials: int,
+    model_id: str,
+) -> list[PreemptionBenchmarkResult]:
+    """Measure how long an interactive refine waits behind a mid-generation bulk item.
+
+    Each trial submits one ``bulk_words``-word bulk refinement as a preemptible
+    job on a real ``SLMScheduler``, then submits an interactive refine part way
+    through. Without preemption the interactive job would wait for the rest of
+    the bulk item; with it the wait is the token-level cancellation latency.
+    Interrupt points are spread over the bulk item's measured duration.
+    """
+    from src.core.model_registry import get_slm_model
+    from src.core.settings import get_settings
+    from src.services.slm_scheduler import SLMJobPreempted, SLMJobPriority, SLMScheduler
+
+    settings = get_settings()
+    slm_model = get_slm_model(model_id)
+    if slm_model is None:
+        print(f"ERROR: Unknown model_id '{model_id}'")
+        sys.exit(1)
+
+    long_text = _build_long_text(corpus, buckets, bulk_words)
+    interactive_text = next((s["text"] for s in corpus.get("short", [])), long_text[:400])
+    ref_settings = settings.refinement
+    engine = _load_engine(_resolve_model_dir(slm_model), ref_settings, thread_count)
+    sampling = {
+        "temperature": ref_settings.temperature,
+        "top_p": ref_settings.top_p,
+        "top_k": ref_settings.top_k,
+        "repetition_penalty": ref_settings.repetition_penalty,
+        "use_thinking": False,
+        "allow_skip": False,
+    }
+
+    print(f"\n{'=' * 70}")
+    print("  Interactive Refine Preemption")
+    print(f"  Model: {slm_model.name} ({model_id})  threads={thread_count}")
+    print(f"  Bulk item: {_count_words(long_text)} words  Trials: {trials}")
+    print(f"{'=' * 70}\n")
+
+    t0 = time.perf_counter()
+    engine.refine(long_text, **sampling)
+    bulk_full_s = time.perf_counter() - t0
+    print(f"    uninterrupted bulk item: {bulk_full_s:.1f}s")
+
+    results: list[PreemptionBenchmarkResult] = []
+    for trial in range(1, trials + 1):
+        interrupt_at = bulk_full_s * trial / (trials + 1)
+        scheduler = SLMScheduler(name="benchmark-slm")
+
+        def bulk_job(scheduler: SLMScheduler = scheduler) -> None:
+            outcome = engine.refine_batch([long_text], should_cancel=scheduler.preempt_requested, **sampling)
+            if outcome[0] is None:
+                raise SLMJobPreempted()
+
+        scheduler.submit(bulk_job, priority=SLMJobPriority.BULK, label="bulk", preemptible=True)
+        time.sleep(interrupt_at)
+        submitted = time.perf_counter()
+        started: list[float] = []
+
+        def interactive_job(started: list[float] = started) -> None:
+            started.append(time.perf_counter())
+            engine.refine(interactive_text, **sampling)
+
+        scheduler.submit(interactive_job, priority=SLMJobPriority.INTERACTIVE_REFINE, label="refine").result()
+        finished = time.perf_counter()
+        # The requeued bulk item is not needed for the measurement.
+        scheduler.shutdown()
+
+        r = PreemptionBenchmarkResult(
+            trial=trial,
+            bulk_words=_count_words(long_text),
+            interrupt_at_s=round(interrupt_at, 3),
+            bulk_full_s=round(bulk_full_s, 3),
+            wait_without_preemption_s=round(max(0.0, bulk_full_s - interrupt_at), 3),
+            wait_with_preemption_s=round(started[0] - submitted, 3),
+            interactive_refine_s=round(finished - started[0], 3),
+            thread_count=thread_count,
+            model_id=model_id,
+        )
+        results.append(r)
+        print(
+            f"    trial {r.trial} | interrupt at {r.interrupt_at_s:>6.1f}s "
+            f"| wait {r.wait_with_preemption_s * 1000:>7.1f}ms (was {r.wait_without_preemption_s:>6.1f}s) "
+            f"| refine {r.interactive_refine_s:>5.1f}s"
+        )
+        # Let the cancelled bulk generation unwind before the next trial.
+        time.sleep(0.5)
+
+    return results
+
+
 # ── Output ──────────────────────────────────────────────────────────────────
 
 
@@ -286,6 +734,175 @@ def _print_summary(results: list[BenchmarkResult]) -> None:
         )
 
 
+def _print_bulk_summary(results: list[BulkBenchmarkResult]) -> None:
+    """Print transcripts/min per batch size, relative to batch size 1."""
+    if not results:
+        return
+
+    print(f"\n\n{'=' * 70}")
+    print("  BULK SUMMARY")
+    print(f"{'=' * 70}")
+    header = f"{'Batch':>6} {'Transcripts':>12} {'Wall Time':>10} {'Per Min':>9} {'Speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    baseline = next((r.transcripts_per_min for r in results if r.batch_size == 1), results[0].transcripts_per_min)
+    for r in results:
+        speedup = r.transcripts_per_min / baseline if baseline else 0.0
+        print(
+            f"{r.batch_size:>6} {r.transcripts:>12} {r.wall_time_s:>9.1f}s "
+            f"{r.transcripts_per_min:>9.1f} {speedup:>7.2f}x"
+        )
+
+
+def _print_preemption_summary(results: list[PreemptionBenchmarkResult]) -> None:
+    """Print worst-case interactive wait with and without preemption."""
+    if not results:
+        return
+
+    print(f"\n\n{'=' * 70}")
+    print("  PREEMPTION SUMMARY")
+    print(f"{'=' * 70}")
+    waits = [r.wait_with_preemption_s for r in results]
+    print(f"  Bulk item: {results[0].bulk_words} words, {results[0].bulk_full_s:.1f}s uninterrupted")
+    print(f"  Worst-case interactive wait without preemption: {results[0].bulk_full_s:>8.2f}s")
+    print(f"  Worst-case interactive wait with preemption:    {max(waits):>8.3f}s")
+    print(f"  Mean interactive wait with preemption:          {sum(waits) / len(waits):>8.3f}s")
+
+
+def _print_selective_summary(results: list[SelectiveBenchmarkResult]) -> None:
+    """Print token savings, latency and edit distance per bucket and variant."""
+    if not results:
+        return
+
+    print(f"\n\n{'=' * 70}")
+    print("  SELECTIVE SUMMARY")
+    print(f"{'=' * 70}")
+    header = f"{'Bucket':<8} {'Variant':<8} {'Tok Saved':>10} {'Full':>8} {'Selective':>10} {'Edit Dist':>10}"
+    print(header)
+    print("-" * len(header))
+    groups: dict[tuple[str, str], list[SelectiveBenchmarkResult]] = {}
+    for r in results:
+        groups.setdefault((r.bucket, r.variant), []).append(r)
+    for (bucket, variant), group in groups.items():
+        full_tokens = sum(r.full_tokens for r in group)
+        selective_tokens = sum(r.selective_tokens for r in group)
+        saved = 100.0 * (1 - selective_tokens / full_tokens) if full_tokens else 0.0
+        full_s = sum(r.full_s for r in group) / len(group)
+        selective_s = sum(r.selective_s for r in group) / len(group)
+        edit = sum(r.edit_distance for r in group) / len(group)
+        print(
+            f"{bucket:<8} {variant:<8} {saved:>9.1f}% {full_s:>7.1f}s {selective_s:>9.1f}s {edit:>10.3f}"
+        )
+
+
+def _write_selective_csv(results: list[SelectiveBenchmarkResult], path: Path) -> None:
+    """Write selective-refinement comparison results to CSV."""
+    fieldnames = [
+        "sample_id",
+        "bucket",
+        "variant",
+        "thread_count",
+        "model_id",
+        "input_words",
+        "regions",
+        "refined_char_pct",
+        "full_tokens",
+        "selective_tokens",
+        "token_savings_pct",
+        "full_s",
+        "selective_s",
+        "edit_distance",
+    ]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for r in results:
+            writer.writerow({name: getattr(r, name) for name in fieldnames})
+    print(f"\nResults written to {path}")
+
+
+def _print_chunked_summary(results: list[ChunkedBenchmarkResult]) -> None:
+    """Print single-shot vs chunked wall time per input length."""
+    if not results:
+        return
+
+    print(f"\n\n{'=' * 70}")
+    print("  CHUNKED SUMMARY")
+    print(f"{'=' * 70}")
+    header = f"{'Words':>6} {'Chunks':>7} {'Single':>9} {'Chunked':>9} {'Speedup':>8} {'First':>7} {'Edit Dist':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        speedup = r.single_s / r.chunked_s if r.chunked_s else 0.0
+        print(
+            f"{r.words:>6} {r.chunks:>7} {r.single_s:>8.1f}s {r.chunked_s:>8.1f}s {speedup:>7.2f}x "
+            f"{r.first_chunk_s:>6.1f}s {r.edit_distance:>10.3f}"
+        )
+
+
+def _write_chunked_csv(results: list[ChunkedBenchmarkResult], path: Path) -> None:
+    """Write chunked-refinement comparison results to CSV."""
+    fieldnames = [
+        "words",
+        "chunks",
+        "thread_count",
+        "model_id",
+        "single_s",
+        "chunked_s",
+        "first_chunk_s",
+        "max_chunk_s",
+        "single_tokens",
+        "chunked_tokens",
+        "edit_distance",
+    ]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for r in results:
+            writer.writerow({name: getattr(r, name) for name in fieldnames})
+    print(f"\nResults written to {path}")
+
+
+def _write_preemption_csv(results: list[PreemptionBenchmarkResult], path: Path) -> None:
+    """Write preemption trial results to CSV."""
+    fieldnames = [
+        "trial",
+        "thread_count",
+        "model_id",
+        "bulk_words",
+        "interrupt_at_s",
+        "bulk_full_s",
+        "wait_without_preemption_s",
+        "wait_with_preemption_s",
+        "interactive_refine_s",
+    ]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for r in results:
+            writer.writerow({name: getattr(r, name) for name in fieldnames})
+    print(f"\nResults written to {path}")
+
+
+def _write_bulk_csv(results: list[BulkBenchmarkResult], path: Path) -> None:
+    """Write bulk sweep results to CSV."""
+    fieldnames = [
+        "batch_size",
+        "thread_count",
+        "model_id",
+        "transcripts",
+        "wall_time_s",
+        "transcripts_per_min",
+        "output_tokens",
+    ]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for r in results:
+            writer.writerow({name: getattr(r, name) for name in fieldnames})
+    print(f"\nResults written to {path}")
+
+
 def _write_csv(results: list[BenchmarkResult], path: Path) -> None:
     """Write results to CSV."""
     fieldnames = [
@@ -375,6 +992,49 @@ def _build_parser() -> argparse.ArgumentParser:
         default="",
         help="Output CSV file path. Default: print to stdout only.",
     )
+    parser.add_argument(
+        "--bulk",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Run the bulk batch-size sweep over N transcripts instead (e.g. 200). Uses the first --threads value.",
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=list(range(1, 17)),
+        help="Batch sizes for --bulk (default: 1 through 16).",
+    )
+    parser.add_argument(
+        "--preemption",
+        type=int,
+        default=0,
+        metavar="WORDS",
+        help=(
+            "Measure interactive-refine wait while a WORDS-word bulk item is mid-generation (e.g. 900). "
+            "Uses the first --threads value; --runs sets the number of interrupt points."
+        ),
+    )
+    parser.add_argument(
+        "--selective",
+        action="store_true",
+        help=(
+            "Compare full vs sentence-level selective refinement per sample: token savings, latency, "
+            "and word edit distance to the full output. Uses the first --threads value."
+        ),
+    )
+    parser.add_argument(
+        "--chunked",
+        type=int,
+        nargs="+",
+        default=[],
+        metavar="WORDS",
+        help=(
+            "Compare single-shot vs chunked refinement of WORDS-word inputs (e.g. 500 2000 8000). "
+            "Uses the first --threads value."
+        ),
+    )
     return parser
 
 
@@ -404,6 +1064,59 @@ def main() -> int:
             print(f"ERROR: Bucket '{b}' not found in corpus. Available: {list(corpus.keys())}")
             return 1
 
+    if args.chunked:
+        chunked_results = run_chunked_benchmark(
+            thread_count=args.threads[0],
+            corpus=corpus,
+            buckets=args.bucket,
+            word_counts=sorted(args.chunked),
+            model_id=model_id,
+        )
+        _print_chunked_summary(chunked_results)
+        if args.csv:
+            _write_chunked_csv(chunked_results, Path(args.csv))
+        return 0
+
+    if args.selective:
+        selective_results = run_selective_benchmark(
+            thread_count=args.threads[0],
+            corpus=corpus,
+            buckets=args.bucket,
+            model_id=model_id,
+        )
+        _print_selective_summary(selective_results)
+        if args.csv:
+            _write_selective_csv(selective_results, Path(args.csv))
+        return 0
+
+    if args.preemption > 0:
+        preemption_results = run_preemption_benchmark(
+            thread_count=args.threads[0],
+            corpus=corpus,
+            buckets=args.bucket,
+            bulk_words=args.preemption,
+            trials=max(1, args.runs),
+            model_id=model_id,
+        )
+        _print_preemption_summary(preemption_results)
+        if args.csv:
+            _write_preemption_csv(preemption_results, Path(args.csv))
+        return 0
+
+    if args.bulk > 0:
+        bulk_results = run_bulk_benchmark(
+            thread_count=args.threads[0],
+            corpus=corpus,
+            buckets=args.bucket,
+            transcript_count=args.bulk,
+            batch_sizes=sorted(args.batch_sizes),
+            model_id=model_id,
+        )
+        _print_bulk_summary(bulk_results)
+        if args.csv:
+            _write_bulk_csv(bulk_results, Path(args.csv))
+        return 0
+
     results = run_benchmark(
         thread_counts=sorted(args.threads),
         corpus=corpus,
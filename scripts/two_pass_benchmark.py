@@ -0,0 +1,195 @@
+"""
+Two-Pass Benchmark — greedy draft vs full beam search on dictation fixtures.
+
+For each fixture, times the single-pass dictation path (AudioPipeline VAD +
+faster-whisper with the default beam) against the two-pass one
+(``model.two_pass``): a greedy draft, which is what reaches the clipboard,
+followed by the beam-search decode of the same cleaned speech that may
+revise it in the background. Reports time-to-clipboard for both, and how
+often and how much the background pass changes the text.
+
+Usage:
+    python -m scripts.two_pass_benchmark --audio short.wav medium.wav long.wav
+    python -m scripts.two_pass_benchmark --audio fixtures/*.wav --repeats 5 --csv two_pass.csv
+
+Requires a provisioned ASR model (run provisioning first).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import difflib
+import re
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SAMPLE_RATE = 16_000
+
+
+@dataclass(slots=True)
+class TwoPassBenchmarkResult:
+    """One fixture dictated single-pass and two-pass."""
+
+    fixture: str
+    audio_s: float
+    single_pass_s: float
+    draft_s: float
+    accurate_s: float
+    speedup: float
+    changed: bool
+    word_diff: float
+    model_id: str
+
+
+def word_diff(draft: str, final: str) -> float:
+    """Fraction of words the accurate pass changed (1 - difflib similarity)."""
+    a = re.sub(r"[^\w\s']", " ", draft.lower()).split()
+    b = re.sub(r"[^\w\s']", " ", final.lower()).split()
+    if not a and not b:
+        return 0.0
+    return round(1.0 - difflib.SequenceMatcher(a=a, b=b, autojunk=False).ratio(), 4)
+
+
+def _timed(call, repeats: int) -> tuple[float, object]:
+    durations, result = [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = call()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), result
+
+
+def run_benchmark(fixtures: dict[str, np.ndarray], repeats: int) -> list[TwoPassBenchmarkResult]:
+    from src.core.settings import init_settings
+    from src.services.audio_pipeline import AudioPipeline
+    from src.services.transcription_service import DRAFT_BEAM_SIZE, create_local_model, transcribe, transcribe_speech
+
+    settings = init_settings()
+    model = create_local_model(settings)
+    pipeline = AudioPipeline(sample_rate=SAMPLE_RATE)
+    model_id = str(model._vociferous_runtime_summary.get("model_id", settings.model.model))
+    first = next(iter(fixtures.values()))
+    transcribe(first, settings, local_model=model, audio_pipeline=pipeline)  # warm up
+
+    results: list[TwoPassBenchmarkResult] = []
+    for name, audio in fixtures.items():
+        single_s, single = _timed(
+            lambda audio=audio: transcribe(audio, settings, local_model=model, audio_pipeline=pipeline), repeats
+        )
+        speech: list[tuple] = []
+
+        def draft_pass(audio=audio, speech=speech):
+            speech.clear()
+            return transcribe(
+                audio,
+                settings,
+                local_model=model,
+                audio_pipeline=pipeline,
+                beam_size=DRAFT_BEAM_SIZE,
+                on_speech=lambda *prepared: speech.append(prepared),
+            )
+
+        draft_s, draft = _timed(draft_pass, repeats)
+        if speech:
+            clean_audio, bounds = speech[0]
+            accurate_s, accurate = _timed(
+                lambda clean_audio=clean_audio, bounds=bounds, audio=audio: transcribe_speech(
+                    clean_audio, settings, model, segment_bounds=bounds, source_samples=len(audio)
+                ),
+                repeats,
+            )
+        else:
+            accurate_s, accurate = 0.0, draft
+
+        draft_text, final_text = draft[0], accurate[0]
+        result = TwoPassBenchmarkResult(
+            fixture=name,
+            audio_s=round(len(audio) / SAMPLE_RATE, 2),
+            single_pass_s=round(single_s, 3),
+            draft_s=round(draft_s, 3),
+            accurate_s=round(accurate_s, 3),
+            speedup=round(single_s / draft_s, 2) if draft_s > 0 else 0.0,
+            changed=final_text != draft_text,
+            word_diff=word_diff(draft_text, final_text),
+            model_id=model_id,
+        )
+        results.append(result)
+        if single[0] != final_text:
+            print(f"  note: {name}: beam search on the cleaned speech differs from the single-pass text")
+        print(
+            f"{name}: clipboard {result.single_pass_s:.2f}s → {result.draft_s:.2f}s "
+            f"({result.speedup:.2f}x), revised={result.changed}, word diff {result.word_diff:.1%}"
+        )
+    return results
+
+
+def _print_summary(results: list[TwoPassBenchmarkResult]) -> None:
+    print("\n" + "=" * 86)
+    print(f"{'fixture':>24} {'audio s':>8} {'single s':>9} {'draft s':>8} {'beam s':>8} {'speedup':>8} {'diff':>7}")
+    for r in results:
+        print(
+            f"{r.fixture[-24:]:>24} {r.audio_s:>8.1f} {r.single_pass_s:>9.2f} {r.draft_s:>8.2f} "
+            f"{r.accurate_s:>8.2f} {r.speedup:>7.2f}x {r.word_diff:>7.1%}"
+        )
+    revised = sum(r.changed for r in results)
+    print(
+        f"\nMedian time-to-clipboard speedup {statistics.median(r.speedup for r in results):.2f}x; "
+        f"background pass revised {revised}/{len(results)} fixtures ({revised / len(results):.0%}), "
+        f"mean word diff {statistics.fmean(r.word_diff for r in results):.1%}"
+    )
+
+
+def _write_csv(results: list[TwoPassBenchmarkResult], path: Path) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(asdict(results[0])))
+        writer.writeheader()
+        for result in results:
+            writer.writerow(asdict(result))
+    print(f"\nResults written to {path}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Two-Pass Benchmark — greedy draft vs full beam search on dictation fixtures.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--audio", type=str, nargs="+", required=True, help="Dictation fixtures (any format ffmpeg reads)."
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per pass; the median is kept (default: 3).")
+    parser.add_argument("--csv", type=str, default="", help="Output CSV file path.")
+    return parser
+
+
+def main() -> int:
+    from faster_whisper import decode_audio
+
+    args = _build_parser().parse_args()
+    fixtures: dict[str, np.ndarray] = {}
+    for audio in args.audio:
+        audio_path = Path(audio)
+        if not audio_path.exists():
+            print(f"ERROR: Audio fixture not found: {audio_path}")
+            return 1
+        decoded = decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)
+        fixtures[audio_path.name] = (np.clip(decoded, -1.0, 1.0) * 32767).astype(np.int16)
+
+    results = run_benchmark(fixtures, max(1, args.repeats))
+    _print_summary(results)
+    if args.csv and results:
+        _write_csv(results, Path(args.csv))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
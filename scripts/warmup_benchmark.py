@@ -0,0 +1,203 @@
+"""
+Warm-up Benchmark — first-use latency with and without a post-load warm-up.
+
+Loads the configured local ASR model (and optionally the refinement model)
+in a fresh process, so CUDA context, allocator and kernel caches start
+cold, then times the same request several times in a row. Runs once
+without and once with the warm-up passes from ``src.services.warmup``. With
+the warm-up the first request should cost about the same as the last.
+
+Usage:
+    python -m scripts.warmup_benchmark --audio fixture.wav
+    python -m scripts.warmup_benchmark --audio fixture.wav --runs 10 --slm
+    python -m scripts.warmup_benchmark --audio fixture.wav --csv warmup.csv
+
+Requires provisioned models (run provisioning first).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import multiprocessing
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SAMPLE_RATE = 16_000
+_SLM_TEXT = "so um the meeting is moved to thursday at three and uh bring the the quarterly numbers"
+
+
+@dataclass(slots=True)
+class WarmupBenchmarkResult:
+    """Request latencies for one component in one fresh process."""
+
+    component: str
+    warmed: bool
+    load_s: float
+    warmup_ms: int
+    first_s: float
+    steady_s: float
+    first_over_steady: float
+    runs: int
+
+
+def _summarise(
+    component: str, warmed: bool, load_s: float, warmup_ms: int, latencies: list[float]
+) -> WarmupBenchmarkResult:
+    steady = statistics.median(latencies[1:]) if len(latencies) > 1 else latencies[0]
+    return WarmupBenchmarkResult(
+        component=component,
+        warmed=warmed,
+        load_s=round(load_s, 2),
+        warmup_ms=warmup_ms,
+        first_s=round(latencies[0], 3),
+        steady_s=round(steady, 3),
+        first_over_steady=round(latencies[0] / steady, 2) if steady else 0.0,
+        runs=len(latencies),
+    )
+
+
+def _bench_asr(audio: np.ndarray, runs: int, warmed: bool) -> WarmupBenchmarkResult:
+    from src.core.settings import get_settings
+    from src.services.audio_pipeline import AudioPipeline
+    from src.services.transcription_service import create_local_model, transcribe
+    from src.services.warmup import warm_up_asr, warm_up_vad
+
+    settings = get_settings()
+    start = time.perf_counter()
+    model = create_local_model(settings)
+    pipeline = AudioPipeline(sample_rate=SAMPLE_RATE)
+    pipeline._load_vad_model()
+    load_s = time.perf_counter() - start
+
+    warmup_ms = 0
+    if warmed:
+        warmup_ms += warm_up_vad(pipeline).ms
+        result = warm_up_asr(model, settings)
+        warmup_ms += result.ms if result else 0
+
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        transcribe(audio, settings, local_model=model, audio_pipeline=pipeline)
+        latencies.append(time.perf_counter() - start)
+    return _summarise("asr", warmed, load_s, warmup_ms, latencies)
+
+
+def _bench_slm(runs: int, warmed: bool) -> WarmupBenchmarkResult:
+    from src.core.settings import get_settings
+    from src.refinement.providers import make_refinement_provider
+    from src.services.warmup import warm_up_slm
+
+    settings = get_settings()
+    provider = make_refinement_provider(settings)
+    start = time.perf_counter()
+    provider.load()
+    load_s = time.perf_counter() - start
+
+    warmup_ms = 0
+    if warmed:
+        result = warm_up_slm(provider)
+        warmup_ms = result.ms if result else 0
+
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        provider.refine(
+            _SLM_TEXT,
+            temperature=0.0,
+            top_p=1.0,
+            top_k=1,
+            repetition_penalty=1.0,
+            use_thinking=False,
+            allow_skip=False,
+        )
+        latencies.append(time.perf_counter() - start)
+    return _summarise("slm", warmed, load_s, warmup_ms, latencies)
+
+
+def _child(component: str, audio: np.ndarray | None, runs: int, warmed: bool) -> dict:
+    from src.core.settings import init_settings
+
+    init_settings()
+    result = _bench_asr(audio, runs, warmed) if component == "asr" else _bench_slm(runs, warmed)
+    return asdict(result)
+
+
+def run_benchmark(audio: np.ndarray, runs: int, components: list[str]) -> list[WarmupBenchmarkResult]:
+    # A fresh interpreter per measurement: CUDA context and allocator caches
+    # survive model reloads inside one process and would hide the cold cost.
+    context = multiprocessing.get_context("spawn")
+    results: list[WarmupBenchmarkResult] = []
+    for component in components:
+        for warmed in (False, True):
+            with context.Pool(1) as pool:
+                data = pool.apply(_child, (component, audio if component == "asr" else None, runs, warmed))
+            result = WarmupBenchmarkResult(**data)
+            results.append(result)
+            print(
+                f"{component} {'warm' if warmed else 'cold'}: first {result.first_s:.3f}s, "
+                f"steady {result.steady_s:.3f}s ({result.first_over_steady:.2f}x), warm-up {result.warmup_ms} ms"
+            )
+    return results
+
+
+def _print_summary(results: list[WarmupBenchmarkResult]) -> None:
+    print("\n" + "=" * 72)
+    print(f"{'component':>9} {'warm-up':>8} {'load s':>7} {'warm ms':>8} {'first s':>8} {'steady s':>9} {'ratio':>6}")
+    for r in results:
+        print(
+            f"{r.component:>9} {'yes' if r.warmed else 'no':>8} {r.load_s:>7.2f} {r.warmup_ms:>8} "
+            f"{r.first_s:>8.3f} {r.steady_s:>9.3f} {r.first_over_steady:>5.2f}x"
+        )
+
+
+def _write_csv(results: list[WarmupBenchmarkResult], path: Path) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(asdict(results[0])))
+        writer.writeheader()
+        for result in results:
+            writer.writerow(asdict(result))
+    print(f"\nResults written to {path}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Warm-up Benchmark — first-use latency with and without a post-load warm-up.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--audio", type=str, required=True, help="Dictation-length fixture (any format ffmpeg reads).")
+    parser.add_argument("--runs", type=int, default=10, help="Requests per process (default: 10).")
+    parser.add_argument("--slm", action="store_true", help="Also benchmark the configured refinement model.")
+    parser.add_argument("--csv", type=str, default="", help="Output CSV file path.")
+    return parser
+
+
+def main() -> int:
+    from faster_whisper import decode_audio
+
+    args = _build_parser().parse_args()
+    audio_path = Path(args.audio)
+    if not audio_path.exists():
+        print(f"ERROR: Audio fixture not found: {audio_path}")
+        return 1
+    audio = (np.clip(decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE), -1.0, 1.0) * 32767).astype(np.int16)
+
+    results = run_benchmark(audio, max(2, args.runs), ["asr", "slm"] if args.slm else ["asr"])
+    _print_summary(results)
+    if args.csv and results:
+        _write_csv(results, Path(args.csv))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,223 @@
+"""
+Worker Benchmark — API latency while ASR runs in-process vs in a worker process.
+
+Loads the configured local Whisper model in a fresh process, either in
+process or behind ``model.worker_process`` (``src.services.inference_worker``),
+and serves a small Litestar app on uvicorn the way the real API server does
+(sync handlers on the thread pool). A prober requests it at a fixed rate,
+first while idle and then while the same process transcribes the fixture in
+a loop. In worker mode decoding no longer holds the app's GIL, so latency
+under load should stay close to idle.
+
+Usage:
+    python -m scripts.worker_benchmark --audio fixture.wav
+    python -m scripts.worker_benchmark --audio fixture.wav --seconds 30 --rate 50
+    python -m scripts.worker_benchmark --audio fixture.wav --csv worker.csv
+
+Requires provisioned models (run provisioning first).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import http.client
+import multiprocessing
+import socket
+import statistics
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SAMPLE_RATE = 16_000
+
+
+@dataclass(slots=True)
+class WorkerBenchmarkResult:
+    """API latency for one mode, idle and during transcription."""
+
+    mode: str
+    phase: str
+    requests: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    transcriptions: int
+    asr_rtf: float
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(port: int) -> None:
+    import uvicorn
+    from litestar import Litestar, get
+
+    @get("/api/status", sync_to_thread=True)
+    def status() -> dict:
+        return {"status": "ok", "items": [{"id": i, "text": f"transcript {i}"} for i in range(50)]}
+
+    config = uvicorn.Config(Litestar(route_handlers=[status]), host="127.0.0.1", port=port, log_level="warning")
+    threading.Thread(target=uvicorn.Server(config).run, daemon=True, name="bench-api").start()
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("benchmark API server did not start")
+
+
+def _probe(port: int, seconds: float, rate: float) -> list[float]:
+    """Request the API every ``1/rate`` s for ``seconds``; returns latencies in ms."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    latencies: list[float] = []
+    interval = 1.0 / rate
+    deadline = time.perf_counter() + seconds
+    next_at = time.perf_counter()
+    while next_at < deadline:
+        time.sleep(max(0.0, next_at - time.perf_counter()))
+        start = time.perf_counter()
+        conn.request("GET", "/api/status")
+        conn.getresponse().read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        next_at += interval
+    conn.close()
+    return latencies
+
+
+def _summarise(mode: str, phase: str, latencies: list[float], runs: int, rtf: float) -> WorkerBenchmarkResult:
+    ordered = sorted(latencies)
+    quantiles = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else ordered * 99
+    return WorkerBenchmarkResult(
+        mode=mode,
+        phase=phase,
+        requests=len(ordered),
+        p50_ms=round(statistics.median(ordered), 2),
+        p95_ms=round(quantiles[94], 2),
+        p99_ms=round(quantiles[98], 2),
+        max_ms=round(ordered[-1], 2),
+        transcriptions=runs,
+        asr_rtf=round(rtf, 3),
+    )
+
+
+def _child(mode: str, audio: np.ndarray, seconds: float, rate: float) -> list[dict]:
+    from src.core.settings import init_settings
+    from src.services.audio_pipeline import AudioPipeline
+    from src.services.transcription_service import create_local_model, transcribe
+
+    settings = init_settings()
+    settings = settings.model_copy(
+        update={"model": settings.model.model_copy(update={"worker_process": mode == "worker"})}
+    )
+    model = create_local_model(settings)
+    pipeline = AudioPipeline(sample_rate=SAMPLE_RATE)
+    pipeline._load_vad_model()
+    transcribe(audio, settings, local_model=model, audio_pipeline=pipeline)  # warm up both paths
+
+    port = _free_port()
+    _serve(port)
+    idle = _probe(port, min(5.0, seconds), rate)
+
+    stop = threading.Event()
+    durations: list[float] = []
+
+    def load() -> None:
+        while not stop.is_set():
+            start = time.perf_counter()
+            transcribe(audio, settings, local_model=model, audio_pipeline=pipeline)
+            durations.append(time.perf_counter() - start)
+
+    worker = threading.Thread(target=load, daemon=True, name="bench-asr")
+    worker.start()
+    busy = _probe(port, seconds, rate)
+    stop.set()
+    worker.join()
+
+    audio_s = len(audio) / SAMPLE_RATE
+    rtf = statistics.median(durations) / audio_s if durations else 0.0
+    return [
+        asdict(_summarise(mode, "idle", idle, 0, 0.0)),
+        asdict(_summarise(mode, "transcribing", busy, len(durations), rtf)),
+    ]
+
+
+def run_benchmark(audio: np.ndarray, seconds: float, rate: float) -> list[WorkerBenchmarkResult]:
+    # A fresh interpreter per mode so neither inherits the other's threads or caches.
+    context = multiprocessing.get_context("spawn")
+    results: list[WorkerBenchmarkResult] = []
+    for mode in ("in_process", "worker"):
+        with context.Pool(1) as pool:
+            rows = pool.apply(_child, (mode, audio, seconds, rate))
+        for row in rows:
+            result = WorkerBenchmarkResult(**row)
+            results.append(result)
+            print(f"{mode} {result.phase}: p50 {result.p50_ms:.1f} ms, p99 {result.p99_ms:.1f} ms")
+    return results
+
+
+def _print_summary(results: list[WorkerBenchmarkResult]) -> None:
+    print("\n" + "=" * 84)
+    print(f"{'mode':>10} {'phase':>12} {'reqs':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'RTF':>6}")
+    for r in results:
+        rtf = f"{r.asr_rtf:.3f}" if r.transcriptions else "-"
+        print(
+            f"{r.mode:>10} {r.phase:>12} {r.requests:>6} {r.p50_ms:>8.1f} {r.p95_ms:>8.1f} "
+            f"{r.p99_ms:>8.1f} {r.max_ms:>8.1f} {rtf:>6}"
+        )
+
+
+def _write_csv(results: list[WorkerBenchmarkResult], path: Path) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(asdict(results[0])))
+        writer.writeheader()
+        for result in results:
+            writer.writerow(asdict(result))
+    print(f"\nResults written to {path}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Worker Benchmark — API latency while ASR runs in-process vs in a worker process.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--audio", type=str, required=True, help="Fixture to transcribe (any format ffmpeg reads).")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Probe duration under load (default: 20).")
+    parser.add_argument("--rate", type=float, default=20.0, help="API requests per second (default: 20).")
+    parser.add_argument("--csv", type=str, default="", help="Output CSV file path.")
+    return parser
+
+
+def main() -> int:
+    from faster_whisper import decode_audio
+
+    args = _build_parser().parse_args()
+    audio_path = Path(args.audio)
+    if not audio_path.exists():
+        print(f"ERROR: Audio fixture not found: {audio_path}")
+        return 1
+    audio = (np.clip(decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE), -1.0, 1.0) * 32767).astype(np.int16)
+
+    results = run_benchmark(audio, max(1.0, args.seconds), max(1.0, args.rate))
+    _print_summary(results)
+    if args.csv and results:
+        _write_csv(results, Path(args.csv))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -44,12 +44,18 @@ from src.api.refinement_providers import (
     test_refinement_provider,
 )
 from src.api.system import (
+    cancel_import_job,
     cleanup_engine,
+    create_import_job,
     engine_status,
+    get_calibration,
     health,
     import_audio_file,
+    list_import_jobs,
     open_log_directory,
     prewarm_health_cache,
+    resume_import_job,
+    start_calibration,
     start_key_capture,
     stop_key_capture,
 )
@@ -326,9 +332,15 @@ def create_app(coordinator: ApplicationCoordinator) -> Litestar:
             get_motd,
             export_file,
             import_audio_file,
+            create_import_job,
+            list_import_jobs,
+            resume_import_job,
+            cancel_import_job,
             health,
             engine_status,
             cleanup_engine,
+            get_calibration,
+            start_calibration,
             open_log_directory,
             minimize_window,
             maximize_window,
@@ -371,6 +383,10 @@ def _wire_event_bridge(coordinator: ApplicationCoordinator, ws_manager: Connecti
         "recording_stopped",
         "transcription_complete",
         "transcription_error",
+        "import_progress",
+        "import_job_started",
+        "import_job_progress",
+        "import_job_complete",
         "audio_level",
         "refinement_started",
         "refinement_complete",
@@ -168,6 +168,9 @@ async def dispatch_intent(data: dict) -> Response:
         "update_config": defs.UpdateConfigIntent,
         "restart_engine": defs.RestartEngineIntent,
         "import_audio_file": defs.ImportAudioFileIntent,
+        "import_audio_batch": defs.ImportAudioBatchIntent,
+        "resume_import_job": defs.ResumeImportJobIntent,
+        "cancel_import_job": defs.CancelImportJobIntent,
         "transcribe_recovered_recording": defs.TranscribeRecoveredRecordingIntent,
         "delete_recovered_recording": defs.DeleteRecoveredRecordingIntent,
     }
@@ -1,5 +1,5 @@
 """
-System API routes — health, audio import, key capture.
+System API routes — health, audio import and import jobs, hardware calibration, key capture.
 
 Config/insight routes → config.py
 Model catalog/download → models.py
@@ -21,7 +21,7 @@ from litestar.datastructures import UploadFile
 from litestar.enums import RequestEncodingType
 from litestar.params import Body
 
-from src.api.deps import get_coordinator
+from src.api.deps import get_coordinator, require_db
 from src.core.constants import APP_VERSION
 from src.core.cuda_runtime import detect_cuda_runtime
 from src.core.engine_status import build_engine_status, cleanup_engine_artifacts
@@ -32,6 +32,7 @@ logger = logging.getLogger(__name__)
 
 _IMPORT_AUDIO_CHUNK_BYTES = 1024 * 1024
 _MAX_IMPORT_AUDIO_BYTES = 256 * 1024 * 1024
+_MAX_IMPORT_BATCH_FILES = 100
 
 
 class _AudioImportTooLargeError(Exception):
@@ -144,9 +145,9 @@ def cleanup_engine(data: dict | None = None) -> dict:
 _ALLOWED_AUDIO_EXTENSIONS = frozenset((".wav", ".mp3", ".m4a", ".flac", ".ogg", ".webm", ".wma", ".aac", ".opus"))
 
 
-async def _write_upload_to_tempfile(data: UploadFile, *, suffix: str) -> tuple[str, int]:
+async def _write_upload_to_tempfile(data: UploadFile, *, suffix: str, directory: Path | None = None) -> tuple[str, int]:
     """Stream an uploaded audio file to disk with a hard byte limit."""
-    fd, tmp_path = tempfile.mkstemp(suffix=suffix, prefix="vociferous_import_")
+    fd, tmp_path = tempfile.mkstemp(suffix=suffix, prefix="vociferous_import_", dir=directory)
     total_bytes = 0
     try:
         with os.fdopen(fd, "wb") as handle:
@@ -206,6 +207,130 @@ async def import_audio_file(
     return Response(content={"status": "importing", "file": original_name, "dispatched": success})
 
 
+@post("/api/import-jobs")
+async def create_import_job(
+    data: list[UploadFile] = Body(media_type=RequestEncodingType.MULTI_PART),
+) -> Response:
+    """
+    Accept several uploaded audio files and queue them as one import job.
+
+    Uploads are kept in the user data directory rather than the temp dir so
+    an interrupted job can be resumed after a restart; each is removed once
+    its file has been transcribed. Progress arrives via WebSocket:
+    import_job_started / import_progress / import_job_progress / import_job_complete.
+    """
+    from src.core.intents.definitions import ImportAudioBatchIntent
+
+    coordinator = get_coordinator()
+
+    if not data:
+        return Response(content={"error": "No files provided"}, status_code=400)
+    if len(data) > _MAX_IMPORT_BATCH_FILES:
+        return Response(content={"error": f"Too many files (max {_MAX_IMPORT_BATCH_FILES})"}, status_code=400)
+    names = [upload.filename or "upload.wav" for upload in data]
+    for name in names:
+        ext = Path(name).suffix.lower()
+        if ext not in _ALLOWED_AUDIO_EXTENSIONS:
+            return Response(content={"error": f"Unsupported format: {ext} ({name})"}, status_code=400)
+
+    upload_dir = ResourceManager.get_user_data_dir() / "imports"
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    stored: list[str] = []
+
+    def _discard() -> None:
+        for stored_path in stored:
+            Path(stored_path).unlink(missing_ok=True)
+
+    for upload, name in zip(data, names):
+        try:
+            stored_path, total_bytes = await _write_upload_to_tempfile(
+                upload, suffix=Path(name).suffix.lower(), directory=upload_dir
+            )
+        except _AudioImportTooLargeError:
+            _discard()
+            max_mb = _MAX_IMPORT_AUDIO_BYTES // (1024 * 1024)
+            return Response(content={"error": f"Audio file too large (max {max_mb} MB): {name}"}, status_code=413)
+        except Exception as e:
+            _discard()
+            logger.exception("Failed to store uploaded audio file %s", name)
+            return Response(content={"error": f"Upload failed: {e}"}, status_code=500)
+        stored.append(stored_path)
+        if total_bytes == 0:
+            _discard()
+            return Response(content={"error": f"Empty file: {name}"}, status_code=400)
+
+    intent = ImportAudioBatchIntent(file_paths=tuple(stored), file_names=tuple(names), cleanup_source=True)
+    success, result = coordinator.command_bus.dispatch_result(intent)
+    if not success or not isinstance(result, dict):
+        _discard()
+        return Response(content={"error": "Failed to queue audio import"}, status_code=503)
+
+    return Response(content={"status": "queued", **result})
+
+
+@get("/api/import-jobs", sync_to_thread=True)
+def list_import_jobs() -> dict:
+    """List batch import jobs, oldest first, with per-file status."""
+    jobs = require_db().list_import_jobs()
+    return {"items": [job.to_dict() for job in jobs], "total": len(jobs)}
+
+
+@post("/api/import-jobs/{job_id:str}/resume", status_code=200)
+async def resume_import_job(job_id: str) -> Response:
+    """Re-queue an interrupted or cancelled import job."""
+    from src.core.intents.definitions import ResumeImportJobIntent
+
+    coordinator = get_coordinator()
+    success, result = coordinator.command_bus.dispatch_result(ResumeImportJobIntent(job_id=job_id))
+    if not success or not isinstance(result, dict):
+        return Response(content={"error": "Import job cannot be resumed", "job_id": job_id}, status_code=409)
+    return Response(content=result)
+
+
+@post("/api/import-jobs/{job_id:str}/cancel", status_code=200)
+async def cancel_import_job(job_id: str) -> Response:
+    """Cancel an import job; files not yet transcribed stay queued for a resume."""
+    from src.core.intents.definitions import CancelImportJobIntent
+
+    coordinator = get_coordinator()
+    success, result = coordinator.command_bus.dispatch_result(CancelImportJobIntent(job_id=job_id))
+    if not success or not isinstance(result, dict):
+        return Response(content={"error": "Import job not found", "job_id": job_id}, status_code=404)
+    return Response(content=result)
+
+
+# --- Hardware Calibration ---
+
+
+def _require_calibrator():
+    from litestar.exceptions import HTTPException
+
+    calibrator = get_coordinator().hardware_calibrator
+    if calibrator is None:
+        raise HTTPException(status_code=503, detail="Hardware calibration not available")
+    return calibrator
+
+
+@get("/api/calibration", sync_to_thread=True)
+def get_calibration() -> dict:
+    """Return this machine's calibration profiles and any sweep in progress."""
+    return _require_calibrator().status()
+
+
+@post("/api/calibration", status_code=202, sync_to_thread=True)
+def start_calibration(data: dict | None = None) -> Response:
+    """Start a background calibration sweep for ``kinds`` (default: ASR and SLM)."""
+    from src.services.calibration import KINDS
+
+    calibrator = _require_calibrator()
+    kinds = (data or {}).get("kinds") or list(KINDS)
+    if not isinstance(kinds, list) or any(kind not in KINDS for kind in kinds):
+        return Response(content={"error": f"kinds must be a list drawn from {list(KINDS)}"}, status_code=400)
+    if not calibrator.start(kinds):
+        return Response(content={"error": "Calibration already running", **calibrator.status()}, status_code=409)
+    return Response(content=calibrator.status(), status_code=202)
+
+
 # --- Key Capture ---
 
 
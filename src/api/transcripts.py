@@ -210,6 +210,7 @@ async def refine_transcript(transcript_id: int, data: dict) -> Response:
             level=data.get("level", 2),
             instructions=data.get("instructions", ""),
             prompt_transcript_id=int(raw_ptid) if isinstance(raw_ptid, (int, float)) else None,
+            auto=bool(data.get("auto", False)),
         )
     except ValueError as e:
         return Response(content={"error": str(e)}, status_code=400)
@@ -17,27 +17,41 @@ from src.core.runtime import (
     cleanup_coordinator,
     do_cleanup,
     init_audio_service,
+    init_cpu_partitioner,
+    init_credential_cache,
+    init_http_pool,
     init_input_handler,
     init_insight_manager,
+    init_model_residency,
     init_recording_session,
     init_slm_runtime,
     init_title_generator,
     open_window,
     shutdown_coordinator,
     start_api_server,
+    start_background_stages,
     wait_for_server,
 )
 from src.core.runtime import (
     restart_engine as restart_engine_runtime,
 )
 from src.core.settings import VociferousSettings
+from src.core.startup import ASR, RECOVERY, SLM, VAD, StartupReadiness, StartupTrace
 from src.core.window_controller import WindowController
 
 if TYPE_CHECKING:
+    from src.core.http_pool import HttpConnectionPool
     from src.database.db import TranscriptDB
     from src.input_handler.listener import KeyListener
+    from src.services.asr_scheduler import ASRScheduler
     from src.services.audio_service import AudioService
+    from src.services.calibration import HardwareCalibrator
+    from src.services.cpu_partition import CorePartitioner
+    from src.services.model_residency import ModelResidencyManager
+    from src.services.refinement_cache import RefinementResultCache
     from src.services.slm_runtime import SLMRuntime
+    from src.services.slm_scheduler import SLMScheduler
+    from src.services.transcription_cache import TranscriptionResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -73,10 +87,30 @@ class ApplicationCoordinator:
         self.audio_service: AudioService | None = None
         self.input_listener: KeyListener | None = None
         self.slm_runtime: SLMRuntime | None = None
+        # Shared SLM job queue; outlives SLMRuntime instances across engine restarts.
+        self.slm_scheduler: SLMScheduler | None = None
+        # Shared ASR job queue: dictation, recovery, re-transcription and imports.
+        self.asr_scheduler: ASRScheduler | None = None
+        # Persistent refinement result cache shared by SLMRuntime instances.
+        self.refinement_cache: RefinementResultCache | None = None
+        # Persistent ASR result cache for re-transcription, imports and recovery.
+        self.transcription_cache: TranscriptionResultCache | None = None
+        # Background CPU thread/compute-type calibration (settings set to auto).
+        self.hardware_calibrator: HardwareCalibrator | None = None
+        # Memory budgets and idle unloading for the ASR, VAD and SLM models.
+        self.model_residency: ModelResidencyManager | None = None
+        # Pooled HTTP clients shared by remote ASR/SLM providers across rebuilds.
+        self.http_pool: HttpConnectionPool | None = None
+        # Disjoint CPU core sets for Whisper and the SLM when both run on the CPU.
+        self.cpu_partitioner: CorePartitioner | None = None
         self._uvicorn_server: Any = None  # uvicorn.Server for graceful shutdown
         self.insight_manager: Any = None  # InsightManager | None
         self.title_generator: Any = None  # TitleGenerator | None
         self.recoverable_recordings: list[dict[str, Any]] = []
+        # Per-stage startup timings, and readiness of the components that load
+        # in the background while the window is already open.
+        self.startup_trace = StartupTrace()
+        self.readiness = StartupReadiness()
 
         # Recording session (created in start())
         self.recording_session: Any = None  # RecordingSession
@@ -94,73 +128,79 @@ class ApplicationCoordinator:
         """
         Initialize all services and start the application.
 
-        Order matters:
+        The window opens as soon as the server answers; models load behind it:
         1. Database
-        2. ASR model (warm load)
-        3. SLM runtime
-        4. Audio service (with event callbacks)
-        5. Input handler
-        6. Register intent handlers
-        7. Start API server (background thread)
-        8. Open pywebview window (blocks until closed)
+        2. Services: recording session, SLM runtime (loads asynchronously),
+           audio service, input handler, intent handlers
+        3. Background stages: vault recovery, ASR and VAD loads, then
+           hardware calibration once every model has settled
+        4. Start API server (background thread) and wait for it to bind
+        5. Open pywebview window (blocks until closed)
+
+        Intents that need a component still loading wait on ``self.readiness``
+        instead of failing. Stage timings are in ``self.startup_trace``.
         """
         from src.core.constants import APP_VERSION
         from src.core.log_manager import log_support_diagnostics_snapshot
 
         logger.info("Starting Vociferous %s...", APP_VERSION)
+        trace = self.startup_trace
+        self.readiness.expect(RECOVERY, ASR, VAD, SLM)
 
         # 1. Database
-        from src.database.db import TranscriptDB
+        with trace.stage("database"):
+            from src.database.db import TranscriptDB
 
-        self.db = TranscriptDB()
-        logger.info("Database initialized (%d transcripts)", self.db.transcript_count())
-        log_support_diagnostics_snapshot(self.settings, transcript_count=self.db.transcript_count())
+            self.db = TranscriptDB()
+            logger.info("Database initialized (%d transcripts)", self.db.transcript_count())
+            log_support_diagnostics_snapshot(self.settings, transcript_count=self.db.transcript_count())
 
-        # Recover interrupted durable recordings before any new recording can start.
-        from src.services.audio_vault import AudioVaultManager
+        with trace.stage("services"):
+            # 2a. Shared HTTP pool and credential cache, before any remote
+            #     provider is built.
+            init_http_pool(self)
+            init_credential_cache(self)
+            # Core sets are decided before any model load creates its threads.
+            init_cpu_partitioner(self)
 
-        recovered = AudioVaultManager(self.db).recover_interrupted_recordings()
-        self.recoverable_recordings = [record.to_dict() for record in recovered]
-        if recovered:
-            logger.warning("Recovered %d interrupted audio recording(s)", len(recovered))
-            self.event_bus.emit("audio_recovery_updated", {"count": len(recovered)})
+            # 2b. Recording session. The residency manager comes first so every
+            #     model load goes through it.
+            init_model_residency(self)
+            init_recording_session(self)
 
-        # 2. Recording session (created here; ASR model loaded after SLM init).
-        init_recording_session(self)
+            # 2c. SLM runtime (CTranslate2 Generator); the model loads on its own thread.
+            self._init_slm_runtime()
 
-        # 3. SLM runtime (CTranslate2 Generator).
-        self._init_slm_runtime()
+            # 2d. Insight manager (unified analytics paragraph for UserView + TranscribeView)
+            self._init_insight_manager()
 
-        # 3b. Insight manager (unified analytics paragraph for UserView + TranscribeView)
-        self._init_insight_manager()
+            # 2e. Title generator (auto-title transcripts via SLM)
+            self._init_title_generator()
 
-        # 3c. Title generator (auto-title transcripts via SLM)
-        self._init_title_generator()
+            # 2f. Audio service with event callbacks
+            self._init_audio_service()
 
-        # 3e. Load ASR model (CTranslate2 Whisper).
-        self.recording_session.load_asr_model()
+            # 2g. Input handler
+            self._init_input_handler()
 
-        # 3f. Preload Silero VAD model (eliminates cold-start on first transcription).
-        self.recording_session.load_vad_model()
+            # 2h. Register intent handlers with CommandBus
+            self._register_handlers()
 
-        # 4. Audio service with event callbacks
-        self._init_audio_service()
+        # 3. Vault recovery and ASR/VAD loads, concurrently, behind the window.
+        start_background_stages(self)
 
-        # 5. Input handler
-        self._init_input_handler()
+        with trace.stage("api_server"):
+            # 4. Start API server in background thread
+            self._start_api_server()
 
-        # 6. Register intent handlers with CommandBus
-        self._register_handlers()
+            # 4b. Wait until the server is actually accepting connections before
+            #     handing the URL to WebKit — eliminates the "Connection refused"
+            #     race on fast hardware where the window opens before uvicorn binds.
+            self._wait_for_server()
 
-        # 7. Start API server in background thread
-        self._start_api_server()
-
-        # 7b. Wait until the server is actually accepting connections before
-        #     handing the URL to WebKit — eliminates the "Connection refused"
-        #     race on fast hardware where the window opens before uvicorn binds.
-        self._wait_for_server()
-
-        # 8. Open pywebview window (blocks main thread)
+        # 5. Open pywebview window (blocks main thread)
+        trace.mark("window_open")
+        logger.info("Opening window %.0f ms after start", trace.milestone_ms("window_open") or 0)
         self._open_window()
 
         logger.info("Vociferous shutdown complete.")
@@ -239,6 +279,7 @@ class ApplicationCoordinator:
             event_bus_emit=self.event_bus.emit,
             title_generator_provider=lambda: self.title_generator,
             insight_manager_provider=lambda: self.insight_manager,
+            readiness=self.readiness,
         )
         system = SystemHandlers(
             event_bus_emit=self.event_bus.emit,
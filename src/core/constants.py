@@ -27,6 +27,7 @@ class TitleGeneration:
     MAX_TITLE_WORDS = 12
     MAX_TITLE_CHARS = 96
     TEMPERATURE = 0.4  # Slightly creative but grounded
+    QUEUE_DEADLINE_S = 30.0  # Queued longer than this → defer to the SLM's idle backfill lane
 
 
 class FlowTiming:
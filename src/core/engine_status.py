@@ -26,6 +26,7 @@ EngineState = Literal[
     "transcribing",
     "refining",
     "degraded_cpu",
+    "unloaded",
     "error",
     "unknown",
 ]
@@ -141,6 +142,14 @@ def build_engine_status(coordinator: Any) -> dict[str, Any]:
         "status": readiness,
         "asr": asdict(asr),
         "slm": asdict(slm),
+        "slm_queue": _safe_runtime_summary(getattr(coordinator, "slm_scheduler", None), "metrics"),
+        "asr_queue": _safe_runtime_summary(getattr(coordinator, "asr_scheduler", None), "metrics"),
+        "residency": _safe_runtime_summary(getattr(coordinator, "model_residency", None), "status"),
+        "startup": {
+            "trace": _safe_runtime_summary(getattr(coordinator, "startup_trace", None), "to_dict"),
+            "readiness": _safe_runtime_summary(getattr(coordinator, "readiness", None), "snapshot"),
+        },
+        "cpu_partition": _safe_runtime_summary(getattr(coordinator, "cpu_partitioner", None), "status"),
         "providers": _provider_status(settings, slm),
         "hardware": _hardware_status(cuda_status),
         "models": _model_status(settings),
@@ -211,6 +220,9 @@ def _build_asr_status(
     elif getattr(recording_session, "is_asr_loaded", False):
         state = "ready"
         detail = "ASR model loaded."
+    elif getattr(recording_session, "is_asr_evicted", False):
+        state = "unloaded"
+        detail = "ASR model unloaded after idling; it reloads on next use."
     elif last_error:
         state = "error"
         detail = last_error
@@ -226,7 +238,7 @@ def _build_asr_status(
     return EngineComponentStatus(
         name="Speech recognition",
         state=state,
-        ready=state in {"ready", "recording", "transcribing", "degraded_cpu"},
+        ready=state in {"ready", "recording", "transcribing", "degraded_cpu", "unloaded"},
         model_id=settings.model.model,
         model_name=model.name if model else None,
         selected=True,
@@ -320,6 +332,9 @@ def _build_slm_status(
         elif raw_state == "INFERRING":
             state = "refining"
             detail = "Refinement is running."
+        elif raw_state == "UNLOADED":
+            state = "unloaded"
+            detail = "Refinement model unloaded after idling; it reloads on next use."
         elif raw_state == "ERROR" or last_error:
             state = "error"
             detail = last_error or "Refinement runtime is in error state."
@@ -342,7 +357,7 @@ def _build_slm_status(
     return EngineComponentStatus(
         name="Refinement",
         state=state,
-        ready=state in {"ready", "refining", "degraded_cpu"},
+        ready=state in {"ready", "refining", "degraded_cpu", "unloaded"},
         model_id=settings.refinement.model_id,
         model_name=model.name if model else None,
         selected=True,
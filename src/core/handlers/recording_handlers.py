@@ -10,6 +10,8 @@ from __future__ import annotations
 import logging
 import threading
 import uuid
+from collections import deque
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
@@ -19,27 +21,44 @@ from src.core.command_bus import handles
 from src.core.engine_status import normalize_engine_error
 from src.core.intents.definitions import (
     BeginRecordingIntent,
+    CancelImportJobIntent,
     CancelRecordingIntent,
     DeleteRecoveredRecordingIntent,
+    ImportAudioBatchIntent,
     ImportAudioFileIntent,
+    ResumeImportJobIntent,
     RetranscribeIntent,
     StopRecordingIntent,
     ToggleRecordingIntent,
     TranscribeRecoveredRecordingIntent,
 )
+from src.core.startup import ASR, RECOVERY, VAD, StartupReadiness
+from src.services.asr_router import AsrRouter
+from src.services.asr_scheduler import ASRJobPriority, ASRScheduler
+from src.services.provider_race import LatencyHistograms
 
 if TYPE_CHECKING:
     from src.core.settings import VociferousSettings
-    from src.database.db import TranscriptDB
+    from src.database.db import ImportJobFile, TranscriptDB
+    from src.services.asr_router import RouteDecision
     from src.services.audio_cache import AudioCacheManager
+    from src.services.audio_import import ImportTranscription
     from src.services.audio_service import AudioService
     from src.services.audio_vault import AudioVaultWriter
+    from src.services.model_residency import ModelResidencyManager
+    from src.services.transcription_cache import CachedTranscription, TranscriptionCacheKey, TranscriptionResultCache
+    from src.services.warmup import WarmupResult
 
 logger = logging.getLogger(__name__)
 
+# The provider a dictation races against (model.race_providers).
+_ASR_RACE_PARTNERS = {"local_faster_whisper": "groq", "groq": "local_faster_whisper"}
+# Recording-length classes (seconds) of the dictation latency histograms.
+_ASR_LATENCY_SIZE_EDGES = (10.0, 30.0, 120.0, 600.0)
+
 
 # ---------------------------------------------------------------------------
-# Audio decode helper (shared between import + retranscribe paths)
+# Audio decode helper (retranscribe path; imports stream via services.audio_import)
 # ---------------------------------------------------------------------------
 
 
@@ -79,6 +98,11 @@ class RecordingSession:
         shutdown_event: threading.Event,
         insight_manager_provider: Callable[[], Any],
         title_generator_provider: Callable[[], Any] = lambda: None,
+        asr_scheduler: ASRScheduler | None = None,
+        transcription_cache: TranscriptionResultCache | None = None,
+        residency: ModelResidencyManager | None = None,
+        readiness: StartupReadiness | None = None,
+        asr_router: AsrRouter | None = None,
     ) -> None:
         self._audio_service_provider = audio_service_provider
         self._settings_provider = settings_provider
@@ -93,12 +117,45 @@ class RecordingSession:
         self._recording_stop = threading.Event()
         self._recording_thread: threading.Thread | None = None
         self._asr_model: Any = None
+        self._asr_load_lock = threading.Lock()
+        # Every decode with the ASR model goes through this queue, so a new
+        # dictation never waits behind an import or re-transcription.
+        self._asr_scheduler = asr_scheduler or ASRScheduler()
+        # Sends long dictations to a faster model when model.latency_budget_s
+        # is set; the faster models it picks are kept here once loaded.
+        self._asr_router = asr_router or AsrRouter()
+        # Dictation latency per provider and recording length; sets the hedge
+        # delay when model.race_providers races local Whisper against Groq.
+        self._asr_latency = LatencyHistograms(_ASR_LATENCY_SIZE_EDGES)
+        # Models loaded next to the configured one: the router's faster
+        # models by model id, and the racing provider as "race:<provider>".
+        # The residency manager sees them as one model, "asr_side".
+        self._side_models: dict[str, Any] = {}
+        # Consulted before re-transcription, imports and recovery decode.
+        self._transcription_cache = transcription_cache
+        # Applies memory budgets to ASR/VAD loads and may unload them when idle.
+        self._residency = residency
+        self._asr_evicted = False
+        # Settled by the startup stages that recover the vault and load ASR/VAD
+        # behind the window; intents arriving earlier wait instead of failing.
+        self._readiness = readiness
+        # A recording requested before vault recovery finished; it starts once
+        # recovery settles unless a stop/cancel arrives first.
+        self._begin_deferred = False
+        # Last warm-up pass after a load (see services.warmup), for diagnostics.
+        self._asr_warmup: WarmupResult | None = None
+        self._vad_warmup: WarmupResult | None = None
         self._asr_runtime_summary: dict[str, object] | None = None
         self.last_asr_error: str | None = None
         self.is_transcribing = False
         self._audio_pipeline: Any = None  # lazy AudioPipeline instance
         self._spool: AudioVaultWriter | None = None
         self._audio_cache: AudioCacheManager | None = None
+        # Batch import jobs run one at a time, in the order they were queued.
+        self._import_lock = threading.Lock()
+        self._import_queue: deque[str] = deque()
+        self._import_cancel: dict[str, threading.Event] = {}
+        self._import_thread: threading.Thread | None = None
 
     # --- Public lifecycle interface ---
 
@@ -114,8 +171,32 @@ class RecordingSession:
     def is_asr_loaded(self) -> bool:
         return self._asr_model is not None
 
+    @property
+    def is_asr_evicted(self) -> bool:
+        """True when the residency manager unloaded the ASR model; it reloads on next use."""
+        return self._asr_model is None and self._asr_evicted
+
     def get_asr_runtime_summary(self) -> dict[str, object] | None:
-        return dict(self._asr_runtime_summary) if self._asr_runtime_summary else None
+        if not self._asr_runtime_summary:
+            return None
+        summary = dict(self._asr_runtime_summary)
+        if self._asr_warmup is not None:
+            summary.update(self._asr_warmup.to_dict())
+        if self._vad_warmup is not None:
+            summary["vad_warmup_ms"] = self._vad_warmup.ms
+        return summary
+
+    @property
+    def asr_scheduler(self) -> ASRScheduler:
+        return self._asr_scheduler
+
+    @property
+    def asr_router(self) -> AsrRouter:
+        return self._asr_router
+
+    @property
+    def asr_latency(self) -> LatencyHistograms:
+        return self._asr_latency
 
     @property
     def audio_cache(self) -> AudioCacheManager | None:
@@ -125,16 +206,53 @@ class RecordingSession:
     def audio_cache(self, value: AudioCacheManager) -> None:
         self._audio_cache = value
 
+    def _wait_for_startup(self, name: str) -> None:
+        """Block until the startup stage ``name`` has settled (no-op after startup).
+
+        Worker threads only: intents are dispatched on the API server's event
+        loop, so intent handlers use ``_defer_until_started`` instead.
+        """
+        if self._readiness is not None:
+            self._readiness.wait(name)
+
+    def _defer_until_started(self, name: str, fn: Callable[[], Any], what: str) -> bool:
+        """Run ``fn`` once the startup stage ``name`` has settled, without blocking.
+
+        Returns True if ``fn`` was deferred; the UI gets a ``loading`` status
+        for the stage in the meantime.
+        """
+        readiness = self._readiness
+        if readiness is None or readiness.is_settled(name):
+            return False
+        logger.info("%s still starting up; %s will run once it is ready", name, what)
+        self._emit(
+            "engine_status",
+            {"component": name, "status": "loading", "message": f"{what} will start once startup finishes"},
+        )
+        readiness.when_settled(name, fn)
+        return True
+
+    def _load_asr_locked(self, settings: VociferousSettings) -> None:
+        """Create the ASR model. Caller holds ``_asr_load_lock`` (or owns startup)."""
+        from src.services.transcription_service import create_local_model
+
+        if self._residency is None:
+            self._asr_model = create_local_model(settings)
+        else:
+            with self._residency.loading("asr"):
+                self._asr_model = create_local_model(settings)
+        self._asr_evicted = False
+
     def load_asr_model(self) -> None:
         """Warm-load the Whisper model (faster-whisper/CTranslate2) and emit engine_status events."""
         settings = self._settings_provider()
         try:
-            from src.services.transcription_service import create_local_model
-
-            self._asr_model = create_local_model(settings)
+            self._load_asr_locked(settings)
             self._asr_runtime_summary = getattr(self._asr_model, "_vociferous_runtime_summary", None)
             self.last_asr_error = None
+            self._warm_up_asr(settings)
             self._emit("engine_status", {"asr": "ready"})
+            self.preload_race_model()
         except Exception as e:
             logger.exception("ASR model failed to load (will retry on first transcription)")
             self.last_asr_error = normalize_engine_error(e)
@@ -148,11 +266,184 @@ class RecordingSession:
             if self._audio_pipeline is None:
                 settings = self._settings_provider()
                 self._audio_pipeline = AudioPipeline(sensitivity=settings.recording.vad_sensitivity)
-            self._audio_pipeline._load_vad_model()
+            if self._residency is None:
+                self._audio_pipeline._load_vad_model()
+            else:
+                with self._residency.loading("vad"):
+                    self._audio_pipeline._load_vad_model()
             logger.info("Silero VAD model preloaded")
+            if self._settings_provider().residency.warmup_after_load:
+                from src.services.warmup import warm_up_vad
+
+                self._vad_warmup = warm_up_vad(self._audio_pipeline, should_stop=self._shutdown_event.is_set)
         except Exception:
             logger.exception("VAD model preload failed (will retry on first transcription)")
 
+    def reload_asr_model(self) -> None:
+        """Load the ASR model if it is not loaded (residency manager prefetch)."""
+        with self._asr_load_lock:
+            if self._asr_model is not None:
+                return
+            self._load_asr_locked(self._settings_provider())
+            self._asr_runtime_summary = getattr(self._asr_model, "_vociferous_runtime_summary", None)
+        self.last_asr_error = None
+        self._warm_up_asr(self._settings_provider())
+        self._emit("engine_status", {"asr": "ready"})
+
+    def hot_swap_asr_model(self) -> bool:
+        """Load the configured ASR model next to the current one and swap it in.
+
+        Dictation keeps using the current model while the new one loads and
+        warms up. Jobs already on the scheduler hold the model they were
+        submitted with and drain on it; the old model is released by a job in
+        the last lane, behind them. If the load fails the current model stays
+        in service and False is returned.
+        """
+        from src.services.transcription_service import create_local_model
+
+        settings = self._settings_provider()
+        try:
+            if self._residency is None:
+                model = create_local_model(settings)
+            else:
+                with self._residency.loading("asr"):
+                    model = create_local_model(settings)
+        except Exception as e:
+            logger.exception("New ASR model failed to load — keeping the current one")
+            self.last_asr_error = normalize_engine_error(e)
+            return False
+
+        self._warm_up_asr(settings, model)
+        with self._asr_load_lock:
+            retired, self._asr_model = self._asr_model, model
+            self._asr_runtime_summary = getattr(model, "_vociferous_runtime_summary", None)
+            self._asr_evicted = False
+            side, self._side_models = self._side_models, {}
+        self.last_asr_error = None
+        logger.info("ASR model hot-swapped")
+        self._release_after_queued_jobs(retired)
+        for side_model in side.values():
+            self._release_after_queued_jobs(side_model)
+        self._emit("engine_status", {"asr": "ready"})
+        self.preload_race_model()
+        return True
+
+    def _release_after_queued_jobs(self, model: Any) -> None:
+        """Drop the last reference to a swapped-out model once earlier jobs have run."""
+        if model is None:
+            return
+        import gc
+
+        retired = [model]
+
+        def release() -> None:
+            retired.clear()
+            gc.collect()
+
+        try:
+            self._asr_scheduler.submit(release, priority=ASRJobPriority.IMPORT, label="release")
+        except Exception:
+            retired.clear()
+
+    def _warm_up_asr(self, settings: VociferousSettings, model: Any = None) -> None:
+        """Decode a second of noise in the lowest ASR lane so the first dictation runs warm.
+
+        Warms ``model`` (a hot-swap candidate) or the current model. Any more
+        urgent job queued meanwhile stops the warm-up at the next segment.
+        Lazy loads for a waiting request skip this.
+        """
+        model = model if model is not None else self._asr_model
+        if model is None or not settings.residency.warmup_after_load:
+            return
+        from src.services.warmup import warm_up_asr
+
+        scheduler = self._asr_scheduler
+
+        def should_stop() -> bool:
+            return self._shutdown_event.is_set() or scheduler.urgent_pending()
+
+        try:
+            result = scheduler.run(
+                lambda: warm_up_asr(model, settings, should_stop=should_stop),
+                priority=ASRJobPriority.IMPORT,
+                label="warmup",
+            )
+        except Exception:
+            logger.debug("ASR warm-up could not be scheduled", exc_info=True)
+            return
+        if result is not None:
+            self._asr_warmup = result
+
+    def preload_race_model(self) -> None:
+        """Load the provider dictations race against (``model.race_providers``) ahead of the first hedge.
+
+        Runs in the background; a raced dictation that arrives meanwhile waits
+        for the load instead of starting a second one. Also the residency
+        manager's reload hook for ``asr_side``.
+        """
+        settings = self._settings_provider()
+        if not settings.model.race_providers:
+            return
+        partner = _ASR_RACE_PARTNERS[settings.model.provider]
+
+        def load() -> None:
+            try:
+                self._race_model(settings, partner)
+            except Exception:
+                logger.warning("Could not preload %s for racing (will load on use)", partner, exc_info=True)
+
+        threading.Thread(target=load, daemon=True, name="asr-race-preload").start()
+
+    def evict_side_models(self) -> None:
+        """Release the routed and racing models; they load again on next use."""
+        import gc
+
+        with self._asr_load_lock:
+            if not self._side_models:
+                return
+            self._side_models = {}
+        gc.collect()
+
+    @property
+    def is_side_model_loaded(self) -> bool:
+        return bool(self._side_models)
+
+    def side_models_estimate_mb(self) -> float:
+        """Approximate footprint of the loaded side models (local Whisper only; remote clients count 0)."""
+        from src.core.model_registry import get_asr_model
+
+        settings = self._settings_provider()
+        total = 0.0
+        for key in list(self._side_models):
+            if key.startswith("race:"):
+                model_id = settings.model.model if key == "race:local_faster_whisper" else None
+            else:
+                model_id = key
+            model = get_asr_model(model_id) if model_id else None
+            total += float(model.size_mb) if model else 0.0
+        return total
+
+    def evict_asr_model(self) -> None:
+        """Release the ASR model to save memory; the next transcription reloads it."""
+        import gc
+
+        with self._asr_load_lock:
+            if self._asr_model is None:
+                return
+            self._asr_model = None
+            self._side_models = {}
+            self._asr_evicted = True
+        gc.collect()
+
+    def unload_vad_model(self) -> None:
+        """Release the Silero VAD session; the pipeline reloads it on next use."""
+        if self._audio_pipeline is not None:
+            self._audio_pipeline.unload_vad_model()
+
+    @property
+    def is_vad_loaded(self) -> bool:
+        return self._audio_pipeline is not None and self._audio_pipeline.is_vad_loaded
+
     def unload_asr_model(self) -> None:
         """Release the ASR model (called during engine restart)."""
         import gc
@@ -160,8 +451,10 @@ class RecordingSession:
         if self._asr_model is not None:
             logger.info("Unloading ASR model...")
             self._asr_model = None
+            self._side_models = {}
             self._asr_runtime_summary = None
             gc.collect()
+        self._asr_evicted = False
 
     def shutdown_models(self) -> None:
         """Mark models as released WITHOUT running native destructors.
@@ -171,6 +464,7 @@ class RecordingSession:
         Just null the tracking flag; the OS reclaims everything on exit.
         """
         self._asr_model = None
+        self._side_models = {}
         self._asr_runtime_summary = None
 
     def cancel_for_shutdown(self) -> None:
@@ -182,6 +476,10 @@ class RecordingSession:
 
     @handles(BeginRecordingIntent)
     def handle_begin(self, intent: Any) -> None:
+        # Vault recovery must not mistake the new recording for an interrupted one.
+        if self._defer_until_started(RECOVERY, lambda: self._begin_after_startup(intent), "Recording"):
+            self._begin_deferred = True
+            return
         with self._recording_lock:
             audio_service = self._audio_service_provider()
             if self._is_recording or not audio_service:
@@ -218,6 +516,8 @@ class RecordingSession:
             self._is_recording = True
 
         self._recording_stop.clear()
+        if self._residency is not None:
+            self._residency.on_recording_started()
 
         db = self._db_provider()
         if db is None:
@@ -246,18 +546,32 @@ class RecordingSession:
 
         self._emit("recording_started", {"recording_id": session_id})
 
+        # Re-open any remote provider connection that lapsed while idle, so
+        # transcription and refinement of this recording start warm.
+        from src.core.http_pool import get_http_pool
+
+        get_http_pool().rewarm_idle()
+
         t = threading.Thread(target=self._recording_loop, daemon=True, name="recording")
         self._recording_thread = t
         t.start()
 
+    def _begin_after_startup(self, intent: Any) -> None:
+        """Start a deferred recording, unless it was stopped while waiting."""
+        if self._begin_deferred:
+            self._begin_deferred = False
+            self.handle_begin(intent)
+
     @handles(StopRecordingIntent)
     def handle_stop(self, intent: Any) -> None:
+        self._begin_deferred = False
         if not self._is_recording:
             return
         self._recording_stop.set()
 
     @handles(CancelRecordingIntent)
     def handle_cancel(self, intent: Any) -> None:
+        self._begin_deferred = False
         if not self._is_recording:
             return
         self._recording_stop.set()
@@ -269,7 +583,7 @@ class RecordingSession:
 
     @handles(ToggleRecordingIntent)
     def handle_toggle(self, intent: Any) -> None:
-        if self._is_recording:
+        if self._is_recording or self._begin_deferred:
             self.handle_stop(intent)
         else:
             self.handle_begin(intent)
@@ -292,14 +606,11 @@ class RecordingSession:
 
         def _import_worker() -> None:
             try:
-                int16_audio = _decode_audio_file_to_int16(path)
-
-                if len(int16_audio) == 0:
-                    self._emit("transcription_error", {"message": "Audio file is empty"})
-                    return
-
+                # Decoded, segmented and transcribed as a stream — the file is
+                # never held in memory whole (see services.audio_import).
                 self._transcribe_and_store(
-                    int16_audio,
+                    None,
+                    import_path=path,
                     source_tag="Imported",
                     display_name=display_name,
                 )
@@ -313,6 +624,68 @@ class RecordingSession:
         t = threading.Thread(target=_import_worker, daemon=True, name="audio-import")
         t.start()
 
+    @handles(ImportAudioBatchIntent)
+    def handle_import_batch(self, intent: Any) -> dict[str, Any] | None:
+        """Queue several audio files as one import job; returns its id.
+
+        The job is recorded in the database before anything runs, so an
+        interrupted batch can be resumed where it stopped.
+        """
+        if not intent.file_paths:
+            self._emit("transcription_error", {"message": "No file paths provided"})
+            return None
+
+        db = self._db_provider()
+        if db is None:
+            self._emit("transcription_error", {"message": "Database not available"})
+            return None
+
+        names = intent.file_names or tuple(Path(file_path).name for file_path in intent.file_paths)
+        job_id = uuid.uuid4().hex
+
+        def create() -> None:
+            db.create_import_job(
+                job_id,
+                [(file_path, name, intent.cleanup_source) for file_path, name in zip(intent.file_paths, names)],
+            )
+            self._enqueue_import_job(job_id)
+
+        # Startup marks queued and running jobs as interrupted; a new one must
+        # not be caught by that, so it is recorded once recovery has settled.
+        if self._defer_until_started(RECOVERY, create, "Import"):
+            return {"job_id": job_id, "total": len(intent.file_paths), "status": "pending"}
+        create()
+        return {"job_id": job_id, "total": len(intent.file_paths)}
+
+    @handles(ResumeImportJobIntent)
+    def handle_resume_import_job(self, intent: Any) -> dict[str, Any] | None:
+        """Re-queue an interrupted or cancelled import job; finished files are kept."""
+        if self._defer_until_started(RECOVERY, lambda: self.handle_resume_import_job(intent), "Import"):
+            return {"job_id": intent.job_id, "status": "pending"}
+        db = self._db_provider()
+        job = db.get_import_job(intent.job_id) if db is not None and intent.job_id else None
+        if job is None or job.status not in {"interrupted", "cancelled"}:
+            self._emit("transcription_error", {"message": "Import job cannot be resumed"})
+            return None
+        db.mark_import_job_status(job.id, "queued")
+        self._enqueue_import_job(job.id)
+        return {"job_id": job.id, "status": "queued"}
+
+    @handles(CancelImportJobIntent)
+    def handle_cancel_import_job(self, intent: Any) -> dict[str, Any] | None:
+        """Stop an import job at the next block or group boundary."""
+        db = self._db_provider()
+        job = db.get_import_job(intent.job_id) if db is not None and intent.job_id else None
+        if job is None:
+            return None
+        with self._import_lock:
+            cancel = self._import_cancel.get(job.id)
+        if cancel is not None:
+            cancel.set()
+        elif job.status == "interrupted":
+            db.mark_import_job_status(job.id, "cancelled")
+        return {"job_id": job.id, "status": "cancel_requested"}
+
     @handles(RetranscribeIntent)
     def handle_retranscribe(self, intent: Any) -> None:
         """Re-transcribe a transcript from its durable source audio."""
@@ -352,52 +725,68 @@ class RecordingSession:
                     return
 
                 from src.services.transcription_service import (
-                    create_local_model,
                     describe_transcription_capture,
                     transcribe,
                 )
 
                 settings = self._settings_provider()
 
-                if self._asr_model is None:
-                    try:
-                        self._asr_model = create_local_model(settings)
-                    except Exception as model_err:
-                        logger.error("ASR model failed to load: %s", model_err)
-                        self._emit("transcription_error", {"message": "ASR model failed to load"})
-                        return
-
+                self._wait_for_startup(ASR)
+                with self._asr_load_lock:
+                    if self._asr_model is None:
+                        try:
+                            self._load_asr_locked(settings)
+                        except Exception as model_err:
+                            logger.error("ASR model failed to load: %s", model_err)
+                            self._emit("transcription_error", {"message": "ASR model failed to load"})
+                            return
+
+                self._wait_for_startup(VAD)
                 if self._audio_pipeline is None:
                     from src.services.audio_pipeline import AudioPipeline
 
                     self._audio_pipeline = AudioPipeline(sensitivity=settings.recording.vad_sensitivity)
 
-                text, speech_duration_ms, retranscription_time_ms = transcribe(
-                    int16_audio,
-                    settings=settings,
-                    local_model=self._asr_model,
-                    audio_pipeline=self._audio_pipeline,
-                )
+                cache_key = self._transcription_cache_key(settings, audio=int16_audio)
+                cached = self._cached_transcription(cache_key)
+                if cached is not None:
+                    text, retranscription_time_ms = cached.text, 0
+                else:
+                    model, pipeline = self._asr_model, self._audio_pipeline
+                    text, speech_duration_ms, retranscription_time_ms = self._asr_scheduler.run(
+                        lambda: transcribe(
+                            int16_audio,
+                            settings=settings,
+                            local_model=model,
+                            audio_pipeline=pipeline,
+                            between_segments=self._asr_scheduler.yield_to_urgent,
+                        ),
+                        priority=ASRJobPriority.RETRANSCRIBE,
+                        label=f"retranscribe {transcript_id}",
+                        audio_seconds=len(int16_audio) / 16000,
+                    )
+                    self._observe_decode(settings, model, len(int16_audio) / 16000, retranscription_time_ms)
+                    self._store_transcription(
+                        cache_key,
+                        settings,
+                        text,
+                        speech_duration_ms=speech_duration_ms,
+                        duration_ms=int(len(int16_audio) / 16000 * 1000),
+                        transcription_time_ms=retranscription_time_ms,
+                    )
 
                 if not text.strip():
                     self._emit("transcription_error", {"message": "No speech detected in cached audio"})
                     return
 
-                retranscription_capture = describe_transcription_capture(settings, local_model=self._asr_model)
-                db.update_retranscription_processing_context(
+                self._record_retranscription(
+                    db,
                     transcript_id,
-                    normalized_text=text,
-                    retranscription_time_ms=retranscription_time_ms,
-                    retranscription_provider=str(retranscription_capture["transcription_provider"]),
-                    retranscription_model_id=str(retranscription_capture["transcription_model_id"]),
-                    retranscription_resolved_device=str(retranscription_capture["transcription_resolved_device"]),
-                    retranscription_compute_type=str(retranscription_capture["transcription_compute_type"]),
-                    retranscription_cpu_threads=int(retranscription_capture["transcription_cpu_threads"]),
-                    retranscription_prompt_text=str(retranscription_capture["transcription_prompt_text"]),
-                    retranscription_prompt_chars=int(retranscription_capture["transcription_prompt_chars"]),
-                    retranscription_prompt_words=int(retranscription_capture["transcription_prompt_words"]),
+                    text,
+                    retranscription_time_ms,
+                    describe_transcription_capture(settings, local_model=self._asr_model),
+                    cached=cached is not None,
                 )
-                self._emit("transcript_updated", {"id": transcript_id})
 
                 logger.info("Re-transcription complete for transcript %d: %d chars", transcript_id, len(text))
 
@@ -405,7 +794,14 @@ class RecordingSession:
                 logger.exception("Re-transcription failed for transcript %d", transcript_id)
                 self._emit("transcription_error", {"message": f"Re-transcription failed: {e}"})
 
-        t = threading.Thread(target=_retranscribe_worker, daemon=True, name="retranscribe")
+        def _retranscribe_held() -> None:
+            self._hold_asr()
+            try:
+                _retranscribe_worker()
+            finally:
+                self._release_asr()
+
+        t = threading.Thread(target=_retranscribe_held, daemon=True, name="retranscribe")
         t.start()
 
     @handles(TranscribeRecoveredRecordingIntent)
@@ -421,15 +817,15 @@ class RecordingSession:
             self._emit("transcription_error", {"message": "Database not available"})
             return
 
-        record = db.get_recording_session(recording_id)
-        if record is None:
-            self._emit("transcription_error", {"message": "Recovered recording not found"})
-            return
-        if record.status == "completed" and record.transcript_id is not None:
-            self._emit("transcription_error", {"message": "Recording has already been transcribed"})
-            return
-
         def _recovery_worker() -> None:
+            self._wait_for_startup(RECOVERY)
+            record = db.get_recording_session(recording_id)
+            if record is None:
+                self._emit("transcription_error", {"message": "Recovered recording not found"})
+                return
+            if record.status == "completed" and record.transcript_id is not None:
+                self._emit("transcription_error", {"message": "Recording has already been transcribed"})
+                return
             try:
                 from src.services.audio_vault import AudioVaultManager
 
@@ -444,6 +840,7 @@ class RecordingSession:
                     spool_path=Path(record.audio_path),
                     recording_id=recording_id,
                     display_name=display_name,
+                    asr_priority=ASRJobPriority.RECOVERY,
                 )
                 self._emit("audio_recovery_updated", {"recording_id": recording_id})
             except Exception as exc:
@@ -533,9 +930,15 @@ class RecordingSession:
         recording_id: str | None = None,
         source_tag: str | None = None,
         display_name: str | None = None,
+        import_path: Path | None = None,
+        asr_priority: ASRJobPriority = ASRJobPriority.DICTATION,
     ) -> None:
         """Run transcription on audio data, store result, and emit events.
 
+        With ``import_path`` the audio is streamed from that file instead of
+        passed in as ``audio_data``. ``asr_priority`` is the ASR scheduler
+        lane for ``audio_data`` (imports always use the import lane).
+
         Thin orchestrator over the ordered stages:
           1. shutdown guard
           2. ensure ASR model + audio pipeline are loaded
@@ -552,6 +955,7 @@ class RecordingSession:
             return
 
         self.is_transcribing = True
+        self._hold_asr()
         try:
             settings = self._settings_provider()
             db = self._db_provider()
@@ -564,12 +968,38 @@ class RecordingSession:
 
             self._ensure_audio_pipeline(settings)
 
-            text, speech_duration_ms, transcription_time_ms = self._run_transcription(audio_data, settings)
+            model, route, two_pass = None, None, False
+            speech: list[tuple[Any, Any]] = []
+            if import_path is not None:
+                result, cached = self._run_import_transcription(import_path, settings)
+                if result.duration_ms == 0:
+                    self._emit("transcription_error", {"message": "Audio file is empty"})
+                    return
+                text = result.text
+                speech_duration_ms = result.speech_duration_ms
+                transcription_time_ms = result.transcription_time_ms
+                duration_ms = result.duration_ms
+            elif asr_priority == ASRJobPriority.DICTATION and settings.model.race_providers:
+                text, speech_duration_ms, transcription_time_ms, model = self._race_dictation(audio_data, settings)
+                cached = False
+                duration_ms = int(len(audio_data) / 16000 * 1000)
+            else:
+                if asr_priority == ASRJobPriority.DICTATION:
+                    model, route = self._route_dictation(settings, db, audio_data)
+                    two_pass = self._two_pass(settings)
+                text, speech_duration_ms, transcription_time_ms, cached = self._run_transcription(
+                    audio_data,
+                    settings,
+                    priority=asr_priority,
+                    model=model,
+                    draft=two_pass,
+                    on_speech=(lambda *prepared: speech.append(prepared)) if two_pass else None,
+                )
+                duration_ms = int(len(audio_data) / 16000 * 1000)
             if not text.strip():
                 self._handle_empty_transcription(db, recording_id, spool_path)
                 return
 
-            duration_ms = int(len(audio_data) / 16000 * 1000)
             transcript = self._persist_transcript(
                 text=text,
                 settings=settings,
@@ -577,11 +1007,18 @@ class RecordingSession:
                 duration_ms=duration_ms,
                 speech_duration_ms=speech_duration_ms,
                 transcription_time_ms=transcription_time_ms,
+                transcription_cached=cached,
                 spool_path=spool_path,
                 recording_id=recording_id,
                 source_tag=source_tag,
                 display_name=display_name,
+                local_model=model,
+                route=route,
             )
+            if transcript is not None and (two_pass or (route is not None and settings.model.retranscribe_routed)):
+                self._schedule_accurate_pass(
+                    settings, db, transcript.id, audio_data, text, speech=speech[0] if speech else None
+                )
 
             self._emit(
                 "transcription_complete",
@@ -602,11 +1039,29 @@ class RecordingSession:
             self._handle_transcription_failure(exc, recording_id, spool_path)
         finally:
             self.is_transcribing = False
+            self._release_asr()
 
     # ------------------------------------------------------------------
     # Pipeline stages
     # ------------------------------------------------------------------
 
+    def _hold_asr(self) -> None:
+        """Keep ASR and VAD from being unloaded until ``_release_asr``.
+
+        Taken before the model is checked, so an idle unload either finishes
+        first (and the model is reloaded) or waits until the decode is done.
+        """
+        if self._residency is not None:
+            self._residency.hold("asr")
+            self._residency.hold("asr_side")
+            self._residency.hold("vad")
+
+    def _release_asr(self) -> None:
+        if self._residency is not None:
+            self._residency.release("vad")
+            self._residency.release("asr_side")
+            self._residency.release("asr")
+
     def _ensure_asr_model_loaded(
         self,
         settings: VociferousSettings,
@@ -615,18 +1070,22 @@ class RecordingSession:
     ) -> bool:
         """Lazy-load the ASR model if warm load failed at startup.
 
+        Waits for the startup load first, so a dictation finished while it is
+        still running uses that model instead of loading a second copy.
         Returns True if the model is ready, False if loading failed (in
         which case error events have already been emitted and any pending
         recording row has been marked failed).
         """
-        if self._asr_model is not None:
-            return True
-
-        from src.services.transcription_service import create_local_model
-
-        logger.info("ASR model not loaded — attempting lazy recovery...")
+        self._wait_for_startup(ASR)
         try:
-            self._asr_model = create_local_model(settings)
+            with self._asr_load_lock:
+                if self._asr_model is not None:
+                    return True
+                if self._asr_evicted:
+                    logger.info("ASR model was unloaded while idle — reloading...")
+                else:
+                    logger.info("ASR model not loaded — attempting lazy recovery...")
+                self._load_asr_locked(settings)
             return True
         except Exception as model_err:
             logger.error("ASR model failed to load: %s", model_err)
@@ -646,25 +1105,660 @@ class RecordingSession:
 
     def _ensure_audio_pipeline(self, settings: VociferousSettings) -> None:
         """Lazy-create the AudioPipeline (holds cached Silero VAD session)."""
+        self._wait_for_startup(VAD)
         if self._audio_pipeline is None:
             from src.services.audio_pipeline import AudioPipeline
 
             self._audio_pipeline = AudioPipeline(sensitivity=settings.recording.vad_sensitivity)
+        if self._residency is not None:
+            self._residency.touch("asr")
+            self._residency.touch("vad")
 
     def _run_transcription(
         self,
         audio_data: Any,
         settings: VociferousSettings,
-    ) -> tuple[str, int, int]:
-        from src.services.transcription_service import transcribe
-
-        return transcribe(
-            audio_data,
-            settings=settings,
-            local_model=self._asr_model,
-            audio_pipeline=self._audio_pipeline,
+        *,
+        priority: ASRJobPriority = ASRJobPriority.DICTATION,
+        model: Any = None,
+        draft: bool = False,
+        on_speech: Callable[..., None] | None = None,
+    ) -> tuple[str, int, int, bool]:
+        """Transcribe ``audio_data`` on the ASR scheduler.
+
+        Returns ``(text, speech_duration_ms, transcription_time_ms, cached)``.
+        Fresh dictation never repeats, so only the other lanes use the
+        transcription cache. ``model`` overrides the loaded ASR model (a
+        routed dictation), ``draft`` decodes greedily (two-pass dictation)
+        and ``on_speech`` receives the cleaned speech (see ``transcribe``).
+        """
+        from src.services.transcription_service import DRAFT_BEAM_SIZE, transcribe
+
+        cache_key = (
+            self._transcription_cache_key(settings, audio=audio_data) if priority != ASRJobPriority.DICTATION else None
+        )
+        cached = self._cached_transcription(cache_key)
+        if cached is not None:
+            return cached.text, cached.speech_duration_ms, 0, True
+
+        model = model if model is not None else self._asr_model
+        pipeline = self._audio_pipeline
+        text, speech_duration_ms, transcription_time_ms = self._asr_scheduler.run(
+            lambda: transcribe(
+                audio_data,
+                settings=settings,
+                local_model=model,
+                audio_pipeline=pipeline,
+                between_segments=self._asr_scheduler.yield_to_urgent,
+                beam_size=DRAFT_BEAM_SIZE if draft else None,
+                on_speech=on_speech,
+            ),
+            priority=priority,
+            label=priority.name.lower(),
+            audio_seconds=len(audio_data) / 16000,
+        )
+        if not draft:  # greedy timings would skew the routing estimates
+            self._observe_decode(settings, model, len(audio_data) / 16000, transcription_time_ms)
+            if priority == ASRJobPriority.DICTATION and model is self._asr_model:
+                self._asr_latency.record(settings.model.provider, len(audio_data) / 16000, transcription_time_ms / 1000)
+        self._store_transcription(
+            cache_key,
+            settings,
+            text,
+            speech_duration_ms=speech_duration_ms,
+            duration_ms=int(len(audio_data) / 16000 * 1000),
+            transcription_time_ms=transcription_time_ms,
+        )
+        return text, speech_duration_ms, transcription_time_ms, False
+
+    def _route_dictation(
+        self,
+        settings: VociferousSettings,
+        db: TranscriptDB | None,
+        audio_data: Any,
+    ) -> tuple[Any, RouteDecision | None]:
+        """Pick the model for a dictation: the loaded one, or a faster one if it would miss the budget.
+
+        Returns ``(model, route)``; ``route`` is None unless the dictation was
+        routed. A faster model that fails to load leaves it on the loaded one.
+        """
+        if settings.model.latency_budget_s <= 0 or self._asr_model is None:
+            return self._asr_model, None
+        from src.services.transcription_service import describe_transcription_capture
+
+        self._asr_router.seed_once(db)
+        primary = describe_transcription_capture(settings, local_model=self._asr_model)
+        route = self._asr_router.route(settings, len(audio_data) / 16000, primary)
+        if not route.routed:
+            return self._asr_model, None
+        try:
+            model = self._routed_model(settings, route.model_id)
+        except Exception:
+            logger.warning("Could not load %s for a routed dictation — using %s", route.model_id, route.routed_from)
+            logger.debug("Routed model load failure", exc_info=True)
+            return self._asr_model, None
+        logger.info("Dictation routed to %s: %s", route.model_id, route.reason)
+        return model, route
+
+    def _routed_model(self, settings: VociferousSettings, model_id: str) -> Any:
+        """The faster model ``model_id``, loaded on first use and kept next to the configured one."""
+        from src.services.asr_router import with_asr_model
+
+        return self._side_model(model_id, with_asr_model(settings, model_id), f"{model_id} for routed dictation")
+
+    def _side_model(self, key: str, settings: VociferousSettings, purpose: str) -> Any:
+        """The side model ``key`` (see ``_side_models``), created from ``settings`` on first use.
+
+        Loads count against the residency budgets as ``asr_side``; hot-swaps
+        and evictions drop every side model.
+        """
+        from src.services.transcription_service import create_local_model
+
+        with self._asr_load_lock:
+            model = self._side_models.get(key)
+            if model is None:
+                logger.info("Loading %s...", purpose)
+                if self._residency is None:
+                    model = create_local_model(settings)
+                else:
+                    with self._residency.loading("asr_side"):
+                        model = create_local_model(settings)
+                self._side_models[key] = model
+            return model
+
+    def _race_dictation(self, audio_data: Any, settings: VociferousSettings) -> tuple[str, int, int, Any]:
+        """Transcribe a dictation on the configured provider, hedged by the other one (``model.race_providers``).
+
+        VAD runs once; local Whisper and Groq then race on the same speech
+        (see ``services.provider_race``). The local decode runs on the ASR
+        scheduler and stops at its next segment once Groq has won.
+
+        Returns ``(text, speech_duration_ms, transcription_time_ms, model)``
+        with the winning model, for the transcript's provenance.
+        """
+        from src.services.provider_race import Contender, RaceCancelled, hedge_delay, race
+        from src.services.transcription_service import prepare_speech, transcribe_speech
+
+        primary_id = settings.model.provider
+        secondary_id = _ASR_RACE_PARTNERS[primary_id]
+        # Normally preloaded with the ASR model; otherwise it loads during VAD,
+        # not once the hedge fires. A failed load fails only that contender.
+        partner: Future[Any] = Future()
+
+        def load_partner() -> None:
+            try:
+                partner.set_result(self._race_model(settings, secondary_id))
+            except Exception as exc:
+                partner.set_exception(exc)
+
+        threading.Thread(target=load_partner, daemon=True, name="asr-race-partner").start()
+        pipeline = self._audio_pipeline
+        clean_audio, segment_bounds = self._asr_scheduler.run(
+            lambda: prepare_speech(audio_data, pipeline), priority=ASRJobPriority.DICTATION, label="dictation-vad"
+        )
+        if clean_audio is None:
+            return "", 0, 0, self._asr_model
+        audio_s = len(audio_data) / 16000
+
+        def decode(provider_id: str, cancel: threading.Event) -> tuple[str, int, int, Any]:
+            model = self._asr_model if provider_id == primary_id else partner.result()
+            provider_settings = settings.model_copy(
+                update={"model": settings.model.model_copy(update={"provider": provider_id})}
+            )
+            if provider_id != "local_faster_whisper":
+                text, speech_ms, time_ms = transcribe_speech(
+                    clean_audio, provider_settings, model, segment_bounds=segment_bounds, source_samples=len(audio_data)
+                )
+                return text, speech_ms, time_ms, model
+
+            def between_segments() -> None:
+                if cancel.is_set():
+                    raise RaceCancelled("the other provider answered first")
+                self._asr_scheduler.yield_to_urgent()
+
+            def local_decode() -> tuple[str, int, int]:
+                if cancel.is_set():
+                    raise RaceCancelled("lost before it started")
+                return transcribe_speech(
+                    clean_audio,
+                    provider_settings,
+                    model,
+                    segment_bounds=segment_bounds,
+                    source_samples=len(audio_data),
+                    between_segments=between_segments,
+                )
+
+            text, speech_ms, time_ms = self._asr_scheduler.run(
+                local_decode, priority=ASRJobPriority.DICTATION, label="dictation", audio_seconds=audio_s
+            )
+            return text, speech_ms, time_ms, model
+
+        outcome = race(
+            Contender(primary_id, lambda cancel: decode(primary_id, cancel)),
+            Contender(secondary_id, lambda cancel: decode(secondary_id, cancel)),
+            hedge_s=hedge_delay(self._asr_latency, primary_id, audio_s, settings.model.race_hedge_ms),
+            is_valid=lambda result: bool(result[0].strip()),
+            on_latency=lambda provider_id, seconds: self._asr_latency.record(provider_id, audio_s, seconds),
+        )
+        return outcome.value
+
+    def _race_model(self, settings: VociferousSettings, provider_id: str) -> Any:
+        """The transcription provider ``provider_id`` for racing, loaded on first use and kept."""
+        return self._side_model(
+            f"race:{provider_id}",
+            settings.model_copy(update={"model": settings.model.model_copy(update={"provider": provider_id})}),
+            f"{provider_id} to race dictation against {settings.model.provider}",
+        )
+
+    def _observe_decode(self, settings: VociferousSettings, model: Any, audio_s: float, time_ms: int) -> None:
+        """Feed one decode's speed to the router (only while routing is on)."""
+        if model is None or time_ms <= 0 or settings.model.latency_budget_s <= 0:
+            return
+        from src.services.transcription_service import describe_transcription_capture
+
+        self._asr_router.seed_once(self._db_provider())
+        self._asr_router.observe(describe_transcription_capture(settings, local_model=model), audio_s, time_ms)
+
+    @staticmethod
+    def _two_pass(settings: VociferousSettings) -> bool:
+        """Whether dictation decodes a greedy draft first (``model.two_pass``)."""
+        return (
+            settings.model.two_pass
+            and settings.model.provider == "local_faster_whisper"
+            and not (settings.output.auto_refine and settings.refinement.enabled)
+        )
+
+    def _schedule_accurate_pass(
+        self,
+        settings: VociferousSettings,
+        db: TranscriptDB | None,
+        transcript_id: int,
+        audio_data: Any,
+        draft: str,
+        *,
+        speech: tuple[Any, Any] | None = None,
+    ) -> None:
+        """Re-decode a draft (routed or greedy) on the configured model with the full beam search.
+
+        Runs in the re-transcription lane, behind any new dictation. ``speech``
+        is the draft's cleaned audio and segment bounds, decoded again as is;
+        without it the recording goes through the pipeline again. The result
+        replaces the draft only if it differs and the transcript was not
+        changed meanwhile, and is recorded like a re-transcription.
+        """
+        if db is None or (settings.output.auto_refine and settings.refinement.enabled):
+            return
+        from src.services.transcription_service import describe_transcription_capture, transcribe, transcribe_speech
+
+        model, pipeline = self._asr_model, self._audio_pipeline
+        audio_s = len(audio_data) / 16000
+
+        def accurate_pass() -> None:
+            try:
+                if speech is not None:
+                    clean_audio, segment_bounds = speech
+                    text, _, time_ms = transcribe_speech(
+                        clean_audio,
+                        settings,
+                        model,
+                        segment_bounds=segment_bounds,
+                        source_samples=len(audio_data),
+                        between_segments=self._asr_scheduler.yield_to_urgent,
+                    )
+                else:
+                    text, _, time_ms = transcribe(
+                        audio_data,
+                        settings=settings,
+                        local_model=model,
+                        audio_pipeline=pipeline,
+                        between_segments=self._asr_scheduler.yield_to_urgent,
+                    )
+                self._observe_decode(settings, model, audio_s, time_ms)
+                current = db.get_transcript(transcript_id)
+                if current is None or current.normalized_text != draft:
+                    logger.info("Transcript %d changed since its draft — keeping it", transcript_id)
+                    return
+                if text.strip() and text != draft:
+                    logger.info(
+                        "Accurate pass revised transcript %d (%d → %d chars)", transcript_id, len(draft), len(text)
+                    )
+                    capture = describe_transcription_capture(settings, local_model=model)
+                    self._record_retranscription(db, transcript_id, text, time_ms, capture)
+            except Exception:
+                logger.exception("Accurate pass for transcript %d failed", transcript_id)
+
+        try:
+            self._asr_scheduler.submit(
+                accurate_pass,
+                priority=ASRJobPriority.RETRANSCRIBE,
+                label=f"accurate pass {transcript_id}",
+                audio_seconds=audio_s,
+            )
+        except Exception:
+            logger.debug("Accurate pass could not be scheduled", exc_info=True)
+
+    def _record_retranscription(
+        self,
+        db: TranscriptDB,
+        transcript_id: int,
+        text: str,
+        retranscription_time_ms: int,
+        capture: dict[str, object],
+        *,
+        cached: bool = False,
+    ) -> None:
+        """Store re-transcribed text with its provenance and tell the UI."""
+        db.update_retranscription_processing_context(
+            transcript_id,
+            normalized_text=text,
+            retranscription_time_ms=retranscription_time_ms,
+            retranscription_provider=str(capture["transcription_provider"]),
+            retranscription_model_id=str(capture["transcription_model_id"]),
+            retranscription_resolved_device=str(capture["transcription_resolved_device"]),
+            retranscription_compute_type=str(capture["transcription_compute_type"]),
+            retranscription_cpu_threads=int(capture["transcription_cpu_threads"]),
+            retranscription_prompt_text=str(capture["transcription_prompt_text"]),
+            retranscription_prompt_chars=int(capture["transcription_prompt_chars"]),
+            retranscription_prompt_words=int(capture["transcription_prompt_words"]),
+            retranscription_cached=cached,
+        )
+        self._emit("transcript_updated", {"id": transcript_id})
+
+    def _run_import_transcription(self, path: Path, settings: VociferousSettings) -> tuple[ImportTranscription, bool]:
+        """Stream-transcribe ``path``; returns the result and whether it came from the cache."""
+        from src.services.audio_import import ImportTranscription, transcribe_audio_file
+
+        cache_key = self._transcription_cache_key(settings, path=path)
+        cached = self._cached_transcription(cache_key)
+        if cached is not None:
+            return ImportTranscription(cached.text, cached.speech_duration_ms, 0, cached.duration_ms), True
+
+        def _progress(decoded_seconds: float, transcribed_seconds: float) -> None:
+            self._emit(
+                "import_progress",
+                {
+                    "file_name": path.name,
+                    "decoded_seconds": round(decoded_seconds, 1),
+                    "transcribed_seconds": round(transcribed_seconds, 1),
+                },
+            )
+
+        result = transcribe_audio_file(
+            path,
+            settings,
+            self._asr_model,
+            self._audio_pipeline,
+            on_progress=_progress,
+            should_stop=self._shutdown_event.is_set,
+            asr_scheduler=self._asr_scheduler,
+        )
+        self._store_transcription(
+            cache_key,
+            settings,
+            result.text,
+            speech_duration_ms=result.speech_duration_ms,
+            duration_ms=result.duration_ms,
+            transcription_time_ms=result.transcription_time_ms,
+        )
+        return result, False
+
+    # ------------------------------------------------------------------
+    # Transcription result cache
+    # ------------------------------------------------------------------
+
+    def _transcription_cache_key(
+        self,
+        settings: VociferousSettings,
+        *,
+        audio: Any = None,
+        path: Path | str | None = None,
+    ) -> TranscriptionCacheKey | None:
+        """Cache key for int16 ``audio`` or the file at ``path``; None when caching is off.
+
+        Call with the ASR model loaded: the key records its resolved model
+        and compute type.
+        """
+        if self._transcription_cache is None or settings.model.result_cache_max_entries <= 0:
+            return None
+
+        from src.services.transcription_cache import TranscriptionCacheKey, hash_audio, hash_file
+        from src.services.transcription_service import describe_transcription_capture
+
+        try:
+            digest = hash_file(path) if path is not None else hash_audio(audio)
+        except OSError:
+            logger.debug("Could not hash audio for the transcription cache", exc_info=True)
+            return None
+        capture = describe_transcription_capture(settings, local_model=self._asr_model)
+        return TranscriptionCacheKey.build(
+            digest, settings, capture, audio_source="file" if path is not None else "samples"
+        )
+
+    def _cached_transcription(self, key: TranscriptionCacheKey | None) -> CachedTranscription | None:
+        if key is None or self._transcription_cache is None:
+            return None
+        try:
+            cached = self._transcription_cache.get(key)
+        except Exception:
+            logger.warning("Transcription cache lookup failed (non-fatal)", exc_info=True)
+            return None
+        if cached is not None:
+            logger.info("Transcription served from cache (%s audio, %d chars)", key.audio_source, len(cached.text))
+        return cached
+
+    def _store_transcription(
+        self,
+        key: TranscriptionCacheKey | None,
+        settings: VociferousSettings,
+        text: str,
+        *,
+        speech_duration_ms: int,
+        duration_ms: int,
+        transcription_time_ms: int,
+    ) -> None:
+        if key is None or self._transcription_cache is None or not text.strip():
+            return
+        from src.services.transcription_cache import CachedTranscription
+
+        try:
+            self._transcription_cache.put(
+                key,
+                CachedTranscription(text, speech_duration_ms, duration_ms, transcription_time_ms),
+                max_entries=settings.model.result_cache_max_entries,
+            )
+        except Exception:
+            logger.warning("Transcription cache store failed (non-fatal)", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Batch import jobs
+    # ------------------------------------------------------------------
+
+    def _enqueue_import_job(self, job_id: str) -> None:
+        with self._import_lock:
+            self._import_cancel[job_id] = threading.Event()
+            self._import_queue.append(job_id)
+            if self._import_thread is None:
+                self._import_thread = threading.Thread(
+                    target=self._import_job_runner, daemon=True, name="audio-import-batch"
+                )
+                self._import_thread.start()
+
+    def _import_job_runner(self) -> None:
+        """Background thread: run queued import jobs one after another."""
+        while True:
+            with self._import_lock:
+                if not self._import_queue or self._shutdown_event.is_set():
+                    self._import_thread = None
+                    return
+                job_id = self._import_queue.popleft()
+                cancel = self._import_cancel[job_id]
+            try:
+                self._run_import_job(job_id, cancel)
+            except Exception as exc:
+                logger.exception("Import job %s failed", job_id)
+                db = self._db_provider()
+                if db is not None:
+                    db.mark_import_job_status(job_id, "interrupted")
+                self._emit("transcription_error", {"message": f"Import failed: {exc}"})
+            finally:
+                with self._import_lock:
+                    self._import_cancel.pop(job_id, None)
+
+    def _run_import_job(self, job_id: str, cancel: threading.Event) -> None:
+        """Transcribe a job's pending files in order, storing each as it finishes.
+
+        Files stream through one ``transcribe_audio_files`` pipeline, so the
+        next file is decoded and segmented while the model works on the
+        current one. Each finished file is committed together with its job
+        row; on cancel or shutdown the rest stay pending for a resume.
+        """
+        from src.services.audio_import import ImportCancelledError, ImportTranscription, transcribe_audio_files
+        from src.services.transcription_service import describe_transcription_capture
+
+        db = self._db_provider()
+        job = db.get_import_job(job_id) if db is not None else None
+        if job is None or job.status != "queued":
+            return
+
+        total = len(job.files)
+        counts = {"completed": job.count("completed"), "failed": job.count("failed")}
+        pending = [file for file in job.files if file.status == "pending"]
+
+        def _finish(status: str) -> None:
+            db.mark_import_job_status(job_id, status, finished=status == "completed")
+            self._emit(
+                "import_job_complete",
+                {"job_id": job_id, "total": total, **counts, "cancelled": status == "cancelled", "status": status},
+            )
+
+        if cancel.is_set():
+            _finish("cancelled")
+            return
+
+        db.mark_import_job_status(job_id, "running")
+        self._emit(
+            "import_job_started",
+            {"job_id": job_id, "total": total, **counts, "file_names": [file.file_name for file in job.files]},
         )
 
+        settings = self._settings_provider()
+        self.is_transcribing = True
+        self._hold_asr()
+        try:
+            if not self._ensure_asr_model_loaded(settings, db, None):
+                _finish("interrupted")
+                return
+            self._ensure_audio_pipeline(settings)
+            capture = describe_transcription_capture(settings, local_model=self._asr_model)
+
+            # Files already in the transcription cache skip the pipeline; they
+            # are stored in position order between the files that decode.
+            keys = [self._transcription_cache_key(settings, path=file.path) for file in pending]
+            hits = {
+                index: hit for index, key in enumerate(keys) if (hit := self._cached_transcription(key)) is not None
+            }
+            to_decode = [index for index in range(len(pending)) if index not in hits]
+            hit_order = deque(sorted(hits))
+
+            def _should_stop() -> bool:
+                return cancel.is_set() or self._shutdown_event.is_set()
+
+            def _progress(index: int, decoded_seconds: float, transcribed_seconds: float) -> None:
+                file = pending[to_decode[index]]
+                self._emit(
+                    "import_progress",
+                    {
+                        "job_id": job_id,
+                        "file_index": file.position,
+                        "file_name": file.file_name,
+                        "decoded_seconds": round(decoded_seconds, 1),
+                        "transcribed_seconds": round(transcribed_seconds, 1),
+                    },
+                )
+
+            def _store(index: int, result: ImportTranscription | Exception, *, cached: bool = False) -> None:
+                file = pending[index]
+                status = self._store_import_result(db, settings, capture, file, result, cached=cached)
+                if status == "completed" and not cached:
+                    assert not isinstance(result, Exception)
+                    self._store_transcription(
+                        keys[index],
+                        settings,
+                        result.text,
+                        speech_duration_ms=result.speech_duration_ms,
+                        duration_ms=result.duration_ms,
+                        transcription_time_ms=result.transcription_time_ms,
+                    )
+                counts[status] += 1
+                self._emit(
+                    "import_job_progress",
+                    {
+                        "job_id": job_id,
+                        "total": total,
+                        **counts,
+                        "file_index": file.position,
+                        "file_name": file.file_name,
+                        "status": status,
+                    },
+                )
+
+            def _store_hits_before(limit: int) -> None:
+                while hit_order and hit_order[0] < limit and not _should_stop():
+                    index = hit_order.popleft()
+                    hit = hits[index]
+                    result = ImportTranscription(hit.text, hit.speech_duration_ms, 0, hit.duration_ms)
+                    _store(index, result, cached=True)
+
+            try:
+                for decode_index, result in transcribe_audio_files(
+                    [pending[index].path for index in to_decode],
+                    settings,
+                    self._asr_model,
+                    self._audio_pipeline,
+                    on_progress=_progress,
+                    should_stop=_should_stop,
+                    asr_scheduler=self._asr_scheduler,
+                ):
+                    index = to_decode[decode_index]
+                    _store_hits_before(index)
+                    _store(index, result)
+                _store_hits_before(len(pending))
+            except ImportCancelledError:
+                pass
+        finally:
+            self.is_transcribing = False
+            self._release_asr()
+
+        if cancel.is_set():
+            _finish("cancelled")
+        elif self._shutdown_event.is_set():
+            _finish("interrupted")
+        else:
+            _finish("completed")
+            logger.info("Import job %s complete: %d/%d files stored", job_id, counts["completed"], total)
+
+    def _store_import_result(
+        self,
+        db: TranscriptDB,
+        settings: VociferousSettings,
+        capture: dict[str, Any],
+        file: ImportJobFile,
+        result: ImportTranscription | Exception,
+        *,
+        cached: bool = False,
+    ) -> str:
+        """Store one finished file of an import job; returns its final status."""
+        path = Path(file.path)
+        if isinstance(result, Exception):
+            reason = f"File not found: {file.file_name}" if not path.is_file() else normalize_engine_error(result)
+            logger.warning("Import of %s failed: %s", file.file_name, result)
+        elif not result.text.strip():
+            reason = "Audio file is empty" if result.duration_ms == 0 else "No speech detected"
+        else:
+            reason = None
+
+        if reason is not None:
+            db.mark_import_file_status(file.job_id, file.position, "failed", failure_reason=reason)
+            self._emit("transcription_error", {"message": f"Import failed: {file.file_name}: {reason}"})
+            status = "failed"
+        else:
+            assert not isinstance(result, Exception)
+            transcript = db.complete_import_file(
+                file.job_id,
+                file.position,
+                result.text,
+                duration_ms=result.duration_ms,
+                speech_duration_ms=result.speech_duration_ms,
+                transcription_time_ms=result.transcription_time_ms,
+                transcription_provider=str(capture["transcription_provider"]),
+                transcription_model_id=str(capture["transcription_model_id"]),
+                transcription_resolved_device=str(capture["transcription_resolved_device"]),
+                transcription_compute_type=str(capture["transcription_compute_type"]),
+                transcription_cpu_threads=int(capture["transcription_cpu_threads"]),
+                transcription_prompt_text=str(capture["transcription_prompt_text"]),
+                transcription_prompt_chars=int(capture["transcription_prompt_chars"]),
+                transcription_prompt_words=int(capture["transcription_prompt_words"]),
+                transcription_cached=cached,
+                display_name=Path(file.file_name).stem,
+                system_tag="Imported",
+                include_in_analytics=not settings.output.exclude_imported_from_analytics,
+            )
+            self._emit(
+                "transcription_complete",
+                {
+                    "text": result.text,
+                    "id": transcript.id,
+                    "duration_ms": result.duration_ms,
+                    "speech_duration_ms": result.speech_duration_ms,
+                },
+            )
+            self._schedule_derived_work(settings, transcript, result.text, copy_to_clipboard=False)
+            status = "completed"
+
+        if file.cleanup_source:
+            path.unlink(missing_ok=True)
+        return status
+
     def _handle_empty_transcription(
         self,
         db: TranscriptDB | None,
@@ -690,14 +1784,23 @@ class RecordingSession:
         recording_id: str | None,
         source_tag: str | None,
         display_name: str | None,
+        transcription_cached: bool = False,
+        local_model: Any = None,
+        route: RouteDecision | None = None,
     ) -> Any:
-        """Insert the transcript row + audio asset; return the new transcript or None."""
+        """Insert the transcript row + audio asset; return the new transcript or None.
+
+        ``local_model`` is the model that decoded it when not the loaded one
+        (``route`` says why).
+        """
         if db is None:
             return None
 
         from src.services.transcription_service import describe_transcription_capture
 
-        capture = describe_transcription_capture(settings, local_model=self._asr_model)
+        capture = describe_transcription_capture(
+            settings, local_model=local_model if local_model is not None else self._asr_model
+        )
         transcript = db.add_transcript(
             raw_text=text,
             duration_ms=duration_ms,
@@ -711,6 +1814,9 @@ class RecordingSession:
             transcription_prompt_text=str(capture["transcription_prompt_text"]),
             transcription_prompt_chars=int(capture["transcription_prompt_chars"]),
             transcription_prompt_words=int(capture["transcription_prompt_words"]),
+            transcription_cached=transcription_cached,
+            transcription_routed_from=route.routed_from if route is not None else "",
+            transcription_route_reason=route.reason if route is not None else "",
             display_name=display_name,
         )
 
@@ -742,6 +1848,8 @@ class RecordingSession:
         settings: VociferousSettings,
         transcript: Any,
         text: str,
+        *,
+        copy_to_clipboard: bool = True,
     ) -> None:
         """Insights, auto-titling, and clipboard side-effects."""
         # Schedule analytics insight generation if a threshold has been crossed.
@@ -767,7 +1875,7 @@ class RecordingSession:
 
         # When auto-refine is active, defer clipboard until refinement
         # completes — otherwise we'd paste raw text that's about to be rewritten.
-        if settings.output.auto_copy_to_clipboard and not settings.output.auto_refine:
+        if copy_to_clipboard and settings.output.auto_copy_to_clipboard and not settings.output.auto_refine:
             _copy_to_system_clipboard(text)
 
     def _promote_legacy_spool(
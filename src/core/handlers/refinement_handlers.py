@@ -4,6 +4,7 @@ RefinementHandlers — SLM-based transcript refinement intent.
 
 from __future__ import annotations
 
+import functools
 import logging
 import threading
 import time
@@ -19,11 +20,15 @@ from src.core.intents.definitions import (
 )
 from src.core.refinement.capture import build_refinement_capture
 from src.core.refinement.validation import validate_slm_ready
+from src.core.startup import SLM, StartupReadiness
+from src.refinement.engine import GenerationCancelled
+from src.services.slm_scheduler import SLMJobPriority
 
 if TYPE_CHECKING:
     from src.core.settings import VociferousSettings
     from src.database.db import TranscriptDB
     from src.services.slm_runtime import SLMRuntime
+    from src.services.slm_types import RefinedText
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +36,11 @@ logger = logging.getLogger(__name__)
 class RefinementHandlers:
     """Handles transcript refinement via the SLM runtime."""
 
+    # Bulk refinement loads and submits this many batches' worth of transcripts
+    # per window, so length bucketing has room to group similar prompts while
+    # the SLM lock is still released between windows.
+    _BULK_WINDOW_BATCHES = 4
+
     def __init__(
         self,
         *,
@@ -40,6 +50,7 @@ class RefinementHandlers:
         event_bus_emit: Callable,
         title_generator_provider: Callable[[], Any] = lambda: None,
         insight_manager_provider: Callable[[], Any] = lambda: None,
+        readiness: StartupReadiness | None = None,
     ) -> None:
         self._db_provider = db_provider
         self._slm_runtime_provider = slm_runtime_provider
@@ -47,6 +58,8 @@ class RefinementHandlers:
         self._emit = event_bus_emit
         self._title_generator_provider = title_generator_provider
         self._insight_manager_provider = insight_manager_provider
+        # Refinement requested while the SLM is still loading at startup waits for it.
+        self._readiness = readiness
         self._bulk_cancel = threading.Event()
         self._bulk_active = False
 
@@ -92,8 +105,10 @@ class RefinementHandlers:
                     logger.warning("Failed to resolve prompt (ID %d): %s", effective_id, e)
         return instructions
 
-    def _build_refinement_capture(self, instructions: str, slm_runtime: Any) -> dict[str, str | int | bool]:
-        return build_refinement_capture(self._settings_provider(), slm_runtime, instructions)
+    def _build_refinement_capture(
+        self, instructions: str, slm_runtime: Any, refinement: RefinedText | None = None
+    ) -> dict[str, str | int | bool]:
+        return build_refinement_capture(self._settings_provider(), slm_runtime, instructions, refinement)
 
     @handles(RefineTranscriptIntent)
     def handle_refine(self, intent: Any) -> None:
@@ -102,18 +117,17 @@ class RefinementHandlers:
             self._emit("refinement_error", {"message": "Database not available"})
             return
 
-        _, err = self._validate_slm_ready()
+        if self._defer_until_slm_started(self.handle_refine, intent):
+            return
+
+        priority = SLMJobPriority.AUTO_REFINE if getattr(intent, "auto", False) else SLMJobPriority.INTERACTIVE_REFINE
+        # A running title, insight or bulk job does not block this refine: the
+        # scheduler runs it next and preempts the background job.
+        _, err = self._validate_slm_ready(priority)
         if err:
             self._emit("refinement_error", {"message": err})
             self._fallback_raw_clipboard(intent.transcript_id)
             return
-        if self._bulk_active:
-            self._emit(
-                "refinement_error",
-                {"message": "A bulk refinement is in progress. Please wait for it to finish."},
-            )
-            self._fallback_raw_clipboard(intent.transcript_id)
-            return
 
         transcript = db.get_transcript(intent.transcript_id)
         if not transcript:
@@ -150,13 +164,26 @@ class RefinementHandlers:
                     },
                 )
 
-                refined = _slm.refine_text_sync(
+                def report_part(done: int, total: int) -> None:
+                    self._emit(
+                        "refinement_progress",
+                        {
+                            "transcript_id": intent.transcript_id,
+                            "status": "inferring",
+                            "message": f"Refining part {done} of {total}…",
+                        },
+                    )
+
+                refinement = _slm.refine_text_with_provenance(
                     text,
                     level=intent.level,
                     instructions=resolved_instructions,
                     allow_skip=self._settings_provider().refinement.smart_refinement,
+                    on_progress=report_part,
+                    priority=priority,
                 )
-                refinement_capture = self._build_refinement_capture(resolved_instructions, _slm)
+                refined = refinement.content
+                refinement_capture = self._build_refinement_capture(resolved_instructions, _slm, refinement)
 
                 elapsed = round(time.monotonic() - start_time, 1)
 
@@ -179,6 +206,7 @@ class RefinementHandlers:
                         refinement_prompt_tokens=int(refinement_capture["refinement_prompt_tokens"]),
                         refinement_completion_tokens=int(refinement_capture["refinement_completion_tokens"]),
                         refinement_total_tokens=int(refinement_capture["refinement_total_tokens"]),
+                        refinement_cached=bool(refinement_capture["refinement_cached"]),
                     )
 
                 self._emit(
@@ -243,9 +271,22 @@ class RefinementHandlers:
 
     # --- Bulk refinement ---
 
-    def _validate_slm_ready(self) -> tuple[Any, str | None]:
+    def _defer_until_slm_started(self, handler: Callable[[Any], Any], intent: Any) -> bool:
+        """Re-run ``handler`` once the SLM has finished loading at startup.
+
+        Returns True if the intent was deferred. Intents are dispatched on the
+        caller's thread, so the wait happens on a thread of its own.
+        """
+        readiness = self._readiness
+        if readiness is None or readiness.is_settled(SLM) or self._validate_slm_ready()[1] is None:
+            return False
+        logger.info("SLM still loading at startup; %s will run once it is ready", type(intent).__name__)
+        readiness.when_settled(SLM, lambda: handler(intent))
+        return True
+
+    def _validate_slm_ready(self, priority: SLMJobPriority | None = None) -> tuple[Any, str | None]:
         """Check SLM is ready; return (runtime, error_message_or_None)."""
-        return validate_slm_ready(self._slm_runtime_provider())
+        return validate_slm_ready(self._slm_runtime_provider(), priority)
 
     def _persist_refinement(
         self,
@@ -280,6 +321,7 @@ class RefinementHandlers:
                 refinement_prompt_tokens=int(refinement_capture["refinement_prompt_tokens"]),
                 refinement_completion_tokens=int(refinement_capture["refinement_completion_tokens"]),
                 refinement_total_tokens=int(refinement_capture["refinement_total_tokens"]),
+                refinement_cached=bool(refinement_capture["refinement_cached"]),
             )
         elif refine_elapsed_ms is not None:
             db.update_refinement_time(transcript_id, refine_elapsed_ms)
@@ -306,6 +348,9 @@ class RefinementHandlers:
             self._emit("bulk_refinement_error", {"message": "No transcripts provided"})
             return
 
+        if self._defer_until_slm_started(self.handle_bulk_refine, intent):
+            return
+
         slm_runtime, err = self._validate_slm_ready()
         if err:
             self._emit("bulk_refinement_error", {"message": err})
@@ -341,21 +386,147 @@ class RefinementHandlers:
 
         resolved_instructions = self._resolve_instructions(intent.instructions, db)
 
-        def do_bulk() -> None:
-            completed = 0
-            failed = 0
-            _slm = self._slm_runtime_provider()
+        completed = 0
+        failed = 0
+
+        def refine_item(_slm: Any, _db: Any, tid: int, text: str) -> bool:
+            """Refine and persist one transcript. Returns False when the run was cancelled."""
+            nonlocal completed, failed
             try:
-                for tid in transcript_ids:
-                    if self._bulk_cancel.is_set():
-                        logger.info("Bulk refinement cancelled after %d/%d", completed, total)
-                        break
+                refine_start = time.monotonic()
+                refinement = _slm.refine_text_with_provenance(
+                    text,
+                    level=intent.level,
+                    instructions=resolved_instructions,
+                    allow_skip=self._settings_provider().refinement.smart_refinement,
+                    priority=SLMJobPriority.BULK,
+                    should_cancel=self._bulk_cancel.is_set,
+                )
+                refined = refinement.content
+                refinement_capture = self._build_refinement_capture(resolved_instructions, _slm, refinement)
+                refine_elapsed_ms = int((time.monotonic() - refine_start) * 1000)
+            except GenerationCancelled:
+                logger.info("Bulk refinement cancelled mid-item after %d/%d", completed, total)
+                return False
+            except TimeoutError:
+                logger.warning("Bulk refine: timed out waiting for SLM lock for transcript %d", tid)
+                failed += 1
+                self._emit(
+                    "bulk_refinement_progress",
+                    {
+                        "completed": completed,
+                        "failed": failed,
+                        "total": total,
+                        "current_transcript_id": tid,
+                        "error": "Refinement engine is busy. Skipping this transcript.",
+                    },
+                )
+                return True
+            except Exception as e:
+                logger.exception("Bulk refine: inference failed for transcript %d", tid)
+                failed += 1
+                self._emit(
+                    "bulk_refinement_progress",
+                    {
+                        "completed": completed,
+                        "failed": failed,
+                        "total": total,
+                        "current_transcript_id": tid,
+                        "error": str(e),
+                    },
+                )
+                return True
+
+            # Auto-commit: persist + tag + timing + emit
+            self._persist_refinement(
+                _db,
+                tid,
+                refined,
+                refine_elapsed_ms=refine_elapsed_ms,
+                refinement_capture=refinement_capture,
+            )
+            completed += 1
 
-                    _db = self._db_provider()
-                    if not _db:
-                        failed += 1
-                        continue
+            # Auto-retitle if enabled
+            settings = self._settings_provider()
+            if settings.output.auto_retitle_on_refine:
+                title_gen = self._title_generator_provider()
+                if title_gen is not None:
+                    title_gen.schedule(tid, refined)
 
+            self._emit(
+                "bulk_refinement_progress",
+                {"completed": completed, "failed": failed, "total": total, "current_transcript_id": tid},
+            )
+            return True
+
+        def deliver_result(
+            _slm: Any,
+            _db: Any,
+            batch_ids: list[int],
+            delivered: set[int],
+            index: int,
+            refinement: RefinedText,
+            elapsed_s: float,
+        ) -> None:
+            """Persist one batched result. A failed write counts as failed, never as pending."""
+            nonlocal completed, failed
+            tid = batch_ids[index]
+            refined = refinement.content
+            try:
+                self._persist_refinement(
+                    _db,
+                    tid,
+                    refined,
+                    refine_elapsed_ms=int(elapsed_s * 1000),
+                    refinement_capture=self._build_refinement_capture(resolved_instructions, _slm, refinement),
+                )
+            except Exception as e:
+                logger.exception("Bulk refine: failed to persist refinement for transcript %d", tid)
+                delivered.add(index)
+                failed += 1
+                self._emit(
+                    "bulk_refinement_progress",
+                    {
+                        "completed": completed,
+                        "failed": failed,
+                        "total": total,
+                        "current_transcript_id": tid,
+                        "error": str(e),
+                    },
+                )
+                return
+            delivered.add(index)
+            completed += 1
+
+            settings = self._settings_provider()
+            if settings.output.auto_retitle_on_refine:
+                title_gen = self._title_generator_provider()
+                if title_gen is not None:
+                    title_gen.schedule(tid, refined)
+
+            self._emit(
+                "bulk_refinement_progress",
+                {"completed": completed, "failed": failed, "total": total, "current_transcript_id": tid},
+            )
+
+        def refine_batched(_slm: Any, batch_size: int) -> None:
+            nonlocal completed, failed
+            window = batch_size * self._BULK_WINDOW_BATCHES
+            for start in range(0, total, window):
+                if self._bulk_cancel.is_set():
+                    logger.info("Bulk refinement cancelled after %d/%d", completed, total)
+                    return
+
+                window_ids = transcript_ids[start : start + window]
+                _db = self._db_provider()
+                if not _db:
+                    failed += len(window_ids)
+                    continue
+
+                batch_ids: list[int] = []
+                texts: list[str] = []
+                for tid in window_ids:
                     transcript = _db.get_transcript(tid)
                     if not transcript:
                         logger.warning("Bulk refine: transcript %d not found, skipping", tid)
@@ -371,68 +542,78 @@ class RefinementHandlers:
                             },
                         )
                         continue
+                    batch_ids.append(tid)
+                    texts.append(transcript.normalized_text or transcript.raw_text)
+                if not texts:
+                    continue
 
-                    text = transcript.normalized_text or transcript.raw_text
-                    try:
-                        refine_start = time.monotonic()
-                        refined = _slm.refine_text_sync(
-                            text,
-                            level=intent.level,
-                            instructions=resolved_instructions,
-                            allow_skip=self._settings_provider().refinement.smart_refinement,
-                        )
-                        refinement_capture = self._build_refinement_capture(resolved_instructions, _slm)
-                        refine_elapsed_ms = int((time.monotonic() - refine_start) * 1000)
-                    except TimeoutError:
-                        logger.warning("Bulk refine: timed out waiting for SLM lock for transcript %d", tid)
-                        failed += 1
-                        self._emit(
-                            "bulk_refinement_progress",
-                            {
-                                "completed": completed,
-                                "failed": failed,
-                                "total": total,
-                                "current_transcript_id": tid,
-                                "error": "Refinement engine is busy. Skipping this transcript.",
-                            },
-                        )
-                        continue
-                    except Exception as e:
-                        logger.exception("Bulk refine: inference failed for transcript %d", tid)
-                        failed += 1
-                        self._emit(
-                            "bulk_refinement_progress",
-                            {
-                                "completed": completed,
-                                "failed": failed,
-                                "total": total,
-                                "current_transcript_id": tid,
-                                "error": str(e),
-                            },
-                        )
-                        continue
+                delivered: set[int] = set()
+                on_result = functools.partial(deliver_result, _slm, _db, batch_ids, delivered)
 
-                    # Auto-commit: persist + tag + timing + emit
-                    self._persist_refinement(
-                        _db,
-                        tid,
-                        refined,
-                        refine_elapsed_ms=refine_elapsed_ms,
-                        refinement_capture=refinement_capture,
+                try:
+                    _slm.refine_batch_sync(
+                        texts,
+                        level=intent.level,
+                        instructions=resolved_instructions,
+                        allow_skip=self._settings_provider().refinement.smart_refinement,
+                        on_result=on_result,
+                        should_cancel=self._bulk_cancel.is_set,
+                    )
+                except Exception:
+                    # One bad prompt (or a transient engine error) must not fail
+                    # the whole window: retry what was not delivered one by one.
+                    logger.exception(
+                        "Bulk refine: batched inference failed; refining %d transcript(s) one by one",
+                        len(batch_ids) - len(delivered),
                     )
-                    completed += 1
+                else:
+                    continue
+                for index, tid in enumerate(batch_ids):
+                    if index in delivered:
+                        continue
+                    if self._bulk_cancel.is_set() or not refine_item(_slm, _db, tid, texts[index]):
+                        return
 
-                    # Auto-retitle if enabled
-                    settings = self._settings_provider()
-                    if settings.output.auto_retitle_on_refine:
-                        title_gen = self._title_generator_provider()
-                        if title_gen is not None:
-                            title_gen.schedule(tid, refined)
+        def refine_sequential(_slm: Any) -> None:
+            nonlocal completed, failed
+            for tid in transcript_ids:
+                if self._bulk_cancel.is_set():
+                    logger.info("Bulk refinement cancelled after %d/%d", completed, total)
+                    break
 
+                _db = self._db_provider()
+                if not _db:
+                    failed += 1
+                    continue
+
+                transcript = _db.get_transcript(tid)
+                if not transcript:
+                    logger.warning("Bulk refine: transcript %d not found, skipping", tid)
+                    failed += 1
                     self._emit(
                         "bulk_refinement_progress",
-                        {"completed": completed, "failed": failed, "total": total, "current_transcript_id": tid},
+                        {
+                            "completed": completed,
+                            "failed": failed,
+                            "total": total,
+                            "current_transcript_id": tid,
+                            "skipped": True,
+                        },
                     )
+                    continue
+
+                text = transcript.normalized_text or transcript.raw_text
+                if not refine_item(_slm, _db, tid, text):
+                    break
+
+        def do_bulk() -> None:
+            _slm = self._slm_runtime_provider()
+            try:
+                batch_size = self._bulk_batch_size(_slm)
+                if batch_size > 1:
+                    refine_batched(_slm, batch_size)
+                else:
+                    refine_sequential(_slm)
 
                 self._emit(
                     "bulk_refinement_complete",
@@ -457,6 +638,15 @@ class RefinementHandlers:
         t = threading.Thread(target=do_bulk, daemon=True, name="bulk-refine")
         t.start()
 
+    @staticmethod
+    def _bulk_batch_size(slm_runtime: Any) -> int:
+        """Batch size the runtime supports for bulk refinement (1 = sequential)."""
+        get_batch_size = getattr(slm_runtime, "bulk_batch_size", None)
+        if not callable(get_batch_size):
+            return 1
+        size = get_batch_size()
+        return size if isinstance(size, int) and size > 1 else 1
+
     @handles(CancelBulkRefinementIntent)
     def handle_cancel_bulk_refine(self, intent: Any) -> None:
         if not self._bulk_active:
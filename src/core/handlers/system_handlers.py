@@ -58,6 +58,11 @@ class SystemHandlers:
             except Exception:
                 logger.exception("Failed to reload logging configuration")
 
+        if "secrets" in settings_updates:
+            from src.core.secret_store import set_credential_cache_ttl
+
+            set_credential_cache_ttl(new_settings.secrets.credential_cache_ttl_seconds or None)
+
         # Reload activation keys if the input handler is running
         input_listener = self._input_listener_provider()
         if input_listener:
@@ -0,0 +1,227 @@
+"""
+Process-wide HTTP connection pool for remote providers.
+
+Groq and LM Studio providers (refinement and transcription) share one
+``HttpConnectionPool`` instead of building an ``httpx.Client`` each. Clients
+are keyed by origin (scheme, host, port), so a provider rebuilt after a
+settings change, engine restart or model switch reuses the warm connections
+of its predecessor. Each origin gets its own connection limit.
+
+HTTP/2 is used when the optional ``h2`` package is installed
+(``pip install httpx[http2]``); otherwise connections are HTTP/1.1
+keep-alive.
+
+``warm`` opens a connection ahead of the first real request (a cheap
+``GET``), so the first dictation after startup or after an idle stretch
+does not pay DNS + TCP + TLS on the critical path. Targets are remembered,
+and ``rewarm_idle`` re-warms every origin that has been quiet long enough
+for its keep-alive connection to have lapsed.
+
+The coordinator owns the pool (``install_http_pool`` at startup, closed in
+cleanup); code outside it uses ``get_http_pool``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_WARM_TIMEOUT = httpx.Timeout(5.0)
+
+
+def http2_available() -> bool:
+    """True when httpx can negotiate HTTP/2 (the ``h2`` package is installed)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def origin_of(url: str) -> str:
+    """``scheme://host:port`` for ``url`` — the key connections are pooled by."""
+    parts = urlsplit(url)
+    scheme = (parts.scheme or "http").lower()
+    port = parts.port or (443 if scheme == "https" else 80)
+    return f"{scheme}://{(parts.hostname or '').lower()}:{port}"
+
+
+@dataclass(slots=True)
+class _WarmTarget:
+    url: str
+    headers: dict[str, str]
+
+
+class HttpConnectionPool:
+    """Shared, thread-safe ``httpx.Client`` per origin with connection warming."""
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = 32,
+        keepalive_expiry_s: float = 120.0,
+        rewarm_after_idle_s: float = 30.0,
+        http2: bool | None = None,
+        transport_factory: Callable[[], httpx.BaseTransport] | None = None,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_connections_per_host,
+            keepalive_expiry=keepalive_expiry_s,
+        )
+        self._rewarm_after_idle_s = rewarm_after_idle_s
+        self._http2 = http2_available() if http2 is None else http2
+        self._transport_factory = transport_factory
+        self._lock = threading.Lock()
+        self._clients: dict[str, httpx.Client] = {}
+        self._last_used: dict[str, float] = {}
+        self._warming: set[str] = set()
+        self._targets: dict[str, _WarmTarget] = {}
+        self._closed = False
+        self.warm_requests = 0
+
+    @property
+    def http2(self) -> bool:
+        return self._http2
+
+    def client_for(self, url: str) -> httpx.Client:
+        """Return the pooled client for ``url``'s origin, creating it on first use."""
+        origin = origin_of(url)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("HTTP connection pool is closed.")
+            client = self._clients.get(origin)
+            if client is None:
+                client = httpx.Client(
+                    http2=self._http2,
+                    limits=self._limits,
+                    transport=self._transport_factory() if self._transport_factory else None,
+                    event_hooks={"response": [lambda _response, origin=origin: self._touch(origin)]},
+                )
+                self._clients[origin] = client
+                logger.debug("HTTP pool opened client for %s (http2=%s)", origin, self._http2)
+            return client
+
+    def _touch(self, origin: str) -> None:
+        with self._lock:
+            self._last_used[origin] = time.monotonic()
+
+    def idle_seconds(self, url: str) -> float | None:
+        """Seconds since the last response from ``url``'s origin (``None`` if never)."""
+        with self._lock:
+            last = self._last_used.get(origin_of(url))
+        return None if last is None else time.monotonic() - last
+
+    def remember(self, url: str, *, headers: dict[str, str] | None = None) -> None:
+        """Record ``url`` as the warm-up target for its origin without any I/O."""
+        with self._lock:
+            self._targets[origin_of(url)] = _WarmTarget(url=url, headers=dict(headers or {}))
+
+    def warm(self, url: str, *, headers: dict[str, str] | None = None, wait: bool = False) -> bool:
+        """Open a connection to ``url``'s origin unless one was used recently.
+
+        Sends a ``GET`` (a provider's model list is a good target) in a
+        background thread, or inline when ``wait`` is true. The response is
+        ignored; errors are logged at debug level. Returns True when a
+        warm-up request was started.
+        """
+        self.remember(url, headers=headers)
+        origin = origin_of(url)
+        idle = self.idle_seconds(url)
+        if idle is not None and idle < self._rewarm_after_idle_s:
+            return False
+        with self._lock:
+            if self._closed or origin in self._warming:
+                return False
+            self._warming.add(origin)
+            self.warm_requests += 1
+        if wait:
+            self._warm_request(origin, url, headers or {})
+        else:
+            threading.Thread(
+                target=self._warm_request, args=(origin, url, headers or {}), daemon=True, name="http-warm"
+            ).start()
+        return True
+
+    def rewarm_idle(self) -> int:
+        """Warm every remembered origin that has gone quiet; returns requests started."""
+        with self._lock:
+            targets = list(self._targets.values())
+        return sum(self.warm(target.url, headers=target.headers) for target in targets)
+
+    def _warm_request(self, origin: str, url: str, headers: dict[str, str]) -> None:
+        start = time.perf_counter()
+        try:
+            self.client_for(url).get(url, headers=headers, timeout=_WARM_TIMEOUT)
+            logger.debug("HTTP pool warmed %s in %.0fms", origin, (time.perf_counter() - start) * 1000)
+        except Exception as exc:
+            logger.debug("HTTP pool warm-up of %s failed: %s", origin, exc)
+        finally:
+            with self._lock:
+                self._warming.discard(origin)
+
+    def stats(self) -> dict[str, object]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "http2": self._http2,
+                "origins": sorted(self._clients),
+                "warm_requests": self.warm_requests,
+                "idle_seconds": {origin: round(now - last, 1) for origin, last in self._last_used.items()},
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._targets.clear()
+            self._closed = True
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                logger.debug("HTTP client close failed (non-fatal)", exc_info=True)
+
+
+_pool: HttpConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def install_http_pool(pool: HttpConnectionPool | None) -> None:
+    """Make ``pool`` the process-wide pool (the coordinator calls this at startup)."""
+    global _pool
+    with _pool_lock:
+        _pool = pool
+
+
+def get_http_pool() -> HttpConnectionPool:
+    """Return the process-wide pool, creating a default one if none is installed."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HttpConnectionPool()
+        return _pool
+
+
+def reset_http_pool() -> None:
+    """Close and drop the process-wide pool (cleanup and tests)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+__all__ = [
+    "HttpConnectionPool",
+    "get_http_pool",
+    "http2_available",
+    "install_http_pool",
+    "origin_of",
+    "reset_http_pool",
+]
@@ -8,9 +8,10 @@ fixed transcript counts or manual refresh buttons.
 Responsibilities:
 - Maintain a simple JSON cache of the last generated insight + timestamp.
 - Decide when regeneration is due based on daily word-count thresholds.
-- Run SLM inference on a background thread, never blocking anything.
+- Run SLM inference as a job in the scheduler's insight lane, never blocking
+  anything. A busy SLM queues the job; one that cannot start promptly is
+  deferred to the idle-time backfill lane instead of being dropped.
 - Emit 'insight_ready' via the EventBus when new content is available.
-- Respect the refinement job priority: skip if SLM is already INFERRING.
 
 Architecture constraint:
     The coordinator calls maybe_schedule() after each transcription_complete event
@@ -40,6 +41,7 @@ from src.core.insights.highlights import build_daily_highlights, build_long_term
 from src.core.resource_manager import ResourceManager
 from src.refinement.prompt_builder import PromptBuilder
 from src.refinement.providers import GenerationTaskKind, ReasoningPolicy, ResponseShape
+from src.services.slm_scheduler import SLMJobPreempted, SLMJobPriority
 
 if TYPE_CHECKING:
     from src.services.slm_runtime import SLMRuntime
@@ -62,6 +64,9 @@ _DEFAULT_THRESHOLDS: tuple[int, ...] = (500, 1000, 2500, 5000, 10_000)
 _FRESHNESS_GROWTH_WORDS = 250
 _FRESHNESS_MIN_INTERVAL_S = 120.0
 _INSIGHT_VISIBLE_OUTPUT_TOKENS = 384
+# Seconds an insight job may sit in the insight lane before it is deferred to
+# the scheduler's idle-time backfill lane.
+_INSIGHT_QUEUE_DEADLINE_S = 10.0
 
 
 class InsightManager:
@@ -102,7 +107,8 @@ class InsightManager:
                 logger.warning("Failed to read insight cache — starting fresh")
 
         self._lock = threading.Lock()
-        self._generating = False
+        self._generating = False  # a generation job is running
+        self._queued = False  # a generation job is waiting in the scheduler
         # Track the today_words value at last generation to detect threshold crossings.
         self._last_generated_today_words: int = self._cache.get("last_today_words", 0)
 
@@ -153,8 +159,9 @@ class InsightManager:
     ) -> None:
         """
         Called after every transcription_complete and when SLM becomes idle.
-        Checks whether a threshold has been crossed and, if so, starts a
-        background thread to regenerate.
+        Checks whether a threshold has been crossed and, if so, queues a
+        regeneration job on the SLM scheduler. A request made while an older
+        one is still queued replaces it (latest reason wins).
 
         Conditions to proceed:
         1. If `new_transcript_words` is given, it must be >= _MIN_TRANSCRIPT_WORDS.
@@ -162,8 +169,8 @@ class InsightManager:
            burst of trivially short transcripts from poking the SLM.
         2. today_words has crossed a threshold OR the freshness growth rule
            has tripped since last generation (ISS-122).
-        3. SLM runtime is loaded and READY.
-        4. No generation is already in flight.
+        3. SLM runtime is loaded (READY, or busy INFERRING — the job queues).
+        4. No generation is already running.
         """
         if new_transcript_words is not None and new_transcript_words < _MIN_TRANSCRIPT_WORDS:
             logger.debug(
@@ -185,7 +192,7 @@ class InsightManager:
 
             from src.services.slm_types import SLMState
 
-            if slm.state != SLMState.READY:
+            if slm.state not in (SLMState.READY, SLMState.INFERRING):
                 logger.info("Insight: SLM not ready (state=%s), skipping", slm.state)
                 return
 
@@ -217,12 +224,30 @@ class InsightManager:
                 )
                 return
 
-            self._generating = True
+            coalesced = self._queued
+            self._queued = True
 
         today_words = int(stats.get("today_words", 0) or 0)
-        logger.info("Insight: scheduling background generation (reason=%s, today_words=%d)", reason, today_words)
-        thread = threading.Thread(target=self._generate_task, args=(reason,), daemon=True)
-        thread.start()
+        logger.info(
+            "Insight: %s background generation (reason=%s, today_words=%d)",
+            "re-queueing" if coalesced else "scheduling",
+            reason,
+            today_words,
+        )
+        slm.submit_job(
+            lambda: self._generate_task(reason),
+            priority=SLMJobPriority.INSIGHT,
+            label="insight",
+            coalesce_key=f"insight:{self._event_name}",
+            deadline_s=_INSIGHT_QUEUE_DEADLINE_S,
+            on_expire="defer",
+            on_done=lambda _future: self._clear_queued(),
+            preemptible=True,
+        )
+
+    def _clear_queued(self) -> None:
+        with self._lock:
+            self._queued = False
 
     # ── Internal ─────────────────────────────────────────────────────────────
 
@@ -331,6 +356,9 @@ class InsightManager:
             self._write_cache()
 
     def _generate_task(self, reason: str = "scheduled") -> None:
+        with self._lock:
+            self._queued = False
+            self._generating = True
         try:
             stats = self._get_stats()
             if not stats or stats.get("count", 0) < 3:
@@ -354,7 +382,7 @@ class InsightManager:
 
             from src.services.slm_types import SLMState
 
-            if slm.state != SLMState.READY:
+            if slm.state not in (SLMState.READY, SLMState.INFERRING):
                 logger.warning("Insight: SLM no longer ready (%s), aborting", slm.state)
                 return
 
@@ -399,6 +427,12 @@ class InsightManager:
                 self._emit(self._event_name, self._cache_payload())
                 logger.info("Insight: generation complete, cache updated (reason=%s)", reason)
 
+        except SLMJobPreempted:
+            # The scheduler re-runs this job once interactive work is done.
+            logger.info("Insight: preempted by interactive work, requeued (reason=%s)", reason)
+            with self._lock:
+                self._queued = True
+            raise
         except Exception:
             logger.exception("Insight: generation failed")
         finally:
@@ -129,6 +129,8 @@ class RefineTranscriptIntent(InteractionIntent):
     level: int = 2
     instructions: str = ""
     prompt_transcript_id: int | None = None
+    # Auto-refine after transcription queues behind user-triggered refinements.
+    auto: bool = False
     source: IntentSource = IntentSource.CONTROLS
 
     def __post_init__(self) -> None:
@@ -221,6 +223,38 @@ class ImportAudioFileIntent(InteractionIntent):
     source: IntentSource = IntentSource.API
 
 
+@dataclass(frozen=True, slots=True)
+class ImportAudioBatchIntent(InteractionIntent):
+    """Queue several audio files as one resumable import job, transcribed in order."""
+
+    file_paths: tuple[str, ...] = field(default_factory=tuple)
+    file_names: tuple[str, ...] = field(default_factory=tuple)
+    cleanup_source: bool = False
+    source: IntentSource = IntentSource.API
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "file_paths", tuple(self.file_paths))
+        object.__setattr__(self, "file_names", tuple(self.file_names))
+        if self.file_names and len(self.file_names) != len(self.file_paths):
+            raise ValueError("file_names must match file_paths")
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeImportJobIntent(InteractionIntent):
+    """Re-queue an interrupted or cancelled import job; completed files are skipped."""
+
+    job_id: str = ""
+    source: IntentSource = IntentSource.API
+
+
+@dataclass(frozen=True, slots=True)
+class CancelImportJobIntent(InteractionIntent):
+    """Cancel a queued or running import job; files not yet stored stay pending."""
+
+    job_id: str = ""
+    source: IntentSource = IntentSource.API
+
+
 @dataclass(frozen=True, slots=True)
 class RetranscribeIntent(InteractionIntent):
     """Re-transcribe a transcript from its cached audio."""
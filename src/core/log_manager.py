@@ -101,6 +101,31 @@ def _detect_cpu_details() -> dict[str, Any]:
     return details
 
 
+def _calibration_summary() -> dict[str, Any]:
+    """This machine's calibrated CPU profiles, without the raw sweep samples."""
+    from src.services.calibration import CalibrationStore, cpu_model
+
+    try:
+        profiles = CalibrationStore.open_default().profiles()
+    except Exception:
+        logger.debug("Calibration profiles unavailable for diagnostics", exc_info=True)
+        profiles = []
+    return {
+        "cpu_model": cpu_model(),
+        "profiles": [
+            {
+                "kind": p.kind,
+                "model_id": p.model_id,
+                "threads": p.threads,
+                "compute_type": p.compute_type,
+                p.metric: p.value,
+                "calibrated_at": p.calibrated_at,
+            }
+            for p in profiles
+        ],
+    }
+
+
 def build_support_diagnostics_snapshot(
     settings: "VociferousSettings",
     *,
@@ -138,6 +163,7 @@ def build_support_diagnostics_snapshot(
         },
         "asr": describe_asr_runtime(settings, cuda_status=cuda_status),
         "slm": describe_slm_runtime(settings, cuda_status=cuda_status),
+        "calibration": _calibration_summary(),
     }
     if transcript_count is not None:
         snapshot["transcripts"] = {"count": transcript_count}
@@ -165,13 +191,15 @@ def log_support_diagnostics_snapshot(settings: "VociferousSettings", *, transcri
         transcript_info.get("count", "n/a"),
     )
     logger.info(
-        "Runtime snapshot: asr=%s slm=%s gpu=%s devices=%s vram=%s/%s MB",
+        "Runtime snapshot: asr=%s slm=%s gpu=%s devices=%s vram=%s/%s MB calibrated=%s",
         _runtime_label(snapshot["asr"]),
         _runtime_label(snapshot["slm"]),
         "cuda" if gpu.get("cuda_available") else "unavailable",
         gpu.get("cuda_device_count", 0),
         gpu.get("vram_free_mb", "?"),
         gpu.get("vram_total_mb", "?"),
+        ",".join(f"{p['kind']}:{p['threads']}t/{p['compute_type']}" for p in snapshot["calibration"]["profiles"])
+        or "none",
     )
     logger.debug("Support snapshot detail", extra={"context": snapshot})
 
@@ -13,6 +13,7 @@ from src.refinement.prompt_builder import PromptBuilder
 
 if TYPE_CHECKING:
     from src.core.settings import VociferousSettings
+    from src.services.slm_types import RefinedText
 
 _PROMPT_BODY_SENTINEL = "__VOCIFEROUS_TRANSCRIPT_BODY__"
 
@@ -21,16 +22,22 @@ def build_refinement_capture(
     settings: "VociferousSettings",
     slm_runtime: Any,
     instructions: str,
+    refinement: RefinedText | None = None,
 ) -> dict[str, str | int | bool]:
     """Build the refinement-capture payload that gets persisted with the variant.
 
-    Pulls runtime details (provider, model, device, thinking flag, last usage
-    counts) from the SLM runtime's ``get_runtime_summary`` when available,
-    falling back to settings when the runtime hasn't reported yet.
+    Pulls runtime details (provider, model, device, thinking flag) from the SLM
+    runtime's ``get_runtime_summary`` when available, falling back to settings
+    when the runtime hasn't reported yet. Token usage and cache provenance come
+    from ``refinement`` — the result being persisted — so a concurrent run
+    cannot leak its numbers into this one, as do the runtime details when a
+    raced provider produced it.
     """
     runtime: dict[str, object] = {}
     get_runtime_summary = getattr(slm_runtime, "get_runtime_summary", None)
-    if callable(get_runtime_summary):
+    if refinement is not None and refinement.runtime is not None:
+        runtime = refinement.runtime
+    elif callable(get_runtime_summary):
         candidate = get_runtime_summary()
         if isinstance(candidate, dict):
             runtime = candidate
@@ -38,7 +45,11 @@ def build_refinement_capture(
     provider = str(runtime.get("provider") or settings.refinement.provider)
     model_id = str(runtime.get("model_id") or settings.refinement.model_id)
     use_thinking = bool(runtime.get("use_thinking", settings.refinement.use_thinking))
-    last_usage = runtime.get("last_usage") if isinstance(runtime.get("last_usage"), dict) else {}
+    if refinement is not None:
+        last_usage: dict[str, int] = refinement.usage
+    else:
+        summary_usage = runtime.get("last_usage")
+        last_usage = summary_usage if isinstance(summary_usage, dict) else {}
     if use_thinking:
         thinking_directive = ""
     elif provider == "local_ct2":
@@ -75,6 +86,7 @@ def build_refinement_capture(
         "refinement_prompt_tokens": int(last_usage.get("prompt_tokens") or 0),
         "refinement_completion_tokens": int(last_usage.get("completion_tokens") or 0),
         "refinement_total_tokens": int(last_usage.get("total_tokens") or 0),
+        "refinement_cached": refinement.cached if refinement is not None else False,
     }
 
 
@@ -6,11 +6,19 @@ don't have to know the SLMState enum themselves.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from src.services.slm_scheduler import SLMJobPriority
 
-def validate_slm_ready(slm_runtime: Any) -> tuple[Any, str | None]:
-    """Check SLM is ready; return ``(runtime, error_message_or_None)``."""
+
+def validate_slm_ready(slm_runtime: Any, priority: SLMJobPriority | None = None) -> tuple[Any, str | None]:
+    """Check SLM is ready; return ``(runtime, error_message_or_None)``.
+
+    With ``priority``, a runtime that is busy with a less urgent job (a
+    title, an insight, a bulk batch) counts as ready: the scheduler queues
+    the new job ahead of it and preempts it where it can.
+    """
     if not slm_runtime:
         return None, "Refinement is not configured. Enable it in Settings."
 
@@ -19,15 +27,25 @@ def validate_slm_ready(slm_runtime: Any) -> tuple[Any, str | None]:
     state = slm_runtime.state
     if state == SLMState.DISABLED:
         return None, "Refinement is disabled. Enable it in Settings and ensure a model is downloaded."
-    if state == SLMState.LOADING:
+    if state == SLMState.LOADING and getattr(slm_runtime, "is_warming_up", False) is not True:
         return None, "The refinement model is still loading. Please wait a moment and try again."
     if state == SLMState.ERROR:
         return None, "The refinement model failed to load. Check Settings to verify a model is downloaded."
-    if state == SLMState.INFERRING:
+    if state == SLMState.INFERRING and not _outranks_running_job(slm_runtime, priority):
         return None, "A refinement is already in progress. Please wait for it to finish."
-    if state != SLMState.READY:
+    if state not in (SLMState.READY, SLMState.UNLOADED, SLMState.LOADING, SLMState.INFERRING):
         return None, f"Refinement model not ready (state: {state.value})"
     return slm_runtime, None
 
 
+def _outranks_running_job(slm_runtime: Any, priority: SLMJobPriority | None) -> bool:
+    if priority is None:
+        return False
+    running_priority = getattr(slm_runtime, "running_priority", None)
+    if not callable(running_priority):
+        return False
+    running = running_priority()
+    return running is None or (isinstance(running, int) and priority < running)
+
+
 __all__ = ["validate_slm_ready"]
@@ -4,11 +4,17 @@ from .lifecycle import cleanup_coordinator, do_cleanup, restart_engine, shutdown
 from .server_window import open_window, start_api_server, wait_for_server
 from .services import (
     init_audio_service,
+    init_cpu_partitioner,
+    init_credential_cache,
+    init_hardware_calibrator,
+    init_http_pool,
     init_input_handler,
     init_insight_manager,
+    init_model_residency,
     init_recording_session,
     init_slm_runtime,
     init_title_generator,
+    start_background_stages,
 )
 
 __all__ = [
@@ -20,9 +26,15 @@ __all__ = [
     "start_api_server",
     "wait_for_server",
     "init_audio_service",
+    "init_cpu_partitioner",
+    "init_credential_cache",
+    "init_hardware_calibrator",
+    "init_http_pool",
     "init_input_handler",
     "init_insight_manager",
+    "init_model_residency",
     "init_recording_session",
     "init_slm_runtime",
     "init_title_generator",
+    "start_background_stages",
 ]
@@ -27,6 +27,8 @@ def shutdown_coordinator(
 
     logger.info("Shutdown requested...")
     coordinator._shutdown_event.set()
+    # Release intents still waiting on components that were starting up.
+    coordinator.readiness.settle_all()
 
     if coordinator.recording_session is not None:
         coordinator.recording_session.cancel_for_shutdown()
@@ -70,18 +72,50 @@ def do_cleanup(coordinator: ApplicationCoordinator) -> None:
         except Exception:
             logger.exception("Input listener cleanup failed")
 
+    if coordinator.model_residency is not None:
+        coordinator.model_residency.shutdown()
+
     if coordinator.slm_runtime:
         try:
             coordinator.slm_runtime.shutdown()
         except Exception:
             logger.exception("SLM runtime cleanup failed")
 
+    if coordinator.slm_scheduler is not None:
+        coordinator.slm_scheduler.shutdown()
+
+    if coordinator.asr_scheduler is not None:
+        coordinator.asr_scheduler.shutdown()
+
+    if coordinator.refinement_cache is not None:
+        coordinator.refinement_cache.close()
+
+    if coordinator.transcription_cache is not None:
+        coordinator.transcription_cache.close()
+
     if coordinator.recording_session is not None:
         try:
             coordinator.recording_session.shutdown_models()
         except Exception:
             logger.exception("Recording model cleanup failed")
 
+    # Worker processes (model.worker_process / refinement.worker_process)
+    # can be stopped cleanly: their native teardown cannot abort us.
+    from src.services.inference_worker import shutdown_workers
+
+    shutdown_workers()
+
+    if coordinator.cpu_partitioner is not None:
+        from src.services.cpu_partition import install_core_partitioner
+
+        install_core_partitioner(None)
+
+    if coordinator.http_pool is not None:
+        from src.core.http_pool import install_http_pool
+
+        coordinator.http_pool.close()
+        install_http_pool(None)
+
     if coordinator.db:
         try:
             coordinator.db.close()
@@ -105,19 +139,6 @@ def restart_engine(coordinator: ApplicationCoordinator) -> None:
 
     def _do_restart() -> None:
         try:
-            logger.info("Engine restart requested — tearing down models...")
-            coordinator.event_bus.emit("engine_status", {"asr": "restarting", "slm": "restarting"})
-
-            if coordinator.recording_session is not None:
-                coordinator.recording_session.unload_asr_model()
-
-            if coordinator.slm_runtime:
-                try:
-                    coordinator.slm_runtime.disable()
-                    coordinator.slm_runtime = None
-                except Exception:
-                    logger.exception("SLM teardown failed during restart")
-
             from src.core.log_manager import log_support_diagnostics_snapshot
             from src.core.settings import get_settings
 
@@ -126,10 +147,55 @@ def restart_engine(coordinator: ApplicationCoordinator) -> None:
                 coordinator.settings,
                 transcript_count=coordinator.db.transcript_count() if coordinator.db is not None else None,
             )
+            # New devices or engines can change the core split; models
+            # loaded below pick up thread counts to match.
+            if coordinator.cpu_partitioner is not None:
+                coordinator.cpu_partitioner.refresh()
+
+            # Hot-swap a model when its replacement fits next to it: the old one
+            # keeps serving until the new one is ready. Otherwise tear it down first.
+            session = coordinator.recording_session
+            runtime = coordinator.slm_runtime
+            residency = coordinator.model_residency
+            swap_asr = (
+                coordinator.settings.residency.hot_swap
+                and session is not None
+                and session.is_asr_loaded
+                and (residency is None or residency.fits_alongside("asr"))
+            )
+            swap_slm = runtime is not None and runtime.can_hot_swap()
+
+            logger.info(
+                "Engine restart requested — ASR %s, SLM %s",
+                "hot-swap" if swap_asr else "reload",
+                "hot-swap" if swap_slm else "reload",
+            )
+            coordinator.event_bus.emit(
+                "engine_status",
+                {"asr": "swapping" if swap_asr else "restarting", "slm": "swapping" if swap_slm else "restarting"},
+            )
+
+            if session is not None and not swap_asr:
+                session.unload_asr_model()
+
+            if runtime is not None and not swap_slm:
+                try:
+                    runtime.disable()
+                    coordinator.slm_runtime = None
+                except Exception:
+                    logger.exception("SLM teardown failed during restart")
+
+            if session is not None:
+                if not swap_asr:
+                    session.load_asr_model()
+                elif not session.hot_swap_asr_model():
+                    _emit_swap_failed(coordinator, "asr", session.last_asr_error)
+
+            if not swap_slm:
+                coordinator._init_slm_runtime()
+            elif not runtime.hot_swap():
+                _emit_swap_failed(coordinator, "slm", runtime.last_error)
 
-            if coordinator.recording_session is not None:
-                coordinator.recording_session.load_asr_model()
-            coordinator._init_slm_runtime()
             coordinator.event_bus.emit("engine_restarted", {})
 
             logger.info("Engine restart complete.")
@@ -138,3 +204,16 @@ def restart_engine(coordinator: ApplicationCoordinator) -> None:
 
     thread = threading.Thread(target=_do_restart, name="engine-restart", daemon=True)
     thread.start()
+
+
+def _emit_swap_failed(coordinator: ApplicationCoordinator, component: str, error: str | None) -> None:
+    """Report a failed hot-swap; the previous model is still in service."""
+    state = "ready" if component == "asr" else coordinator.slm_runtime.state.value
+    coordinator.event_bus.emit(
+        "engine_status",
+        {
+            component: state,
+            "status": "swap_failed",
+            "message": f"New model failed to load; still using the previous one. {error or ''}".strip(),
+        },
+    )
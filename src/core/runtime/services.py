@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import partial
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,11 +11,142 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def init_http_pool(coordinator: ApplicationCoordinator) -> None:
+    """Create the shared HTTP connection pool used by every remote provider."""
+    from src.core.http_pool import HttpConnectionPool, install_http_pool
+
+    coordinator.http_pool = HttpConnectionPool()
+    install_http_pool(coordinator.http_pool)
+    logger.info("HTTP connection pool ready (http2=%s)", coordinator.http_pool.http2)
+
+
+def init_credential_cache(coordinator: ApplicationCoordinator) -> None:
+    """Apply the configured credential cache TTL before any provider reads a key."""
+    from src.core.secret_store import set_credential_cache_ttl
+
+    set_credential_cache_ttl(coordinator.settings.secrets.credential_cache_ttl_seconds or None)
+
+
+def init_cpu_partitioner(coordinator: ApplicationCoordinator) -> None:
+    """Create the CPU core partitioner that model loads and inference pin themselves to."""
+    from src.services.cpu_partition import CorePartitioner, install_core_partitioner
+
+    coordinator.cpu_partitioner = CorePartitioner(settings_provider=lambda: coordinator.settings)
+    install_core_partitioner(coordinator.cpu_partitioner)
+
+
+def init_model_residency(coordinator: ApplicationCoordinator) -> None:
+    """Create the residency manager and register the ASR, VAD and SLM models.
+
+    ``asr_side`` covers the Whisper models loaded next to the configured one
+    (dictation routing and racing); it shares the ASR pool and idle timeout.
+
+    Owners are resolved through the coordinator on every call, so the
+    registrations survive engine restarts that replace the SLM runtime.
+    """
+    from src.core.model_registry import SILERO_VAD, get_asr_model, get_slm_model
+    from src.services.model_residency import MemoryPool, ModelResidencyManager
+    from src.services.slm_types import SLMState
+
+    def on_evicted(name: str) -> None:
+        coordinator.event_bus.emit("engine_status", {"component": name, "status": "unloaded"})
+
+    manager = ModelResidencyManager(settings_provider=lambda: coordinator.settings, on_evicted=on_evicted)
+
+    def session():
+        return coordinator.recording_session
+
+    def pool(summary: dict[str, object] | None) -> MemoryPool:
+        return "vram" if summary and summary.get("resolved_device") == "cuda" else "ram"
+
+    def asr_estimate() -> float:
+        settings = coordinator.settings
+        model = get_asr_model(settings.model.model) if settings.model.provider == "local_faster_whisper" else None
+        return float(model.size_mb) if model else 0.0
+
+    def slm_estimate() -> float:
+        settings = coordinator.settings
+        model = get_slm_model(settings.refinement.model_id) if settings.refinement.provider == "local_ct2" else None
+        return float(model.size_mb) if model else 0.0
+
+    def asr_busy() -> bool:
+        rs = session()
+        scheduler = coordinator.asr_scheduler
+        return bool(
+            rs is not None
+            and (rs.is_recording or rs.is_transcribing or (scheduler is not None and not scheduler.wait_idle(0)))
+        )
+
+    def slm_busy() -> bool:
+        runtime, scheduler = coordinator.slm_runtime, coordinator.slm_scheduler
+        if runtime is not None and runtime.state in (SLMState.LOADING, SLMState.INFERRING):
+            return True
+        metrics = scheduler.metrics() if scheduler is not None else {}
+        return metrics.get("running") is not None or bool(metrics.get("queue_depth"))
+
+    def asr_idle() -> float:
+        return coordinator.settings.residency.asr_idle_minutes * 60
+
+    manager.register(
+        "asr",
+        load=lambda: session().reload_asr_model(),
+        unload=lambda: session().evict_asr_model(),
+        is_loaded=lambda: session() is not None and session().is_asr_loaded,
+        estimate_mb=asr_estimate,
+        pool=lambda: pool(session().get_asr_runtime_summary() if session() is not None else None),
+        busy=asr_busy,
+        idle_timeout_s=asr_idle,
+    )
+    manager.register(
+        "asr_side",
+        load=lambda: session().preload_race_model(),
+        unload=lambda: session().evict_side_models(),
+        is_loaded=lambda: session() is not None and session().is_side_model_loaded,
+        estimate_mb=lambda: session().side_models_estimate_mb() if session() is not None else 0.0,
+        pool=lambda: pool(session().get_asr_runtime_summary() if session() is not None else None),
+        busy=asr_busy,
+        idle_timeout_s=asr_idle,
+    )
+    manager.register(
+        "vad",
+        load=lambda: session().load_vad_model(),
+        unload=lambda: session().unload_vad_model(),
+        is_loaded=lambda: session() is not None and session().is_vad_loaded,
+        estimate_mb=lambda: float(SILERO_VAD.size_mb),
+        busy=asr_busy,
+        idle_timeout_s=asr_idle,
+    )
+    manager.register(
+        "slm",
+        load=lambda: coordinator.slm_runtime.reload(),
+        unload=lambda: coordinator.slm_runtime.evict(),
+        is_loaded=lambda: coordinator.slm_runtime is not None and coordinator.slm_runtime.state == SLMState.READY,
+        estimate_mb=slm_estimate,
+        pool=lambda: pool(coordinator.slm_runtime.get_runtime_summary() if coordinator.slm_runtime else None),
+        busy=slm_busy,
+        idle_timeout_s=lambda: coordinator.settings.residency.slm_idle_minutes * 60,
+    )
+    manager.start()
+    coordinator.model_residency = manager
+
+
 def init_recording_session(coordinator: ApplicationCoordinator) -> None:
     """Create the recording session and attach audio cache support."""
     from src.core.handlers.recording_handlers import RecordingSession
+    from src.services.asr_scheduler import ASRScheduler
     from src.services.audio_cache import AudioCacheManager
 
+    if coordinator.asr_scheduler is None:
+        coordinator.asr_scheduler = ASRScheduler()
+
+    if coordinator.transcription_cache is None:
+        try:
+            from src.services.transcription_cache import TranscriptionResultCache
+
+            coordinator.transcription_cache = TranscriptionResultCache.open_default()
+        except Exception:
+            logger.warning("Transcription result cache unavailable (non-fatal)", exc_info=True)
+
     coordinator.recording_session = RecordingSession(
         audio_service_provider=lambda: coordinator.audio_service,
         settings_provider=lambda: coordinator.settings,
@@ -23,6 +155,10 @@ def init_recording_session(coordinator: ApplicationCoordinator) -> None:
         shutdown_event=coordinator._shutdown_event,
         insight_manager_provider=lambda: coordinator.insight_manager,
         title_generator_provider=lambda: coordinator.title_generator,
+        asr_scheduler=coordinator.asr_scheduler,
+        transcription_cache=coordinator.transcription_cache,
+        residency=coordinator.model_residency,
+        readiness=coordinator.readiness,
     )
 
     audio_cache = AudioCacheManager(sample_rate=coordinator.settings.recording.sample_rate)
@@ -37,8 +173,23 @@ def init_recording_session(coordinator: ApplicationCoordinator) -> None:
 
 def init_slm_runtime(coordinator: ApplicationCoordinator) -> None:
     """Initialize the SLM refinement runtime if enabled."""
+    from src.core.startup import SLM
+    from src.services.slm_types import SLMState
+
     try:
         from src.services.slm_runtime import SLMRuntime
+        from src.services.slm_scheduler import SLMScheduler
+
+        if coordinator.slm_scheduler is None:
+            coordinator.slm_scheduler = SLMScheduler()
+
+        if coordinator.refinement_cache is None:
+            try:
+                from src.services.refinement_cache import RefinementResultCache
+
+                coordinator.refinement_cache = RefinementResultCache.open_default()
+            except Exception:
+                logger.warning("Refinement result cache unavailable (non-fatal)", exc_info=True)
 
         def on_slm_state(state):
             coordinator.event_bus.emit("engine_status", {"slm": state.value})
@@ -46,6 +197,8 @@ def init_slm_runtime(coordinator: ApplicationCoordinator) -> None:
 
             if state == _SLMState.READY and coordinator.insight_manager is not None:
                 coordinator.insight_manager.maybe_schedule(reason="slm_ready")
+            if state in (_SLMState.READY, _SLMState.ERROR, _SLMState.DISABLED):
+                _settle_slm_startup(coordinator, ok=state != _SLMState.ERROR)
 
         def on_slm_error(msg):
             coordinator.event_bus.emit("refinement_error", {"message": msg})
@@ -58,14 +211,96 @@ def init_slm_runtime(coordinator: ApplicationCoordinator) -> None:
             on_state_changed=on_slm_state,
             on_error=on_slm_error,
             on_text_ready=on_slm_text,
+            scheduler=coordinator.slm_scheduler,
+            result_cache=coordinator.refinement_cache,
+            residency=coordinator.model_residency,
         )
 
+        if not coordinator.readiness.is_settled(SLM):
+            coordinator.startup_trace.begin(SLM)
         if coordinator.settings.refinement.enabled:
             coordinator.slm_runtime.enable()
 
     except Exception:
         logger.exception("SLM runtime failed to initialize (non-fatal)")
 
+    # Nothing loading in the background: refinement is off or init failed.
+    runtime = coordinator.slm_runtime
+    if runtime is None or runtime.state != SLMState.LOADING:
+        _settle_slm_startup(coordinator, ok=runtime is not None and runtime.state != SLMState.ERROR)
+
+
+def _settle_slm_startup(coordinator: ApplicationCoordinator, *, ok: bool) -> None:
+    """End the startup ``slm`` stage the first time the runtime leaves LOADING."""
+    from src.core.startup import SLM
+
+    if coordinator.readiness.is_settled(SLM):
+        return
+    coordinator.startup_trace.end(SLM, error=None if ok else "SLM failed to load")
+    coordinator.readiness.settle(SLM, ok)
+
+
+def init_hardware_calibrator(coordinator: ApplicationCoordinator) -> None:
+    """Create the calibrator; sweeps run only when the user starts one."""
+    try:
+        from src.services.calibration import CalibrationStore, HardwareCalibrator
+
+        if coordinator.hardware_calibrator is None:
+            coordinator.hardware_calibrator = HardwareCalibrator(
+                settings_provider=lambda: coordinator.settings,
+                store=CalibrationStore.open_default(),
+                asr_scheduler=coordinator.asr_scheduler,
+                slm_scheduler=coordinator.slm_scheduler,
+                residency=coordinator.model_residency,
+                shutdown_event=coordinator._shutdown_event,
+            )
+        missing = coordinator.hardware_calibrator.missing()
+        if missing:
+            logger.info(
+                "No calibration profile for %s yet; auto settings use defaults until one is run", ", ".join(missing)
+            )
+    except Exception:
+        logger.exception("Hardware calibrator failed to initialize (non-fatal)")
+
+
+def start_background_stages(coordinator: ApplicationCoordinator) -> None:
+    """Run vault recovery and the ASR/VAD loads concurrently on background threads.
+
+    The SLM loads asynchronously on its own (``SLMRuntime.enable``) and
+    settles its readiness from the state callback above. Hardware
+    calibration waits until every model has settled so it never competes
+    with a load.
+    """
+    from src.core.startup import ASR, RECOVERY, SLM, VAD, run_stage
+
+    stage = partial(
+        run_stage,
+        trace=coordinator.startup_trace,
+        readiness=coordinator.readiness,
+        emit=coordinator.event_bus.emit,
+    )
+    session = coordinator.recording_session
+
+    def recover() -> None:
+        # Interrupted durable recordings are recovered before any new recording can start.
+        from src.services.audio_vault import AudioVaultManager
+
+        recovered = AudioVaultManager(coordinator.db).recover_interrupted_recordings()
+        coordinator.recoverable_recordings = [record.to_dict() for record in recovered]
+        if recovered:
+            logger.warning("Recovered %d interrupted audio recording(s)", len(recovered))
+            coordinator.event_bus.emit("audio_recovery_updated", {"count": len(recovered)})
+
+        # Batch imports cut short by the last exit wait for the user to resume them.
+        interrupted_imports = coordinator.db.interrupt_import_jobs()
+        if interrupted_imports:
+            logger.warning("Found %d interrupted audio import job(s)", len(interrupted_imports))
+
+    stage(RECOVERY, recover)
+    stage(ASR, session.load_asr_model, succeeded=lambda: session.is_asr_loaded)
+    stage(VAD, session.load_vad_model, succeeded=lambda: session.is_vad_loaded)
+    stage("calibration", lambda: init_hardware_calibrator(coordinator), after=(ASR, VAD, SLM))
+
 
 def init_insight_manager(coordinator: ApplicationCoordinator) -> None:
     """Initialize the unified InsightManager for analytics paragraphs."""
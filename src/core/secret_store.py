@@ -10,6 +10,8 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Literal
 
@@ -20,6 +22,21 @@ SecretBackend = Literal["win32_dpapi", "macos_keychain", "libsecret", "unavailab
 _SERVICE = "vociferous"
 _VALID_PROVIDERS = frozenset({"lm_studio", "groq"})
 
+# Provider keys are read on every remote request (auth header, shape check).
+# On Linux/macOS each backend read forks `secret-tool`/`security`, so lookups
+# are cached in memory — including "no key stored", the common case for
+# environment-variable users. store/delete invalidate the entry; an optional
+# TTL bounds staleness against edits made outside the app. A detected backend
+# is memoized too; "unavailable" is re-probed so a later install is noticed.
+# Every invalidation bumps the generation; a fill whose read started under an
+# older generation is dropped, so a read racing a store/delete cannot put the
+# previous key back.
+_cache_lock = threading.Lock()
+_cache_generation = 0
+_backend_cache: SecretBackend | None = None
+_provider_key_cache: dict[str, tuple[str | None, float]] = {}
+_provider_key_ttl_s: float | None = None
+
 
 class SecretStoreUnavailable(RuntimeError):
     """Raised when the current platform has no supported local secret backend."""
@@ -47,8 +64,41 @@ def _audio_vault_secret_store_unavailable_message() -> str:
     return "No supported local secret store is available for encrypted audio recordings."
 
 
+def set_credential_cache_ttl(seconds: float | None) -> None:
+    """Expire cached provider keys after ``seconds`` (``None`` = until invalidated)."""
+    global _provider_key_ttl_s
+    with _cache_lock:
+        _provider_key_ttl_s = seconds if seconds is None else max(0.0, float(seconds))
+
+
+def clear_credential_cache(provider_id: str | None = None) -> None:
+    """Drop one provider's cached key, or every cached key and the backend memo."""
+    global _backend_cache, _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        if provider_id is None:
+            _provider_key_cache.clear()
+            _backend_cache = None
+        else:
+            _provider_key_cache.pop(provider_id, None)
+
+
 def get_secret_backend() -> SecretBackend:
-    """Return the supported secret backend for this host."""
+    """Return the supported secret backend for this host (memoized once found)."""
+    global _backend_cache
+    with _cache_lock:
+        if _backend_cache is not None:
+            return _backend_cache
+        generation = _cache_generation
+    backend = _detect_secret_backend()
+    if backend != "unavailable":
+        with _cache_lock:
+            if generation == _cache_generation:
+                _backend_cache = backend
+    return backend
+
+
+def _detect_secret_backend() -> SecretBackend:
     if sys.platform == "win32":
         return "win32_dpapi"
     if sys.platform == "darwin" and shutil.which("security"):
@@ -72,11 +122,30 @@ def store_provider_api_key(provider_id: str, api_key: str) -> None:
         _secret_tool_store(provider_id, value)
     else:
         raise SecretStoreUnavailable(_provider_secret_store_unavailable_message())
+    clear_credential_cache(provider_id)
+
 
+def get_provider_api_key(provider_id: str, *, refresh: bool = False) -> str | None:
+    """Load a provider API key from the platform secret backend, if one exists.
 
-def get_provider_api_key(provider_id: str) -> str | None:
-    """Load a provider API key from the platform secret backend, if one exists."""
+    Served from the in-memory credential cache unless ``refresh`` is true or
+    the entry has outlived the configured TTL.
+    """
     provider_id = _validate_provider(provider_id)
+    with _cache_lock:
+        cached = None if refresh else _provider_key_cache.get(provider_id)
+        ttl = _provider_key_ttl_s
+        generation = _cache_generation
+    if cached is not None and (ttl is None or time.monotonic() - cached[1] < ttl):
+        return cached[0]
+    value = _read_provider_api_key(provider_id)
+    with _cache_lock:
+        if generation == _cache_generation:
+            _provider_key_cache[provider_id] = (value, time.monotonic())
+    return value
+
+
+def _read_provider_api_key(provider_id: str) -> str | None:
     backend = get_secret_backend()
     if backend == "win32_dpapi":
         return normalize_provider_api_key(provider_id, _dpapi_get(provider_id))
@@ -92,12 +161,15 @@ def delete_provider_api_key(provider_id: str) -> bool:
     provider_id = _validate_provider(provider_id)
     backend = get_secret_backend()
     if backend == "win32_dpapi":
-        return _dpapi_delete(provider_id)
-    if backend == "macos_keychain":
-        return _security_delete(provider_id)
-    if backend == "libsecret":
-        return _secret_tool_delete(provider_id)
-    return False
+        deleted = _dpapi_delete(provider_id)
+    elif backend == "macos_keychain":
+        deleted = _security_delete(provider_id)
+    elif backend == "libsecret":
+        deleted = _secret_tool_delete(provider_id)
+    else:
+        deleted = False
+    clear_credential_cache(provider_id)
+    return deleted
 
 
 def has_provider_api_key(provider_id: str) -> bool:
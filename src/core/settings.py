@@ -37,6 +37,18 @@ class OpenAICompatibleTranscriptionProviderSettings(BaseModel):
     timeout_seconds: float = 120.0
     model_list_enabled: bool = True
     temperature: float = 0.0
+    # Encoding of uploaded speech: "flac" (lossless, half to two-thirds of WAV),
+    # "opus" (Ogg/Opus, about a tenth of WAV) or "wav". FLAC and Opus need
+    # PyAV (installed with faster-whisper); without it uploads fall back to WAV.
+    upload_format: Literal["flac", "opus", "wav"] = "flac"
+    # Speech longer than this is split at VAD segment boundaries into pieces
+    # that are transcribed concurrently and stitched back in order.
+    max_chunk_seconds: float = 600.0
+    # Encoded pieces larger than this are split further (Groq's free tier
+    # accepts files up to 25 MB).
+    max_upload_bytes: int = 24_000_000
+    # Pieces of one recording uploaded at the same time.
+    upload_concurrency: int = 3
 
 
 class GroqTranscriptionProviderSettings(OpenAICompatibleTranscriptionProviderSettings):
@@ -66,8 +78,53 @@ class ModelSettings(BaseModel):
     model: str = "large-v3-turbo-int8"
     device: str = "auto"  # faster-whisper resolves device at model load time
     language: str = "en"
+    # CPU threads for Whisper; 0 = auto (calibrated per machine, see
+    # src/services/calibration.py), falling back to 4 until calibrated.
     n_threads: int = 4
+    # "auto" takes the calibrated CPU compute type for ASR and the local
+    # SLM (int8 until calibrated); CUDA still upgrades int8 to float16.
     compute_type: str = "int8"
+    # Local recordings and imports with at least this much speech (after VAD)
+    # are decoded with faster-whisper's BatchedInferencePipeline, several 30 s
+    # windows per forward pass, instead of window by window. 0 disables it.
+    batched_min_seconds: float = 120.0
+    # Windows decoded together in batched mode. Larger batches are faster on
+    # GPUs and many-core CPUs at the cost of memory.
+    batch_size: int = 8
+    # Run the local Whisper model in a separate worker process (audio handed
+    # over through shared memory). Keeps decoding off the app's GIL and a
+    # native crash out of the app; the worker restarts after a crash.
+    worker_process: bool = False
+    # Adaptive routing for local dictation: when the configured model is
+    # predicted (from measured real-time factors) to take longer than this
+    # many seconds on a recording, it is decoded on the fastest installed
+    # smaller model instead. The faster model loads on first use and stays
+    # loaded next to the configured one. 0 disables routing.
+    latency_budget_s: float = 0.0
+    # Re-transcribe routed dictations with the configured model in the
+    # background, replacing the draft unless it was edited meanwhile.
+    # Skipped while auto-refine is on (it rewrites the draft anyway).
+    retranscribe_routed: bool = True
+    # Two-pass dictation (local Whisper): a greedy (beam 1) draft is saved,
+    # shown and copied right away, then the same speech is re-decoded with
+    # the full beam search in the background and the transcript updated if
+    # the text differs. Off while auto-refine is on: refinement should get
+    # the full-quality text, and the clipboard waits for it anyway.
+    two_pass: bool = False
+    # Speculative racing for dictation between local Whisper and Groq (both
+    # must be set up): the configured provider gets the recording first and,
+    # if it has not answered within race_hedge_ms, the other one gets it too.
+    # The first non-empty text wins, the slower call is cancelled, and the
+    # winner is recorded as the transcript's provider. Routing and two-pass
+    # are skipped for raced dictations.
+    race_providers: bool = False
+    # Hedge delay; 0 = the configured provider's p90 latency for recordings
+    # of similar length (src/services/provider_race.py).
+    race_hedge_ms: int = 0
+    # Persistent transcription result cache: entries kept (LRU), 0 disables it.
+    # Re-transcription, imports and recovered recordings look up the source
+    # audio hash plus model/decode settings before running ASR.
+    result_cache_max_entries: int = 500
     # Stylistic anchor for the CTranslate2 Whisper decoder.  This text is
     # tokenized and passed as prompt tokens before each audio chunk.
     # Combined with condition_on_previous_text=False, this prompt becomes
@@ -160,10 +217,71 @@ class DisplaySettings(BaseModel):
     render_markdown_in_editor: bool = False
 
 
+class ResidencySettings(BaseModel):
+    """Model residency: memory budgets and idle unloading (see ModelResidencyManager)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # Budgets for loaded models in MB, per pool; 0 = unlimited. Loading a
+    # model that would not fit first unloads the least recently used other
+    # models in the same pool.
+    ram_budget_mb: int = 0
+    vram_budget_mb: int = 0
+    # Unload a model after this many minutes without use; 0 keeps it loaded.
+    # VAD follows the ASR timeout. An unloaded model reloads on next use.
+    asr_idle_minutes: float = 0.0
+    slm_idle_minutes: float = 0.0
+    # Reload unloaded models when recording starts (the SLM only with
+    # auto-refine on), so the reload overlaps with speaking.
+    predictive_reload: bool = True
+    # Run a short silent pass through VAD, Whisper and the SLM after each
+    # load, before reporting ready, so the first real request is not slowed
+    # by one-time kernel and allocator setup. A real request cancels it.
+    warmup_after_load: bool = True
+    # On engine restart or model change, load the new model next to the old
+    # one when the budget (or, without one, free memory) leaves room, then
+    # swap it in; otherwise the old model is unloaded first.
+    hot_swap: bool = True
+
+
+class CPUSettings(BaseModel):
+    """CPU core allocation between Whisper, the local SLM and the app (see src/services/cpu_partition.py)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # When Whisper and the local SLM both run on the CPU, give them disjoint
+    # core sets and cap each thread pool at its set, instead of letting both
+    # pools spread over every core. The caps are fixed when a model loads, so
+    # an engine keeps its smaller pool even while the other is idle; only
+    # thread placement widens to the other engine's cores then. Off by
+    # default; worth it when dictation and auto-refine overlap. An engine
+    # alone on the CPU gets every core outside the reserved ones.
+    partition: bool = False
+    # Physical cores kept free of both engines for the audio callback, the
+    # API server and the UI.
+    reserved_cores: int = 1
+    # Share of the remaining cores given to Whisper when both run on the CPU.
+    asr_share: float = 0.5
+
+
+class SecretSettings(BaseModel):
+    """Provider credential lookups (see src/core/secret_store.py)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # Stored API keys are cached in memory after the first lookup. Keys saved
+    # or deleted through the app always invalidate the cache; a positive value
+    # also re-reads the platform keyring after this many seconds, so edits made
+    # with `secret-tool` or Keychain Access are picked up. 0 = until invalidated.
+    credential_cache_ttl_seconds: float = 0.0
+
+
 def _auto_cpu_threads() -> int:
     """Pick a sensible CPU thread count for SLM inference.
 
-    Heuristic: logical_cores // 3, clamped [2, 10].  On a typical desktop
+    Heuristic: logical_cores // 3, clamped [2, 10]. Setting
+    ``refinement.n_threads = 0`` replaces it with a measured per-machine
+    value (see ``src.services.calibration``).  On a typical desktop
     with SMT this lands near physical_cores × 2/3, leaving headroom for
     the UI thread, audio pipeline, and ASR without starving the SLM.
     Benchmark reference (Ryzen 9 7900X 12c/24t, Qwen3-4B int8):
@@ -188,6 +306,10 @@ class OpenAICompatibleProviderSettings(BaseModel):
     # metered API — it will truncate long refinements at that limit.
     max_output_tokens: int = 0
     model_list_enabled: bool = True
+    # Upper bound on bulk-refinement requests in flight. The effective limit
+    # adapts below it: halved on a 429, grown back one request at a time on
+    # success. 1 restores one-at-a-time bulk refinement.
+    bulk_concurrency: int = 4
 
 
 class LMStudioProviderSettings(OpenAICompatibleProviderSettings):
@@ -195,6 +317,8 @@ class LMStudioProviderSettings(OpenAICompatibleProviderSettings):
 
     base_url: str = "http://localhost:1234/v1"
     api_key_env: str | None = "LM_STUDIO_API_KEY"
+    # A local server shares one GPU; queued requests eat into the read timeout.
+    bulk_concurrency: int = 2
 
 
 class GroqProviderSettings(OpenAICompatibleProviderSettings):
@@ -214,8 +338,42 @@ class RefinementSettings(BaseModel):
     provider: Literal["local_ct2", "lm_studio", "groq"] = "local_ct2"
     model_id: str = "qwen4b"
     n_gpu_layers: int = -1  # -1 = full GPU (CT2 device="cuda"), 0 = CPU only
-    n_threads: int = Field(default_factory=_auto_cpu_threads)  # CPU threads (CPU mode only)
+    # CPU threads (CPU mode only); 0 = auto (calibrated), _auto_cpu_threads() until calibrated.
+    n_threads: int = Field(default_factory=_auto_cpu_threads)
     smart_refinement: bool = False
+    # Transcripts per batched generate call during bulk refinement (local CT2
+    # only). 1 restores the one-at-a-time path; the engine may lower it
+    # further to fit free memory.
+    bulk_batch_size: int = 8
+    # Run the local CT2 model in a separate worker process (see
+    # model.worker_process). External providers are unaffected.
+    worker_process: bool = False
+    # Persistent refinement result cache: entries kept (LRU), 0 disables it.
+    # Only deterministic sampling (temperature <= 0.05 or top_k == 1) is
+    # cached unless cache_sampled_results opts sampled output in as well.
+    result_cache_max_entries: int = 2000
+    cache_sampled_results: bool = False
+    # Selective refinement: score each sentence with score_refinement_need and
+    # send only those at or above selective_threshold to the SLM, keeping clean
+    # sentences verbatim. Suited to in-place cleanup prompts, not rewrites.
+    selective_refinement: bool = False
+    selective_threshold: float = 0.15
+    # Chunked refinement for long transcripts: text longer than
+    # chunk_threshold_words (0 disables) is split at paragraph/sentence
+    # boundaries into windows of ~chunk_max_tokens, each repeating
+    # chunk_overlap_tokens of the previous window as context, then stitched.
+    # Remote providers refine up to chunk_concurrency windows at once.
+    chunk_threshold_words: int = 1500
+    chunk_max_tokens: int = 768
+    chunk_overlap_tokens: int = 48
+    chunk_concurrency: int = 3
+    # Speculative racing between the local model and Groq (see
+    # model.race_providers): the other provider gets a refinement too when
+    # the configured one has not answered within race_hedge_ms (0 = its p90
+    # latency for texts of similar length). local_ct2 and lm_studio race
+    # Groq; Groq races local_ct2. Split (selective/chunked) texts are not raced.
+    race_providers: bool = False
+    race_hedge_ms: int = 0
     use_thinking: bool = False  # Allow model to reason in <think> blocks before output
     temperature: float = 0.3
     top_p: float = 0.9
@@ -257,6 +415,9 @@ class VociferousSettings(BaseSettings):
     safety: SafetySettings = Field(default_factory=SafetySettings)
     refinement: RefinementSettings = Field(default_factory=RefinementSettings)
     display: DisplaySettings = Field(default_factory=DisplaySettings)
+    residency: ResidencySettings = Field(default_factory=ResidencySettings)
+    cpu: CPUSettings = Field(default_factory=CPUSettings)
+    secrets: SecretSettings = Field(default_factory=SecretSettings)
 
     model_config = {
         "env_prefix": "VOCIFEROUS_",
@@ -0,0 +1,221 @@
+"""
+Staged startup: per-stage timings and readiness futures.
+
+``ApplicationCoordinator.start`` brings up the database, the service
+objects and the API server first and opens the window right away. Model
+loads (ASR, VAD, SLM) and vault recovery run concurrently on background
+threads (``run_stage``). Each announces its progress through
+``engine_status`` events and settles a readiness future when done.
+
+Code that needs one of those components calls ``StartupReadiness.wait``
+instead of failing. A settled future only says the startup attempt has
+finished; whether the component actually works is still checked by the
+caller, which keeps its existing fallback (lazy load, error message).
+After startup every wait returns immediately.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Readiness components settled by startup.
+RECOVERY = "recovery"
+ASR = "asr"
+VAD = "vad"
+SLM = "slm"
+
+# Longest an intent waits for a component still starting up.
+STARTUP_WAIT_S = 120.0
+
+
+class StartupTrace:
+    """Start/end offsets of each startup stage, relative to construction."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._milestones: dict[str, float] = {}
+
+    def _now_ms(self) -> float:
+        return round((time.perf_counter() - self._origin) * 1000, 1)
+
+    def begin(self, name: str) -> None:
+        with self._lock:
+            self._stages[name] = {
+                "name": name,
+                "start_ms": self._now_ms(),
+                "end_ms": None,
+                "duration_ms": None,
+                "thread": threading.current_thread().name,
+                "error": None,
+            }
+
+    def end(self, name: str, *, error: str | None = None) -> None:
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None or stage["end_ms"] is not None:
+                return
+            stage["end_ms"] = self._now_ms()
+            stage["duration_ms"] = round(stage["end_ms"] - stage["start_ms"], 1)
+            stage["error"] = error
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self.begin(name)
+        try:
+            yield
+        except BaseException as exc:
+            self.end(name, error=str(exc) or type(exc).__name__)
+            raise
+        self.end(name)
+
+    def mark(self, name: str) -> None:
+        """Record a point in time (e.g. ``window_open``)."""
+        with self._lock:
+            self._milestones[name] = self._now_ms()
+
+    def milestone_ms(self, name: str) -> float | None:
+        with self._lock:
+            return self._milestones.get(name)
+
+    def duration_ms(self, name: str) -> float | None:
+        with self._lock:
+            stage = self._stages.get(name)
+            return stage["duration_ms"] if stage else None
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            stages = sorted((dict(stage) for stage in self._stages.values()), key=lambda stage: stage["start_ms"])
+            return {"stages": stages, "milestones": dict(self._milestones)}
+
+
+class StartupReadiness:
+    """One future per component; the result is whether its startup load succeeded.
+
+    Only components passed to ``expect`` are waited on. Anything else counts
+    as settled, so handlers built outside ``ApplicationCoordinator.start``
+    (tests, tools) never block.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+
+    def expect(self, *names: str) -> None:
+        """Declare components that startup is about to bring up."""
+        with self._lock:
+            for name in names:
+                self._futures.setdefault(name, Future())
+
+    def _future(self, name: str) -> Future | None:
+        with self._lock:
+            return self._futures.get(name)
+
+    def settle(self, name: str, ok: bool = True) -> None:
+        """Mark ``name`` as done starting up. Later calls are ignored."""
+        with self._lock:
+            future = self._futures.setdefault(name, Future())
+            if not future.done():
+                future.set_result(bool(ok))
+
+    def settle_all(self) -> None:
+        """Release every waiter (shutdown)."""
+        with self._lock:
+            names = list(self._futures)
+        for name in names:
+            self.settle(name, False)
+
+    def is_settled(self, name: str) -> bool:
+        future = self._future(name)
+        return future is None or future.done()
+
+    def wait(self, name: str, timeout: float | None = STARTUP_WAIT_S) -> bool | None:
+        """Block until ``name`` has settled. Returns its result, or None on timeout."""
+        future = self._future(name)
+        if future is None:
+            return True
+        if not future.done():
+            logger.info("Waiting for %s to finish starting up...", name)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            logger.warning("%s still starting up after %.0fs; continuing without it", name, timeout or 0)
+            return None
+
+    def when_settled(self, name: str, fn: Callable[[], Any]) -> None:
+        """Run ``fn`` on a daemon thread once ``name`` has settled, for callers that must not block."""
+
+        def _run() -> None:
+            self.wait(name)
+            try:
+                fn()
+            except Exception:
+                logger.exception("Deferred work waiting on %s failed", name)
+
+        threading.Thread(target=_run, daemon=True, name=f"startup-wait-{name}").start()
+
+    def snapshot(self) -> dict[str, str]:
+        with self._lock:
+            futures = dict(self._futures)
+        return {
+            name: ("ready" if future.result() else "failed") if future.done() else "pending"
+            for name, future in futures.items()
+        }
+
+
+def run_stage(
+    name: str,
+    fn: Callable[[], Any],
+    *,
+    trace: StartupTrace,
+    readiness: StartupReadiness,
+    emit: Callable[[str, dict[str, Any]], None],
+    after: Sequence[str] = (),
+    succeeded: Callable[[], bool] = lambda: True,
+) -> threading.Thread:
+    """Run ``fn`` on a daemon thread once the ``after`` components have settled.
+
+    Emits ``engine_status`` progress events, records the stage in ``trace``
+    and settles ``name`` with ``succeeded()`` (False if ``fn`` raised).
+    """
+
+    def _run() -> None:
+        for dependency in after:
+            readiness.wait(dependency, timeout=None)
+        emit("engine_status", {"component": name, "status": "loading"})
+        ok = False
+        try:
+            with trace.stage(name):
+                fn()
+            ok = bool(succeeded())
+        except Exception:
+            logger.exception("Startup stage %s failed", name)
+        finally:
+            readiness.settle(name, ok)
+        logger.info("Startup stage %s %s in %.0f ms", name, "ready" if ok else "failed", trace.duration_ms(name) or 0)
+        emit("engine_status", {"component": name, "status": "ready" if ok else "error"})
+
+    thread = threading.Thread(target=_run, daemon=True, name=f"startup-{name}")
+    thread.start()
+    return thread
+
+
+__all__ = [
+    "ASR",
+    "RECOVERY",
+    "SLM",
+    "STARTUP_WAIT_S",
+    "VAD",
+    "StartupReadiness",
+    "StartupTrace",
+    "run_stage",
+]
@@ -1,24 +1,28 @@
 """
 Title Generator — Background SLM-based auto-titling for transcripts.
 
-Follows the InsightManager pattern: fire-and-forget background thread,
-no blocking, emits 'transcript_updated' when the title is ready.
+Follows the InsightManager pattern: fire-and-forget job on the shared SLM
+scheduler (retitle lane), no blocking, emits 'transcript_updated' when the
+title is ready.
 
 Trigger: called after each transcription_complete in the recording pipeline.
 Guard rails:
     - Only fires if an SLM runtime exists.
     - Only fires if text length is within bounds (100–30,000 chars).
-    - One generation at a time per transcript (simple set-based dedup).
+    - Scheduling a transcript whose title job has not started yet replaces
+      that job (scheduler coalescing), so the latest text is titled once.
+    - A title job that cannot start promptly is deferred to the scheduler's
+      idle-time backfill lane rather than dropped.
 """
 
 from __future__ import annotations
 
 import logging
-import threading
 from typing import TYPE_CHECKING, Callable
 
 from src.core.constants import TitleGeneration
 from src.refinement.providers import GenerationTaskKind, ReasoningPolicy
+from src.services.slm_scheduler import SLMJobPreempted, SLMJobPriority
 
 if TYPE_CHECKING:
     from src.database.db import TranscriptDB
@@ -60,7 +64,7 @@ Rules:
 
 class TitleGenerator:
     """
-    Generates short SLM-based titles for transcripts in a background thread.
+    Generates short SLM-based titles for transcripts as scheduler jobs.
 
     Usage:
         generator.schedule(transcript_id, text)
@@ -80,9 +84,6 @@ class TitleGenerator:
         self._db_provider = db_provider
         self._emit = event_emitter
 
-        self._lock = threading.Lock()
-        self._pending: set[int] = set()  # transcript IDs currently being titled
-
     def schedule(self, transcript_id: int, text: str) -> None:
         """
         Schedule title generation for a transcript if conditions are met.
@@ -90,7 +91,8 @@ class TitleGenerator:
         Conditions:
         1. Text length is within bounds.
         2. SLM runtime exists.
-        3. No title generation is already in flight for this transcript.
+
+        A job already queued for the transcript is superseded by this one.
         """
         text_len = len(text)
         if text_len < TitleGeneration.MIN_TEXT_CHARS:
@@ -102,29 +104,24 @@ class TitleGenerator:
             )
             return
 
-        with self._lock:
-            if transcript_id in self._pending:
-                logger.debug("Title gen: already in flight for transcript %d", transcript_id)
-                return
-
-            slm = self._slm_provider()
-            if slm is None:
-                logger.debug("Title gen: SLM unavailable, skipping transcript %d", transcript_id)
-                return
-
-            self._pending.add(transcript_id)
+        slm = self._slm_provider()
+        if slm is None:
+            logger.debug("Title gen: SLM unavailable, skipping transcript %d", transcript_id)
+            return
 
         logger.info("Title gen: scheduling for transcript %d (%d chars)", transcript_id, text_len)
-        thread = threading.Thread(
-            target=self._generate_task,
-            args=(transcript_id, text),
-            daemon=True,
-            name=f"title-gen-{transcript_id}",
+        slm.submit_job(
+            lambda: self._generate_task(transcript_id, text),
+            priority=SLMJobPriority.RETITLE,
+            label=f"title-gen-{transcript_id}",
+            coalesce_key=f"title:{transcript_id}",
+            deadline_s=TitleGeneration.QUEUE_DEADLINE_S,
+            on_expire="defer",
+            preemptible=True,
         )
-        thread.start()
 
     def _generate_task(self, transcript_id: int, text: str) -> None:
-        """Background thread: generate title via SLM, write to DB, emit event."""
+        """Scheduler job: generate title via SLM, write to DB, emit event."""
         try:
             slm = self._slm_provider()
             if slm is None:
@@ -166,8 +163,9 @@ class TitleGenerator:
             self._emit("transcript_updated", {"id": transcript_id})
             logger.info("Title gen: transcript %d titled '%s'", transcript_id, title)
 
+        except SLMJobPreempted:
+            # The scheduler re-runs this job once the interactive work is done.
+            logger.info("Title gen: preempted by interactive work for transcript %d", transcript_id)
+            raise
         except Exception:
             logger.exception("Title gen: failed for transcript %d", transcript_id)
-        finally:
-            with self._lock:
-                self._pending.discard(transcript_id)
@@ -14,15 +14,26 @@ import sqlite3
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 from src.core.resource_manager import ResourceManager
-from src.database.models import AudioAsset, RecordingSessionRecord, Tag, Transcript, utc_now
+from src.database.models import (
+    AudioAsset,
+    ImportJobFile,
+    ImportJobRecord,
+    RecordingSessionRecord,
+    Tag,
+    Transcript,
+    utc_now,
+)
 
 logger = logging.getLogger(__name__)
 
 # Re-exported for backwards compatibility — these now live in src.database.models.
 __all__ = [
     "AudioAsset",
+    "ImportJobFile",
+    "ImportJobRecord",
     "RecordingSessionRecord",
     "Tag",
     "Transcript",
@@ -77,6 +88,9 @@ CREATE TABLE IF NOT EXISTS transcripts (
     transcription_prompt_text TEXT NOT NULL DEFAULT '',
     transcription_prompt_chars INTEGER NOT NULL DEFAULT 0,
     transcription_prompt_words INTEGER NOT NULL DEFAULT 0,
+    transcription_cached INTEGER NOT NULL DEFAULT 0,
+    transcription_routed_from TEXT NOT NULL DEFAULT '',
+    transcription_route_reason TEXT NOT NULL DEFAULT '',
     retranscription_count INTEGER NOT NULL DEFAULT 0,
     last_retranscription_at TEXT NOT NULL DEFAULT '',
     last_retranscription_time_ms INTEGER NOT NULL DEFAULT 0,
@@ -88,6 +102,7 @@ CREATE TABLE IF NOT EXISTS transcripts (
     last_retranscription_prompt_text TEXT NOT NULL DEFAULT '',
     last_retranscription_prompt_chars INTEGER NOT NULL DEFAULT 0,
     last_retranscription_prompt_words INTEGER NOT NULL DEFAULT 0,
+    last_retranscription_cached INTEGER NOT NULL DEFAULT 0,
     refinement_provider TEXT NOT NULL DEFAULT '',
     refinement_model_id TEXT NOT NULL DEFAULT '',
     refinement_resolved_device TEXT NOT NULL DEFAULT '',
@@ -101,6 +116,7 @@ CREATE TABLE IF NOT EXISTS transcripts (
     refinement_prompt_tokens INTEGER NOT NULL DEFAULT 0,
     refinement_completion_tokens INTEGER NOT NULL DEFAULT 0,
     refinement_total_tokens INTEGER NOT NULL DEFAULT 0,
+    refinement_cached INTEGER NOT NULL DEFAULT 0,
     created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now')),
     include_in_analytics INTEGER NOT NULL DEFAULT 1,
     has_audio_cached INTEGER NOT NULL DEFAULT 0,
@@ -185,6 +201,29 @@ CREATE TABLE IF NOT EXISTS audio_assets (
 CREATE INDEX IF NOT EXISTS idx_audio_assets_recording ON audio_assets(recording_id);
 CREATE INDEX IF NOT EXISTS idx_audio_assets_transcript ON audio_assets(transcript_id);
 CREATE INDEX IF NOT EXISTS idx_audio_assets_role ON audio_assets(role);
+
+CREATE TABLE IF NOT EXISTS import_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    finished_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_import_jobs_status ON import_jobs(status);
+
+CREATE TABLE IF NOT EXISTS import_job_files (
+    job_id TEXT NOT NULL REFERENCES import_jobs(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    cleanup_source INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    transcript_id INTEGER REFERENCES transcripts(id) ON DELETE SET NULL,
+    failure_reason TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (job_id, position)
+);
 """
 
 
@@ -235,54 +274,106 @@ class TranscriptDB:
         transcription_prompt_text: str = "",
         transcription_prompt_chars: int = 0,
         transcription_prompt_words: int = 0,
+        transcription_cached: bool = False,
+        transcription_routed_from: str = "",
+        transcription_route_reason: str = "",
         display_name: str | None = None,
         tag_ids: list[int] | None = None,
     ) -> Transcript:
         """Insert a new transcript. Returns the created transcript."""
-        norm = normalized_text if normalized_text is not None else raw_text
         with self._write_lock, self._conn:
-            ts = self._next_timestamp_locked()
-            cur = self._conn.execute(
-                """INSERT INTO transcripts
-                   (timestamp, raw_text, normalized_text, display_name,
-                    duration_ms, speech_duration_ms, transcription_time_ms,
-                    transcription_provider, transcription_model_id,
-                    transcription_resolved_device, transcription_compute_type,
-                    transcription_cpu_threads,
-                    transcription_prompt_text, transcription_prompt_chars,
-                    transcription_prompt_words, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    ts,
-                    raw_text,
-                    norm,
-                    display_name,
-                    duration_ms,
-                    speech_duration_ms,
-                    transcription_time_ms,
-                    transcription_provider,
-                    transcription_model_id,
-                    transcription_resolved_device,
-                    transcription_compute_type,
-                    transcription_cpu_threads,
-                    transcription_prompt_text,
-                    transcription_prompt_chars,
-                    transcription_prompt_words,
-                    ts,
-                ),
+            transcript = self._insert_transcript_locked(
+                raw_text,
+                normalized_text=normalized_text,
+                duration_ms=duration_ms,
+                speech_duration_ms=speech_duration_ms,
+                transcription_time_ms=transcription_time_ms,
+                transcription_provider=transcription_provider,
+                transcription_model_id=transcription_model_id,
+                transcription_resolved_device=transcription_resolved_device,
+                transcription_compute_type=transcription_compute_type,
+                transcription_cpu_threads=transcription_cpu_threads,
+                transcription_prompt_text=transcription_prompt_text,
+                transcription_prompt_chars=transcription_prompt_chars,
+                transcription_prompt_words=transcription_prompt_words,
+                transcription_cached=transcription_cached,
+                transcription_routed_from=transcription_routed_from,
+                transcription_route_reason=transcription_route_reason,
+                display_name=display_name,
             )
-            tid = cur.lastrowid
+            tid = transcript.id
             assert tid is not None
 
             # Assign tags if provided
-            tags: list[Tag] = []
             if tag_ids:
                 for tag_id in tag_ids:
                     self._conn.execute(
                         "INSERT OR IGNORE INTO transcript_tags (transcript_id, tag_id) VALUES (?, ?)",
                         (tid, tag_id),
                     )
-                tags = self._get_tags_for_transcript(tid)
+                transcript.tags = self._get_tags_for_transcript(tid)
+
+        return transcript
+
+    def _insert_transcript_locked(
+        self,
+        raw_text: str,
+        *,
+        normalized_text: str | None = None,
+        duration_ms: int = 0,
+        speech_duration_ms: int = 0,
+        transcription_time_ms: int = 0,
+        transcription_provider: str = "",
+        transcription_model_id: str = "",
+        transcription_resolved_device: str = "",
+        transcription_compute_type: str = "",
+        transcription_cpu_threads: int = 0,
+        transcription_prompt_text: str = "",
+        transcription_prompt_chars: int = 0,
+        transcription_prompt_words: int = 0,
+        transcription_cached: bool = False,
+        transcription_routed_from: str = "",
+        transcription_route_reason: str = "",
+        display_name: str | None = None,
+    ) -> Transcript:
+        """INSERT the transcript row. Caller must hold _write_lock and commit."""
+        norm = normalized_text if normalized_text is not None else raw_text
+        ts = self._next_timestamp_locked()
+        cur = self._conn.execute(
+            """INSERT INTO transcripts
+               (timestamp, raw_text, normalized_text, display_name,
+                duration_ms, speech_duration_ms, transcription_time_ms,
+                transcription_provider, transcription_model_id,
+                transcription_resolved_device, transcription_compute_type,
+                transcription_cpu_threads,
+                transcription_prompt_text, transcription_prompt_chars,
+                transcription_prompt_words, transcription_cached,
+                transcription_routed_from, transcription_route_reason, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                ts,
+                raw_text,
+                norm,
+                display_name,
+                duration_ms,
+                speech_duration_ms,
+                transcription_time_ms,
+                transcription_provider,
+                transcription_model_id,
+                transcription_resolved_device,
+                transcription_compute_type,
+                transcription_cpu_threads,
+                transcription_prompt_text,
+                transcription_prompt_chars,
+                transcription_prompt_words,
+                int(transcription_cached),
+                transcription_routed_from,
+                transcription_route_reason,
+                ts,
+            ),
+        )
+        tid = cur.lastrowid
+        assert tid is not None
 
         return Transcript(
             id=tid,
@@ -301,8 +392,11 @@ class TranscriptDB:
             transcription_prompt_text=transcription_prompt_text,
             transcription_prompt_chars=transcription_prompt_chars,
             transcription_prompt_words=transcription_prompt_words,
+            transcription_cached=transcription_cached,
+            transcription_routed_from=transcription_routed_from,
+            transcription_route_reason=transcription_route_reason,
             created_at=ts,
-            tags=tags,
+            tags=[],
         )
 
     def _next_timestamp_locked(self) -> str:
@@ -479,6 +573,30 @@ class TranscriptDB:
             ).fetchall()
             return [self._row_to_transcript(row) for row in rows]
 
+    def recent_transcription_timings(self, limit: int = 200) -> list[tuple[str, str, str, int, int]]:
+        """Decode timings of the latest local transcriptions, oldest first.
+
+        Rows are ``(model_id, resolved_device, compute_type, duration_ms,
+        transcription_time_ms)``; cached results and rows without timing are
+        left out. Seeds the ASR router's real-time-factor estimates.
+        """
+        with self._write_lock:
+            rows = self._conn.execute(
+                """
+                SELECT transcription_model_id, transcription_resolved_device, transcription_compute_type,
+                       duration_ms, transcription_time_ms
+                FROM transcripts
+                WHERE transcription_provider = 'local_faster_whisper'
+                  AND transcription_cached = 0
+                  AND duration_ms > 0
+                  AND transcription_time_ms > 0
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+        return [(row[0], row[1], row[2], int(row[3]), int(row[4])) for row in reversed(rows)]
+
     def search(
         self,
         query: str,
@@ -642,6 +760,7 @@ class TranscriptDB:
         refinement_prompt_tokens: int,
         refinement_completion_tokens: int,
         refinement_total_tokens: int,
+        refinement_cached: bool = False,
     ) -> None:
         """Persist refinement timing plus provider/model/prompt provenance."""
         with self._write_lock:
@@ -660,7 +779,8 @@ class TranscriptDB:
                        refinement_prompt_words = ?,
                        refinement_prompt_tokens = ?,
                        refinement_completion_tokens = ?,
-                       refinement_total_tokens = ?
+                       refinement_total_tokens = ?,
+                       refinement_cached = ?
                    WHERE id = ?""",
                 (
                     refinement_time_ms,
@@ -677,6 +797,7 @@ class TranscriptDB:
                     refinement_prompt_tokens,
                     refinement_completion_tokens,
                     refinement_total_tokens,
+                    int(refinement_cached),
                     transcript_id,
                 ),
             )
@@ -696,6 +817,7 @@ class TranscriptDB:
         retranscription_prompt_text: str,
         retranscription_prompt_chars: int,
         retranscription_prompt_words: int,
+        retranscription_cached: bool = False,
     ) -> None:
         """Persist the latest re-transcription result without overwriting original transcription provenance."""
         retr_timestamp = utc_now()
@@ -713,7 +835,8 @@ class TranscriptDB:
                        last_retranscription_cpu_threads = ?,
                        last_retranscription_prompt_text = ?,
                        last_retranscription_prompt_chars = ?,
-                       last_retranscription_prompt_words = ?
+                       last_retranscription_prompt_words = ?,
+                       last_retranscription_cached = ?
                    WHERE id = ?""",
                 (
                     normalized_text,
@@ -727,6 +850,7 @@ class TranscriptDB:
                     retranscription_prompt_text,
                     retranscription_prompt_chars,
                     retranscription_prompt_words,
+                    int(retranscription_cached),
                     transcript_id,
                 ),
             )
@@ -1001,6 +1125,9 @@ class TranscriptDB:
             transcription_prompt_text=row["transcription_prompt_text"],
             transcription_prompt_chars=row["transcription_prompt_chars"],
             transcription_prompt_words=row["transcription_prompt_words"],
+            transcription_cached=bool(row["transcription_cached"]),
+            transcription_routed_from=row["transcription_routed_from"],
+            transcription_route_reason=row["transcription_route_reason"],
             retranscription_count=row["retranscription_count"],
             last_retranscription_at=row["last_retranscription_at"],
             last_retranscription_time_ms=row["last_retranscription_time_ms"],
@@ -1012,6 +1139,7 @@ class TranscriptDB:
             last_retranscription_prompt_text=row["last_retranscription_prompt_text"],
             last_retranscription_prompt_chars=row["last_retranscription_prompt_chars"],
             last_retranscription_prompt_words=row["last_retranscription_prompt_words"],
+            last_retranscription_cached=bool(row["last_retranscription_cached"]),
             refinement_provider=row["refinement_provider"],
             refinement_model_id=row["refinement_model_id"],
             refinement_resolved_device=row["refinement_resolved_device"],
@@ -1025,6 +1153,7 @@ class TranscriptDB:
             refinement_prompt_tokens=row["refinement_prompt_tokens"],
             refinement_completion_tokens=row["refinement_completion_tokens"],
             refinement_total_tokens=row["refinement_total_tokens"],
+            refinement_cached=bool(row["refinement_cached"]),
             created_at=row["created_at"],
             include_in_analytics=bool(row["include_in_analytics"]),
             has_audio_cached=bool(row["has_audio_cached"]),
@@ -1358,6 +1487,145 @@ class TranscriptDB:
             ).fetchall()
         return [self._row_to_audio_asset(row) for row in rows]
 
+    # --- Batch audio import jobs ---
+
+    def create_import_job(self, job_id: str, files: list[tuple[str, str, bool]]) -> ImportJobRecord:
+        """Create a queued import job; ``files`` are ``(path, file_name, cleanup_source)`` in order."""
+        now = utc_now()
+        with self._write_lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO import_jobs (id, status, created_at, updated_at) VALUES (?, 'queued', ?, ?)",
+                (job_id, now, now),
+            )
+            self._conn.executemany(
+                """INSERT INTO import_job_files
+                   (job_id, position, path, file_name, cleanup_source, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                [
+                    (job_id, position, str(path), file_name, 1 if cleanup else 0, now)
+                    for position, (path, file_name, cleanup) in enumerate(files)
+                ],
+            )
+        job = self.get_import_job(job_id)
+        assert job is not None
+        return job
+
+    def get_import_job(self, job_id: str) -> ImportJobRecord | None:
+        with self._write_lock:
+            row = self._conn.execute("SELECT * FROM import_jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            file_rows = self._conn.execute(
+                "SELECT * FROM import_job_files WHERE job_id = ? ORDER BY position",
+                (job_id,),
+            ).fetchall()
+        return self._row_to_import_job(row, file_rows)
+
+    def list_import_jobs(self, statuses: tuple[str, ...] | None = None) -> list[ImportJobRecord]:
+        """Import jobs oldest first, optionally filtered by status."""
+        with self._write_lock:
+            if statuses:
+                placeholders = ",".join("?" * len(statuses))
+                rows = self._conn.execute(
+                    f"SELECT id FROM import_jobs WHERE status IN ({placeholders}) ORDER BY created_at, rowid",
+                    statuses,
+                ).fetchall()
+            else:
+                rows = self._conn.execute("SELECT id FROM import_jobs ORDER BY created_at, rowid").fetchall()
+        jobs = [self.get_import_job(row["id"]) for row in rows]
+        return [job for job in jobs if job is not None]
+
+    def mark_import_job_status(self, job_id: str, status: str, *, finished: bool = False) -> None:
+        now = utc_now()
+        with self._write_lock, self._conn:
+            self._conn.execute(
+                "UPDATE import_jobs SET status = ?, updated_at = ?, finished_at = ? WHERE id = ?",
+                (status, now, now if finished else None, job_id),
+            )
+
+    def mark_import_file_status(
+        self,
+        job_id: str,
+        position: int,
+        status: str,
+        *,
+        failure_reason: str | None = None,
+    ) -> None:
+        with self._write_lock, self._conn:
+            self._conn.execute(
+                """UPDATE import_job_files SET status = ?, failure_reason = ?, updated_at = ?
+                   WHERE job_id = ? AND position = ?""",
+                (status, failure_reason, utc_now(), job_id, position),
+            )
+
+    def complete_import_file(
+        self,
+        job_id: str,
+        position: int,
+        raw_text: str,
+        *,
+        system_tag: str | None = None,
+        include_in_analytics: bool = True,
+        **transcript_fields: Any,
+    ) -> Transcript:
+        """Insert an imported file's transcript and mark the file completed, atomically.
+
+        A crash leaves the file either pending (re-imported on resume) or
+        completed with its transcript — never a transcript without the
+        job knowing about it.
+        """
+        with self._write_lock, self._conn:
+            transcript = self._insert_transcript_locked(raw_text, **transcript_fields)
+            tag_id = self._get_system_tag_id(system_tag) if system_tag else None
+            if tag_id is not None:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO transcript_tags (transcript_id, tag_id) VALUES (?, ?)",
+                    (transcript.id, tag_id),
+                )
+                transcript.tags = self._get_tags_for_transcript(transcript.id)
+            if not include_in_analytics:
+                self._conn.execute("UPDATE transcripts SET include_in_analytics = 0 WHERE id = ?", (transcript.id,))
+                transcript.include_in_analytics = False
+            self._conn.execute(
+                """UPDATE import_job_files
+                   SET status = 'completed', transcript_id = ?, failure_reason = NULL, updated_at = ?
+                   WHERE job_id = ? AND position = ?""",
+                (transcript.id, utc_now(), job_id, position),
+            )
+        return transcript
+
+    def interrupt_import_jobs(self) -> list[ImportJobRecord]:
+        """Mark jobs left queued or running by a previous process as interrupted."""
+        interrupted = self.list_import_jobs(("queued", "running"))
+        for job in interrupted:
+            self.mark_import_job_status(job.id, "interrupted")
+            job.status = "interrupted"
+        return interrupted
+
+    @staticmethod
+    def _row_to_import_job(row: sqlite3.Row, file_rows: list[sqlite3.Row]) -> ImportJobRecord:
+        return ImportJobRecord(
+            id=row["id"],
+            status=row["status"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            finished_at=row["finished_at"],
+            files=[
+                ImportJobFile(
+                    job_id=f["job_id"],
+                    position=f["position"],
+                    path=f["path"],
+                    file_name=f["file_name"],
+                    cleanup_source=bool(f["cleanup_source"]),
+                    status=f["status"],
+                    transcript_id=f["transcript_id"],
+                    failure_reason=f["failure_reason"],
+                    updated_at=f["updated_at"],
+                )
+                for f in file_rows
+            ],
+        )
+
     def export_backup(self, dest: Path) -> None:
         """Export a full database backup to dest path."""
         import shutil
@@ -851,6 +851,65 @@ def _v18_prompt_grid(conn: sqlite3.Connection) -> None:
     logger.info("v18 migration: legacy prompts wiped, new prompt grid seeded")
 
 
+def _v19_refinement_cache_provenance(conn: sqlite3.Connection) -> None:
+    """v19 — Flag refinements that were served from the refinement result cache."""
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(transcripts)")}
+    if "refinement_cached" not in cols:
+        conn.execute("ALTER TABLE transcripts ADD COLUMN refinement_cached INTEGER NOT NULL DEFAULT 0")
+    logger.info("v19 migration: refinement_cached column added")
+
+
+def _v20_import_jobs(conn: sqlite3.Connection) -> None:
+    """v20 — Add batch audio import jobs so an interrupted import can resume."""
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS import_jobs (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            finished_at TEXT
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_import_jobs_status ON import_jobs(status);
+
+        CREATE TABLE IF NOT EXISTS import_job_files (
+            job_id TEXT NOT NULL REFERENCES import_jobs(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            path TEXT NOT NULL,
+            file_name TEXT NOT NULL,
+            cleanup_source INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'pending',
+            transcript_id INTEGER REFERENCES transcripts(id) ON DELETE SET NULL,
+            failure_reason TEXT,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (job_id, position)
+        );
+        """
+    )
+    logger.info("v20 migration: import job tables ensured")
+
+
+def _v21_transcription_cache_provenance(conn: sqlite3.Connection) -> None:
+    """v21 — Flag transcriptions and re-transcriptions served from the transcription result cache."""
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(transcripts)")}
+    if "transcription_cached" not in cols:
+        conn.execute("ALTER TABLE transcripts ADD COLUMN transcription_cached INTEGER NOT NULL DEFAULT 0")
+    if "last_retranscription_cached" not in cols:
+        conn.execute("ALTER TABLE transcripts ADD COLUMN last_retranscription_cached INTEGER NOT NULL DEFAULT 0")
+    logger.info("v21 migration: transcription_cached / last_retranscription_cached columns added")
+
+
+def _v22_transcription_routing_provenance(conn: sqlite3.Connection) -> None:
+    """v22 — Record when adaptive ASR routing picked a faster model than the configured one."""
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(transcripts)")}
+    if "transcription_routed_from" not in cols:
+        conn.execute("ALTER TABLE transcripts ADD COLUMN transcription_routed_from TEXT NOT NULL DEFAULT ''")
+    if "transcription_route_reason" not in cols:
+        conn.execute("ALTER TABLE transcripts ADD COLUMN transcription_route_reason TEXT NOT NULL DEFAULT ''")
+    logger.info("v22 migration: transcription_routed_from / transcription_route_reason columns added")
+
+
 #: Ordered list of (human-readable description, migration function) pairs.
 #: Append here to add future migrations; do not edit existing entries.
 MIGRATIONS: list[tuple[str, object]] = [
@@ -878,6 +937,16 @@ MIGRATIONS: list[tuple[str, object]] = [
         _v17_processing_runtime_context,
     ),
     ("v18 prompt grid — clean verbatim vs markdown rewrites", _v18_prompt_grid),
+    ("v19 refinement cache provenance — refinement_cached column on transcripts", _v19_refinement_cache_provenance),
+    ("v20 import jobs — resumable batch audio import queue", _v20_import_jobs),
+    (
+        "v21 transcription cache provenance — transcription_cached / last_retranscription_cached columns",
+        _v21_transcription_cache_provenance,
+    ),
+    (
+        "v22 transcription routing provenance — transcription_routed_from / transcription_route_reason columns",
+        _v22_transcription_routing_provenance,
+    ),
 ]
 
 
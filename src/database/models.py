@@ -57,6 +57,11 @@ class Transcript:
     transcription_prompt_text: str = ""
     transcription_prompt_chars: int = 0
     transcription_prompt_words: int = 0
+    transcription_cached: bool = False
+    # Set when adaptive routing decoded this on a faster model than the
+    # configured one (``transcription_model_id`` is the model actually used).
+    transcription_routed_from: str = ""
+    transcription_route_reason: str = ""
     retranscription_count: int = 0
     last_retranscription_at: str = ""
     last_retranscription_time_ms: int = 0
@@ -68,6 +73,7 @@ class Transcript:
     last_retranscription_prompt_text: str = ""
     last_retranscription_prompt_chars: int = 0
     last_retranscription_prompt_words: int = 0
+    last_retranscription_cached: bool = False
     refinement_provider: str = ""
     refinement_model_id: str = ""
     refinement_resolved_device: str = ""
@@ -81,6 +87,7 @@ class Transcript:
     refinement_prompt_tokens: int = 0
     refinement_completion_tokens: int = 0
     refinement_total_tokens: int = 0
+    refinement_cached: bool = False
     created_at: str = ""
     include_in_analytics: bool = True
     has_audio_cached: bool = False
@@ -116,6 +123,9 @@ class Transcript:
             "transcription_prompt_text": self.transcription_prompt_text,
             "transcription_prompt_chars": self.transcription_prompt_chars,
             "transcription_prompt_words": self.transcription_prompt_words,
+            "transcription_cached": self.transcription_cached,
+            "transcription_routed_from": self.transcription_routed_from,
+            "transcription_route_reason": self.transcription_route_reason,
             "retranscription_count": self.retranscription_count,
             "last_retranscription_at": self.last_retranscription_at,
             "last_retranscription_time_ms": self.last_retranscription_time_ms,
@@ -127,6 +137,7 @@ class Transcript:
             "last_retranscription_prompt_text": self.last_retranscription_prompt_text,
             "last_retranscription_prompt_chars": self.last_retranscription_prompt_chars,
             "last_retranscription_prompt_words": self.last_retranscription_prompt_words,
+            "last_retranscription_cached": self.last_retranscription_cached,
             "refinement_provider": self.refinement_provider,
             "refinement_model_id": self.refinement_model_id,
             "refinement_resolved_device": self.refinement_resolved_device,
@@ -140,6 +151,7 @@ class Transcript:
             "refinement_prompt_tokens": self.refinement_prompt_tokens,
             "refinement_completion_tokens": self.refinement_completion_tokens,
             "refinement_total_tokens": self.refinement_total_tokens,
+            "refinement_cached": self.refinement_cached,
             "created_at": self.created_at,
             "include_in_analytics": self.include_in_analytics,
             "has_audio_cached": self.has_audio_cached,
@@ -220,4 +232,62 @@ class AudioAsset:
         }
 
 
-__all__ = ["AudioAsset", "RecordingSessionRecord", "Tag", "Transcript", "utc_now"]
+@dataclass(slots=True)
+class ImportJobFile:
+    job_id: str
+    position: int
+    path: str
+    file_name: str
+    cleanup_source: bool = False
+    status: str = "pending"
+    transcript_id: int | None = None
+    failure_reason: str | None = None
+    updated_at: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "position": self.position,
+            "file_name": self.file_name,
+            "status": self.status,
+            "transcript_id": self.transcript_id,
+            "failure_reason": self.failure_reason,
+            "updated_at": self.updated_at,
+        }
+
+
+@dataclass(slots=True)
+class ImportJobRecord:
+    id: str
+    status: str
+    created_at: str
+    updated_at: str
+    finished_at: str | None = None
+    files: list[ImportJobFile] = field(default_factory=list)
+
+    def count(self, status: str) -> int:
+        return sum(1 for f in self.files if f.status == status)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "finished_at": self.finished_at,
+            "total": len(self.files),
+            "completed": self.count("completed"),
+            "failed": self.count("failed"),
+            "pending": self.count("pending"),
+            "files": [f.to_dict() for f in self.files],
+        }
+
+
+__all__ = [
+    "AudioAsset",
+    "ImportJobFile",
+    "ImportJobRecord",
+    "RecordingSessionRecord",
+    "Tag",
+    "Transcript",
+    "utc_now",
+]
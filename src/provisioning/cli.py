@@ -145,5 +145,39 @@ def install(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def calibrate(
+    kind: str = typer.Option("all", "--kind", "-k", help="What to calibrate: asr, slm or all"),
+):
+    """Measure CPU thread counts and compute types for the configured models on this machine."""
+    from src.core.settings import init_settings
+    from src.services.calibration import KINDS, CalibrationStore, asr_measure, slm_measure, sweep
+
+    kinds = list(KINDS) if kind == "all" else [kind]
+    if any(k not in KINDS for k in kinds):
+        logger.error("Unknown kind: %s (expected asr, slm or all)", kind)
+        raise typer.Exit(code=1)
+
+    settings = init_settings()
+    store = CalibrationStore.open_default()
+    failed = False
+    for k in kinds:
+        model_id = settings.model.model if k == "asr" else settings.refinement.model_id
+        print(f"-> Calibrating {k} model {model_id} (this loads the model several times)...")
+        try:
+            measure = asr_measure(settings) if k == "asr" else slm_measure(settings)
+            profile = sweep(k, model_id, measure)
+        except Exception as e:
+            logger.error("Calibration of %s failed: %s", k, e)
+            failed = True
+            continue
+        store.put(profile)
+        print(f"   threads={profile.threads} compute_type={profile.compute_type} {profile.metric}={profile.value}")
+
+    print(f'\nProfiles saved to {store.path}. Set n_threads to 0 and/or compute_type to "auto" to use them.')
+    if failed:
+        raise typer.Exit(code=1)
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,191 @@
+"""
+Chunked refinement — split very long transcripts into bounded windows.
+
+A long transcript is cut at paragraph and sentence boundaries into chunks of
+at most ``max_tokens`` (estimated) tokens. Each chunk after the first repeats
+the tail of the previous one (``overlap_tokens``) so the SLM sees the
+sentence it is continuing from. ``ChunkPlan.stitch`` drops the refined copy
+of that overlap again, by aligning the refined chunk's head against the
+overlap words, and joins the chunks with the original separators.
+
+Token counts are estimated from characters; no tokenizer is needed, so the
+same plan serves local and remote providers.
+
+Pure string work — no model, no I/O.
+"""
+
+from __future__ import annotations
+
+import difflib
+import math
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from src.refinement.selective import split_sentences
+
+# Rough chars-per-token for English BPE vocabularies (Qwen, Llama).
+CHARS_PER_TOKEN = 4.0
+
+_WORD = re.compile(r"\S+")
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+_NORMALIZE = re.compile(r"[^\w']+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for budgeting chunk sizes."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+@dataclass(frozen=True, slots=True)
+class TextChunk:
+    """One window of a long transcript."""
+
+    body: str
+    # Tail of the previous chunk repeated as leading context ("" for the first).
+    overlap: str
+    # Whitespace that followed ``body`` in the original text.
+    separator: str
+
+    @property
+    def text(self) -> str:
+        """What is sent to the SLM: the overlap context, then the body."""
+        return f"{self.overlap} {self.body}" if self.overlap else self.body
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkPlan:
+    """A long transcript split into overlapping, bounded windows."""
+
+    leading: str
+    chunks: tuple[TextChunk, ...]
+    trailing: str
+
+    @property
+    def regions(self) -> list[str]:
+        """Texts to send to the SLM, one per chunk, in order."""
+        return [chunk.text for chunk in self.chunks]
+
+    def stitch(self, refined: Sequence[str | None]) -> str:
+        """Join refined chunks, dropping each chunk's refined overlap.
+
+        A ``None`` or blank entry keeps that chunk's original body.
+        """
+        if len(refined) != len(self.chunks):
+            raise ValueError(f"Expected {len(self.chunks)} refined chunk(s), got {len(refined)}")
+        parts = [self.leading]
+        for chunk, candidate in zip(self.chunks, refined):
+            if candidate is None or not candidate.strip():
+                body = chunk.body
+            else:
+                body = drop_overlap(candidate.strip(), chunk.overlap)
+            parts.append(body)
+            parts.append(chunk.separator)
+        parts.append(self.trailing)
+        return "".join(parts)
+
+
+def _normalize(word: str) -> str:
+    return _NORMALIZE.sub("", word.lower())
+
+
+def drop_overlap(refined: str, overlap: str) -> str:
+    """Remove the refined rendering of ``overlap`` from the head of ``refined``.
+
+    The SLM may fix punctuation, casing or fillers inside the overlap, so the
+    cut point is found by aligning normalised words rather than by string
+    prefix. When fewer than half of the overlap words can be aligned, the
+    chunk is kept whole: duplicating a few words is better than losing them.
+    """
+    overlap_words = [_normalize(word) for word in overlap.split()]
+    overlap_words = [word for word in overlap_words if word]
+    if not overlap_words:
+        return refined
+    matches = list(_WORD.finditer(refined))
+    head = [_normalize(match.group()) for match in matches[: len(overlap_words) * 2 + 8]]
+    matcher = difflib.SequenceMatcher(a=overlap_words, b=head, autojunk=False)
+    blocks = [block for block in matcher.get_matching_blocks() if block.size]
+    if sum(block.size for block in blocks) * 2 < len(overlap_words):
+        return refined
+    cut = blocks[-1].b + blocks[-1].size
+    if cut >= len(matches):
+        return ""
+    return refined[matches[cut].start() :]
+
+
+def _split_oversized(sentence: str, max_tokens: int) -> list[tuple[str, str]]:
+    """Cut a sentence longer than ``max_tokens`` at word boundaries."""
+    pieces: list[tuple[str, str]] = []
+    start = 0
+    last_end = 0
+    for match in _WORD.finditer(sentence):
+        if match.end() - start > max_tokens * CHARS_PER_TOKEN and last_end > start:
+            pieces.append((sentence[start:last_end], sentence[last_end : match.start()]))
+            start = match.start()
+        last_end = match.end()
+    pieces.append((sentence[start:], ""))
+    return pieces
+
+
+def _tail(text: str, overlap_tokens: int) -> str:
+    """The last whole words of ``text`` fitting in ``overlap_tokens``."""
+    if overlap_tokens <= 0:
+        return ""
+    words = text.split()
+    kept: list[str] = []
+    size = 0
+    for word in reversed(words):
+        size += len(word) + 1
+        if size > overlap_tokens * CHARS_PER_TOKEN:
+            break
+        kept.append(word)
+    return " ".join(reversed(kept))
+
+
+def plan_chunks(text: str, *, max_tokens: int, overlap_tokens: int = 0) -> ChunkPlan:
+    """Split ``text`` into chunks of at most ``max_tokens`` estimated tokens.
+
+    Chunks are filled greedily with whole sentences and closed early at a
+    paragraph break once at least half full, so paragraphs stay intact where
+    possible. A single sentence above the budget (unpunctuated dictation) is
+    cut at word boundaries.
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+    stripped = text.strip()
+    leading = text[: len(text) - len(text.lstrip())]
+    trailing = text[len(text.rstrip()) :] if stripped else ""
+
+    units: list[tuple[str, str]] = []
+    for sentence, separator in split_sentences(text):
+        if estimate_tokens(sentence) > max_tokens:
+            pieces = _split_oversized(sentence, max_tokens)
+            pieces[-1] = (pieces[-1][0], separator)
+            units.extend(pieces)
+        else:
+            units.append((sentence, separator))
+
+    bodies: list[tuple[str, str]] = []
+    current = ""
+    current_separator = ""
+    for sentence, separator in units:
+        candidate = current + current_separator + sentence if current else sentence
+        if current and estimate_tokens(candidate) > max_tokens:
+            bodies.append((current, current_separator))
+            current, current_separator = sentence, separator
+            continue
+        current, current_separator = candidate, separator
+        if _PARAGRAPH_BREAK.search(separator) and estimate_tokens(current) * 2 >= max_tokens:
+            bodies.append((current, current_separator))
+            current, current_separator = "", ""
+    if current:
+        bodies.append((current, current_separator))
+
+    chunks: list[TextChunk] = []
+    for index, (body, separator) in enumerate(bodies):
+        overlap = _tail(bodies[index - 1][0], overlap_tokens) if index else ""
+        chunks.append(TextChunk(body=body, overlap=overlap, separator=separator))
+    return ChunkPlan(leading=leading, chunks=tuple(chunks), trailing=trailing)
+
+
+__all__ = ["CHARS_PER_TOKEN", "ChunkPlan", "TextChunk", "drop_overlap", "estimate_tokens", "plan_chunks"]
@@ -8,6 +8,7 @@ enforcement. Tokenization is handled by the HuggingFace `tokenizers` library.
 
 import logging
 import time
+from collections.abc import Callable, Sequence
 from pathlib import Path
 
 from src.refinement.output_parser import GenerationResult, parse_generation_output
@@ -16,6 +17,29 @@ from src.refinement.prompt_builder import PromptBuilder
 logger = logging.getLogger(__name__)
 
 
+class GenerationCancelled(RuntimeError):
+    """Generation was stopped mid-decode because ``should_cancel`` returned True."""
+
+
+class _CancelCallback:
+    """CT2 per-token ``callback`` that stops decoding once ``should_cancel()`` is True.
+
+    CTranslate2 calls it for every generated token (greedy/sampling only,
+    ``beam_size=1``); returning True stops decoding for that batch index.
+    """
+
+    __slots__ = ("_should_cancel", "triggered")
+
+    def __init__(self, should_cancel: Callable[[], bool]) -> None:
+        self._should_cancel = should_cancel
+        self.triggered = False
+
+    def __call__(self, _step: object) -> bool:
+        if self.triggered or self._should_cancel():
+            self.triggered = True
+        return self.triggered
+
+
 class RefinementEngine:
     """
     Refinement Engine using CTranslate2 Generator.
@@ -31,6 +55,16 @@ class RefinementEngine:
     # Fixed thinking budget: reserved exclusively for <think> reasoning overhead.
     THINKING_BUDGET_TOKENS = 2048
 
+    # Batched (bulk) generation limits.
+    MAX_BATCH_SIZE = 16
+    # Pessimistic per-token working-set estimate (KV cache + activations) for a
+    # 4B-class model, used to bound CPU batch size by currently free RAM.
+    BATCH_BYTES_PER_TOKEN = 512 * 1024
+    BATCH_MEMORY_FRACTION = 0.5
+    # A bucket is closed once the next prompt is this much longer than its
+    # shortest member, so padding waste inside a batch stays bounded.
+    BUCKET_LENGTH_RATIO = 1.5
+
     def __init__(
         self,
         model_path: Path | str,
@@ -97,6 +131,7 @@ class RefinementEngine:
             inter_threads=1,
             intra_threads=n_threads if ct2_device == "cpu" else 0,
         )
+        self.device = ct2_device
 
         # Load tokenizer from the model directory
         tokenizer_path = model_path / "tokenizer.json"
@@ -158,6 +193,7 @@ class RefinementEngine:
         repetition_penalty: float = 1.0,
         use_thinking: bool = False,
         allow_skip: bool = True,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> GenerationResult:
         """
         Refine the input text using the loaded model.
@@ -169,6 +205,8 @@ class RefinementEngine:
             top_p: Nucleus sampling threshold (conservative to reduce drift).
             top_k: Top-k sampling (Qwen3 baseline: 20).
             use_thinking: Allow model to reason in <think> blocks before output.
+            should_cancel: Polled once per generated token; returning True
+                stops decoding and raises ``GenerationCancelled``.
 
         Returns:
             GenerationResult containing refined text and optional reasoning.
@@ -185,12 +223,7 @@ class RefinementEngine:
                 logger.debug("Skipping refinement (%s): %r", skip_reason, text[:80])
                 return GenerationResult(content=text)
 
-        messages = self._format_prompt(text, user_instructions, use_thinking=use_thinking)
-
-        # Tokenize the ChatML-formatted prompt
-        chatml_string = self._messages_to_chatml(messages)
-        encoded = self.tokenizer.encode(chatml_string)
-        prompt_tokens = encoded.tokens  # CT2 generate_batch() expects List[str], not int IDs
+        prompt_tokens = self._encode_refinement_prompt(text, user_instructions, use_thinking)
 
         # Calculate dynamic max tokens based on input size
         max_new_tokens = self._calculate_dynamic_max_tokens(len(prompt_tokens), use_thinking=use_thinking)
@@ -205,8 +238,9 @@ class RefinementEngine:
         # CT2 needs temperature > 0 for sampling
         effective_temp = max(temperature, 0.01)
 
-        results = self.generator.generate_batch(
+        results = self._generate(
             [prompt_tokens],
+            should_cancel,
             max_length=max_new_tokens,
             beam_size=1,
             sampling_temperature=effective_temp,
@@ -217,10 +251,36 @@ class RefinementEngine:
             include_prompt_in_result=False,
         )
 
-        output_ids = results[0].sequences_ids[0]
+        return self._refinement_result(text, len(prompt_tokens), results[0].sequences_ids[0])
+
+    def _generate(  # noqa: ANN202
+        self,
+        prompts: list[list[str]],
+        should_cancel: Callable[[], bool] | None,
+        **options: object,
+    ):
+        """Call ``generate_batch``, stopping token-by-token when ``should_cancel`` fires."""
+        if should_cancel is None:
+            return self.generator.generate_batch(prompts, **options)
+        if should_cancel():
+            raise GenerationCancelled("Generation cancelled before it started.")
+        callback = _CancelCallback(should_cancel)
+        results = self.generator.generate_batch(prompts, callback=callback, **options)
+        if callback.triggered:
+            raise GenerationCancelled("Generation cancelled mid-decode.")
+        return results
+
+    def _encode_refinement_prompt(self, text: str, user_instructions: str, use_thinking: bool) -> list[str]:
+        """Build and tokenize the ChatML refinement prompt for one transcript."""
+        messages = self._format_prompt(text, user_instructions, use_thinking=use_thinking)
+        chatml_string = self._messages_to_chatml(messages)
+        # CT2 generate_batch() expects List[str], not int IDs
+        return self.tokenizer.encode(chatml_string).tokens
+
+    def _refinement_result(self, text: str, prompt_token_count: int, output_ids: list[int]) -> GenerationResult:
+        """Decode generated ids into a GenerationResult with usage counts."""
         output_text = self.tokenizer.decode(output_ids)
         result = self._parse_output(output_text)
-        prompt_token_count = len(prompt_tokens)
         completion_token_count = len(output_ids)
         total_token_count = prompt_token_count + completion_token_count
 
@@ -247,6 +307,171 @@ class RefinementEngine:
             total_tokens=total_token_count,
         )
 
+    def _memory_bounded_batch_size(self, requested: int, tokens_per_item: int) -> int:
+        """Clamp a batch size so its estimated working set fits in free RAM.
+
+        Only applies on CPU; on CUDA the batch is split on out-of-memory
+        errors instead (see ``_generate_bucket``).
+        """
+        requested = max(1, min(requested, self.MAX_BATCH_SIZE))
+        if getattr(self, "device", "cpu") != "cpu":
+            return requested
+        try:
+            import psutil
+
+            available = psutil.virtual_memory().available
+        except Exception:
+            return requested
+        per_item = max(1, tokens_per_item) * self.BATCH_BYTES_PER_TOKEN
+        fits = int(available * self.BATCH_MEMORY_FRACTION // per_item)
+        return max(1, min(requested, fits))
+
+    def _bucket_by_length(
+        self,
+        prepared: list[tuple[int, list[str], int]],
+        max_batch_size: int,
+    ) -> list[list[tuple[int, list[str], int]]]:
+        """Group (index, prompt_tokens, max_new_tokens) items into length buckets.
+
+        Items are sorted by prompt length; a bucket closes when it reaches the
+        memory-bounded batch size or when the next prompt is much longer than
+        the bucket's shortest one.
+        """
+        buckets: list[list[tuple[int, list[str], int]]] = []
+        current: list[tuple[int, list[str], int]] = []
+        for item in sorted(prepared, key=lambda entry: len(entry[1])):
+            if current:
+                shortest = len(current[0][1])
+                footprint = len(item[1]) + max(entry[2] for entry in (*current, item))
+                limit = self._memory_bounded_batch_size(max_batch_size, footprint)
+                if len(current) >= limit or len(item[1]) > shortest * self.BUCKET_LENGTH_RATIO:
+                    buckets.append(current)
+                    current = []
+            current.append(item)
+        if current:
+            buckets.append(current)
+        return buckets
+
+    def _generate_bucket(
+        self,
+        bucket: list[tuple[int, list[str], int]],
+        should_cancel: Callable[[], bool] | None = None,
+        **sampling: object,
+    ) -> list[list[int]]:
+        """Run one batched generate call, halving the batch on out-of-memory errors."""
+        try:
+            results = self._generate(
+                [tokens for _, tokens, _ in bucket],
+                should_cancel,
+                max_length=max(budget for _, _, budget in bucket),
+                max_batch_size=len(bucket),
+                beam_size=1,
+                end_token=self._end_tokens,
+                include_prompt_in_result=False,
+                **sampling,
+            )
+        except RuntimeError as exc:
+            if len(bucket) == 1 or "out of memory" not in str(exc).lower():
+                raise
+            half = len(bucket) // 2
+            logger.warning("Batched refinement ran out of memory at batch size %d; splitting.", len(bucket))
+            return self._generate_bucket(bucket[:half], should_cancel, **sampling) + self._generate_bucket(
+                bucket[half:], should_cancel, **sampling
+            )
+        # CT2's max_length is per call; trim each item to its own budget so
+        # batched output matches what the sequential path would produce.
+        return [result.sequences_ids[0][:budget] for result, (_, _, budget) in zip(results, bucket)]
+
+    def refine_batch(
+        self,
+        texts: Sequence[str],
+        user_instructions: str = "",
+        temperature: float = 0.3,
+        top_p: float = 0.9,
+        top_k: int = 20,
+        repetition_penalty: float = 1.0,
+        use_thinking: bool = False,
+        allow_skip: bool = True,
+        max_batch_size: int = 8,
+        on_result: Callable[[int, GenerationResult, float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> list[GenerationResult | None]:
+        """
+        Refine many texts with length-bucketed batched generation.
+
+        Prompts are tokenized up front, sorted into buckets of similar length
+        and submitted as batched ``generate_batch`` calls. Results are
+        delivered per item through ``on_result(index, result, elapsed_s)`` as
+        soon as their bucket finishes, where ``elapsed_s`` is the bucket's
+        wall time amortized over its items.
+
+        Args:
+            texts: Raw input texts, in caller order.
+            max_batch_size: Upper bound on items per generate call; further
+                reduced to fit available memory.
+            on_result: Optional per-item completion callback.
+            should_cancel: Polled before each bucket and once per generated
+                token; once it returns True the in-flight bucket is abandoned
+                and the remaining items are left unprocessed.
+
+        Returns:
+            One entry per input text, in input order. ``None`` marks items that
+            were not processed because the batch was cancelled.
+        """
+        from src.refinement.skip_check import should_skip_refinement
+
+        results: list[GenerationResult | None] = [None] * len(texts)
+
+        def deliver(index: int, result: GenerationResult, elapsed: float) -> None:
+            results[index] = result
+            if on_result is not None:
+                on_result(index, result, elapsed)
+
+        prepared: list[tuple[int, list[str], int]] = []
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                deliver(index, GenerationResult(content=text), 0.0)
+                continue
+            if allow_skip:
+                skip_reason = should_skip_refinement(text)
+                if skip_reason:
+                    logger.debug("Skipping refinement (%s): %r", skip_reason, text[:80])
+                    deliver(index, GenerationResult(content=text), 0.0)
+                    continue
+            prompt_tokens = self._encode_refinement_prompt(text, user_instructions, use_thinking)
+            budget = self._calculate_dynamic_max_tokens(len(prompt_tokens), use_thinking=use_thinking)
+            prepared.append((index, prompt_tokens, budget))
+
+        sampling = {
+            "sampling_temperature": max(temperature, 0.01),
+            "sampling_topp": top_p,
+            "sampling_topk": top_k,
+            "repetition_penalty": repetition_penalty,
+        }
+        for bucket in self._bucket_by_length(prepared, max_batch_size):
+            if should_cancel is not None and should_cancel():
+                logger.info("Batched refinement cancelled with %d item(s) pending", sum(r is None for r in results))
+                break
+            logger.debug(
+                "Refining bucket of %d prompts (%d-%d tokens, limit %d new tokens).",
+                len(bucket),
+                len(bucket[0][1]),
+                len(bucket[-1][1]),
+                max(budget for _, _, budget in bucket),
+            )
+            start = time.perf_counter()
+            try:
+                outputs = self._generate_bucket(bucket, should_cancel, **sampling)
+            except GenerationCancelled:
+                pending = sum(r is None for r in results)
+                logger.info("Batched refinement cancelled mid-bucket with %d item(s) pending", pending)
+                break
+            per_item = (time.perf_counter() - start) / len(bucket)
+            for (index, prompt_tokens, _), output_ids in zip(bucket, outputs):
+                deliver(index, self._refinement_result(texts[index], len(prompt_tokens), output_ids), per_item)
+
+        return results
+
     def generate_custom(
         self,
         system_prompt: str,
@@ -254,6 +479,7 @@ class RefinementEngine:
         max_tokens: int = 150,
         temperature: float = 0.7,
         use_thinking: bool = False,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> GenerationResult:
         """
         Generate text using a custom system and user prompt.
@@ -264,6 +490,8 @@ class RefinementEngine:
             max_tokens: Maximum new tokens to generate.
             temperature: Sampling temperature.
             use_thinking: Allow model to reason in <think> blocks before output.
+            should_cancel: Polled once per generated token; returning True
+                stops decoding and raises ``GenerationCancelled``.
 
         Returns:
             GenerationResult with 'content' and 'reasoning'.
@@ -282,8 +510,9 @@ class RefinementEngine:
         if use_thinking:
             total_tokens += self.THINKING_BUDGET_TOKENS
 
-        results = self.generator.generate_batch(
+        results = self._generate(
             [prompt_tokens],
+            should_cancel,
             max_length=total_tokens,
             beam_size=1,
             sampling_temperature=effective_temp,
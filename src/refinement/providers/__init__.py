@@ -1,7 +1,9 @@
 """Refinement provider package.
 
 Public surface (kept import-compatible with the previous single-file module):
-  * ``RefinementProvider`` — Protocol consumed by ``SLMRuntime``.
+  * ``RefinementProvider`` — Protocol consumed by ``SLMRuntime``;
+    ``BatchRefinementProvider`` / ``supports_batching`` narrow it to
+    providers with batched generation.
   * ``ProviderRequestError`` — HTTP-aware error type.
   * ``make_refinement_provider`` — factory used by the composition root.
   * ``list_external_provider_models``, ``test_external_provider`` — used by
@@ -9,23 +11,29 @@ Public surface (kept import-compatible with the previous single-file module):
   * ``describe_refinement_runtime`` — runtime descriptor used by status/support.
   * ``LocalCT2RefinementProvider``, ``OpenAICompatibleRefinementProvider`` —
     concrete implementations.
+  * ``WorkerRefinementProvider`` — the local CT2 provider running in a
+    supervised worker process (``refinement.worker_process``).
 
 Internal modules (not re-exported, but stable for tests inside this package):
   * ``capabilities`` — per-model capability model centralizing reasoning
     suppression, ``reasoning_effort`` value selection, schema forcing, and
     MTP awareness for OpenAI-compatible providers.
   * ``runtime`` — runtime descriptor + API key helpers.
-  * ``factory``, ``contracts``, ``local_ct2``, ``openai_compatible`` —
-    implementation modules.
+  * ``remote_dispatch`` — header-fed rate limiter, AIMD concurrency and the
+    ordered concurrent dispatcher used for remote bulk refinement.
+  * ``factory``, ``contracts``, ``local_ct2``, ``openai_compatible``,
+    ``worker`` — implementation modules.
 """
 
 from src.refinement.providers.contracts import (
+    BatchRefinementProvider,
     GenerationRequest,
     GenerationTaskKind,
     ProviderRequestError,
     ReasoningPolicy,
     RefinementProvider,
     ResponseShape,
+    supports_batching,
 )
 from src.refinement.providers.factory import (
     list_external_provider_models,
@@ -35,8 +43,10 @@ from src.refinement.providers.factory import (
 from src.refinement.providers.local_ct2 import LocalCT2RefinementProvider
 from src.refinement.providers.openai_compatible import OpenAICompatibleRefinementProvider
 from src.refinement.providers.runtime import describe_refinement_runtime
+from src.refinement.providers.worker import WorkerRefinementProvider
 
 __all__ = [
+    "BatchRefinementProvider",
     "LocalCT2RefinementProvider",
     "OpenAICompatibleRefinementProvider",
     "GenerationRequest",
@@ -45,8 +55,10 @@ __all__ = [
     "ReasoningPolicy",
     "RefinementProvider",
     "ResponseShape",
+    "WorkerRefinementProvider",
     "describe_refinement_runtime",
     "list_external_provider_models",
     "make_refinement_provider",
+    "supports_batching",
     "test_external_provider",
 ]
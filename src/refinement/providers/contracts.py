@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Protocol
+from typing import Any, Protocol, TypeGuard
 
 from src.refinement.output_parser import GenerationResult
 
@@ -129,7 +130,13 @@ def _coerce_response_shape(value: ResponseShape | str) -> ResponseShape:
 
 
 class RefinementProvider(Protocol):
-    """Provider contract consumed by SLMRuntime."""
+    """Provider contract consumed by SLMRuntime.
+
+    ``should_cancel`` is polled during generation only by providers whose
+    ``supports_cancellation`` is True; the others finish the request.
+    """
+
+    supports_cancellation: bool
 
     @property
     def provider_id(self) -> str: ...
@@ -149,6 +156,7 @@ class RefinementProvider(Protocol):
         use_thinking: bool,
         allow_skip: bool = True,
         request: GenerationRequest | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> GenerationResult: ...
     def generate_custom(
         self,
@@ -159,4 +167,31 @@ class RefinementProvider(Protocol):
         temperature: float = 0.7,
         use_thinking: bool = False,
         request: GenerationRequest | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> GenerationResult: ...
+
+
+class BatchRefinementProvider(RefinementProvider, Protocol):
+    """A provider that refines many texts in one batched generation (local CT2)."""
+
+    def refine_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        instructions: str = "",
+        temperature: float,
+        top_p: float,
+        top_k: int,
+        repetition_penalty: float,
+        use_thinking: bool,
+        allow_skip: bool = True,
+        max_batch_size: int = 8,
+        on_result: Callable[[int, GenerationResult, float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+        request: GenerationRequest | None = None,
+    ) -> list[GenerationResult | None]: ...
+
+
+def supports_batching(provider: Any) -> TypeGuard[BatchRefinementProvider]:
+    """True when ``provider`` has a batched ``refine_batch``."""
+    return callable(getattr(provider, "refine_batch", None))
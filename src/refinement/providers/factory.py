@@ -6,12 +6,15 @@ from src.core.settings import VociferousSettings
 from src.refinement.providers.contracts import RefinementProvider
 from src.refinement.providers.local_ct2 import LocalCT2RefinementProvider
 from src.refinement.providers.openai_compatible import OpenAICompatibleRefinementProvider
+from src.refinement.providers.worker import WorkerRefinementProvider
 
 
 def make_refinement_provider(settings: VociferousSettings) -> RefinementProvider:
     """Create the configured refinement provider."""
     provider = settings.refinement.provider
     if provider == "local_ct2":
+        if settings.refinement.worker_process:
+            return WorkerRefinementProvider(settings)
         return LocalCT2RefinementProvider(settings)
     if provider in {"lm_studio", "groq"}:
         return OpenAICompatibleRefinementProvider(settings, provider)
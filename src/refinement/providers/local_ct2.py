@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Sequence
 from pathlib import Path
 
 from src.core.cuda_runtime import CudaRuntimeStatus, detect_cuda_runtime
@@ -13,6 +14,7 @@ from src.refinement.engine import RefinementEngine
 from src.refinement.output_parser import GenerationResult
 from src.refinement.providers.contracts import GenerationRequest
 from src.refinement.providers.runtime import describe_refinement_runtime
+from src.services.cpu_partition import SLM, pinned_load
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,9 @@ logger = logging.getLogger(__name__)
 class LocalCT2RefinementProvider:
     """Local CTranslate2 refinement provider."""
 
+    # refine()/generate_custom() accept ``should_cancel`` and stop mid-decode.
+    supports_cancellation = True
+
     def __init__(self, settings: VociferousSettings) -> None:
         self._settings = settings
         self._engine: RefinementEngine | None = None
@@ -81,14 +86,19 @@ class LocalCT2RefinementProvider:
             runtime_summary["compute_type"],
             runtime_summary["use_thinking"],
         )
-        self._engine = RefinementEngine(
-            model_path=model_dir,
-            system_prompt=settings.refinement.system_prompt,
-            invariants=settings.refinement.invariants,
-            n_gpu_layers=int(runtime_summary["gpu_layers"]),
-            n_threads=settings.refinement.n_threads,
-            compute_type=settings.model.compute_type,
-        )
+        gpu_layers = runtime_summary["gpu_layers"]
+        cpu_threads = runtime_summary["cpu_threads"]
+        if not isinstance(gpu_layers, int) or not isinstance(cpu_threads, int):
+            raise TypeError(f"Invalid SLM runtime summary: gpu_layers={gpu_layers!r}, cpu_threads={cpu_threads!r}")
+        with pinned_load(SLM):
+            self._engine = RefinementEngine(
+                model_path=model_dir,
+                system_prompt=settings.refinement.system_prompt,
+                invariants=settings.refinement.invariants,
+                n_gpu_layers=gpu_layers,
+                n_threads=cpu_threads,
+                compute_type=str(runtime_summary["compute_type"]),
+            )
         self._runtime_summary = runtime_summary
 
     def unload(self) -> None:
@@ -123,6 +133,7 @@ class LocalCT2RefinementProvider:
         use_thinking: bool,
         allow_skip: bool = True,
         request: GenerationRequest | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> GenerationResult:
         if self._engine is None:
             raise RuntimeError("Engine not loaded.")
@@ -136,6 +147,7 @@ class LocalCT2RefinementProvider:
             repetition_penalty=repetition_penalty,
             use_thinking=request.use_thinking,
             allow_skip=allow_skip,
+            should_cancel=should_cancel,
         )
         self._last_usage = {
             "prompt_tokens": result.prompt_tokens,
@@ -145,6 +157,56 @@ class LocalCT2RefinementProvider:
         self._last_request = request.to_runtime_summary()
         return result
 
+    def refine_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        instructions: str = "",
+        temperature: float,
+        top_p: float,
+        top_k: int,
+        repetition_penalty: float,
+        use_thinking: bool,
+        allow_skip: bool = True,
+        max_batch_size: int = 8,
+        on_result: Callable[[int, GenerationResult, float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+        request: GenerationRequest | None = None,
+    ) -> list[GenerationResult | None]:
+        """Refine many texts with batched CT2 generation (local-only capability).
+
+        ``last_usage`` is updated to each item's counts right before its
+        ``on_result`` callback fires, so per-item provenance capture keeps
+        working exactly as it does for single refinements.
+        """
+        if self._engine is None:
+            raise RuntimeError("Engine not loaded.")
+        request = request or GenerationRequest.for_refinement(visible_output_tokens=1, use_thinking=use_thinking)
+        self._last_request = request.to_runtime_summary()
+
+        def record_usage(index: int, result: GenerationResult, elapsed: float) -> None:
+            self._last_usage = {
+                "prompt_tokens": result.prompt_tokens,
+                "completion_tokens": result.completion_tokens,
+                "total_tokens": result.total_tokens,
+            }
+            if on_result is not None:
+                on_result(index, result, elapsed)
+
+        return self._engine.refine_batch(
+            texts,
+            user_instructions=instructions,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            repetition_penalty=repetition_penalty,
+            use_thinking=request.use_thinking,
+            allow_skip=allow_skip,
+            max_batch_size=max_batch_size,
+            on_result=record_usage,
+            should_cancel=should_cancel,
+        )
+
     def generate_custom(
         self,
         *,
@@ -154,6 +216,7 @@ class LocalCT2RefinementProvider:
         temperature: float = 0.7,
         use_thinking: bool = False,
         request: GenerationRequest | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> GenerationResult:
         if self._engine is None:
             raise RuntimeError("Engine not loaded.")
@@ -164,6 +227,7 @@ class LocalCT2RefinementProvider:
             max_tokens=request.visible_output_tokens,
             temperature=temperature,
             use_thinking=request.use_thinking,
+            should_cancel=should_cancel,
         )
         self._last_usage = {
             "prompt_tokens": result.prompt_tokens,
@@ -5,11 +5,14 @@ from __future__ import annotations
 import json
 import logging
 import time
+from collections.abc import Callable
 
 import httpx
 
+from src.core.http_pool import get_http_pool
 from src.core.secret_store import get_provider_api_key, normalize_provider_api_key, validate_provider_api_key
 from src.core.settings import VociferousSettings
+from src.refinement.chunking import estimate_tokens
 from src.refinement.engine import RefinementEngine
 from src.refinement.output_parser import GenerationResult, parse_generation_output
 from src.refinement.prompt_builder import PromptBuilder
@@ -19,6 +22,7 @@ from src.refinement.providers.capabilities import (
     resolve_capabilities,
 )
 from src.refinement.providers.contracts import GenerationRequest, ProviderRequestError, ResponseShape
+from src.refinement.providers.remote_dispatch import RateLimiter
 from src.refinement.providers.runtime import api_key_from_env, describe_refinement_runtime
 
 logger = logging.getLogger(__name__)
@@ -58,16 +62,28 @@ class OpenAICompatibleRefinementProvider:
     # cannot trigger unbounded regeneration. Three doublings = 8x the seed.
     _MAX_BUDGET_GROWTHS = 3
 
+    # Independent HTTP requests may run in parallel (chunked refinement);
+    # per-request state is kept on the stack, ``_last_*`` is diagnostics only.
+    supports_concurrent_requests = True
+    # A request in flight can't be stopped; ``should_cancel`` is accepted for
+    # the provider contract and ignored.
+    supports_cancellation = False
+
     def __init__(self, settings: VociferousSettings, provider_id: str) -> None:
         if provider_id not in {"lm_studio", "groq"}:
             raise ValueError(f"Unsupported OpenAI-compatible provider: {provider_id}")
         self._settings = settings
         self._provider_id = provider_id
         self._provider_settings = getattr(settings.refinement, provider_id)
+        # Injected client (tests); ``None`` uses the process-wide pool, whose
+        # warm connections outlive this provider instance.
         self._client: httpx.Client | None = None
         self._runtime_summary = describe_refinement_runtime(settings)
         self._last_usage: dict[str, object] | None = None
         self._last_rate_limit: dict[str, str] = {}
+        # Paces requests from the x-ratelimit-* / retry-after headers; shared
+        # by every thread so concurrent bulk requests respect one budget.
+        self.rate_limiter = RateLimiter()
         self._last_request: dict[str, object] | None = None
         self._last_finish_reason: str | None = None
 
@@ -78,9 +94,13 @@ class OpenAICompatibleRefinementProvider:
     def load(self) -> None:
         if not self._provider_settings.model_id:
             raise ValueError(f"No model configured for {self._provider_label}.")
+        # Re-read the stored key once per load; requests then hit the cache.
+        get_provider_api_key(self._provider_id, refresh=True)
         if self._provider_id == "groq" and not self._api_key:
             raise ValueError("Groq API key is not configured. Set GROQ_API_KEY or save a local provider API key.")
         self.list_models()
+        if self._client is None:
+            get_http_pool().remember(self._url("models"), headers=self._headers())
         self._runtime_summary = describe_refinement_runtime(self._settings)
 
     def unload(self) -> None:
@@ -94,6 +114,7 @@ class OpenAICompatibleRefinementProvider:
             summary["last_usage"] = dict(self._last_usage)
         if self._last_rate_limit:
             summary["rate_limit"] = dict(self._last_rate_limit)
+            summary["rate_limiter"] = self.rate_limiter.snapshot()
         if self._last_request:
             summary["last_request"] = dict(self._last_request)
         return summary
@@ -122,6 +143,7 @@ class OpenAICompatibleRefinementProvider:
         use_thinking: bool,
         allow_skip: bool = True,
         request: GenerationRequest | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> GenerationResult:
         if not text or not text.strip():
             return GenerationResult(content=text)
@@ -176,6 +198,7 @@ class OpenAICompatibleRefinementProvider:
         temperature: float = 0.7,
         use_thinking: bool = False,
         request: GenerationRequest | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> GenerationResult:
         capabilities = self._capabilities()
         request = request or GenerationRequest.for_custom(
@@ -231,9 +254,9 @@ class OpenAICompatibleRefinementProvider:
 
     @property
     def _client_instance(self) -> httpx.Client:
-        if self._client is None:
-            self._client = httpx.Client()
-        return self._client
+        if self._client is not None:
+            return self._client
+        return get_http_pool().client_for(self._provider_settings.base_url)
 
     def _request_timeout(self, endpoint: str, *, json_payload: dict[str, object] | None = None) -> httpx.Timeout:
         read_timeout = max(1.0, float(self._provider_settings.timeout_seconds))
@@ -298,6 +321,17 @@ class OpenAICompatibleRefinementProvider:
         except (TypeError, ValueError):
             return 0
 
+    @classmethod
+    def _estimated_request_tokens(cls, json_payload: dict[str, object] | None) -> int:
+        """Prompt plus requested completion tokens, as rate limiters count them."""
+        if not isinstance(json_payload, dict):
+            return 0
+        messages = json_payload.get("messages")
+        prompt = ""
+        if isinstance(messages, list):
+            prompt = " ".join(str(message.get("content", "")) for message in messages if isinstance(message, dict))
+        return estimate_tokens(prompt) + cls._requested_completion_tokens(json_payload)
+
     def _headers(self) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
         api_key = self._api_key
@@ -314,7 +348,9 @@ class OpenAICompatibleRefinementProvider:
         attempts = max(1, self._max_retries + 1)
         last_error: Exception | None = None
         timeout = self._request_timeout(endpoint, json_payload=json_payload)
+        estimated_tokens = self._estimated_request_tokens(json_payload)
         for attempt in range(attempts):
+            self.rate_limiter.acquire(estimated_tokens)
             try:
                 response = self._client_instance.request(
                     method,
@@ -465,8 +501,9 @@ class OpenAICompatibleRefinementProvider:
                 request_tokens = next_tokens
                 continue
 
-            result = self._parse_chat_response(response.json())
-            grown_tokens = self._grow_budget_if_truncated(request_tokens, budget_growths)
+            body = response.json()
+            result = self._parse_chat_response(body)
+            grown_tokens = self._grow_budget_if_truncated(request_tokens, budget_growths, self._finish_reason(body))
             if grown_tokens is None:
                 return result
             logger.info(
@@ -535,8 +572,18 @@ class OpenAICompatibleRefinementProvider:
             return messages
         return [*messages, {"role": "assistant", "content": "<think>\n\n</think>\n\n"}]
 
+    @staticmethod
+    def _finish_reason(body: dict[str, object]) -> str | None:
+        try:
+            choice = body["choices"][0]  # type: ignore[index]
+        except (KeyError, IndexError, TypeError):
+            return None
+        return choice.get("finish_reason") if isinstance(choice, dict) else None
+
     def _parse_chat_response(self, body: dict[str, object]) -> GenerationResult:
-        self._last_usage = body.get("usage") if isinstance(body.get("usage"), dict) else None
+        raw_usage = body.get("usage")
+        usage = raw_usage if isinstance(raw_usage, dict) else None
+        self._last_usage = usage
         try:
             choice = body["choices"][0]
             message = choice["message"]
@@ -551,7 +598,7 @@ class OpenAICompatibleRefinementProvider:
             content = ""
         if not isinstance(content, str):
             raise RuntimeError(f"{self._provider_label} returned non-text chat completion content.")
-        prompt_tokens, completion_tokens, total_tokens = self._usage_counts()
+        prompt_tokens, completion_tokens, total_tokens = self._usage_counts(usage)
         reasoning = self._message_reasoning(message)
         schema_text = self._text_from_schema_output(content) or self._text_from_schema_output(reasoning or "")
         if schema_text is not None:
@@ -612,8 +659,9 @@ class OpenAICompatibleRefinementProvider:
                 return value.strip()
         return None
 
-    def _usage_counts(self) -> tuple[int, int, int]:
-        usage = self._last_usage or {}
+    @staticmethod
+    def _usage_counts(usage: dict[str, object] | None) -> tuple[int, int, int]:
+        usage = usage or {}
         prompt_tokens = int(usage.get("prompt_tokens") or 0)
         completion_tokens = int(usage.get("completion_tokens") or 0)
         total_tokens = int(usage.get("total_tokens") or (prompt_tokens + completion_tokens))
@@ -637,7 +685,7 @@ class OpenAICompatibleRefinementProvider:
             budget += RefinementEngine.THINKING_BUDGET_TOKENS
         return self._apply_budget_ceiling(budget)
 
-    def _grow_budget_if_truncated(self, current_tokens: int, growths: int) -> int | None:
+    def _grow_budget_if_truncated(self, current_tokens: int, growths: int, finish_reason: str | None) -> int | None:
         """Return a larger budget when the provider truncated on length, else None.
 
         This is the missing half of the self-correcting loop: LM Studio (and other
@@ -645,7 +693,7 @@ class OpenAICompatibleRefinementProvider:
         with ``finish_reason == "length"`` and silently truncated content — never an
         error — so nothing downstream catches it without inspecting finish_reason.
         """
-        if self._last_finish_reason != "length":
+        if finish_reason != "length":
             return None
         if growths >= self._MAX_BUDGET_GROWTHS:
             logger.warning(
@@ -681,6 +729,7 @@ class OpenAICompatibleRefinementProvider:
             "x-ratelimit-reset-tokens",
         )
         self._last_rate_limit = {key: response.headers[key] for key in keys if key in response.headers}
+        self.rate_limiter.observe(response.headers, response.status_code)
 
 
 __all__ = ["OpenAICompatibleRefinementProvider"]
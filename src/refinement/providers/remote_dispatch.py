@@ -0,0 +1,343 @@
+"""
+Remote dispatch — paced, bounded-concurrency requests to HTTP providers.
+
+Three pieces, used together for bulk refinement against Groq or LM Studio:
+
+``RateLimiter``
+    Client-side token buckets (requests and tokens) synced from the
+    provider's ``x-ratelimit-*`` headers, plus a hard pause from
+    ``retry-after``. Providers that send no such headers are never paced.
+
+``AdaptiveConcurrency``
+    AIMD limit on requests in flight: one more slot per window of
+    successes, halved on a 429.
+
+``dispatch_in_order``
+    Runs items through a worker pool under that limit, requeues throttled
+    items, and delivers results strictly in input order so callers can
+    commit them as they arrive.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+from src.refinement.providers.contracts import ProviderRequestError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Provider statuses that mean "slow down" rather than "this request is bad".
+THROTTLE_STATUS_CODES = frozenset({429, 498})
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_reset_seconds(raw: str | None) -> float | None:
+    """Parse a rate-limit reset header into seconds.
+
+    Accepts Groq/OpenAI durations (``"2m59.56s"``, ``"7.66s"``, ``"120ms"``,
+    ``"1h2m"``) and bare numbers of seconds (``retry-after``).
+    """
+    if raw is None:
+        return None
+    value = raw.strip().lower()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value:
+        return None
+    scale = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def _header_number(headers: Mapping[str, str], key: str) -> float | None:
+    raw = headers.get(key)
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """Continuously refilled bucket; unset (never paces) until first synced.
+
+    ``reserve`` takes from the bucket immediately, letting the balance go
+    negative, and returns how long the caller must wait before using what it
+    reserved. Concurrent callers therefore queue up behind each other instead
+    of all waking at once when the bucket refills.
+    """
+
+    def __init__(self) -> None:
+        self.capacity: float | None = None
+        self.refill_per_second = 0.0
+        self._available = 0.0
+        self._updated = 0.0
+
+    def _refill(self, now: float) -> None:
+        if self.capacity is None:
+            return
+        elapsed = max(0.0, now - self._updated)
+        self._available = min(self.capacity, self._available + elapsed * self.refill_per_second)
+        self._updated = now
+
+    def sync(self, now: float, *, limit: float | None, remaining: float | None, reset_s: float | None) -> None:
+        """Adopt the server's view of this bucket."""
+        if limit is None or remaining is None or limit <= 0:
+            return
+        self.capacity = limit
+        self._available = min(limit, max(0.0, remaining))
+        self._updated = now
+        if reset_s is not None and reset_s > 0:
+            # Back to full by the time the server says the window resets.
+            self.refill_per_second = max(limit - remaining, 1.0) / reset_s
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` and return the seconds to wait before it is covered."""
+        if self.capacity is None or amount <= 0:
+            return 0.0
+        self._refill(now)
+        self._available -= min(amount, self.capacity)
+        if self._available >= 0:
+            return 0.0
+        if self.refill_per_second <= 0:
+            return 0.0
+        return -self._available / self.refill_per_second
+
+
+class RateLimiter:
+    """Request and token pacing fed by provider rate-limit headers.
+
+    Thread-safe; one instance is shared by every request a provider makes.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        max_wait_s: float = 120.0,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._max_wait_s = max_wait_s
+        self._lock = threading.Lock()
+        self._requests = TokenBucket()
+        self._tokens = TokenBucket()
+        self._paused_until = 0.0
+        self._throttle_count = 0
+
+    @property
+    def throttle_count(self) -> int:
+        """Throttling responses (429/498) observed so far."""
+        with self._lock:
+            return self._throttle_count
+
+    def observe(self, headers: Mapping[str, str], status_code: int) -> None:
+        """Update the buckets from a response's headers."""
+        now = self._clock()
+        with self._lock:
+            self._requests.sync(
+                now,
+                limit=_header_number(headers, "x-ratelimit-limit-requests"),
+                remaining=_header_number(headers, "x-ratelimit-remaining-requests"),
+                reset_s=parse_reset_seconds(headers.get("x-ratelimit-reset-requests")),
+            )
+            self._tokens.sync(
+                now,
+                limit=_header_number(headers, "x-ratelimit-limit-tokens"),
+                remaining=_header_number(headers, "x-ratelimit-remaining-tokens"),
+                reset_s=parse_reset_seconds(headers.get("x-ratelimit-reset-tokens")),
+            )
+            if status_code in THROTTLE_STATUS_CODES:
+                self._throttle_count += 1
+                retry_after = parse_reset_seconds(headers.get("retry-after"))
+                if retry_after:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until one request of ``tokens`` estimated tokens may be sent.
+
+        Returns the seconds waited. Waits are capped at ``max_wait_s`` so a
+        bogus header cannot stall a request indefinitely.
+        """
+        now = self._clock()
+        with self._lock:
+            delay = max(
+                self._paused_until - now,
+                self._requests.reserve(1, now),
+                self._tokens.reserve(tokens, now),
+                0.0,
+            )
+        delay = min(delay, self._max_wait_s)
+        if delay > 0:
+            logger.debug("Rate limiter pacing request for %.2fs", delay)
+            self._sleep(delay)
+        return delay
+
+    def snapshot(self) -> dict[str, object]:
+        """Diagnostics for runtime summaries."""
+        now = self._clock()
+        with self._lock:
+            return {
+                "paused_s": round(max(0.0, self._paused_until - now), 3),
+                "throttled": self._throttle_count,
+                "request_capacity": self._requests.capacity,
+                "token_capacity": self._tokens.capacity,
+            }
+
+
+class AdaptiveConcurrency:
+    """Additive-increase / multiplicative-decrease limit on requests in flight."""
+
+    def __init__(self, maximum: int, *, initial: int | None = None, minimum: int = 1) -> None:
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        start = self.maximum if initial is None else initial
+        self._limit = max(self.minimum, min(self.maximum, start))
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        with self._lock:
+            return self._limit
+
+    def on_success(self) -> None:
+        """Grow by one slot after a full window (``limit``) of successes."""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self._limit:
+                self._successes = 0
+                self._limit = min(self.maximum, self._limit + 1)
+
+    def on_throttle(self) -> None:
+        """Halve the limit after a throttling response."""
+        with self._lock:
+            self._successes = 0
+            self._limit = max(self.minimum, self._limit // 2)
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """True for provider errors that mean "rate limited", not "bad request"."""
+    return isinstance(exc, ProviderRequestError) and exc.status_code in THROTTLE_STATUS_CODES
+
+
+def dispatch_in_order(
+    items: Sequence[T],
+    work: Callable[[T], R],
+    *,
+    concurrency: AdaptiveConcurrency,
+    on_result: Callable[[int, R, float], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+    throttle_count: Callable[[], int] | None = None,
+    max_throttle_retries: int = 3,
+) -> list[R | None]:
+    """Run ``work`` over ``items`` concurrently and deliver results in order.
+
+    At most ``concurrency.limit`` calls are in flight. A call that fails with
+    a throttling error is requeued (up to ``max_throttle_retries`` times per
+    item) and halves the limit; ``throttle_count`` lets the dispatcher also
+    see 429s the provider retried internally. ``on_result(index, result,
+    elapsed_s)`` runs on the calling thread, in index order, as soon as every
+    earlier item has been delivered.
+
+    When ``should_stop`` turns true no new calls are started; in-flight ones
+    finish and are delivered. On a non-throttling error the same happens and
+    the first error is re-raised afterwards. Undelivered items are ``None``.
+    """
+    total = len(items)
+    results: list[R | None] = [None] * total
+    finished = [False] * total
+    elapsed: list[float] = [0.0] * total
+    queue: deque[int] = deque(range(total))
+    retries = [0] * total
+    in_flight: dict[Future[R], tuple[int, float]] = {}
+    error: BaseException | None = None
+    next_commit = 0
+    seen_throttles = throttle_count() if throttle_count is not None else 0
+
+    def stopping() -> bool:
+        return error is not None or (should_stop is not None and should_stop())
+
+    def commit_ready() -> None:
+        nonlocal next_commit
+        while next_commit < total and finished[next_commit]:
+            if on_result is not None:
+                on_result(next_commit, results[next_commit], elapsed[next_commit])
+            next_commit += 1
+
+    if not total:
+        return results
+
+    with ThreadPoolExecutor(max_workers=concurrency.maximum, thread_name_prefix="remote-dispatch") as pool:
+        while queue or in_flight:
+            while queue and len(in_flight) < concurrency.limit and not stopping():
+                index = queue.popleft()
+                in_flight[pool.submit(work, items[index])] = (index, time.monotonic())
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, started = in_flight.pop(future)
+                exc = future.exception()
+                throttled = False
+                if throttle_count is not None:
+                    current = throttle_count()
+                    throttled = current > seen_throttles
+                    seen_throttles = current
+                if exc is None:
+                    results[index] = future.result()
+                    elapsed[index] = time.monotonic() - started
+                    finished[index] = True
+                    if throttled:
+                        concurrency.on_throttle()
+                    else:
+                        concurrency.on_success()
+                elif is_throttle_error(exc) and retries[index] < max_throttle_retries:
+                    retries[index] += 1
+                    concurrency.on_throttle()
+                    queue.appendleft(index)
+                    logger.info(
+                        "Remote dispatch throttled on item %d (retry %d); concurrency now %d",
+                        index,
+                        retries[index],
+                        concurrency.limit,
+                    )
+                elif error is None:
+                    error = exc
+            commit_ready()
+
+    # Stopped or failed: deliver what did finish, still in order, past any gaps.
+    for index in range(next_commit, total):
+        if finished[index] and on_result is not None:
+            on_result(index, results[index], elapsed[index])
+    if error is not None:
+        raise error
+    return results
+
+
+__all__ = [
+    "THROTTLE_STATUS_CODES",
+    "AdaptiveConcurrency",
+    "RateLimiter",
+    "TokenBucket",
+    "dispatch_in_order",
+    "is_throttle_error",
+    "parse_reset_seconds",
+]
@@ -6,7 +6,7 @@ import os
 
 from src.core.cuda_runtime import CudaRuntimeStatus, detect_cuda_runtime
 from src.core.secret_store import get_provider_api_key, normalize_provider_api_key
-from src.core.settings import VociferousSettings
+from src.core.settings import VociferousSettings, _auto_cpu_threads
 
 
 def api_key_from_env(provider_id: str, env_name: str | None) -> str | None:
@@ -63,6 +63,22 @@ def describe_refinement_runtime(
     else:
         resolved_device = "cpu"
 
+    from src.services.calibration import SLM, resolve_cpu_runtime
+
+    # n_threads 0 / compute_type "auto" read this machine's calibration profile.
+    cpu_threads, compute_type, cpu_runtime_source = resolve_cpu_runtime(
+        SLM,
+        resolved_model,
+        settings.refinement.n_threads,
+        settings.model.compute_type,
+        fallback_threads=_auto_cpu_threads(),
+    )
+    if resolved_device in {"cpu", "cpu-fallback"}:
+        from src.services.cpu_partition import partition_threads
+
+        # Never more threads than cores in the SLM's share of the CPU.
+        cpu_threads = partition_threads(settings, SLM, cpu_threads, cuda_status=status)
+
     return {
         "enabled": settings.refinement.enabled,
         "provider": "local_ct2",
@@ -71,8 +87,9 @@ def describe_refinement_runtime(
         "resolved_device": resolved_device,
         "gpu_layers": 0 if resolved_device == "cpu-fallback" else settings.refinement.n_gpu_layers,
         "requested_gpu_layers": settings.refinement.n_gpu_layers,
-        "cpu_threads": settings.refinement.n_threads,
-        "compute_type": settings.model.compute_type,
+        "cpu_threads": cpu_threads,
+        "cpu_runtime_source": cpu_runtime_source,
+        "compute_type": compute_type,
         "use_thinking": settings.refinement.use_thinking,
         "default_reasoning_policy": "visible" if settings.refinement.use_thinking else "disabled",
         "cuda_detail": status.detail,
@@ -0,0 +1,193 @@
+"""Local CTranslate2 refinement in a worker process (``refinement.worker_process``)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from src.core.settings import VociferousSettings
+from src.refinement.output_parser import GenerationResult
+from src.refinement.providers.contracts import GenerationRequest
+from src.refinement.providers.runtime import describe_refinement_runtime
+from src.services.inference_worker import WorkerProcess
+
+
+class _LocalCT2Server:
+    """Worker side: the in-process provider, driven over the pipe."""
+
+    def __init__(self, settings: VociferousSettings) -> None:
+        from src.refinement.providers.local_ct2 import LocalCT2RefinementProvider
+
+        self._provider = LocalCT2RefinementProvider(settings)
+        self._provider.load()
+
+    def summary(self) -> dict[str, object]:
+        return self._provider.get_runtime_summary()
+
+    def refine(self, payload: tuple[str, dict[str, Any]], channel: Any) -> tuple[GenerationResult, dict]:
+        text, kwargs = payload
+        result = self._provider.refine(text, **kwargs, should_cancel=channel.should_cancel)
+        return result, self.summary()
+
+    def refine_batch(self, payload: tuple[Sequence[str], dict[str, Any]], channel: Any) -> tuple[list, dict]:
+        texts, kwargs = payload
+        results = self._provider.refine_batch(
+            texts,
+            **kwargs,
+            on_result=lambda index, result, elapsed: channel.send("result", (index, result, elapsed)),
+            should_cancel=channel.should_cancel,
+        )
+        return results, self.summary()
+
+    def generate_custom(self, kwargs: dict[str, Any], channel: Any) -> tuple[GenerationResult, dict]:
+        result = self._provider.generate_custom(**kwargs, should_cancel=channel.should_cancel)
+        return result, self.summary()
+
+
+def _usage(result: GenerationResult) -> dict[str, int]:
+    return {
+        "prompt_tokens": result.prompt_tokens,
+        "completion_tokens": result.completion_tokens,
+        "total_tokens": result.total_tokens,
+    }
+
+
+class WorkerRefinementProvider:
+    """``LocalCT2RefinementProvider`` with the engine in a supervised worker process.
+
+    Same provider id, capabilities and runtime summary as the in-process
+    provider; a worker crash fails the request in flight with
+    ``WorkerCrashed`` and the worker restarts for the next one.
+    """
+
+    supports_cancellation = True
+
+    def __init__(self, settings: VociferousSettings, *, server_factory: Callable[..., Any] = _LocalCT2Server) -> None:
+        self._settings = settings
+        self._server_factory = server_factory
+        self._worker: WorkerProcess | None = None
+        self._runtime_summary: dict[str, object] | None = None
+
+    @property
+    def provider_id(self) -> str:
+        return "local_ct2"
+
+    @property
+    def worker(self) -> WorkerProcess | None:
+        return self._worker
+
+    def load(self) -> None:
+        worker = WorkerProcess("slm", self._server_factory, self._settings)
+        self._runtime_summary = worker.start()
+        self._worker = worker
+
+    def unload(self) -> None:
+        worker, self._worker = self._worker, None
+        self._runtime_summary = None
+        if worker is not None:
+            worker.stop()
+
+    def get_runtime_summary(self) -> dict[str, object]:
+        summary = dict(self._runtime_summary or describe_refinement_runtime(self._settings))
+        summary["worker_process"] = True
+        if self._worker is not None:
+            status = self._worker.status()
+            summary["worker_pid"] = status["pid"]
+            summary["worker_restarts"] = status["restarts"]
+        return summary
+
+    def _call(self, op: str, payload: Any, should_cancel: Callable[[], bool] | None, **kwargs: Any) -> Any:
+        if self._worker is None:
+            raise RuntimeError("Engine not loaded.")
+        value, self._runtime_summary = self._worker.call(op, payload, should_cancel=should_cancel, **kwargs)
+        return value
+
+    def refine(
+        self,
+        text: str,
+        *,
+        instructions: str = "",
+        temperature: float,
+        top_p: float,
+        top_k: int,
+        repetition_penalty: float,
+        use_thinking: bool,
+        allow_skip: bool = True,
+        request: GenerationRequest | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> GenerationResult:
+        kwargs = {
+            "instructions": instructions,
+            "temperature": temperature,
+            "top_p": top_p,
+            "top_k": top_k,
+            "repetition_penalty": repetition_penalty,
+            "use_thinking": use_thinking,
+            "allow_skip": allow_skip,
+            "request": request,
+        }
+        return self._call("refine", (text, kwargs), should_cancel)
+
+    def refine_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        instructions: str = "",
+        temperature: float,
+        top_p: float,
+        top_k: int,
+        repetition_penalty: float,
+        use_thinking: bool,
+        allow_skip: bool = True,
+        max_batch_size: int = 8,
+        on_result: Callable[[int, GenerationResult, float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+        request: GenerationRequest | None = None,
+    ) -> list[GenerationResult | None]:
+        """Batched refinement in the worker; ``on_result`` fires here as each item arrives."""
+        kwargs = {
+            "instructions": instructions,
+            "temperature": temperature,
+            "top_p": top_p,
+            "top_k": top_k,
+            "repetition_penalty": repetition_penalty,
+            "use_thinking": use_thinking,
+            "allow_skip": allow_skip,
+            "max_batch_size": max_batch_size,
+            "request": request,
+        }
+
+        def on_message(tag: str, value: Any) -> None:
+            if tag != "result":
+                return
+            index, result, elapsed = value
+            # Per-item provenance reads last_usage from the summary in on_result.
+            self._runtime_summary = {**(self._runtime_summary or {}), "last_usage": _usage(result)}
+            if on_result is not None:
+                on_result(index, result, elapsed)
+
+        return self._call("refine_batch", (list(texts), kwargs), should_cancel, on_message=on_message)
+
+    def generate_custom(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        use_thinking: bool = False,
+        request: GenerationRequest | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> GenerationResult:
+        kwargs = {
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "use_thinking": use_thinking,
+            "request": request,
+        }
+        return self._call("generate_custom", kwargs, should_cancel)
+
+
+__all__ = ["WorkerRefinementProvider"]
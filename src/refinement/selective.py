@@ -0,0 +1,160 @@
+"""
+Selective refinement — send only the spans of a transcript that need it.
+
+A transcript is split into sentences (paragraph breaks are hard boundaries),
+each sentence is scored with ``score_refinement_need``, and consecutive
+sentences above the threshold are merged into regions. Only those regions go
+to the SLM; clean sentences are kept verbatim, and ``SelectivePlan.stitch``
+reassembles the text with the original whitespace between spans.
+
+Pure string work — no model, no tokenizer, no I/O.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from src.refinement.skip_check import MIN_REFINABLE_WORDS, SKIP_SCORE_THRESHOLD, score_refinement_need
+
+# Sentence boundary: whitespace after terminal punctuation (optionally closed
+# by a quote or bracket), or a blank line. The separator is captured so
+# stitching can restore it exactly.
+_BOUNDARY = re.compile(r"(\n[ \t]*\n\s*|(?<=[.!?])\s+|(?<=[.!?][\"')\]])\s+)")
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+
+
+@dataclass(frozen=True, slots=True)
+class TextSpan:
+    """A run of one or more sentences and the whitespace that follows it."""
+
+    text: str
+    separator: str
+    score: float
+    refine: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SelectivePlan:
+    """Spans of a transcript, marked for refinement or verbatim passthrough."""
+
+    leading: str
+    spans: tuple[TextSpan, ...]
+    trailing: str
+
+    @property
+    def regions(self) -> list[str]:
+        """Texts of the spans that should be sent to the SLM, in order."""
+        return [span.text for span in self.spans if span.refine]
+
+    @property
+    def is_partial(self) -> bool:
+        """True when some, but not all, of the text needs refinement."""
+        flags = {span.refine for span in self.spans}
+        return flags == {True, False}
+
+    @property
+    def refine_chars(self) -> int:
+        return sum(len(span.text) for span in self.spans if span.refine)
+
+    @property
+    def total_chars(self) -> int:
+        return sum(len(span.text) for span in self.spans)
+
+    def stitch(self, refined: Sequence[str | None]) -> str:
+        """Reassemble the transcript from refined region texts.
+
+        ``refined`` lines up with ``regions``; a ``None`` or blank entry keeps
+        that region's original text.
+        """
+        if len(refined) != len(self.regions):
+            raise ValueError(f"Expected {len(self.regions)} refined region(s), got {len(refined)}")
+        replacements = iter(refined)
+        parts = [self.leading]
+        for span in self.spans:
+            text = span.text
+            if span.refine:
+                candidate = next(replacements)
+                if candidate is not None and candidate.strip():
+                    text = candidate.strip()
+            parts.append(text)
+            parts.append(span.separator)
+        parts.append(self.trailing)
+        return "".join(parts)
+
+
+def split_sentences(text: str) -> list[tuple[str, str]]:
+    """Split ``text`` into ``(sentence, following_whitespace)`` pairs.
+
+    Leading and trailing whitespace of ``text`` is not included; joining
+    every sentence and separator reproduces ``text.strip()`` exactly.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return []
+    pieces = _BOUNDARY.split(stripped)
+    pairs: list[tuple[str, str]] = []
+    for index in range(0, len(pieces), 2):
+        sentence = pieces[index]
+        separator = pieces[index + 1] if index + 1 < len(pieces) else ""
+        if not sentence:
+            # Zero-width sentence between two separators: fold into previous.
+            if pairs:
+                prev_sentence, prev_separator = pairs[-1]
+                pairs[-1] = (prev_sentence, prev_separator + separator)
+            continue
+        pairs.append((sentence, separator))
+    return pairs
+
+
+def plan_selective_refinement(text: str, threshold: float = SKIP_SCORE_THRESHOLD) -> SelectivePlan:
+    """Score each sentence of ``text`` and group the ones that need refinement.
+
+    Fragments shorter than ``MIN_REFINABLE_WORDS`` are too short to score on
+    their own and are attached to the preceding sentence (or the next one at
+    the start of a paragraph). Consecutive sentences at or above
+    ``threshold`` within a paragraph are merged into a single region so the
+    SLM sees them with their local context.
+    """
+    stripped = text.strip()
+    leading = text[: len(text) - len(text.lstrip())]
+    trailing = text[len(text.rstrip()) :] if stripped else ""
+
+    # Attach short fragments to a neighbour within the same paragraph.
+    merged: list[list[str]] = []
+    carry = ""
+    for sentence, separator in split_sentences(text):
+        if len(sentence.split()) >= MIN_REFINABLE_WORDS:
+            merged.append([carry + sentence, separator])
+            carry = ""
+        elif merged and not carry and not _PARAGRAPH_BREAK.search(merged[-1][1]):
+            merged[-1][0] += merged[-1][1] + sentence
+            merged[-1][1] = separator
+        elif not _PARAGRAPH_BREAK.search(separator) and separator:
+            carry += sentence + separator
+        else:
+            merged.append([carry + sentence, separator])
+            carry = ""
+    if carry:
+        merged.append([carry.rstrip(), carry[len(carry.rstrip()) :]])
+
+    spans: list[TextSpan] = []
+    for sentence, separator in merged:
+        score = score_refinement_need(sentence)
+        # A paragraph too short to score (e.g. "Thanks.") is not worth a call.
+        refine = score >= threshold and len(sentence.split()) >= MIN_REFINABLE_WORDS
+        previous = spans[-1] if spans else None
+        if previous is not None and refine and previous.refine and not _PARAGRAPH_BREAK.search(previous.separator):
+            spans[-1] = TextSpan(
+                text=previous.text + previous.separator + sentence,
+                separator=separator,
+                score=max(previous.score, score),
+                refine=True,
+            )
+            continue
+        spans.append(TextSpan(text=sentence, separator=separator, score=score, refine=refine))
+    return SelectivePlan(leading=leading, spans=tuple(spans), trailing=trailing)
+
+
+__all__ = ["SelectivePlan", "TextSpan", "plan_selective_refinement", "split_sentences"]
@@ -0,0 +1,182 @@
+"""
+Adaptive ASR model routing by recording length and measured speed.
+
+Every local dictation decodes on the configured Whisper model unless
+``model.latency_budget_s`` is set. Then ``AsrRouter.route`` predicts the
+decode time as audio length × the model's real-time factor (RTF, decode
+time / audio time) on this machine. When that exceeds the budget, the
+recording goes to a faster installed model from ``ASR_MODELS``: the largest
+one predicted to fit, or the fastest if none does.
+
+``RtfEstimator`` tracks RTFs per (model, resolved device, compute type) as an
+exponentially weighted mean. It is seeded from the timings stored with past
+transcripts and updated after every local decode. A model with no history
+of its own is estimated from the configured model's RTF scaled by relative
+model size.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.core.model_registry import ASR_MODELS, get_asr_model
+
+if TYPE_CHECKING:
+    from src.core.settings import VociferousSettings
+    from src.database.db import TranscriptDB
+
+logger = logging.getLogger(__name__)
+
+# (model_id, resolved_device, compute_type), as recorded in transcript provenance.
+RtfKey = tuple[str, str, str]
+
+# Shorter clips are dominated by fixed per-call overhead and skew the RTF.
+MIN_AUDIO_S = 2.0
+
+
+def rtf_key(capture: Mapping[str, object]) -> RtfKey:
+    """Estimator key for a ``describe_transcription_capture`` result."""
+    return (
+        str(capture.get("transcription_model_id") or ""),
+        str(capture.get("transcription_resolved_device") or ""),
+        str(capture.get("transcription_compute_type") or ""),
+    )
+
+
+def with_asr_model(settings: VociferousSettings, model_id: str) -> VociferousSettings:
+    """``settings`` with the local Whisper model swapped for ``model_id``."""
+    return settings.model_copy(update={"model": settings.model.model_copy(update={"model": model_id})})
+
+
+class RtfEstimator:
+    """Online real-time-factor estimates per model, device and compute type."""
+
+    def __init__(self, *, alpha: float = 0.2) -> None:
+        self._alpha = alpha
+        self._lock = threading.Lock()
+        self._rtf: dict[RtfKey, float] = {}
+        self._samples: dict[RtfKey, int] = {}
+
+    def record(self, key: RtfKey, audio_s: float, decode_s: float) -> None:
+        if audio_s < MIN_AUDIO_S or decode_s <= 0:
+            return
+        rtf = decode_s / audio_s
+        with self._lock:
+            previous = self._rtf.get(key)
+            self._rtf[key] = rtf if previous is None else previous + self._alpha * (rtf - previous)
+            self._samples[key] = self._samples.get(key, 0) + 1
+
+    def seed(self, rows: Iterable[tuple[str, str, str, int, int]]) -> None:
+        """Replay ``TranscriptDB.recent_transcription_timings`` rows (oldest first)."""
+        for model_id, device, compute_type, duration_ms, transcription_time_ms in rows:
+            self.record((model_id, device, compute_type), duration_ms / 1000, transcription_time_ms / 1000)
+
+    def estimate(self, key: RtfKey) -> float | None:
+        with self._lock:
+            return self._rtf.get(key)
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {
+                "/".join(key): {"rtf": round(rtf, 4), "samples": self._samples[key]} for key, rtf in self._rtf.items()
+            }
+
+
+@dataclass(frozen=True, slots=True)
+class RouteDecision:
+    """Which model decodes a recording, and why it is not the configured one."""
+
+    model_id: str
+    # The configured model when the recording was routed away from it.
+    routed_from: str = ""
+    # Predicted decode time on the configured model (0 without history).
+    predicted_s: float = 0.0
+    reason: str = ""
+
+    @property
+    def routed(self) -> bool:
+        return bool(self.routed_from)
+
+
+def _installed(model_id: str) -> bool:
+    from src.services.transcription_service import is_asr_model_installed
+
+    return is_asr_model_installed(model_id)
+
+
+class AsrRouter:
+    """Picks the Whisper model for each dictation from its length and measured RTFs."""
+
+    def __init__(
+        self,
+        estimator: RtfEstimator | None = None,
+        *,
+        installed: Callable[[str], bool] = _installed,
+    ) -> None:
+        self.estimator = estimator or RtfEstimator()
+        self._installed = installed
+        self._seeded = False
+
+    def seed_once(self, db: TranscriptDB | None) -> None:
+        """Load past decode timings from ``db`` the first time one is available."""
+        if self._seeded or db is None:
+            return
+        self._seeded = True
+        try:
+            self.estimator.seed(db.recent_transcription_timings())
+        except Exception:
+            logger.warning("Could not seed ASR speed estimates from history (non-fatal)", exc_info=True)
+
+    def observe(self, capture: Mapping[str, object], audio_s: float, transcription_time_ms: int) -> None:
+        """Record one local decode (``capture`` from ``describe_transcription_capture``)."""
+        if capture.get("transcription_provider") == "local_faster_whisper":
+            self.estimator.record(rtf_key(capture), audio_s, transcription_time_ms / 1000)
+
+    def route(self, settings: VociferousSettings, audio_s: float, primary: Mapping[str, object]) -> RouteDecision:
+        """Decide where ``audio_s`` seconds of dictation decode.
+
+        ``primary`` is the capture description of the loaded configured model.
+        """
+        model_id = settings.model.model
+        budget = float(settings.model.latency_budget_s)
+        if budget <= 0 or settings.model.provider != "local_faster_whisper":
+            return RouteDecision(model_id)
+        primary_rtf = self.estimator.estimate(rtf_key(primary))
+        current = get_asr_model(model_id)
+        if primary_rtf is None or current is None:
+            return RouteDecision(model_id)
+        predicted = audio_s * primary_rtf
+        if predicted <= budget:
+            return RouteDecision(model_id, predicted_s=predicted)
+
+        _, device, compute_type = rtf_key(primary)
+        estimates = []
+        for candidate in ASR_MODELS.values():
+            if candidate.size_mb >= current.size_mb or not self._installed(candidate.id):
+                continue
+            rtf = self.estimator.estimate((candidate.id, device, compute_type))
+            if rtf is None:
+                rtf = primary_rtf * candidate.size_mb / current.size_mb
+            estimates.append((candidate, audio_s * rtf))
+        if not estimates:
+            return RouteDecision(model_id, predicted_s=predicted)
+
+        fitting = [estimate for estimate in estimates if estimate[1] <= budget]
+        if fitting:
+            chosen, chosen_s = max(fitting, key=lambda estimate: estimate[0].size_mb)
+        else:
+            chosen, chosen_s = min(estimates, key=lambda estimate: estimate[0].size_mb)
+        reason = (
+            f"predicted {predicted:.1f}s on {model_id} over the {budget:g}s budget; ~{chosen_s:.1f}s on {chosen.id}"
+        )
+        return RouteDecision(chosen.id, routed_from=model_id, predicted_s=predicted, reason=reason)
+
+    def status(self, settings: VociferousSettings) -> dict[str, object]:
+        return {"latency_budget_s": settings.model.latency_budget_s, "rtf": self.estimator.snapshot()}
+
+
+__all__ = ["AsrRouter", "RouteDecision", "RtfEstimator", "rtf_key", "with_asr_model"]
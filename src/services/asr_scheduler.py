@@ -0,0 +1,277 @@
+"""
+ASR Scheduler — single-worker priority queue for the shared Whisper model.
+
+Live dictation, crash recovery, re-transcription and audio imports all
+decode with the same ``WhisperModel``. Instead of each running on its own
+thread (and oversubscribing the CPU, or making a fresh dictation wait for a
+long import), every decode is submitted here and runs on one worker thread.
+
+Semantics:
+- Priority lanes (``ASRJobPriority``), FIFO within a lane.
+- Cooperative yielding: a running job calls ``yield_to_urgent()`` between
+  decoded segments. Any queued job in a more urgent lane runs right there,
+  on the worker thread, and the yielding job then carries on where it was.
+  Unlike ``SLMScheduler`` preemption nothing is thrown away — a half-done
+  import keeps its decoded segments — so a new dictation waits at most for
+  the segment that is being decoded when it arrives.
+- Yield points are only as fine as the decode that provides them. A batched
+  pass (``model.batch_size``) produces no segment until its first batch of
+  windows is decoded, a worker process (``model.worker_process``) hands back
+  its segments once the whole decode is done, and a remote provider (Groq,
+  OpenAI-compatible) returns nothing until all of its upload pieces are
+  back. A dictation that arrives meanwhile waits for that batch, decode or
+  those uploads.
+- Jobs submitted from the worker thread itself run inline.
+- Metrics: queue depth per lane, wait-time statistics per priority and the
+  real-time factor (decode wall time over audio length) per priority.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+
+from src.services.scheduler_stats import WaitStats
+
+logger = logging.getLogger(__name__)
+
+
+class ASRJobPriority(IntEnum):
+    """Scheduling lanes, most urgent first."""
+
+    DICTATION = 0
+    RECOVERY = 1
+    RETRANSCRIBE = 2
+    IMPORT = 3
+
+
+@dataclass(slots=True, eq=False)
+class _Job:
+    seq: int
+    priority: ASRJobPriority
+    label: str
+    fn: Callable[[], Any]
+    submitted_at: float
+    audio_seconds: float | None
+    future: Future
+    # Time spent running more urgent jobs while this one yielded.
+    yielded_s: float = 0.0
+
+
+@dataclass(slots=True)
+class _RtfStats:
+    count: int = 0
+    audio_s: float = 0.0
+    busy_s: float = 0.0
+    last: float = 0.0
+
+    def record(self, busy_s: float, audio_s: float) -> None:
+        self.count += 1
+        self.audio_s += audio_s
+        self.busy_s += busy_s
+        self.last = busy_s / audio_s
+
+    def to_dict(self) -> dict[str, float | int]:
+        return {
+            "count": self.count,
+            "audio_s": round(self.audio_s, 1),
+            "rtf": round(self.busy_s / self.audio_s, 4) if self.audio_s else 0.0,
+            "last_rtf": round(self.last, 4),
+        }
+
+
+class ASRScheduler:
+    """Runs ASR jobs one at a time on a dedicated worker thread, by priority."""
+
+    def __init__(self, *, name: str = "asr-scheduler") -> None:
+        self._name = name
+        self._cond = threading.Condition()
+        self._pending: list[_Job] = []
+        self._running: list[_Job] = []  # innermost (currently executing) job last
+        self._worker: threading.Thread | None = None
+        self._stopped = False
+        self._seq = 0
+        self._counters = {"submitted": 0, "completed": 0, "failed": 0, "yielded": 0}
+        self._wait_stats = {priority: WaitStats() for priority in ASRJobPriority}
+        self._rtf_stats = {priority: _RtfStats() for priority in ASRJobPriority}
+
+    # ── Public API ──────────────────────────────────────────────────────────
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        *,
+        priority: ASRJobPriority,
+        label: str = "job",
+        audio_seconds: float | None = None,
+    ) -> Future:
+        """Queue ``fn`` and return a Future for its result.
+
+        ``audio_seconds`` is the length of the audio the job decodes; when
+        given, the job's real-time factor is recorded in ``metrics()``.
+        Jobs submitted from the worker thread itself run inline.
+        """
+        future: Future = Future()
+        now = time.monotonic()
+
+        if self.in_worker():
+            job = _Job(0, priority, label, fn, now, audio_seconds, future)
+            self._execute(job)
+            return future
+
+        with self._cond:
+            if self._stopped:
+                future.set_exception(RuntimeError("ASR scheduler is shut down."))
+                return future
+            self._counters["submitted"] += 1
+            self._seq += 1
+            self._pending.append(_Job(self._seq, priority, label, fn, now, audio_seconds, future))
+            self._ensure_worker_locked()
+            self._cond.notify_all()
+        return future
+
+    def run(
+        self,
+        fn: Callable[[], Any],
+        *,
+        priority: ASRJobPriority,
+        label: str = "job",
+        audio_seconds: float | None = None,
+    ) -> Any:
+        """``submit`` and wait for the result (re-raising the job's exception)."""
+        return self.submit(fn, priority=priority, label=label, audio_seconds=audio_seconds).result()
+
+    def in_worker(self) -> bool:
+        """True when called from the scheduler's own worker thread."""
+        return self._worker is not None and threading.current_thread() is self._worker
+
+    def yield_to_urgent(self) -> None:
+        """Run queued jobs more urgent than the running one, then return.
+
+        Called by running jobs between decoded segments (see the module
+        notes for decodes that have no such points). A no-op off the worker
+        thread, so decode code can call it unconditionally.
+        """
+        if not self.in_worker():
+            return
+        while True:
+            with self._cond:
+                if not self._running or self._stopped:
+                    return
+                current = self._running[-1]
+                urgent = [job for job in self._pending if job.priority < current.priority]
+                if not urgent:
+                    return
+                job = min(urgent, key=lambda job: (job.priority, job.seq))
+                self._pending.remove(job)
+                self._counters["yielded"] += 1
+            logger.info("ASR scheduler: %s yields to %s", current.label, job.label)
+            started = time.monotonic()
+            self._run_job(job)
+            current.yielded_s += time.monotonic() - started
+
+    def urgent_pending(self) -> bool:
+        """True when a queued job is more urgent than the running one.
+
+        Lets a job that would rather stop than yield (a model warm-up) poll
+        for real work.
+        """
+        with self._cond:
+            if not self._running:
+                return False
+            current = self._running[-1].priority
+            return any(job.priority < current for job in self._pending)
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until no job is running or queued. Returns False on timeout."""
+        end = time.monotonic() + timeout if timeout is not None else None
+        with self._cond:
+            while self._running or self._pending:
+                remaining = end - time.monotonic() if end is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth, wait-time and real-time-factor snapshot for diagnostics."""
+        with self._cond:
+            depth = {priority.name.lower(): 0 for priority in ASRJobPriority}
+            for job in self._pending:
+                depth[job.priority.name.lower()] += 1
+            oldest = min((job.submitted_at for job in self._pending), default=None)
+            return {
+                "queue_depth": sum(depth.values()),
+                "queue_depth_by_priority": depth,
+                "running": self._running[-1].label if self._running else None,
+                "oldest_wait_ms": round((time.monotonic() - oldest) * 1000, 1) if oldest is not None else 0.0,
+                "wait_ms_by_priority": {p.name.lower(): s.to_dict() for p, s in self._wait_stats.items()},
+                "rtf_by_priority": {p.name.lower(): s.to_dict() for p, s in self._rtf_stats.items()},
+                **self._counters,
+            }
+
+    def shutdown(self, *, cancel_pending: bool = True) -> None:
+        """Stop the worker after the running job; pending futures are cancelled."""
+        with self._cond:
+            self._stopped = True
+            pending, self._pending = (self._pending, []) if cancel_pending else ([], self._pending)
+            self._cond.notify_all()
+        for job in pending:
+            job.future.cancel()
+
+    # ── Worker ──────────────────────────────────────────────────────────────
+
+    def _ensure_worker_locked(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._worker_loop, daemon=True, name=self._name)
+            self._worker.start()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    if self._stopped:
+                        return
+                    self._cond.wait()
+                job = min(self._pending, key=lambda job: (job.priority, job.seq))
+                self._pending.remove(job)
+            self._run_job(job)
+
+    def _run_job(self, job: _Job) -> None:
+        """Run a dequeued job on the worker thread and record its metrics."""
+        with self._cond:
+            self._wait_stats[job.priority].record((time.monotonic() - job.submitted_at) * 1000)
+            self._running.append(job)
+        try:
+            ok = self._execute(job)
+        finally:
+            with self._cond:
+                self._running.pop()
+                self._counters["completed" if ok else "failed"] += 1
+                self._cond.notify_all()
+
+    def _execute(self, job: _Job) -> bool:
+        if not job.future.set_running_or_notify_cancel():
+            return True
+        logger.debug("ASR scheduler: running %s (priority=%s)", job.label, job.priority.name)
+        started = time.monotonic()
+        try:
+            result = job.fn()
+        except BaseException as exc:
+            job.future.set_exception(exc)
+            return False
+        busy_s = time.monotonic() - started - job.yielded_s
+        if job.audio_seconds:
+            with self._cond:
+                self._rtf_stats[job.priority].record(busy_s, job.audio_seconds)
+        job.future.set_result(result)
+        return True
+
+
+__all__ = ["ASRJobPriority", "ASRScheduler"]
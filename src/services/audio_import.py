@@ -0,0 +1,378 @@
+"""
+Streaming transcription of imported audio files.
+
+``faster_whisper.audio.decode_audio`` decodes a whole file to float32 before
+anything else can run, and the import path then converted that to a second
+int16 copy — two full copies of a two-hour recording in memory before VAD
+even started. Imports instead stream through three stages:
+
+  1. PyAV decodes the file and resamples it to 16 kHz mono int16 in
+     fixed-size blocks.
+  2. Each block is pushed through an :class:`~src.services.audio_pipeline.SpeechStream`,
+     which closes speech segments as the pauses after them are seen.
+  3. Closed segments are grouped (up to one batched-decoding pass worth of
+     speech) and transcribed while decoding continues on a producer thread.
+
+Memory is bounded by the VAD stream's retained audio, the bounded segment
+queue and the group being transcribed, independent of file length.
+
+Batch imports run several files through the same stream: while the model
+transcribes the tail of one file, the decoder is already working through
+the next, so a folder of recordings takes about as long as transcribing it.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.core.constants import AudioConfig
+from src.core.settings import VociferousSettings
+from src.services.transcription.long_form import WINDOW_SECONDS
+from src.services.transcription.post_process import merge_segment_texts, post_process_transcription
+
+if TYPE_CHECKING:
+    from src.services.asr_scheduler import ASRScheduler
+    from src.services.audio_pipeline import AudioPipeline, SpeechSegment
+
+logger = logging.getLogger(__name__)
+
+# Decoded audio handed to the VAD stream at a time.
+BLOCK_SECONDS = 5.0
+# Closed segments allowed to wait for the transcriber before decoding pauses.
+_QUEUE_SEGMENTS = 8
+# Minimum wall time between progress callbacks from the decoder thread.
+_PROGRESS_INTERVAL_S = 0.5
+
+ProgressCallback = Callable[[float, float], None]
+FileProgressCallback = Callable[[int, float, float], None]
+
+
+@dataclass(frozen=True, slots=True)
+class ImportTranscription:
+    """Result of :func:`transcribe_audio_file`."""
+
+    text: str
+    speech_duration_ms: int
+    transcription_time_ms: int
+    duration_ms: int
+
+
+def iter_audio_file_blocks(
+    path: Path | str,
+    *,
+    sample_rate: int = AudioConfig.DEFAULT_SAMPLE_RATE,
+    block_samples: int = int(BLOCK_SECONDS * AudioConfig.DEFAULT_SAMPLE_RATE),
+) -> Iterator[NDArray[np.int16]]:
+    """Yield ``path`` as mono int16 blocks of ``block_samples`` at ``sample_rate``.
+
+    The last block may be shorter. Decoding and resampling are incremental,
+    so only about one block of audio is held at a time.
+    """
+    import av  # deferred import — ships with faster-whisper
+
+    resampler = av.audio.resampler.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+    pending: list[NDArray[np.int16]] = []
+    pending_samples = 0
+
+    def _drain(frames: list[Any]) -> Iterator[NDArray[np.int16]]:
+        nonlocal pending, pending_samples
+        for frame in frames:
+            pending.append(frame.to_ndarray().reshape(-1))
+            pending_samples += frame.samples
+        while pending_samples >= block_samples:
+            joined = np.concatenate(pending)
+            yield joined[:block_samples]
+            rest = joined[block_samples:]
+            pending = [rest] if len(rest) else []
+            pending_samples = len(rest)
+
+    with av.open(str(path), mode="r") as container:
+        for frame in container.decode(audio=0):
+            # Timestamps from the source stream confuse the resampler; let it
+            # count samples instead (as faster-whisper's decode_audio does).
+            frame.pts = None
+            yield from _drain(resampler.resample(frame))
+        yield from _drain(resampler.resample(None))
+
+    if pending_samples:
+        yield np.concatenate(pending)
+
+
+def _assemble(
+    segments: list[SpeechSegment], pipeline: AudioPipeline
+) -> tuple[NDArray[np.float32], list[tuple[int, int]]]:
+    """Join segments with the batch pipeline's low-level noise inserts."""
+    silence_samples = int(pipeline._INTER_SEGMENT_SILENCE_MS * pipeline.sample_rate / 1000)
+    rng = np.random.default_rng(42)
+    parts: list[NDArray[np.float32]] = []
+    bounds: list[tuple[int, int]] = []
+    offset = 0
+    for index, segment in enumerate(segments):
+        if index:
+            parts.append(rng.normal(0, 1e-4, silence_samples).astype(np.float32))
+            offset += silence_samples
+        parts.append(segment.audio)
+        bounds.append((offset, offset + len(segment.audio)))
+        offset += len(segment.audio)
+    return np.concatenate(parts), bounds
+
+
+def _group_seconds(settings: VociferousSettings) -> float:
+    """Speech to collect before transcribing: one batched pass where batching is on."""
+    batch_size = int(settings.model.batch_size)
+    threshold = float(settings.model.batched_min_seconds)
+    if batch_size > 1 and threshold > 0:
+        return max(threshold, WINDOW_SECONDS * batch_size)
+    return WINDOW_SECONDS
+
+
+class ImportCancelledError(RuntimeError):
+    """Raised when ``should_stop`` ends a streaming import early."""
+
+
+def transcribe_audio_files(
+    paths: Sequence[Path | str],
+    settings: VociferousSettings,
+    local_model: Any,
+    audio_pipeline: AudioPipeline,
+    *,
+    on_progress: FileProgressCallback | None = None,
+    should_stop: Callable[[], bool] | None = None,
+    asr_scheduler: ASRScheduler | None = None,
+) -> Iterator[tuple[int, ImportTranscription | Exception]]:
+    """Decode, segment and transcribe ``paths`` as one stream, in order.
+
+    One decoder thread walks the files in order, so the next file is
+    decoded and run through VAD while the model is still transcribing the
+    current one. Yields ``(index, result)`` once per file, in input order.
+    ``result`` is the exception instead when that file could not be decoded
+    or transcribed; the remaining files still run.
+
+    ``on_progress(index, decoded_seconds, transcribed_seconds)`` reports per
+    file, from the decoder thread as blocks arrive (throttled) and from the
+    calling thread after each group is transcribed. ``should_stop`` is
+    polled between blocks and groups; when it returns True the stream ends
+    with :class:`ImportCancelledError`.
+
+    With ``asr_scheduler`` each group is decoded as a separate job in the
+    import lane, yielding to more urgent work between segments.
+    """
+    from src.services.transcription_service import transcribe_speech
+
+    sample_rate = AudioConfig.DEFAULT_SAMPLE_RATE
+    items: queue.Queue[tuple[Any, ...] | None] = queue.Queue(maxsize=_QUEUE_SEGMENTS)
+    abandon = threading.Event()
+    lock = threading.Lock()
+    decoded: dict[int, int] = {}
+    transcribed: dict[int, int] = {}
+    stopped = should_stop or (lambda: False)
+
+    def _report(index: int) -> None:
+        if on_progress is None:
+            return
+        with lock:
+            done_decoding, done_transcribing = decoded.get(index, 0), transcribed.get(index, 0)
+        on_progress(index, done_decoding / sample_rate, done_transcribing / sample_rate)
+
+    def _put(item: tuple[Any, ...] | None) -> bool:
+        while not abandon.is_set() and not stopped():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decode_file(index: int, path: Path | str) -> bool:
+        stream = audio_pipeline.open_stream(max_segment_seconds=WINDOW_SECONDS)
+        last_report = 0.0
+        for block in iter_audio_file_blocks(path, sample_rate=sample_rate):
+            if abandon.is_set() or stopped():
+                return False
+            closed = stream.push(block)
+            with lock:
+                decoded[index] = decoded.get(index, 0) + len(block)
+            for segment in closed:
+                if not _put(("segment", index, segment)):
+                    return False
+            now = time.monotonic()
+            if now - last_report >= _PROGRESS_INTERVAL_S:
+                last_report = now
+                _report(index)
+        for segment in stream.finish():
+            if not _put(("segment", index, segment)):
+                return False
+        return _put(("end", index))
+
+    def _decode() -> None:
+        for index, path in enumerate(paths):
+            try:
+                if not _decode_file(index, path):
+                    return
+            except Exception as exc:  # handed to the consumer as this file's result
+                if not _put(("error", index, exc)):
+                    return
+        _put(None)
+
+    decoder = threading.Thread(target=_decode, daemon=True, name="audio-import-decode")
+    decoder.start()
+
+    group_samples = int(_group_seconds(settings) * sample_rate)
+    texts: list[str] = []
+    speech_ms = 0
+    transcription_ms = 0
+    group: list[SpeechSegment] = []
+    group_len = 0
+    failure: Exception | None = None
+
+    def _transcribe_group(index: int) -> None:
+        nonlocal group, group_len, speech_ms, transcription_ms
+        clean_audio, bounds = _assemble(group, audio_pipeline)
+        source_samples = group[-1].end - group[0].start
+        if asr_scheduler is None:
+            text, group_speech_ms, group_time_ms = transcribe_speech(
+                clean_audio,
+                settings,
+                local_model,
+                segment_bounds=bounds,
+                source_samples=source_samples,
+                post_process=False,
+            )
+        else:
+            from src.services.asr_scheduler import ASRJobPriority
+
+            text, group_speech_ms, group_time_ms = asr_scheduler.run(
+                lambda: transcribe_speech(
+                    clean_audio,
+                    settings,
+                    local_model,
+                    segment_bounds=bounds,
+                    source_samples=source_samples,
+                    between_segments=asr_scheduler.yield_to_urgent,
+                    post_process=False,
+                ),
+                priority=ASRJobPriority.IMPORT,
+                label=f"import {Path(paths[index]).name}",
+                audio_seconds=source_samples / sample_rate,
+            )
+        texts.append(text)
+        speech_ms += group_speech_ms
+        transcription_ms += group_time_ms
+        with lock:
+            transcribed[index] = group[-1].end
+        group, group_len = [], 0
+        _report(index)
+
+    def _finish_file(index: int) -> ImportTranscription | Exception:
+        nonlocal texts, speech_ms, transcription_ms, group, group_len, failure
+        try:
+            if failure is not None:
+                return failure
+            if group:
+                _transcribe_group(index)
+            with lock:
+                samples = decoded.get(index, 0)
+                transcribed[index] = samples
+            _report(index)
+            text = post_process_transcription(merge_segment_texts(texts), settings) if texts else ""
+            logger.info(
+                "Streamed import of %s: audio=%.1fs, groups=%d, speech=%dms, transcription=%dms",
+                Path(paths[index]).name,
+                samples / sample_rate,
+                len(texts),
+                speech_ms,
+                transcription_ms,
+            )
+            return ImportTranscription(
+                text=text,
+                speech_duration_ms=speech_ms,
+                transcription_time_ms=transcription_ms,
+                duration_ms=int(samples / sample_rate * 1000),
+            )
+        except Exception as exc:
+            return exc
+        finally:
+            texts, speech_ms, transcription_ms, group, group_len, failure = [], 0, 0, [], 0, None
+
+    try:
+        while True:
+            if stopped():
+                raise ImportCancelledError("Import cancelled")
+            try:
+                item = items.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is None:
+                return
+            kind, index = item[0], item[1]
+            if kind in ("end", "error"):
+                if kind == "error":
+                    failure = item[2]
+                yield index, _finish_file(index)
+                continue
+            if failure is not None:
+                continue  # this file already failed; skip to its end marker
+            segment = item[2]
+            try:
+                if group and group_len + len(segment.audio) > group_samples:
+                    _transcribe_group(index)
+            except Exception as exc:
+                failure = exc
+                continue
+            group.append(segment)
+            group_len += len(segment.audio)
+    finally:
+        abandon.set()
+        decoder.join(timeout=5.0)
+
+
+def transcribe_audio_file(
+    path: Path | str,
+    settings: VociferousSettings,
+    local_model: Any,
+    audio_pipeline: AudioPipeline,
+    *,
+    on_progress: ProgressCallback | None = None,
+    should_stop: Callable[[], bool] | None = None,
+    asr_scheduler: ASRScheduler | None = None,
+) -> ImportTranscription:
+    """Decode, segment and transcribe one file as a stream.
+
+    See :func:`transcribe_audio_files`; ``on_progress(decoded_seconds,
+    transcribed_seconds)`` drops the file index. Decode and transcription
+    errors are raised.
+    """
+    progress = (lambda _index, done, heard: on_progress(done, heard)) if on_progress is not None else None
+    for _, result in transcribe_audio_files(
+        [path],
+        settings,
+        local_model,
+        audio_pipeline,
+        on_progress=progress,
+        should_stop=should_stop,
+        asr_scheduler=asr_scheduler,
+    ):
+        if isinstance(result, Exception):
+            raise result
+        return result
+    raise ImportCancelledError("Import cancelled")
+
+
+__all__ = [
+    "BLOCK_SECONDS",
+    "ImportCancelledError",
+    "ImportTranscription",
+    "iter_audio_file_blocks",
+    "transcribe_audio_file",
+    "transcribe_audio_files",
+]
@@ -9,11 +9,16 @@ regions created by a gate are out-of-distribution — causing
 hallucinations, soft phoneme loss (/h/, /f/, /s/), and word-boundary
 truncation.  RMS normalization + 100 Hz highpass is sufficient signal
 sanitization.  Silero VAD handles speech/silence discrimination.
+
+:meth:`AudioPipeline.open_stream` runs the same stages block by block for
+audio that is too long to hold in memory (file imports), handing back each
+speech segment as soon as the silence after it closes it.
 """
 
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +31,16 @@ from src.core.resource_manager import ResourceManager
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class CleanSpeech:
+    """:meth:`AudioPipeline.process_speech` output."""
+
+    audio: NDArray[np.float32]
+    # (start, end) sample offsets of each speech segment in ``audio`` —
+    # where long uploads may be split without cutting words.
+    bounds: list[tuple[int, int]]
+
+
 class AudioPipeline:
     """Unified audio preprocessor: int16 in → clean float32 speech out.
 
@@ -120,6 +135,17 @@ class AudioPipeline:
         logger.info("Silero VAD model loaded from %s", model_path)
         return self._session
 
+    @property
+    def is_vad_loaded(self) -> bool:
+        return self._session is not None
+
+    def unload_vad_model(self) -> None:
+        """Drop the cached VAD session; the next use reloads it.
+
+        Open ``SpeechStream``s keep their own reference and finish normally.
+        """
+        self._session = None
+
     @staticmethod
     def _resolve_model_path() -> Path:
         cache_dir = ResourceManager.get_user_cache_dir("models")
@@ -158,6 +184,15 @@ class AudioPipeline:
 
         Returns None when no meaningful speech is detected.
         """
+        speech = self.process_speech(audio, sample_rate)
+        return speech.audio if speech is not None else None
+
+    def process_speech(
+        self,
+        audio: NDArray[np.int16],
+        sample_rate: int = 16000,
+    ) -> CleanSpeech | None:
+        """:meth:`process`, also returning where each speech segment sits in the output."""
         if audio.size == 0:
             return None
 
@@ -187,12 +222,16 @@ class AudioPipeline:
         # Stage 5: Extract speech segments (hysteresis + inter-segment silence)
         result = self._extract_speech(audio_f32, speech_probs)
 
-        if result is None or result.size == 0:
+        if result is None or result.audio.size == 0:
             logger.info("No speech segments after VAD processing")
             return None
 
         return result
 
+    def open_stream(self, *, max_segment_seconds: float = 30.0) -> SpeechStream:
+        """Start a block-by-block run of the pipeline (see :class:`SpeechStream`)."""
+        return SpeechStream(self, max_segment_seconds=max_segment_seconds)
+
     # ------------------------------------------------------------------
     # Pipeline stages
     # ------------------------------------------------------------------
@@ -268,7 +307,7 @@ class AudioPipeline:
         self,
         audio: NDArray[np.float32],
         speech_probs: list[float],
-    ) -> NDArray[np.float32] | None:
+    ) -> CleanSpeech | None:
         """Extract speech segments using VAD probabilities with hysteresis.
 
         Uses a two-threshold state machine: activation at _SPEECH_THRESHOLD,
@@ -345,6 +384,7 @@ class AudioPipeline:
         # Whisper uses silence duration to decide punctuation tokens.
         # Digital zero is out-of-distribution (trained on real noisy audio),
         # so we insert low-level Gaussian noise (~-80 dBFS) instead.
+        bounds: list[tuple[int, int]] = [(0, len(parts[0]))]
         if len(parts) > 1:
             silence_samples = int(self._INTER_SEGMENT_SILENCE_MS * self.sample_rate / 1000)
             rng = np.random.default_rng(42)
@@ -353,6 +393,8 @@ class AudioPipeline:
                 silence = rng.normal(0, 1e-4, silence_samples).astype(np.float32)
                 assembled.append(silence)
                 assembled.append(part)
+                offset = bounds[-1][1] + silence_samples
+                bounds.append((offset, offset + len(part)))
             result = np.concatenate(assembled)
         else:
             result = parts[0]
@@ -373,4 +415,214 @@ class AudioPipeline:
                 "s" if n_segs != 1 else "",
             )
 
-        return result
+        return CleanSpeech(result, bounds)
+
+
+@dataclass(frozen=True, slots=True)
+class SpeechSegment:
+    """A closed speech segment from a :class:`SpeechStream`."""
+
+    start: int  # sample offset in the source stream
+    audio: NDArray[np.float32]
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.audio)
+
+
+class SpeechStream:
+    """Incremental :class:`AudioPipeline` for audio pushed in blocks.
+
+    Runs the same stages as :meth:`AudioPipeline.process` — normalize,
+    highpass, Silero VAD, hysteresis, run merging and asymmetric padding —
+    carrying filter and VAD state across blocks. Only the audio a segment
+    may still need is retained, so memory stays bounded by
+    ``max_segment_seconds`` however long the stream runs.
+
+    Differences from the batch pipeline:
+      - RMS normalization uses the running RMS of the audio seen so far,
+        since the level of the whole recording is not known up front.
+      - A segment that reaches ``max_segment_seconds`` without a closing
+        pause is cut at the chunk with the lowest speech probability in
+        its last few seconds; the next piece starts at the cut, without
+        pre-roll.
+      - Segments are returned individually (with their source offsets)
+        rather than assembled with inter-segment silence.
+    """
+
+    _SPLIT_SEARCH_SECONDS: float = 5.0
+
+    def __init__(self, pipeline: AudioPipeline, *, max_segment_seconds: float = 30.0) -> None:
+        self._pipeline = pipeline
+        self._session = pipeline._load_vad_model()
+        self._chunk = pipeline._CHUNK_SIZE
+        chunks_per_second = pipeline.sample_rate / self._chunk
+        self._max_chunks = max(pipeline._MIN_SPEECH_CHUNKS + 1, int(max_segment_seconds * chunks_per_second))
+        self._search_chunks = min(self._max_chunks - 1, int(self._SPLIT_SEARCH_SECONDS * chunks_per_second))
+        self._sr = np.array(pipeline.sample_rate, dtype=np.int64)
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+
+        self._sum_squares = 0.0
+        self._samples_seen = 0
+        self._hp_prev_in: float | None = None
+        self._hp_prev_out = 0.0
+        self._pending = np.empty(0, dtype=np.float32)  # filtered samples short of a whole chunk
+
+        # Filtered audio and VAD probabilities retained from chunk _base on.
+        self._base = 0
+        self._buffer = np.empty(0, dtype=np.float32)
+        self._probs: list[float] = []
+        self._n_chunks = 0
+
+        self._in_speech = False
+        self._run_start: int | None = None  # first chunk of the speech run in progress
+        self._segment: list[int] | None = None  # [start, end) chunks of the open merged segment
+        self._floor = 0  # nothing before this chunk is emitted again
+
+    def push(self, block: NDArray[np.int16]) -> list[SpeechSegment]:
+        """Feed the next block of int16 audio; return segments it closed."""
+        if block.size == 0:
+            return []
+        audio = block.astype(np.float32) / 32768.0
+        self._sum_squares += float(np.dot(audio, audio))
+        self._samples_seen += len(audio)
+        rms = (self._sum_squares / self._samples_seen) ** 0.5
+        if rms >= 1e-8:
+            gain = min(self._pipeline._TARGET_RMS / rms, 10.0)
+            audio = np.clip(audio * gain, -1.0, 1.0).astype(np.float32)
+        audio = np.concatenate([self._pending, self._highpass(audio)])
+
+        whole = len(audio) // self._chunk * self._chunk
+        self._pending = audio[whole:].copy()
+        audio = audio[:whole]
+        self._buffer = np.concatenate([self._buffer, audio])
+
+        closed: list[SpeechSegment] = []
+        for offset in range(0, whole, self._chunk):
+            output, self._state = self._session.run(
+                None,
+                {"input": audio[offset : offset + self._chunk].reshape(1, -1), "state": self._state, "sr": self._sr},
+            )
+            self._step(float(output[0][0]), closed)
+        self._trim()
+        return closed
+
+    def finish(self) -> list[SpeechSegment]:
+        """End the stream; return the segments still open.
+
+        Samples short of a whole 32 ms chunk are dropped, as in the batch
+        pipeline.
+        """
+        closed: list[SpeechSegment] = []
+        if self._run_start is not None:
+            self._close_run(self._run_start, self._n_chunks, closed)
+            self._run_start = None
+        if self._segment is not None:
+            start, end = self._segment
+            self._emit(start, end + self._pipeline._POST_SPEECH_PAD_CHUNKS, closed)
+            self._segment = None
+        self._buffer = np.empty(0, dtype=np.float32)
+        self._probs = []
+        self._base = self._n_chunks
+        return closed
+
+    # ------------------------------------------------------------------
+
+    def _highpass(self, audio: NDArray[np.float32]) -> NDArray[np.float32]:
+        """:meth:`AudioPipeline._highpass`, continuing from the previous block."""
+        alpha = self._pipeline._hp_alpha
+        out = np.empty(len(audio), dtype=np.float32)
+        prev_in = self._hp_prev_in
+        prev_out = self._hp_prev_out
+        for i in range(len(audio)):
+            x = float(audio[i])
+            prev_out = x if prev_in is None else alpha * (prev_out + x - prev_in)
+            out[i] = prev_out
+            prev_in = x
+        self._hp_prev_in = prev_in
+        self._hp_prev_out = prev_out
+        return out
+
+    def _step(self, prob: float, closed: list[SpeechSegment]) -> None:
+        """Advance the hysteresis / merge state machine by one chunk."""
+        pipeline = self._pipeline
+        index = self._n_chunks
+        self._n_chunks += 1
+        self._probs.append(prob)
+
+        threshold = pipeline._SPEECH_EXIT_THRESHOLD if self._in_speech else pipeline._SPEECH_THRESHOLD
+        self._in_speech = prob >= threshold
+        if self._in_speech:
+            if self._run_start is None:
+                self._run_start = index
+        elif self._run_start is not None:
+            self._close_run(self._run_start, index, closed)
+            self._run_start = None
+
+        segment = self._segment
+        if segment is not None:
+            # A run in progress close enough to the segment could still merge into it.
+            may_merge = self._run_start is not None and self._run_start - segment[1] <= pipeline._MIN_SILENCE_CHUNKS
+            if not may_merge and self._n_chunks - segment[1] > pipeline._MIN_SILENCE_CHUNKS:
+                self._emit(segment[0], segment[1] + pipeline._POST_SPEECH_PAD_CHUNKS, closed)
+                self._segment = None
+
+        while (span := self._open_span_start()) is not None and self._n_chunks - span >= self._max_chunks:
+            self._split(span, closed)
+
+    def _close_run(self, start: int, end: int, closed: list[SpeechSegment]) -> None:
+        pipeline = self._pipeline
+        if end - start < pipeline._MIN_SPEECH_CHUNKS:
+            return
+        segment = self._segment
+        if segment is not None and start - segment[1] <= pipeline._MIN_SILENCE_CHUNKS:
+            segment[1] = end
+            return
+        if segment is not None:
+            self._emit(segment[0], segment[1] + pipeline._POST_SPEECH_PAD_CHUNKS, closed)
+        self._segment = [start, end]
+
+    def _open_span_start(self) -> int | None:
+        """First chunk of speech not yet emitted, or None when nothing is open."""
+        if self._segment is not None:
+            return max(self._floor, self._segment[0])
+        if self._run_start is not None:
+            return max(self._floor, self._run_start)
+        return None
+
+    def _split(self, span: int, closed: list[SpeechSegment]) -> None:
+        """Cut an over-long open segment at its least speech-like chunk."""
+        limit = span + self._max_chunks
+        lo = limit - self._search_chunks
+        window = self._probs[lo - self._base : limit - self._base]
+        cut = lo + int(np.argmin(window)) + 1 if window else limit
+        start = self._segment[0] if self._segment is not None else self._run_start
+        self._emit(start if start is not None else span, cut, closed)
+        if self._segment is not None and self._segment[1] <= cut:
+            self._segment = None
+
+    def _emit(self, start: int, end: int, closed: list[SpeechSegment]) -> None:
+        """Emit chunks ``[start - pre-roll, end)``, never reaching back before the floor."""
+        lo = max(self._floor, start - self._pipeline._PRE_SPEECH_PAD_CHUNKS)
+        hi = min(self._n_chunks, end)
+        if hi <= lo:
+            return
+        chunk = self._chunk
+        audio = self._buffer[(lo - self._base) * chunk : (hi - self._base) * chunk].copy()
+        closed.append(SpeechSegment(start=lo * chunk, audio=audio))
+        self._floor = hi
+
+    def _trim(self) -> None:
+        """Drop audio and probabilities no future segment can reach."""
+        if self._segment is not None:
+            first = self._segment[0]
+        elif self._run_start is not None:
+            first = self._run_start
+        else:
+            first = self._n_chunks
+        keep = max(self._base, self._floor, first - self._pipeline._PRE_SPEECH_PAD_CHUNKS)
+        drop = keep - self._base
+        if drop > 0:
+            self._buffer = self._buffer[drop * self._chunk :]
+            del self._probs[:drop]
+            self._base = keep
@@ -0,0 +1,664 @@
+"""
+Hardware calibration — per-machine CPU thread counts and compute types.
+
+Sweeps CPU thread counts and compute types for the local Whisper model (ASR)
+and the CTranslate2 generator (SLM) on short fixed inputs, picks the knee of
+the throughput curve and stores the result as a profile keyed by CPU model and
+model id in ``<data_dir>/calibration.json``.
+
+Settings opt in with sentinels: ``n_threads = 0`` ("auto (calibrated)") and
+``model.compute_type = "auto"``. ``describe_asr_runtime`` and
+``describe_refinement_runtime`` resolve them through ``resolve_cpu_runtime``;
+without a profile they fall back to the previous fixed defaults.
+
+The sweep is a coordinate descent rather than a full grid: thread counts are
+swept with int8, then the compute types at the chosen thread count. Each
+configuration loads the model once (CTranslate2 fixes the thread pool at load
+time), so a full grid would triple the cost for little gain — the thread knee
+barely moves between compute types.
+
+Sweeps run only when the user asks for one (``POST /api/calibration`` or the
+``calibrate`` CLI command). In the app, the resident copy of the model is
+unloaded for each measurement, so only one copy is in memory, and it is
+reloaded once the sweep ends. A measurement stops as soon as more urgent work
+is queued and is retried after that work.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.core.resource_manager import ResourceManager
+
+if TYPE_CHECKING:
+    from src.core.settings import VociferousSettings
+    from src.services.asr_scheduler import ASRScheduler
+    from src.services.model_residency import ModelResidencyManager
+    from src.services.slm_scheduler import SLMScheduler
+
+logger = logging.getLogger(__name__)
+
+ASR = "asr"
+SLM = "slm"
+KINDS = (ASR, SLM)
+
+# ``model.compute_type`` value that defers to the calibrated profile.
+AUTO_COMPUTE_TYPE = "auto"
+# Compute types CTranslate2 runs natively on x86/ARM CPUs, in tie-break order.
+CPU_COMPUTE_TYPES = ("int8", "int8_float32", "float32")
+FALLBACK_COMPUTE_TYPE = "int8"
+# Fallback ASR thread count when ``model.n_threads`` is auto but no profile exists.
+FALLBACK_ASR_THREADS = 4
+
+_THREAD_LADDER = (1, 2, 4, 6, 8, 12, 16)
+# Smallest thread count reaching this share of the best throughput is the knee.
+_KNEE_FRACTION = 0.9
+# Compute types within this share of the fastest count as a tie.
+_COMPUTE_TYPE_TOLERANCE = 0.05
+
+_PROFILE_FILENAME = "calibration.json"
+
+# ~15 s of fixture audio: long enough that the encoder dominates, as it does
+# for real dictation, short enough that a full sweep finishes in a minute or two.
+_ASR_FIXTURE_SECONDS = 15.0
+_ASR_FIXTURE_MAX_TOKENS = 48
+_SLM_FIXTURE_TEXT = (
+    "so um basically what we need to do is uh take the quarterly numbers and "
+    "put them in the report before friday and then send it to the team so they "
+    "can review it over the weekend and um let me know if theres any problems "
+    "with the formatting or the charts because last time the legend was cut off"
+)
+
+# Timed runs per configuration, after one untimed warm-up run.
+_REPEATS = 2
+
+
+class MeasurementPreempted(Exception):
+    """A measurement stopped early because more urgent work is waiting."""
+
+
+@functools.lru_cache(maxsize=1)
+def cpu_model() -> str:
+    """CPU model name used to key profiles (cached; hardware does not change at runtime)."""
+    from src.core.log_manager import _detect_cpu_details
+
+    details = _detect_cpu_details()
+    return f"{details.get('model') or 'unknown'} ({details.get('logical_cores') or 0} threads)"
+
+
+def thread_candidates(logical_cores: int | None = None) -> list[int]:
+    """Thread counts to sweep: a coarse ladder capped at the logical core count."""
+    logical = logical_cores or os.cpu_count() or 4
+    candidates = [n for n in _THREAD_LADDER if n <= logical]
+    if logical not in candidates and logical < _THREAD_LADDER[-1]:
+        candidates.append(logical)
+    return candidates
+
+
+def pick_knee(throughput: Mapping[int, float], *, fraction: float = _KNEE_FRACTION) -> int:
+    """Smallest thread count whose throughput is within ``fraction`` of the best.
+
+    Beyond the knee extra threads buy little and steal cores from the UI,
+    audio pipeline and the other model.
+    """
+    if not throughput:
+        raise ValueError("No throughput samples to pick from.")
+    best = max(throughput.values())
+    return min(threads for threads, value in throughput.items() if value >= best * fraction)
+
+
+def pick_compute_type(throughput: Mapping[str, float]) -> str:
+    """Fastest compute type; near-ties go to the earlier (cheaper) entry of ``CPU_COMPUTE_TYPES``."""
+    if not throughput:
+        raise ValueError("No throughput samples to pick from.")
+    best = max(throughput.values())
+    ordered = sorted(
+        throughput, key=lambda ct: CPU_COMPUTE_TYPES.index(ct) if ct in CPU_COMPUTE_TYPES else len(CPU_COMPUTE_TYPES)
+    )
+    return next(ct for ct in ordered if throughput[ct] >= best * (1 - _COMPUTE_TYPE_TOLERANCE))
+
+
+@dataclass(slots=True)
+class CalibrationProfile:
+    """Chosen CPU runtime for one model on one machine, plus the sweep behind it."""
+
+    kind: str
+    model_id: str
+    cpu_model: str
+    threads: int
+    compute_type: str
+    # "rtf" for ASR (lower is better), "tokens_per_second" for SLM.
+    metric: str
+    value: float
+    samples: list[dict[str, Any]] = field(default_factory=list)
+    calibrated_at: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> CalibrationProfile:
+        return cls(
+            kind=str(data["kind"]),
+            model_id=str(data["model_id"]),
+            cpu_model=str(data["cpu_model"]),
+            threads=int(data["threads"]),
+            compute_type=str(data["compute_type"]),
+            metric=str(data.get("metric", "")),
+            value=float(data.get("value", 0.0)),
+            samples=list(data.get("samples", [])),
+            calibrated_at=float(data.get("calibrated_at", 0.0)),
+        )
+
+
+def sweep(
+    kind: str,
+    model_id: str,
+    measure: Callable[[int, str], float],
+    *,
+    threads: Iterable[int] | None = None,
+    compute_types: Iterable[str] = CPU_COMPUTE_TYPES,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> CalibrationProfile:
+    """Calibrate one model with ``measure(threads, compute_type)``.
+
+    ``measure`` returns the ASR real-time factor or SLM tokens per second.
+    A configuration that fails to load or run (e.g. a compute type the CPU
+    lacks) is logged and skipped.
+    """
+    metric = "rtf" if kind == ASR else "tokens_per_second"
+    samples: list[dict[str, Any]] = []
+
+    def _throughput(value: float) -> float:
+        return 1.0 / value if metric == "rtf" else value
+
+    def _run(n_threads: int, compute_type: str) -> float | None:
+        if should_stop():
+            raise InterruptedError("Calibration stopped.")
+        try:
+            value = float(measure(n_threads, compute_type))
+        except Exception as exc:
+            logger.info(
+                "Calibration %s %s threads=%d compute_type=%s failed: %s", kind, model_id, n_threads, compute_type, exc
+            )
+            return None
+        if value <= 0:
+            return None
+        samples.append({"threads": n_threads, "compute_type": compute_type, metric: round(value, 4)})
+        logger.info(
+            "Calibration %s %s threads=%d compute_type=%s %s=%.3f",
+            kind,
+            model_id,
+            n_threads,
+            compute_type,
+            metric,
+            value,
+        )
+        return value
+
+    base_type = FALLBACK_COMPUTE_TYPE
+    by_threads: dict[int, float] = {}
+    by_threads_raw: dict[int, float] = {}
+    for n_threads in threads or thread_candidates():
+        value = _run(n_threads, base_type)
+        if value is not None:
+            by_threads[n_threads] = _throughput(value)
+            by_threads_raw[n_threads] = value
+    if not by_threads:
+        raise RuntimeError(f"Calibration of {kind} model {model_id} produced no measurements.")
+    knee = pick_knee(by_threads)
+
+    by_type: dict[str, float] = {base_type: by_threads[knee]}
+    by_type_raw: dict[str, float] = {base_type: by_threads_raw[knee]}
+    for compute_type in compute_types:
+        if compute_type == base_type:
+            continue
+        value = _run(knee, compute_type)
+        if value is not None:
+            by_type[compute_type] = _throughput(value)
+            by_type_raw[compute_type] = value
+    chosen = pick_compute_type(by_type)
+
+    return CalibrationProfile(
+        kind=kind,
+        model_id=model_id,
+        cpu_model=cpu_model(),
+        threads=knee,
+        compute_type=chosen,
+        metric=metric,
+        value=round(by_type_raw[chosen], 4),
+        samples=samples,
+        calibrated_at=time.time(),
+    )
+
+
+class CalibrationStore:
+    """JSON file of calibration profiles keyed by CPU model, kind and model id."""
+
+    def __init__(self, path: Path | str) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._cache: tuple[float, dict[str, CalibrationProfile]] | None = None
+
+    @classmethod
+    def open_default(cls) -> CalibrationStore:
+        """Store in the user data directory (profiles are not disposable cache)."""
+        return cls(ResourceManager.get_user_data_dir() / _PROFILE_FILENAME)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @staticmethod
+    def _key(cpu: str, kind: str, model_id: str) -> str:
+        return f"{cpu}|{kind}|{model_id}"
+
+    def _load(self) -> dict[str, CalibrationProfile]:
+        try:
+            mtime = self._path.stat().st_mtime
+        except OSError:
+            return {}
+        if self._cache is not None and self._cache[0] == mtime:
+            return self._cache[1]
+        profiles: dict[str, CalibrationProfile] = {}
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            for key, data in (raw.get("profiles") or {}).items():
+                profiles[key] = CalibrationProfile.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable calibration profile file %s", self._path, exc_info=True)
+            profiles = {}
+        self._cache = (mtime, profiles)
+        return profiles
+
+    def get(self, kind: str, model_id: str, *, cpu: str | None = None) -> CalibrationProfile | None:
+        with self._lock:
+            return self._load().get(self._key(cpu or cpu_model(), kind, model_id))
+
+    def put(self, profile: CalibrationProfile) -> None:
+        with self._lock:
+            profiles = dict(self._load())
+            profiles[self._key(profile.cpu_model, profile.kind, profile.model_id)] = profile
+            payload = {"version": 1, "profiles": {key: p.to_dict() for key, p in profiles.items()}}
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self._path)
+            self._cache = None
+
+    def profiles(self, *, cpu: str | None = None) -> list[CalibrationProfile]:
+        """Profiles for this machine (or ``cpu``), ASR first."""
+        wanted = cpu or cpu_model()
+        with self._lock:
+            found = [p for p in self._load().values() if p.cpu_model == wanted]
+        return sorted(found, key=lambda p: (KINDS.index(p.kind) if p.kind in KINDS else len(KINDS), p.model_id))
+
+
+def resolve_cpu_runtime(
+    kind: str,
+    model_id: str,
+    n_threads: int,
+    compute_type: str,
+    *,
+    fallback_threads: int,
+    store: CalibrationStore | None = None,
+) -> tuple[int, str, str]:
+    """Resolve the auto sentinels to ``(threads, compute_type, source)``.
+
+    ``source`` is "configured" when neither setting is auto, "calibrated"
+    when a profile supplied an auto value, and "default" when auto had no
+    profile to read.
+    """
+    wants_threads = n_threads <= 0
+    wants_type = compute_type == AUTO_COMPUTE_TYPE
+    if not wants_threads and not wants_type:
+        return n_threads, compute_type, "configured"
+
+    profile = None
+    try:
+        profile = (store or CalibrationStore.open_default()).get(kind, model_id)
+    except Exception:
+        logger.debug("Calibration profile lookup failed", exc_info=True)
+    if profile is None:
+        return (
+            fallback_threads if wants_threads else n_threads,
+            FALLBACK_COMPUTE_TYPE if wants_type else compute_type,
+            "default",
+        )
+    return (
+        profile.threads if wants_threads else n_threads,
+        profile.compute_type if wants_type else compute_type,
+        "calibrated",
+    )
+
+
+def wants_calibration(settings: VociferousSettings, kind: str) -> bool:
+    """True when ``kind`` runs locally and one of its CPU settings is auto."""
+    auto_type = settings.model.compute_type == AUTO_COMPUTE_TYPE
+    if kind == ASR:
+        return settings.model.provider == "local_faster_whisper" and (settings.model.n_threads <= 0 or auto_type)
+    return (
+        settings.refinement.enabled
+        and settings.refinement.provider == "local_ct2"
+        and bool(settings.refinement.model_id)
+        and (settings.refinement.n_threads <= 0 or auto_type)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Measurements
+# ---------------------------------------------------------------------------
+
+
+def _asr_fixture(sample_rate: int = 16_000) -> np.ndarray:
+    """Deterministic speech-like audio: voiced harmonic bursts separated by pauses."""
+    t = np.arange(int(_ASR_FIXTURE_SECONDS * sample_rate), dtype=np.float32) / sample_rate
+    pitch = 140.0 + 25.0 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    syllables = np.clip(np.sin(2 * np.pi * 3.0 * t), 0.0, None) * (np.sin(2 * np.pi * 0.25 * t) > -0.6)
+    noise = np.random.default_rng(0).normal(0.0, 0.01, t.shape)
+    return (0.3 * voice * syllables + noise).astype(np.float32)
+
+
+def _check_stop(should_stop: Callable[[], bool] | None) -> None:
+    if should_stop is not None and should_stop():
+        raise MeasurementPreempted("Calibration measurement stopped for urgent work.")
+
+
+def asr_measure(
+    settings: VociferousSettings, *, should_stop: Callable[[], bool] | None = None
+) -> Callable[[int, str], float]:
+    """``measure(threads, compute_type) -> RTF`` for the configured Whisper model on CPU.
+
+    ``should_stop`` is polled before the model loads and before each run;
+    when it returns True the measurement raises ``MeasurementPreempted``.
+    """
+    from faster_whisper import WhisperModel
+
+    from src.services.transcription_service import _resolve_model_path
+
+    model_dir = str(_resolve_model_path(settings))
+    audio = _asr_fixture()
+    language = settings.model.language or "en"
+
+    def _measure(n_threads: int, compute_type: str) -> float:
+        _check_stop(should_stop)
+        model = WhisperModel(
+            model_dir, device="cpu", cpu_threads=n_threads, compute_type=compute_type, local_files_only=True
+        )
+        try:
+            timings = []
+            for _ in range(_REPEATS + 1):  # first run warms caches and allocators
+                _check_stop(should_stop)
+                start = time.perf_counter()
+                segments, _ = model.transcribe(
+                    audio,
+                    language=language,
+                    beam_size=1,
+                    temperature=0.0,
+                    condition_on_previous_text=False,
+                    without_timestamps=True,
+                    max_new_tokens=_ASR_FIXTURE_MAX_TOKENS,
+                    vad_filter=False,
+                )
+                for _segment in segments:
+                    pass
+                timings.append(time.perf_counter() - start)
+            return float(np.median(timings[1:])) / _ASR_FIXTURE_SECONDS
+        finally:
+            del model
+
+    return _measure
+
+
+def slm_measure(
+    settings: VociferousSettings, *, should_stop: Callable[[], bool] | None = None
+) -> Callable[[int, str], float]:
+    """``measure(threads, compute_type) -> tokens/s`` for the configured CT2 generator on CPU.
+
+    ``should_stop`` is polled before the model loads and during generation;
+    when it returns True the measurement raises ``MeasurementPreempted``.
+    """
+    from src.core.model_registry import get_slm_model
+    from src.refinement.engine import GenerationCancelled, RefinementEngine
+    from src.refinement.providers.local_ct2 import LocalCT2RefinementProvider
+
+    model = get_slm_model(settings.refinement.model_id)
+    if model is None:
+        raise ValueError(f"Unknown SLM model_id: {settings.refinement.model_id}")
+    model_dir = LocalCT2RefinementProvider._model_dir(ResourceManager.get_user_cache_dir("models"), model)
+    if not (model_dir / model.model_file).exists():
+        raise FileNotFoundError(f"CT2 model directory not found: {model_dir}")
+
+    def _measure(n_threads: int, compute_type: str) -> float:
+        _check_stop(should_stop)
+        engine = RefinementEngine(
+            model_path=model_dir,
+            system_prompt=settings.refinement.system_prompt,
+            invariants=settings.refinement.invariants,
+            n_gpu_layers=0,
+            n_threads=n_threads,
+            compute_type=compute_type,
+        )
+        try:
+            rates = []
+            for _ in range(_REPEATS + 1):
+                start = time.perf_counter()
+                try:
+                    result = engine.refine(
+                        _SLM_FIXTURE_TEXT, temperature=0.0, top_k=1, allow_skip=False, should_cancel=should_stop
+                    )
+                except GenerationCancelled as exc:
+                    raise MeasurementPreempted("Calibration measurement stopped for urgent work.") from exc
+                elapsed = time.perf_counter() - start
+                rates.append(result.completion_tokens / elapsed if elapsed > 0 else 0.0)
+            return float(np.median(rates[1:]))
+        finally:
+            try:
+                engine.generator.unload_model()
+            except Exception:
+                logger.debug("CT2 Generator.unload_model() failed (non-fatal)")
+
+    return _measure
+
+
+def _model_id(settings: VociferousSettings, kind: str) -> str:
+    return settings.model.model if kind == ASR else settings.refinement.model_id
+
+
+# ---------------------------------------------------------------------------
+# Background calibrator
+# ---------------------------------------------------------------------------
+
+
+class HardwareCalibrator:
+    """Runs calibration sweeps on a background thread, when asked to.
+
+    Each measurement is queued on the ASR or SLM scheduler at its lowest
+    priority and stops as soon as dictation or interactive refinement is
+    queued behind it; it runs again once that work is done. With a
+    residency manager the resident model is unloaded for each measurement
+    and reloaded after the sweep.
+    """
+
+    def __init__(
+        self,
+        *,
+        settings_provider: Callable[[], VociferousSettings],
+        store: CalibrationStore,
+        asr_scheduler: ASRScheduler | None = None,
+        slm_scheduler: SLMScheduler | None = None,
+        residency: ModelResidencyManager | None = None,
+        shutdown_event: threading.Event | None = None,
+    ) -> None:
+        self._settings_provider = settings_provider
+        self._store = store
+        self._asr_scheduler = asr_scheduler
+        self._slm_scheduler = slm_scheduler
+        self._residency = residency
+        self._shutdown_event = shutdown_event or threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._running: list[str] = []
+        self._current: str | None = None
+        self._errors: dict[str, str] = {}
+
+    @property
+    def store(self) -> CalibrationStore:
+        return self._store
+
+    def is_running(self) -> bool:
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def start(self, kinds: Iterable[str] = KINDS) -> bool:
+        """Calibrate ``kinds`` in the background; False if a run is already active."""
+        targets = [kind for kind in KINDS if kind in set(kinds)]
+        with self._lock:
+            if not targets or (self._thread is not None and self._thread.is_alive()):
+                return False
+            self._running = targets
+            self._errors = {}
+            self._thread = threading.Thread(target=self._run, args=(targets,), daemon=True, name="hardware-calibration")
+            self._thread.start()
+        return True
+
+    def missing(self) -> list[str]:
+        """Models whose settings ask for auto and that have no profile yet (the UI offers to calibrate them)."""
+        settings = self._settings_provider()
+        return [
+            kind
+            for kind in KINDS
+            if wants_calibration(settings, kind) and self._store.get(kind, _model_id(settings, kind)) is None
+        ]
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            running = self._thread is not None and self._thread.is_alive()
+            payload: dict[str, Any] = {
+                "running": running,
+                "pending": list(self._running) if running else [],
+                "current": self._current if running else None,
+                "errors": dict(self._errors),
+            }
+        payload["cpu_model"] = cpu_model()
+        payload["profiles"] = [p.to_dict() for p in self._store.profiles()]
+        payload["missing"] = self.missing()
+        return payload
+
+    def _run(self, kinds: list[str]) -> None:
+        for kind in kinds:
+            if self._shutdown_event.is_set():
+                break
+            settings = self._settings_provider()
+            model_id = _model_id(settings, kind)
+            with self._lock:
+                self._current = kind
+            try:
+                profile = sweep(kind, model_id, self._measure(kind, settings), should_stop=self._shutdown_event.is_set)
+                self._store.put(profile)
+                logger.info(
+                    "Calibrated %s model %s: threads=%d compute_type=%s (%s=%.3f)",
+                    kind,
+                    model_id,
+                    profile.threads,
+                    profile.compute_type,
+                    profile.metric,
+                    profile.value,
+                )
+            except InterruptedError:
+                break
+            except Exception as exc:
+                logger.warning("Calibration of %s model %s failed: %s", kind, model_id, exc)
+                with self._lock:
+                    self._errors[kind] = str(exc)
+            finally:
+                if self._residency is not None:
+                    self._residency.prefetch(kind)
+                with self._lock:
+                    if kind in self._running:
+                        self._running.remove(kind)
+        with self._lock:
+            self._current = None
+            self._running = []
+
+    def _measure(self, kind: str, settings: VociferousSettings) -> Callable[[int, str], float]:
+        """``measure`` for ``kind``, each configuration run as one low-priority scheduler job."""
+        if kind == ASR:
+            asr_scheduler = self._asr_scheduler
+            if asr_scheduler is None:
+                return asr_measure(settings)
+            from src.services.asr_scheduler import ASRJobPriority
+
+            measure = asr_measure(settings, should_stop=asr_scheduler.urgent_pending)
+
+            def run_asr(n: int, ct: str) -> float:
+                # The ASR scheduler cannot requeue a job, so a preempted
+                # measurement is queued again behind the urgent work.
+                while True:
+                    try:
+                        return asr_scheduler.run(
+                            lambda: self._unloading_resident(ASR, lambda: measure(n, ct)),
+                            priority=ASRJobPriority.IMPORT,
+                            label=f"calibrate-asr-{n}-{ct}",
+                        )
+                    except MeasurementPreempted:
+                        logger.info("Calibration asr threads=%d compute_type=%s yielded to urgent work", n, ct)
+
+            return run_asr
+
+        slm_scheduler = self._slm_scheduler
+        if slm_scheduler is None:
+            return slm_measure(settings)
+        from src.services.slm_scheduler import SLMJobPreempted, SLMJobPriority
+
+        measure = slm_measure(settings, should_stop=slm_scheduler.preempt_requested)
+
+        def slm_job(n: int, ct: str) -> float:
+            try:
+                return self._unloading_resident(SLM, lambda: measure(n, ct))
+            except MeasurementPreempted as exc:
+                raise SLMJobPreempted() from exc  # the scheduler requeues it
+
+        return lambda n, ct: slm_scheduler.submit(
+            lambda: slm_job(n, ct), priority=SLMJobPriority.BULK, label=f"calibrate-slm-{n}-{ct}", preemptible=True
+        ).result()
+
+    def _unloading_resident(self, kind: str, measure: Callable[[], float]) -> float:
+        """Run ``measure`` with the resident copy of the model unloaded (reloaded after the sweep)."""
+        if self._residency is not None:
+            self._residency.evict(kind, reason="calibration", check_busy=False)
+        return measure()
+
+
+__all__ = [
+    "ASR",
+    "AUTO_COMPUTE_TYPE",
+    "CPU_COMPUTE_TYPES",
+    "CalibrationProfile",
+    "CalibrationStore",
+    "HardwareCalibrator",
+    "MeasurementPreempted",
+    "SLM",
+    "asr_measure",
+    "cpu_model",
+    "pick_compute_type",
+    "pick_knee",
+    "resolve_cpu_runtime",
+    "slm_measure",
+    "sweep",
+    "thread_candidates",
+    "wants_calibration",
+]
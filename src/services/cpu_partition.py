@@ -0,0 +1,386 @@
+"""
+CPU core partitioning between Whisper (ASR), the local SLM and the app.
+
+With auto-refine on, the SLM refines transcript N while Whisper decodes
+transcript N+1. Each engine sizes its intra-op thread pool against the
+whole machine, so running both at once oversubscribes the CPU. Both
+engines slow down, and so do the audio callback and the API server.
+
+With ``cpu.partition`` on (it is off by default), ``plan_partition`` turns
+the ``cpu`` settings into disjoint core sets:
+
+* ``reserved_cores`` physical cores (the lowest numbered) are kept out of
+  both engines for the audio callback, the API server and the UI;
+* when both engines run on the CPU, the rest is split by ``asr_share``,
+  whole physical cores at a time so SMT siblings stay together;
+* an engine alone on the CPU gets every non-reserved core.
+
+``describe_asr_runtime`` and ``describe_refinement_runtime`` cap their
+thread counts at the physical cores in the engine's set
+(``partition_threads``).
+
+``CorePartitioner`` applies the plan with ``os.sched_setaffinity`` (Linux):
+
+* Models load under ``pinned_load(role)``. CTranslate2 creates its pool
+  threads during the load, so they inherit the mask, and their thread ids
+  are recorded.
+* Inference runs under ``engine_busy(role)``. While only one engine is
+  busy, its threads are widened to every non-reserved core. They are
+  narrowed back as soon as the other engine starts. Pool sizes are fixed at
+  load, so this only rebalances placement.
+* Worker processes (``src.services.inference_worker``) are pinned whole
+  through ``adopt_process``.
+
+Where affinity is not available the thread caps still apply. Without an
+installed partitioner (tests, tools) the helpers do nothing.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.core.cuda_runtime import CudaRuntimeStatus, detect_cuda_runtime
+
+if TYPE_CHECKING:
+    from src.core.settings import VociferousSettings
+
+logger = logging.getLogger(__name__)
+
+ASR = "asr"
+SLM = "slm"
+ROLES = (ASR, SLM)
+
+_SYSFS_CPU = Path("/sys/devices/system/cpu")
+
+
+def affinity_supported() -> bool:
+    return hasattr(os, "sched_setaffinity") and Path("/proc/self/task").is_dir()
+
+
+def _parse_cpu_list(text: str) -> tuple[int, ...]:
+    """Parse a sysfs CPU list such as ``0-3,8,10-11``."""
+    cpus: list[int] = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        cpus.extend(range(int(lo), int(hi or lo) + 1))
+    return tuple(cpus)
+
+
+@functools.lru_cache(maxsize=1)
+def physical_cores() -> tuple[tuple[int, ...], ...]:
+    """CPUs this process may use, grouped by physical core and ordered by first CPU."""
+    if hasattr(os, "sched_getaffinity"):
+        usable = sorted(os.sched_getaffinity(os.getpid()))  # the main thread is never pinned
+    else:
+        usable = list(range(os.cpu_count() or 1))
+    groups: dict[tuple[int, ...], list[int]] = {}
+    for cpu in usable:
+        try:
+            siblings = _parse_cpu_list((_SYSFS_CPU / f"cpu{cpu}/topology/thread_siblings_list").read_text())
+        except (OSError, ValueError):
+            siblings = (cpu,)
+        groups.setdefault(siblings or (cpu,), []).append(cpu)
+    return tuple(sorted((tuple(cpus) for cpus in groups.values()), key=lambda cpus: cpus[0]))
+
+
+@dataclass(frozen=True, slots=True)
+class CorePlan:
+    """CPU sets per engine. An empty set leaves that engine unpinned."""
+
+    asr: tuple[int, ...] = ()
+    slm: tuple[int, ...] = ()
+    reserved: tuple[int, ...] = ()
+    # Physical cores behind each set (the thread cap).
+    asr_cores: int = 0
+    slm_cores: int = 0
+
+    @property
+    def split(self) -> bool:
+        """Both engines on the CPU, on disjoint sets."""
+        return bool(self.asr and self.slm)
+
+    @property
+    def shared(self) -> tuple[int, ...]:
+        """Every non-reserved CPU: where a lone busy engine may spread."""
+        return tuple(sorted({*self.asr, *self.slm}))
+
+    def cpus(self, role: str) -> tuple[int, ...]:
+        return self.asr if role == ASR else self.slm
+
+    def cores(self, role: str) -> int:
+        return self.asr_cores if role == ASR else self.slm_cores
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "asr": list(self.asr),
+            "slm": list(self.slm),
+            "reserved": list(self.reserved),
+            "asr_cores": self.asr_cores,
+            "slm_cores": self.slm_cores,
+            "split": self.split,
+        }
+
+
+def engines_on_cpu(settings: VociferousSettings, cuda_status: CudaRuntimeStatus) -> set[str]:
+    """Which local engines will run on the CPU with these settings."""
+    on_cpu: set[str] = set()
+    device = (settings.model.device or "auto").strip().lower()
+    if settings.model.provider == "local_faster_whisper" and (
+        device == "cpu" or (device == "auto" and not cuda_status.cuda_available)
+    ):
+        on_cpu.add(ASR)
+    refinement = settings.refinement
+    if (
+        refinement.enabled
+        and refinement.provider == "local_ct2"
+        and refinement.model_id
+        and (refinement.n_gpu_layers == 0 or not cuda_status.cuda_available)
+    ):
+        on_cpu.add(SLM)
+    return on_cpu
+
+
+def plan_partition(
+    settings: VociferousSettings,
+    *,
+    cuda_status: CudaRuntimeStatus | None = None,
+    cores: Sequence[Sequence[int]] | None = None,
+) -> CorePlan:
+    """Assign disjoint CPU sets to the engines that run on the CPU.
+
+    ``cores`` is the physical-core grouping (default: this machine's).
+    Returns an empty plan when partitioning is off, nothing runs on the CPU
+    or there are too few cores to set any aside.
+    """
+    if not settings.cpu.partition:
+        return CorePlan()
+    on_cpu = engines_on_cpu(settings, cuda_status or detect_cuda_runtime())
+    if not on_cpu:
+        return CorePlan()
+    cores = [tuple(core) for core in (physical_cores() if cores is None else cores)]
+    reserve = max(0, int(settings.cpu.reserved_cores))
+    engine_cores = cores[reserve:]
+    if len(engine_cores) < len(on_cpu):
+        return CorePlan()
+
+    if on_cpu == {ASR, SLM}:
+        n_asr = min(max(1, round(len(engine_cores) * float(settings.cpu.asr_share))), len(engine_cores) - 1)
+        parts = {ASR: engine_cores[:n_asr], SLM: engine_cores[n_asr:]}
+    else:
+        parts = {role: engine_cores for role in on_cpu}
+
+    def flat(group: Sequence[Sequence[int]]) -> tuple[int, ...]:
+        return tuple(sorted(cpu for core in group for cpu in core))
+
+    return CorePlan(
+        asr=flat(parts.get(ASR, ())),
+        slm=flat(parts.get(SLM, ())),
+        reserved=flat(cores[:reserve]),
+        asr_cores=len(parts.get(ASR, ())),
+        slm_cores=len(parts.get(SLM, ())),
+    )
+
+
+def partition_threads(
+    settings: VociferousSettings, role: str, threads: int, *, cuda_status: CudaRuntimeStatus | None = None
+) -> int:
+    """``threads`` capped at the physical cores in ``role``'s set."""
+    cores = plan_partition(settings, cuda_status=cuda_status).cores(role)
+    return min(threads, cores) if cores else threads
+
+
+def _tasks(pid: int | str = "self") -> list[int]:
+    try:
+        return [int(tid) for tid in os.listdir(f"/proc/{pid}/task")]
+    except OSError:
+        return []
+
+
+def _set_affinity(tid: int, cpus: Sequence[int]) -> bool:
+    """Pin one thread; False once it has exited."""
+    try:
+        os.sched_setaffinity(tid, cpus)
+        return True
+    except OSError:
+        return False
+
+
+class CorePartitioner:
+    """Pins engine threads and worker processes to the current ``CorePlan``."""
+
+    def __init__(
+        self,
+        settings_provider: Callable[[], VociferousSettings],
+        *,
+        planner: Callable[[VociferousSettings], CorePlan] = plan_partition,
+    ) -> None:
+        self._settings_provider = settings_provider
+        self._planner = planner
+        self._lock = threading.Lock()
+        self._plan: CorePlan | None = None
+        self._threads: dict[str, set[int]] = {role: set() for role in ROLES}
+        self._processes: dict[str, set[int]] = {role: set() for role in ROLES}
+        self._busy: dict[str, int] = {role: 0 for role in ROLES}
+        self._callers: dict[int, str] = {}
+        self._applied: dict[str, tuple[int, ...]] = {}
+        self._enabled = affinity_supported()
+
+    def plan(self) -> CorePlan:
+        with self._lock:
+            return self._current_plan()
+
+    def _current_plan(self) -> CorePlan:
+        if self._plan is None:
+            self._plan = self._planner(self._settings_provider())
+            logger.info("CPU partition: %s", self._plan.to_dict())
+        return self._plan
+
+    def refresh(self) -> CorePlan:
+        """Re-plan from current settings (engine restart) and re-pin everything."""
+        with self._lock:
+            self._plan = None
+            plan = self._current_plan()
+            self._apply(force=True)
+            return plan
+
+    def _target(self, role: str, plan: CorePlan) -> tuple[int, ...]:
+        if plan.split and [r for r in ROLES if self._busy[r]] == [role]:
+            return plan.shared
+        return plan.cpus(role)
+
+    def _apply(self, *, force: bool = False) -> None:
+        """Move every tracked thread to its role's target set. Caller holds the lock."""
+        plan = self._current_plan()
+        for role in ROLES:
+            target = self._target(role, plan)
+            if not target or (not force and self._applied.get(role) == target):
+                continue
+            self._applied[role] = target
+            callers = [tid for tid, owner in self._callers.items() if owner == role]
+            for tid in [*self._threads[role], *callers]:
+                if not _set_affinity(tid, target):
+                    self._threads[role].discard(tid)
+            for pid in list(self._processes[role]):
+                tasks = _tasks(pid)
+                if not tasks:
+                    self._processes[role].discard(pid)
+                for tid in tasks:
+                    _set_affinity(tid, target)
+
+    @contextmanager
+    def loading(self, role: str) -> Iterator[None]:
+        """Load a model on ``role``'s cores so the threads it creates inherit them."""
+        cpus = self.plan().cpus(role)
+        if not self._enabled or not cpus:
+            yield
+            return
+        before = set(_tasks())
+        previous = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, cpus)
+        try:
+            yield
+        finally:
+            os.sched_setaffinity(0, previous)
+            with self._lock:
+                for tid in set(_tasks()) - before:
+                    try:
+                        if os.sched_getaffinity(tid) == set(cpus):
+                            self._threads[role].add(tid)
+                    except OSError:
+                        pass
+                self._apply(force=True)
+
+    @contextmanager
+    def busy(self, role: str) -> Iterator[None]:
+        """Run inference for ``role``: on its own cores, or on all engine cores while alone."""
+        if not self._enabled or not self.plan().cpus(role):
+            yield
+            return
+        tid = threading.get_native_id()
+        previous = os.sched_getaffinity(0)
+        with self._lock:
+            self._busy[role] += 1
+            self._callers[tid] = role
+            self._apply(force=True)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._busy[role] -= 1
+                self._callers.pop(tid, None)
+                os.sched_setaffinity(0, previous)
+                self._apply()
+
+    def adopt_process(self, role: str, pid: int) -> None:
+        """Pin every thread of worker process ``pid`` to ``role``'s cores."""
+        if not self._enabled or not self.plan().cpus(role):
+            return
+        with self._lock:
+            self._processes[role].add(pid)
+            self._apply(force=True)
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            plan = self._current_plan()
+            return {
+                **plan.to_dict(),
+                "pinning": self._enabled,
+                "busy": [role for role in ROLES if self._busy[role]],
+                "threads": {role: len(self._threads[role]) for role in ROLES},
+                "processes": {role: sorted(self._processes[role]) for role in ROLES},
+            }
+
+
+_partitioner: CorePartitioner | None = None
+
+
+def install_core_partitioner(partitioner: CorePartitioner | None) -> None:
+    """Make ``partitioner`` the process-wide one (the coordinator calls this at startup)."""
+    global _partitioner
+    _partitioner = partitioner
+
+
+def get_core_partitioner() -> CorePartitioner | None:
+    return _partitioner
+
+
+def pinned_load(role: str) -> AbstractContextManager[None]:
+    """Context for loading ``role``'s model (no-op without a partitioner)."""
+    return _partitioner.loading(role) if _partitioner is not None else nullcontext()
+
+
+def engine_busy(role: str) -> AbstractContextManager[None]:
+    """Context for one inference call on ``role``'s engine (no-op without a partitioner)."""
+    return _partitioner.busy(role) if _partitioner is not None else nullcontext()
+
+
+def adopt_process(role: str, pid: int) -> None:
+    if _partitioner is not None:
+        _partitioner.adopt_process(role, pid)
+
+
+__all__ = [
+    "ASR",
+    "SLM",
+    "CorePartitioner",
+    "CorePlan",
+    "adopt_process",
+    "engine_busy",
+    "engines_on_cpu",
+    "get_core_partitioner",
+    "install_core_partitioner",
+    "partition_threads",
+    "physical_cores",
+    "pinned_load",
+    "plan_partition",
+]
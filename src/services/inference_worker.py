@@ -0,0 +1,576 @@
+"""
+Out-of-process inference workers.
+
+With ``model.worker_process`` (ASR) or ``refinement.worker_process`` (local
+SLM) turned on, the model is loaded in a child process instead of the app
+process. Decoding then stops competing with the API server and the UI for
+the GIL. A native crash (CTranslate2 abort, CUDA driver fault) also takes
+down the worker instead of the app.
+
+``WorkerProcess`` owns one spawned child and talks to it over a pipe. It
+handles one request at a time and streams the results back as small
+messages. The parent reads a reply to the end before handing its messages
+on, so a caller that yields to more urgent work between segments (the ASR
+scheduler) finds the worker free again instead of waiting on itself.
+
+Audio is not pickled: ``SharedAudio`` copies the samples into a
+``multiprocessing.shared_memory`` block and only its name, shape and dtype
+cross the pipe, so the child decodes from a view of that block.
+
+If the child dies mid-request, that request fails with ``WorkerCrashed`` and
+the worker is respawned in the background with exponential backoff. After
+``MAX_RESTARTS`` crashes within ``RESTART_WINDOW_S`` it stays down.
+
+``WorkerWhisperModel`` stands in for ``faster_whisper.WhisperModel``. The
+SLM counterpart is ``WorkerRefinementProvider``
+(``src.refinement.providers.worker``). The rest of the app cannot tell
+either apart from the in-process model.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.core.settings import VociferousSettings
+from src.services.cpu_partition import adopt_process
+
+logger = logging.getLogger(__name__)
+
+# Crashes tolerated within RESTART_WINDOW_S before a worker stays down.
+MAX_RESTARTS = 3
+RESTART_WINDOW_S = 300.0
+# Delay before the first respawn; doubles with each crash in the window.
+RESTART_BACKOFF_S = 1.0
+
+# How often a waiting parent checks the child is alive and polls should_cancel.
+_POLL_S = 0.05
+_STOP_TIMEOUT_S = 5.0
+
+_SEGMENT_FIELDS = ("id", "start", "end", "text", "avg_logprob", "compression_ratio", "no_speech_prob")
+_INFO_FIELDS = ("language", "language_probability", "duration", "duration_after_vad")
+
+_live_workers: weakref.WeakSet[WorkerProcess] = weakref.WeakSet()
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process exited while serving a request, or is down for good."""
+
+
+class _ConnectionLost(Exception):
+    """Internal: the child went away while the parent was waiting on it."""
+
+
+# --- Shared-memory audio handoff ---
+
+
+class SharedAudio:
+    """A copy of ``audio`` in shared memory, handed to a worker by name."""
+
+    def __init__(self, audio: NDArray) -> None:
+        audio = np.ascontiguousarray(audio)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, audio.nbytes))
+        np.ndarray(audio.shape, dtype=audio.dtype, buffer=self._shm.buf)[...] = audio
+        self.descriptor: tuple[str, tuple[int, ...], str] = (self._shm.name, audio.shape, audio.dtype.str)
+        self._closed = False
+
+    def close(self) -> None:
+        """Release the block. Only call once the worker has finished with it."""
+        if self._closed:
+            return
+        self._closed = True
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> SharedAudio:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def attach_audio(descriptor: tuple[str, tuple[int, ...], str]) -> tuple[shared_memory.SharedMemory, NDArray]:
+    """Worker side: map the block named in ``descriptor`` as an array (no copy)."""
+    name, shape, dtype = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _detach(shm: shared_memory.SharedMemory) -> None:
+    try:
+        shm.close()
+    except BufferError:
+        # A decoder still holds a view; the mapping goes when it is collected.
+        logger.debug("Shared audio still referenced; leaving the mapping to GC")
+
+
+# --- Child process ---
+
+
+class _Channel:
+    """The child's end of one request: streams partial results, notices cancellation."""
+
+    def __init__(self, conn: Connection) -> None:
+        self._conn = conn
+        self.cancelled = False
+
+    def send(self, tag: str, value: Any) -> None:
+        self._conn.send((tag, value))
+
+    def should_cancel(self) -> bool:
+        while not self.cancelled and self._conn.poll():
+            if self._conn.recv()[0] == "cancel":
+                self.cancelled = True
+        return self.cancelled
+
+
+def _send_error(conn: Connection, exc: BaseException, tag: str = "error") -> None:
+    try:
+        conn.send((tag, exc))
+    except Exception:  # exception type that does not pickle
+        conn.send((tag, RuntimeError(f"{type(exc).__name__}: {exc}")))
+
+
+def _worker_main(
+    conn: Connection, name: str, server_factory: Callable[[VociferousSettings], Any], settings: Any
+) -> None:
+    """Child entry point: build the server (loads the model), then serve requests until told to stop."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C goes to the app, which stops us
+    logging.basicConfig(level=logging.INFO, format=f"%(asctime)s [{name}-worker] %(levelname)s %(name)s: %(message)s")
+    try:
+        server = server_factory(settings)
+    except BaseException as exc:
+        _send_error(conn, exc, tag="load_error")
+        return
+    conn.send(("ready", server.summary()))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return  # the app went away
+        if message[0] == "stop":
+            return
+        if message[0] != "call":
+            continue  # a cancel that arrived after its request finished
+        _, op, payload = message
+        try:
+            value = getattr(server, op)(payload, _Channel(conn))
+        except Exception as exc:
+            _send_error(conn, exc)
+        else:
+            conn.send(("done", value))
+
+
+class _WhisperServer:
+    """Worker-side ASR: a real ``WhisperModel`` decoding audio from shared memory."""
+
+    def __init__(self, settings: VociferousSettings) -> None:
+        from src.services.transcription_service import create_local_model
+
+        self._model = create_local_model(settings)
+
+    def summary(self) -> dict[str, Any]:
+        return dict(getattr(self._model, "_vociferous_runtime_summary", None) or {})
+
+    def transcribe(self, payload: tuple, channel: _Channel) -> None:
+        descriptor, options, batched = payload
+        shm, audio = attach_audio(descriptor)
+        try:
+            if batched:
+                from src.services.transcription.long_form import batched_pipeline
+
+                segments, info = batched_pipeline(self._model).transcribe(audio, **options)
+            else:
+                segments, info = self._model.transcribe(audio, **options)
+            channel.send("info", {field: getattr(info, field, None) for field in _INFO_FIELDS} if info else None)
+            for segment in segments:
+                channel.send("segment", {field: getattr(segment, field, None) for field in _SEGMENT_FIELDS})
+                if channel.should_cancel():
+                    break
+            close = getattr(segments, "close", None)
+            if close is not None:
+                close()
+            del segments
+        finally:
+            del audio
+            _detach(shm)
+
+
+# --- Parent side ---
+
+
+class WorkerProcess:
+    """One supervised child process serving a model, one request at a time.
+
+    ``name`` doubles as the CPU partition role ("asr" / "slm") the process
+    is pinned to.
+
+    ``server_factory`` is called in the child with ``settings`` and must
+    return an object with ``summary()`` plus one ``op(payload, channel)``
+    method per request type. It is pickled by reference, so it has to be
+    a module-level class or function.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        server_factory: Callable[[VociferousSettings], Any],
+        settings: Any,
+        *,
+        max_restarts: int = MAX_RESTARTS,
+        restart_window_s: float = RESTART_WINDOW_S,
+        restart_backoff_s: float = RESTART_BACKOFF_S,
+    ) -> None:
+        self.name = name
+        self._server_factory = server_factory
+        self._settings = settings
+        self._max_restarts = max_restarts
+        self._restart_window_s = restart_window_s
+        self._restart_backoff_s = restart_backoff_s
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._process: Any = None
+        self._conn: Connection | None = None
+        self._crashes: list[float] = []
+        self._failure: str | None = None
+        self._stopped = False
+        self.summary: dict[str, Any] = {}
+        self.restarts = 0
+        _live_workers.add(self)
+
+    @property
+    def pid(self) -> int | None:
+        process = self._process
+        return process.pid if process is not None else None
+
+    def start(self) -> dict[str, Any]:
+        """Spawn the child and wait for its model to load.
+
+        Returns the child's runtime summary. A load error raised in the
+        child is re-raised here.
+        """
+        with self._lock:
+            return self._spawn()
+
+    def _spawn(self) -> dict[str, Any]:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.name, self._server_factory, self._settings),
+            name=f"vociferous-{self.name}-worker",
+            daemon=True,
+        )
+        start = time.perf_counter()
+        process.start()
+        child_conn.close()
+        try:
+            tag, value = self._recv(parent_conn, process)
+        except _ConnectionLost:
+            parent_conn.close()
+            raise WorkerCrashed(f"{self.name} worker exited while loading (exit code {process.exitcode})") from None
+        if tag == "load_error":
+            process.join(_STOP_TIMEOUT_S)
+            parent_conn.close()
+            raise value
+        self._process, self._conn = process, parent_conn
+        self.summary = dict(value)
+        adopt_process(self.name, process.pid)
+        logger.info("%s worker ready in %.2fs (pid %d)", self.name, time.perf_counter() - start, process.pid)
+        return self.summary
+
+    @staticmethod
+    def _recv(conn: Connection, process: Any, on_wait: Callable[[], None] | None = None) -> tuple[str, Any]:
+        while not conn.poll(_POLL_S):
+            if not process.is_alive() and not conn.poll():
+                raise _ConnectionLost
+            if on_wait is not None:
+                on_wait()
+        try:
+            return conn.recv()
+        except (EOFError, OSError):
+            raise _ConnectionLost from None
+
+    def _ensure_running(self) -> None:
+        if self._stopped:
+            raise WorkerCrashed(f"{self.name} worker is stopped")
+        if self._failure:
+            raise WorkerCrashed(self._failure)
+        if self._process is None or not self._process.is_alive():
+            self._spawn()  # backoff not over yet, or the background respawn failed
+            if self._crashes:
+                self.restarts += 1
+
+    def request(
+        self, op: str, payload: Any, *, should_cancel: Callable[[], bool] | None = None
+    ) -> Iterator[tuple[str, Any]]:
+        """Send one request and yield its ``(tag, value)`` messages up to ``("done", value)``.
+
+        The whole reply is read while the worker is held and only yielded once
+        it is released again, so the caller may run other requests on this
+        worker between messages (the ASR scheduler runs urgent jobs between
+        segments). ``should_cancel`` returning True cancels the request in the
+        child; the messages received so far are still yielded. Errors raised
+        in the child are re-raised here.
+        """
+        messages: list[tuple[str, Any]] = []
+        with self._lock:
+            result = self._exchange(op, payload, should_cancel, lambda tag, value: messages.append((tag, value)))
+        messages.append(("done", result))
+        yield from messages
+
+    def call(
+        self,
+        op: str,
+        payload: Any,
+        *,
+        should_cancel: Callable[[], bool] | None = None,
+        on_message: Callable[[str, Any], None] | None = None,
+    ) -> Any:
+        """Run one request to completion; streamed messages go to ``on_message`` as they arrive.
+
+        ``on_message`` runs while the worker is held and must not send it
+        another request.
+        """
+        with self._lock:
+            return self._exchange(op, payload, should_cancel, on_message)
+
+    def _exchange(
+        self,
+        op: str,
+        payload: Any,
+        should_cancel: Callable[[], bool] | None,
+        on_message: Callable[[str, Any], None] | None,
+    ) -> Any:
+        """Send one request, pass its messages to ``on_message`` and return the result. Caller holds ``_lock``."""
+        self._ensure_running()
+        conn, process = self._conn, self._process
+        assert conn is not None
+        conn.send(("call", op, payload))
+        cancel_sent = False
+
+        def check_cancel() -> None:
+            nonlocal cancel_sent
+            if not cancel_sent and should_cancel is not None and should_cancel():
+                conn.send(("cancel",))
+                cancel_sent = True
+
+        finished = False
+        try:
+            while True:
+                tag, value = self._recv(conn, process, check_cancel)
+                if tag == "error":
+                    finished = True
+                    raise value
+                if tag == "done":
+                    finished = True
+                    return value
+                if on_message is not None:
+                    on_message(tag, value)
+                check_cancel()
+        except _ConnectionLost:
+            finished = True
+            raise self._crashed(process) from None
+        finally:
+            if not finished:
+                self._abandon(conn, process, cancel_sent)
+
+    def _abandon(self, conn: Connection, process: Any, cancel_sent: bool) -> None:
+        """Reading stopped early (interrupted): cancel and drain so the next request starts clean."""
+        try:
+            if not cancel_sent:
+                conn.send(("cancel",))
+            while self._recv(conn, process)[0] not in ("done", "error"):
+                pass
+        except (_ConnectionLost, OSError):
+            self._crashed(process)
+
+    def _crashed(self, process: Any) -> WorkerCrashed:
+        """Record a crash and schedule a respawn. Returns the error for the request in flight."""
+        process.join(1.0)  # the pipe can report EOF before the exit is reaped
+        exitcode = process.exitcode
+        if self._conn is not None:
+            self._conn.close()
+        self._process = self._conn = None
+        if self._stopped:
+            return WorkerCrashed(f"{self.name} worker stopped")
+        now = time.monotonic()
+        self._crashes = [t for t in self._crashes if now - t < self._restart_window_s] + [now]
+        if len(self._crashes) > self._max_restarts:
+            self._failure = (
+                f"{self.name} worker crashed {len(self._crashes)} times in "
+                f"{self._restart_window_s:.0f}s (last exit code {exitcode}); not restarting"
+            )
+            logger.error(self._failure)
+            return WorkerCrashed(self._failure)
+        delay = self._restart_backoff_s * 2 ** (len(self._crashes) - 1)
+        logger.error("%s worker crashed (exit code %s); restarting in %.1fs", self.name, exitcode, delay)
+        threading.Thread(
+            target=self._respawn_after, args=(delay,), daemon=True, name=f"{self.name}-worker-restart"
+        ).start()
+        return WorkerCrashed(f"{self.name} worker crashed (exit code {exitcode})")
+
+    def _respawn_after(self, delay: float) -> None:
+        time.sleep(delay)
+        with self._lock:
+            if self._stopped or self._failure or self._process is not None:
+                return
+            try:
+                self._spawn()
+                self.restarts += 1
+            except Exception:
+                logger.exception("%s worker restart failed; the next request will retry", self.name)
+
+    def status(self) -> dict[str, Any]:
+        process = self._process
+        return {
+            "pid": process.pid if process is not None else None,
+            "alive": bool(process is not None and process.is_alive()),
+            "restarts": self.restarts,
+            "failure": self._failure,
+        }
+
+    def stop(self) -> None:
+        """Stop the child. A request still running after a few seconds is cut off."""
+        self._stopped = True
+        acquired = self._lock.acquire(timeout=_STOP_TIMEOUT_S)
+        try:
+            process, conn = self._process, self._conn
+            self._process = self._conn = None
+            if process is None:
+                return
+            if acquired and process.is_alive():
+                try:
+                    conn.send(("stop",))
+                except OSError:
+                    pass
+                process.join(_STOP_TIMEOUT_S)
+            if process.is_alive():
+                process.terminate()
+                process.join(1.0)
+            if conn is not None:
+                conn.close()
+        finally:
+            if acquired:
+                self._lock.release()
+
+
+def shutdown_workers() -> None:
+    """Stop every live worker process (app shutdown)."""
+    for worker in list(_live_workers):
+        try:
+            worker.stop()
+        except Exception:
+            logger.debug("Stopping %s worker failed", worker.name, exc_info=True)
+
+
+# --- ASR stand-in ---
+
+
+class _RemoteSegments:
+    """Segments decoded by the worker. Closing it releases the shared audio block."""
+
+    def __init__(self, messages: Iterator[tuple[str, Any]], shared: SharedAudio) -> None:
+        self._messages: Iterator[tuple[str, Any]] | None = messages
+        self._shared = shared
+
+    def __iter__(self) -> _RemoteSegments:
+        return self
+
+    def __next__(self) -> SimpleNamespace:
+        if self._messages is None:
+            raise StopIteration
+        try:
+            for tag, value in self._messages:
+                if tag == "segment":
+                    return SimpleNamespace(**value)
+        except BaseException:
+            self.close()
+            raise
+        self.close()
+        raise StopIteration
+
+    def close(self) -> None:
+        messages, self._messages = self._messages, None
+        try:
+            if messages is not None:
+                messages.close()  # type: ignore[attr-defined]
+        finally:
+            self._shared.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def _remote_transcribe(
+    worker: WorkerProcess, audio: NDArray, options: dict[str, Any], batched: bool
+) -> tuple[_RemoteSegments, SimpleNamespace | None]:
+    shared = SharedAudio(audio)
+    messages = worker.request("transcribe", (shared.descriptor, options, batched))
+    try:
+        _tag, info = next(messages)  # the child reports info before the first segment
+    except BaseException:
+        shared.close()
+        raise
+    return _RemoteSegments(messages, shared), SimpleNamespace(**info) if info else None
+
+
+class _WorkerBatchedPipeline:
+    """``BatchedInferencePipeline`` stand-in: batched decoding inside the worker."""
+
+    def __init__(self, worker: WorkerProcess) -> None:
+        self._worker = worker
+
+    def transcribe(self, audio: NDArray, **options: Any) -> tuple[_RemoteSegments, SimpleNamespace | None]:
+        return _remote_transcribe(self._worker, audio, options, True)
+
+
+class WorkerWhisperModel:
+    """``WhisperModel`` look-alike whose decoding runs in a worker process.
+
+    ``transcribe`` takes the same arguments and returns ``(segments, info)``
+    like faster-whisper. The worker stops when this object is released.
+    """
+
+    def __init__(self, settings: VociferousSettings, *, server_factory: Callable[..., Any] = _WhisperServer) -> None:
+        in_process = settings.model_copy(update={"model": settings.model.model_copy(update={"worker_process": False})})
+        self._worker = WorkerProcess("asr", server_factory, in_process)
+        summary = self._worker.start()
+        self._vociferous_runtime_summary = {**summary, "worker_process": True, "worker_pid": self._worker.pid}
+        # Picked up by long_form.batched_pipeline() instead of wrapping this object.
+        self._vociferous_batched_pipeline = _WorkerBatchedPipeline(self._worker)
+        weakref.finalize(self, self._worker.stop)
+
+    @property
+    def worker(self) -> WorkerProcess:
+        return self._worker
+
+    def transcribe(self, audio: NDArray, **options: Any) -> tuple[_RemoteSegments, SimpleNamespace | None]:
+        return _remote_transcribe(self._worker, audio, options, False)
+
+
+__all__ = [
+    "MAX_RESTARTS",
+    "RESTART_WINDOW_S",
+    "SharedAudio",
+    "WorkerCrashed",
+    "WorkerProcess",
+    "WorkerWhisperModel",
+    "attach_audio",
+    "shutdown_workers",
+]
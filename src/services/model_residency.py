@@ -0,0 +1,428 @@
+"""
+ModelResidencyManager — memory budgets and idle unloading for loaded models.
+
+Whisper, the refinement SLM and Silero VAD used to load at startup and stay
+resident for the life of the process. The manager keeps that as the default
+but lets the user trade a reload on next use for a smaller steady footprint:
+
+* **Idle unloading** — a model unused for its idle timeout is unloaded.
+* **Budgets** — before a model loads, the least recently used other models
+  in the same pool (RAM or VRAM) are unloaded until it fits.
+* **Predictive reload** — recording start reloads ASR/VAD (and the SLM when
+  auto-refine is on) while the user is still speaking.
+* **Hot-swap headroom** — ``fits_alongside`` tells a restart whether the
+  replacement model can load before the old one is unloaded.
+
+The manager only decides *when*; owners keep the mechanism. Each model is
+registered with callables that load, unload and describe it, and owners wrap
+their own load paths in ``loading(name)`` so budgets apply and load time and
+RSS growth are recorded no matter who triggered the load. A model whose
+``busy`` callable is true is never unloaded and counts as just used.
+
+Owners that read a model and then use it (a transcription checking the
+Whisper model is loaded before decoding with it) hold it with
+``acquire(name)`` around both steps. A held model is not unloaded, and
+``acquire`` waits for an unload already under way to finish, so the owner
+sees the model as unloaded and reloads it instead of finding it gone
+mid-use.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from src.core.settings import VociferousSettings
+
+logger = logging.getLogger(__name__)
+
+MemoryPool = Literal["ram", "vram"]
+
+# How often the idle monitor looks at resident models.
+_MONITOR_INTERVAL_S = 15.0
+
+
+def _free_memory_mb(pool: MemoryPool) -> float:
+    """Free memory in the pool in MB (0.0 when it cannot be measured)."""
+    try:
+        if pool == "vram":
+            from src.core.cuda_runtime import detect_cuda_runtime
+
+            return float(detect_cuda_runtime().vram_free_mb)
+        import psutil
+
+        return psutil.virtual_memory().available / (1024 * 1024)
+    except Exception:
+        return 0.0
+
+
+def process_rss_mb() -> float:
+    """Resident set size of this process in MB (0.0 when psutil is unavailable)."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        return 0.0
+
+
+@dataclass(slots=True)
+class _Resident:
+    name: str
+    load: Callable[[], None]
+    unload: Callable[[], None]
+    is_loaded: Callable[[], bool]
+    estimate_mb: Callable[[], float]
+    pool: Callable[[], MemoryPool]
+    busy: Callable[[], bool]
+    idle_timeout_s: Callable[[], float]
+    last_used: float = field(default_factory=time.monotonic)
+    loading: bool = False
+    unloading: bool = False
+    in_use: int = 0
+    evicted: bool = False
+    loads: int = 0
+    reloads: int = 0
+    evictions: int = 0
+    last_load_ms: int | None = None
+    last_reload_ms: int | None = None
+    rss_delta_mb: float | None = None
+    last_eviction_reason: str = ""
+
+
+class ModelResidencyManager:
+    """Decides which registered models stay loaded."""
+
+    def __init__(
+        self,
+        settings_provider: Callable[[], VociferousSettings],
+        *,
+        on_evicted: Callable[[str], None] | None = None,
+        monitor_interval_s: float = _MONITOR_INTERVAL_S,
+    ) -> None:
+        self._settings_provider = settings_provider
+        self._on_evicted = on_evicted
+        self._monitor_interval_s = monitor_interval_s
+        self._models: dict[str, _Resident] = {}
+        self._lock = threading.RLock()
+        # Signalled when an unload finishes, for owners waiting in hold().
+        self._unloaded = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._monitor: threading.Thread | None = None
+
+    # --- Registration -------------------------------------------------------
+
+    def register(
+        self,
+        name: str,
+        *,
+        load: Callable[[], None],
+        unload: Callable[[], None],
+        is_loaded: Callable[[], bool],
+        estimate_mb: Callable[[], float],
+        pool: Callable[[], MemoryPool] = lambda: "ram",
+        busy: Callable[[], bool] = lambda: False,
+        idle_timeout_s: Callable[[], float] = lambda: 0.0,
+    ) -> None:
+        """Register a model. ``estimate_mb`` of 0 marks it as not worth unloading (e.g. a remote provider)."""
+        with self._lock:
+            self._models[name] = _Resident(
+                name=name,
+                load=load,
+                unload=unload,
+                is_loaded=is_loaded,
+                estimate_mb=estimate_mb,
+                pool=pool,
+                busy=busy,
+                idle_timeout_s=idle_timeout_s,
+            )
+
+    def start(self) -> None:
+        """Start the idle monitor thread."""
+        if self._monitor is not None and self._monitor.is_alive():
+            return
+        self._stop.clear()
+        self._monitor = threading.Thread(target=self._monitor_loop, daemon=True, name="model-residency")
+        self._monitor.start()
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join(timeout=2)
+
+    # --- Owner hooks --------------------------------------------------------
+
+    def touch(self, name: str) -> None:
+        """Mark ``name`` as just used."""
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is not None:
+                entry.last_used = time.monotonic()
+
+    def hold(self, name: str) -> None:
+        """Keep ``name`` from being unloaded until ``release``; waits out an unload under way."""
+        with self._unloaded:
+            entry = self._models.get(name)
+            if entry is None:
+                return
+            while entry.unloading:
+                self._unloaded.wait()
+            entry.in_use += 1
+            entry.last_used = time.monotonic()
+
+    def release(self, name: str) -> None:
+        """End a ``hold``."""
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is not None and entry.in_use:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+    @contextmanager
+    def acquire(self, *names: str) -> Iterator[None]:
+        """Hold ``names`` for the duration of the block (see ``hold``)."""
+        held: list[str] = []
+        try:
+            for name in names:
+                self.hold(name)
+                held.append(name)
+            yield
+        finally:
+            for name in reversed(held):
+                self.release(name)
+
+    @contextmanager
+    def loading(self, name: str) -> Iterator[None]:
+        """Wrap an owner's model load: make room first, then record time and RSS growth."""
+        entry = self._models.get(name)
+        if entry is None:
+            yield
+            return
+        self._make_room(entry)
+        with self._lock:
+            entry.loading = True
+        rss_before = process_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            with self._lock:
+                entry.loading = False
+            raise
+        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        rss_delta = process_rss_mb() - rss_before
+        with self._lock:
+            entry.loading = False
+            entry.loads += 1
+            entry.last_load_ms = elapsed_ms
+            if entry.evicted:
+                entry.reloads += 1
+                entry.last_reload_ms = elapsed_ms
+            entry.evicted = False
+            # Concurrent loads blur the delta; keep the first clean positive reading.
+            if rss_delta > 1.0 and entry.rss_delta_mb is None:
+                entry.rss_delta_mb = round(rss_delta, 1)
+            entry.last_used = time.monotonic()
+        logger.info("Model %s loaded in %d ms (rss %+.0f MB)", name, elapsed_ms, rss_delta)
+
+    # --- Policy -------------------------------------------------------------
+
+    def evict(self, name: str, *, reason: str = "manual", check_busy: bool = True) -> bool:
+        """Unload ``name`` unless it is held, busy or not loaded. Returns True if it was unloaded.
+
+        A job running on the model's own scheduler passes ``check_busy=False``:
+        the busy check would only see the job itself. Holds still apply.
+        """
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is None or entry.loading or entry.unloading or entry.in_use:
+                return False
+            if not self._safe(entry.is_loaded) or (check_busy and self._safe(entry.busy)):
+                return False
+            if not self._safe(entry.estimate_mb, 0.0):
+                return False
+            # From here until the unload returns, hold() waits instead of handing out the model.
+            entry.unloading = True
+        try:
+            entry.unload()
+        except Exception:
+            logger.exception("Unloading %s failed", name)
+            return False
+        finally:
+            with self._unloaded:
+                entry.unloading = False
+                self._unloaded.notify_all()
+        with self._lock:
+            entry.evicted = True
+            entry.evictions += 1
+            entry.last_eviction_reason = reason
+        logger.info("Unloaded %s model (%s)", name, reason)
+        if self._on_evicted is not None:
+            try:
+                self._on_evicted(name)
+            except Exception:
+                logger.debug("Residency eviction callback failed", exc_info=True)
+        return True
+
+    def prefetch(self, name: str) -> bool:
+        """Reload ``name`` in the background if it was unloaded by this manager."""
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is None or entry.loading or not entry.evicted or self._safe(entry.is_loaded):
+                return False
+            entry.last_used = time.monotonic()
+
+        def _load() -> None:
+            try:
+                entry.load()
+            except Exception:
+                logger.warning("Predictive reload of %s failed (will load on use)", name, exc_info=True)
+
+        threading.Thread(target=_load, daemon=True, name=f"residency-prefetch-{name}").start()
+        return True
+
+    def fits_alongside(self, name: str) -> bool:
+        """Whether a second copy of ``name``, at its current estimate, fits next to everything resident.
+
+        Hot-swaps load the replacement before unloading the old model. With a
+        budget the budget decides; without one the pool's free memory does.
+        """
+        entry = self._models.get(name)
+        if entry is None:
+            return False
+        needed = float(self._safe(entry.estimate_mb, 0.0))
+        if needed <= 0:
+            return True
+        settings = self._settings_provider().residency
+        pool = self._safe(entry.pool, "ram")
+        budget = settings.vram_budget_mb if pool == "vram" else settings.ram_budget_mb
+        if budget <= 0:
+            return needed <= _free_memory_mb(pool)
+        with self._lock:
+            resident = [
+                e for e in self._models.values() if self._safe(e.pool, "ram") == pool and self._safe(e.is_loaded)
+            ]
+        return sum(self._footprint(e) for e in resident) + needed <= budget
+
+    def on_recording_started(self) -> None:
+        """Predictive reload: dictation will need ASR/VAD soon, and the SLM if auto-refine is on."""
+        settings = self._settings_provider()
+        if not settings.residency.predictive_reload:
+            return
+        targets = ["vad", "asr"]
+        if settings.output.auto_refine and settings.refinement.enabled:
+            targets.append("slm")
+        for name in targets:
+            self.touch(name)
+            self.prefetch(name)
+
+    def _make_room(self, incoming: _Resident) -> None:
+        settings = self._settings_provider().residency
+        pool = self._safe(incoming.pool, "ram")
+        budget = settings.vram_budget_mb if pool == "vram" else settings.ram_budget_mb
+        if budget <= 0:
+            return
+        needed = self._footprint(incoming)
+        with self._lock:
+            others = [
+                e
+                for e in self._models.values()
+                if e is not incoming and self._safe(e.pool, "ram") == pool and self._safe(e.is_loaded)
+            ]
+        used = sum(self._footprint(e) for e in others)
+        for victim in sorted(others, key=lambda e: e.last_used):
+            if used + needed <= budget:
+                break
+            if self.evict(victim.name, reason=f"{pool} budget for {incoming.name}"):
+                used -= self._footprint(victim)
+        if used + needed > budget:
+            logger.warning(
+                "Loading %s exceeds the %s budget (%d MB needed, %d MB resident, budget %d MB)",
+                incoming.name,
+                pool,
+                needed,
+                used,
+                budget,
+            )
+
+    def _check_idle(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._models.values())
+        for entry in entries:
+            if entry.in_use or self._safe(entry.busy):
+                entry.last_used = now
+                continue
+            timeout = self._safe(entry.idle_timeout_s, 0.0)
+            if timeout > 0 and now - entry.last_used >= timeout and self._safe(entry.is_loaded):
+                self.evict(entry.name, reason=f"idle {int(now - entry.last_used)}s")
+
+    def _monitor_loop(self) -> None:
+        while not self._stop.wait(self._monitor_interval_s):
+            try:
+                self._check_idle()
+            except Exception:
+                logger.exception("Model residency check failed")
+
+    # --- Reporting ----------------------------------------------------------
+
+    def _footprint(self, entry: _Resident) -> float:
+        """Measured RSS growth for RAM models when known, else the estimate."""
+        if entry.rss_delta_mb is not None and self._safe(entry.pool, "ram") == "ram":
+            return entry.rss_delta_mb
+        return float(self._safe(entry.estimate_mb, 0.0))
+
+    def status(self) -> dict[str, Any]:
+        settings = self._settings_provider().residency
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._models.values())
+        models = {}
+        for entry in entries:
+            loaded = self._safe(entry.is_loaded)
+            if entry.loading:
+                state = "loading"
+            elif entry.unloading:
+                state = "unloading"
+            elif loaded:
+                state = "resident"
+            elif entry.evicted:
+                state = "unloaded"
+            else:
+                state = "not_loaded"
+            models[entry.name] = {
+                "state": state,
+                "pool": self._safe(entry.pool, "ram"),
+                "footprint_mb": round(self._footprint(entry), 1),
+                "rss_delta_mb": entry.rss_delta_mb,
+                "idle_seconds": round(now - entry.last_used, 1),
+                "idle_timeout_seconds": self._safe(entry.idle_timeout_s, 0.0),
+                "loads": entry.loads,
+                "reloads": entry.reloads,
+                "evictions": entry.evictions,
+                "last_load_ms": entry.last_load_ms,
+                "last_reload_ms": entry.last_reload_ms,
+                "last_eviction_reason": entry.last_eviction_reason,
+            }
+        return {
+            "ram_budget_mb": settings.ram_budget_mb,
+            "vram_budget_mb": settings.vram_budget_mb,
+            "process_rss_mb": round(process_rss_mb(), 1),
+            "models": models,
+        }
+
+    @staticmethod
+    def _safe(fn: Callable[[], Any], default: Any = False) -> Any:
+        try:
+            return fn()
+        except Exception:
+            return default
+
+
+__all__ = ["MemoryPool", "ModelResidencyManager", "process_rss_mb"]
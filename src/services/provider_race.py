@@ -0,0 +1,256 @@
+"""
+Speculative racing between two providers of the same request.
+
+With racing on (``model.race_providers``, ``refinement.race_providers``) a
+request goes to the configured provider first. If no valid result has come
+back after the hedge delay, the same request also goes to the other one
+(local ↔ Groq) and the first valid result wins. The losing call is
+cancelled: a local decode stops at its next cancel check, an HTTP request
+already in flight is abandoned and its result dropped. A primary that fails
+starts the secondary at once.
+
+``LatencyHistograms`` keeps every provider's latencies in log-spaced
+buckets, split by request size (audio seconds, words) so a long recording is
+not judged against short ones. Unless a fixed delay is configured, the hedge
+delay is the primary's p90 latency for requests of that size.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import queue
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Latency bucket upper bounds: 50 ms to ~23 min, 25% apart.
+_BUCKET_BOUNDS: tuple[float, ...] = tuple(0.05 * 1.25**index for index in range(47))
+
+HEDGE_QUANTILE = 0.9
+# Requests of a size class recorded before its quantile is trusted.
+MIN_SAMPLES = 5
+# Hedge delay until then.
+FALLBACK_HEDGE_S = 2.0
+
+
+class LatencyHistogram:
+    """Counts of latencies in fixed log-spaced buckets (not thread-safe)."""
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        self._counts[bisect.bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return None
+        target = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return _BUCKET_BOUNDS[min(index, len(_BUCKET_BOUNDS) - 1)]
+        return _BUCKET_BOUNDS[-1]
+
+
+class LatencyHistograms:
+    """Latency histograms per provider and request-size class.
+
+    ``size_edges`` are the upper bounds of the size classes; anything larger
+    falls in a last, open class.
+    """
+
+    def __init__(self, size_edges: Sequence[float]) -> None:
+        self._edges = tuple(size_edges)
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, int], LatencyHistogram] = {}
+
+    def _size_class(self, size: float) -> int:
+        return bisect.bisect_left(self._edges, size)
+
+    def record(self, provider: str, size: float, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self._lock:
+            key = (provider, self._size_class(size))
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def quantile(self, provider: str, size: float, q: float = HEDGE_QUANTILE) -> float | None:
+        """The ``q`` latency of ``provider`` for requests like ``size``, or None with too little history."""
+        with self._lock:
+            histogram = self._histograms.get((provider, self._size_class(size)))
+            if histogram is None or histogram.count < MIN_SAMPLES:
+                return None
+            return histogram.quantile(q)
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        with self._lock:
+            snapshot: dict[str, dict[str, float | int | None]] = {}
+            for (provider, size_class), histogram in sorted(self._histograms.items()):
+                bound = f"<={self._edges[size_class]:g}" if size_class < len(self._edges) else f">{self._edges[-1]:g}"
+                snapshot[f"{provider}/{bound}"] = {
+                    "count": histogram.count,
+                    "p50_s": histogram.quantile(0.5),
+                    "p90_s": histogram.quantile(HEDGE_QUANTILE),
+                }
+            return snapshot
+
+
+def hedge_delay(histograms: LatencyHistograms, provider: str, size: float, configured_ms: int) -> float:
+    """Seconds to wait for ``provider`` before racing the other one.
+
+    ``configured_ms`` wins when set; otherwise the provider's p90 latency,
+    or ``FALLBACK_HEDGE_S`` until enough requests of the size were seen.
+    """
+    if configured_ms > 0:
+        return configured_ms / 1000
+    p90 = histograms.quantile(provider, size)
+    return FALLBACK_HEDGE_S if p90 is None else p90
+
+
+class RaceCancelled(Exception):
+    """Raised by a contender that stopped because the other one won."""
+
+
+@dataclass(frozen=True, slots=True)
+class Contender(Generic[T]):
+    """One provider's attempt at a request.
+
+    ``call`` gets an event that is set when the other contender won. With
+    ``wait_on_cancel`` the race waits for a losing call to return before
+    handing over the result (it holds an engine the next request needs).
+    """
+
+    name: str
+    call: Callable[[threading.Event], T]
+    wait_on_cancel: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class RaceResult(Generic[T]):
+    value: T
+    winner: str
+    # Whether the secondary was started at all.
+    hedged: bool
+    hedge_s: float
+    elapsed_s: float
+
+
+def _always_valid(_value: Any) -> bool:
+    return True
+
+
+def race(
+    primary: Contender[T],
+    secondary: Contender[T],
+    *,
+    hedge_s: float,
+    is_valid: Callable[[T], bool] = _always_valid,
+    on_latency: Callable[[str, float], None] | None = None,
+    abort_on: tuple[type[BaseException], ...] = (),
+) -> RaceResult[T]:
+    """Run ``primary``, hedged by ``secondary`` after ``hedge_s`` seconds; return the first valid result.
+
+    ``on_latency(name, seconds)`` is called for every valid result, the
+    loser's included if it still completes. Without any valid result the
+    primary's own result (or error) stands. An exception in ``abort_on``
+    raised before there is a winner ends the race and is re-raised.
+    """
+    start = time.perf_counter()
+    finished: queue.Queue[tuple[Contender[T], bool, Any]] = queue.Queue()
+    contenders = {primary.name: primary, secondary.name: secondary}
+    cancels = {primary.name: threading.Event(), secondary.name: threading.Event()}
+    threads: dict[str, threading.Thread] = {}
+
+    def run(contender: Contender[T]) -> None:
+        began = time.perf_counter()
+        try:
+            value = contender.call(cancels[contender.name])
+        except BaseException as exc:
+            finished.put((contender, False, exc))
+            return
+        valid = is_valid(value)
+        if valid and on_latency is not None:
+            on_latency(contender.name, time.perf_counter() - began)
+        finished.put((contender, valid, value))
+
+    def launch(contender: Contender[T]) -> None:
+        thread = threading.Thread(target=run, args=(contender,), daemon=True, name=f"race-{contender.name}")
+        threads[contender.name] = thread
+        thread.start()
+
+    def cancel_all(except_name: str = "") -> None:
+        for name, thread in threads.items():
+            if name != except_name and thread.is_alive():
+                cancels[name].set()
+                if contenders[name].wait_on_cancel:
+                    thread.join()
+
+    launch(primary)
+    outcomes: dict[str, tuple[bool, Any]] = {}
+    winner: Contender[T] | None = None
+    while len(outcomes) < len(threads):
+        timeout = None if secondary.name in threads else max(0.0, hedge_s - (time.perf_counter() - start))
+        try:
+            contender, valid, outcome = finished.get(timeout=timeout)
+        except queue.Empty:
+            logger.info("No result from %s after %.2fs — racing %s", primary.name, hedge_s, secondary.name)
+            launch(secondary)
+            continue
+        outcomes[contender.name] = (valid, outcome)
+        if valid:
+            winner = contender
+            break
+        if isinstance(outcome, abort_on):
+            cancel_all()
+            raise outcome
+        if isinstance(outcome, BaseException):
+            logger.warning("%s failed in a provider race: %s", contender.name, outcome)
+        if secondary.name not in threads:
+            logger.info("%s returned no usable result — trying %s", primary.name, secondary.name)
+            launch(secondary)
+
+    if winner is None:
+        for name in (primary.name, secondary.name):
+            if name in outcomes and not isinstance(outcomes[name][1], BaseException):
+                winner = contenders[name]
+                break
+        else:
+            raise outcomes[primary.name][1]
+    cancel_all(except_name=winner.name)
+    elapsed = time.perf_counter() - start
+    if winner is secondary:
+        logger.info("%s won the race against %s in %.2fs", secondary.name, primary.name, elapsed)
+    return RaceResult(
+        value=outcomes[winner.name][1],
+        winner=winner.name,
+        hedged=secondary.name in threads,
+        hedge_s=hedge_s,
+        elapsed_s=elapsed,
+    )
+
+
+__all__ = [
+    "Contender",
+    "LatencyHistogram",
+    "LatencyHistograms",
+    "RaceCancelled",
+    "RaceResult",
+    "hedge_delay",
+    "race",
+]
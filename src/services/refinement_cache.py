@@ -0,0 +1,196 @@
+"""
+RefinementResultCache — persistent, content-addressed cache of SLM refinements.
+
+Re-refining identical text with an identical prompt, model and sampling
+configuration (bulk refine over refined items, repeated "Refine" clicks,
+switching back to an earlier prompt) returns the stored output instead of
+running the SLM again.
+
+Entries live in a small SQLite file under ``<cache_dir>/refinement/`` and are
+keyed by a SHA-256 over every input that shapes the output (see
+``RefinementCacheKey``). The store is bounded by entry count; the least
+recently used entries are evicted first.
+
+Only deterministic settings are cacheable by default: a sampled refinement
+can legitimately differ run to run, so caching it is opt-in.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from src.core.resource_manager import ResourceManager
+
+logger = logging.getLogger(__name__)
+
+# At or below this temperature CT2 sampling is effectively greedy.
+DETERMINISTIC_MAX_TEMPERATURE = 0.05
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS refinement_results (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_refinement_results_last_used ON refinement_results(last_used_at);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RefinementCacheKey:
+    """Everything that determines a refinement's output."""
+
+    text: str
+    instructions: str
+    provider_id: str
+    model_id: str
+    temperature: float
+    top_p: float
+    top_k: int
+    repetition_penalty: float
+    use_thinking: bool
+    allow_skip: bool
+    # System prompt + invariants: editing them must not serve stale output.
+    system_prompt: str = ""
+    invariants: tuple[str, ...] = ()
+    # Selective refinement threshold, or None when the whole text is sent.
+    selective_threshold: float | None = None
+    # (max_tokens, overlap_tokens) when the text is refined in chunks.
+    chunk_window: tuple[int, ...] = ()
+
+    @property
+    def deterministic(self) -> bool:
+        return self.temperature <= DETERMINISTIC_MAX_TEMPERATURE or self.top_k == 1
+
+    def digest(self) -> str:
+        payload = json.dumps(asdict(self), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRefinement:
+    """A stored refinement and the token usage of the run that produced it."""
+
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+    @property
+    def usage(self) -> dict[str, int]:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+        }
+
+
+class RefinementResultCache:
+    """Thread-safe SQLite-backed LRU of refinement results."""
+
+    def __init__(self, path: Path | str) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open_default(cls) -> "RefinementResultCache":
+        """Open the cache in the user cache directory."""
+        return cls(ResourceManager.get_user_cache_dir("refinement") / "results.sqlite3")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, key: RefinementCacheKey) -> CachedRefinement | None:
+        """Return the cached refinement for ``key`` (and mark it recently used)."""
+        digest = key.digest()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, prompt_tokens, completion_tokens, total_tokens FROM refinement_results WHERE key = ?",
+                (digest,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE refinement_results SET last_used_at = ? WHERE key = ?", (time.time(), digest))
+            self._conn.commit()
+            self.hits += 1
+        return CachedRefinement(
+            content=row["content"],
+            prompt_tokens=row["prompt_tokens"],
+            completion_tokens=row["completion_tokens"],
+            total_tokens=row["total_tokens"],
+        )
+
+    def put(self, key: RefinementCacheKey, result: CachedRefinement, *, max_entries: int) -> None:
+        """Store ``result`` and evict least recently used entries beyond ``max_entries``."""
+        if max_entries <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO refinement_results
+                   (key, content, prompt_tokens, completion_tokens, total_tokens, created_at, last_used_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    key.digest(),
+                    result.content,
+                    result.prompt_tokens,
+                    result.completion_tokens,
+                    result.total_tokens,
+                    now,
+                    now,
+                ),
+            )
+            self._conn.execute(
+                """DELETE FROM refinement_results WHERE key IN (
+                       SELECT key FROM refinement_results ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                   )""",
+                (max_entries,),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM refinement_results").fetchone()[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM refinement_results")
+            self._conn.commit()
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                logger.debug("Refinement cache close failed (non-fatal)", exc_info=True)
+
+
+__all__ = [
+    "DETERMINISTIC_MAX_TEMPERATURE",
+    "CachedRefinement",
+    "RefinementCacheKey",
+    "RefinementResultCache",
+]
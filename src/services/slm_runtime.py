@@ -10,10 +10,17 @@ Manages the lifecycle of a CTranslate2 Generator-based refinement model:
 import logging
 import threading
 import time
-from typing import Callable, Optional
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 from src.core.settings import VociferousSettings, update_settings
+from src.refinement.chunking import ChunkPlan, plan_chunks
+from src.refinement.engine import GenerationCancelled
+from src.refinement.output_parser import GenerationResult
 from src.refinement.providers import (
+    BatchRefinementProvider,
     GenerationRequest,
     GenerationTaskKind,
     ReasoningPolicy,
@@ -21,11 +28,29 @@ from src.refinement.providers import (
     ResponseShape,
     describe_refinement_runtime,
     make_refinement_provider,
+    supports_batching,
 )
-from src.services.slm_types import SLMState
+from src.refinement.providers.remote_dispatch import AdaptiveConcurrency, RateLimiter, dispatch_in_order
+from src.refinement.selective import SelectivePlan, plan_selective_refinement
+from src.refinement.skip_check import should_skip_refinement
+from src.services.cpu_partition import SLM as SLM_ROLE
+from src.services.cpu_partition import engine_busy
+from src.services.provider_race import Contender, LatencyHistograms, hedge_delay, race
+from src.services.refinement_cache import CachedRefinement, RefinementCacheKey, RefinementResultCache
+from src.services.slm_scheduler import ExpirePolicy, SLMJobPreempted, SLMJobPriority, SLMScheduler
+from src.services.slm_types import RefinedText, SLMState
+
+if TYPE_CHECKING:
+    from src.services.model_residency import ModelResidencyManager
+    from src.services.warmup import WarmupResult
 
 logger = logging.getLogger(__name__)
 
+# The provider a refinement races against (refinement.race_providers).
+_RACE_PARTNERS = {"local_ct2": "groq", "lm_studio": "groq", "groq": "local_ct2"}
+# Input-length classes (words) of the refinement latency histograms.
+_LATENCY_SIZE_EDGES = (50.0, 200.0, 800.0)
+
 
 def describe_slm_runtime(
     settings: VociferousSettings,
@@ -52,21 +77,55 @@ class SLMRuntime:
     """
 
     _SLOW_INFERENCE_SECONDS = 15.0
+    # Seconds an interactive/auto refinement may wait in the queue before it
+    # fails with "engine busy". Background work never blocks it for long: it
+    # only waits behind the job currently running.
+    _REFINE_QUEUE_DEADLINE = 60.0
+    # Seconds a title/insight job may wait before it is moved to the idle-time
+    # backfill lane instead of competing with foreground work.
+    _CUSTOM_QUEUE_DEADLINE = 5.0
 
     def __init__(
         self,
         settings_provider: Callable[[], VociferousSettings],
         settings_updater: Callable[..., VociferousSettings] = update_settings,
-        on_state_changed: Optional[Callable[[SLMState], None]] = None,
-        on_error: Optional[Callable[[str], None]] = None,
-        on_text_ready: Optional[Callable[[str], None]] = None,
+        on_state_changed: Callable[[SLMState], None] | None = None,
+        on_error: Callable[[str], None] | None = None,
+        on_text_ready: Callable[[str], None] | None = None,
+        scheduler: SLMScheduler | None = None,
+        result_cache: RefinementResultCache | None = None,
+        residency: "ModelResidencyManager | None" = None,
     ) -> None:
         self._settings_provider = settings_provider
         self._settings_updater = settings_updater
         self._state = SLMState.DISABLED
-        self._engine: Optional[RefinementProvider] = None
+        self._engine: RefinementProvider | None = None
         self._lock = threading.Lock()
+        # Every inference goes through one priority queue (see slm_scheduler).
+        self._scheduler = scheduler or SLMScheduler()
         self._runtime_summary: dict[str, object] | None = None
+        # Persistent content-addressed store of past refinements; ``None``
+        # disables caching. Whether a result came from it travels with the
+        # result (``RefinedText.cached``).
+        self._result_cache = result_cache
+        # AIMD in-flight limit for remote bulk refinement; kept across bulk
+        # windows so a limit learned from 429s is not reset every window.
+        self._remote_concurrency: AdaptiveConcurrency | None = None
+        # Refinement latency per provider and text length, and the other
+        # provider loaded for refinement.race_providers, keyed by
+        # (provider, model_id). A refinement that provider won carries its
+        # runtime summary as provenance (``RefinedText.runtime``).
+        self._latency = LatencyHistograms(_LATENCY_SIZE_EDGES)
+        self._race_engine: tuple[tuple[str, str], RefinementProvider] | None = None
+        self._race_lock = threading.Lock()
+        # Applies the memory budget to model loads; ``evict()`` is its unload
+        # hook. Reloads after an eviction are serialized by ``_reload_lock``.
+        self._residency = residency
+        self._reload_lock = threading.Lock()
+        # Warm-up pass after the last load (see services.warmup); while it
+        # runs the state is still LOADING but refinement is accepted.
+        self._warmup: "WarmupResult | None" = None
+        self._warming_up = False
         self.last_error: str | None = None
 
         # Lifecycle callbacks invoked from the SLM worker thread.
@@ -85,17 +144,26 @@ class SLMRuntime:
             if self._on_state_changed:
                 self._on_state_changed(new_state)
 
+    @property
+    def is_warming_up(self) -> bool:
+        return self._warming_up
+
     def get_runtime_summary(self) -> dict[str, object] | None:
         if self._engine is not None:
             try:
                 self._runtime_summary = self._engine.get_runtime_summary()
             except Exception:
                 logger.debug("Failed to refresh live refinement runtime summary", exc_info=True)
-        return dict(self._runtime_summary) if self._runtime_summary else None
+        summary = dict(self._runtime_summary) if self._runtime_summary else None
+        if not summary:
+            return None
+        if self._warmup is not None:
+            summary.update(self._warmup.to_dict())
+        return summary
 
     def enable(self) -> None:
         """Enable the SLM runtime. Starts async model loading."""
-        if self.state not in (SLMState.DISABLED, SLMState.ERROR):
+        if self.state not in (SLMState.DISABLED, SLMState.ERROR, SLMState.UNLOADED):
             return
 
         self.state = SLMState.LOADING
@@ -118,8 +186,12 @@ class SLMRuntime:
         """
         self.state = SLMState.DISABLED
 
-    def _load_model_task(self) -> None:
-        """Background task to initialize the configured refinement provider."""
+    def _load_model_task(self, warm_up: bool = True) -> None:
+        """Background task to initialize the configured refinement provider.
+
+        With ``warm_up`` a short generation runs before the state becomes
+        READY (skipped for loads a waiting request triggered).
+        """
         try:
             s = self._settings_provider()
             if not s.refinement.enabled or (s.refinement.provider == "local_ct2" and not s.refinement.model_id):
@@ -139,7 +211,11 @@ class SLMRuntime:
             )
             start = time.perf_counter()
 
-            provider.load()
+            if self._residency is None:
+                provider.load()
+            else:
+                with self._residency.loading("slm"):
+                    provider.load()
 
             self._engine = provider
             self._runtime_summary = provider.get_runtime_summary()
@@ -154,6 +230,9 @@ class SLMRuntime:
                 self._runtime_summary.get("resolved_device"),
             )
 
+            if warm_up and s.residency.warmup_after_load:
+                self._warm_up(provider)
+
             self.state = SLMState.READY
 
         except Exception as e:
@@ -182,6 +261,123 @@ class SLMRuntime:
                     logger.debug("Refinement provider unload failed (non-fatal)")
                 self._engine = None
                 self._runtime_summary = None
+            with self._race_lock:
+                self._unload_race_engine()
+
+    def evict(self) -> None:
+        """Unload the model to free memory, keeping the runtime enabled.
+
+        The state becomes ``UNLOADED`` and the next inference reloads the
+        model first (``ensure_loaded``). Called by the residency manager.
+        """
+        with self._lock:
+            if self._engine is None:
+                return
+            logger.info("Unloading refinement provider (idle)...")
+            try:
+                self._engine.unload()
+            except Exception:
+                logger.debug("Refinement provider unload failed (non-fatal)")
+            self._engine = None
+            self._runtime_summary = None
+            self.state = SLMState.UNLOADED
+            with self._race_lock:
+                self._unload_race_engine()
+
+    def reload(self, warm_up: bool = True) -> None:
+        """Reload a model unloaded by ``evict``; no-op in any other state.
+
+        The state stays ``UNLOADED`` while loading, so refinement requested
+        meanwhile is accepted and waits for the reload instead of failing.
+        """
+        with self._reload_lock:
+            if self._engine is None and self.state == SLMState.UNLOADED:
+                self._load_model_task(warm_up=warm_up)
+
+    def ensure_loaded(self) -> None:
+        """Reload the model first if the residency manager unloaded it."""
+        if self._engine is None and self.state == SLMState.UNLOADED:
+            self.reload(warm_up=False)
+        if self._residency is not None:
+            self._residency.touch("slm")
+
+    def can_hot_swap(self) -> bool:
+        """Whether the configured model can load next to the one in service."""
+        s = self._settings_provider()
+        if not (s.residency.hot_swap and s.refinement.enabled):
+            return False
+        if self._engine is None or self.state not in (SLMState.READY, SLMState.INFERRING):
+            return False
+        return self._residency is None or self._residency.fits_alongside("slm")
+
+    def hot_swap(self) -> bool:
+        """Load the configured model next to the current one and swap it in.
+
+        Refinement keeps running on the current engine while the new one
+        loads and warms up. The swap takes ``_lock``, which every inference
+        holds for its whole call, so in-flight work drains on the old engine
+        first; queued jobs then run on the new one and the old engine is
+        unloaded. Returns False, with the current engine still in service,
+        if the load fails or there is no engine to replace.
+        """
+        from src.core.engine_status import normalize_engine_error
+
+        with self._reload_lock:
+            if self._engine is None:
+                return False
+            s = self._settings_provider()
+            try:
+                provider = make_refinement_provider(s)
+                if self._residency is None:
+                    provider.load()
+                else:
+                    with self._residency.loading("slm"):
+                        provider.load()
+            except Exception as e:
+                logger.error("New refinement model failed to load — keeping the current one: %s", e)
+                self.last_error = normalize_engine_error(e)
+                if self._on_error:
+                    self._on_error(self.last_error)
+                return False
+
+            if s.residency.warmup_after_load:
+                self._warm_up(provider)
+            with self._lock:
+                retired, self._engine = self._engine, provider
+                self._runtime_summary = provider.get_runtime_summary()
+                self.last_error = None
+            logger.info(
+                "Refinement model hot-swapped (provider=%s, model_id=%s)",
+                self._runtime_summary.get("provider"),
+                self._runtime_summary.get("model_id"),
+            )
+            if retired is not None:
+                try:
+                    retired.unload()
+                except Exception:
+                    logger.debug("Previous refinement provider unload failed (non-fatal)")
+            return True
+
+    def _warm_up(self, provider: RefinementProvider) -> None:
+        """Generate a few tokens as a preemptible bulk job, so real refinement stops it."""
+        from src.services.warmup import warm_up_slm
+
+        self._warming_up = True
+        try:
+            future = self._scheduler.submit(
+                lambda: warm_up_slm(provider, should_stop=self._scheduler.preempt_requested),
+                priority=SLMJobPriority.BULK,
+                label="warmup",
+                preemptible=True,
+            )
+            result = future.result()
+        except Exception:
+            logger.debug("SLM warm-up could not be scheduled", exc_info=True)
+            return
+        finally:
+            self._warming_up = False
+        if result is not None:
+            self._warmup = result
 
     def _log_inference_timing(self, operation: str, input_text: str, output_text: str, elapsed: float) -> None:
         """Emit support-useful timing context without logging user text."""
@@ -240,69 +436,677 @@ class SLMRuntime:
             "use_thinking": r.use_thinking,
         }
 
+    def submit_job(
+        self,
+        fn: Callable[[], Any],
+        *,
+        priority: SLMJobPriority,
+        label: str = "job",
+        coalesce_key: str | None = None,
+        deadline_s: float | None = None,
+        on_expire: ExpirePolicy = "fail",
+        on_done: Callable[[Future], None] | None = None,
+        preemptible: bool = False,
+    ) -> Future:
+        """Queue arbitrary SLM-bound work on the shared scheduler.
+
+        Background consumers (title generation, insights) submit their whole
+        task here; the ``*_sync`` methods they call from inside the job run
+        inline on the scheduler worker. A ``preemptible`` job is stopped
+        mid-generation when interactive work arrives and re-run afterwards.
+        """
+        return self._scheduler.submit(
+            fn,
+            priority=priority,
+            label=label,
+            coalesce_key=coalesce_key,
+            deadline_s=deadline_s,
+            on_expire=on_expire,
+            on_done=on_done,
+            preemptible=preemptible,
+        )
+
+    def running_priority(self) -> SLMJobPriority | None:
+        """Priority of the SLM job running now, or None when none is."""
+        return self._scheduler.running_priority()
+
+    def get_scheduler_metrics(self) -> dict[str, Any]:
+        """Queue depth and wait-time metrics for the shared SLM scheduler."""
+        return self._scheduler.metrics()
+
     def refine_text(self, text: str, level: int = 1, instructions: str = "") -> None:
-        """Submit text for refinement (runs in background thread)."""
+        """Submit text for refinement (runs on the scheduler worker)."""
+        self.ensure_loaded()
         if self.state != SLMState.READY:
             logger.warning("Refinement requested but SLM not ready.")
             return
 
         self.state = SLMState.INFERRING
-        t = threading.Thread(
-            target=self._inference_task,
-            args=(text, level, instructions),
-            daemon=True,
+        self._scheduler.submit(
+            lambda: self._inference_task(text, level, instructions),
+            priority=SLMJobPriority.INTERACTIVE_REFINE,
+            label="refine",
         )
-        t.start()
 
     def refine_text_sync(
-        self, text: str, level: int = 1, instructions: str = "", allow_skip: bool | None = None
+        self,
+        text: str,
+        level: int = 1,
+        instructions: str = "",
+        allow_skip: bool | None = None,
+        priority: SLMJobPriority = SLMJobPriority.INTERACTIVE_REFINE,
+        should_cancel: Callable[[], bool] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
     ) -> str:
-        """Synchronous refinement — blocks until complete. Returns refined text."""
+        """Synchronous refinement — blocks until complete. Returns refined text.
+
+        See ``refine_text_with_provenance``.
+        """
+        return self.refine_text_with_provenance(
+            text, level, instructions, allow_skip, priority, should_cancel, on_progress
+        ).content
+
+    def refine_text_with_provenance(
+        self,
+        text: str,
+        level: int = 1,
+        instructions: str = "",
+        allow_skip: bool | None = None,
+        priority: SLMJobPriority = SLMJobPriority.INTERACTIVE_REFINE,
+        should_cancel: Callable[[], bool] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> RefinedText:
+        """Synchronous refinement returning the text with its token usage and cache provenance.
+
+        Raises ``TimeoutError`` (``SLMJobExpired``) when the job could not
+        start within ``_REFINE_QUEUE_DEADLINE`` seconds, and
+        ``GenerationCancelled`` when ``should_cancel`` stopped a local
+        generation mid-decode. Background-priority refinements are
+        preemptible: they yield to interactive work and restart afterwards.
+        When the text is split (selective or chunked refinement),
+        ``on_progress(done, total)`` fires as each part finishes.
+        """
+        self.ensure_loaded()
         if not self._engine:
             raise RuntimeError("Engine not loaded.")
 
-        previous_state = self.state
+        cache_key = self._result_cache_key(text, level, instructions, allow_skip)
+        cached = self._cached_refinement(cache_key)
+        if cached is not None:
+            return RefinedText.from_cache(cached)
 
-        # Mark busy before lock acquisition so low-priority background jobs
-        # do not race and starve user-triggered refinement.
-        self.state = SLMState.INFERRING
+        future = self._scheduler.submit(
+            lambda: self._run_refinement(text, level, instructions, allow_skip, should_cancel, cache_key, on_progress),
+            priority=priority,
+            label="auto-refine" if priority == SLMJobPriority.AUTO_REFINE else "refine",
+            deadline_s=self._REFINE_QUEUE_DEADLINE,
+            preemptible=priority > SLMScheduler.PREEMPT_AT,
+        )
+        return future.result()
+
+    def _run_refinement(
+        self,
+        text: str,
+        level: int,
+        instructions: str,
+        allow_skip: bool | None,
+        should_cancel: Callable[[], bool] | None = None,
+        cache_key: RefinementCacheKey | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> RefinedText:
+        with self._engine_session() as engine:
+            params = self._sampling_params_for_level(level)
+            should_allow_skip = (
+                self._settings_provider().refinement.smart_refinement if allow_skip is None else allow_skip
+            )
+            options = self._generation_options(instructions, params)
+            plan = self._refinement_plan(text)
+            start = time.perf_counter()
+            winner_runtime: dict[str, object] | None = None
+            race_providers = plan is None and self._settings_provider().refinement.race_providers
+            if plan is not None:
+                result = self._refine_regions(engine, plan, options, should_cancel, on_progress)
+            elif race_providers:
+                result, winner_runtime = self._race_refinement(engine, text, should_allow_skip, options, should_cancel)
+            else:
+                result = engine.refine(
+                    text,
+                    allow_skip=should_allow_skip,
+                    should_cancel=self._cancel_check(engine, should_cancel),
+                    **options,
+                )
+            if winner_runtime is None:  # the cache key names the configured provider
+                self._store_refinement(cache_key, result)
+            elapsed = time.perf_counter() - start
+            if plan is None and not race_providers:  # raced calls record their own latency
+                self._latency.record(self._settings_provider().refinement.provider, len(text.split()), elapsed)
+            self._log_inference_timing("refinement", text, result.content, elapsed)
+        return RefinedText.from_generation(result, runtime=winner_runtime)
+
+    def _race_refinement(
+        self,
+        engine: RefinementProvider,
+        text: str,
+        allow_skip: bool,
+        options: dict[str, Any],
+        should_cancel: Callable[[], bool] | None,
+    ) -> tuple[GenerationResult, dict[str, object] | None]:
+        """Refine ``text`` on ``engine``, hedged by the other provider (``refinement.race_providers``).
+
+        Returns the result and, when the other provider won, its runtime
+        summary. Runs inside the engine session. A losing local generation is
+        cancelled and waited for, so the engine is idle when the job ends; a
+        losing remote request is abandoned. Preemption still requeues the job.
+        """
+        r = self._settings_provider().refinement
+        primary_id = r.provider
+        secondary_id = _RACE_PARTNERS[primary_id]
+        words = len(text.split())
 
-        acquired = self._lock.acquire(timeout=self._REFINE_LOCK_TIMEOUT)
-        if not acquired:
-            self.state = previous_state
-            raise TimeoutError(f"Timed out waiting for SLM lock after {self._REFINE_LOCK_TIMEOUT:.0f}s")
+        def refine_on(provider: RefinementProvider, cancel: threading.Event) -> tuple[Any, GenerationResult]:
+            def cancelled() -> bool:
+                return cancel.is_set() or (should_cancel is not None and should_cancel())
 
+            result = provider.refine(
+                text, allow_skip=allow_skip, should_cancel=self._cancel_check(provider, cancelled), **options
+            )
+            return provider, result
+
+        outcome = race(
+            Contender(
+                primary_id,
+                lambda cancel: refine_on(engine, cancel),
+                wait_on_cancel=engine.supports_cancellation is True,
+            ),
+            Contender(
+                secondary_id,
+                lambda cancel: refine_on(self._race_partner(secondary_id), cancel),
+                wait_on_cancel=secondary_id == "local_ct2",
+            ),
+            hedge_s=hedge_delay(self._latency, primary_id, words, r.race_hedge_ms),
+            is_valid=lambda value: bool(value[1].content.strip()),
+            on_latency=lambda provider_id, seconds: self._latency.record(provider_id, words, seconds),
+            abort_on=(GenerationCancelled,),
+        )
+        winner, result = outcome.value
+        return result, (winner.get_runtime_summary() if winner is not engine else None)
+
+    def _race_partner(self, provider_id: str) -> RefinementProvider:
+        """The refinement provider ``provider_id`` for racing, loaded on first use and kept."""
+        s = self._settings_provider()
+        partner_settings = s.model_copy(
+            update={"refinement": s.refinement.model_copy(update={"provider": provider_id})}
+        )
+        model_id = s.refinement.model_id if provider_id == "local_ct2" else getattr(s.refinement, provider_id).model_id
+        with self._race_lock:
+            if self._race_engine is not None and self._race_engine[0] == (provider_id, model_id):
+                return self._race_engine[1]
+            self._unload_race_engine()
+            logger.info(
+                "Loading %s (%s) to race refinement against %s...", provider_id, model_id, s.refinement.provider
+            )
+            provider = make_refinement_provider(partner_settings)
+            if self._residency is None or provider_id != "local_ct2":
+                provider.load()
+            else:
+                with self._residency.loading("slm"):
+                    provider.load()
+            self._race_engine = ((provider_id, model_id), provider)
+            return provider
+
+    def _unload_race_engine(self) -> None:
+        if self._race_engine is None:
+            return
+        _, provider = self._race_engine
+        self._race_engine = None
         try:
-            self.state = SLMState.INFERRING
-            if not self._engine:
-                raise RuntimeError("Engine not loaded.")
+            provider.unload()
+        except Exception:
+            logger.debug("Racing refinement provider unload failed (non-fatal)")
+
+    def _result_cache_key(
+        self, text: str, level: int, instructions: str, allow_skip: bool | None
+    ) -> RefinementCacheKey | None:
+        """Return the cache key for a refinement, or ``None`` when it must not be cached.
+
+        Sampled (non-greedy) settings are only cached when the user opted in.
+        """
+        engine = self._engine
+        r = self._settings_provider().refinement
+        if self._result_cache is None or engine is None or r.result_cache_max_entries <= 0:
+            return None
+        params = self._sampling_params_for_level(level)
+        runtime = self._runtime_summary if isinstance(self._runtime_summary, dict) else {}
+        key = RefinementCacheKey(
+            text=text,
+            instructions=instructions,
+            provider_id=str(runtime.get("provider") or r.provider),
+            model_id=str(runtime.get("model_id") or r.model_id),
+            temperature=float(params["temperature"]),
+            top_p=float(params["top_p"]),
+            top_k=int(params["top_k"]),
+            repetition_penalty=float(params["repetition_penalty"]),
+            use_thinking=bool(params["use_thinking"]),
+            allow_skip=bool(r.smart_refinement if allow_skip is None else allow_skip),
+            system_prompt=r.system_prompt,
+            invariants=tuple(r.invariants),
+            selective_threshold=r.selective_threshold if r.selective_refinement else None,
+            chunk_window=(
+                (r.chunk_max_tokens, r.chunk_overlap_tokens) if 0 < r.chunk_threshold_words < len(text.split()) else ()
+            ),
+        )
+        if not key.deterministic and not r.cache_sampled_results:
+            return None
+        return key
+
+    def _cached_refinement(self, key: RefinementCacheKey | None) -> CachedRefinement | None:
+        if key is None or self._result_cache is None:
+            return None
+        try:
+            cached = self._result_cache.get(key)
+        except Exception:
+            logger.warning("Refinement cache lookup failed (non-fatal)", exc_info=True)
+            return None
+        if cached is not None:
+            logger.info("SLM refinement served from cache (input_chars=%d)", len(key.text))
+        return cached
+
+    def _store_refinement(self, key: RefinementCacheKey | None, result: GenerationResult) -> None:
+        if key is None or self._result_cache is None:
+            return
+        try:
+            self._result_cache.put(
+                key,
+                CachedRefinement(
+                    content=result.content,
+                    prompt_tokens=result.prompt_tokens,
+                    completion_tokens=result.completion_tokens,
+                    total_tokens=result.total_tokens,
+                ),
+                max_entries=self._settings_provider().refinement.result_cache_max_entries,
+            )
+        except Exception:
+            logger.warning("Refinement cache store failed (non-fatal)", exc_info=True)
+
+    @staticmethod
+    def _generation_options(instructions: str, params: dict[str, float | int | bool]) -> dict[str, Any]:
+        return {
+            "instructions": instructions,
+            "temperature": float(params["temperature"]),
+            "top_p": float(params["top_p"]),
+            "top_k": int(params["top_k"]),
+            "repetition_penalty": float(params["repetition_penalty"]),
+            "use_thinking": bool(params["use_thinking"]),
+        }
+
+    def _refinement_plan(self, text: str) -> SelectivePlan | ChunkPlan | None:
+        """Return how to split ``text`` for refinement, or ``None`` to send it whole.
+
+        Selective refinement wins when it leaves some text verbatim; a text
+        that is dirty throughout (or with selective mode off) is chunked once
+        it is longer than ``chunk_threshold_words``.
+        """
+        r = self._settings_provider().refinement
+        if r.selective_refinement:
+            selective = plan_selective_refinement(text, threshold=r.selective_threshold)
+            if selective.is_partial or not selective.regions:
+                return selective
+        if 0 < r.chunk_threshold_words < len(text.split()):
+            chunked = plan_chunks(text, max_tokens=r.chunk_max_tokens, overlap_tokens=r.chunk_overlap_tokens)
+            if len(chunked.chunks) > 1:
+                return chunked
+        return None
+
+    def _refine_regions(
+        self,
+        engine: RefinementProvider,
+        plan: SelectivePlan | ChunkPlan,
+        options: dict[str, Any],
+        should_cancel: Callable[[], bool] | None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> GenerationResult:
+        """Refine a plan's regions and stitch them back together.
+
+        Local engines get one batched call; remote providers that accept
+        parallel requests get up to ``chunk_concurrency`` at once; anything
+        else goes one call at a time. Usage is summed across calls.
+        """
+        regions = plan.regions
+        total = len(regions)
+        done = 0
+        progress_lock = threading.Lock()
+
+        def progress() -> None:
+            nonlocal done
+            with progress_lock:
+                done += 1
+                current = done
+            if on_progress is not None:
+                on_progress(current, total)
+
+        def refine_one(region: str) -> GenerationResult:
+            result = engine.refine(
+                region, allow_skip=False, should_cancel=self._cancel_check(engine, should_cancel), **options
+            )
+            progress()
+            return result
+
+        results: list[GenerationResult | None]
+        concurrency = max(1, int(self._settings_provider().refinement.chunk_concurrency))
+        if total > 1 and supports_batching(engine):
+            results = list(
+                engine.refine_batch(
+                    regions,
+                    allow_skip=False,
+                    max_batch_size=self.bulk_batch_size(),
+                    on_result=lambda _index, _result, _elapsed: progress(),
+                    should_cancel=self._with_preemption(should_cancel),
+                    **options,
+                )
+            )
+            if any(result is None for result in results):
+                raise GenerationCancelled("Split refinement cancelled")
+        elif total > 1 and concurrency > 1 and getattr(engine, "supports_concurrent_requests", False) is True:
+            with ThreadPoolExecutor(max_workers=min(total, concurrency), thread_name_prefix="slm-chunk") as pool:
+                results = list(pool.map(refine_one, regions))
+        else:
+            results = [refine_one(region) for region in regions]
+        combined = self._combine_region_results(plan, results)
+        if isinstance(plan, ChunkPlan):
+            logger.info("SLM chunked refinement stitched %d chunk(s) (%d chars)", total, len(combined.content))
+        else:
+            logger.info(
+                "SLM selective refinement sent %d region(s), %d/%d chars (%.0f%%)",
+                total,
+                plan.refine_chars,
+                plan.total_chars,
+                100.0 * plan.refine_chars / plan.total_chars if plan.total_chars else 0.0,
+            )
+        return combined
+
+    def _combine_region_results(
+        self, plan: SelectivePlan | ChunkPlan, results: Sequence[GenerationResult | None]
+    ) -> GenerationResult:
+        done = [result for result in results if result is not None]
+        # Usage is summed over every region; the provider's own ``last_usage``
+        # only covers the last one.
+        return GenerationResult(
+            content=plan.stitch([result.content if result is not None else None for result in results]),
+            prompt_tokens=sum(result.prompt_tokens for result in done),
+            completion_tokens=sum(result.completion_tokens for result in done),
+            total_tokens=sum(result.total_tokens for result in done),
+        )
+
+    @property
+    def latency(self) -> LatencyHistograms:
+        return self._latency
+
+    def bulk_batch_size(self) -> int:
+        """Return the batch size bulk refinement should use (1 = sequential).
+
+        Local engines batch ``bulk_batch_size`` transcripts per generate call;
+        remote providers that accept parallel requests report their
+        ``bulk_concurrency`` (requests in flight). Anything else reports 1.
+        """
+        engine = self._engine
+        if engine is None:
+            return 1
+        refinement = self._settings_provider().refinement
+        if supports_batching(engine):
+            return max(1, int(refinement.bulk_batch_size))
+        if getattr(engine, "supports_concurrent_requests", False) is True:
+            provider_settings = getattr(refinement, refinement.provider, None)
+            return max(1, int(getattr(provider_settings, "bulk_concurrency", 1)))
+        return 1
+
+    def refine_batch_sync(
+        self,
+        texts: Sequence[str],
+        level: int = 1,
+        instructions: str = "",
+        allow_skip: bool | None = None,
+        *,
+        on_result: Callable[[int, RefinedText, float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> list[str | None]:
+        """Synchronous batched refinement — blocks until every bucket finishes.
+
+        Runs in the bulk lane, so it waits behind any interactive work.
+        ``on_result(index, refined, elapsed_s)`` fires per item on the
+        scheduler worker, so callers can persist results (and their
+        provenance) incrementally.
+        Returns refined texts in input order; ``None`` marks cancelled items.
+        Items already in the result cache are delivered before the job is
+        queued and never reach the engine.
+
+        The job is preemptible: an interactive refinement stops it
+        mid-bucket, and on re-run only the items not yet delivered are
+        refined again.
+        """
+        self.ensure_loaded()
+        if not self._engine:
+            raise RuntimeError("Engine not loaded.")
+
+        refined: list[str | None] = [None] * len(texts)
+        cache_keys = [self._result_cache_key(text, level, instructions, allow_skip) for text in texts]
+        for index, key in enumerate(cache_keys):
+            cached = self._cached_refinement(key)
+            if cached is not None:
+                refined[index] = cached.content
+                if on_result is not None:
+                    on_result(index, RefinedText.from_cache(cached), 0.0)
+        if all(text is not None for text in refined):
+            return list(refined)
+
+        def job() -> list[str | None]:
+            pending = [index for index, text in enumerate(refined) if text is None]
+
+            def deliver(sub_index: int, result: RefinedText, elapsed: float) -> None:
+                index = pending[sub_index]
+                refined[index] = result.content
+                if on_result is not None:
+                    on_result(index, result, elapsed)
+
+            self._run_refine_batch(
+                [texts[index] for index in pending],
+                level,
+                instructions,
+                allow_skip,
+                deliver,
+                should_cancel,
+                [cache_keys[index] for index in pending],
+            )
+            if self._scheduler.preempt_requested() and any(text is None for text in refined):
+                raise SLMJobPreempted()
+            return list(refined)
+
+        future = self._scheduler.submit(
+            job,
+            priority=SLMJobPriority.BULK,
+            label=f"bulk-refine[{len(texts)}]",
+            preemptible=True,
+        )
+        return future.result()
+
+    def _run_refine_batch(
+        self,
+        texts: Sequence[str],
+        level: int,
+        instructions: str,
+        allow_skip: bool | None,
+        on_result: Callable[[int, RefinedText, float], None] | None,
+        should_cancel: Callable[[], bool] | None,
+        cache_keys: Sequence[RefinementCacheKey | None] = (),
+    ) -> list[str | None]:
+        with self._engine_session() as engine:
             params = self._sampling_params_for_level(level)
             should_allow_skip = (
                 self._settings_provider().refinement.smart_refinement if allow_skip is None else allow_skip
             )
+            batch_size = self.bulk_batch_size()
+
+            def forward(index: int, result: GenerationResult, elapsed: float) -> None:
+                if index < len(cache_keys):
+                    self._store_refinement(cache_keys[index], result)
+                if on_result is not None:
+                    on_result(index, RefinedText.from_generation(result), elapsed)
+
             start = time.perf_counter()
-            result = self._engine.refine(
-                text,
-                instructions=instructions,
-                temperature=float(params["temperature"]),
-                top_p=float(params["top_p"]),
-                top_k=int(params["top_k"]),
-                repetition_penalty=float(params["repetition_penalty"]),
-                use_thinking=bool(params["use_thinking"]),
-                allow_skip=should_allow_skip,
+            options = self._generation_options(instructions, params)
+            plans = [self._refinement_plan(text) for text in texts]
+            if not supports_batching(engine):
+                results = self._dispatch_remote_batch(
+                    engine,
+                    texts,
+                    plans,
+                    options,
+                    should_allow_skip,
+                    batch_size,
+                    forward,
+                    self._with_preemption(should_cancel),
+                )
+            elif any(plan is not None for plan in plans):
+                results = self._refine_batch_in_regions(
+                    engine,
+                    texts,
+                    plans,
+                    options,
+                    should_allow_skip,
+                    batch_size,
+                    forward,
+                    self._with_preemption(should_cancel),
+                )
+            else:
+                results = engine.refine_batch(
+                    texts,
+                    allow_skip=should_allow_skip,
+                    max_batch_size=batch_size,
+                    on_result=forward,
+                    should_cancel=self._with_preemption(should_cancel),
+                    **options,
+                )
+            elapsed = time.perf_counter() - start
+            done = sum(result is not None for result in results)
+            logger.info(
+                "SLM batched refinement completed %d/%d item(s) in %.2fs (batch_size=%d, %.1f transcripts/min)",
+                done,
+                len(texts),
+                elapsed,
+                batch_size,
+                done * 60.0 / elapsed if elapsed > 0 else 0.0,
             )
-            self._log_inference_timing("refinement", text, result.content, time.perf_counter() - start)
-        finally:
-            self._lock.release()
-            self.state = SLMState.READY if self._engine else previous_state
-        return result.content
+        return [result.content if result is not None else None for result in results]
+
+    def _dispatch_remote_batch(
+        self,
+        engine: RefinementProvider,
+        texts: Sequence[str],
+        plans: Sequence[SelectivePlan | ChunkPlan | None],
+        options: dict[str, Any],
+        allow_skip: bool,
+        max_concurrency: int,
+        forward: Callable[[int, GenerationResult, float], None],
+        should_cancel: Callable[[], bool],
+    ) -> list[GenerationResult | None]:
+        """Refine transcripts on a remote provider with several requests in flight.
+
+        The provider's rate limiter paces each request; the in-flight limit
+        backs off on 429s and ramps up on success. ``forward`` still sees
+        results strictly in input order, so bulk commits stay ordered.
+        """
+        if self._remote_concurrency is None or self._remote_concurrency.maximum != max_concurrency:
+            self._remote_concurrency = AdaptiveConcurrency(max_concurrency)
+        limiter = getattr(engine, "rate_limiter", None)
+
+        def refine_one(index: int) -> GenerationResult:
+            plan = plans[index]
+            if plan is not None:
+                return self._refine_regions(engine, plan, options, should_cancel)
+            return engine.refine(
+                texts[index], allow_skip=allow_skip, should_cancel=self._cancel_check(engine, should_cancel), **options
+            )
+
+        return dispatch_in_order(
+            range(len(texts)),
+            refine_one,
+            concurrency=self._remote_concurrency,
+            on_result=forward,
+            should_stop=should_cancel,
+            throttle_count=(lambda: limiter.throttle_count) if isinstance(limiter, RateLimiter) else None,
+        )
 
-    # Maximum seconds to wait for the inference lock before giving up.
-    # Prevents low-priority tasks (title gen) from blocking behind long
-    # thinking-mode refinements.
-    _CUSTOM_LOCK_TIMEOUT = 5.0
-    # Maximum seconds refinement will wait for the shared SLM lock.
-    _REFINE_LOCK_TIMEOUT = 60.0
+    def _refine_batch_in_regions(
+        self,
+        engine: BatchRefinementProvider,
+        texts: Sequence[str],
+        plans: Sequence[SelectivePlan | ChunkPlan | None],
+        options: dict[str, Any],
+        allow_skip: bool,
+        batch_size: int,
+        forward: Callable[[int, GenerationResult, float], None],
+        should_cancel: Callable[[], bool],
+    ) -> list[GenerationResult | None]:
+        """Batch the regions of every transcript through one ``refine_batch`` call.
+
+        Transcripts without a plan are sent whole, as a single region. A
+        transcript is delivered through ``forward`` as soon as its last
+        region finishes; those with nothing to refine are delivered up front.
+        """
+        owners: list[tuple[int, int]] = []
+        regions: list[str] = []
+        region_results: list[list[GenerationResult | None]] = []
+        elapsed_by_item = [0.0] * len(texts)
+        results: list[GenerationResult | None] = [None] * len(texts)
+        for index, (text, plan) in enumerate(zip(texts, plans)):
+            if plan is not None:
+                item_regions = plan.regions
+            elif allow_skip and should_skip_refinement(text):
+                item_regions = []
+            else:
+                item_regions = [text]
+            region_results.append([None] * len(item_regions))
+            for slot, region in enumerate(item_regions):
+                owners.append((index, slot))
+                regions.append(region)
+
+        def complete(index: int) -> None:
+            plan = plans[index]
+            if plan is not None:
+                results[index] = self._combine_region_results(plan, region_results[index])
+            elif region_results[index]:
+                results[index] = region_results[index][0]
+            else:
+                results[index] = GenerationResult(content=texts[index])
+            forward(index, results[index], elapsed_by_item[index])
+
+        for index, item_results in enumerate(region_results):
+            if not item_results:
+                complete(index)
+
+        def on_region(flat_index: int, result: GenerationResult, elapsed: float) -> None:
+            index, slot = owners[flat_index]
+            region_results[index][slot] = result
+            elapsed_by_item[index] += elapsed
+            if all(item is not None for item in region_results[index]):
+                complete(index)
+
+        if regions:
+            engine.refine_batch(
+                regions,
+                allow_skip=False,
+                max_batch_size=batch_size,
+                on_result=on_region,
+                should_cancel=should_cancel,
+                **options,
+            )
+        return results
+
+    _TASK_PRIORITIES = {
+        GenerationTaskKind.TITLE: SLMJobPriority.RETITLE,
+        GenerationTaskKind.ANALYTICS: SLMJobPriority.INSIGHT,
+        GenerationTaskKind.REFINEMENT: SLMJobPriority.INTERACTIVE_REFINE,
+        GenerationTaskKind.FREEFORM: SLMJobPriority.INTERACTIVE_REFINE,
+    }
 
     def generate_custom_sync(
         self,
@@ -318,64 +1122,92 @@ class SLMRuntime:
     ) -> str:
         """Synchronous freeform generation — blocks until complete. Returns generated text.
 
-        Uses a short lock timeout so callers (title gen, insight gen) don't
-        block for minutes behind a long thinking-mode refinement.
+        Called from a scheduler job (title gen, insight gen) this runs inline.
+        Called from any other thread it is queued by task kind; title and
+        analytics work that cannot start promptly is deferred to the backfill
+        lane rather than dropped.
         """
-        acquired = self._lock.acquire(timeout=self._CUSTOM_LOCK_TIMEOUT)
-        if not acquired:
-            logger.warning(
-                "generate_custom_sync: could not acquire lock within %.1fs (SLM busy with refinement)",
-                self._CUSTOM_LOCK_TIMEOUT,
-            )
-            return ""
-        previous_state = self.state
-        self.state = SLMState.INFERRING
-        try:
-            if not self._engine:
-                raise RuntimeError("Engine not loaded.")
-            request = request or GenerationRequest.for_custom(
-                visible_output_tokens=max_tokens,
-                use_thinking=use_thinking,
-                task_kind=task_kind,
-                reasoning_policy=reasoning_policy,
-                response_shape=response_shape,
-            )
+        self.ensure_loaded()
+        request = request or GenerationRequest.for_custom(
+            visible_output_tokens=max_tokens,
+            use_thinking=use_thinking,
+            task_kind=task_kind,
+            reasoning_policy=reasoning_policy,
+            response_shape=response_shape,
+        )
+        priority = self._TASK_PRIORITIES.get(request.task_kind, SLMJobPriority.INTERACTIVE_REFINE)
+        background = priority in (SLMJobPriority.RETITLE, SLMJobPriority.INSIGHT)
+        future = self._scheduler.submit(
+            lambda: self._run_custom_generation(system_prompt, user_prompt, temperature, request),
+            priority=priority,
+            label=f"custom-{request.task_kind.value}",
+            deadline_s=self._CUSTOM_QUEUE_DEADLINE if background else self._REFINE_QUEUE_DEADLINE,
+            on_expire="defer" if background else "fail",
+            preemptible=background,
+        )
+        return future.result()
+
+    def _run_custom_generation(
+        self, system_prompt: str, user_prompt: str, temperature: float, request: GenerationRequest
+    ) -> str:
+        with self._engine_session() as engine:
             start = time.perf_counter()
-            result = self._engine.generate_custom(
+            result = engine.generate_custom(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 max_tokens=request.visible_output_tokens,
                 temperature=temperature,
                 use_thinking=request.use_thinking,
                 request=request,
+                should_cancel=self._cancel_check(engine, None),
             )
             self._log_inference_timing("custom-generation", user_prompt, result.content, time.perf_counter() - start)
-        finally:
-            self._lock.release()
-            self.state = SLMState.READY if self._engine else previous_state
         return result.content
 
+    @contextmanager
+    def _engine_session(self) -> Iterator[RefinementProvider]:
+        """Hold the engine lock and INFERRING state for one inference call.
+
+        A generation stopped because the scheduler asked the running job to
+        yield surfaces as ``SLMJobPreempted`` so the job is requeued.
+        """
+        previous_state = self.state
+        with self._lock:
+            engine = self._engine
+            if not engine:
+                raise RuntimeError("Engine not loaded.")
+            self.state = SLMState.INFERRING
+            try:
+                with engine_busy(SLM_ROLE):
+                    yield engine
+            except GenerationCancelled as exc:
+                if self._scheduler.preempt_requested():
+                    raise SLMJobPreempted() from exc
+                raise
+            finally:
+                self.state = SLMState.READY if self._engine else previous_state
+
+    def _with_preemption(self, should_cancel: Callable[[], bool] | None) -> Callable[[], bool]:
+        """Combine a caller's cancel check with the scheduler's preemption request."""
+        preempt_requested = self._scheduler.preempt_requested
+        if should_cancel is None:
+            return preempt_requested
+        return lambda: should_cancel() or preempt_requested()
+
+    def _cancel_check(
+        self, engine: RefinementProvider, should_cancel: Callable[[], bool] | None
+    ) -> Callable[[], bool] | None:
+        """``should_cancel`` for providers that can stop mid-decode (local CT2 only)."""
+        if engine.supports_cancellation is not True:
+            return None
+        return self._with_preemption(should_cancel)
+
     def _inference_task(self, text: str, level: int, instructions: str = "") -> None:
         try:
-            with self._lock:
-                if not self._engine:
-                    raise RuntimeError("Engine disappeared during inference.")
-                params = self._sampling_params_for_level(level)
-                start = time.perf_counter()
-                result = self._engine.refine(
-                    text,
-                    instructions=instructions,
-                    temperature=float(params["temperature"]),
-                    top_p=float(params["top_p"]),
-                    top_k=int(params["top_k"]),
-                    repetition_penalty=float(params["repetition_penalty"]),
-                    use_thinking=bool(params["use_thinking"]),
-                    allow_skip=self._settings_provider().refinement.smart_refinement,
-                )
-                self._log_inference_timing("refinement", text, result.content, time.perf_counter() - start)
+            content = self._run_refinement(text, level, instructions, None).content
 
             if self._on_text_ready:
-                self._on_text_ready(result.content)
+                self._on_text_ready(content)
 
             self.state = SLMState.READY
         except Exception as e:
@@ -394,6 +1226,10 @@ class SLMRuntime:
         except Exception:
             logger.exception("Failed to persist new model id to config")
 
+        if self.can_hot_swap():
+            threading.Thread(target=self.hot_swap, daemon=True, name="slm-hot-swap").start()
+            return
+
         self.disable()
 
         s = self._settings_provider()
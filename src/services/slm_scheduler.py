@@ -0,0 +1,397 @@
+"""
+SLM Scheduler — single-worker priority queue for the shared SLM.
+
+Every consumer of the refinement model (interactive refine, auto-refine,
+auto-retitle, analytics insight, bulk refinement) submits a job here instead
+of racing for a lock. One worker thread runs jobs in priority order, so a
+user-triggered refinement only ever waits behind the job already running,
+and background work is queued instead of silently dropped.
+
+Semantics:
+- Priority lanes (``SLMJobPriority``), FIFO within a lane.
+- Coalescing: submitting with the ``coalesce_key`` of a job that has not
+  started yet replaces that job's work (latest wins). Every caller's future
+  resolves with the surviving job's result.
+- Deadlines: a job not started by its deadline either fails with
+  ``SLMJobExpired`` (a ``TimeoutError``) or is deferred to the backfill lane.
+- Backfill lane: deferred jobs run only once the foreground queue is empty
+  and the SLM has been idle for ``idle_backfill_s``.
+- Preemption: a job submitted as ``preemptible`` is asked to stop when a
+  job at ``PREEMPT_AT`` priority or more urgent arrives. The job polls
+  ``preempt_requested()`` (local generation checks it every token) and
+  raises ``SLMJobPreempted``; it is then requeued ahead of its lane and
+  re-run once the urgent work is done.
+- Metrics: queue depth per lane plus wait-time statistics per priority.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Literal
+
+from src.services.scheduler_stats import WaitStats
+
+logger = logging.getLogger(__name__)
+
+ExpirePolicy = Literal["fail", "defer"]
+
+
+class SLMJobPriority(IntEnum):
+    """Scheduling lanes, most urgent first."""
+
+    INTERACTIVE_REFINE = 0
+    AUTO_REFINE = 1
+    RETITLE = 2
+    INSIGHT = 3
+    BULK = 4
+
+
+class SLMJobExpired(TimeoutError):
+    """Raised through a job's future when it was not started before its deadline."""
+
+
+class SLMJobPreempted(BaseException):
+    """Raised by a preemptible job that stopped early so urgent work can run.
+
+    Derives from ``BaseException`` (like ``asyncio.CancelledError``) so that
+    broad ``except Exception`` handlers inside background jobs let it reach
+    the scheduler, which requeues the job instead of failing its future.
+    """
+
+
+@dataclass(slots=True, eq=False)
+class _Job:
+    seq: int
+    priority: SLMJobPriority
+    label: str
+    fn: Callable[[], Any]
+    submitted_at: float
+    deadline: float | None
+    on_expire: ExpirePolicy
+    coalesce_key: str | None
+    futures: list[Future] = field(default_factory=list)
+    deferred: bool = False
+    preemptible: bool = False
+    started: bool = False
+
+
+class SLMScheduler:
+    """Runs SLM jobs one at a time on a dedicated worker thread, by priority."""
+
+    # Jobs at this priority or more urgent preempt a running preemptible job.
+    PREEMPT_AT = SLMJobPriority.AUTO_REFINE
+
+    def __init__(self, *, idle_backfill_s: float = 2.0, name: str = "slm-scheduler") -> None:
+        self._idle_backfill_s = idle_backfill_s
+        self._name = name
+        self._cond = threading.Condition()
+        self._pending: list[_Job] = []
+        self._running: _Job | None = None
+        self._preempt_requested = False
+        self._worker: threading.Thread | None = None
+        self._monitor: threading.Thread | None = None
+        self._stopped = False
+        self._seq = 0
+        self._idle_since = time.monotonic()
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "expired": 0,
+            "deferred": 0,
+            "coalesced": 0,
+            "preempted": 0,
+        }
+        self._wait_stats = {priority: WaitStats() for priority in SLMJobPriority}
+
+    # ── Public API ──────────────────────────────────────────────────────────
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        *,
+        priority: SLMJobPriority,
+        label: str = "job",
+        coalesce_key: str | None = None,
+        deadline_s: float | None = None,
+        on_expire: ExpirePolicy = "fail",
+        on_done: Callable[[Future], None] | None = None,
+        preemptible: bool = False,
+    ) -> Future:
+        """Queue ``fn`` and return a Future for its result.
+
+        ``deadline_s`` bounds how long the job may wait to *start*; what
+        happens afterwards is chosen by ``on_expire``. ``on_done`` is attached
+        as a done-callback and runs on the worker thread. A ``preemptible``
+        job may be stopped and re-run later (see ``preempt_requested``), so
+        its ``fn`` must be safe to call again.
+
+        Jobs submitted from the worker thread itself run inline — a job that
+        calls back into the runtime must not wait on its own queue.
+        """
+        future: Future = Future()
+        if on_done is not None:
+            future.add_done_callback(on_done)
+
+        if self.in_worker():
+            self._run_inline(fn, future)
+            return future
+
+        now = time.monotonic()
+        deadline = now + deadline_s if deadline_s is not None else None
+        with self._cond:
+            if self._stopped:
+                future.set_exception(RuntimeError("SLM scheduler is shut down."))
+                return future
+            self._counters["submitted"] += 1
+
+            existing = self._find_pending_locked(coalesce_key)
+            if existing is not None:
+                existing.fn = fn
+                existing.futures.append(future)
+                existing.priority = min(existing.priority, priority)
+                existing.label = label
+                existing.deadline = deadline
+                existing.on_expire = on_expire
+                existing.deferred = False
+                self._counters["coalesced"] += 1
+                logger.debug("SLM scheduler: coalesced %s into pending job #%d", label, existing.seq)
+            else:
+                self._seq += 1
+                self._pending.append(
+                    _Job(
+                        seq=self._seq,
+                        priority=priority,
+                        label=label,
+                        fn=fn,
+                        submitted_at=now,
+                        deadline=deadline,
+                        on_expire=on_expire,
+                        coalesce_key=coalesce_key,
+                        futures=[future],
+                        preemptible=preemptible,
+                    )
+                )
+            self._maybe_preempt_locked(priority)
+            self._ensure_worker_locked()
+            self._cond.notify_all()
+        return future
+
+    def in_worker(self) -> bool:
+        """True when called from the scheduler's own worker thread."""
+        return self._worker is not None and threading.current_thread() is self._worker
+
+    def running_priority(self) -> SLMJobPriority | None:
+        """Priority of the job running now, or None when the worker is idle."""
+        running = self._running
+        return running.priority if running is not None else None
+
+    def preempt_requested(self) -> bool:
+        """True when the running job has been asked to yield to urgent work.
+
+        Cheap enough to poll once per generated token.
+        """
+        return self._preempt_requested
+
+    def wait_idle(self, timeout: float | None = None, *, include_deferred: bool = True) -> bool:
+        """Block until no job is running or queued. Returns False on timeout."""
+        end = time.monotonic() + timeout if timeout is not None else None
+        with self._cond:
+            while self._running is not None or any(include_deferred or not j.deferred for j in self._pending):
+                remaining = end - time.monotonic() if end is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth and wait-time snapshot for diagnostics."""
+        with self._cond:
+            depth = {priority.name.lower(): 0 for priority in SLMJobPriority}
+            deferred = 0
+            for job in self._pending:
+                if job.deferred:
+                    deferred += 1
+                else:
+                    depth[job.priority.name.lower()] += 1
+            oldest = min((job.submitted_at for job in self._pending), default=None)
+            return {
+                "queue_depth": sum(depth.values()),
+                "queue_depth_by_priority": depth,
+                "backfill_depth": deferred,
+                "running": self._running.label if self._running is not None else None,
+                "oldest_wait_ms": round((time.monotonic() - oldest) * 1000, 1) if oldest is not None else 0.0,
+                "wait_ms_by_priority": {p.name.lower(): s.to_dict() for p, s in self._wait_stats.items()},
+                **self._counters,
+            }
+
+    def shutdown(self, *, cancel_pending: bool = True) -> None:
+        """Stop the worker after the running job; pending futures are cancelled."""
+        with self._cond:
+            self._stopped = True
+            pending, self._pending = (self._pending, []) if cancel_pending else ([], self._pending)
+            self._cond.notify_all()
+        for job in pending:
+            for future in job.futures:
+                # A requeued (preempted) job's futures are already running and
+                # can no longer be cancelled; fail them so waiters wake up.
+                if future.running():
+                    future.set_exception(RuntimeError("SLM scheduler is shut down."))
+                else:
+                    future.cancel()
+
+    # ── Worker ──────────────────────────────────────────────────────────────
+
+    def _ensure_worker_locked(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._worker_loop, daemon=True, name=self._name)
+            self._worker.start()
+        if self._monitor is None and any(job.deadline is not None for job in self._pending):
+            # Deadlines must fire while the worker is busy running a long job.
+            self._monitor = threading.Thread(target=self._deadline_loop, daemon=True, name=f"{self._name}-deadlines")
+            self._monitor.start()
+
+    def _find_pending_locked(self, coalesce_key: str | None) -> _Job | None:
+        if coalesce_key is None:
+            return None
+        # A requeued (preempted) job may have made partial progress; its work
+        # cannot be swapped out, so it never absorbs new submissions.
+        return next(
+            (job for job in self._pending if job.coalesce_key == coalesce_key and not job.started),
+            None,
+        )
+
+    def _maybe_preempt_locked(self, priority: SLMJobPriority) -> None:
+        running = self._running
+        if running is None or not running.preemptible or self._preempt_requested:
+            return
+        if priority <= self.PREEMPT_AT and priority < running.priority:
+            self._preempt_requested = True
+            logger.info("SLM scheduler: preempting %s for %s work", running.label, priority.name)
+
+    def _expire_locked(self, now: float) -> None:
+        changed = False
+        for job in list(self._pending):
+            if job.deferred or job.deadline is None or now < job.deadline:
+                continue
+            changed = True
+            if job.on_expire == "defer":
+                job.deferred = True
+                job.deadline = None
+                self._counters["deferred"] += 1
+                logger.info("SLM scheduler: deferred %s to the backfill lane (SLM busy)", job.label)
+                continue
+            self._pending.remove(job)
+            self._counters["expired"] += 1
+            waited = now - job.submitted_at
+            logger.warning("SLM scheduler: %s expired after waiting %.1fs", job.label, waited)
+            for future in job.futures:
+                if not future.cancelled():
+                    future.set_exception(SLMJobExpired(f"Timed out waiting for the SLM after {waited:.0f}s"))
+        if changed:
+            self._cond.notify_all()
+
+    def _next_job_locked(self, now: float) -> tuple[_Job | None, float | None]:
+        """Pick the next runnable job, or return how long to sleep before re-checking."""
+        foreground = [job for job in self._pending if not job.deferred]
+        if foreground:
+            return min(foreground, key=lambda job: (job.priority, job.seq)), None
+
+        wakeups = [job.deadline - now for job in self._pending if job.deadline is not None]
+        backfill = [job for job in self._pending if job.deferred]
+        if backfill:
+            idle_for = now - self._idle_since
+            if idle_for >= self._idle_backfill_s:
+                return min(backfill, key=lambda job: (job.priority, job.seq)), None
+            wakeups.append(self._idle_backfill_s - idle_for)
+        return None, max(0.0, min(wakeups)) if wakeups else None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    now = time.monotonic()
+                    self._expire_locked(now)
+                    job, sleep_for = self._next_job_locked(now)
+                    if job is not None:
+                        break
+                    self._cond.wait(sleep_for)
+                self._pending.remove(job)
+                self._running = job
+                if not job.started:
+                    wait_ms = (time.monotonic() - job.submitted_at) * 1000
+                    self._wait_stats[job.priority].record(wait_ms)
+
+            # Futures of a requeued job are already RUNNING from its first attempt.
+            futures = [future for future in job.futures if future.running() or future.set_running_or_notify_cancel()]
+            job.started = True
+            preempted = False
+            if futures:
+                logger.debug("SLM scheduler: running %s (priority=%s)", job.label, job.priority.name)
+                try:
+                    result = job.fn()
+                except SLMJobPreempted:
+                    preempted = self._preempt_requested
+                    if not preempted:
+                        self._count("failed")
+                        for future in futures:
+                            future.set_exception(RuntimeError(f"{job.label} stopped without a preemption request"))
+                except BaseException as exc:
+                    self._count("failed")
+                    for future in futures:
+                        future.set_exception(exc)
+                else:
+                    self._count("completed")
+                    for future in futures:
+                        future.set_result(result)
+
+            with self._cond:
+                self._running = None
+                self._preempt_requested = False
+                if preempted:
+                    self._requeue_locked(job, futures)
+                self._idle_since = time.monotonic()
+                self._cond.notify_all()
+
+    def _requeue_locked(self, job: _Job, futures: list[Future]) -> None:
+        job.futures = futures
+        job.deadline = None
+        if self._stopped:
+            for future in futures:
+                future.set_exception(RuntimeError("SLM scheduler is shut down."))
+            return
+        self._counters["preempted"] += 1
+        # Keeping the original sequence number puts the job back at the head
+        # of its lane, ahead of anything submitted after it.
+        self._pending.append(job)
+        logger.info("SLM scheduler: requeued preempted %s", job.label)
+
+    def _deadline_loop(self) -> None:
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                self._expire_locked(now)
+                deadlines = [job.deadline for job in self._pending if job.deadline is not None]
+                self._cond.wait(max(0.0, min(deadlines) - now) if deadlines else None)
+
+    def _run_inline(self, fn: Callable[[], Any], future: Future) -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    def _count(self, counter: str) -> None:
+        with self._cond:
+            self._counters[counter] += 1
+
+
+__all__ = ["ExpirePolicy", "SLMJobExpired", "SLMJobPreempted", "SLMJobPriority", "SLMScheduler"]
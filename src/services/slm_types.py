@@ -1,6 +1,14 @@
 """SLM types for Vociferous v4.0."""
 
+from __future__ import annotations
+
 import enum
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.refinement.output_parser import GenerationResult
+    from src.services.refinement_cache import CachedRefinement
 
 
 class SLMState(enum.Enum):
@@ -9,3 +17,36 @@ class SLMState(enum.Enum):
     READY = "Ready"
     INFERRING = "Refining..."
     ERROR = "Error"
+    # Unloaded by the residency manager after idling; reloads on next use.
+    UNLOADED = "Unloaded"
+
+
+@dataclass(frozen=True, slots=True)
+class RefinedText:
+    """A refinement and the provenance of the run that produced it."""
+
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    # Served from the refinement result cache instead of the model.
+    cached: bool = False
+    # Runtime summary of the provider that produced it when that is not the
+    # configured one (the other side of ``refinement.race_providers`` won).
+    runtime: dict[str, object] | None = None
+
+    @classmethod
+    def from_generation(cls, result: GenerationResult, *, runtime: dict[str, object] | None = None) -> RefinedText:
+        return cls(result.content, result.prompt_tokens, result.completion_tokens, result.total_tokens, runtime=runtime)
+
+    @classmethod
+    def from_cache(cls, cached: CachedRefinement) -> RefinedText:
+        return cls(cached.content, cached.prompt_tokens, cached.completion_tokens, cached.total_tokens, cached=True)
+
+    @property
+    def usage(self) -> dict[str, int]:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+        }
@@ -4,6 +4,13 @@ The legacy public surface continues to live in :mod:`src.services.transcription_
 This package houses the decomposed pieces that file delegates to.
 """
 
+from src.services.transcription.long_form import (
+    WINDOW_SECONDS,
+    batched_pipeline,
+    speech_windows,
+    split_long_segments,
+    use_batched_decoding,
+)
 from src.services.transcription.post_process import (
     collapse_repeated_phrases,
     merge_segment_texts,
@@ -11,11 +18,28 @@ from src.services.transcription.post_process import (
     normalize_sentence_casing,
     post_process_transcription,
 )
+from src.services.transcription.upload import (
+    UPLOAD_FORMATS,
+    EncodedUpload,
+    encode_upload,
+    plan_upload_chunks,
+    wav_bytes,
+)
 
 __all__ = [
+    "UPLOAD_FORMATS",
+    "WINDOW_SECONDS",
+    "EncodedUpload",
+    "batched_pipeline",
     "collapse_repeated_phrases",
+    "encode_upload",
     "merge_segment_texts",
     "needs_boundary_space",
     "normalize_sentence_casing",
+    "plan_upload_chunks",
     "post_process_transcription",
+    "speech_windows",
+    "split_long_segments",
+    "use_batched_decoding",
+    "wav_bytes",
 ]
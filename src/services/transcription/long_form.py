@@ -0,0 +1,117 @@
+"""
+Batched long-form decoding for local faster-whisper.
+
+``WhisperModel.transcribe`` decodes a long recording one 30 s window after
+another. Above ``model.batched_min_seconds`` of speech, ``transcribe()``
+hands the audio to faster-whisper's ``BatchedInferencePipeline`` instead,
+which decodes ``model.batch_size`` windows per forward pass.
+
+The windows come from the speech segments ``AudioPipeline`` already found
+(passed as clip timestamps), so faster-whisper does not run a second VAD.
+Short segments are packed together up to 30 s and cuts fall in the gaps
+between them; a single segment longer than a window is cut at its quietest
+frame near the limit.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.core.constants import AudioConfig
+from src.core.settings import VociferousSettings
+from src.services.transcription.upload import plan_upload_chunks
+
+logger = logging.getLogger(__name__)
+
+# Whisper's receptive field; batched clips longer than this are truncated.
+WINDOW_SECONDS = 30.0
+# How far back from a window's end to look for a quiet cut point.
+_SPLIT_SEARCH_SECONDS = 5.0
+# 32 ms energy frames, matching the Silero VAD chunk size.
+_FRAME_SAMPLES = 512
+
+
+def use_batched_decoding(settings: VociferousSettings, samples: int) -> bool:
+    """True when ``samples`` of clean speech should go through the batched pipeline."""
+    threshold = float(settings.model.batched_min_seconds)
+    if threshold <= 0 or int(settings.model.batch_size) <= 1:
+        return False
+    return samples / AudioConfig.DEFAULT_SAMPLE_RATE >= threshold
+
+
+def _quietest_point(audio: NDArray[np.float32], lo: int, hi: int) -> int:
+    """Sample offset of the lowest-energy frame centre in ``[lo, hi)``."""
+    usable = (hi - lo) // _FRAME_SAMPLES * _FRAME_SAMPLES
+    if usable <= 0:
+        return hi
+    frames = audio[lo : lo + usable].reshape(-1, _FRAME_SAMPLES)
+    energy = np.einsum("ij,ij->i", frames, frames)
+    return lo + int(np.argmin(energy)) * _FRAME_SAMPLES + _FRAME_SAMPLES // 2
+
+
+def split_long_segments(
+    audio: NDArray[np.float32],
+    segment_bounds: Sequence[tuple[int, int]],
+    max_samples: int,
+    *,
+    search_samples: int,
+) -> list[tuple[int, int]]:
+    """Split every segment longer than ``max_samples`` at quiet frames.
+
+    Each cut is the quietest frame within ``search_samples`` before the
+    point where the piece would exceed ``max_samples``.
+    """
+    result: list[tuple[int, int]] = []
+    for start, end in segment_bounds:
+        while end - start > max_samples:
+            limit = start + max_samples
+            cut = _quietest_point(audio, max(start + 1, limit - search_samples), limit)
+            result.append((start, cut))
+            start = cut
+        result.append((start, end))
+    return result
+
+
+def speech_windows(
+    audio: NDArray[np.float32],
+    segment_bounds: Sequence[tuple[int, int]] | None,
+    *,
+    sample_rate: int = AudioConfig.DEFAULT_SAMPLE_RATE,
+    max_seconds: float = WINDOW_SECONDS,
+) -> list[dict[str, float]]:
+    """Clip timestamps (seconds) covering ``audio`` in windows of at most ``max_seconds``."""
+    max_samples = int(max_seconds * sample_rate)
+    bounds = list(segment_bounds) if segment_bounds else [(0, len(audio))]
+    refined = split_long_segments(audio, bounds, max_samples, search_samples=int(_SPLIT_SEARCH_SECONDS * sample_rate))
+    return [
+        {"start": start / sample_rate, "end": end / sample_rate}
+        for start, end in plan_upload_chunks(len(audio), refined, max_samples)
+    ]
+
+
+def batched_pipeline(model: Any) -> Any:
+    """Return the ``BatchedInferencePipeline`` wrapping ``model`` (created once per model)."""
+    pipeline = getattr(model, "_vociferous_batched_pipeline", None)
+    if pipeline is None:
+        from faster_whisper import BatchedInferencePipeline
+
+        pipeline = BatchedInferencePipeline(model=model)
+        try:
+            setattr(model, "_vociferous_batched_pipeline", pipeline)
+        except Exception:
+            logger.debug("Could not cache batched pipeline on Whisper model", exc_info=True)
+    return pipeline
+
+
+__all__ = [
+    "WINDOW_SECONDS",
+    "batched_pipeline",
+    "speech_windows",
+    "split_long_segments",
+    "use_batched_decoding",
+]
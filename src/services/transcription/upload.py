@@ -0,0 +1,169 @@
+"""
+Upload encoding and chunk planning for external (Groq) transcription.
+
+Speech sent to an OpenAI-compatible ``audio/transcriptions`` endpoint is
+encoded before upload: FLAC is lossless and typically half to two-thirds
+the size of a 16-bit WAV; Ogg/Opus at a speech bitrate is about a tenth. Encoding uses PyAV,
+which faster-whisper already installs; without it (or if the encoder
+fails) the upload falls back to WAV.
+
+Recordings longer than a provider accepts in one request are split into
+pieces at the speech segment boundaries ``AudioPipeline`` found, so no
+word is cut in half. A single segment longer than the limit is the only
+case that gets a hard cut.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import wave
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.core.constants import AudioConfig
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_FORMATS = ("flac", "opus", "wav")
+
+# Wideband speech bitrate; about a tenth of 16-bit PCM at 16 kHz.
+_OPUS_BIT_RATE = 24_000
+# Samples handed to the encoder per frame (one second at 16 kHz).
+_ENCODE_FRAME_SAMPLES = 16_000
+
+# PyAV audio encoders used for uploads; a literal codec name types the
+# stream ``add_stream`` returns as an audio stream.
+_AvCodec = Literal["flac", "libopus"]
+# upload format → (container, codec, filename, content type)
+_AV_FORMATS: dict[str, tuple[str, _AvCodec, str, str]] = {
+    "flac": ("flac", "flac", "speech.flac", "audio/flac"),
+    "opus": ("ogg", "libopus", "speech.ogg", "audio/ogg"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedUpload:
+    """Encoded audio ready for a multipart ``file`` field."""
+
+    format: str
+    filename: str
+    content_type: str
+    data: bytes
+
+    def as_file(self) -> tuple[str, bytes, str]:
+        return (self.filename, self.data, self.content_type)
+
+
+def _pcm16(audio: NDArray[np.float32]) -> NDArray[np.int16]:
+    return (np.clip(audio, -1.0, 1.0) * 32767.0).astype(np.int16)
+
+
+def wav_bytes(audio: NDArray[np.float32], sample_rate: int = AudioConfig.DEFAULT_SAMPLE_RATE) -> bytes:
+    """Encode float32 mono audio as a 16-bit PCM WAV file."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(_pcm16(audio).tobytes())
+    return buffer.getvalue()
+
+
+def _encode_with_av(audio: NDArray[np.float32], container: str, codec: _AvCodec, sample_rate: int) -> bytes:
+    import av  # deferred import — ships with faster-whisper
+
+    pcm = _pcm16(audio)
+    buffer = io.BytesIO()
+    with av.open(buffer, mode="w", format=container) as output:
+        stream = output.add_stream(codec, rate=sample_rate, layout="mono")
+        if codec == "libopus":
+            stream.bit_rate = _OPUS_BIT_RATE
+        for start in range(0, len(pcm), _ENCODE_FRAME_SAMPLES):
+            frame = av.AudioFrame.from_ndarray(
+                pcm[start : start + _ENCODE_FRAME_SAMPLES].reshape(1, -1), format="s16", layout="mono"
+            )
+            frame.sample_rate = sample_rate
+            for packet in stream.encode(frame):
+                output.mux(packet)
+        for packet in stream.encode(None):
+            output.mux(packet)
+    return buffer.getvalue()
+
+
+def encode_upload(
+    audio: NDArray[np.float32],
+    fmt: str = "flac",
+    *,
+    sample_rate: int = AudioConfig.DEFAULT_SAMPLE_RATE,
+) -> EncodedUpload:
+    """Encode ``audio`` as ``fmt`` ("flac", "opus" or "wav"), falling back to WAV."""
+    if fmt in _AV_FORMATS and len(audio):
+        container, codec, filename, content_type = _AV_FORMATS[fmt]
+        try:
+            data = _encode_with_av(audio, container, codec, sample_rate)
+            return EncodedUpload(format=fmt, filename=filename, content_type=content_type, data=data)
+        except ImportError:
+            logger.info("PyAV is not installed; uploading speech as WAV instead of %s", fmt)
+        except Exception:
+            logger.warning("Encoding speech as %s failed; uploading WAV instead", fmt, exc_info=True)
+    elif fmt not in UPLOAD_FORMATS:
+        logger.warning("Unknown upload format %r; uploading WAV", fmt)
+    return EncodedUpload(
+        format="wav", filename="speech.wav", content_type="audio/wav", data=wav_bytes(audio, sample_rate)
+    )
+
+
+def plan_upload_chunks(
+    total_samples: int,
+    segment_bounds: Sequence[tuple[int, int]] | None,
+    max_samples: int,
+) -> list[tuple[int, int]]:
+    """Split ``[0, total_samples)`` into contiguous pieces of at most ``max_samples``.
+
+    Cuts fall in the gap between two speech segments (``segment_bounds`` are
+    ``(start, end)`` sample offsets in the audio being uploaded), midway
+    through the silence. Segments are packed greedily, so the result has as
+    few pieces as the boundaries allow. A segment longer than ``max_samples``
+    on its own is cut at fixed intervals. Without bounds the whole recording
+    is treated as one segment.
+    """
+    if total_samples <= 0:
+        return []
+    max_samples = max(1, int(max_samples))
+    if total_samples <= max_samples:
+        return [(0, total_samples)]
+
+    # Candidate cut points: the middle of each inter-segment gap.
+    bounds = sorted((max(0, s), min(total_samples, e)) for s, e in (segment_bounds or ()) if e > s)
+    cuts = [(prev_end + next_start) // 2 for (_, prev_end), (next_start, _) in zip(bounds, bounds[1:])]
+    cuts = [cut for cut in cuts if 0 < cut < total_samples]
+
+    pieces: list[tuple[int, int]] = []
+    start = 0
+    index = 0
+    while total_samples - start > max_samples:
+        # Furthest cut that keeps this piece within the limit.
+        best: int | None = None
+        while index < len(cuts) and cuts[index] - start <= max_samples:
+            if cuts[index] > start:
+                best = cuts[index]
+            index += 1
+        end = best if best is not None else start + max_samples
+        pieces.append((start, end))
+        start = end
+    pieces.append((start, total_samples))
+    return pieces
+
+
+__all__ = [
+    "UPLOAD_FORMATS",
+    "EncodedUpload",
+    "encode_upload",
+    "plan_upload_chunks",
+    "wav_bytes",
+]
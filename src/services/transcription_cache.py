@@ -0,0 +1,246 @@
+"""
+TranscriptionResultCache — persistent, content-addressed cache of ASR results.
+
+Re-transcribing a recording with unchanged settings, importing the same file
+again or transcribing a recovered recording a second time returns the stored
+text instead of running Whisper (or an upload) again.
+
+Entries live in a small SQLite file under ``<cache_dir>/transcription/`` and
+are keyed by a SHA-256 of the source audio — the raw int16 samples, or the
+file bytes for imports — together with every setting that shapes the output
+(see ``TranscriptionCacheKey``). VAD runs inside transcription, so its
+sensitivity is part of the key rather than the cleaned audio being hashed:
+a hit skips VAD as well as decoding. The store is bounded by entry count;
+the least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.core.resource_manager import ResourceManager
+
+if TYPE_CHECKING:
+    from src.core.settings import VociferousSettings
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcription_results (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    speech_duration_ms INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    transcription_time_ms INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transcription_results_last_used ON transcription_results(last_used_at);
+"""
+
+
+def hash_audio(audio: NDArray[np.int16]) -> str:
+    """SHA-256 of raw int16 samples."""
+    return hashlib.sha256(np.ascontiguousarray(audio, dtype=np.int16)).hexdigest()
+
+
+def hash_file(path: Path | str) -> str:
+    """SHA-256 of a file's bytes, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class TranscriptionCacheKey:
+    """Everything that determines a transcription's output."""
+
+    audio_sha256: str
+    # "samples" for int16 audio, "file" for an imported file's bytes.
+    audio_source: str
+    provider_id: str
+    model_id: str
+    compute_type: str
+    language: str
+    initial_prompt: str
+    vad_sensitivity: str
+    # Sorted (name, value) pairs of the provider's decode parameters.
+    decode_params: tuple[tuple[str, Any], ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        audio_sha256: str,
+        settings: VociferousSettings,
+        capture: Mapping[str, object],
+        *,
+        audio_source: str = "samples",
+    ) -> TranscriptionCacheKey:
+        """Key for ``audio_sha256`` under ``settings``.
+
+        ``capture`` is ``describe_transcription_capture()`` for the loaded
+        model, so the key uses the resolved model and compute type that the
+        transcript's provenance records.
+        """
+        from src.services.transcription_service import LOCAL_DECODE_OPTIONS
+
+        m = settings.model
+        provider = str(capture.get("transcription_provider") or m.provider)
+        if provider == "local_faster_whisper":
+            params: dict[str, Any] = {
+                **LOCAL_DECODE_OPTIONS,
+                "batched_min_seconds": m.batched_min_seconds,
+                "batch_size": m.batch_size,
+            }
+        else:
+            # Lossy uploads and the piece size change what the provider hears.
+            p = m.groq
+            params = {
+                "temperature": p.temperature,
+                "upload_format": p.upload_format,
+                "max_chunk_seconds": p.max_chunk_seconds,
+            }
+        return cls(
+            audio_sha256=audio_sha256,
+            audio_source=audio_source,
+            provider_id=provider,
+            model_id=str(capture.get("transcription_model_id") or m.model),
+            compute_type=str(capture.get("transcription_compute_type") or m.compute_type),
+            language=m.language or "en",
+            initial_prompt=str(capture.get("transcription_prompt_text", m.initial_prompt)),
+            vad_sensitivity=settings.recording.vad_sensitivity,
+            decode_params=tuple(sorted(params.items())),
+        )
+
+    def digest(self) -> str:
+        payload = json.dumps(asdict(self), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedTranscription:
+    """A stored transcription and the durations of the run that produced it."""
+
+    text: str
+    speech_duration_ms: int = 0
+    duration_ms: int = 0
+    # Decode time of the original run, for diagnostics; a hit costs ~0 ms.
+    transcription_time_ms: int = 0
+
+
+class TranscriptionResultCache:
+    """Thread-safe SQLite-backed LRU of transcription results."""
+
+    def __init__(self, path: Path | str) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open_default(cls) -> "TranscriptionResultCache":
+        """Open the cache in the user cache directory."""
+        return cls(ResourceManager.get_user_cache_dir("transcription") / "results.sqlite3")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, key: TranscriptionCacheKey) -> CachedTranscription | None:
+        """Return the cached transcription for ``key`` (and mark it recently used)."""
+        digest = key.digest()
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT text, speech_duration_ms, duration_ms, transcription_time_ms
+                   FROM transcription_results WHERE key = ?""",
+                (digest,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE transcription_results SET last_used_at = ? WHERE key = ?", (time.time(), digest))
+            self._conn.commit()
+            self.hits += 1
+        return CachedTranscription(
+            text=row["text"],
+            speech_duration_ms=row["speech_duration_ms"],
+            duration_ms=row["duration_ms"],
+            transcription_time_ms=row["transcription_time_ms"],
+        )
+
+    def put(self, key: TranscriptionCacheKey, result: CachedTranscription, *, max_entries: int) -> None:
+        """Store ``result`` and evict least recently used entries beyond ``max_entries``."""
+        if max_entries <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO transcription_results
+                   (key, text, speech_duration_ms, duration_ms, transcription_time_ms, created_at, last_used_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    key.digest(),
+                    result.text,
+                    result.speech_duration_ms,
+                    result.duration_ms,
+                    result.transcription_time_ms,
+                    now,
+                    now,
+                ),
+            )
+            self._conn.execute(
+                """DELETE FROM transcription_results WHERE key IN (
+                       SELECT key FROM transcription_results ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                   )""",
+                (max_entries,),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM transcription_results").fetchone()[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM transcription_results")
+            self._conn.commit()
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                logger.debug("Transcription cache close failed (non-fatal)", exc_info=True)
+
+
+__all__ = [
+    "CachedTranscription",
+    "TranscriptionCacheKey",
+    "TranscriptionResultCache",
+    "hash_audio",
+    "hash_file",
+]
@@ -7,11 +7,11 @@ the faster-whisper library, which wraps CTranslate2 for inference.
 
 from __future__ import annotations
 
-import io
 import logging
 import os
 import time
-import wave
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -21,9 +21,13 @@ from numpy.typing import NDArray
 from src.core.constants import AudioConfig
 from src.core.cuda_runtime import CudaRuntimeStatus, detect_cuda_runtime
 from src.core.exceptions import EngineError
-from src.core.model_registry import ASR_MODELS, get_asr_model
+from src.core.model_registry import ASR_MODELS, ASRModel, get_asr_model
 from src.core.resource_manager import ResourceManager
 from src.core.settings import VociferousSettings
+from src.services.cpu_partition import ASR as ASR_ROLE
+from src.services.cpu_partition import engine_busy, partition_threads, pinned_load
+from src.services.transcription.long_form import batched_pipeline, speech_windows, use_batched_decoding
+from src.services.transcription.upload import encode_upload, plan_upload_chunks
 
 if TYPE_CHECKING:
     from src.services.audio_pipeline import AudioPipeline
@@ -32,6 +36,19 @@ logger = logging.getLogger(__name__)
 
 _EXTERNAL_ASR_PROVIDERS = frozenset({"groq"})
 
+# faster-whisper decode parameters not taken from settings. Part of the
+# transcription cache key: changing one must not serve stale text.
+LOCAL_DECODE_OPTIONS: dict[str, Any] = {
+    "beam_size": 5,
+    "patience": 1.0,
+    "repetition_penalty": 1.0,
+    "no_speech_threshold": 0.5,
+    "condition_on_previous_text": False,
+}
+
+# Beam size of the quick first pass in two-pass dictation (model.two_pass).
+DRAFT_BEAM_SIZE = 1
+
 
 class TranscriptionProviderRequestError(RuntimeError):
     """Raised when an external transcription provider rejects or cannot serve a request."""
@@ -78,7 +95,19 @@ def describe_asr_runtime(
     else:
         resolved_device = "cuda" if status.cuda_available else "cpu"
 
-    raw_compute_type = settings.model.compute_type
+    from src.services.calibration import ASR, FALLBACK_ASR_THREADS, resolve_cpu_runtime
+
+    # n_threads 0 / compute_type "auto" read this machine's calibration profile.
+    cpu_threads, raw_compute_type, threads_source = resolve_cpu_runtime(
+        ASR,
+        settings.model.model,
+        settings.model.n_threads,
+        settings.model.compute_type,
+        fallback_threads=FALLBACK_ASR_THREADS,
+    )
+    if resolved_device == "cpu":
+        # Never more threads than cores in Whisper's share of the CPU.
+        cpu_threads = partition_threads(settings, ASR_ROLE, cpu_threads, cuda_status=status)
     if resolved_device == "cuda" and raw_compute_type == "int8":
         resolved_compute_type = "float16"
     elif resolved_device == "cpu" and raw_compute_type in {"float16", "bfloat16"}:
@@ -92,7 +121,8 @@ def describe_asr_runtime(
         "language": settings.model.language,
         "device_preference": device_pref,
         "resolved_device": resolved_device,
-        "cpu_threads": settings.model.n_threads,
+        "cpu_threads": cpu_threads,
+        "cpu_runtime_source": threads_source,
         "compute_type_requested": raw_compute_type,
         "compute_type_resolved": resolved_compute_type,
         "initial_prompt_enabled": bool(settings.model.initial_prompt),
@@ -110,17 +140,24 @@ def _resolve_model_path(settings: VociferousSettings) -> Path:
         model_id = "large-v3-turbo-int8"
         asr_model = ASR_MODELS[model_id]
 
-    cache_dir = ResourceManager.get_user_cache_dir("models")
-    # CT2 models are directories named after the repo slug
-    local_dir_name = asr_model.repo.split("/")[-1]
-    model_dir = cache_dir / local_dir_name
-
+    model_dir = _model_dir(asr_model)
     if not (model_dir / asr_model.model_file).exists():
         raise EngineError(f"ASR model directory not found: {model_dir}. Run provisioning to download '{model_id}'.")
 
     return model_dir
 
 
+def _model_dir(asr_model: ASRModel) -> Path:
+    # CT2 models are directories named after the repo slug
+    return ResourceManager.get_user_cache_dir("models") / asr_model.repo.split("/")[-1]
+
+
+def is_asr_model_installed(model_id: str) -> bool:
+    """Whether the CT2 Whisper model ``model_id`` has been provisioned."""
+    asr_model = get_asr_model(model_id)
+    return asr_model is not None and (_model_dir(asr_model) / asr_model.model_file).exists()
+
+
 def create_local_model(settings: VociferousSettings):
     """
     Create and return a faster-whisper WhisperModel instance.
@@ -134,6 +171,11 @@ def create_local_model(settings: VociferousSettings):
         provider.load()
         return provider
 
+    if settings.model.worker_process:
+        from src.services.inference_worker import WorkerWhisperModel
+
+        return WorkerWhisperModel(settings)
+
     from faster_whisper import WhisperModel
 
     model_dir = _resolve_model_path(settings)
@@ -183,13 +225,14 @@ def create_local_model(settings: VociferousSettings):
     start = time.perf_counter()
 
     try:
-        model = WhisperModel(
-            str(model_dir),
-            device=fw_device,
-            cpu_threads=n_threads,
-            compute_type=compute_type,
-            local_files_only=True,
-        )
+        with pinned_load(ASR_ROLE):
+            model = WhisperModel(
+                str(model_dir),
+                device=fw_device,
+                cpu_threads=n_threads,
+                compute_type=compute_type,
+                local_files_only=True,
+            )
     except Exception as e:
         from src.core.engine_status import normalize_engine_error
 
@@ -242,6 +285,8 @@ class OpenAICompatibleTranscriptionProvider:
             raise ValueError(f"No base URL configured for {self._provider_label} transcription.")
         if not self._provider_settings.model_id.strip():
             raise ValueError(f"No model configured for {self._provider_label} transcription.")
+        # Re-read the stored key once per load; requests then hit the cache.
+        _stored_api_key(self._provider_id, refresh=True)
         if self._provider_id == "groq":
             from src.core.secret_store import validate_provider_api_key
 
@@ -255,6 +300,16 @@ class OpenAICompatibleTranscriptionProvider:
                 raise
         if self._provider_settings.model_list_enabled:
             self.list_models()
+        if self._client is None:
+            from src.core.http_pool import get_http_pool
+
+            # The model list request already opened a connection; without it,
+            # warm one now so the first dictation skips the handshake.
+            pool = get_http_pool()
+            if self._provider_settings.model_list_enabled:
+                pool.remember(self._url("models"), headers=self._headers())
+            else:
+                pool.warm(self._url("models"), headers=self._headers())
 
     def get_runtime_summary(self) -> dict[str, object]:
         return dict(self._runtime_summary)
@@ -270,29 +325,97 @@ class OpenAICompatibleTranscriptionProvider:
                 models.append({"id": item["id"], "object": item.get("object", "model")})
         return models
 
-    def transcribe(self, audio: NDArray[np.float32], settings: VociferousSettings) -> tuple[str, int, int]:
+    def transcribe(
+        self,
+        audio: NDArray[np.float32],
+        settings: VociferousSettings,
+        *,
+        segment_bounds: Sequence[tuple[int, int]] | None = None,
+        post_process: bool = True,
+    ) -> tuple[str, int, int]:
+        """Transcribe ``audio``, fanning long recordings out over several requests.
+
+        Speech longer than ``max_chunk_seconds`` is split between the speech
+        segments in ``segment_bounds`` (sample offsets from ``AudioPipeline``);
+        the pieces are uploaded concurrently and their texts and durations
+        stitched back in order. ``post_process=False`` returns the merged
+        text without :func:`post_process_transcription`.
+        """
         start = time.perf_counter()
         prompt = _transcription_prompt(settings.model.initial_prompt)
-        response = self._request(
-            "POST",
-            "audio/transcriptions",
-            data=self._transcription_data(settings),
-            files={"file": ("speech.wav", _wav_bytes(audio), "audio/wav")},
-        )
-        text, speech_duration_ms = _parse_external_transcription_response(response, len(audio))
+        data = self._transcription_data(settings)
+        max_samples = int(max(1.0, float(self._provider_settings.max_chunk_seconds)) * AudioConfig.DEFAULT_SAMPLE_RATE)
+        pieces = plan_upload_chunks(len(audio), segment_bounds, max_samples)
+        if len(pieces) > 1:
+            results = self._transcribe_pieces(audio, pieces, segment_bounds, data)
+            text = _merge_segment_texts([piece_text for piece_text, _ in results])
+        else:
+            results = [self._transcribe_piece(audio, segment_bounds, data)]
+            text = results[0][0]
+        speech_duration_ms = sum(duration for _, duration in results)
         elapsed = time.perf_counter() - start
         transcription_time_ms = int(elapsed * 1000)
         logger.info(
-            "External transcription completed in %.2fs (provider=%s, model_id=%s, resolved_device=%s, chars=%d, speech=%dms, prompt_words=%d)",
+            "External transcription completed in %.2fs (provider=%s, model_id=%s, resolved_device=%s, chars=%d, speech=%dms, pieces=%d, prompt_words=%d)",
             elapsed,
             self._provider_id,
             self._provider_settings.model_id,
             self._runtime_summary.get("resolved_device"),
             len(text),
             speech_duration_ms,
+            len(results),
             len(prompt.split()),
         )
-        return post_process_transcription(text, settings), speech_duration_ms, transcription_time_ms
+        if post_process:
+            text = post_process_transcription(text, settings)
+        return text, speech_duration_ms, transcription_time_ms
+
+    def _transcribe_pieces(
+        self,
+        audio: NDArray[np.float32],
+        pieces: list[tuple[int, int]],
+        segment_bounds: Sequence[tuple[int, int]] | None,
+        data: dict[str, str],
+    ) -> list[tuple[str, int]]:
+        workers = max(1, min(int(self._provider_settings.upload_concurrency), len(pieces)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asr-upload") as pool:
+            futures = [
+                pool.submit(self._transcribe_piece, audio[lo:hi], _bounds_within(segment_bounds, lo, hi), data)
+                for lo, hi in pieces
+            ]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _transcribe_piece(
+        self,
+        audio: NDArray[np.float32],
+        segment_bounds: Sequence[tuple[int, int]] | None,
+        data: dict[str, str],
+    ) -> tuple[str, int]:
+        upload = encode_upload(audio, self._provider_settings.upload_format)
+        if len(upload.data) > self._provider_settings.max_upload_bytes and len(audio) > AudioConfig.DEFAULT_SAMPLE_RATE:
+            # Still over the size limit once encoded: split again and send the halves in turn.
+            halves = plan_upload_chunks(len(audio), segment_bounds, (len(audio) + 1) // 2)
+            logger.info(
+                "Encoded %s upload is %d bytes (limit %d); splitting into %d pieces",
+                upload.format,
+                len(upload.data),
+                self._provider_settings.max_upload_bytes,
+                len(halves),
+            )
+            results = [
+                self._transcribe_piece(audio[lo:hi], _bounds_within(segment_bounds, lo, hi), data) for lo, hi in halves
+            ]
+            return (
+                _merge_segment_texts([piece_text for piece_text, _ in results]),
+                sum(duration for _, duration in results),
+            )
+        response = self._request("POST", "audio/transcriptions", data=data, files={"file": upload.as_file()})
+        return _parse_external_transcription_response(response, len(audio))
 
     def _transcription_data(self, settings: VociferousSettings) -> dict[str, str]:
         data = {
@@ -309,11 +432,11 @@ class OpenAICompatibleTranscriptionProvider:
 
     @property
     def _client_instance(self):
-        if self._client is None:
-            import httpx
+        if self._client is not None:
+            return self._client
+        from src.core.http_pool import get_http_pool
 
-            self._client = httpx.Client(timeout=self._provider_settings.timeout_seconds)
-        return self._client
+        return get_http_pool().client_for(self._provider_settings.base_url)
 
     def _headers(self) -> dict[str, str]:
         api_key = self._api_key
@@ -347,6 +470,7 @@ class OpenAICompatibleTranscriptionProvider:
                     headers=self._headers(),
                     data=data,
                     files=files,
+                    timeout=self._provider_settings.timeout_seconds,
                 )
                 if response.status_code < 400:
                     return response
@@ -390,7 +514,10 @@ class OpenAICompatibleTranscriptionProvider:
             case 404:
                 return f"{self._provider_label} transcription endpoint or model was not found. Check base URL and model id."
             case 413:
-                return f"{self._provider_label} rejected the audio because it is too large. Shorten the recording."
+                return (
+                    f"{self._provider_label} rejected the audio because it is too large. "
+                    "Lower the upload size limit or switch the upload format to Opus in Settings."
+                )
             case 422:
                 return f"{self._provider_label} could not transcribe the audio: {detail}"
             case 429:
@@ -437,6 +564,10 @@ def transcribe(
     settings: VociferousSettings,
     local_model=None,
     audio_pipeline: AudioPipeline | None = None,
+    *,
+    between_segments: Callable[[], None] | None = None,
+    beam_size: int | None = None,
+    on_speech: Callable[[NDArray[np.float32], list[tuple[int, int]] | None], None] | None = None,
 ) -> tuple[str, int, int]:
     """
     Transcribe audio data to text using faster-whisper (CTranslate2 backend).
@@ -449,6 +580,13 @@ def transcribe(
         settings: Current application settings.
         local_model: A faster_whisper.WhisperModel instance (created if None).
         audio_pipeline: Reusable AudioPipeline instance (created if None).
+        between_segments: Called after each decoded segment (see
+            :func:`transcribe_speech`).
+        beam_size: Overrides ``LOCAL_DECODE_OPTIONS`` (see
+            :func:`transcribe_speech`).
+        on_speech: Called with the cleaned speech and its segment bounds
+            before decoding, so a later pass can re-decode them without
+            running the pipeline again.
 
     Returns:
         Tuple of (transcription_text, speech_duration_ms, transcription_time_ms).
@@ -456,36 +594,103 @@ def transcribe(
     if audio_data is None or len(audio_data) == 0:
         return "", 0, 0
 
-    language = settings.model.language or "en"
-
     if local_model is None:
         local_model = create_local_model(settings)
 
-    # ── Audio pre-processing: Silero VAD pipeline ──
+    clean_audio, segment_bounds = prepare_speech(audio_data, audio_pipeline)
+    if clean_audio is None:
+        return "", 0, 0
+    if on_speech is not None:
+        on_speech(clean_audio, segment_bounds)
+
+    return transcribe_speech(
+        clean_audio,
+        settings,
+        local_model,
+        segment_bounds=segment_bounds,
+        source_samples=len(audio_data),
+        between_segments=between_segments,
+        beam_size=beam_size,
+    )
+
+
+def prepare_speech(
+    audio_data: NDArray[np.int16], audio_pipeline: AudioPipeline | None = None
+) -> tuple[NDArray[np.float32] | None, list[tuple[int, int]] | None]:
+    """
+    Run a recording through the AudioPipeline (normalize → highpass → Silero VAD).
+
+    The pre-processing half of :func:`transcribe`. Returns the cleaned
+    speech and its segment bounds, or ``(None, None)`` without speech.
+    """
     if audio_pipeline is None:
         from src.services.audio_pipeline import AudioPipeline
 
         audio_pipeline = AudioPipeline(sample_rate=AudioConfig.DEFAULT_SAMPLE_RATE)
 
-    clean_audio = audio_pipeline.process(audio_data, sample_rate=AudioConfig.DEFAULT_SAMPLE_RATE)
+    speech = audio_pipeline.process_speech(audio_data, sample_rate=AudioConfig.DEFAULT_SAMPLE_RATE)
 
-    if clean_audio is None:
+    if speech is None:
         logger.info("AudioPipeline detected no speech; skipping transcription")
-        return "", 0, 0
+        return None, None
+
+    return speech.audio, speech.bounds
+
+
+def transcribe_speech(
+    clean_audio: NDArray[np.float32],
+    settings: VociferousSettings,
+    local_model,
+    *,
+    segment_bounds: Sequence[tuple[int, int]] | None = None,
+    source_samples: int | None = None,
+    between_segments: Callable[[], None] | None = None,
+    beam_size: int | None = None,
+    post_process: bool = True,
+) -> tuple[str, int, int]:
+    """
+    Transcribe speech that has already been through the AudioPipeline.
+
+    The decoding half of :func:`transcribe`, shared with the streaming
+    importer, which runs VAD block by block and hands over speech as it
+    closes.
+
+    Args:
+        clean_audio: Speech from ``AudioPipeline`` (float32, 16kHz mono).
+        settings: Current application settings.
+        local_model: A faster_whisper.WhisperModel or external provider.
+        segment_bounds: ``(start, end)`` sample offsets of the speech
+            segments in ``clean_audio``.
+        source_samples: Length of the recording the speech came from, for
+            real-time-factor logging (defaults to ``len(clean_audio)``).
+        between_segments: Called after each decoded segment, while the
+            model is idle — the ASR scheduler's yield point for more urgent
+            work. Local decoding only.
+        beam_size: Beam width instead of ``LOCAL_DECODE_OPTIONS``' (e.g.
+            ``DRAFT_BEAM_SIZE`` for a greedy draft). Local decoding only.
+        post_process: Apply :func:`post_process_transcription` to the text.
+            The streaming importer turns it off for each group and
+            post-processes the stitched file text once.
 
+    Returns:
+        Tuple of (transcription_text, speech_duration_ms, transcription_time_ms).
+    """
     if isinstance(local_model, OpenAICompatibleTranscriptionProvider):
-        return local_model.transcribe(clean_audio, settings)
+        return local_model.transcribe(clean_audio, settings, segment_bounds=segment_bounds, post_process=post_process)
+
+    language = settings.model.language or "en"
+    source_samples = len(clean_audio) if source_samples is None else source_samples
 
     try:
         audio_float: NDArray[np.float32] = clean_audio
         runtime_summary = getattr(local_model, "_vociferous_runtime_summary", None)
 
         start = time.perf_counter()
-        estimated_audio_seconds = len(audio_data) / AudioConfig.DEFAULT_SAMPLE_RATE
+        estimated_audio_seconds = source_samples / AudioConfig.DEFAULT_SAMPLE_RATE
         logger.info(
             "Transcription started (language=%s, samples=%d, audio=%.2fs)",
             language,
-            len(audio_data),
+            source_samples,
             estimated_audio_seconds,
         )
 
@@ -496,23 +701,38 @@ def transcribe(
         # ── faster-whisper inference ──
         initial_prompt = settings.model.initial_prompt or None
 
-        segments_iter, _ = local_model.transcribe(
-            audio_float,
-            language=language,
-            initial_prompt=initial_prompt,
-            beam_size=5,
-            patience=1.0,
-            repetition_penalty=1.0,
-            no_speech_threshold=0.5,
-            condition_on_previous_text=False,
-        )
-
-        # Consume the segment iterator and extract text
+        decode_options: dict[str, Any] = {
+            "language": language,
+            "initial_prompt": initial_prompt,
+            **LOCAL_DECODE_OPTIONS,
+        }
+        if beam_size is not None:
+            decode_options["beam_size"] = beam_size
+        batch_size = 0
         segment_texts: list[str] = []
         total_duration_ms = 0
-        for seg in segments_iter:
-            segment_texts.append(seg.text)
-            total_duration_ms = int(seg.end * 1000)
+        with engine_busy(ASR_ROLE):
+            if use_batched_decoding(settings, len(audio_float)):
+                # Long speech: decode several VAD-delimited windows per forward pass.
+                windows = speech_windows(audio_float, segment_bounds)
+                batch_size = int(settings.model.batch_size)
+                logger.info("Batched decoding of %d windows (batch_size=%d)", len(windows), batch_size)
+                segments_iter, _ = batched_pipeline(local_model).transcribe(
+                    audio_float,
+                    **decode_options,
+                    vad_filter=False,
+                    clip_timestamps=windows,
+                    batch_size=batch_size,
+                )
+            else:
+                segments_iter, _ = local_model.transcribe(audio_float, **decode_options)
+
+            # Consume the segment iterator and extract text
+            for seg in segments_iter:
+                segment_texts.append(seg.text)
+                total_duration_ms = int(seg.end * 1000)
+                if between_segments is not None:
+                    between_segments()
 
         transcription = _merge_segment_texts(segment_texts)
 
@@ -523,11 +743,13 @@ def transcribe(
         transcription_time_ms = int(elapsed * 1000)
         realtime_multiplier = estimated_audio_seconds / elapsed if elapsed > 0 else 0.0
         logger.info(
-            "Transcription completed in %.2fs (audio=%.2fs, realtime=%.2fx, segments=%d, speech=%dms, model=%s, resolved_device=%s, compute_type=%s, cpu_threads=%s, prompt_words=%d)",
+            "Transcription completed in %.2fs (audio=%.2fs, realtime=%.2fx, segments=%d, batch_size=%d, beam_size=%d, speech=%dms, model=%s, resolved_device=%s, compute_type=%s, cpu_threads=%s, prompt_words=%d)",
             elapsed,
             estimated_audio_seconds,
             realtime_multiplier,
             len(segment_texts),
+            batch_size,
+            decode_options["beam_size"],
             speech_duration_ms,
             (runtime_summary or {}).get("model_id", settings.model.model),
             (runtime_summary or {}).get("resolved_device", settings.model.device),
@@ -549,7 +771,9 @@ def transcribe(
                 (runtime_summary or {}).get("language", language),
             )
 
-        return post_process_transcription(transcription, settings), speech_duration_ms, transcription_time_ms
+        if post_process:
+            transcription = post_process_transcription(transcription, settings)
+        return transcription, speech_duration_ms, transcription_time_ms
 
     except Exception as e:
         from src.core.engine_status import normalize_engine_error
@@ -592,16 +816,13 @@ def describe_transcription_capture(settings: VociferousSettings, *, local_model=
     }
 
 
-def _wav_bytes(audio: NDArray[np.float32]) -> bytes:
-    clipped = np.clip(audio, -1.0, 1.0)
-    pcm = (clipped * 32767.0).astype(np.int16)
-    buffer = io.BytesIO()
-    with wave.open(buffer, "wb") as wav:
-        wav.setnchannels(1)
-        wav.setsampwidth(2)
-        wav.setframerate(AudioConfig.DEFAULT_SAMPLE_RATE)
-        wav.writeframes(pcm.tobytes())
-    return buffer.getvalue()
+def _bounds_within(
+    segment_bounds: Sequence[tuple[int, int]] | None, start: int, end: int
+) -> list[tuple[int, int]] | None:
+    """Segment bounds clipped to ``[start, end)`` and shifted to start at zero."""
+    if segment_bounds is None:
+        return None
+    return [(max(lo, start) - start, min(hi, end) - start) for lo, hi in segment_bounds if hi > start and lo < end]
 
 
 def _transcription_prompt(prompt: str | None) -> str:
@@ -652,11 +873,11 @@ def _api_key_from_env(provider_id: str, env_name: str | None) -> str | None:
         return os.environ.get(env_name) or None
 
 
-def _stored_api_key(provider_id: str) -> str | None:
+def _stored_api_key(provider_id: str, *, refresh: bool = False) -> str | None:
     try:
         from src.core.secret_store import get_provider_api_key
 
-        return get_provider_api_key(provider_id)
+        return get_provider_api_key(provider_id, refresh=refresh)
     except Exception:
         return None
 
@@ -673,6 +894,8 @@ from src.services.transcription.post_process import (  # noqa: E402
 )
 
 __all__ = [
+    "DRAFT_BEAM_SIZE",
+    "LOCAL_DECODE_OPTIONS",
     "_collapse_repeated_phrases",
     "_merge_segment_texts",
     "_needs_boundary_space",
@@ -680,10 +903,13 @@ __all__ = [
     "create_local_model",
     "describe_asr_runtime",
     "describe_transcription_capture",
+    "is_asr_model_installed",
     "list_external_transcription_provider_models",
     "post_process_transcription",
+    "prepare_speech",
     "test_external_transcription_provider",
     "transcribe",
+    "transcribe_speech",
     "OpenAICompatibleTranscriptionProvider",
     "TranscriptionProviderRequestError",
 ]
@@ -0,0 +1,159 @@
+"""
+Warm-up passes run right after a model loads.
+
+Loading weights is not the whole cost of a cold model: the first real
+decode also pays for allocator growth, kernel selection, CUDA context and
+cuBLAS handle creation, and tokenizer initialization. Each loader runs one
+short, silent pass here before it reports ``ready``, so the first dictation
+after launch (or after an idle unload) is as fast as the tenth.
+
+Every pass takes a ``should_stop`` callable and gives up as soon as it
+returns True, so a real request that arrives meanwhile never waits for a
+warm-up to finish. Results are discarded; only the duration is kept.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.core.constants import AudioConfig
+
+if TYPE_CHECKING:
+    from src.core.settings import VociferousSettings
+    from src.refinement.providers import RefinementProvider
+    from src.services.audio_pipeline import AudioPipeline
+
+logger = logging.getLogger(__name__)
+
+WARMUP_AUDIO_SECONDS = 1.0
+# Peak amplitude of the warm-up noise (int16), roughly -60 dBFS: enough to
+# run every stage without looking like speech.
+_NOISE_AMPLITUDE = 32
+_SLM_WARMUP_TOKENS = 4
+
+
+@dataclass(slots=True)
+class WarmupResult:
+    """Outcome of one warm-up pass."""
+
+    ms: int
+    cancelled: bool = False
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"warmup_ms": self.ms, "warmup_cancelled": self.cancelled, "warmup_error": self.error}
+
+
+def warmup_noise(seconds: float = WARMUP_AUDIO_SECONDS) -> NDArray[np.int16]:
+    """Deterministic low-level noise (int16, 16 kHz mono)."""
+    samples = int(seconds * AudioConfig.DEFAULT_SAMPLE_RATE)
+    rng = np.random.default_rng(0)
+    return rng.integers(-_NOISE_AMPLITUDE, _NOISE_AMPLITUDE + 1, samples, dtype=np.int16)
+
+
+def _never() -> bool:
+    return False
+
+
+def _run(name: str, should_stop: Callable[[], bool], body: Callable[[Callable[[], bool]], bool]) -> WarmupResult:
+    """Time ``body``; it returns False when it stopped early."""
+    if should_stop():
+        return WarmupResult(ms=0, cancelled=True)
+    start = time.perf_counter()
+    try:
+        finished = body(should_stop)
+    except Exception as exc:
+        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        logger.warning("%s warm-up failed after %d ms (non-fatal): %s", name, elapsed_ms, exc)
+        return WarmupResult(ms=elapsed_ms, error=str(exc))
+    result = WarmupResult(ms=int((time.perf_counter() - start) * 1000), cancelled=not finished)
+    logger.info("%s warm-up %s in %d ms", name, "cancelled" if result.cancelled else "done", result.ms)
+    return result
+
+
+def warm_up_vad(pipeline: AudioPipeline, *, should_stop: Callable[[], bool] = _never) -> WarmupResult:
+    """Run warm-up noise through the full VAD pipeline (normalize, highpass, Silero)."""
+
+    def body(_should_stop: Callable[[], bool]) -> bool:
+        pipeline.process(warmup_noise(), sample_rate=AudioConfig.DEFAULT_SAMPLE_RATE)
+        return True
+
+    return _run("VAD", should_stop, body)
+
+
+def warm_up_asr(
+    model: Any,
+    settings: VociferousSettings,
+    *,
+    should_stop: Callable[[], bool] = _never,
+) -> WarmupResult | None:
+    """Decode warm-up noise with the local Whisper model, using the real decode options.
+
+    Returns None for external providers, which have nothing local to warm.
+    """
+    from src.services.transcription_service import LOCAL_DECODE_OPTIONS, OpenAICompatibleTranscriptionProvider
+
+    if isinstance(model, OpenAICompatibleTranscriptionProvider):
+        return None
+
+    def body(stop: Callable[[], bool]) -> bool:
+        audio = warmup_noise().astype(np.float32) / 32768.0
+        segments, _ = model.transcribe(
+            audio,
+            language=settings.model.language or "en",
+            initial_prompt=settings.model.initial_prompt or None,
+            **LOCAL_DECODE_OPTIONS,
+        )
+        # Decoding is lazy: the encoder and decoder run while iterating.
+        for _segment in segments:
+            if stop():
+                return False
+        return True
+
+    return _run("ASR", should_stop, body)
+
+
+def warm_up_slm(
+    provider: RefinementProvider,
+    *,
+    should_stop: Callable[[], bool] = _never,
+) -> WarmupResult | None:
+    """Generate a few tokens with a local refinement provider.
+
+    Returns None for external providers, which have nothing local to warm.
+    """
+    from src.refinement.engine import GenerationCancelled
+    from src.refinement.providers import GenerationRequest
+
+    summary = provider.get_runtime_summary()
+    if summary.get("resolved_device") == "external":
+        return None
+
+    def body(stop: Callable[[], bool]) -> bool:
+        kwargs: dict[str, Any] = {}
+        if getattr(provider, "supports_cancellation", False) is True:
+            kwargs["should_cancel"] = stop
+        try:
+            provider.generate_custom(
+                system_prompt="Reply with one word.",
+                user_prompt="Ready?",
+                max_tokens=_SLM_WARMUP_TOKENS,
+                temperature=0.0,
+                request=GenerationRequest.for_custom(visible_output_tokens=_SLM_WARMUP_TOKENS),
+                **kwargs,
+            )
+        except GenerationCancelled:
+            return False
+        return True
+
+    return _run("SLM", should_stop, body)
+
+
+__all__ = ["WARMUP_AUDIO_SECONDS", "WarmupResult", "warm_up_asr", "warm_up_slm", "warm_up_vad", "warmup_noise"]
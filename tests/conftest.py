@@ -155,3 +155,33 @@ def _reset_coordinator_global():
     from src.api.deps import set_coordinator
 
     set_coordinator(None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_http_pool():
+    """Close the process-wide HTTP pool after every test.
+
+    Providers built without an injected client fall back to the shared pool;
+    dropping it keeps connections and warm-up targets from leaking between
+    tests.
+    """
+    yield
+    from src.core.http_pool import reset_http_pool
+
+    reset_http_pool()
+
+
+@pytest.fixture(autouse=True)
+def _reset_credential_cache():
+    """Start every test with an empty secret-store credential cache.
+
+    Tests patch the platform, ``shutil.which`` and ``subprocess.run`` to
+    emulate backends; a key or backend memoized by one must not leak into
+    the next.
+    """
+    from src.core.secret_store import clear_credential_cache, set_credential_cache_ttl
+
+    clear_credential_cache()
+    yield
+    set_credential_cache_ttl(None)
+    clear_credential_cache()
@@ -54,7 +54,7 @@ def api(coordinator, event_collector) -> Iterator[tuple]:
         save_refinement_provider_api_key,
         test_refinement_provider,
     )
-    from src.api.system import health, import_audio_file
+    from src.api.system import cancel_import_job, create_import_job, health, import_audio_file, list_import_jobs
     from src.api.transcription_providers import (
         delete_transcription_provider_api_key,
         get_transcription_provider_api_key_status,
@@ -117,6 +117,9 @@ def api(coordinator, event_collector) -> Iterator[tuple]:
             download_model,
             health,
             import_audio_file,
+            create_import_job,
+            list_import_jobs,
+            cancel_import_job,
             dispatch_intent,
             get_refinement_provider_api_key_status,
             save_refinement_provider_api_key,
@@ -346,6 +349,60 @@ class TestImportAudioRoute:
         assert len(dispatched) == 1
         assert not Path(dispatched[0].file_path).exists()
 
+    def test_import_job_stores_uploads_durably_and_lists_job(self, api, monkeypatch, tmp_path: Path):
+        client, coord, _ = api
+        monkeypatch.setenv("VOCIFEROUS_DATA_DIR", str(tmp_path / "data"))
+        dispatched = []
+
+        def dispatch_result(intent):
+            dispatched.append(intent)
+            job = coord.db.create_import_job(
+                "job_api", [(path, name, True) for path, name in zip(intent.file_paths, intent.file_names)]
+            )
+            return True, {"job_id": job.id, "total": len(job.files)}
+
+        coord.command_bus.dispatch_result = dispatch_result
+
+        resp = client.post(
+            "/api/import-jobs",
+            files=[
+                ("data", ("one.wav", b"RIFFone", "audio/wav")),
+                ("data", ("two.mp3", b"ID3two", "audio/mpeg")),
+            ],
+        )
+
+        assert resp.status_code == 201
+        assert resp.json() == {"status": "queued", "job_id": "job_api", "total": 2}
+        intent = dispatched[0]
+        assert intent.file_names == ("one.wav", "two.mp3")
+        assert [Path(path).parent for path in intent.file_paths] == [tmp_path / "data" / "imports"] * 2
+        assert Path(intent.file_paths[1]).read_bytes() == b"ID3two"
+
+        listing = client.get("/api/import-jobs").json()
+        assert listing["total"] == 1
+        assert [f["file_name"] for f in listing["items"][0]["files"]] == ["one.wav", "two.mp3"]
+
+        coord.command_bus.dispatch_result = lambda intent: (
+            True,
+            {"job_id": intent.job_id, "status": "cancel_requested"},
+        )
+        cancelled = client.post("/api/import-jobs/job_api/cancel")
+        assert cancelled.status_code == 200
+        assert cancelled.json()["status"] == "cancel_requested"
+
+    def test_import_job_rejects_unsupported_files_before_storing_any(self, api):
+        client, coord, _ = api
+        coord.command_bus.dispatch_result = MagicMock()
+
+        resp = client.post(
+            "/api/import-jobs",
+            files=[("data", ("one.wav", b"RIFF", "audio/wav")), ("data", ("notes.txt", b"hi", "text/plain"))],
+        )
+
+        assert resp.status_code == 400
+        assert "notes.txt" in resp.json()["error"]
+        coord.command_bus.dispatch_result.assert_not_called()
+
     def test_append_intent_preserves_source_but_keeps_default_list_count_stable(self, api):
         client, coord, _ = api
         root = coord.db.add_transcript(raw_text="Root text", duration_ms=1000)
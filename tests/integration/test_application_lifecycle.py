@@ -135,6 +135,7 @@ class TestHandlerRegistration:
             BeginRecordingIntent,
             BulkRefineTranscriptsIntent,
             CancelBulkRefinementIntent,
+            CancelImportJobIntent,
             CancelRecordingIntent,
             ClearAllTranscriptsIntent,
             CommitEditsIntent,
@@ -142,9 +143,11 @@ class TestHandlerRegistration:
             DeleteRecoveredRecordingIntent,
             DeleteTagIntent,
             DeleteTranscriptIntent,
+            ImportAudioBatchIntent,
             ImportAudioFileIntent,
             RefineTranscriptIntent,
             RestartEngineIntent,
+            ResumeImportJobIntent,
             RetitleTranscriptIntent,
             RetranscribeIntent,
             RevertToRawIntent,
@@ -161,6 +164,9 @@ class TestHandlerRegistration:
             CancelRecordingIntent,
             ToggleRecordingIntent,
             ImportAudioFileIntent,
+            ImportAudioBatchIntent,
+            ResumeImportJobIntent,
+            CancelImportJobIntent,
             RetranscribeIntent,
             CommitEditsIntent,
             RevertToRawIntent,
@@ -188,7 +194,7 @@ class TestHandlerRegistration:
 
     def test_handler_count_matches_intent_count(self, coordinator):
         """No extra/ghost handlers registered beyond the expected set."""
-        assert len(coordinator.command_bus._handlers) == 23
+        assert len(coordinator.command_bus._handlers) == 26
 
     def test_handlers_are_callable(self, coordinator):
         """Every registered handler must be callable."""
@@ -198,7 +204,7 @@ class TestHandlerRegistration:
     def test_double_register_does_not_duplicate(self, coordinator):
         """Calling _register_handlers again overwrites, doesn't stack."""
         coordinator._register_handlers()
-        assert len(coordinator.command_bus._handlers) == 23
+        assert len(coordinator.command_bus._handlers) == 26
 
 
 # ── Shutdown & Cleanup ────────────────────────────────────────────────────
@@ -316,6 +316,22 @@ class TestUpdateConfig:
         assert cfg_events[-1]["safety"]["confirm_delete"] is False
         assert coord.settings.safety.confirm_delete is False
 
+    def test_update_config_applies_credential_cache_ttl(self, wired):
+        coord, _events = wired
+
+        from src.core import secret_store
+        from src.core.intents.definitions import UpdateConfigIntent
+
+        coord.command_bus.dispatch(
+            UpdateConfigIntent(settings={"secrets": {"credential_cache_ttl_seconds": 300}}),
+        )
+        assert secret_store._provider_key_ttl_s == 300.0
+
+        coord.command_bus.dispatch(
+            UpdateConfigIntent(settings={"secrets": {"credential_cache_ttl_seconds": 0}}),
+        )
+        assert secret_store._provider_key_ttl_s is None
+
 
 # ── RestartEngineIntent ───────────────────────────────────────────────────
 
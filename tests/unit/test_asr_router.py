@@ -0,0 +1,234 @@
+"""
+Adaptive ASR routing tests.
+
+Real-time-factor estimation, the routing decision against a latency budget,
+the timing history the estimates are seeded from, and a routed dictation
+end to end: draft on the faster model with routing provenance, then the
+accurate pass in the background.
+"""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.core.handlers.recording_handlers import RecordingSession
+from src.core.settings import VociferousSettings
+from src.database.db import TranscriptDB
+from src.services.asr_router import AsrRouter, RtfEstimator
+
+_CPU_INT8 = ("cpu", "int8")
+
+
+def _settings(**model) -> VociferousSettings:
+    settings = VociferousSettings()
+    return settings.model_copy(
+        update={"model": settings.model.model_copy(update={"model": "large-v3", "latency_budget_s": 10.0, **model})}
+    )
+
+
+def _capture(model_id: str) -> dict[str, object]:
+    return {
+        "transcription_provider": "local_faster_whisper",
+        "transcription_model_id": model_id,
+        "transcription_resolved_device": "cpu",
+        "transcription_compute_type": "int8",
+    }
+
+
+def _router(rtf: dict[str, float], installed=("large-v3-turbo", "large-v3-turbo-int8")) -> AsrRouter:
+    estimator = RtfEstimator()
+    for model_id, value in rtf.items():
+        estimator.record((model_id, *_CPU_INT8), 10.0, value * 10.0)
+    return AsrRouter(estimator, installed=lambda model_id: model_id in installed)
+
+
+class TestRtfEstimator:
+    def test_moving_average_and_short_clips_ignored(self):
+        estimator = RtfEstimator(alpha=0.5)
+        key = ("large-v3", *_CPU_INT8)
+
+        estimator.record(key, 10.0, 4.0)
+        estimator.record(key, 10.0, 2.0)
+        estimator.record(key, 0.5, 5.0)  # too short to say anything
+
+        assert estimator.estimate(key) == pytest.approx(0.3)
+        assert estimator.snapshot() == {"large-v3/cpu/int8": {"rtf": 0.3, "samples": 2}}
+        assert estimator.estimate(("large-v3", "cuda", "float16")) is None
+
+    def test_seeded_from_transcript_timings(self, tmp_path):
+        db = TranscriptDB(db_path=tmp_path / "timings.db")
+        try:
+            local = {
+                "transcription_provider": "local_faster_whisper",
+                "transcription_model_id": "large-v3",
+                "transcription_resolved_device": "cpu",
+                "transcription_compute_type": "int8",
+                "duration_ms": 20_000,
+            }
+            db.add_transcript("a", transcription_time_ms=10_000, **local)
+            db.add_transcript("b", transcription_time_ms=0, **local)
+            db.add_transcript("c", transcription_time_ms=4_000, transcription_cached=True, **local)
+            db.add_transcript("d", duration_ms=20_000, transcription_time_ms=1_000, transcription_provider="groq")
+
+            assert db.recent_transcription_timings() == [("large-v3", "cpu", "int8", 20_000, 10_000)]
+            router = AsrRouter()
+            router.seed_once(db)
+            assert router.estimator.estimate(("large-v3", *_CPU_INT8)) == pytest.approx(0.5)
+        finally:
+            db.close()
+
+
+class TestRoute:
+    def test_stays_on_the_configured_model_within_budget_or_without_history(self):
+        router = _router({"large-v3": 0.5})
+
+        assert not router.route(_settings(), 15.0, _capture("large-v3")).routed  # 7.5 s predicted
+        assert not router.route(_settings(latency_budget_s=0.0), 600.0, _capture("large-v3")).routed
+        assert not _router({}).route(_settings(), 600.0, _capture("large-v3")).routed
+
+    def test_routes_to_the_most_accurate_model_that_fits(self):
+        decision = _router({"large-v3": 0.5}).route(_settings(), 30.0, _capture("large-v3"))
+
+        # large-v3-turbo is about half the size: ~7.9 s, inside the 10 s budget.
+        assert decision.model_id == "large-v3-turbo" and decision.routed_from == "large-v3"
+        assert decision.predicted_s == pytest.approx(15.0)
+        assert "over the 10s budget" in decision.reason
+
+    def test_measured_speeds_beat_the_size_prior(self):
+        router = _router({"large-v3": 0.5, "large-v3-turbo": 0.45})
+
+        assert router.route(_settings(), 30.0, _capture("large-v3")).model_id == "large-v3-turbo-int8"
+
+    def test_fastest_model_when_nothing_fits_and_only_installed_models(self):
+        assert _router({"large-v3": 0.5}).route(_settings(), 600.0, _capture("large-v3")).model_id == (
+            "large-v3-turbo-int8"
+        )
+        assert not _router({"large-v3": 0.5}, installed=()).route(_settings(), 600.0, _capture("large-v3")).routed
+
+
+# ---------------------------------------------------------------------------
+# RecordingSession integration
+# ---------------------------------------------------------------------------
+
+
+def _model(model_id: str) -> MagicMock:
+    model = MagicMock()
+    model._vociferous_runtime_summary = {
+        "provider": "local_faster_whisper",
+        "model_id": model_id,
+        "resolved_device": "cpu",
+        "compute_type_resolved": "int8",
+        "cpu_threads": 4,
+    }
+    return model
+
+
+@pytest.fixture()
+def db(tmp_path):
+    database = TranscriptDB(db_path=tmp_path / "routing.db")
+    yield database
+    database.close()
+
+
+@pytest.fixture()
+def session(db):
+    settings = _settings()
+    sess = RecordingSession(
+        audio_service_provider=lambda: None,
+        settings_provider=lambda: settings,
+        db_provider=lambda: db,
+        event_bus_emit=MagicMock(),
+        shutdown_event=threading.Event(),
+        insight_manager_provider=lambda: None,
+        asr_router=_router({"large-v3": 0.5}),
+    )
+    sess._asr_model = _model("large-v3")
+    sess._audio_pipeline = MagicMock()
+    yield sess
+    sess.asr_scheduler.shutdown()
+
+
+def _fake_transcribe(db: TranscriptDB, *, edit_before_accurate: bool = False):
+    def transcribe(audio, settings, local_model, audio_pipeline, between_segments=None, **_):
+        if local_model._vociferous_runtime_summary["model_id"] == "large-v3":
+            if edit_before_accurate:
+                db.update_normalized_text(db.recent(limit=1)[0][0].id, "Edited by hand.")
+            return "Accurate text.", 29_000, 15_000
+        return "Draft text.", 29_000, 6_000
+
+    return transcribe
+
+
+class TestRoutedDictation:
+    def test_draft_on_the_fast_model_then_the_accurate_pass(self, session, db):
+        with (
+            patch("src.services.transcription_service.create_local_model", return_value=_model("large-v3-turbo")),
+            patch("src.services.transcription_service.transcribe", side_effect=_fake_transcribe(db)),
+        ):
+            session._transcribe_and_store(np.zeros(16_000 * 30, dtype=np.int16))
+            assert session.asr_scheduler.wait_idle(5)
+
+        transcript = db.recent(limit=1)[0][0]
+        assert transcript.raw_text == "Draft text."
+        assert transcript.transcription_model_id == "large-v3-turbo"
+        assert transcript.transcription_routed_from == "large-v3"
+        assert "budget" in transcript.transcription_route_reason
+        assert transcript.normalized_text == "Accurate text."
+        assert transcript.last_retranscription_model_id == "large-v3"
+        # Both decodes fed the estimates.
+        assert set(session.asr_router.estimator.snapshot()) == {"large-v3/cpu/int8", "large-v3-turbo/cpu/int8"}
+
+    def test_edits_made_before_the_accurate_pass_are_kept(self, session, db):
+        with (
+            patch("src.services.transcription_service.create_local_model", return_value=_model("large-v3-turbo")),
+            patch(
+                "src.services.transcription_service.transcribe",
+                side_effect=_fake_transcribe(db, edit_before_accurate=True),
+            ),
+        ):
+            session._transcribe_and_store(np.zeros(16_000 * 30, dtype=np.int16))
+            assert session.asr_scheduler.wait_idle(5)
+
+        transcript = db.recent(limit=1)[0][0]
+        assert transcript.normalized_text == "Edited by hand." and transcript.retranscription_count == 0
+
+    def test_short_dictation_stays_on_the_configured_model(self, session, db):
+        with (
+            patch("src.services.transcription_service.create_local_model") as load,
+            patch("src.services.transcription_service.transcribe", side_effect=_fake_transcribe(db)),
+        ):
+            session._transcribe_and_store(np.zeros(16_000 * 5, dtype=np.int16))
+
+        load.assert_not_called()
+        transcript = db.recent(limit=1)[0][0]
+        assert transcript.raw_text == "Accurate text." and transcript.transcription_routed_from == ""
+
+    def test_routed_model_is_budgeted_and_dropped_on_hot_swap(self, session, db):
+        from src.services.model_residency import ModelResidencyManager
+
+        residency = ModelResidencyManager(settings_provider=session._settings_provider)
+        residency.register(
+            "asr_side",
+            load=session.preload_race_model,
+            unload=session.evict_side_models,
+            is_loaded=lambda: session.is_side_model_loaded,
+            estimate_mb=session.side_models_estimate_mb,
+        )
+        session._residency = residency
+        with (
+            patch("src.services.transcription_service.create_local_model", return_value=_model("large-v3-turbo")),
+            patch("src.services.transcription_service.transcribe", side_effect=_fake_transcribe(db)),
+        ):
+            session._transcribe_and_store(np.zeros(16_000 * 30, dtype=np.int16))
+            assert session.asr_scheduler.wait_idle(5)
+
+        status = residency.status()["models"]["asr_side"]
+        assert status["loads"] == 1 and session.side_models_estimate_mb() > 0
+
+        with patch("src.services.transcription_service.create_local_model", return_value=_model("large-v3")):
+            assert session.hot_swap_asr_model()
+        assert not session.is_side_model_loaded
@@ -0,0 +1,190 @@
+"""
+ASRScheduler tests.
+
+Priority ordering, cooperative yielding between segments, inline execution
+from the worker, shutdown, and queue/wait/RTF metrics.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import CancelledError
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.services.asr_scheduler import ASRJobPriority, ASRScheduler
+from src.services.transcription_service import transcribe_speech
+
+
+@pytest.fixture()
+def scheduler():
+    sched = ASRScheduler()
+    yield sched
+    sched.shutdown()
+
+
+def _block(scheduler: ASRScheduler, priority: ASRJobPriority = ASRJobPriority.DICTATION) -> threading.Event:
+    """Occupy the worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def _job() -> None:
+        started.set()
+        release.wait(5)
+
+    scheduler.submit(_job, priority=priority, label="blocker")
+    assert started.wait(2)
+    return release
+
+
+class _SlowWhisper:
+    """WhisperModel stand-in producing ``segments`` segments, ``delay_s`` apart."""
+
+    def __init__(self, segments: int, delay_s: float) -> None:
+        self.segments = segments
+        self.delay_s = delay_s
+
+    def transcribe(self, audio, **kwargs):
+        def _iter():
+            for index in range(self.segments):
+                time.sleep(self.delay_s)
+                yield SimpleNamespace(text=f" s{index}", end=float(index + 1))
+
+        return _iter(), None
+
+
+class TestPriorityOrdering:
+    def test_jobs_run_in_priority_order(self, scheduler):
+        release = _block(scheduler)
+        order: list[str] = []
+
+        for priority in reversed(ASRJobPriority):
+            scheduler.submit(lambda name=priority.name: order.append(name), priority=priority, label=priority.name)
+
+        release.set()
+        assert scheduler.wait_idle(2)
+        assert order == ["DICTATION", "RECOVERY", "RETRANSCRIBE", "IMPORT"]
+
+    def test_fifo_within_a_lane(self, scheduler):
+        release = _block(scheduler)
+        order: list[int] = []
+        for i in range(4):
+            scheduler.submit(lambda i=i: order.append(i), priority=ASRJobPriority.IMPORT)
+
+        release.set()
+        assert scheduler.wait_idle(2)
+        assert order == [0, 1, 2, 3]
+
+    def test_run_returns_result_and_reraises(self, scheduler):
+        assert scheduler.run(lambda: 42, priority=ASRJobPriority.DICTATION) == 42
+
+        def _fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            scheduler.run(_fail, priority=ASRJobPriority.IMPORT)
+        assert scheduler.metrics()["failed"] == 1
+
+
+class TestCooperativeYield:
+    def test_dictation_runs_at_the_next_segment_of_a_running_import(self, scheduler, fresh_settings, record_property):
+        segment_s = 0.1
+        import_started = threading.Event()
+        marks: list[str] = []
+
+        def _import():
+            import_started.set()
+            result = transcribe_speech(
+                np.zeros(16_000, dtype=np.float32),
+                fresh_settings,
+                _SlowWhisper(segments=20, delay_s=segment_s),
+                between_segments=scheduler.yield_to_urgent,
+            )
+            marks.append("import")
+            return result
+
+        import_future = scheduler.submit(_import, priority=ASRJobPriority.IMPORT, label="import")
+        assert import_started.wait(2)
+        time.sleep(segment_s * 2.5)
+
+        submitted = time.monotonic()
+        dictation = scheduler.run(
+            lambda: marks.append("dictation") or "dictated", priority=ASRJobPriority.DICTATION, label="dictation"
+        )
+        wait_s = time.monotonic() - submitted
+
+        assert dictation == "dictated"
+        text, _, _ = import_future.result(timeout=5)
+        # The import resumed where it yielded and kept every segment.
+        assert text.lower().split() == [f"s{i}" for i in range(20)]
+        assert marks == ["dictation", "import"]
+        record_property("dictation_wait_ms", round(wait_s * 1000, 1))
+        assert wait_s < segment_s * 3
+        assert scheduler.metrics()["yielded"] == 1
+
+    def test_equal_or_lower_priority_does_not_interrupt(self, scheduler):
+        order: list[str] = []
+        gate = threading.Event()
+
+        def _dictation():
+            gate.wait(2)
+            scheduler.yield_to_urgent()
+            order.append("dictation")
+
+        scheduler.submit(_dictation, priority=ASRJobPriority.DICTATION, label="first")
+        scheduler.submit(lambda: order.append("second"), priority=ASRJobPriority.DICTATION, label="second")
+        scheduler.submit(lambda: order.append("import"), priority=ASRJobPriority.IMPORT, label="import")
+        gate.set()
+
+        assert scheduler.wait_idle(2)
+        assert order == ["dictation", "second", "import"]
+
+    def test_yield_off_the_worker_is_a_noop(self, scheduler):
+        scheduler.yield_to_urgent()
+
+    def test_submit_from_worker_runs_inline(self, scheduler):
+        def _outer():
+            inner = scheduler.submit(lambda: "inner", priority=ASRJobPriority.IMPORT)
+            assert inner.done()
+            return inner.result()
+
+        assert scheduler.run(_outer, priority=ASRJobPriority.DICTATION) == "inner"
+
+
+class TestShutdownAndMetrics:
+    def test_shutdown_cancels_pending_jobs(self):
+        scheduler = ASRScheduler()
+        release = _block(scheduler)
+        pending = scheduler.submit(lambda: None, priority=ASRJobPriority.IMPORT)
+
+        scheduler.shutdown()
+        release.set()
+
+        with pytest.raises(CancelledError):
+            pending.result(timeout=1)
+        rejected = scheduler.submit(lambda: None, priority=ASRJobPriority.DICTATION)
+        with pytest.raises(RuntimeError):
+            rejected.result(timeout=1)
+
+    def test_metrics_report_depth_wait_and_rtf(self, scheduler):
+        release = _block(scheduler, ASRJobPriority.IMPORT)
+        scheduler.submit(lambda: time.sleep(0.05), priority=ASRJobPriority.DICTATION, audio_seconds=1.0)
+        scheduler.submit(lambda: None, priority=ASRJobPriority.IMPORT)
+
+        snapshot = scheduler.metrics()
+        assert snapshot["queue_depth"] == 2
+        assert snapshot["queue_depth_by_priority"] == {"dictation": 1, "recovery": 0, "retranscribe": 0, "import": 1}
+        assert snapshot["running"] == "blocker"
+
+        release.set()
+        assert scheduler.wait_idle(2)
+        metrics = scheduler.metrics()
+        assert metrics["completed"] == 3
+        assert metrics["wait_ms_by_priority"]["dictation"]["count"] == 1
+        assert metrics["wait_ms_by_priority"]["dictation"]["max_ms"] > 0
+        rtf = metrics["rtf_by_priority"]["dictation"]
+        assert rtf["count"] == 1 and 0.04 < rtf["rtf"] < 1.0
+        assert metrics["rtf_by_priority"]["import"]["count"] == 0
@@ -0,0 +1,270 @@
+"""
+Streaming audio import: PyAV block decoding, incremental VAD and grouped
+transcription with progress.
+
+The VAD session is scripted from chunk energy and the Whisper model is a
+stand-in, so no ONNX or ASR model is loaded.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.services import audio_import
+from src.services.audio_import import (
+    ImportCancelledError,
+    iter_audio_file_blocks,
+    transcribe_audio_file,
+    transcribe_audio_files,
+)
+from src.services.audio_pipeline import AudioPipeline
+
+SR = 16_000
+
+
+def _write_wav(path, audio: np.ndarray, sample_rate: int, channels: int = 1) -> None:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(audio.astype(np.int16).tobytes())
+
+
+def _bursts(seconds: float, *, speech_s: float = 6.0, pause_s: float = 2.0) -> np.ndarray:
+    """Alternating tone bursts and near-silence, int16 at 16 kHz."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(speech_s * SR)) / SR
+    speech = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+    pause = rng.normal(0, 2, int(pause_s * SR)).astype(np.int16)
+    cycle = np.concatenate([speech, pause])
+    repeats = int(np.ceil(seconds * SR / len(cycle)))
+    return np.tile(cycle, repeats)[: int(seconds * SR)]
+
+
+class _EnergyVad:
+    """Silero-shaped session: speech wherever the chunk carries energy.
+
+    A plain class rather than a MagicMock, which would keep every chunk
+    alive in its call history.
+    """
+
+    def run(self, _names, inputs):
+        prob = 0.95 if float(np.sqrt(np.mean(inputs["input"] ** 2))) > 0.01 else 0.02
+        return [np.array([[prob]], dtype=np.float32), inputs["state"]]
+
+
+def _pipeline() -> AudioPipeline:
+    pipeline = AudioPipeline(sample_rate=SR)
+    pipeline._session = _EnergyVad()
+    return pipeline
+
+
+class _Whisper:
+    """WhisperModel stand-in answering each call with one numbered segment."""
+
+    def __init__(self, delay_s: float = 0.0) -> None:
+        self.calls: list[int] = []
+        self.delay_s = delay_s
+
+    def transcribe(self, audio, **kwargs):
+        time.sleep(self.delay_s)
+        self.calls.append(len(audio))
+        return iter([SimpleNamespace(text=f" Group {len(self.calls)}.", end=len(audio) / SR)]), None
+
+
+def _sequential(settings):
+    return settings.model_copy(update={"model": settings.model.model_copy(update={"batch_size": 1})})
+
+
+class TestIterAudioFileBlocks:
+    def test_resamples_stereo_44k_to_16k_mono_blocks(self, tmp_path):
+        seconds = 12.0
+        t = np.arange(int(seconds * 44_100)) / 44_100
+        tone = (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+        path = tmp_path / "stereo.wav"
+        _write_wav(path, np.column_stack([tone, tone]).reshape(-1), 44_100, channels=2)
+
+        blocks = list(iter_audio_file_blocks(path, block_samples=SR))
+
+        assert all(block.dtype == np.int16 and block.ndim == 1 for block in blocks)
+        assert all(len(block) == SR for block in blocks[:-1])
+        assert sum(len(block) for block in blocks) == pytest.approx(seconds * SR, abs=SR // 100)
+        # 440 Hz survives the resample: ~880 zero crossings per second.
+        middle = blocks[5].astype(np.float32)
+        crossings = np.count_nonzero(np.diff(np.signbit(middle)))
+        assert crossings == pytest.approx(880, rel=0.02)
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(Exception):
+            list(iter_audio_file_blocks(tmp_path / "missing.wav"))
+
+
+class TestTranscribeAudioFile:
+    def test_segments_are_grouped_transcribed_and_stitched(self, tmp_path, fresh_settings):
+        path = tmp_path / "talk.wav"
+        _write_wav(path, _bursts(100.0), SR)
+        model = _Whisper()
+        progress: list[tuple[float, float]] = []
+
+        result = transcribe_audio_file(
+            path,
+            _sequential(fresh_settings),
+            model,
+            _pipeline(),
+            on_progress=lambda decoded, transcribed: progress.append((decoded, transcribed)),
+        )
+
+        # 100 s of 6 s bursts: ~75 s of padded speech in groups of at most 30 s.
+        assert len(model.calls) >= 3
+        assert all(samples <= 30 * SR + SR for samples in model.calls)
+        assert result.text.split() == [word for i in range(len(model.calls)) for word in ("Group", f"{i + 1}.")]
+        assert result.duration_ms == pytest.approx(100_000, abs=50)
+        assert result.speech_duration_ms > 0
+
+        decoded = [d for d, _ in progress]
+        transcribed = [t for _, t in progress]
+        assert decoded == sorted(decoded) and transcribed == sorted(transcribed)
+        assert progress[-1] == (pytest.approx(100.0, abs=0.05), pytest.approx(100.0, abs=0.05))
+
+    def test_stitched_text_is_post_processed_once(self, tmp_path, fresh_settings, monkeypatch):
+        from src.services import transcription_service
+
+        path = tmp_path / "talk.wav"
+        _write_wav(path, _bursts(100.0), SR)
+        model = _Whisper()
+        processed: list[str] = []
+        post_process = audio_import.post_process_transcription
+
+        def counting(text, settings):
+            processed.append(text)
+            return post_process(text, settings)
+
+        monkeypatch.setattr(audio_import, "post_process_transcription", counting)
+        monkeypatch.setattr(transcription_service, "post_process_transcription", counting)
+
+        result = transcribe_audio_file(path, _sequential(fresh_settings), model, _pipeline())
+
+        assert len(model.calls) >= 3
+        assert len(processed) == 1
+        assert result.text.endswith(". ") and not result.text.endswith("  ")
+
+    def test_silent_file_yields_no_text(self, tmp_path, fresh_settings):
+        path = tmp_path / "silence.wav"
+        _write_wav(path, np.zeros(10 * SR, dtype=np.int16), SR)
+        model = _Whisper()
+
+        result = transcribe_audio_file(path, fresh_settings, model, _pipeline())
+
+        assert result.text == ""
+        assert result.duration_ms == 10_000
+        assert model.calls == []
+
+    def test_decode_failure_is_raised_to_caller(self, tmp_path, fresh_settings):
+        path = tmp_path / "broken.wav"
+        path.write_bytes(b"RIFF not really a wav file")
+
+        with pytest.raises(Exception):
+            transcribe_audio_file(path, fresh_settings, _Whisper(), _pipeline())
+
+    def test_shutdown_abandons_the_import(self, tmp_path, fresh_settings):
+        path = tmp_path / "talk.wav"
+        _write_wav(path, _bursts(30.0), SR)
+
+        with pytest.raises(ImportCancelledError):
+            transcribe_audio_file(path, fresh_settings, _Whisper(), _pipeline(), should_stop=lambda: True)
+
+    def test_peak_memory_is_independent_of_file_length(self, tmp_path, fresh_settings, record_property):
+        peaks: dict[int, int] = {}
+        for seconds in (60, 180):
+            path = tmp_path / f"long_{seconds}.wav"
+            _write_wav(path, _bursts(seconds), SR)
+            tracemalloc.start()
+            try:
+                result = transcribe_audio_file(path, _sequential(fresh_settings), _Whisper(), _pipeline())
+                _, peaks[seconds] = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert result.duration_ms == pytest.approx(seconds * 1000, abs=50)
+            record_property(f"import_{seconds}s_peak_bytes", peaks[seconds])
+
+        # The whole-file path held decode_audio's float32 plus an int16 copy.
+        whole_file_bytes = 180 * SR * (4 + 2)
+        record_property("import_180s_whole_file_bytes", whole_file_bytes)
+        assert peaks[180] < whole_file_bytes / 2
+        assert peaks[180] < peaks[60] * 1.5
+
+
+class TestTranscribeAudioFiles:
+    def test_results_arrive_in_order_and_a_bad_file_does_not_stop_the_batch(self, tmp_path, fresh_settings):
+        paths = []
+        for name, seconds in (("a", 20.0), ("b", 0.0), ("c", 10.0)):
+            path = tmp_path / f"{name}.wav"
+            if seconds:
+                _write_wav(path, _bursts(seconds), SR)
+            else:
+                path.write_bytes(b"RIFF not really a wav file")
+            paths.append(path)
+        progress: dict[int, float] = {}
+
+        results = list(
+            transcribe_audio_files(
+                paths,
+                _sequential(fresh_settings),
+                _Whisper(),
+                _pipeline(),
+                on_progress=lambda index, decoded, _heard: progress.__setitem__(index, decoded),
+            )
+        )
+
+        assert [index for index, _ in results] == [0, 1, 2]
+        assert results[0][1].duration_ms == pytest.approx(20_000, abs=50)
+        assert isinstance(results[1][1], Exception)
+        assert results[2][1].duration_ms == pytest.approx(10_000, abs=50)
+        assert results[2][1].text.strip()
+        assert progress[0] == pytest.approx(20.0, abs=0.05) and progress[2] == pytest.approx(10.0, abs=0.05)
+
+    def test_next_file_decodes_while_current_one_transcribes(
+        self, tmp_path, fresh_settings, monkeypatch, record_property
+    ):
+        files, decode_delay_s, asr_s = 4, 0.25, 0.35
+        settings = _sequential(fresh_settings)
+        paths = []
+        for index in range(files):
+            paths.append(tmp_path / f"part{index}.wav")
+            _write_wav(paths[-1], _bursts(12.0, speech_s=4.0), SR)
+
+        real_blocks = audio_import.iter_audio_file_blocks
+
+        def slow_blocks(path, **kwargs):
+            blocks = list(real_blocks(path, **kwargs))
+            for block in blocks:
+                time.sleep(decode_delay_s / len(blocks))
+                yield block
+
+        monkeypatch.setattr(audio_import, "iter_audio_file_blocks", slow_blocks)
+
+        # One file at a time: each file's single group waits for its whole decode.
+        start = time.perf_counter()
+        for path in paths:
+            transcribe_audio_file(path, settings, _Whisper(delay_s=asr_s), _pipeline())
+        serial_s = time.perf_counter() - start
+
+        model = _Whisper(delay_s=asr_s)
+        start = time.perf_counter()
+        results = list(transcribe_audio_files(paths, settings, model, _pipeline()))
+        wall_s = time.perf_counter() - start
+
+        # 12 s of 4 s bursts is one 30 s group per file: one decode + one ASR pass each.
+        assert len(model.calls) == files
+        assert [index for index, _ in results] == list(range(files))
+        record_property("batch_import_wall_s", round(wall_s, 3))
+        record_property("batch_import_serial_s", round(serial_s, 3))
+        record_property("batch_import_asr_bound_s", files * asr_s)
+        # Overlapped, the batch costs about one decode plus the ASR passes.
+        assert wall_s < serial_s * 0.8
@@ -236,7 +236,7 @@ class TestExtractSpeech:
         result = pipe._extract_speech(audio, probs)
         assert result is not None
         # With padding, should return essentially everything
-        assert len(result) >= len(audio) * 0.5
+        assert len(result.audio) >= len(audio) * 0.5
 
     def test_all_silence_returns_none(self):
         pipe = AudioPipeline()
@@ -305,7 +305,7 @@ class TestExtractSpeech:
         # dip ended the segment, we'd see two shorter segments separated by
         # a 300ms silence insert (~4800 samples) instead of one contiguous run.
         min_expected_samples = 25 * 512  # the speech-active region alone
-        assert len(result) >= min_expected_samples
+        assert len(result.audio) >= min_expected_samples
 
     def test_hysteresis_allows_exit_below_exit_threshold(self):
         """Prob below exit threshold (0.35) DOES end the speech segment."""
@@ -331,7 +331,7 @@ class TestExtractSpeech:
         # That's 30 chunks × 512 = 15360 samples
         expected_chunks = 10 + 7 + 13  # speech + pre + post
         expected_samples = expected_chunks * 512
-        assert len(result) == expected_samples
+        assert len(result.audio) == expected_samples
 
     def test_inter_segment_silence_inserted(self):
         """When segments don't merge, low-level noise is inserted between them."""
@@ -347,7 +347,23 @@ class TestExtractSpeech:
         silence_samples = int(300 * 16000 / 1000)
         # Two segments with padding + silence insert
         min_expected = (10 + 10) * 512 + silence_samples
-        assert len(result) > min_expected
+        assert len(result.audio) > min_expected
+
+    def test_segment_bounds_locate_speech_in_output(self):
+        """The bounds mark each segment in the assembled output."""
+        pipe = AudioPipeline()
+        n_chunks = 120
+        audio = np.ones(n_chunks * 512, dtype=np.float32) * 0.1
+        probs = [0.9] * 10 + [0.1] * 50 + [0.9] * 10 + [0.1] * 50
+        result = pipe._extract_speech(audio, probs)
+        assert result is not None
+        silence_samples = int(300 * 16000 / 1000)
+        (first_start, first_end), (second_start, second_end) = result.bounds
+        assert first_start == 0
+        assert second_start - first_end == silence_samples
+        assert second_end == len(result.audio)
+        # The gap between them is the low-level noise insert, not speech.
+        assert np.abs(result.audio[first_end:second_start]).max() < 0.01
 
     def test_single_segment_no_silence_insert(self):
         """Single segment should have no silence inserted."""
@@ -411,3 +427,91 @@ class TestFullPipeline:
         assert result is not None
         assert pipe.sample_rate == 48000
         assert pipe._hp_alpha != original_alpha
+
+
+# ======================================================================
+# Streaming (SpeechStream)
+# ======================================================================
+
+
+def _scripted_session(probs: list[float]) -> MagicMock:
+    """Mock Silero session returning ``probs`` in call order."""
+    remaining = iter(probs)
+    session = MagicMock()
+    session.run.side_effect = lambda _names, inputs: [
+        np.array([[next(remaining)]], dtype=np.float32),
+        inputs["state"],
+    ]
+    return session
+
+
+class TestSpeechStream:
+    """open_stream(): the same segmentation, block by block."""
+
+    @staticmethod
+    def _probs() -> list[float]:
+        # speech, short pause (merged), speech, long pause (split), transient, speech to the end
+        return [0.05] * 20 + [0.9] * 60 + [0.1] * 30 + [0.9] * 40 + [0.1] * 100 + [0.9] * 3 + [0.1] * 60 + [0.9] * 50
+
+    def test_segments_match_batch_extraction(self):
+        probs = self._probs()
+        audio = np.random.default_rng(0).normal(0, 3000, len(probs) * 512 + 100).astype(np.int16)
+
+        batch = AudioPipeline()
+        batch._session = _scripted_session(probs)
+        speech = batch.process_speech(audio)
+        assert speech is not None
+        expected = [end - start for start, end in speech.bounds]
+
+        streaming = AudioPipeline()
+        streaming._session = _scripted_session(probs)
+        stream = streaming.open_stream()
+        segments = []
+        for start in range(0, len(audio), 3001):
+            segments += stream.push(audio[start : start + 3001])
+        segments += stream.finish()
+
+        assert [len(segment.audio) for segment in segments] == expected
+        # Pre-roll of 7 chunks before the first speech chunk (20).
+        assert segments[0].start == (20 - 7) * 512
+        assert all(a.end <= b.start for a, b in zip(segments, segments[1:]))
+
+    def test_segment_is_closed_once_the_pause_is_long_enough(self):
+        probs = [0.9] * 40 + [0.1] * 48
+        stream_pipe = AudioPipeline()
+        stream_pipe._session = _scripted_session(probs)
+        stream = stream_pipe.open_stream()
+
+        closed = stream.push(_make_tone(duration_s=len(probs) * 512 / 16000))
+
+        assert len(closed) == 1
+        assert len(closed[0].audio) == (40 + 13) * 512
+        assert stream.finish() == []
+
+    def test_continuous_speech_is_split_at_the_least_speechlike_chunk(self):
+        probs = [0.9] * 200
+        probs[150] = 0.5  # still speech under hysteresis, but the best cut point
+        pipe = AudioPipeline()
+        pipe._session = _scripted_session(probs)
+        stream = pipe.open_stream(max_segment_seconds=160 * 512 / 16000)
+
+        segments = stream.push(_make_tone(duration_s=len(probs) * 512 / 16000)) + stream.finish()
+
+        assert [segment.start for segment in segments] == [0, 151 * 512]
+        assert segments[0].end == segments[1].start
+        assert segments[1].end == 200 * 512
+
+    def test_retained_audio_stays_bounded(self):
+        probs = ([0.9] * 100 + [0.1] * 60) * 50
+        pipe = AudioPipeline()
+        pipe._session = _scripted_session(probs)
+        stream = pipe.open_stream(max_segment_seconds=2.0)
+        tone = _make_tone(duration_s=len(probs) * 512 / 16000)
+
+        retained = []
+        for start in range(0, len(tone), 8192):
+            stream.push(tone[start : start + 8192])
+            retained.append(len(stream._buffer))
+
+        # Never more than a forced-split segment plus the closing pause.
+        assert max(retained) < (2.0 * 16000) + (47 + 7) * 512 + 8192
@@ -0,0 +1,281 @@
+"""
+Hardware calibration tests.
+
+Knee and compute-type selection, the coordinate-descent sweep, the JSON
+profile store, resolution of the auto sentinels in the ASR/SLM runtime
+descriptors, and the background calibrator.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.cuda_runtime import CudaRuntimeStatus
+from src.core.settings import VociferousSettings
+from src.refinement.providers.runtime import describe_refinement_runtime
+from src.services.asr_scheduler import ASRJobPriority, ASRScheduler
+from src.services.calibration import (
+    ASR,
+    SLM,
+    CalibrationProfile,
+    CalibrationStore,
+    HardwareCalibrator,
+    MeasurementPreempted,
+    cpu_model,
+    pick_compute_type,
+    pick_knee,
+    resolve_cpu_runtime,
+    sweep,
+    thread_candidates,
+)
+from src.services.transcription_service import describe_asr_runtime
+
+_NO_CUDA = CudaRuntimeStatus(
+    driver_detected=False,
+    cuda_available=False,
+    cuda_device_count=0,
+    gpu_name="",
+    vram_total_mb=0,
+    vram_free_mb=0,
+    detail="no CUDA",
+)
+
+
+def _profile(
+    kind: str = ASR,
+    model_id: str = "large-v3-turbo-int8",
+    *,
+    machine: str | None = None,
+    threads: int = 6,
+    compute_type: str = "int8_float32",
+) -> CalibrationProfile:
+    return CalibrationProfile(
+        kind=kind,
+        model_id=model_id,
+        cpu_model=machine or cpu_model(),
+        threads=threads,
+        compute_type=compute_type,
+        metric="rtf" if kind == ASR else "tokens_per_second",
+        value=0.2,
+        calibrated_at=1.0,
+    )
+
+
+def _settings(model: dict | None = None, refinement: dict | None = None) -> VociferousSettings:
+    settings = VociferousSettings()
+    return settings.model_copy(
+        update={
+            "model": settings.model.model_copy(update={"device": "cpu", **(model or {})}),
+            "refinement": settings.refinement.model_copy(update={"n_gpu_layers": 0, **(refinement or {})}),
+        }
+    )
+
+
+@pytest.fixture()
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOCIFEROUS_DATA_DIR", str(tmp_path))
+    return CalibrationStore.open_default()
+
+
+class TestSelection:
+    def test_knee_is_the_smallest_count_near_the_best(self):
+        # Mirrors the _auto_cpu_threads benchmark: 8 threads is the knee.
+        assert pick_knee({1: 2.4, 4: 6.4, 8: 8.4, 12: 8.8}) == 8
+        assert pick_knee({1: 1.0, 2: 1.0}) == 1
+
+    def test_compute_type_near_ties_prefer_int8(self):
+        assert pick_compute_type({"int8": 10.0, "int8_float32": 10.3, "float32": 6.0}) == "int8"
+        assert pick_compute_type({"int8": 10.0, "int8_float32": 12.0, "float32": 6.0}) == "int8_float32"
+
+    def test_thread_candidates_are_capped_at_logical_cores(self):
+        assert thread_candidates(24) == [1, 2, 4, 6, 8, 12, 16]
+        assert thread_candidates(10) == [1, 2, 4, 6, 8, 10]
+        assert thread_candidates(1) == [1]
+
+
+class TestSweep:
+    def test_threads_then_compute_types_at_the_knee(self):
+        calls: list[tuple[int, str]] = []
+        rtf_by_threads = {1: 1.0, 2: 0.5, 4: 0.3, 8: 0.28}
+
+        def measure(threads: int, compute_type: str) -> float:
+            calls.append((threads, compute_type))
+            if compute_type == "float32":
+                raise RuntimeError("unsupported")
+            return rtf_by_threads[threads] * (0.5 if compute_type == "int8_float32" else 1.0)
+
+        profile = sweep(ASR, "tiny", measure, threads=[1, 2, 4, 8])
+
+        assert calls == [(1, "int8"), (2, "int8"), (4, "int8"), (8, "int8"), (4, "int8_float32"), (4, "float32")]
+        assert (profile.threads, profile.compute_type) == (4, "int8_float32")
+        assert profile.metric == "rtf" and profile.value == pytest.approx(0.15)
+        assert len(profile.samples) == 5  # the failed float32 run is not recorded
+
+    def test_slm_throughput_is_higher_is_better(self):
+        profile = sweep(SLM, "qwen4b", lambda threads, _ct: float(min(threads, 4)), threads=[2, 4, 8])
+
+        assert (profile.threads, profile.compute_type, profile.metric) == (4, "int8", "tokens_per_second")
+
+    def test_no_successful_measurement_raises(self):
+        def measure(threads: int, compute_type: str) -> float:
+            raise RuntimeError("model missing")
+
+        with pytest.raises(RuntimeError, match="no measurements"):
+            sweep(ASR, "tiny", measure, threads=[1, 2])
+
+
+class TestStoreAndResolution:
+    def test_profiles_round_trip_per_cpu_and_model(self, store):
+        store.put(_profile())
+        store.put(_profile(SLM, "qwen4b", threads=8, compute_type="int8"))
+        store.put(_profile(machine="Other CPU (64 threads)", threads=32))
+
+        reopened = CalibrationStore(store.path)
+        assert reopened.get(ASR, "large-v3-turbo-int8") == _profile()
+        assert reopened.get(ASR, "small-en") is None
+        assert [p.kind for p in reopened.profiles()] == [ASR, SLM]
+        assert reopened.get(ASR, "large-v3-turbo-int8", cpu="Other CPU (64 threads)").threads == 32
+
+    def test_unreadable_file_is_ignored(self, store):
+        store.path.write_text("{not json", encoding="utf-8")
+
+        assert store.get(ASR, "large-v3-turbo-int8") is None
+
+    def test_resolution_sources(self, store):
+        assert resolve_cpu_runtime(ASR, "m", 4, "int8", fallback_threads=2, store=store) == (4, "int8", "configured")
+        assert resolve_cpu_runtime(ASR, "m", 0, "auto", fallback_threads=2, store=store) == (2, "int8", "default")
+
+        store.put(_profile(model_id="m"))
+        assert resolve_cpu_runtime(ASR, "m", 0, "auto", fallback_threads=2, store=store) == (
+            6,
+            "int8_float32",
+            "calibrated",
+        )
+        # Only the auto setting is taken from the profile.
+        assert resolve_cpu_runtime(ASR, "m", 3, "auto", fallback_threads=2, store=store)[:2] == (3, "int8_float32")
+
+    def test_asr_runtime_reads_the_profile_for_auto_settings(self, store):
+        settings = _settings(model={"n_threads": 0, "compute_type": "auto"})
+        before = describe_asr_runtime(settings, cuda_status=_NO_CUDA)
+        store.put(_profile(model_id=settings.model.model))
+        after = describe_asr_runtime(settings, cuda_status=_NO_CUDA)
+
+        assert (before["cpu_threads"], before["compute_type_resolved"], before["cpu_runtime_source"]) == (
+            4,
+            "int8",
+            "default",
+        )
+        assert (after["cpu_threads"], after["compute_type_resolved"], after["cpu_runtime_source"]) == (
+            6,
+            "int8_float32",
+            "calibrated",
+        )
+
+    def test_refinement_runtime_reads_the_slm_profile(self, store):
+        settings = _settings(model={"compute_type": "auto"}, refinement={"n_threads": 0})
+        store.put(_profile(SLM, settings.refinement.model_id, threads=8, compute_type="int8"))
+
+        runtime = describe_refinement_runtime(settings, cuda_status=_NO_CUDA)
+
+        assert (runtime["cpu_threads"], runtime["compute_type"], runtime["cpu_runtime_source"]) == (
+            8,
+            "int8",
+            "calibrated",
+        )
+
+
+class TestHardwareCalibrator:
+    def test_sweeps_run_on_the_scheduler_only_when_started(self, store, monkeypatch):
+        settings = _settings(model={"n_threads": 0})
+        seen_threads: list[str] = []
+
+        def fake_measure(_settings, **_kwargs):
+            def _measure(threads: int, compute_type: str) -> float:
+                seen_threads.append(threading.current_thread().name)
+                return 1.0 / min(threads, 2)
+
+            return _measure
+
+        monkeypatch.setattr("src.services.calibration.asr_measure", fake_measure)
+        monkeypatch.setattr("src.services.calibration.thread_candidates", lambda: [1, 2, 4])
+        scheduler = ASRScheduler()
+        residency = MagicMock()
+        calibrator = HardwareCalibrator(
+            settings_provider=lambda: settings, store=store, asr_scheduler=scheduler, residency=residency
+        )
+        try:
+            assert calibrator.missing() == [ASR]
+            assert calibrator.is_running() is False
+            assert calibrator.start([ASR]) is True
+            calibrator._thread.join(timeout=5)
+
+            profile = store.get(ASR, settings.model.model)
+            assert (profile.threads, profile.compute_type) == (2, "int8")
+            # Every configuration ran as a job on the ASR scheduler worker.
+            assert seen_threads and all(name == seen_threads[0] != "hardware-calibration" for name in seen_threads)
+            # The resident model was unloaded for each measurement and reloaded afterwards.
+            assert residency.evict.call_count == len(seen_threads)
+            residency.evict.assert_called_with(ASR, reason="calibration", check_busy=False)
+            residency.prefetch.assert_called_once_with(ASR)
+            assert calibrator.missing() == []
+            status = calibrator.status()
+            assert status["running"] is False and status["errors"] == {}
+            assert [p["kind"] for p in status["profiles"]] == [ASR]
+        finally:
+            scheduler.shutdown()
+
+    def test_measurement_yields_to_dictation_and_runs_again(self, store, monkeypatch):
+        settings = _settings(model={"n_threads": 0})
+        scheduler = ASRScheduler()
+        order: list[str] = []
+        dictation: list = []
+
+        def fake_measure(_settings, *, should_stop):
+            def _measure(threads: int, compute_type: str) -> float:
+                if not dictation:
+                    # A dictation arrives from another thread while the first configuration runs.
+                    dictation.append(
+                        threading.Thread(
+                            target=scheduler.submit,
+                            args=(lambda: order.append("dictation"),),
+                            kwargs={"priority": ASRJobPriority.DICTATION},
+                        )
+                    )
+                    dictation[0].start()
+                    while not should_stop():
+                        time.sleep(0.001)
+                    raise MeasurementPreempted()
+                order.append(f"measure-{threads}")
+                return 1.0 / threads
+
+            return _measure
+
+        monkeypatch.setattr("src.services.calibration.asr_measure", fake_measure)
+        monkeypatch.setattr("src.services.calibration.thread_candidates", lambda: [1, 2])
+        calibrator = HardwareCalibrator(settings_provider=lambda: settings, store=store, asr_scheduler=scheduler)
+        try:
+            assert calibrator.start([ASR]) is True
+            calibrator._thread.join(timeout=5)
+
+            assert order[:2] == ["dictation", "measure-1"]
+            assert calibrator.status()["errors"] == {}
+            assert {sample["threads"] for sample in store.get(ASR, settings.model.model).samples} == {1, 2}
+        finally:
+            scheduler.shutdown()
+
+    def test_failures_are_reported_in_status(self, store, monkeypatch):
+        def broken_measure(_settings, **_kwargs):
+            raise FileNotFoundError("CT2 model directory not found")
+
+        monkeypatch.setattr("src.services.calibration.slm_measure", broken_measure)
+        calibrator = HardwareCalibrator(settings_provider=_settings, store=store)
+
+        assert calibrator.start([SLM]) is True
+        calibrator._thread.join(timeout=5)
+
+        assert calibrator.status()["errors"] == {SLM: "CT2 model directory not found"}
+        assert store.get(SLM, _settings().refinement.model_id) is None
@@ -0,0 +1,77 @@
+"""Tests for src.refinement.chunking — bounded windows for long transcripts."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.refinement.chunking import drop_overlap, estimate_tokens, plan_chunks
+
+SENTENCE = "The committee reviewed the budget and approved the new schedule."
+
+
+def _text(sentences: int, paragraph_every: int = 0) -> str:
+    parts = []
+    for index in range(sentences):
+        parts.append(SENTENCE)
+        if paragraph_every and (index + 1) % paragraph_every == 0 and index + 1 < sentences:
+            parts.append("\n\n")
+        elif index + 1 < sentences:
+            parts.append(" ")
+    return "".join(parts)
+
+
+class TestPlanChunks:
+    def test_chunks_respect_the_token_budget(self) -> None:
+        plan = plan_chunks(_text(40), max_tokens=64)
+
+        assert len(plan.chunks) > 1
+        assert all(estimate_tokens(chunk.body) <= 64 for chunk in plan.chunks)
+
+    def test_unrefined_stitch_round_trips(self) -> None:
+        text = "  " + _text(30, paragraph_every=4) + "\n"
+        plan = plan_chunks(text, max_tokens=64, overlap_tokens=8)
+
+        assert plan.stitch([None] * len(plan.chunks)) == text
+
+    def test_paragraph_breaks_close_half_full_chunks(self) -> None:
+        plan = plan_chunks(_text(6, paragraph_every=2), max_tokens=40)
+
+        assert [chunk.separator for chunk in plan.chunks[:-1]] == ["\n\n", "\n\n"]
+
+    def test_run_on_text_is_cut_at_word_boundaries(self) -> None:
+        text = " ".join(["word"] * 400)
+        plan = plan_chunks(text, max_tokens=50)
+
+        assert len(plan.chunks) > 1
+        assert all(chunk.body.split() == ["word"] * len(chunk.body.split()) for chunk in plan.chunks)
+        assert plan.stitch([None] * len(plan.chunks)) == text
+
+    def test_chunks_after_the_first_carry_overlap_context(self) -> None:
+        plan = plan_chunks(_text(20), max_tokens=48, overlap_tokens=6)
+
+        assert plan.chunks[0].overlap == ""
+        for previous, chunk in zip(plan.chunks, plan.chunks[1:]):
+            assert chunk.overlap and previous.body.endswith(chunk.overlap)
+            assert chunk.text == f"{chunk.overlap} {chunk.body}"
+
+    def test_refined_overlap_is_dropped_when_stitching(self) -> None:
+        plan = plan_chunks(_text(12), max_tokens=48, overlap_tokens=6)
+
+        stitched = plan.stitch([region.upper() for region in plan.regions])
+
+        assert stitched == _text(12).upper()
+
+    def test_rejects_non_positive_budget(self) -> None:
+        with pytest.raises(ValueError):
+            plan_chunks("text", max_tokens=0)
+
+
+class TestDropOverlap:
+    def test_drops_lightly_edited_overlap(self) -> None:
+        assert drop_overlap("So, we went home. Then we ate.", "so we um went home") == "Then we ate."
+
+    def test_keeps_text_when_overlap_cannot_be_aligned(self) -> None:
+        assert drop_overlap("Something else entirely.", "so we went home") == "Something else entirely."
+
+    def test_no_overlap_is_a_no_op(self) -> None:
+        assert drop_overlap("Text.", "") == "Text."
@@ -0,0 +1,212 @@
+"""
+CPU core partitioning tests.
+
+Plan construction from settings and a synthetic core layout, thread caps in
+the runtime descriptions, and the partitioner's pinning and rebalancing
+(thread affinity calls recorded instead of applied).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.core.cuda_runtime import CudaRuntimeStatus
+from src.core.settings import VociferousSettings
+from src.services import cpu_partition
+from src.services.cpu_partition import (
+    ASR,
+    SLM,
+    CorePartitioner,
+    CorePlan,
+    _parse_cpu_list,
+    engine_busy,
+    engines_on_cpu,
+    partition_threads,
+    pinned_load,
+    plan_partition,
+)
+from src.services.transcription_service import describe_asr_runtime
+
+_NO_CUDA = CudaRuntimeStatus(detail="test")
+_CUDA = CudaRuntimeStatus(driver_detected=True, cuda_available=True, cuda_device_count=1)
+# Five physical cores with SMT siblings, numbered the way Linux does.
+_CORES = [(0, 5), (1, 6), (2, 7), (3, 8), (4, 9)]
+
+
+def _settings(cpu: dict | None = None, model: dict | None = None, refinement: dict | None = None):
+    settings = VociferousSettings()
+    return settings.model_copy(
+        update={
+            "cpu": settings.cpu.model_copy(update={"partition": True, **(cpu or {})}),
+            "model": settings.model.model_copy(update={"device": "cpu", **(model or {})}),
+            "refinement": settings.refinement.model_copy(update={"n_gpu_layers": 0, **(refinement or {})}),
+        }
+    )
+
+
+class TestPlan:
+    def test_both_engines_split_whole_cores_after_the_reserve(self):
+        plan = plan_partition(_settings(), cuda_status=_NO_CUDA, cores=_CORES)
+
+        assert plan.reserved == (0, 5)
+        assert plan.asr == (1, 2, 6, 7) and plan.slm == (3, 4, 8, 9)
+        assert (plan.asr_cores, plan.slm_cores) == (2, 2)
+        assert plan.split and plan.shared == (1, 2, 3, 4, 6, 7, 8, 9)
+
+    def test_asr_share_moves_the_boundary_but_leaves_each_engine_a_core(self):
+        heavy = plan_partition(_settings(cpu={"asr_share": 0.75}), cuda_status=_NO_CUDA, cores=_CORES)
+        greedy = plan_partition(_settings(cpu={"asr_share": 1.0}), cuda_status=_NO_CUDA, cores=_CORES)
+
+        assert (heavy.asr_cores, heavy.slm_cores) == (3, 1)
+        assert (greedy.asr_cores, greedy.slm_cores) == (3, 1)
+
+    def test_an_engine_alone_on_the_cpu_gets_every_engine_core(self):
+        gpu_asr = plan_partition(_settings(model={"device": "cuda"}), cuda_status=_CUDA, cores=_CORES)
+        no_slm = plan_partition(_settings(refinement={"enabled": False}), cuda_status=_NO_CUDA, cores=_CORES)
+
+        assert gpu_asr.asr == () and gpu_asr.slm_cores == 4 and not gpu_asr.split
+        assert no_slm.slm == () and no_slm.asr == (1, 2, 3, 4, 6, 7, 8, 9)
+
+    def test_empty_when_off_idle_or_too_small(self):
+        assert plan_partition(_settings(cpu={"partition": False}), cuda_status=_NO_CUDA, cores=_CORES) == CorePlan()
+        assert plan_partition(_settings(), cuda_status=_NO_CUDA, cores=_CORES[:2]) == CorePlan()
+        everything_on_gpu = _settings(model={"device": "auto"}, refinement={"n_gpu_layers": -1})
+        assert plan_partition(everything_on_gpu, cuda_status=_CUDA, cores=_CORES) == CorePlan()
+
+    def test_engines_on_cpu_follows_devices_and_providers(self):
+        auto = _settings(model={"device": "auto"}, refinement={"n_gpu_layers": -1})
+
+        assert engines_on_cpu(auto, _NO_CUDA) == {ASR, SLM}
+        assert engines_on_cpu(auto, _CUDA) == set()
+        assert engines_on_cpu(_settings(model={"provider": "groq"}, refinement={"provider": "groq"}), _NO_CUDA) == set()
+
+    def test_parse_cpu_list(self):
+        assert _parse_cpu_list("0-3,8,10-11\n") == (0, 1, 2, 3, 8, 10, 11)
+
+
+class TestThreadCaps:
+    def test_threads_are_capped_at_the_engine_share(self):
+        settings = _settings(model={"n_threads": 8})
+        with patch.object(cpu_partition, "physical_cores", return_value=tuple(_CORES)):
+            assert partition_threads(settings, ASR, 8, cuda_status=_NO_CUDA) == 2
+            assert partition_threads(settings, SLM, 1, cuda_status=_NO_CUDA) == 1
+            assert describe_asr_runtime(settings, cuda_status=_NO_CUDA)["cpu_threads"] == 2
+
+    def test_threads_are_untouched_without_a_plan(self):
+        settings = _settings(cpu={"partition": False})
+
+        assert partition_threads(settings, ASR, 8, cuda_status=_NO_CUDA) == 8
+
+    def test_partitioning_is_off_by_default(self):
+        settings = VociferousSettings()
+
+        assert settings.cpu.partition is False
+        assert plan_partition(settings, cuda_status=_NO_CUDA, cores=_CORES) == CorePlan()
+
+
+class _Pins:
+    """Records ``_set_affinity`` calls as the last mask per thread."""
+
+    def __init__(self) -> None:
+        self.masks: dict[int, tuple[int, ...]] = {}
+
+    def __call__(self, tid: int, cpus) -> bool:
+        self.masks[tid] = tuple(cpus)
+        return True
+
+
+@pytest.fixture
+def pins():
+    recorder = _Pins()
+    with (
+        patch.object(cpu_partition, "_set_affinity", recorder),
+        patch.object(cpu_partition.os, "sched_setaffinity"),
+        patch.object(cpu_partition.os, "sched_getaffinity", return_value={0}),
+    ):
+        yield recorder
+
+
+def _partitioner(plan: CorePlan) -> CorePartitioner:
+    partitioner = CorePartitioner(lambda: VociferousSettings(), planner=lambda settings: plan)
+    partitioner._enabled = True
+    partitioner._threads = {ASR: {101}, SLM: {201}}
+    return partitioner
+
+
+_SPLIT = CorePlan(asr=(1, 2), slm=(3, 4), reserved=(0,), asr_cores=2, slm_cores=2)
+
+
+class TestPartitioner:
+    def test_a_lone_busy_engine_spreads_and_narrows_when_the_other_starts(self, pins):
+        partitioner = _partitioner(_SPLIT)
+
+        with partitioner.busy(ASR):
+            assert pins.masks[101] == (1, 2, 3, 4)
+            with partitioner.busy(SLM):
+                assert pins.masks[101] == (1, 2) and pins.masks[201] == (3, 4)
+                assert partitioner.status()["busy"] == [ASR, SLM]
+            assert pins.masks[101] == (1, 2, 3, 4)
+        assert pins.masks[101] == (1, 2)
+
+    def test_worker_processes_are_pinned_whole(self, pins):
+        partitioner = _partitioner(_SPLIT)
+        with patch.object(cpu_partition, "_tasks", return_value=[501, 502]):
+            partitioner.adopt_process(SLM, 500)
+
+        assert pins.masks[501] == pins.masks[502] == (3, 4)
+        assert partitioner.status()["processes"][SLM] == [500]
+
+    def test_nothing_is_pinned_without_a_set(self, pins):
+        partitioner = _partitioner(CorePlan(slm=(1, 2, 3, 4), slm_cores=4))
+
+        with partitioner.busy(ASR):
+            partitioner.adopt_process(ASR, 500)
+        assert 101 not in pins.masks and partitioner.status()["processes"][ASR] == []
+
+    def test_refresh_replans_and_repins(self, pins):
+        plans = iter([_SPLIT, CorePlan(asr=(1, 2, 3, 4), asr_cores=4)])
+        partitioner = CorePartitioner(lambda: VociferousSettings(), planner=lambda settings: next(plans))
+        partitioner._enabled = True
+        partitioner._threads[ASR].add(101)
+
+        assert partitioner.plan() == _SPLIT
+        assert partitioner.refresh().asr == (1, 2, 3, 4)
+        assert pins.masks[101] == (1, 2, 3, 4)
+
+
+@pytest.mark.skipif(not cpu_partition.affinity_supported(), reason="thread affinity is Linux-only")
+class TestRealAffinity:
+    def test_threads_started_during_a_pinned_load_are_tracked(self):
+        cpu = min(os.sched_getaffinity(0))
+        partitioner = CorePartitioner(
+            lambda: VociferousSettings(), planner=lambda settings: CorePlan(asr=(cpu,), asr_cores=1)
+        )
+        started, release = threading.Event(), threading.Event()
+
+        def pool_thread() -> None:
+            started.set()
+            release.wait(5)
+
+        cpu_partition.install_core_partitioner(partitioner)
+        try:
+            with pinned_load(ASR):
+                thread = threading.Thread(target=pool_thread, daemon=True)
+                thread.start()
+                started.wait(5)
+            with engine_busy(ASR):
+                assert os.sched_getaffinity(0) == {cpu}
+            assert partitioner.status()["threads"][ASR] >= 1
+        finally:
+            cpu_partition.install_core_partitioner(None)
+            release.set()
+            thread.join(5)
+
+    def test_helpers_do_nothing_without_a_partitioner(self):
+        before = os.sched_getaffinity(0)
+        with pinned_load(ASR), engine_busy(SLM):
+            assert os.sched_getaffinity(0) == before
+        cpu_partition.adopt_process(ASR, os.getpid())
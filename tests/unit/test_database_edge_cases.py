@@ -185,6 +185,59 @@ class TestAudioVaultTables:
         assert completed.transcript_id == transcript.id
 
 
+class TestImportJobTables:
+    def test_job_files_keep_order_and_complete_atomically(self, db: TranscriptDB) -> None:
+        db.add_tag("Imported", is_system=True)
+        job = db.create_import_job("job1", [("/in/b.wav", "b.wav", False), ("/in/a.wav", "a.wav", True)])
+        assert job.status == "queued"
+        assert [f.file_name for f in job.files] == ["b.wav", "a.wav"]
+        assert job.files[1].cleanup_source is True
+
+        transcript = db.complete_import_file(
+            "job1", 0, "hello", duration_ms=1000, system_tag="Imported", include_in_analytics=False
+        )
+        db.mark_import_file_status("job1", 1, "failed", failure_reason="bad header")
+
+        job = db.get_import_job("job1")
+        assert job is not None
+        assert job.files[0].status == "completed"
+        assert job.files[0].transcript_id == transcript.id
+        assert job.to_dict()["completed"] == 1 and job.to_dict()["failed"] == 1
+        stored = db.get_transcript(transcript.id)
+        assert stored is not None
+        assert stored.include_in_analytics is False
+        assert [tag.name for tag in stored.tags] == ["Imported"]
+
+    def test_failed_completion_leaves_no_transcript(self, db: TranscriptDB, monkeypatch) -> None:
+        db.add_tag("Imported", is_system=True)
+        db.create_import_job("job1", [("/in/a.wav", "a.wav", False)])
+
+        def _fail(_transcript_id):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        # Fails after the transcript row is written, inside the same transaction.
+        monkeypatch.setattr(db, "_get_tags_for_transcript", _fail)
+        with pytest.raises(sqlite3.OperationalError):
+            db.complete_import_file("job1", 0, "hello", system_tag="Imported")
+
+        assert db.transcript_count() == 0
+        job = db.get_import_job("job1")
+        assert job is not None and job.files[0].status == "pending"
+
+    def test_unfinished_jobs_are_interrupted_on_startup(self, db: TranscriptDB) -> None:
+        db.create_import_job("queued", [("/in/a.wav", "a.wav", False)])
+        db.create_import_job("running", [("/in/b.wav", "b.wav", False)])
+        db.create_import_job("done", [("/in/c.wav", "c.wav", False)])
+        db.mark_import_job_status("running", "running")
+        db.mark_import_job_status("done", "completed", finished=True)
+
+        interrupted = db.interrupt_import_jobs()
+
+        assert sorted(job.id for job in interrupted) == ["queued", "running"]
+        assert [job.id for job in db.list_import_jobs(("interrupted",))] == ["queued", "running"]
+        assert db.get_import_job("done").status == "completed"
+
+
 class TestLegacySchemaBootstrap:
     def test_pre_v11_database_bootstraps_and_migrates(self, tmp_path: Path) -> None:
         db_path = tmp_path / "legacy_v10.db"
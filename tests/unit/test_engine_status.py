@@ -84,6 +84,7 @@ def test_build_engine_status_reports_ready_models(monkeypatch, tmp_path: Path) -
             last_error=None,
             get_runtime_summary=lambda: {"resolved_device": "cuda"},
         ),
+        slm_scheduler=types.SimpleNamespace(metrics=lambda: {"queue_depth": 2, "running": "refine"}),
         is_recording_active=lambda: False,
     )
 
@@ -92,6 +93,7 @@ def test_build_engine_status_reports_ready_models(monkeypatch, tmp_path: Path) -
     assert status["status"] == "ready"
     assert status["asr"]["ready"] is True
     assert status["slm"]["ready"] is True
+    assert status["slm_queue"] == {"queue_depth": 2, "running": "refine"}
     assert status["providers"][0]["id"] == "local_ct2"
     reset_for_tests()
 
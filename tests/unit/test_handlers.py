@@ -16,7 +16,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.database.db import TranscriptDB
-from src.services.slm_types import SLMState
+from src.services.slm_types import RefinedText, SLMState
 
 # ---------------------------------------------------------------------------
 # Shared fixtures
@@ -239,7 +239,7 @@ class TestRefinementHandlersHappyPath:
 
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-        mock_slm.refine_text_sync.return_value = "refined version of the text"
+        mock_slm.refine_text_with_provenance.return_value = RefinedText("refined version of the text")
 
         handler = RefinementHandlers(
             db_provider=lambda: db,
@@ -261,8 +261,8 @@ class TestRefinementHandlersHappyPath:
         assert complete[0]["transcript_id"] == t.id
         assert complete[0]["text"] == "refined version of the text"
         assert complete[0]["level"] == 2
-        mock_slm.refine_text_sync.assert_called_once()
-        assert mock_slm.refine_text_sync.call_args.kwargs["allow_skip"] is False
+        mock_slm.refine_text_with_provenance.assert_called_once()
+        assert mock_slm.refine_text_with_provenance.call_args.kwargs["allow_skip"] is False
 
         # Completion is preview-only until an explicit commit intent is handled.
         refreshed = db.get_transcript(t.id)
@@ -280,7 +280,7 @@ class TestRefinementHandlersHappyPath:
 
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-        mock_slm.refine_text_sync.return_value = "clean enough text"
+        mock_slm.refine_text_with_provenance.return_value = RefinedText("clean enough text")
 
         handler = RefinementHandlers(
             db_provider=lambda: db,
@@ -292,7 +292,7 @@ class TestRefinementHandlersHappyPath:
         handler.handle_refine(SimpleNamespace(transcript_id=t.id, level=2, instructions=None))
         _wait_for_threads("refine")
 
-        assert mock_slm.refine_text_sync.call_args.kwargs["allow_skip"] is True
+        assert mock_slm.refine_text_with_provenance.call_args.kwargs["allow_skip"] is True
 
     def test_single_refine_persists_processing_provenance(self, db, events):
         from src.core.handlers.refinement_handlers import RefinementHandlers
@@ -303,7 +303,10 @@ class TestRefinementHandlersHappyPath:
 
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-        mock_slm.refine_text_sync.return_value = "refined version"
+        mock_slm.refine_text_with_provenance.return_value = RefinedText(
+            "refined version", prompt_tokens=72, completion_tokens=38, total_tokens=110
+        )
+        # Usage comes from the result itself, never the runtime's last-run summary.
         mock_slm.get_runtime_summary.return_value = {
             "provider": "lm_studio",
             "model_id": "qwen3.5-27b",
@@ -312,11 +315,7 @@ class TestRefinementHandlersHappyPath:
             "cpu_threads": 8,
             "gpu_layers": 99,
             "use_thinking": False,
-            "last_usage": {
-                "prompt_tokens": 72,
-                "completion_tokens": 38,
-                "total_tokens": 110,
-            },
+            "last_usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
         }
 
         handler = RefinementHandlers(
@@ -380,7 +379,7 @@ class TestRefinementHandlersHappyPath:
 
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-        mock_slm.refine_text_sync.side_effect = RuntimeError("inference exploded")
+        mock_slm.refine_text_with_provenance.side_effect = RuntimeError("inference exploded")
 
         handler = RefinementHandlers(
             db_provider=lambda: db,
@@ -427,7 +426,7 @@ class TestBulkRefinementHappyPath:
 
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-        mock_slm.refine_text_sync.side_effect = lambda text, **kw: f"refined: {text}"
+        mock_slm.refine_text_with_provenance.side_effect = lambda text, **kw: RefinedText(f"refined: {text}")
         insight_manager = MagicMock()
 
         handler, ev = self._make_handler(
@@ -461,7 +460,7 @@ class TestBulkRefinementHappyPath:
         assert len(progress) == 3
         assert progress[-1]["completed"] == 3
         assert progress[-1]["failed"] == 0
-        assert all(call.kwargs["allow_skip"] is False for call in mock_slm.refine_text_sync.call_args_list)
+        assert all(call.kwargs["allow_skip"] is False for call in mock_slm.refine_text_with_provenance.call_args_list)
 
         complete = _events_of(ev, "bulk_refinement_complete")
         assert len(complete) == 1
@@ -480,7 +479,7 @@ class TestBulkRefinementHappyPath:
 
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-        mock_slm.refine_text_sync.return_value = "clean enough text"
+        mock_slm.refine_text_with_provenance.return_value = RefinedText("clean enough text")
 
         handler, ev = self._make_handler(db=db, slm=mock_slm, events_list=events)
         handler._settings_provider = lambda: settings
@@ -494,14 +493,14 @@ class TestBulkRefinementHappyPath:
         )
         _wait_for_threads("bulk-refine")
 
-        assert mock_slm.refine_text_sync.call_args.kwargs["allow_skip"] is True
+        assert mock_slm.refine_text_with_provenance.call_args.kwargs["allow_skip"] is True
 
     def test_bulk_refine_skips_missing_transcripts(self, db, events):
         t1 = db.add_transcript(raw_text="exists", duration_ms=1000)
 
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-        mock_slm.refine_text_sync.return_value = "refined"
+        mock_slm.refine_text_with_provenance.return_value = RefinedText("refined")
 
         handler, ev = self._make_handler(db=db, slm=mock_slm, events_list=events)
         handler.handle_bulk_refine(
@@ -524,9 +523,9 @@ class TestBulkRefinementHappyPath:
 
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-        mock_slm.refine_text_sync.side_effect = [
+        mock_slm.refine_text_with_provenance.side_effect = [
             RuntimeError("inference kaboom"),
-            "refined text",
+            RefinedText("refined text"),
         ]
 
         handler, ev = self._make_handler(db=db, slm=mock_slm, events_list=events)
@@ -564,9 +563,9 @@ class TestBulkRefinementHappyPath:
             # After the first transcript, trigger cancel
             if call_count >= 1:
                 handler._bulk_cancel.set()
-            return f"refined: {text}"
+            return RefinedText(f"refined: {text}")
 
-        mock_slm.refine_text_sync.side_effect = refine_and_cancel
+        mock_slm.refine_text_with_provenance.side_effect = refine_and_cancel
 
         handler.handle_bulk_refine(
             SimpleNamespace(
@@ -583,38 +582,58 @@ class TestBulkRefinementHappyPath:
         assert complete[0]["cancelled"] is True
         assert complete[0]["completed"] == 1
 
-    def test_bulk_refine_rejects_when_already_active(self, db, events):
+    def test_bulk_refine_cancel_interrupts_in_flight_transcript(self, db, events):
+        from src.refinement.engine import GenerationCancelled
+
+        t1 = db.add_transcript(raw_text="first", duration_ms=1000)
+        db.add_transcript(raw_text="second", duration_ms=2000)
+
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-
         handler, ev = self._make_handler(db=db, slm=mock_slm, events_list=events)
-        handler._bulk_active = True
+
+        def cancel_mid_generation(text, **kw):
+            handler._bulk_cancel.set()
+            assert kw["should_cancel"]() is True
+            raise GenerationCancelled("stopped")
+
+        mock_slm.refine_text_with_provenance.side_effect = cancel_mid_generation
 
         handler.handle_bulk_refine(
             SimpleNamespace(
-                transcript_ids=(1,),
+                transcript_ids=(t1.id, t1.id + 1),
                 level=2,
                 instructions="",
                 skip_refined=False,
             )
         )
+        _wait_for_threads("bulk-refine")
 
-        errors = _events_of(ev, "bulk_refinement_error")
-        assert len(errors) == 1
-        assert "already in progress" in errors[0]["message"].lower()
+        assert mock_slm.refine_text_with_provenance.call_count == 1
+        complete = _events_of(ev, "bulk_refinement_complete")
+        assert complete[0]["cancelled"] is True
+        assert complete[0]["completed"] == 0
+        assert complete[0]["failed"] == 0
 
-    def test_single_refine_blocked_during_bulk(self, db, events):
+    def test_bulk_refine_rejects_when_already_active(self, db, events):
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
 
         handler, ev = self._make_handler(db=db, slm=mock_slm, events_list=events)
         handler._bulk_active = True
 
-        handler.handle_refine(SimpleNamespace(transcript_id=1, level=2, instructions=""))
+        handler.handle_bulk_refine(
+            SimpleNamespace(
+                transcript_ids=(1,),
+                level=2,
+                instructions="",
+                skip_refined=False,
+            )
+        )
 
-        errors = _events_of(ev, "refinement_error")
+        errors = _events_of(ev, "bulk_refinement_error")
         assert len(errors) == 1
-        assert "bulk" in errors[0]["message"].lower()
+        assert "already in progress" in errors[0]["message"].lower()
 
     def test_bulk_refine_empty_ids_emits_error(self, db, events):
         mock_slm = MagicMock()
@@ -639,7 +658,7 @@ class TestBulkRefinementHappyPath:
 
         mock_slm = MagicMock()
         mock_slm.state = SLMState.READY
-        mock_slm.refine_text_sync.return_value = "polished"
+        mock_slm.refine_text_with_provenance.return_value = RefinedText("polished")
 
         handler, ev = self._make_handler(db=db, slm=mock_slm, events_list=events)
         handler.handle_bulk_refine(
@@ -658,6 +677,210 @@ class TestBulkRefinementHappyPath:
         assert updated_ids == {t1.id, t2.id}
 
 
+class TestBulkRefinementBatched:
+    """Bulk refinement via the runtime's batched path."""
+
+    def _make_handler(self, *, db, slm, events_list):
+        from src.core.handlers.refinement_handlers import RefinementHandlers
+        from src.core.settings import VociferousSettings
+
+        settings = VociferousSettings()
+        return RefinementHandlers(
+            db_provider=lambda: db,
+            slm_runtime_provider=lambda: slm,
+            settings_provider=lambda: settings,
+            event_bus_emit=_emit_to(events_list),
+        )
+
+    @staticmethod
+    def _batched_slm(results_by_text, *, cancel_after=None, handler_ref=None):
+        mock_slm = MagicMock()
+        mock_slm.state = SLMState.READY
+        mock_slm.bulk_batch_size.return_value = 4
+
+        def refine_batch_sync(texts, **kw):
+            out = []
+            for index, text in enumerate(texts):
+                if cancel_after is not None and index >= cancel_after:
+                    handler_ref[0]._bulk_cancel.set()
+                    out.append(None)
+                    continue
+                result = results_by_text(text)
+                kw["on_result"](index, RefinedText(result), 0.25)
+                out.append(result)
+            return out
+
+        mock_slm.refine_batch_sync.side_effect = refine_batch_sync
+        return mock_slm
+
+    def test_batched_path_persists_each_item(self, db, events):
+        ids = [db.add_transcript(raw_text=f"text {i}", duration_ms=1000).id for i in range(10)]
+        mock_slm = self._batched_slm(lambda text: f"refined: {text}")
+        handler = self._make_handler(db=db, slm=mock_slm, events_list=events)
+
+        handler.handle_bulk_refine(
+            SimpleNamespace(transcript_ids=tuple(ids), level=2, instructions="", skip_refined=False)
+        )
+        _wait_for_threads("bulk-refine")
+
+        mock_slm.refine_text_with_provenance.assert_not_called()
+        # 10 transcripts with batch size 4 → windows of 16 → one batched call
+        assert mock_slm.refine_batch_sync.call_count == 1
+        for i, tid in enumerate(ids):
+            t = db.get_transcript(tid)
+            assert t.normalized_text == f"refined: text {i}"
+            assert t.refinement_time_ms == 250
+            assert any(tag.name == "Refined" for tag in t.tags)
+
+        progress = _events_of(events, "bulk_refinement_progress")
+        assert [p["completed"] for p in progress] == list(range(1, 11))
+        complete = _events_of(events, "bulk_refinement_complete")
+        assert complete[0] == {"completed": 10, "total": 10, "failed": 0, "cancelled": False}
+
+    def test_batched_failure_falls_back_to_per_item_refinement(self, db, events):
+        t1 = db.add_transcript(raw_text="one", duration_ms=1000)
+        t2 = db.add_transcript(raw_text="two", duration_ms=1000)
+        t3 = db.add_transcript(raw_text="three", duration_ms=1000)
+        mock_slm = MagicMock()
+        mock_slm.state = SLMState.READY
+        mock_slm.bulk_batch_size.return_value = 3
+
+        def refine_batch_sync(texts, **kw):
+            kw["on_result"](0, RefinedText("refined one"), 0.1)
+            raise RuntimeError("batch kaboom")
+
+        def refine_text_sync(text, **kw):
+            if text == "three":
+                raise RuntimeError("item kaboom")
+            return RefinedText(f"refined {text}")
+
+        mock_slm.refine_batch_sync.side_effect = refine_batch_sync
+        mock_slm.refine_text_with_provenance.side_effect = refine_text_sync
+        handler = self._make_handler(db=db, slm=mock_slm, events_list=events)
+
+        handler.handle_bulk_refine(
+            SimpleNamespace(transcript_ids=(t1.id, t2.id, t3.id), level=2, instructions="", skip_refined=False)
+        )
+        _wait_for_threads("bulk-refine")
+
+        assert [call.args[0] for call in mock_slm.refine_text_with_provenance.call_args_list] == ["two", "three"]
+        assert db.get_transcript(t1.id).normalized_text == "refined one"
+        assert db.get_transcript(t2.id).normalized_text == "refined two"
+        assert db.get_transcript(t3.id).normalized_text == "three"
+        errors = [p for p in _events_of(events, "bulk_refinement_progress") if "error" in p]
+        assert [(e["current_transcript_id"], e["error"]) for e in errors] == [(t3.id, "item kaboom")]
+        complete = _events_of(events, "bulk_refinement_complete")
+        assert complete[0]["completed"] == 2
+        assert complete[0]["failed"] == 1
+
+    def test_batched_persist_failure_counts_as_failed(self, db, events):
+        ids = [db.add_transcript(raw_text=f"text {i}", duration_ms=1000).id for i in range(3)]
+        mock_slm = self._batched_slm(lambda text: f"refined: {text}")
+        handler = self._make_handler(db=db, slm=mock_slm, events_list=events)
+        persist = handler._persist_refinement
+
+        def flaky_persist(_db, tid, *args, **kwargs):
+            if tid == ids[1]:
+                raise RuntimeError("disk full")
+            return persist(_db, tid, *args, **kwargs)
+
+        handler._persist_refinement = flaky_persist
+
+        handler.handle_bulk_refine(
+            SimpleNamespace(transcript_ids=tuple(ids), level=2, instructions="", skip_refined=False)
+        )
+        _wait_for_threads("bulk-refine")
+
+        mock_slm.refine_text_with_provenance.assert_not_called()
+        assert db.get_transcript(ids[1]).normalized_text == "text 1"
+        assert db.get_transcript(ids[2]).normalized_text == "refined: text 2"
+        errors = [p for p in _events_of(events, "bulk_refinement_progress") if "error" in p]
+        assert [(e["current_transcript_id"], e["error"]) for e in errors] == [(ids[1], "disk full")]
+        complete = _events_of(events, "bulk_refinement_complete")
+        assert complete[0] == {"completed": 2, "total": 3, "failed": 1, "cancelled": False}
+
+    def test_batched_cancel_leaves_remaining_untouched(self, db, events):
+        ids = [db.add_transcript(raw_text=f"text {i}", duration_ms=1000).id for i in range(3)]
+        handler_ref: list = []
+        mock_slm = self._batched_slm(lambda text: "refined", cancel_after=1, handler_ref=handler_ref)
+        handler = self._make_handler(db=db, slm=mock_slm, events_list=events)
+        handler_ref.append(handler)
+
+        handler.handle_bulk_refine(
+            SimpleNamespace(transcript_ids=tuple(ids), level=2, instructions="", skip_refined=False)
+        )
+        _wait_for_threads("bulk-refine")
+
+        assert db.get_transcript(ids[0]).normalized_text == "refined"
+        assert db.get_transcript(ids[2]).normalized_text == "text 2"
+        complete = _events_of(events, "bulk_refinement_complete")
+        assert complete[0]["cancelled"] is True
+        assert complete[0]["completed"] == 1
+        assert mock_slm.refine_batch_sync.call_args.kwargs["should_cancel"] == handler._bulk_cancel.is_set
+
+    def test_interactive_refine_preempts_a_running_bulk_job(self, db, events, fresh_settings):
+        from src.refinement.output_parser import GenerationResult
+        from src.services.slm_runtime import SLMRuntime
+        from src.services.slm_scheduler import SLMScheduler
+
+        bulk_ids = [db.add_transcript(raw_text=f"bulk {i}", duration_ms=1000).id for i in range(2)]
+        single = db.add_transcript(raw_text="urgent", duration_ms=1000)
+        fresh_settings.refinement.bulk_batch_size = 2
+        scheduler = SLMScheduler()
+        runtime = SLMRuntime(
+            settings_provider=lambda: fresh_settings,
+            on_state_changed=MagicMock(),
+            on_error=MagicMock(),
+            on_text_ready=MagicMock(),
+            scheduler=scheduler,
+        )
+        handler = self._make_handler(db=db, slm=runtime, events_list=events)
+        bulk_generating = threading.Event()
+        order: list[str] = []
+
+        def refine_batch(texts, **kw):
+            order.append(f"bulk {len(texts)}")
+            if len(order) == 1:
+                bulk_generating.set()
+                while not kw["should_cancel"]():
+                    threading.Event().wait(0.01)
+                return [None] * len(texts)
+            results = [GenerationResult(content=f"refined {text}") for text in texts]
+            for index, result in enumerate(results):
+                kw["on_result"](index, result, 0.1)
+            return results
+
+        def refine(text, **kw):
+            order.append("interactive")
+            return GenerationResult(content="refined urgent")
+
+        engine = MagicMock()
+        engine.supports_cancellation = True
+        engine.refine_batch.side_effect = refine_batch
+        engine.refine.side_effect = refine
+        runtime._engine = engine
+        runtime.state = SLMState.READY
+
+        try:
+            handler.handle_bulk_refine(
+                SimpleNamespace(transcript_ids=tuple(bulk_ids), level=2, instructions="", skip_refined=False)
+            )
+            assert bulk_generating.wait(5)
+            assert runtime.state is SLMState.INFERRING
+
+            handler.handle_refine(SimpleNamespace(transcript_id=single.id, level=2, instructions=""))
+            _wait_for_threads("refine")
+            _wait_for_threads("bulk-refine")
+        finally:
+            scheduler.shutdown()
+
+        assert _events_of(events, "refinement_error") == []
+        assert _events_of(events, "refinement_complete")[0]["text"] == "refined urgent"
+        assert order == ["bulk 2", "interactive", "bulk 2"]
+        assert [db.get_transcript(tid).normalized_text for tid in bulk_ids] == ["refined bulk 0", "refined bulk 1"]
+        assert scheduler.metrics()["preempted"] == 1
+
+
 # ===========================================================================
 # RecordingSession
 # ===========================================================================
@@ -843,6 +1066,171 @@ class TestRecordingSessionLifecycle:
         assert refreshed.last_retranscription_prompt_chars == len("Prefer proper nouns.")
         assert refreshed.last_retranscription_prompt_words == 3
 
+    def test_handle_import_streams_file_and_emits_progress(self, db, events, tmp_path):
+        from src.services.audio_import import ImportTranscription
+
+        session = self._make_session(events_list=events, db=db)
+        session._asr_model = MagicMock()
+        audio_file = tmp_path / "lecture.flac"
+        audio_file.write_bytes(b"not decoded here")
+
+        def fake_stream(path, settings, model, pipeline, *, on_progress, should_stop, asr_scheduler):
+            assert path == audio_file and model is session._asr_model and not should_stop()
+            assert asr_scheduler is session.asr_scheduler
+            on_progress(30.0, 0.0)
+            on_progress(60.0, 28.5)
+            on_progress(90.0, 90.0)
+            return ImportTranscription(
+                text="imported text", speech_duration_ms=80_000, transcription_time_ms=4_000, duration_ms=90_000
+            )
+
+        with patch("src.services.audio_import.transcribe_audio_file", side_effect=fake_stream):
+            session.handle_import(SimpleNamespace(file_path=str(audio_file)))
+            _wait_for_threads("audio-import")
+
+        progress = _events_of(events, "import_progress")
+        assert [(p["decoded_seconds"], p["transcribed_seconds"]) for p in progress] == [
+            (30.0, 0.0),
+            (60.0, 28.5),
+            (90.0, 90.0),
+        ]
+        assert all(p["file_name"] == "lecture.flac" for p in progress)
+        complete = _events_of(events, "transcription_complete")
+        assert len(complete) == 1
+        assert complete[0]["text"] == "imported text"
+        assert complete[0]["duration_ms"] == 90_000
+
+    def test_handle_import_of_empty_file_reports_error(self, db, events, tmp_path):
+        from src.services.audio_import import ImportTranscription
+
+        session = self._make_session(events_list=events, db=db)
+        session._asr_model = MagicMock()
+        audio_file = tmp_path / "empty.wav"
+        audio_file.write_bytes(b"")
+
+        with patch(
+            "src.services.audio_import.transcribe_audio_file",
+            return_value=ImportTranscription(text="", speech_duration_ms=0, transcription_time_ms=0, duration_ms=0),
+        ):
+            session.handle_import(SimpleNamespace(file_path=str(audio_file)))
+            _wait_for_threads("audio-import")
+
+        assert [e["message"] for e in _events_of(events, "transcription_error")] == ["Audio file is empty"]
+        assert _events_of(events, "transcription_complete") == []
+
+    def test_handle_import_batch_stores_each_file_in_order(self, db, events, tmp_path):
+        from src.services.audio_import import ImportTranscription
+
+        session = self._make_session(events_list=events, db=db)
+        session._asr_model = MagicMock()
+        files = [tmp_path / name for name in ("one.wav", "two.wav", "three.wav")]
+        for path in files:
+            path.write_bytes(b"audio")
+
+        def fake_stream(paths, settings, model, pipeline, *, on_progress, should_stop, asr_scheduler):
+            assert paths == [str(path) for path in files]
+            assert asr_scheduler is session.asr_scheduler
+            on_progress(0, 10.0, 10.0)
+            yield (
+                0,
+                ImportTranscription(
+                    text="first", speech_duration_ms=9_000, transcription_time_ms=500, duration_ms=10_000
+                ),
+            )
+            yield 1, RuntimeError("Invalid data found when processing input")
+            yield 2, ImportTranscription(text="", speech_duration_ms=0, transcription_time_ms=0, duration_ms=5_000)
+
+        with patch("src.services.audio_import.transcribe_audio_files", side_effect=fake_stream):
+            result = session.handle_import_batch(
+                SimpleNamespace(file_paths=tuple(str(path) for path in files), file_names=(), cleanup_source=True)
+            )
+            _wait_for_threads("audio-import")
+
+        job = db.get_import_job(result["job_id"])
+        assert job is not None and job.status == "completed"
+        assert [f.status for f in job.files] == ["completed", "failed", "failed"]
+        assert job.files[2].failure_reason == "No speech detected"
+        stored = db.get_transcript(job.files[0].transcript_id)
+        assert stored.raw_text == "first" and stored.display_name == "one"
+        assert not any(path.exists() for path in files)
+
+        assert _events_of(events, "import_job_started")[0]["file_names"] == ["one.wav", "two.wav", "three.wav"]
+        assert _events_of(events, "import_progress")[0]["job_id"] == result["job_id"]
+        assert [(p["file_index"], p["status"]) for p in _events_of(events, "import_job_progress")] == [
+            (0, "completed"),
+            (1, "failed"),
+            (2, "failed"),
+        ]
+        complete = _events_of(events, "import_job_complete")
+        assert complete == [
+            {
+                "job_id": result["job_id"],
+                "total": 3,
+                "completed": 1,
+                "failed": 2,
+                "cancelled": False,
+                "status": "completed",
+            }
+        ]
+        assert len(_events_of(events, "transcription_complete")) == 1
+
+    def test_cancelled_import_batch_resumes_with_remaining_files(self, db, events, tmp_path):
+        from src.services.audio_import import ImportCancelledError, ImportTranscription
+
+        session = self._make_session(events_list=events, db=db)
+        session._asr_model = MagicMock()
+        files = [tmp_path / f"part{i}.wav" for i in range(3)]
+        for path in files:
+            path.write_bytes(b"audio")
+        calls: list[list[str]] = []
+
+        def fake_stream(paths, settings, model, pipeline, *, on_progress, should_stop, asr_scheduler):
+            calls.append(list(paths))
+            for index, _path in enumerate(paths):
+                yield (
+                    index,
+                    ImportTranscription(
+                        text=f"text {len(calls)}.{index}",
+                        speech_duration_ms=1,
+                        transcription_time_ms=1,
+                        duration_ms=1_000,
+                    ),
+                )
+                if len(calls) == 1:
+                    session.handle_cancel_import_job(SimpleNamespace(job_id=job_id))
+                if should_stop():
+                    raise ImportCancelledError("Import cancelled")
+
+        job_id = "job42"
+        with (
+            patch("src.services.audio_import.transcribe_audio_files", side_effect=fake_stream),
+            patch("src.core.handlers.recording_handlers.uuid.uuid4", return_value=SimpleNamespace(hex=job_id)),
+        ):
+            session.handle_import_batch(
+                SimpleNamespace(file_paths=tuple(str(p) for p in files), file_names=(), cleanup_source=False)
+            )
+            _wait_for_threads("audio-import")
+
+            cancelled = db.get_import_job(job_id)
+            assert cancelled.status == "cancelled"
+            assert [f.status for f in cancelled.files] == ["completed", "pending", "pending"]
+
+            assert session.handle_resume_import_job(SimpleNamespace(job_id=job_id)) == {
+                "job_id": job_id,
+                "status": "queued",
+            }
+            _wait_for_threads("audio-import")
+
+        assert calls == [[str(p) for p in files], [str(p) for p in files[1:]]]
+        resumed = db.get_import_job(job_id)
+        assert resumed.status == "completed"
+        assert [db.get_transcript(f.transcript_id).raw_text for f in resumed.files] == [
+            "text 1.0",
+            "text 2.0",
+            "text 2.1",
+        ]
+        assert [e["status"] for e in _events_of(events, "import_job_complete")] == ["cancelled", "completed"]
+
     def test_handle_toggle_idle_no_audio_service_is_noop(self, events):
         """Toggle from idle with no audio service: dispatches BeginRecording but it
         no-ops because there's nothing to record from. Renamed in v6.5.1 from
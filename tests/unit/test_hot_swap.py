@@ -0,0 +1,213 @@
+"""
+Model hot-swap tests.
+
+Headroom checks against the residency budget, swapping the ASR model and the
+SLM engine while the old one keeps serving (in-flight work drains on it),
+keeping the old model when the new load fails, and the restart path
+choosing between hot-swap and reload.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from src.core.handlers.recording_handlers import RecordingSession
+from src.core.runtime.lifecycle import restart_engine
+from src.core.settings import VociferousSettings
+from src.services.asr_scheduler import ASRJobPriority
+from src.services.model_residency import ModelResidencyManager
+from src.services.slm_runtime import SLMRuntime
+from src.services.slm_types import SLMState
+
+
+def _settings(**residency) -> VociferousSettings:
+    settings = VociferousSettings()
+    return settings.model_copy(
+        update={
+            "residency": settings.residency.model_copy(update=residency),
+            "refinement": settings.refinement.model_copy(update={"enabled": True}),
+        }
+    )
+
+
+def _register(manager: ModelResidencyManager, name: str, size_mb: float, loaded: bool = True) -> None:
+    manager.register(
+        name,
+        load=lambda: None,
+        unload=lambda: None,
+        is_loaded=lambda: loaded,
+        estimate_mb=lambda: size_mb,
+    )
+
+
+class TestHeadroom:
+    def test_budget_decides_when_set(self):
+        box = {"settings": _settings(ram_budget_mb=5000)}
+        manager = ModelResidencyManager(lambda: box["settings"])
+        _register(manager, "asr", 1500)
+        _register(manager, "slm", 3000)
+
+        assert manager.fits_alongside("asr") is False  # 4500 resident + 1500
+        box["settings"] = _settings(ram_budget_mb=6000)
+        assert manager.fits_alongside("asr") is True
+
+    def test_free_memory_decides_without_a_budget(self):
+        manager = ModelResidencyManager(_settings)
+        _register(manager, "asr", 1500)
+        _register(manager, "remote", 0)
+
+        with patch("src.services.model_residency._free_memory_mb", return_value=1000.0):
+            assert manager.fits_alongside("asr") is False
+            assert manager.fits_alongside("remote") is True  # nothing to load locally
+
+
+class TestASRHotSwap:
+    def _session(self, emit: MagicMock) -> RecordingSession:
+        return RecordingSession(
+            audio_service_provider=lambda: None,
+            settings_provider=lambda: _settings(warmup_after_load=False),
+            db_provider=lambda: None,
+            event_bus_emit=emit,
+            shutdown_event=threading.Event(),
+            insight_manager_provider=lambda: None,
+        )
+
+    def test_queued_jobs_drain_on_the_old_model(self):
+        emit = MagicMock()
+        session = self._session(emit)
+        old, new = MagicMock(name="old"), MagicMock(name="new")
+        session._asr_model = old
+        started, release = threading.Event(), threading.Event()
+        used: list[object] = []
+
+        def job(model=old) -> None:
+            started.set()
+            release.wait(5)
+            used.append(model)
+
+        try:
+            running = session.asr_scheduler.submit(job, priority=ASRJobPriority.IMPORT)
+            started.wait(5)
+            with patch("src.services.transcription_service.create_local_model", return_value=new):
+                assert session.hot_swap_asr_model() is True
+
+            assert session._asr_model is new  # new work goes to the new model at once
+            release.set()
+            running.result(timeout=5)
+            assert used == [old]
+            assert session.asr_scheduler.wait_idle(5)
+            emit.assert_called_with("engine_status", {"asr": "ready"})
+        finally:
+            session.asr_scheduler.shutdown()
+
+    def test_failed_load_keeps_the_current_model(self):
+        session = self._session(MagicMock())
+        old = MagicMock()
+        session._asr_model = old
+        try:
+            with patch("src.services.transcription_service.create_local_model", side_effect=RuntimeError("OOM")):
+                assert session.hot_swap_asr_model() is False
+
+            assert session._asr_model is old and session.last_asr_error
+        finally:
+            session.asr_scheduler.shutdown()
+
+
+class TestSLMHotSwap:
+    def _runtime(self) -> tuple[SLMRuntime, MagicMock]:
+        settings = _settings(warmup_after_load=False)
+        runtime = SLMRuntime(settings_provider=lambda: settings)
+        old = MagicMock(name="old")
+        runtime._engine = old
+        runtime.state = SLMState.READY
+        return runtime, old
+
+    def test_swap_waits_for_in_flight_inference_then_unloads_the_old_engine(self):
+        runtime, old = self._runtime()
+        new = MagicMock(name="new")
+        new.get_runtime_summary.return_value = {"provider": "local_ct2", "model_id": "new"}
+        inferring, finish = threading.Event(), threading.Event()
+
+        def inference() -> None:
+            with runtime._engine_session() as engine:
+                assert engine is old
+                inferring.set()
+                finish.wait(5)
+
+        worker = threading.Thread(target=inference)
+        worker.start()
+        inferring.wait(5)
+        with patch("src.services.slm_runtime.make_refinement_provider", return_value=new):
+            swapper = threading.Thread(target=runtime.hot_swap)
+            swapper.start()
+            time.sleep(0.05)
+            assert runtime._engine is old and swapper.is_alive()  # draining
+            finish.set()
+            swapper.join(5)
+        worker.join(5)
+
+        assert runtime._engine is new and runtime.state is SLMState.READY
+        old.unload.assert_called_once()
+
+    def test_failed_load_keeps_the_current_engine(self):
+        runtime, old = self._runtime()
+        new = MagicMock()
+        new.load.side_effect = RuntimeError("CUDA out of memory")
+
+        with patch("src.services.slm_runtime.make_refinement_provider", return_value=new):
+            assert runtime.hot_swap() is False
+
+        assert runtime._engine is old and runtime.state is SLMState.READY
+        assert runtime.last_error
+        old.unload.assert_not_called()
+
+
+class TestRestartPath:
+    def _coordinator(self, settings: VociferousSettings, *, fits: bool) -> MagicMock:
+        coordinator = MagicMock()
+        coordinator._restart_lock = threading.Lock()
+        coordinator.model_residency.fits_alongside.return_value = fits
+        coordinator.recording_session.is_asr_loaded = True
+        coordinator.slm_runtime.can_hot_swap.return_value = fits
+        coordinator.hardware_calibrator = None
+        done = threading.Event()
+
+        def emit(event: str, data: dict) -> None:
+            if event == "engine_restarted":
+                done.set()
+
+        coordinator.event_bus.emit.side_effect = emit
+        coordinator.done = done
+        return coordinator
+
+    def _restart(self, coordinator: MagicMock, settings: VociferousSettings) -> None:
+        with patch("src.core.settings.get_settings", return_value=settings):
+            restart_engine(coordinator)
+            assert coordinator.done.wait(5)
+
+    def test_hot_swaps_when_there_is_room(self):
+        settings = _settings()
+        coordinator = self._coordinator(settings, fits=True)
+        session, runtime = coordinator.recording_session, coordinator.slm_runtime
+
+        self._restart(coordinator, settings)
+
+        session.hot_swap_asr_model.assert_called_once()
+        session.unload_asr_model.assert_not_called()
+        runtime.hot_swap.assert_called_once()
+        runtime.disable.assert_not_called()
+
+    def test_reloads_when_there_is_no_room(self):
+        settings = _settings()
+        coordinator = self._coordinator(settings, fits=False)
+        session, runtime = coordinator.recording_session, coordinator.slm_runtime
+
+        self._restart(coordinator, settings)
+
+        session.unload_asr_model.assert_called_once()
+        session.load_asr_model.assert_called_once()
+        session.hot_swap_asr_model.assert_not_called()
+        runtime.disable.assert_called_once()
+        coordinator._init_slm_runtime.assert_called_once()
@@ -0,0 +1,177 @@
+"""
+HttpConnectionPool tests.
+
+Per-origin client sharing, survival across provider rebuilds, connection
+warming against a local keep-alive server, and HTTP/2 detection.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.core import http_pool as http_pool_module
+from src.core.http_pool import HttpConnectionPool, get_http_pool, install_http_pool, origin_of
+from src.refinement.providers import OpenAICompatibleRefinementProvider
+
+
+class _KeepAliveServer:
+    """HTTP/1.1 keep-alive server that counts TCP connections and requests."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.requests: list[str] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                stub.connections += 1
+
+            def log_message(self, *args) -> None:  # noqa: ANN002
+                pass
+
+            def do_GET(self) -> None:  # noqa: N802
+                stub.requests.append(self.path)
+                data = json.dumps({"data": [{"id": "model-a"}]}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def __enter__(self) -> "_KeepAliveServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:  # noqa: ANN002
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestOrigins:
+    def test_origin_normalises_default_ports_and_case(self):
+        assert origin_of("https://API.groq.com/openai/v1") == "https://api.groq.com:443"
+        assert origin_of("http://localhost:1234/v1/models") == "http://localhost:1234"
+        assert origin_of("http://localhost/v1") == "http://localhost:80"
+
+    def test_clients_are_shared_per_origin(self):
+        pool = HttpConnectionPool(http2=False)
+        try:
+            groq = pool.client_for("https://api.groq.com/openai/v1")
+            assert pool.client_for("https://api.groq.com/openai/v1/models") is groq
+            assert pool.client_for("http://localhost:1234/v1") is not groq
+            assert pool.stats()["origins"] == ["http://localhost:1234", "https://api.groq.com:443"]
+        finally:
+            pool.close()
+
+    def test_closed_pool_rejects_new_clients(self):
+        pool = HttpConnectionPool(http2=False)
+        pool.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.client_for("http://localhost:1234/v1")
+
+
+class TestProviderSharing:
+    def test_rebuilt_provider_reuses_pooled_connection(self, fresh_settings):
+        with _KeepAliveServer() as server:
+            fresh_settings.refinement.lm_studio.base_url = server.base_url
+            fresh_settings.refinement.lm_studio.model_id = "model-a"
+
+            first = OpenAICompatibleRefinementProvider(fresh_settings, "lm_studio")
+            first.load()
+            first.unload()
+            # A settings change rebuilds the provider; the pooled socket survives.
+            second = OpenAICompatibleRefinementProvider(fresh_settings, "lm_studio")
+            assert [model["id"] for model in second.list_models()] == ["model-a"]
+
+        assert server.requests == ["/v1/models", "/v1/models"]
+        assert server.connections == 1
+
+    def test_injected_client_bypasses_pool(self, fresh_settings):
+        provider = OpenAICompatibleRefinementProvider(fresh_settings, "lm_studio")
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"data": []})))
+        provider._client = client
+
+        assert provider._client_instance is client
+        assert get_http_pool().stats()["origins"] == []
+
+
+class TestWarming:
+    def test_warm_opens_the_connection_the_first_request_reuses(self):
+        pool = HttpConnectionPool(http2=False)
+        try:
+            with _KeepAliveServer() as server:
+                url = f"{server.base_url}/models"
+                assert pool.warm(url, wait=True) is True
+                assert server.connections == 1
+
+                pool.client_for(url).get(url)
+                assert server.connections == 1
+                assert len(server.requests) == 2
+        finally:
+            pool.close()
+
+    def test_warm_is_skipped_while_the_origin_is_in_use(self):
+        pool = HttpConnectionPool(http2=False, rewarm_after_idle_s=60.0)
+        try:
+            with _KeepAliveServer() as server:
+                url = f"{server.base_url}/models"
+                pool.client_for(url).get(url)
+                assert pool.warm(url, wait=True) is False
+                assert server.requests == ["/v1/models"]
+        finally:
+            pool.close()
+
+    def test_rewarm_idle_revisits_remembered_targets(self):
+        pool = HttpConnectionPool(http2=False, rewarm_after_idle_s=0.0)
+        try:
+            with _KeepAliveServer() as server:
+                pool.remember(f"{server.base_url}/models", headers={"Authorization": "Bearer x"})
+                assert server.requests == []
+
+                assert pool.rewarm_idle() == 1
+                deadline = time.monotonic() + 2
+                while not server.requests and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert server.requests == ["/v1/models"]
+        finally:
+            pool.close()
+
+    def test_warm_failure_is_swallowed(self):
+        pool = HttpConnectionPool(http2=False)
+        try:
+            assert pool.warm("http://127.0.0.1:9/v1/models", wait=True) is True
+            assert pool.idle_seconds("http://127.0.0.1:9/v1/models") is None
+        finally:
+            pool.close()
+
+
+class TestHttp2:
+    def test_http2_follows_h2_availability(self, monkeypatch):
+        monkeypatch.setattr(http_pool_module, "http2_available", lambda: True)
+        assert HttpConnectionPool().http2 is True
+        monkeypatch.setattr(http_pool_module, "http2_available", lambda: False)
+        assert HttpConnectionPool().http2 is False
+
+
+class TestProcessPool:
+    def test_installed_pool_is_returned(self):
+        pool = HttpConnectionPool(http2=False)
+        install_http_pool(pool)
+        assert get_http_pool() is pool
@@ -0,0 +1,300 @@
+"""
+Out-of-process inference worker tests.
+
+Shared-memory audio handoff, the Whisper and refinement stand-ins talking to
+a real spawned worker (fake models inside it), cancellation, load errors,
+and supervised restart after a crash.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.core.settings import VociferousSettings
+from src.refinement.engine import GenerationCancelled
+from src.refinement.output_parser import GenerationResult
+from src.refinement.providers import WorkerRefinementProvider, make_refinement_provider
+from src.refinement.providers.local_ct2 import LocalCT2RefinementProvider
+from src.refinement.providers.worker import _LocalCT2Server
+from src.services.asr_scheduler import ASRJobPriority, ASRScheduler
+from src.services.inference_worker import (
+    SharedAudio,
+    WorkerCrashed,
+    WorkerProcess,
+    WorkerWhisperModel,
+    _WhisperServer,
+    attach_audio,
+)
+from src.services.transcription.long_form import batched_pipeline
+from src.services.transcription_service import create_local_model, transcribe_speech
+
+
+def _settings(**model) -> VociferousSettings:
+    settings = VociferousSettings()
+    return settings.model_copy(update={"model": settings.model.model_copy(update=model)})
+
+
+# --- Fakes built inside the worker (module level, so they pickle by reference) ---
+
+
+class _FakeWhisper:
+    def __init__(self, batched: bool = False) -> None:
+        self.batched = batched
+        if not batched:
+            self._vociferous_batched_pipeline = _FakeWhisper(batched=True)
+
+    def transcribe(self, audio, **options):
+        if options.get("crash"):
+            os._exit(3)
+        count, delay = options.get("segments", 2), options.get("delay", 0.0)
+        label = f"{'batched' if self.batched else 'plain'} {audio.dtype} {len(audio)} {float(audio.sum()):.1f}"
+
+        def segments():
+            for index in range(count):
+                time.sleep(delay)
+                yield SimpleNamespace(text=f" {label} #{index}", start=float(index), end=index + 1.0)
+
+        return segments(), SimpleNamespace(language="en", language_probability=1.0, duration=len(audio) / 16_000)
+
+
+class FakeWhisperServer(_WhisperServer):
+    def __init__(self, settings: VociferousSettings) -> None:
+        self._model = _FakeWhisper()
+
+    def summary(self) -> dict:
+        return {"model_id": "fake", "resolved_device": "cpu", "pid": os.getpid()}
+
+
+class BrokenWhisperServer(_WhisperServer):
+    def __init__(self, settings: VociferousSettings) -> None:
+        raise FileNotFoundError("ASR model directory not found")
+
+
+class _FakeCT2:
+    def get_runtime_summary(self) -> dict:
+        return {"provider": "local_ct2", "resolved_device": "cpu"}
+
+    def refine(self, text, *, should_cancel, **kwargs):
+        return GenerationResult(content=text.upper(), prompt_tokens=3, completion_tokens=len(text), total_tokens=9)
+
+    def refine_batch(self, texts, *, on_result, should_cancel, **kwargs):
+        results = []
+        for index, text in enumerate(texts):
+            result = GenerationResult(content=text.upper(), completion_tokens=index + 1)
+            on_result(index, result, 0.01)
+            results.append(result)
+        return results
+
+    def generate_custom(self, *, should_cancel, max_tokens, **kwargs):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if should_cancel():
+                raise GenerationCancelled("stopped")
+            time.sleep(0.01)
+        return GenerationResult(content="never cancelled")
+
+
+class FakeCT2Server(_LocalCT2Server):
+    def __init__(self, settings: VociferousSettings) -> None:
+        self._provider = cast(LocalCT2RefinementProvider, _FakeCT2())
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = WorkerWhisperModel(_settings(), server_factory=FakeWhisperServer)
+    yield model
+    model.worker.stop()
+
+
+@pytest.fixture(scope="module")
+def provider():
+    provider = WorkerRefinementProvider(VociferousSettings(), server_factory=FakeCT2Server)
+    provider.load()
+    yield provider
+    provider.unload()
+
+
+# --- Tests ---
+
+
+class TestSharedAudio:
+    def test_the_worker_side_maps_the_same_samples(self):
+        audio = np.arange(16_000, dtype=np.float32) / 16_000
+
+        with SharedAudio(audio) as shared:
+            shm, view = attach_audio(shared.descriptor)
+            assert view.dtype == np.float32 and np.array_equal(view, audio)
+            del view
+            shm.close()
+
+        with pytest.raises(FileNotFoundError):  # unlinked on close
+            attach_audio(shared.descriptor)
+
+
+class TestWorkerWhisperModel:
+    def test_decodes_in_the_worker_from_shared_memory(self, model):
+        audio = np.full(8_000, 0.5, dtype=np.float32)
+
+        segments, info = model.transcribe(audio, segments=3)
+
+        assert [s.text for s in segments] == [f" plain float32 8000 4000.0 #{i}" for i in range(3)]
+        assert info.language == "en" and info.duration == 0.5
+        assert model._vociferous_runtime_summary["pid"] != os.getpid()
+        assert model._vociferous_runtime_summary["worker_process"] is True
+
+    def test_batched_decoding_runs_in_the_worker(self, model):
+        segments, _ = batched_pipeline(model).transcribe(np.zeros(4, dtype=np.float32), segments=1)
+
+        assert next(iter(segments)).text.startswith(" batched")
+
+    def test_transcribe_speech_works_unchanged(self, model):
+        text, speech_ms, _ = transcribe_speech(np.ones(16_000, dtype=np.float32), _settings(), model)
+
+        assert "plain float32 16000" in text and speech_ms == 2000
+
+    def test_should_cancel_stops_the_decode(self, model):
+        start = time.perf_counter()
+        with SharedAudio(np.zeros(16, dtype=np.float32)) as shared:
+            messages = list(
+                model.worker.request(
+                    "transcribe",
+                    (shared.descriptor, {"segments": 200, "delay": 0.02}, False),
+                    should_cancel=lambda: time.perf_counter() - start > 0.1,
+                )
+            )
+
+        assert time.perf_counter() - start < 2.0  # did not wait for 200 segments
+        assert messages[-1][0] == "done" and 0 < len(messages) < 200
+        again, _ = model.transcribe(np.zeros(16, dtype=np.float32), segments=1)
+        assert len(list(again)) == 1  # the next request starts clean
+
+    def test_dictation_preempts_an_import_decoding_in_the_worker(self, model):
+        scheduler = ASRScheduler()
+        settings = _settings(worker_process=True)
+        import_started, dictation_queued = threading.Event(), threading.Event()
+        finished: list[str] = []
+
+        def import_job():
+            import_started.set()
+            dictation_queued.wait(5)
+            text = transcribe_speech(
+                np.ones(16_000, dtype=np.float32), settings, model, between_segments=scheduler.yield_to_urgent
+            )[0]
+            finished.append("import")
+            return text
+
+        def dictation_job():
+            text = transcribe_speech(np.ones(8_000, dtype=np.float32), settings, model)[0]
+            finished.append("dictation")
+            return text
+
+        try:
+            imported = scheduler.submit(import_job, priority=ASRJobPriority.IMPORT)
+            assert import_started.wait(5)
+            dictated = scheduler.submit(dictation_job, priority=ASRJobPriority.DICTATION)
+            dictation_queued.set()
+
+            assert "plain float32 8000" in dictated.result(timeout=30)
+            assert "plain float32 16000" in imported.result(timeout=30)
+            assert finished == ["dictation", "import"]
+            assert scheduler.metrics()["yielded"] == 1
+        finally:
+            scheduler.shutdown()
+
+    def test_create_local_model_uses_the_worker_when_enabled(self):
+        with patch("src.services.inference_worker.WorkerWhisperModel") as worker_model:
+            assert create_local_model(_settings(worker_process=True)) is worker_model.return_value
+        worker_model.assert_called_once()
+
+
+class TestSupervision:
+    def test_load_errors_are_raised_in_the_app(self):
+        with pytest.raises(FileNotFoundError, match="ASR model directory"):
+            WorkerWhisperModel(_settings(), server_factory=BrokenWhisperServer)
+
+    def test_a_crash_fails_the_request_and_the_worker_restarts(self):
+        worker = WorkerProcess("asr", FakeWhisperServer, _settings(), restart_backoff_s=0.01)
+        model_pid = worker.start()["pid"]
+        try:
+            audio = np.zeros(16, dtype=np.float32)
+            with pytest.raises(WorkerCrashed, match="exit code 3"):
+                with SharedAudio(audio) as shared:
+                    worker.call("transcribe", (shared.descriptor, {"crash": True}, False))
+
+            deadline = time.monotonic() + 30
+            while worker.status()["restarts"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            with SharedAudio(audio) as shared:
+                worker.call("transcribe", (shared.descriptor, {"segments": 1}, False))
+
+            status = worker.status()
+            assert status["alive"] and status["restarts"] == 1 and worker.summary["pid"] != model_pid
+        finally:
+            worker.stop()
+
+    def test_gives_up_after_too_many_crashes(self):
+        worker = WorkerProcess("asr", FakeWhisperServer, _settings(), max_restarts=0)
+        worker.start()
+        try:
+            with SharedAudio(np.zeros(16, dtype=np.float32)) as shared:
+                with pytest.raises(WorkerCrashed):
+                    worker.call("transcribe", (shared.descriptor, {"crash": True}, False))
+                with pytest.raises(WorkerCrashed, match="not restarting"):
+                    worker.call("transcribe", (shared.descriptor, {}, False))
+        finally:
+            worker.stop()
+
+
+class TestWorkerRefinementProvider:
+    def test_refine_and_summary(self, provider):
+        result = provider.refine(
+            "hello", temperature=0.0, top_p=1.0, top_k=1, repetition_penalty=1.0, use_thinking=False
+        )
+
+        assert result == GenerationResult(content="HELLO", prompt_tokens=3, completion_tokens=5, total_tokens=9)
+        summary = provider.get_runtime_summary()
+        assert summary["provider"] == "local_ct2" and summary["worker_process"] is True and summary["worker_pid"]
+
+    def test_batch_results_stream_with_per_item_usage(self, provider):
+        seen: list[tuple[int, str, object]] = []
+
+        def on_result(index, result, elapsed):
+            seen.append((index, result.content, provider.get_runtime_summary()["last_usage"]["completion_tokens"]))
+
+        results = provider.refine_batch(
+            ["a", "b"],
+            temperature=0.0,
+            top_p=1.0,
+            top_k=1,
+            repetition_penalty=1.0,
+            use_thinking=False,
+            on_result=on_result,
+        )
+
+        assert [r.content for r in results] == ["A", "B"]
+        assert seen == [(0, "A", 1), (1, "B", 2)]
+
+    def test_should_cancel_reaches_the_worker(self, provider):
+        start = time.perf_counter()
+        with pytest.raises(GenerationCancelled):
+            provider.generate_custom(
+                system_prompt="", user_prompt="x", should_cancel=lambda: time.perf_counter() - start > 0.1
+            )
+
+        assert time.perf_counter() - start < 3.0
+
+    def test_factory_picks_the_worker_provider_when_enabled(self):
+        settings = VociferousSettings()
+        settings = settings.model_copy(
+            update={"refinement": settings.refinement.model_copy(update={"worker_process": True})}
+        )
+
+        assert isinstance(make_refinement_provider(settings), WorkerRefinementProvider)
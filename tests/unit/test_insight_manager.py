@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import tempfile
+from concurrent.futures import Future
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -98,23 +99,7 @@ class TestInsightManagerPerTranscriptGate:
         from src.core.insight_manager import _MIN_TRANSCRIPT_WORDS
 
         manager, _ = _make_manager_with_emit(tmp_path, "Insight.", today_words=2000)
-        # Force foreground so the assertion is deterministic.
-        import threading as _threading
-
-        original = _threading.Thread
-
-        def _inline_thread(target=None, daemon=None, **_):
-            class _Inline:
-                def start(self_inner):  # pragma: no cover - trivial
-                    target()
-
-            return _Inline()
-
-        _threading.Thread = _inline_thread  # type: ignore[assignment]
-        try:
-            manager.maybe_schedule(new_transcript_words=_MIN_TRANSCRIPT_WORDS)
-        finally:
-            _threading.Thread = original  # type: ignore[assignment]
+        manager.maybe_schedule(new_transcript_words=_MIN_TRANSCRIPT_WORDS)
 
         slm = manager._slm_provider()
         slm.generate_custom_sync.assert_called_once()
@@ -128,6 +113,51 @@ class TestInsightManagerPerTranscriptGate:
         assert manager._should_regenerate(_make_stats(today_words=2000)) is True
 
 
+class TestInsightManagerScheduling:
+    def test_busy_slm_queues_in_insight_lane(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An INFERRING SLM no longer drops the insight — the job is queued and deferrable."""
+        import src.services.slm_types as slm_types
+        from src.services.slm_scheduler import SLMJobPriority
+
+        manager, _ = _make_manager_with_emit(tmp_path, "Insight.", today_words=2000)
+        slm = manager._slm_provider()
+        slm.state = slm_types.SLMState.INFERRING
+        submit_job = MagicMock()
+        monkeypatch.setattr(slm, "submit_job", submit_job)
+
+        manager.maybe_schedule()
+
+        submit_job.assert_called_once()
+        kwargs = submit_job.call_args.kwargs
+        assert kwargs["priority"] == SLMJobPriority.INSIGHT
+        assert kwargs["on_expire"] == "defer"
+        assert kwargs["coalesce_key"] == "insight:insight_ready"
+
+    def test_repeat_schedule_while_queued_resubmits_for_coalescing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        manager, _ = _make_manager_with_emit(tmp_path, "Insight.", today_words=2000)
+        submit_job = MagicMock()
+        monkeypatch.setattr(manager._slm_provider(), "submit_job", submit_job)
+
+        manager.maybe_schedule()
+        manager.maybe_schedule()
+
+        assert submit_job.call_count == 2
+        keys = {c.kwargs["coalesce_key"] for c in submit_job.call_args_list}
+        assert len(keys) == 1
+
+    def test_running_generation_skips_schedule(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        manager, _ = _make_manager_with_emit(tmp_path, "Insight.", today_words=2000)
+        submit_job = MagicMock()
+        monkeypatch.setattr(manager._slm_provider(), "submit_job", submit_job)
+        manager._generating = True
+
+        manager.maybe_schedule()
+
+        submit_job.assert_not_called()
+
+
 # ── Growth-Based Freshness Rule (ISS-122) ──────────────────────────────────
 
 
@@ -322,6 +352,16 @@ def _make_stats(today_words: int = 500) -> dict:
     }
 
 
+def _run_job_inline(fn, *, on_done=None, **_kwargs) -> Future:
+    """Stand-in for SLMRuntime.submit_job that runs the job on the calling thread."""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+    future.set_result(fn())
+    if on_done is not None:
+        on_done(future)
+    return future
+
+
 def _make_manager_with_emit(
     tmp_path: Path,
     slm_result: str,
@@ -331,6 +371,7 @@ def _make_manager_with_emit(
     """Create an InsightManager wired to a mock SLM that returns `slm_result`."""
     mock_slm = MagicMock()
     mock_slm.generate_custom_sync.return_value = slm_result
+    mock_slm.submit_job.side_effect = _run_job_inline
 
     import src.services.slm_types as slm_types
 
@@ -0,0 +1,264 @@
+"""
+Model residency tests.
+
+Idle unloading, busy and in-use protection, per-pool LRU eviction under a memory
+budget, reload accounting through ``loading()``, predictive reload on
+recording start, and the SLMRuntime evict/reload path.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.refinement.validation import validate_slm_ready
+from src.core.settings import VociferousSettings
+from src.services.model_residency import MemoryPool, ModelResidencyManager
+from src.services.slm_runtime import SLMRuntime
+from src.services.slm_types import SLMState
+
+
+def _settings(output: dict | None = None, **residency) -> VociferousSettings:
+    settings = VociferousSettings()
+    return settings.model_copy(
+        update={
+            "residency": settings.residency.model_copy(update=residency),
+            "output": settings.output.model_copy(update=output or {}),
+        }
+    )
+
+
+class FakeModel:
+    def __init__(self, manager: ModelResidencyManager, name: str, size_mb: float, *, loaded: bool = True) -> None:
+        self.manager = manager
+        self.name = name
+        self.size_mb = size_mb
+        self.loaded = loaded
+        self.busy = False
+        self.idle_timeout_s = 0.0
+        self.pool: MemoryPool = "ram"
+        self.load_count = 0
+
+    def load(self) -> None:
+        with self.manager.loading(self.name):
+            self.load_count += 1
+            self.loaded = True
+
+    def unload(self) -> None:
+        self.loaded = False
+
+    def register(self) -> FakeModel:
+        self.manager.register(
+            self.name,
+            load=self.load,
+            unload=self.unload,
+            is_loaded=lambda: self.loaded,
+            estimate_mb=lambda: self.size_mb,
+            pool=lambda: self.pool,
+            busy=lambda: self.busy,
+            idle_timeout_s=lambda: self.idle_timeout_s,
+        )
+        return self
+
+
+@pytest.fixture()
+def settings_box():
+    return {"settings": _settings()}
+
+
+@pytest.fixture()
+def manager(settings_box):
+    evicted: list[str] = []
+    mgr = ModelResidencyManager(lambda: settings_box["settings"], on_evicted=evicted.append)
+    mgr.evicted_names = evicted
+    yield mgr
+    mgr.shutdown()
+
+
+def _join_prefetch() -> None:
+    for thread in threading.enumerate():
+        if thread.name.startswith("residency-prefetch") and thread.is_alive():
+            thread.join(timeout=5)
+
+
+class TestIdleUnloading:
+    def test_idle_model_is_unloaded_and_reported(self, manager):
+        asr = FakeModel(manager, "asr", 1500).register()
+        asr.idle_timeout_s = 60
+        manager._models["asr"].last_used = time.monotonic() - 120
+
+        manager._check_idle()
+
+        assert asr.loaded is False
+        assert manager.evicted_names == ["asr"]
+        status = manager.status()["models"]["asr"]
+        assert status["state"] == "unloaded" and status["evictions"] == 1
+        assert status["last_eviction_reason"].startswith("idle")
+
+    def test_zero_timeout_keeps_the_model_resident(self, manager):
+        asr = FakeModel(manager, "asr", 1500).register()
+        manager._models["asr"].last_used = time.monotonic() - 10_000
+
+        manager._check_idle()
+
+        assert asr.loaded is True
+
+    def test_busy_model_is_never_unloaded_and_counts_as_used(self, manager):
+        asr = FakeModel(manager, "asr", 1500).register()
+        asr.idle_timeout_s = 60
+        asr.busy = True
+        manager._models["asr"].last_used = time.monotonic() - 120
+
+        manager._check_idle()
+        asr.busy = False
+        manager._check_idle()
+
+        assert asr.loaded is True
+        assert manager.evict("asr") is True
+
+    def test_held_model_is_not_unloaded(self, manager):
+        asr = FakeModel(manager, "asr", 1500).register()
+
+        with manager.acquire("asr"):
+            assert manager.evict("asr") is False
+            assert asr.loaded is True
+        assert manager.evict("asr") is True
+
+    def test_unchecked_busy_still_respects_holds(self, manager):
+        asr = FakeModel(manager, "asr", 1500).register()
+        asr.busy = True
+
+        assert manager.evict("asr") is False
+        with manager.acquire("asr"):
+            assert manager.evict("asr", check_busy=False) is False
+        assert manager.evict("asr", check_busy=False) is True
+        assert asr.loaded is False
+
+    def test_acquire_waits_for_an_unload_under_way(self, manager):
+        asr = FakeModel(manager, "asr", 1500)
+        unloading, finish = threading.Event(), threading.Event()
+
+        def slow_unload():
+            unloading.set()
+            finish.wait(5)
+            asr.loaded = False
+
+        asr.unload = slow_unload
+        asr.register()
+        evictor = threading.Thread(target=manager.evict, args=("asr",))
+        evictor.start()
+        assert unloading.wait(5)
+        seen: list[bool] = []
+
+        def use():
+            with manager.acquire("asr"):
+                seen.append(asr.loaded)
+
+        user = threading.Thread(target=use)
+        user.start()
+        user.join(0.2)
+        assert user.is_alive() and manager.status()["models"]["asr"]["state"] == "unloading"
+        finish.set()
+        evictor.join(5)
+        user.join(5)
+
+        assert seen == [False]  # the owner sees the unload and reloads, instead of losing the model mid-use
+
+    def test_remote_models_are_not_unloaded(self, manager):
+        remote = FakeModel(manager, "slm", 0).register()
+
+        assert manager.evict("slm") is False
+        assert remote.loaded is True
+
+
+class TestBudget:
+    def test_loading_evicts_least_recently_used_in_the_same_pool(self, manager, settings_box):
+        settings_box["settings"] = _settings(ram_budget_mb=4000, vram_budget_mb=1000)
+        asr = FakeModel(manager, "asr", 1500).register()
+        vad = FakeModel(manager, "vad", 2).register()
+        gpu = FakeModel(manager, "gpu", 900).register()
+        gpu.pool = "vram"
+        slm = FakeModel(manager, "slm", 3000, loaded=False).register()
+        manager._models["asr"].last_used = time.monotonic() - 50
+        manager.touch("vad")
+
+        slm.load()
+
+        assert (asr.loaded, vad.loaded, gpu.loaded, slm.loaded) == (False, True, True, True)
+        assert manager.status()["models"]["asr"]["last_eviction_reason"] == "ram budget for slm"
+
+    def test_unlimited_budget_evicts_nothing(self, manager):
+        asr = FakeModel(manager, "asr", 1500).register()
+        slm = FakeModel(manager, "slm", 9000, loaded=False).register()
+
+        slm.load()
+
+        assert asr.loaded and slm.loaded
+
+
+class TestReload:
+    def test_reload_after_eviction_is_counted_and_timed(self, manager):
+        asr = FakeModel(manager, "asr", 1500).register()
+        manager.evict("asr", reason="test")
+
+        asr.load()
+
+        status = manager.status()["models"]["asr"]
+        assert status["state"] == "resident"
+        assert (status["loads"], status["reloads"], status["evictions"]) == (1, 1, 1)
+        assert status["last_reload_ms"] is not None
+
+    def test_recording_start_prefetches_unloaded_models(self, manager, settings_box):
+        settings_box["settings"] = _settings(output={"auto_refine": False})
+        asr = FakeModel(manager, "asr", 1500).register()
+        slm = FakeModel(manager, "slm", 3000).register()
+        untouched = FakeModel(manager, "vad", 2).register()
+        manager.evict("asr")
+        manager.evict("slm")
+
+        manager.on_recording_started()
+        _join_prefetch()
+
+        assert asr.loaded is True and asr.load_count == 1
+        assert slm.loaded is False  # auto-refine is off
+        assert untouched.load_count == 0  # never unloaded, nothing to prefetch
+
+    def test_predictive_reload_can_be_turned_off(self, manager, settings_box):
+        settings_box["settings"] = _settings(predictive_reload=False)
+        asr = FakeModel(manager, "asr", 1500).register()
+        manager.evict("asr")
+
+        manager.on_recording_started()
+        _join_prefetch()
+
+        assert asr.loaded is False
+
+
+class TestSLMRuntimeEviction:
+    def test_evicted_runtime_reloads_on_next_refinement(self, fresh_settings):
+        engine = MagicMock()
+        engine.get_runtime_summary.return_value = {"provider": "local_ct2", "resolved_device": "cpu"}
+        settings = fresh_settings.model_copy(
+            update={"refinement": fresh_settings.refinement.model_copy(update={"enabled": True})}
+        )
+        runtime = SLMRuntime(settings_provider=lambda: settings)
+        runtime._engine = engine
+        runtime.state = SLMState.READY
+        assert runtime.get_runtime_summary()["resolved_device"] == "cpu"
+
+        runtime.evict()
+
+        assert runtime.state is SLMState.UNLOADED and runtime._engine is None
+        # Diagnostics must not keep reporting the unloaded model's runtime.
+        assert runtime._runtime_summary is None
+        engine.unload.assert_called_once()
+        assert validate_slm_ready(runtime) == (runtime, None)
+
+        with patch("src.services.slm_runtime.make_refinement_provider", return_value=engine) as make:
+            runtime.ensure_loaded()
+
+        make.assert_called_once()
+        assert runtime.state is SLMState.READY and runtime._engine is engine
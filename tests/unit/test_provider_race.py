@@ -0,0 +1,365 @@
+"""
+Speculative provider racing tests.
+
+Latency histograms and the hedge delay they give, the race itself (hedging,
+failover, cancellation of the loser), and racing end to end against a local
+OpenAI-compatible stub server that injects latency spikes: a raced
+dictation and a raced refinement, with the winner recorded as provenance.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.core.handlers.recording_handlers import RecordingSession
+from src.core.refinement.capture import build_refinement_capture
+from src.database.db import TranscriptDB
+from src.refinement.engine import GenerationCancelled
+from src.refinement.output_parser import GenerationResult
+from src.refinement.providers import OpenAICompatibleRefinementProvider
+from src.services.audio_pipeline import CleanSpeech
+from src.services.provider_race import (
+    FALLBACK_HEDGE_S,
+    Contender,
+    LatencyHistograms,
+    hedge_delay,
+    race,
+)
+from src.services.slm_runtime import SLMRuntime
+from src.services.slm_scheduler import SLMScheduler
+from src.services.transcription_service import OpenAICompatibleTranscriptionProvider
+
+VALID_GROQ_KEY = "gsk_test_secret_123456789012345678901234567890"
+
+
+class TestLatencyHistograms:
+    def test_p90_per_provider_and_size_class(self):
+        histograms = LatencyHistograms((10.0, 60.0))
+        for seconds in (0.4, 0.5, 0.5, 0.6, 0.6, 0.7, 0.7, 0.8, 0.9, 3.0):
+            histograms.record("groq", 5.0, seconds)
+        for _ in range(5):
+            histograms.record("groq", 45.0, 8.0)
+
+        assert histograms.quantile("groq", 5.0) == pytest.approx(0.9, rel=0.25)
+        assert histograms.quantile("groq", 45.0) == pytest.approx(8.0, rel=0.25)
+        assert histograms.quantile("groq", 300.0) is None
+        assert histograms.quantile("local_faster_whisper", 5.0) is None
+        assert set(histograms.snapshot()) == {"groq/<=10", "groq/<=60"}
+
+    def test_hedge_delay_configured_learned_or_fallback(self):
+        histograms = LatencyHistograms((10.0,))
+        assert hedge_delay(histograms, "groq", 5.0, 0) == FALLBACK_HEDGE_S
+        for _ in range(4):
+            histograms.record("groq", 5.0, 0.3)
+        assert hedge_delay(histograms, "groq", 5.0, 0) == FALLBACK_HEDGE_S  # too few samples yet
+        histograms.record("groq", 5.0, 0.3)
+
+        assert hedge_delay(histograms, "groq", 5.0, 0) == pytest.approx(0.3, rel=0.25)
+        assert hedge_delay(histograms, "groq", 5.0, 750) == 0.75
+
+
+def _contender(name: str, delay_s: float, value: str = "", *, fail: bool = False, stopped: list | None = None):
+    def call(cancel: threading.Event) -> str:
+        if cancel.wait(delay_s):
+            if stopped is not None:
+                stopped.append(name)
+            raise GenerationCancelled(f"{name} cancelled")
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        return value or f"{name} text"
+
+    return Contender(name, call, wait_on_cancel=stopped is not None)
+
+
+class TestRace:
+    def test_fast_primary_is_never_hedged(self):
+        latencies: list[str] = []
+        outcome = race(
+            _contender("local", 0.01),
+            _contender("groq", 0.01),
+            hedge_s=0.5,
+            on_latency=lambda name, _seconds: latencies.append(name),
+        )
+
+        assert (outcome.value, outcome.winner, outcome.hedged) == ("local text", "local", False)
+        assert latencies == ["local"]
+
+    def test_stalled_primary_loses_to_the_hedge_and_is_cancelled(self):
+        stopped: list[str] = []
+        outcome = race(_contender("local", 5.0, stopped=stopped), _contender("groq", 0.05), hedge_s=0.1)
+
+        assert outcome.winner == "groq" and outcome.hedged
+        assert outcome.elapsed_s < 1.0
+        assert stopped == ["local"]  # waited for, since it holds the engine
+
+    def test_failed_primary_starts_the_secondary_at_once(self):
+        outcome = race(_contender("groq", 0.0, fail=True), _contender("local", 0.01), hedge_s=5.0)
+
+        assert outcome.winner == "local" and outcome.elapsed_s < 1.0
+
+    def test_invalid_results_fall_back_to_the_primary_and_errors_propagate(self):
+        outcome = race(
+            _contender("local", 0.0, value=" "),
+            _contender("groq", 0.0, value="  "),
+            hedge_s=0.0,
+            is_valid=lambda text: bool(text.strip()),
+        )
+        assert outcome.winner == "local" and outcome.hedged
+
+        with pytest.raises(RuntimeError, match="local failed"):
+            race(_contender("local", 0.0, fail=True), _contender("groq", 0.0, fail=True), hedge_s=0.0)
+
+    def test_abort_on_ends_the_race(self):
+        def preempted(_cancel: threading.Event) -> str:
+            raise GenerationCancelled("preempted")
+
+        with pytest.raises(GenerationCancelled, match="preempted"):
+            race(Contender("local", preempted), _contender("groq", 0.2), hedge_s=5.0, abort_on=(GenerationCancelled,))
+
+
+# ---------------------------------------------------------------------------
+# Against a stub OpenAI-compatible server with latency spikes
+# ---------------------------------------------------------------------------
+
+
+class _SpikyStub:
+    """Transcription and chat-completion endpoints; ``spikes`` delays the next requests."""
+
+    def __init__(self, *, latency_s: float = 0.02) -> None:
+        self.latency_s = latency_s
+        self.spikes: list[float] = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:  # noqa: ANN002
+                pass
+
+            def do_POST(self) -> None:  # noqa: N802
+                self.rfile.read(int(self.headers["Content-Length"]))
+                with stub._lock:
+                    delay = stub.spikes.pop(0) if stub.spikes else stub.latency_s
+                time.sleep(delay)
+                if self.path.endswith("/audio/transcriptions"):
+                    payload = {"text": "Groq text.", "duration": 3.0}
+                else:
+                    payload = {
+                        "choices": [{"message": {"content": "Groq refined."}, "finish_reason": "stop"}],
+                        "usage": {"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13},
+                    }
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def __enter__(self) -> "_SpikyStub":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:  # noqa: ANN002
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture()
+def stub():
+    with _SpikyStub() as server:
+        yield server
+
+
+class _LocalWhisper:
+    """Stands in for a loaded faster-whisper model: one segment after ``delay_s``."""
+
+    _vociferous_runtime_summary = {
+        "provider": "local_faster_whisper",
+        "model_id": "large-v3-turbo-int8",
+        "resolved_device": "cpu",
+        "compute_type_resolved": "int8",
+        "cpu_threads": 4,
+    }
+
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+
+    def transcribe(self, audio, **options):
+        time.sleep(self.delay_s)
+        return [SimpleNamespace(text="Local text.", end=3.0)], None
+
+
+@pytest.fixture()
+def raced_session(fresh_settings, stub, tmp_path):
+    groq = fresh_settings.model.groq.model_copy(
+        update={
+            "base_url": stub.base_url,
+            "api_key": VALID_GROQ_KEY,
+            "model_list_enabled": False,
+            "upload_format": "wav",
+        }
+    )
+    settings = fresh_settings.model_copy(
+        update={
+            "model": fresh_settings.model.model_copy(
+                update={"provider": "groq", "race_providers": True, "race_hedge_ms": 300, "groq": groq}
+            )
+        }
+    )
+    db = TranscriptDB(db_path=tmp_path / "race.db")
+    session = RecordingSession(
+        audio_service_provider=lambda: None,
+        settings_provider=lambda: settings,
+        db_provider=lambda: db,
+        event_bus_emit=MagicMock(),
+        shutdown_event=threading.Event(),
+        insight_manager_provider=lambda: None,
+    )
+    session._asr_model = OpenAICompatibleTranscriptionProvider(settings)
+    session._side_models["race:local_faster_whisper"] = _LocalWhisper(delay_s=0.2)
+    session._audio_pipeline = MagicMock()
+    session._audio_pipeline.process_speech.return_value = CleanSpeech(
+        np.full(16_000 * 3, 0.1, dtype=np.float32), [(0, 16_000 * 3)]
+    )
+    yield session, db
+    session.asr_scheduler.shutdown()
+    db.close()
+
+
+class TestRacedDictation:
+    def test_groq_answers_within_the_hedge(self, raced_session):
+        session, db = raced_session
+        session._transcribe_and_store(np.zeros(16_000 * 3, dtype=np.int16))
+
+        transcript = db.recent(limit=1)[0][0]
+        assert transcript.raw_text.strip() == "Groq text." and transcript.transcription_provider == "groq"
+
+    def test_latency_spike_hands_the_dictation_to_local_whisper(self, raced_session, stub):
+        session, db = raced_session
+        stub.spikes = [3.0]
+        start = time.perf_counter()
+        session._transcribe_and_store(np.zeros(16_000 * 3, dtype=np.int16))
+        elapsed = time.perf_counter() - start
+
+        transcript = db.recent(limit=1)[0][0]
+        assert transcript.raw_text.strip() == "Local text."
+        assert transcript.transcription_provider == "local_faster_whisper"
+        assert transcript.transcription_model_id == "large-v3-turbo-int8"
+        assert elapsed < 2.0  # hedge (0.3 s) + local decode, not the 3 s spike
+        assert set(session.asr_latency.snapshot()) == {"local_faster_whisper/<=10"}
+
+    def test_the_partner_loads_before_the_hedge_and_is_evictable(self, raced_session):
+        from src.services.model_residency import ModelResidencyManager
+
+        session, db = raced_session
+        local = session._side_models.pop("race:local_faster_whisper")
+        residency = ModelResidencyManager(settings_provider=session._settings_provider)
+        residency.register(
+            "asr_side",
+            load=session.preload_race_model,
+            unload=session.evict_side_models,
+            is_loaded=lambda: session.is_side_model_loaded,
+            estimate_mb=session.side_models_estimate_mb,
+        )
+        session._residency = residency
+
+        with patch("src.services.transcription_service.create_local_model", return_value=local) as create:
+            session._transcribe_and_store(np.zeros(16_000 * 3, dtype=np.int16))
+
+        # Groq answered inside the hedge, yet the local model was loaded for it.
+        assert db.recent(limit=1)[0][0].transcription_provider == "groq"
+        assert create.call_count == 1
+        assert residency.status()["models"]["asr_side"]["loads"] == 1
+        assert residency.evict("asr_side", check_busy=False)
+        assert not session.is_side_model_loaded
+
+
+class _LocalSLM:
+    """Stands in for the local CT2 provider: cancellable, answers after ``delay_s``."""
+
+    supports_cancellation = True
+
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+        self.cancelled = 0
+
+    def refine(self, text, *, should_cancel=None, **_options) -> GenerationResult:
+        deadline = time.monotonic() + self.delay_s
+        while time.monotonic() < deadline:
+            if should_cancel is not None and should_cancel():
+                self.cancelled += 1
+                raise GenerationCancelled("Generation cancelled mid-decode.")
+            time.sleep(0.01)
+        return GenerationResult(content="Local refined.", prompt_tokens=8, completion_tokens=2, total_tokens=10)
+
+    def get_runtime_summary(self) -> dict[str, object]:
+        return {"provider": "local_ct2", "model_id": "qwen4b", "resolved_device": "cpu", "compute_type": "int8"}
+
+    def unload(self) -> None:
+        pass
+
+
+@pytest.fixture()
+def raced_runtime(fresh_settings, stub):
+    refinement = fresh_settings.refinement
+    refinement.provider = "groq"
+    refinement.race_providers = True
+    refinement.race_hedge_ms = 300
+    refinement.groq.base_url = stub.base_url
+    refinement.groq.api_key = VALID_GROQ_KEY
+    refinement.chunk_threshold_words = 0
+    refinement.result_cache_max_entries = 0
+    scheduler = SLMScheduler()
+    runtime = SLMRuntime(settings_provider=lambda: fresh_settings, scheduler=scheduler)
+    runtime._engine = OpenAICompatibleRefinementProvider(fresh_settings, "groq")
+    local = _LocalSLM(delay_s=0.2)
+    runtime._race_engine = (("local_ct2", refinement.model_id), local)
+    yield runtime, local, fresh_settings
+    scheduler.shutdown()
+
+
+class TestRacedRefinement:
+    def test_latency_spike_hands_the_refinement_to_the_local_model(self, raced_runtime, stub):
+        runtime, _local, settings = raced_runtime
+        stub.spikes = [3.0]
+
+        start = time.perf_counter()
+        hedged = runtime.refine_text_with_provenance("so um this is a test you know", allow_skip=False)
+        assert hedged.content == "Local refined."
+        assert time.perf_counter() - start < 2.0
+
+        direct = runtime.refine_text_with_provenance("so um this is a test you know", allow_skip=False)
+        assert direct.content == "Groq refined."
+        capture = build_refinement_capture(settings, runtime, "", direct)
+        assert capture["refinement_provider"] == "groq" and capture["refinement_total_tokens"] == 13
+        # The winner travels with each result, so a later run never relabels an earlier one.
+        assert build_refinement_capture(settings, runtime, "", hedged)["refinement_provider"] == "local_ct2"
+
+    def test_local_primary_is_cancelled_when_groq_wins(self, raced_runtime):
+        runtime, _local, settings = raced_runtime
+        settings.refinement.provider = "local_ct2"
+        slow = _LocalSLM(delay_s=5.0)
+        runtime._engine, groq = slow, runtime._engine
+        runtime._race_engine = (("groq", settings.refinement.groq.model_id), groq)
+
+        refined = runtime.refine_text_with_provenance("so um this is a test you know", allow_skip=False)
+        assert refined.content == "Groq refined."
+        assert slow.cancelled == 1
+        assert build_refinement_capture(settings, runtime, "", refined)["refinement_provider"] == "groq"
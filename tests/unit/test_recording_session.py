@@ -15,6 +15,7 @@ import numpy as np
 import pytest
 
 from src.core.handlers.recording_handlers import RecordingSession
+from src.services.asr_scheduler import ASRJobPriority
 
 
 @pytest.fixture()
@@ -148,6 +149,30 @@ class TestTranscribeAndStore:
         assert payload["id"] == 42
         assert payload["speech_duration_ms"] == 850
 
+    @pytest.mark.parametrize(
+        ("kwargs", "lane"),
+        [({}, "dictation"), ({"asr_priority": ASRJobPriority.RECOVERY}, "recovery")],
+    )
+    @patch("src.services.transcription_service.transcribe")
+    def test_decode_runs_on_the_asr_scheduler(self, mock_transcribe, session, kwargs, lane):
+        """ASR runs on the scheduler worker in the caller's lane, with a yield point."""
+        seen = {}
+
+        def fake_transcribe(audio, **kw):
+            seen["in_worker"] = session.asr_scheduler.in_worker()
+            seen["between_segments"] = kw["between_segments"]
+            return ("Hello world", 850, 120)
+
+        mock_transcribe.side_effect = fake_transcribe
+        session._asr_model = MagicMock()
+        session._audio_pipeline = MagicMock()
+
+        session._transcribe_and_store(np.zeros(32000, dtype=np.float32), **kwargs)
+
+        assert seen == {"in_worker": True, "between_segments": session.asr_scheduler.yield_to_urgent}
+        rtf = session.asr_scheduler.metrics()["rtf_by_priority"][lane]
+        assert rtf["count"] == 1 and rtf["audio_s"] == 2.0
+
     @patch("src.services.audio_pipeline.AudioPipeline")
     @patch("src.services.transcription_service.transcribe")
     def test_no_speech_detected(self, mock_transcribe, mock_pipeline, session, emit, fake_db):
@@ -0,0 +1,186 @@
+"""
+Refinement result cache tests.
+
+Covers the SQLite LRU store (keying, eviction, persistence) and how
+SLMRuntime consults it: hits skip the engine and are reported as cached,
+sampled settings are only cached when opted in.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.refinement.output_parser import GenerationResult
+from src.services.refinement_cache import CachedRefinement, RefinementCacheKey, RefinementResultCache
+from src.services.slm_runtime import SLMRuntime
+
+
+def _key(text: str = "rough text", *, temperature: float = 0.0, top_k: int = 20) -> RefinementCacheKey:
+    return RefinementCacheKey(
+        text=text,
+        instructions="",
+        provider_id="local_ct2",
+        model_id="qwen4b",
+        temperature=temperature,
+        top_p=0.9,
+        top_k=top_k,
+        repetition_penalty=1.0,
+        use_thinking=False,
+        allow_skip=False,
+    )
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    store = RefinementResultCache(tmp_path / "results.sqlite3")
+    yield store
+    store.close()
+
+
+class TestRefinementResultCache:
+    def test_round_trip_keeps_content_and_usage(self, cache):
+        cache.put(_key(), CachedRefinement("Polished.", 10, 5, 15), max_entries=10)
+
+        hit = cache.get(_key())
+
+        assert hit == CachedRefinement("Polished.", 10, 5, 15)
+        assert hit.usage == {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 0}
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"text": "other text"},
+            {"instructions": "Use bullet points."},
+            {"provider_id": "groq"},
+            {"model_id": "qwen8b"},
+            {"temperature": 0.01},
+            {"top_k": 1},
+            {"allow_skip": True},
+            {"system_prompt": "Be terse."},
+            {"invariants": ("Keep names.",)},
+        ],
+    )
+    def test_any_input_change_misses(self, cache, change):
+        cache.put(_key(), CachedRefinement("Polished."), max_entries=10)
+
+        assert cache.get(dataclasses.replace(_key(), **change)) is None
+
+    def test_least_recently_used_entries_are_evicted(self, cache):
+        cache.put(_key("a"), CachedRefinement("A"), max_entries=2)
+        cache.put(_key("b"), CachedRefinement("B"), max_entries=2)
+        assert cache.get(_key("a")) is not None  # "b" is now least recently used
+
+        cache.put(_key("c"), CachedRefinement("C"), max_entries=2)
+
+        assert len(cache) == 2
+        assert cache.get(_key("b")) is None
+        assert cache.get(_key("a")) is not None
+        assert cache.get(_key("c")) is not None
+
+    def test_zero_max_entries_stores_nothing(self, cache):
+        cache.put(_key(), CachedRefinement("Polished."), max_entries=0)
+        assert len(cache) == 0
+
+    def test_entries_persist_across_reopen(self, tmp_path):
+        path = tmp_path / "results.sqlite3"
+        first = RefinementResultCache(path)
+        first.put(_key(), CachedRefinement("Polished."), max_entries=10)
+        first.close()
+
+        second = RefinementResultCache(path)
+        try:
+            assert second.get(_key()).content == "Polished."
+        finally:
+            second.close()
+
+    def test_deterministic_flag(self):
+        assert _key(temperature=0.0).deterministic
+        assert _key(temperature=0.7, top_k=1).deterministic
+        assert not _key(temperature=0.3).deterministic
+
+
+class TestRuntimeCaching:
+    @pytest.fixture()
+    def runtime(self, fresh_settings, cache):
+        fresh_settings.refinement.temperature = 0.0
+        engine = MagicMock()
+        engine.get_runtime_summary.return_value = {"provider": "local_ct2", "model_id": "qwen4b"}
+
+        def refine(text, **kw):
+            return GenerationResult(content=text.upper(), prompt_tokens=12, completion_tokens=4, total_tokens=16)
+
+        engine.refine.side_effect = refine
+        rt = SLMRuntime(settings_provider=lambda: fresh_settings, result_cache=cache)
+        rt._engine = engine
+        rt._runtime_summary = engine.get_runtime_summary()
+        return rt
+
+    def test_hit_skips_engine_and_reports_cached_provenance(self, runtime):
+        miss = runtime.refine_text_with_provenance("rough text")
+        assert (miss.content, miss.cached) == ("ROUGH TEXT", False)
+
+        hit = runtime.refine_text_with_provenance("rough text")
+
+        assert runtime._engine.refine.call_count == 1
+        assert (hit.content, hit.cached) == ("ROUGH TEXT", True)
+        assert hit.usage == {"prompt_tokens": 12, "completion_tokens": 4, "total_tokens": 16}
+
+    def test_provenance_belongs_to_each_call(self, runtime):
+        hit_first = runtime.refine_text_with_provenance("rough text")
+        hit = runtime.refine_text_with_provenance("rough text")
+        miss = runtime.refine_text_with_provenance("other text")
+
+        # A later miss does not rewrite what an earlier hit reported.
+        assert (hit_first.cached, hit.cached, miss.cached) == (False, True, False)
+        assert "last_cached" not in runtime.get_runtime_summary()
+
+    def test_changed_instructions_rerun_the_engine(self, runtime):
+        runtime.refine_text_sync("rough text")
+        runtime.refine_text_sync("rough text", instructions="Use bullet points.")
+
+        assert runtime._engine.refine.call_count == 2
+
+    def test_sampled_settings_are_cached_only_when_opted_in(self, runtime, fresh_settings):
+        fresh_settings.refinement.temperature = 0.3
+        runtime.refine_text_sync("rough text")
+        runtime.refine_text_sync("rough text")
+        assert runtime._engine.refine.call_count == 2
+
+        fresh_settings.refinement.cache_sampled_results = True
+        runtime.refine_text_sync("rough text")
+        runtime.refine_text_sync("rough text")
+        assert runtime._engine.refine.call_count == 3
+
+    def test_disabled_by_zero_max_entries(self, runtime, fresh_settings):
+        fresh_settings.refinement.result_cache_max_entries = 0
+        runtime.refine_text_sync("rough text")
+        runtime.refine_text_sync("rough text")
+        assert runtime._engine.refine.call_count == 2
+
+    def test_batch_only_sends_misses_to_the_engine(self, runtime):
+        runtime.refine_text_sync("a")
+        engine = runtime._engine
+
+        def refine_batch(texts, **kw):
+            results = [GenerationResult(content=text.upper()) for text in texts]
+            for index, result in enumerate(results):
+                kw["on_result"](index, result, 0.5)
+            return results
+
+        engine.refine_batch.side_effect = refine_batch
+        delivered = []
+
+        out = runtime.refine_batch_sync(
+            ["a", "b"],
+            on_result=lambda index, refined, elapsed: delivered.append((index, refined.content, refined.cached)),
+        )
+
+        assert out == ["A", "B"]
+        assert sorted(delivered) == [(0, "A", True), (1, "B", False)]
+        assert engine.refine_batch.call_args.args[0] == ["b"]
+        assert runtime.refine_batch_sync(["a", "b"]) == ["A", "B"]
+        assert engine.refine_batch.call_count == 1
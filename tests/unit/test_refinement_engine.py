@@ -10,9 +10,11 @@ Tests the pure logic without loading an actual CT2 model:
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from src.refinement.engine import GenerationResult, RefinementEngine
+from src.refinement.engine import GenerationCancelled, GenerationResult, RefinementEngine
 from src.refinement.prompt_builder import PromptBuilder
 
 # ── Test Fixture: Engine Without Model ────────────────────────────────────
@@ -346,3 +348,199 @@ class TestRefineGuard:
         result = engine.refine("ok", user_instructions="Fix this anyway.", allow_skip=False)
 
         assert result.content == "Refined output"
+
+
+# ── Batched Refinement ────────────────────────────────────────────────────
+
+
+class _BatchTokenizer:
+    """Whitespace tokenizer: prompt length tracks input length."""
+
+    def encode(self, value: str):  # noqa: ANN201
+        class _Encoded:
+            tokens = value.split()
+
+        return _Encoded()
+
+    def decode(self, ids: list[int]) -> str:
+        return f"out-{len(ids)}"
+
+
+class _RecordingGenerator:
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[list[str]], dict[str, object]]] = []
+
+    def generate_batch(self, prompts: list[list[str]], **kwargs: object) -> list[object]:
+        self.calls.append((prompts, kwargs))
+
+        class _Result:
+            def __init__(self, n: int) -> None:
+                self.sequences_ids = [list(range(n))]
+
+        return [_Result(len(p)) for p in prompts]
+
+
+def _make_batch_engine() -> tuple[RefinementEngine, _RecordingGenerator]:
+    engine = _make_engine()
+    engine.device = "cpu"
+    engine.tokenizer = MagicMock(wraps=_BatchTokenizer())
+    engine._format_prompt = lambda user_text, user_instructions="", use_thinking=False: [  # type: ignore[method-assign]
+        {"role": "user", "content": user_text}
+    ]
+    engine._messages_to_chatml = lambda messages: messages[0]["content"]  # type: ignore[method-assign]
+    generator = _RecordingGenerator()
+    engine.generator = generator
+    return engine, generator
+
+
+class TestRefineBatch:
+    def test_results_returned_in_input_order(self) -> None:
+        engine, _ = _make_batch_engine()
+        texts = ["w " * 40, "w " * 4, "w " * 20]
+
+        results = engine.refine_batch(texts, allow_skip=False, max_batch_size=8)
+
+        assert [r.prompt_tokens for r in results] == [40, 4, 20]
+        assert [r.content for r in results] == ["out-40", "out-4", "out-20"]
+
+    def test_prompts_are_bucketed_by_length(self) -> None:
+        engine, generator = _make_batch_engine()
+        texts = ["w " * n for n in (100, 10, 11, 102, 12, 101)]
+
+        engine.refine_batch(texts, allow_skip=False, max_batch_size=8)
+
+        batch_lengths = [[len(p) for p in prompts] for prompts, _ in generator.calls]
+        assert batch_lengths == [[10, 11, 12], [100, 101, 102]]
+        assert generator.calls[0][1]["max_batch_size"] == 3
+        assert generator.calls[0][1]["max_length"] == engine._calculate_dynamic_max_tokens(12)
+
+    def test_max_batch_size_caps_bucket(self) -> None:
+        engine, generator = _make_batch_engine()
+
+        engine.refine_batch(["w " * 10] * 5, allow_skip=False, max_batch_size=2)
+
+        assert [len(prompts) for prompts, _ in generator.calls] == [2, 2, 1]
+
+    def test_batch_size_bounded_by_available_memory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import psutil
+
+        engine, _ = _make_batch_engine()
+        per_item = 100 * engine.BATCH_BYTES_PER_TOKEN
+        available = int(3 * per_item / engine.BATCH_MEMORY_FRACTION)
+        monkeypatch.setattr(psutil, "virtual_memory", lambda: type("VM", (), {"available": available})())
+
+        assert engine._memory_bounded_batch_size(16, 100) == 3
+        assert engine._memory_bounded_batch_size(16, 10_000_000) == 1
+
+    def test_out_of_memory_splits_bucket(self) -> None:
+        engine, generator = _make_batch_engine()
+        original = generator.generate_batch
+
+        def flaky(prompts, **kwargs):  # noqa: ANN001, ANN202
+            if len(prompts) > 2:
+                raise RuntimeError("CUDA failed with error out of memory")
+            return original(prompts, **kwargs)
+
+        generator.generate_batch = flaky  # type: ignore[method-assign]
+
+        results = engine.refine_batch(["w " * 10] * 4, allow_skip=False, max_batch_size=4)
+
+        assert all(r is not None for r in results)
+        assert [len(prompts) for prompts, _ in generator.calls] == [2, 2]
+
+    def test_skipped_items_and_callbacks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        engine, generator = _make_batch_engine()
+        monkeypatch.setattr(
+            "src.refinement.skip_check.should_skip_refinement",
+            lambda text: "short_text" if len(text.split()) < 3 else None,
+        )
+        seen: list[int] = []
+
+        results = engine.refine_batch(
+            ["ok", "w " * 10, ""],
+            on_result=lambda index, result, elapsed: seen.append(index),
+        )
+
+        assert results[0].content == "ok"
+        assert results[2].content == ""
+        assert sorted(seen) == [0, 1, 2]
+        assert len(generator.calls) == 1
+
+    def test_cancel_stops_before_next_bucket(self) -> None:
+        engine, generator = _make_batch_engine()
+        texts = ["w " * 10, "w " * 100]
+        cancelled = False
+
+        def on_result(index: int, result: GenerationResult, elapsed: float) -> None:
+            nonlocal cancelled
+            cancelled = True
+
+        results = engine.refine_batch(texts, allow_skip=False, on_result=on_result, should_cancel=lambda: cancelled)
+
+        assert results[0] is not None
+        assert results[1] is None
+        assert len(generator.calls) == 1
+
+
+class _SteppingGenerator:
+    """Emits one token per step through CT2's ``callback``, honouring a True return."""
+
+    def __init__(self, steps: int = 50) -> None:
+        self.steps = steps
+        self.emitted = 0
+
+    def generate_batch(self, prompts: list[list[str]], callback=None, **kwargs: object) -> list[object]:  # noqa: ANN001
+        class _Result:
+            def __init__(self, n: int) -> None:
+                self.sequences_ids = [list(range(n))]
+
+        for _ in range(self.steps):
+            self.emitted += 1
+            if callback is not None and callback(object()):
+                break
+        return [_Result(self.emitted) for _ in prompts]
+
+
+class TestCooperativeCancellation:
+    def test_refine_stops_mid_decode_and_raises(self) -> None:
+        engine, _ = _make_batch_engine()
+        generator = _SteppingGenerator(steps=50)
+        engine.generator = generator
+
+        with pytest.raises(GenerationCancelled):
+            engine.refine("w " * 10, allow_skip=False, should_cancel=lambda: generator.emitted >= 5)
+
+        assert generator.emitted == 5
+
+    def test_generate_custom_checks_before_starting(self) -> None:
+        engine, _ = _make_batch_engine()
+        engine.prompt_builder = PromptBuilder()
+        generator = _SteppingGenerator()
+        engine.generator = generator
+
+        with pytest.raises(GenerationCancelled):
+            engine.generate_custom("system", "user", should_cancel=lambda: True)
+
+        assert generator.emitted == 0
+
+    def test_uncancelled_generation_completes(self) -> None:
+        engine, _ = _make_batch_engine()
+        engine.generator = _SteppingGenerator(steps=7)
+
+        result = engine.refine("w " * 10, allow_skip=False, should_cancel=lambda: False)
+
+        assert result.completion_tokens == 7
+
+    def test_refine_batch_abandons_in_flight_bucket(self) -> None:
+        engine, _ = _make_batch_engine()
+        generator = _SteppingGenerator(steps=50)
+        engine.generator = generator
+
+        results = engine.refine_batch(
+            ["w " * 10, "w " * 11],
+            allow_skip=False,
+            should_cancel=lambda: generator.emitted >= 3,
+        )
+
+        assert results == [None, None]
+        assert generator.emitted == 3
@@ -0,0 +1,360 @@
+"""
+Remote dispatch tests.
+
+Rate-limit header parsing and pacing, AIMD concurrency, ordered delivery,
+and bulk refinement through SLMRuntime against a local stub
+OpenAI-compatible server that simulates latency and rate limits.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.refinement.providers import OpenAICompatibleRefinementProvider, ProviderRequestError
+from src.refinement.providers.remote_dispatch import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    dispatch_in_order,
+    parse_reset_seconds,
+)
+from src.services.slm_runtime import SLMRuntime
+from src.services.slm_scheduler import SLMScheduler
+
+VALID_GROQ_KEY = "gsk_test_secret_123456789012345678901234567890"
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestParseResetSeconds:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("2m59.56s", 179.56),
+            ("7.66s", 7.66),
+            ("120ms", 0.12),
+            ("1h2m", 3720.0),
+            ("3", 3.0),
+            ("0.5", 0.5),
+        ],
+    )
+    def test_parses_provider_durations(self, raw, expected):
+        assert parse_reset_seconds(raw) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("raw", [None, "", "soon", "5 minutes", "2x"])
+    def test_rejects_unparseable_values(self, raw):
+        assert parse_reset_seconds(raw) is None
+
+
+class TestRateLimiter:
+    def test_does_not_pace_without_headers(self):
+        clock = _FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        for _ in range(5):
+            assert limiter.acquire(10_000) == 0.0
+        assert clock.slept == []
+
+    def test_exhausted_request_bucket_waits_for_refill(self):
+        clock = _FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.observe(
+            {
+                "x-ratelimit-limit-requests": "10",
+                "x-ratelimit-remaining-requests": "1",
+                "x-ratelimit-reset-requests": "9s",
+            },
+            200,
+        )
+
+        assert limiter.acquire() == 0.0
+        # 9 requests refill over 9s: one per second.
+        assert limiter.acquire() == pytest.approx(1.0)
+        assert limiter.acquire() == pytest.approx(1.0)
+
+    def test_token_bucket_paces_large_requests(self):
+        clock = _FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.observe(
+            {
+                "x-ratelimit-limit-tokens": "6000",
+                "x-ratelimit-remaining-tokens": "1000",
+                "x-ratelimit-reset-tokens": "50s",
+            },
+            200,
+        )
+
+        assert limiter.acquire(1000) == 0.0
+        # 5000 tokens over 50s = 100 tokens/s.
+        assert limiter.acquire(500) == pytest.approx(5.0)
+
+    def test_retry_after_pauses_every_caller_and_counts_throttles(self):
+        clock = _FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.observe({"retry-after": "3"}, 429)
+
+        assert limiter.throttle_count == 1
+        assert limiter.acquire() == pytest.approx(3.0)
+        assert limiter.acquire() == 0.0
+
+    def test_wait_is_capped(self):
+        clock = _FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep, max_wait_s=2.0)
+        limiter.observe({"retry-after": "600"}, 429)
+        assert limiter.acquire() == 2.0
+
+
+class TestAdaptiveConcurrency:
+    def test_halves_on_throttle_and_grows_one_per_window(self):
+        concurrency = AdaptiveConcurrency(8)
+        assert concurrency.limit == 8
+
+        concurrency.on_throttle()
+        assert concurrency.limit == 4
+        concurrency.on_throttle()
+        concurrency.on_throttle()
+        concurrency.on_throttle()
+        assert concurrency.limit == 1
+
+        concurrency.on_success()
+        assert concurrency.limit == 2
+        concurrency.on_success()
+        assert concurrency.limit == 2
+        concurrency.on_success()
+        assert concurrency.limit == 3
+
+    def test_never_exceeds_maximum(self):
+        concurrency = AdaptiveConcurrency(2, initial=1)
+        for _ in range(10):
+            concurrency.on_success()
+        assert concurrency.limit == 2
+
+
+class TestDispatchInOrder:
+    def test_delivers_in_input_order_despite_out_of_order_completion(self):
+        delays = [0.06, 0.0, 0.03, 0.0, 0.01]
+        delivered: list[int] = []
+
+        def work(index: int) -> str:
+            time.sleep(delays[index])
+            return f"r{index}"
+
+        results = dispatch_in_order(
+            range(len(delays)),
+            work,
+            concurrency=AdaptiveConcurrency(5),
+            on_result=lambda index, result, _elapsed: delivered.append(index),
+        )
+
+        assert results == ["r0", "r1", "r2", "r3", "r4"]
+        assert delivered == [0, 1, 2, 3, 4]
+
+    def test_throttled_items_are_requeued_and_concurrency_backs_off(self):
+        attempts: dict[int, int] = {}
+        lock = threading.Lock()
+
+        def work(index: int) -> int:
+            with lock:
+                attempts[index] = attempts.get(index, 0) + 1
+                first = attempts[index] == 1
+            if index % 2 and first:
+                raise ProviderRequestError("rate limited", status_code=429)
+            return index
+
+        concurrency = AdaptiveConcurrency(4)
+        results = dispatch_in_order(range(6), work, concurrency=concurrency)
+
+        assert results == [0, 1, 2, 3, 4, 5]
+        assert attempts[1] == attempts[3] == attempts[5] == 2
+        assert concurrency.limit < 4
+
+    def test_hard_error_delivers_finished_items_then_raises(self):
+        delivered: list[int] = []
+
+        def work(index: int) -> int:
+            if index == 1:
+                raise ProviderRequestError("bad request", status_code=422)
+            return index
+
+        with pytest.raises(ProviderRequestError, match="bad request"):
+            dispatch_in_order(
+                range(3),
+                work,
+                concurrency=AdaptiveConcurrency(1),
+                on_result=lambda index, _result, _elapsed: delivered.append(index),
+            )
+        # Serial: item 2 never starts once item 1 has failed.
+        assert delivered == [0]
+
+    def test_stop_lets_in_flight_items_finish(self):
+        started: list[int] = []
+        stop = threading.Event()
+
+        def work(index: int) -> int:
+            started.append(index)
+            stop.set()
+            return index
+
+        results = dispatch_in_order(range(5), work, concurrency=AdaptiveConcurrency(1), should_stop=stop.is_set)
+
+        assert started == [0]
+        assert results == [0, None, None, None, None]
+
+
+# ── Stub OpenAI-compatible server ─────────────────────────────────────────
+
+
+class _StubServer:
+    """Chat-completions endpoint with fixed latency and a parallel-request cap.
+
+    Requests beyond ``max_parallel`` in flight get a 429 with ``retry-after``
+    and ``x-ratelimit-*`` headers, like Groq's per-key limits.
+    """
+
+    def __init__(self, *, latency_s: float, max_parallel: int | None = None) -> None:
+        self.latency_s = latency_s
+        self.max_parallel = max_parallel
+        self.in_flight = 0
+        self.peak = 0
+        self.served = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:  # noqa: ANN002
+                pass
+
+            def do_POST(self) -> None:  # noqa: N802
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub._lock:
+                    if stub.max_parallel is not None and stub.in_flight >= stub.max_parallel:
+                        stub.throttled += 1
+                        self._send(429, {"error": {"message": "Rate limit reached"}}, {"retry-after": "0.02"})
+                        return
+                    stub.in_flight += 1
+                    stub.peak = max(stub.peak, stub.in_flight)
+                try:
+                    time.sleep(stub.latency_s)
+                    prompt = " ".join(str(m.get("content", "")) for m in body["messages"])
+                    item = re.findall(r"item \d+", prompt)[-1]
+                    payload = {
+                        "choices": [{"message": {"content": f"Refined {item}."}, "finish_reason": "stop"}],
+                        "usage": {"prompt_tokens": 10, "completion_tokens": 4, "total_tokens": 14},
+                    }
+                    self._send(200, payload, {})
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+                        stub.served += 1
+
+            def _send(self, status: int, payload: dict, headers: dict[str, str]) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("x-ratelimit-limit-requests", "14400")
+                self.send_header("x-ratelimit-remaining-requests", "14000")
+                self.send_header("x-ratelimit-reset-requests", "2m59.56s")
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def __enter__(self) -> "_StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:  # noqa: ANN002
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _remote_runtime(fresh_settings, base_url: str, concurrency: int) -> tuple[SLMRuntime, SLMScheduler]:
+    refinement = fresh_settings.refinement
+    refinement.provider = "groq"
+    refinement.groq.base_url = base_url
+    refinement.groq.api_key = VALID_GROQ_KEY
+    refinement.groq.bulk_concurrency = concurrency
+    refinement.groq.retry_backoff_seconds = 0.01
+    refinement.chunk_threshold_words = 0
+    refinement.result_cache_max_entries = 0
+    scheduler = SLMScheduler()
+    runtime = SLMRuntime(settings_provider=lambda: fresh_settings, scheduler=scheduler)
+    runtime._engine = OpenAICompatibleRefinementProvider(fresh_settings, "groq")
+    return runtime, scheduler
+
+
+def _texts(count: int) -> list[str]:
+    return [f"so um this is item {index} of the bulk run you know" for index in range(count)]
+
+
+class TestRemoteBulkRefinement:
+    def test_bulk_batch_size_reports_provider_concurrency(self, fresh_settings):
+        runtime, scheduler = _remote_runtime(fresh_settings, "http://127.0.0.1:9/v1", 6)
+        try:
+            assert runtime.bulk_batch_size() == 6
+        finally:
+            scheduler.shutdown()
+
+    def test_results_commit_in_order_under_rate_limits(self, fresh_settings):
+        texts = _texts(16)
+        delivered: list[tuple[int, str]] = []
+        with _StubServer(latency_s=0.02, max_parallel=2) as stub:
+            runtime, scheduler = _remote_runtime(fresh_settings, stub.base_url, 8)
+            try:
+                out = runtime.refine_batch_sync(
+                    texts,
+                    allow_skip=False,
+                    on_result=lambda index, text, _elapsed: delivered.append((index, text)),
+                )
+            finally:
+                scheduler.shutdown()
+
+        assert out == [f"Refined item {index}." for index in range(16)]
+        assert [index for index, _ in delivered] == list(range(16))
+        assert stub.throttled > 0
+        assert stub.peak <= 2
+        assert runtime._remote_concurrency is not None
+        assert runtime._remote_concurrency.limit < 8
+
+    def test_throughput_scales_with_concurrency(self, fresh_settings, record_property):
+        texts = _texts(24)
+        throughput: dict[int, float] = {}
+        with _StubServer(latency_s=0.05) as stub:
+            for concurrency in (1, 4, 8):
+                runtime, scheduler = _remote_runtime(fresh_settings, stub.base_url, concurrency)
+                try:
+                    start = time.monotonic()
+                    out = runtime.refine_batch_sync(texts, allow_skip=False)
+                    throughput[concurrency] = len(texts) / (time.monotonic() - start)
+                finally:
+                    scheduler.shutdown()
+                assert out == [f"Refined item {index}." for index in range(24)]
+                record_property(f"transcripts_per_s_c{concurrency}", round(throughput[concurrency], 1))
+
+        assert throughput[4] > 2 * throughput[1]
+        assert throughput[8] > 1.2 * throughput[4]
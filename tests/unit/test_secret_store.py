@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import subprocess
+import threading
 
 import pytest
 
@@ -81,3 +82,148 @@ def test_windows_dpapi_roundtrip(monkeypatch, tmp_path) -> None:
     assert get_provider_api_key("groq") == VALID_GROQ_KEY
     assert delete_provider_api_key("groq") is True
     assert get_provider_api_key("groq") is None
+
+
+class _FakeSecretTool:
+    """In-memory ``secret-tool`` that counts every spawned process."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.calls: list[str] = []
+
+    def run(self, args, **kwargs):
+        self.calls.append(args[1])
+        account = args[-1]
+        if args[1] == "store":
+            self.values[account] = kwargs["input"]
+            return subprocess.CompletedProcess(args, 0, stdout="")
+        if args[1] == "lookup":
+            value = self.values.get(account)
+            return subprocess.CompletedProcess(args, 0 if value else 1, stdout=value or "")
+        existed = self.values.pop(account, None) is not None
+        return subprocess.CompletedProcess(args, 0 if existed else 1, stdout="")
+
+
+@pytest.fixture()
+def fake_secret_tool(monkeypatch):
+    tool = _FakeSecretTool()
+    which_calls: list[str] = []
+
+    def which(name):
+        which_calls.append(name)
+        return "/usr/bin/secret-tool" if name == "secret-tool" else None
+
+    monkeypatch.setattr(secret_store.sys, "platform", "linux")
+    monkeypatch.setattr(secret_store.shutil, "which", which)
+    monkeypatch.setattr(secret_store.subprocess, "run", tool.run)
+    tool.which_calls = which_calls
+    return tool
+
+
+def test_backend_lookup_is_memoized(fake_secret_tool) -> None:
+    assert get_secret_backend() == "libsecret"
+    assert get_secret_backend() == "libsecret"
+    assert fake_secret_tool.which_calls == ["secret-tool"]
+
+
+def test_provider_key_is_cached_including_absence(fake_secret_tool) -> None:
+    assert get_provider_api_key("groq") is None
+    assert get_provider_api_key("groq") is None
+    assert fake_secret_tool.calls == ["lookup"]
+
+
+def test_store_and_delete_invalidate_the_cached_key(fake_secret_tool) -> None:
+    assert get_provider_api_key("groq") is None
+
+    store_provider_api_key("groq", VALID_GROQ_KEY)
+    assert get_provider_api_key("groq") == VALID_GROQ_KEY
+    assert get_provider_api_key("groq") == VALID_GROQ_KEY
+
+    assert delete_provider_api_key("groq") is True
+    assert get_provider_api_key("groq") is None
+    assert fake_secret_tool.calls == ["lookup", "store", "lookup", "clear", "lookup"]
+
+
+def test_refresh_and_ttl_reread_the_backend(fake_secret_tool, monkeypatch) -> None:
+    fake_secret_tool.values["refinement:groq:api_key"] = VALID_GROQ_KEY
+    assert get_provider_api_key("groq") == VALID_GROQ_KEY
+    assert get_provider_api_key("groq", refresh=True) == VALID_GROQ_KEY
+    assert fake_secret_tool.calls == ["lookup", "lookup"]
+
+    now = [1000.0]
+    monkeypatch.setattr(secret_store.time, "monotonic", lambda: now[0])
+    secret_store.set_credential_cache_ttl(60)
+    get_provider_api_key("groq", refresh=True)
+    now[0] += 30
+    get_provider_api_key("groq")
+    assert len(fake_secret_tool.calls) == 3
+    now[0] += 31
+    get_provider_api_key("groq")
+    assert len(fake_secret_tool.calls) == 4
+
+
+def test_read_racing_a_delete_does_not_recache_the_old_key(fake_secret_tool, monkeypatch) -> None:
+    fake_secret_tool.values["refinement:groq:api_key"] = VALID_GROQ_KEY
+    read_started = threading.Event()
+    release_read = threading.Event()
+    fast_run = fake_secret_tool.run
+
+    def slow_run(args, **kwargs):
+        result = fast_run(args, **kwargs)
+        if args[1] == "lookup" and not read_started.is_set():
+            # The old key is already read; hold the reader until the delete lands.
+            read_started.set()
+            release_read.wait(5)
+        return result
+
+    monkeypatch.setattr(secret_store.subprocess, "run", slow_run)
+    reader = threading.Thread(target=get_provider_api_key, args=("groq",))
+    reader.start()
+    assert read_started.wait(5)
+
+    assert delete_provider_api_key("groq") is True
+    release_read.set()
+    reader.join(5)
+
+    assert get_provider_api_key("groq") is None
+    assert fake_secret_tool.calls == ["lookup", "clear", "lookup"]
+
+
+def test_bulk_refinement_spawns_no_subprocess_after_load(fake_secret_tool, fresh_settings) -> None:
+    import httpx
+
+    from src.refinement.providers import OpenAICompatibleRefinementProvider
+    from src.services.slm_runtime import SLMRuntime
+    from src.services.slm_scheduler import SLMScheduler
+
+    fake_secret_tool.values["refinement:groq:api_key"] = VALID_GROQ_KEY
+    fresh_settings.refinement.provider = "groq"
+    fresh_settings.refinement.groq.api_key = None
+    fresh_settings.refinement.groq.api_key_env = None
+    fresh_settings.refinement.result_cache_max_entries = 0
+    fresh_settings.refinement.chunk_threshold_words = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == f"Bearer {VALID_GROQ_KEY}"
+        if request.url.path.endswith("/models"):
+            return httpx.Response(200, json={"data": [{"id": "llama-3.1-8b-instant"}]})
+        return httpx.Response(200, json={"choices": [{"message": {"content": "Refined."}}]})
+
+    provider = OpenAICompatibleRefinementProvider(fresh_settings, "groq")
+    provider._client = httpx.Client(transport=httpx.MockTransport(handler))
+    provider.load()
+    spawned_at_load = len(fake_secret_tool.calls)
+    which_at_load = len(fake_secret_tool.which_calls)
+    assert spawned_at_load >= 1
+
+    scheduler = SLMScheduler()
+    runtime = SLMRuntime(settings_provider=lambda: fresh_settings, scheduler=scheduler)
+    runtime._engine = provider
+    try:
+        out = runtime.refine_batch_sync([f"so um item {index} you know" for index in range(100)], allow_skip=False)
+    finally:
+        scheduler.shutdown()
+
+    assert out == ["Refined."] * 100
+    assert len(fake_secret_tool.calls) == spawned_at_load
+    assert len(fake_secret_tool.which_calls) == which_at_load
@@ -0,0 +1,71 @@
+"""Tests for src.refinement.selective — sentence-level refinement planning."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.refinement.selective import plan_selective_refinement, split_sentences
+
+CLEAN = "The quarterly report is ready for review."
+DIRTY = "um so like the the numbers are are wrong i think"
+MIXED = f"  {CLEAN} {DIRTY}. Ok. Another clean sentence is here!\n\nThanks.\n\nuh yeah we need to to fix it. {CLEAN} "
+
+
+class TestSplitSentences:
+    def test_round_trips_the_stripped_text(self) -> None:
+        pairs = split_sentences(MIXED)
+        assert "".join(sentence + separator for sentence, separator in pairs) == MIXED.strip()
+
+    def test_splits_on_terminal_punctuation_and_blank_lines(self) -> None:
+        assert split_sentences('He said "stop." Then left!\n\nNew paragraph') == [
+            ('He said "stop."', " "),
+            ("Then left!", "\n\n"),
+            ("New paragraph", ""),
+        ]
+
+    def test_empty_text(self) -> None:
+        assert split_sentences("  \n ") == []
+
+
+class TestPlanSelectiveRefinement:
+    def test_only_dirty_sentences_are_marked(self) -> None:
+        plan = plan_selective_refinement(MIXED)
+
+        assert plan.is_partial
+        assert plan.regions == [f"{DIRTY}. Ok.", "uh yeah we need to to fix it."]
+
+    def test_short_paragraph_is_kept_verbatim(self) -> None:
+        plan = plan_selective_refinement(MIXED)
+        thanks = [span for span in plan.spans if span.text == "Thanks."]
+        assert thanks and not thanks[0].refine
+
+    def test_stitch_preserves_boundaries(self) -> None:
+        plan = plan_selective_refinement(MIXED)
+
+        assert plan.stitch([None] * len(plan.regions)) == MIXED
+        stitched = plan.stitch(["The numbers are wrong, I think.", "We need to fix it."])
+        assert stitched == (
+            f"  {CLEAN} The numbers are wrong, I think. Another clean sentence is here!\n\n"
+            f"Thanks.\n\nWe need to fix it. {CLEAN} "
+        )
+
+    def test_consecutive_dirty_sentences_form_one_region(self) -> None:
+        plan = plan_selective_refinement(f"{DIRTY}. {DIRTY}. {CLEAN}")
+        assert plan.regions == [f"{DIRTY}. {DIRTY}."]
+
+    def test_paragraph_break_splits_regions(self) -> None:
+        plan = plan_selective_refinement(f"{DIRTY}.\n\n{DIRTY}.")
+        assert len(plan.regions) == 2
+        assert not plan.is_partial
+
+    def test_clean_text_has_no_regions(self) -> None:
+        plan = plan_selective_refinement(f"{CLEAN} {CLEAN}")
+        assert plan.regions == []
+        assert plan.stitch([]) == f"{CLEAN} {CLEAN}"
+
+    def test_threshold_controls_selection(self) -> None:
+        assert plan_selective_refinement(f"{CLEAN} {DIRTY}.", threshold=1.01).regions == []
+
+    def test_stitch_rejects_wrong_region_count(self) -> None:
+        with pytest.raises(ValueError, match="region"):
+            plan_selective_refinement(f"{CLEAN} {DIRTY}.").stitch([])
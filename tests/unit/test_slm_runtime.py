@@ -394,6 +394,288 @@ class TestRefineTextSync:
         assert result == "polished text"
         assert runtime.state is SLMState.READY
 
+    def test_should_cancel_only_reaches_cancellable_providers(self, runtime):
+        remote = MagicMock()
+        remote.refine.return_value = MagicMock(content="polished")
+        runtime._engine = remote
+
+        runtime.refine_text_sync("rough text", level=1, should_cancel=lambda: False)
+
+        assert remote.refine.call_args.kwargs["should_cancel"] is None
+
+    def test_user_cancel_surfaces_generation_cancelled(self, runtime):
+        from src.refinement.engine import GenerationCancelled
+
+        local = MagicMock()
+        local.supports_cancellation = True
+
+        def refine(text, **kw):
+            assert kw["should_cancel"]() is True
+            raise GenerationCancelled("stopped")
+
+        local.refine.side_effect = refine
+        runtime._engine = local
+
+        with pytest.raises(GenerationCancelled):
+            runtime.refine_text_sync("rough text", level=1, should_cancel=lambda: True)
+        assert runtime.state is SLMState.READY
+
+
+class TestRefineBatchSync:
+    """Batched bulk refinement — capability detection and per-item delivery."""
+
+    def test_bulk_batch_size_is_one_without_batch_capable_engine(self, runtime):
+        runtime._engine = MagicMock(spec=["refine", "generate_custom"])
+        assert runtime.bulk_batch_size() == 1
+
+    def test_bulk_batch_size_follows_setting(self, runtime, fresh_settings):
+        fresh_settings.refinement.bulk_batch_size = 6
+        runtime._engine = MagicMock()
+        assert runtime.bulk_batch_size() == 6
+
+    def test_refine_batch_forwards_per_item_results(self, runtime, fresh_settings):
+        from src.refinement.output_parser import GenerationResult
+
+        fresh_settings.refinement.bulk_batch_size = 4
+        mock_engine = MagicMock()
+
+        def refine_batch(texts, **kw):
+            results = []
+            for index, text in enumerate(texts):
+                result = GenerationResult(content=text.upper())
+                kw["on_result"](index, result, 0.5)
+                results.append(result)
+            return results
+
+        mock_engine.refine_batch.side_effect = refine_batch
+        runtime._engine = mock_engine
+        delivered = []
+
+        out = runtime.refine_batch_sync(
+            ["a", "b"],
+            on_result=lambda index, refined, elapsed: delivered.append((index, refined.content, elapsed)),
+        )
+
+        assert out == ["A", "B"]
+        assert delivered == [(0, "A", 0.5), (1, "B", 0.5)]
+        assert mock_engine.refine_batch.call_args.kwargs["max_batch_size"] == 4
+        assert mock_engine.refine_batch.call_args.kwargs["allow_skip"] is False
+        assert runtime.state is SLMState.READY
+
+    def test_preempted_batch_resumes_with_undelivered_items(self, fresh_settings, callbacks):
+        from src.refinement.output_parser import GenerationResult
+        from src.services.slm_scheduler import SLMJobPriority, SLMScheduler
+
+        scheduler = SLMScheduler()
+        runtime = SLMRuntime(settings_provider=lambda: fresh_settings, scheduler=scheduler, **callbacks)
+        fresh_settings.refinement.bulk_batch_size = 4
+        order: list[str] = []
+        calls: list[list[str]] = []
+
+        def refine_batch(texts, **kw):
+            calls.append(list(texts))
+            first = GenerationResult(content=texts[0].upper())
+            kw["on_result"](0, first, 0.1)
+            if len(calls) == 1:
+                # An interactive refine arrives while the rest is mid-generation.
+                threading.Thread(
+                    target=lambda: runtime.submit_job(
+                        lambda: order.append("interactive"), priority=SLMJobPriority.INTERACTIVE_REFINE
+                    )
+                ).start()
+                for _ in range(200):
+                    if kw["should_cancel"]():
+                        break
+                    threading.Event().wait(0.01)
+                return [first] + [None] * (len(texts) - 1)
+            results = [first]
+            for index, text in enumerate(texts[1:], start=1):
+                results.append(GenerationResult(content=text.upper()))
+                kw["on_result"](index, results[-1], 0.1)
+            return results
+
+        mock_engine = MagicMock()
+        mock_engine.refine_batch.side_effect = refine_batch
+        runtime._engine = mock_engine
+        delivered: list[int] = []
+
+        try:
+            out = runtime.refine_batch_sync(
+                ["a", "b", "c"],
+                on_result=lambda index, text, elapsed: (delivered.append(index), order.append(f"bulk-{index}")),
+            )
+        finally:
+            scheduler.shutdown()
+
+        assert out == ["A", "B", "C"]
+        assert calls == [["a", "b", "c"], ["b", "c"]]
+        assert delivered == [0, 1, 2]
+        assert order == ["bulk-0", "interactive", "bulk-1", "bulk-2"]
+        assert runtime.get_scheduler_metrics()["preempted"] == 1
+
+    def test_refine_batch_without_engine_raises(self, runtime):
+        runtime._engine = None
+        with pytest.raises(RuntimeError, match="Engine not loaded"):
+            runtime.refine_batch_sync(["text"])
+
+
+class TestSelectiveRefinement:
+    """Only sentences that score as needing cleanup reach the engine."""
+
+    CLEAN = "The quarterly report is ready for review."
+    DIRTY = "um so like the the numbers are are wrong i think."
+
+    @staticmethod
+    def _result(text: str):
+        from src.refinement.output_parser import GenerationResult
+
+        return GenerationResult(content=text.upper(), prompt_tokens=10, completion_tokens=5, total_tokens=15)
+
+    def test_only_dirty_spans_are_sent_and_stitched_back(self, runtime, fresh_settings):
+        fresh_settings.refinement.selective_refinement = True
+        engine = MagicMock(spec=["refine", "get_runtime_summary", "supports_cancellation"])
+        engine.supports_cancellation = False
+        engine.refine.side_effect = lambda text, **kw: self._result(text)
+        engine.get_runtime_summary.return_value = {"model_id": "qwen4b"}
+        runtime._engine = engine
+
+        out = runtime.refine_text_sync(f"{self.CLEAN} {self.DIRTY}\n\n{self.CLEAN}")
+
+        assert out == f"{self.CLEAN} {self.DIRTY.upper()}\n\n{self.CLEAN}"
+        assert [call.args[0] for call in engine.refine.call_args_list] == [self.DIRTY]
+        assert engine.refine.call_args.kwargs["allow_skip"] is False
+
+    def test_regions_are_batched_and_usage_summed(self, runtime, fresh_settings):
+        fresh_settings.refinement.selective_refinement = True
+        engine = MagicMock()
+        engine.refine_batch.side_effect = lambda texts, **kw: [self._result(text) for text in texts]
+        engine.get_runtime_summary.return_value = {"model_id": "qwen4b", "last_usage": {"total_tokens": 15}}
+        runtime._engine = engine
+
+        out = runtime.refine_text_with_provenance(f"{self.DIRTY}\n\n{self.CLEAN}\n\n{self.DIRTY}")
+
+        assert out.content == f"{self.DIRTY.upper()}\n\n{self.CLEAN}\n\n{self.DIRTY.upper()}"
+        assert engine.refine_batch.call_args.args[0] == [self.DIRTY, self.DIRTY]
+        engine.refine.assert_not_called()
+        assert out.usage == {
+            "prompt_tokens": 20,
+            "completion_tokens": 10,
+            "total_tokens": 30,
+        }
+
+    def test_clean_text_never_reaches_the_engine(self, runtime, fresh_settings):
+        fresh_settings.refinement.selective_refinement = True
+        engine = MagicMock()
+        runtime._engine = engine
+
+        assert runtime.refine_text_sync(f"{self.CLEAN} {self.CLEAN}") == f"{self.CLEAN} {self.CLEAN}"
+        engine.refine.assert_not_called()
+        engine.refine_batch.assert_not_called()
+
+    def test_bulk_batch_flattens_regions_across_transcripts(self, runtime, fresh_settings):
+        fresh_settings.refinement.selective_refinement = True
+        engine = MagicMock()
+
+        def refine_batch(texts, **kw):
+            results = []
+            for index, text in enumerate(texts):
+                results.append(self._result(text))
+                kw["on_result"](index, results[-1], 0.5)
+            return results
+
+        engine.refine_batch.side_effect = refine_batch
+        runtime._engine = engine
+        delivered = []
+
+        out = runtime.refine_batch_sync(
+            [f"{self.CLEAN} {self.DIRTY}", self.CLEAN, self.DIRTY],
+            on_result=lambda index, text, elapsed: delivered.append(index),
+        )
+
+        assert out == [f"{self.CLEAN} {self.DIRTY.upper()}", self.CLEAN, self.DIRTY.upper()]
+        assert engine.refine_batch.call_count == 1
+        assert engine.refine_batch.call_args.args[0] == [self.DIRTY, self.DIRTY]
+        assert delivered == [1, 0, 2]
+
+
+class TestChunkedRefinement:
+    """Long transcripts are refined in bounded windows and stitched back."""
+
+    SENTENCE = "The committee reviewed the budget and approved the new schedule."
+
+    @pytest.fixture()
+    def long_text(self, fresh_settings) -> str:
+        fresh_settings.refinement.chunk_threshold_words = 50
+        fresh_settings.refinement.chunk_max_tokens = 64
+        fresh_settings.refinement.chunk_overlap_tokens = 6
+        return " ".join([self.SENTENCE] * 20)
+
+    @staticmethod
+    def _result(text: str):
+        from src.refinement.output_parser import GenerationResult
+
+        return GenerationResult(content=text.upper(), total_tokens=10)
+
+    def test_local_engine_refines_chunks_in_one_batch(self, runtime, long_text):
+        engine = MagicMock()
+
+        def refine_batch(texts, **kw):
+            results = [self._result(text) for text in texts]
+            for index, result in enumerate(results):
+                kw["on_result"](index, result, 0.1)
+            return results
+
+        engine.refine_batch.side_effect = refine_batch
+        runtime._engine = engine
+        progress = []
+
+        out = runtime.refine_text_sync(long_text, on_progress=lambda done, total: progress.append((done, total)))
+
+        assert out == long_text.upper()
+        chunks = engine.refine_batch.call_args.args[0]
+        assert len(chunks) > 1 and engine.refine_batch.call_count == 1
+        engine.refine.assert_not_called()
+        assert progress == [(i, len(chunks)) for i in range(1, len(chunks) + 1)]
+
+    def test_concurrent_remote_provider_gets_parallel_requests(self, runtime, fresh_settings, long_text):
+        fresh_settings.refinement.chunk_concurrency = 3
+        engine = MagicMock(
+            spec=["refine", "get_runtime_summary", "supports_cancellation", "supports_concurrent_requests"]
+        )
+        engine.supports_cancellation = False
+        engine.supports_concurrent_requests = True
+        in_flight = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def refine(text, **kw):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            threading.Event().wait(0.02)
+            with lock:
+                in_flight["now"] -= 1
+            return self._result(text)
+
+        engine.refine.side_effect = refine
+        runtime._engine = engine
+
+        out = runtime.refine_text_sync(long_text)
+
+        assert out == long_text.upper()
+        assert engine.refine.call_count > 1
+        assert 1 < in_flight["peak"] <= 3
+
+    def test_short_text_is_not_chunked(self, runtime, long_text):
+        engine = MagicMock(spec=["refine", "get_runtime_summary", "supports_cancellation"])
+        engine.supports_cancellation = False
+        engine.refine.side_effect = lambda text, **kw: self._result(text)
+        runtime._engine = engine
+
+        runtime.refine_text_sync(self.SENTENCE)
+
+        engine.refine.assert_called_once()
+        assert engine.refine.call_args.args[0] == self.SENTENCE
+
 
 # ── generate_custom_sync ──────────────────────────────────────────────────
 
@@ -427,6 +709,42 @@ class TestGenerateCustomSync:
         assert result == "generated"
         assert runtime.state is SLMState.READY
 
+    def test_background_generation_is_deferred_not_dropped(self, fresh_settings, callbacks, monkeypatch):
+        from src.refinement.providers import GenerationTaskKind
+        from src.services.slm_scheduler import SLMJobPriority, SLMScheduler
+
+        monkeypatch.setattr(SLMRuntime, "_CUSTOM_QUEUE_DEADLINE", 0.05)
+        scheduler = SLMScheduler(idle_backfill_s=0.0)
+        runtime = SLMRuntime(settings_provider=lambda: fresh_settings, scheduler=scheduler, **callbacks)
+        mock_engine = MagicMock()
+        mock_engine.generate_custom.return_value = MagicMock(content="A Title")
+        runtime._engine = mock_engine
+        release = threading.Event()
+        started = threading.Event()
+        runtime.submit_job(lambda: (started.set(), release.wait(5)), priority=SLMJobPriority.BULK, label="bulk")
+        assert started.wait(2)
+
+        result: list[str] = []
+        caller = threading.Thread(
+            target=lambda: result.append(
+                runtime.generate_custom_sync("system", "prompt", task_kind=GenerationTaskKind.TITLE)
+            )
+        )
+        caller.start()
+        try:
+            deadline = threading.Event()
+            for _ in range(200):
+                if runtime.get_scheduler_metrics()["deferred"]:
+                    break
+                deadline.wait(0.01)
+            assert runtime.get_scheduler_metrics()["backfill_depth"] == 1
+        finally:
+            release.set()
+            caller.join(5)
+            scheduler.shutdown()
+
+        assert result == ["A Title"]
+
 
 class TestTimingLogs:
     def test_refine_text_sync_logs_timing_context(self, runtime, caplog):
@@ -474,12 +792,13 @@ class TestChangeModel:
     """change_model tears down and optionally re-enables."""
 
     def test_change_model_disables_and_re_enables(self, runtime, fresh_settings):
-        """When refinement.enabled=True, changing model re-enables."""
+        """When refinement.enabled=True and hot-swap is off, changing model re-enables."""
         fresh_settings.refinement.enabled = True
         runtime._state = SLMState.READY
         runtime._engine = MagicMock()
 
         with (
+            patch.object(runtime, "can_hot_swap", return_value=False),
             patch.object(runtime, "enable") as mock_enable,
             patch.object(runtime, "_settings_updater") as mock_updater,
         ):
@@ -489,6 +808,24 @@ class TestChangeModel:
         assert runtime.state is SLMState.DISABLED
         mock_enable.assert_called_once()
 
+    def test_change_model_hot_swaps_when_there_is_room(self, runtime, fresh_settings):
+        """With hot-swap on, the old engine keeps serving while the new one loads."""
+        fresh_settings.refinement.enabled = True
+        runtime._state = SLMState.READY
+        runtime._engine = MagicMock()
+
+        with (
+            patch.object(runtime, "hot_swap") as mock_hot_swap,
+            patch.object(runtime, "_settings_updater"),
+        ):
+            runtime.change_model("new-model-id")
+            for thread in threading.enumerate():
+                if thread.name == "slm-hot-swap":
+                    thread.join(timeout=5)
+
+        mock_hot_swap.assert_called_once()
+        assert runtime.state is SLMState.READY
+
     def test_change_model_stays_disabled_when_not_enabled(self, runtime, fresh_settings):
         """When refinement.enabled=False, changing model stays disabled."""
         fresh_settings.refinement.enabled = False
@@ -0,0 +1,292 @@
+"""
+SLMScheduler tests.
+
+Priority ordering, coalescing, deadlines (fail/defer), the idle backfill lane,
+preemption/requeue, inline execution from the worker, and metrics.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.services.slm_scheduler import SLMJobExpired, SLMJobPreempted, SLMJobPriority, SLMScheduler
+
+
+@pytest.fixture()
+def scheduler():
+    sched = SLMScheduler(idle_backfill_s=0.0)
+    yield sched
+    sched.shutdown()
+
+
+def _block(scheduler: SLMScheduler) -> threading.Event:
+    """Occupy the worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def _job() -> None:
+        started.set()
+        release.wait(5)
+
+    scheduler.submit(_job, priority=SLMJobPriority.INTERACTIVE_REFINE, label="blocker")
+    assert started.wait(2)
+    return release
+
+
+class TestPriorityOrdering:
+    def test_jobs_run_in_priority_order(self, scheduler):
+        release = _block(scheduler)
+        order: list[str] = []
+
+        for name, priority in [
+            ("bulk", SLMJobPriority.BULK),
+            ("insight", SLMJobPriority.INSIGHT),
+            ("retitle", SLMJobPriority.RETITLE),
+            ("auto", SLMJobPriority.AUTO_REFINE),
+            ("interactive", SLMJobPriority.INTERACTIVE_REFINE),
+        ]:
+            scheduler.submit(lambda name=name: order.append(name), priority=priority, label=name)
+
+        release.set()
+        assert scheduler.wait_idle(2)
+        assert order == ["interactive", "auto", "retitle", "insight", "bulk"]
+
+    def test_fifo_within_a_lane(self, scheduler):
+        release = _block(scheduler)
+        order: list[int] = []
+        for i in range(4):
+            scheduler.submit(lambda i=i: order.append(i), priority=SLMJobPriority.RETITLE)
+
+        release.set()
+        assert scheduler.wait_idle(2)
+        assert order == [0, 1, 2, 3]
+
+    def test_future_carries_result_and_exception(self, scheduler):
+        ok = scheduler.submit(lambda: 42, priority=SLMJobPriority.BULK)
+        bad = scheduler.submit(lambda: 1 / 0, priority=SLMJobPriority.BULK)
+
+        assert ok.result(2) == 42
+        with pytest.raises(ZeroDivisionError):
+            bad.result(2)
+
+
+class TestCoalescing:
+    def test_pending_job_with_same_key_is_replaced(self, scheduler):
+        release = _block(scheduler)
+        calls: list[str] = []
+
+        retitle = SLMJobPriority.RETITLE
+        first = scheduler.submit(lambda: calls.append("old") or "old", priority=retitle, coalesce_key="k")
+        second = scheduler.submit(lambda: calls.append("new") or "new", priority=retitle, coalesce_key="k")
+
+        release.set()
+        assert first.result(2) == "new"
+        assert second.result(2) == "new"
+        assert calls == ["new"]
+        assert scheduler.metrics()["coalesced"] == 1
+
+    def test_coalescing_keeps_the_most_urgent_priority(self, scheduler):
+        release = _block(scheduler)
+        order: list[str] = []
+
+        scheduler.submit(lambda: order.append("insight"), priority=SLMJobPriority.INSIGHT)
+        scheduler.submit(lambda: order.append("k"), priority=SLMJobPriority.BULK, coalesce_key="k")
+        scheduler.submit(lambda: order.append("k"), priority=SLMJobPriority.RETITLE, coalesce_key="k")
+
+        release.set()
+        assert scheduler.wait_idle(2)
+        assert order == ["k", "insight"]
+
+
+class TestDeadlines:
+    def test_expired_job_fails_with_timeout(self, scheduler):
+        release = _block(scheduler)
+        future = scheduler.submit(lambda: "late", priority=SLMJobPriority.BULK, deadline_s=0.05)
+
+        with pytest.raises(SLMJobExpired):
+            future.result(2)
+        release.set()
+        assert isinstance(future.exception(), TimeoutError)
+        assert scheduler.metrics()["expired"] == 1
+
+    def test_deferred_job_runs_in_backfill_lane(self, scheduler):
+        release = _block(scheduler)
+        future = scheduler.submit(
+            lambda: "eventually",
+            priority=SLMJobPriority.INSIGHT,
+            deadline_s=0.05,
+            on_expire="defer",
+        )
+
+        deadline = time.monotonic() + 2
+        while scheduler.metrics()["backfill_depth"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert scheduler.metrics()["backfill_depth"] == 1
+        assert not future.done()
+
+        release.set()
+        assert future.result(2) == "eventually"
+        assert scheduler.metrics()["deferred"] == 1
+
+
+class TestBackfill:
+    def test_backfill_waits_for_idle_period_and_yields_to_foreground(self):
+        scheduler = SLMScheduler(idle_backfill_s=0.2)
+        try:
+            release = _block(scheduler)
+            order: list[str] = []
+            scheduler.submit(
+                lambda: order.append("backfill"),
+                priority=SLMJobPriority.RETITLE,
+                deadline_s=0.0,
+                on_expire="defer",
+            )
+            scheduler.submit(lambda: order.append("bulk"), priority=SLMJobPriority.BULK)
+
+            release.set()
+            assert scheduler.wait_idle(2, include_deferred=False)
+            assert order == ["bulk"]
+
+            assert scheduler.wait_idle(2)
+            assert order == ["bulk", "backfill"]
+        finally:
+            scheduler.shutdown()
+
+
+class TestPreemption:
+    @staticmethod
+    def _background_job(scheduler: SLMScheduler, started: threading.Event, runs: list[str]):
+        """A job that polls for preemption like a token loop, then finishes on its re-run."""
+
+        def job() -> str:
+            runs.append("bulk")
+            started.set()
+            if len(runs) == 1:
+                deadline = time.monotonic() + 2
+                while not scheduler.preempt_requested():
+                    assert time.monotonic() < deadline
+                    time.sleep(0.001)
+                raise SLMJobPreempted()
+            return "bulk-done"
+
+        return job
+
+    def test_interactive_job_preempts_and_background_is_requeued(self, scheduler):
+        started = threading.Event()
+        runs: list[str] = []
+        bulk = scheduler.submit(
+            self._background_job(scheduler, started, runs), priority=SLMJobPriority.BULK, preemptible=True
+        )
+        assert started.wait(2)
+
+        interactive = scheduler.submit(
+            lambda: runs.append("interactive") or "ok", priority=SLMJobPriority.INTERACTIVE_REFINE
+        )
+
+        assert interactive.result(2) == "ok"
+        assert bulk.result(2) == "bulk-done"
+        assert runs == ["bulk", "interactive", "bulk"]
+        metrics = scheduler.metrics()
+        assert metrics["preempted"] == 1
+        assert metrics["wait_ms_by_priority"]["bulk"]["count"] == 1
+
+    def test_requeued_job_runs_ahead_of_later_jobs_in_its_lane(self, scheduler):
+        started = threading.Event()
+        runs: list[str] = []
+        scheduler.submit(self._background_job(scheduler, started, runs), priority=SLMJobPriority.BULK, preemptible=True)
+        assert started.wait(2)
+        scheduler.submit(lambda: runs.append("bulk-2"), priority=SLMJobPriority.BULK)
+        scheduler.submit(lambda: runs.append("interactive"), priority=SLMJobPriority.INTERACTIVE_REFINE)
+
+        assert scheduler.wait_idle(2)
+        assert runs == ["bulk", "interactive", "bulk", "bulk-2"]
+
+    def test_non_preemptible_and_lower_priority_work_do_not_preempt(self, scheduler):
+        release = _block(scheduler)
+        assert not scheduler.preempt_requested()
+
+        scheduler.submit(lambda: None, priority=SLMJobPriority.INTERACTIVE_REFINE)
+        assert not scheduler.preempt_requested()
+        release.set()
+        assert scheduler.wait_idle(2)
+
+        started = threading.Event()
+        hold = threading.Event()
+
+        def background() -> None:
+            started.set()
+            hold.wait(2)
+
+        scheduler.submit(background, priority=SLMJobPriority.RETITLE, preemptible=True)
+        assert started.wait(2)
+        scheduler.submit(lambda: None, priority=SLMJobPriority.INSIGHT)
+        assert not scheduler.preempt_requested()
+        hold.set()
+        assert scheduler.wait_idle(2)
+
+    def test_shutdown_fails_a_requeued_job(self, scheduler):
+        started = threading.Event()
+        runs: list[str] = []
+        bulk = scheduler.submit(
+            self._background_job(scheduler, started, runs), priority=SLMJobPriority.BULK, preemptible=True
+        )
+        assert started.wait(2)
+
+        interactive = scheduler.submit(lambda: scheduler.shutdown() or "ok", priority=SLMJobPriority.INTERACTIVE_REFINE)
+
+        assert interactive.result(2) == "ok"
+        with pytest.raises(RuntimeError, match="shut down"):
+            bulk.result(2)
+        assert runs == ["bulk"]
+
+    def test_stray_preempted_exception_fails_the_job(self, scheduler):
+        def job() -> None:
+            raise SLMJobPreempted()
+
+        future = scheduler.submit(job, priority=SLMJobPriority.BULK, preemptible=True)
+        with pytest.raises(RuntimeError, match="without a preemption request"):
+            future.result(2)
+
+
+class TestWorkerReentry:
+    def test_submit_from_worker_runs_inline(self, scheduler):
+        def outer() -> str:
+            assert scheduler.in_worker()
+            return scheduler.submit(lambda: "inner", priority=SLMJobPriority.BULK).result(0)
+
+        assert scheduler.submit(outer, priority=SLMJobPriority.INTERACTIVE_REFINE).result(2) == "inner"
+
+
+class TestMetricsAndShutdown:
+    def test_metrics_report_depth_and_waits(self, scheduler):
+        release = _block(scheduler)
+        scheduler.submit(lambda: None, priority=SLMJobPriority.BULK)
+        scheduler.submit(lambda: None, priority=SLMJobPriority.RETITLE)
+
+        metrics = scheduler.metrics()
+        assert metrics["queue_depth"] == 2
+        assert metrics["queue_depth_by_priority"]["bulk"] == 1
+        assert metrics["queue_depth_by_priority"]["retitle"] == 1
+        assert metrics["running"] == "blocker"
+
+        release.set()
+        assert scheduler.wait_idle(2)
+        metrics = scheduler.metrics()
+        assert metrics["queue_depth"] == 0
+        assert metrics["completed"] == 3
+        assert metrics["wait_ms_by_priority"]["bulk"]["count"] == 1
+
+    def test_shutdown_cancels_pending_and_rejects_new_work(self):
+        scheduler = SLMScheduler()
+        release = _block(scheduler)
+        pending = scheduler.submit(lambda: None, priority=SLMJobPriority.BULK)
+
+        scheduler.shutdown()
+        release.set()
+
+        assert pending.cancelled()
+        with pytest.raises(RuntimeError, match="shut down"):
+            scheduler.submit(lambda: None, priority=SLMJobPriority.BULK).result(1)
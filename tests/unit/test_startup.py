@@ -0,0 +1,267 @@
+"""
+Staged startup tests.
+
+Readiness futures and stage tracing, intents waiting on a component that
+is still loading instead of failing, and the coordinator opening its window
+before the models finish loading.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from src.core.command_bus import CommandBus
+from src.core.handlers.recording_handlers import RecordingSession
+from src.core.handlers.refinement_handlers import RefinementHandlers
+from src.core.intents.definitions import BeginRecordingIntent, RefineTranscriptIntent, StopRecordingIntent
+from src.core.startup import ASR, RECOVERY, SLM, VAD, StartupReadiness, StartupTrace, run_stage
+
+
+def _run_stage(name, fn, readiness, events, **kwargs) -> threading.Thread:
+    return run_stage(
+        name,
+        fn,
+        trace=kwargs.pop("trace", StartupTrace()),
+        readiness=readiness,
+        emit=lambda event, data: events.append((event, data)),
+        **kwargs,
+    )
+
+
+class TestReadiness:
+    def test_only_expected_components_block(self):
+        readiness = StartupReadiness()
+        readiness.expect(ASR)
+
+        assert readiness.is_settled(SLM) is True and readiness.wait(SLM) is True
+        assert readiness.is_settled(ASR) is False
+        assert readiness.wait(ASR, timeout=0.01) is None
+
+    def test_waiters_see_the_result_once_settled(self):
+        readiness = StartupReadiness()
+        readiness.expect(ASR)
+        results: list[bool | None] = []
+        waiter = threading.Thread(target=lambda: results.append(readiness.wait(ASR, timeout=5)))
+        waiter.start()
+
+        readiness.settle(ASR, False)
+        readiness.settle(ASR, True)  # later settles are ignored
+        waiter.join(5)
+
+        assert results == [False]
+        assert readiness.snapshot() == {ASR: "failed"}
+
+    def test_deferred_work_runs_after_settling(self):
+        readiness = StartupReadiness()
+        readiness.expect(SLM)
+        ran = threading.Event()
+
+        readiness.when_settled(SLM, ran.set)
+        assert not ran.wait(0.05)
+        readiness.settle_all()
+
+        assert ran.wait(5)
+
+
+class TestRunStage:
+    def test_stage_waits_for_dependencies_and_reports_progress(self):
+        readiness = StartupReadiness()
+        readiness.expect(ASR, "calibration")
+        trace = StartupTrace()
+        events: list[tuple[str, dict]] = []
+
+        thread = _run_stage("calibration", lambda: None, readiness, events, trace=trace, after=(ASR,))
+        time.sleep(0.05)
+        assert events == []  # still waiting for ASR
+        readiness.settle(ASR)
+        thread.join(5)
+
+        assert [data["status"] for _, data in events] == ["loading", "ready"]
+        assert readiness.snapshot()["calibration"] == "ready"
+        stage = trace.to_dict()["stages"][0]
+        assert stage["name"] == "calibration" and stage["duration_ms"] >= 0 and stage["error"] is None
+
+    def test_failures_settle_and_are_traced(self):
+        readiness = StartupReadiness()
+        readiness.expect(VAD)
+        trace = StartupTrace()
+        events: list[tuple[str, dict]] = []
+
+        def boom() -> None:
+            raise RuntimeError("no onnxruntime")
+
+        _run_stage(VAD, boom, readiness, events, trace=trace).join(5)
+
+        assert readiness.wait(VAD) is False
+        assert events[-1][1] == {"component": VAD, "status": "error"}
+        assert trace.to_dict()["stages"][0]["error"] == "no onnxruntime"
+
+
+class TestIntentsWait:
+    def test_dictation_waits_for_the_startup_asr_load(self):
+        readiness = StartupReadiness()
+        readiness.expect(ASR)
+        session = RecordingSession(
+            audio_service_provider=lambda: None,
+            settings_provider=MagicMock(),
+            db_provider=lambda: None,
+            event_bus_emit=MagicMock(),
+            shutdown_event=threading.Event(),
+            insight_manager_provider=lambda: None,
+            readiness=readiness,
+        )
+        results: list[bool] = []
+        try:
+            with patch("src.services.transcription_service.create_local_model") as create:
+                waiter = threading.Thread(
+                    target=lambda: results.append(session._ensure_asr_model_loaded(MagicMock(), None, None))
+                )
+                waiter.start()
+                time.sleep(0.05)
+                assert results == []  # blocked on startup, not loading its own copy
+                session._asr_model = object()
+                readiness.settle(ASR)
+                waiter.join(5)
+
+            assert results == [True]
+            create.assert_not_called()
+        finally:
+            session.asr_scheduler.shutdown()
+
+    def _deferred_session(self, readiness: StartupReadiness) -> tuple[RecordingSession, CommandBus, MagicMock]:
+        emit = MagicMock()
+        session = RecordingSession(
+            audio_service_provider=MagicMock(return_value=None),
+            settings_provider=MagicMock(),
+            db_provider=lambda: None,
+            event_bus_emit=emit,
+            shutdown_event=threading.Event(),
+            insight_manager_provider=lambda: None,
+            readiness=readiness,
+        )
+        bus = CommandBus()
+        bus.register(BeginRecordingIntent, session.handle_begin)
+        bus.register(StopRecordingIntent, session.handle_stop)
+        return session, bus, emit
+
+    def test_begin_recording_during_recovery_returns_without_blocking(self):
+        readiness = StartupReadiness()
+        readiness.expect(RECOVERY)
+        session, bus, emit = self._deferred_session(readiness)
+        try:
+            started = time.perf_counter()
+            assert bus.dispatch(BeginRecordingIntent())
+            assert time.perf_counter() - started < 1.0
+            session._audio_service_provider.assert_not_called()
+            assert emit.call_args.args[0] == "engine_status"
+            assert emit.call_args.args[1]["component"] == RECOVERY
+            assert emit.call_args.args[1]["status"] == "loading"
+
+            readiness.settle(RECOVERY)
+            deadline = time.monotonic() + 5
+            while not session._audio_service_provider.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            session._audio_service_provider.assert_called_once()
+        finally:
+            session.asr_scheduler.shutdown()
+
+    def test_stop_drops_a_recording_deferred_by_recovery(self):
+        readiness = StartupReadiness()
+        readiness.expect(RECOVERY)
+        session, bus, _ = self._deferred_session(readiness)
+        try:
+            bus.dispatch(BeginRecordingIntent())
+            bus.dispatch(StopRecordingIntent())
+            readiness.settle(RECOVERY)
+            time.sleep(0.1)
+
+            session._audio_service_provider.assert_not_called()
+        finally:
+            session.asr_scheduler.shutdown()
+
+    def test_refinement_is_deferred_until_the_slm_settles(self, fresh_settings):
+        readiness = StartupReadiness()
+        readiness.expect(SLM)
+        runtime = MagicMock()
+        emit = MagicMock()
+        handlers = RefinementHandlers(
+            db_provider=MagicMock,
+            slm_runtime_provider=lambda: runtime,
+            settings_provider=lambda: fresh_settings,
+            event_bus_emit=emit,
+            readiness=readiness,
+        )
+        intent = RefineTranscriptIntent(transcript_id=1, level=1)
+        validations = iter([(runtime, "Refinement model is loading"), (runtime, "Refinement model failed")])
+        ran = threading.Event()
+
+        with patch.object(handlers, "_validate_slm_ready", side_effect=lambda *_: next(validations)):
+            with patch.object(handlers, "_fallback_raw_clipboard", side_effect=lambda _id: ran.set()):
+                handlers.handle_refine(intent)
+                emit.assert_not_called()  # deferred, not failed
+                readiness.settle(SLM, False)
+                assert ran.wait(5)
+
+        emit.assert_called_once_with("refinement_error", {"message": "Refinement model failed"})
+
+
+class TestTimeToWindow:
+    def _start(self, tmp_path, monkeypatch, load_seconds: float) -> dict:
+        from src.core.application_coordinator import ApplicationCoordinator
+        from src.core.settings import init_settings, reset_for_tests
+
+        for name in ("DATA", "CACHE", "CONFIG", "LOG"):
+            monkeypatch.setenv(f"VOCIFEROUS_{name}_DIR", str(tmp_path / f"{name.lower()}-{load_seconds}"))
+        reset_for_tests()
+        settings = init_settings(config_path=tmp_path / f"settings-{load_seconds}.json")
+        settings = settings.model_copy(update={"refinement": settings.refinement.model_copy(update={"enabled": False})})
+        coordinator = ApplicationCoordinator(settings)
+        window: dict = {}
+
+        def load_asr(self) -> None:
+            time.sleep(load_seconds)
+            self._asr_model = object()
+
+        def open_window() -> None:
+            window["ms"] = coordinator.startup_trace.milestone_ms("window_open")
+            window["asr_settled"] = coordinator.readiness.is_settled(ASR)
+
+        try:
+            with (
+                patch.object(RecordingSession, "load_asr_model", load_asr),
+                patch.object(RecordingSession, "load_vad_model"),
+                patch.object(RecordingSession, "is_vad_loaded", True),
+                patch("src.core.runtime.services.init_hardware_calibrator"),
+                patch.object(coordinator, "_init_audio_service"),
+                patch.object(coordinator, "_init_input_handler"),
+                patch.object(coordinator, "_start_api_server"),
+                patch.object(coordinator, "_wait_for_server"),
+                patch.object(coordinator, "_open_window", side_effect=open_window),
+            ):
+                coordinator.start()
+                assert coordinator.readiness.wait(ASR, timeout=10) is True
+                assert coordinator.readiness.wait("calibration", timeout=10) is True
+            window["trace"] = coordinator.startup_trace.to_dict()
+            window["readiness"] = coordinator.readiness.snapshot()
+        finally:
+            coordinator.shutdown(close_windows=False)
+            coordinator._do_cleanup()
+            reset_for_tests()
+        return window
+
+    def test_window_opens_before_the_models_finish_loading(self, tmp_path, monkeypatch):
+        window = self._start(tmp_path, monkeypatch, 1.5)
+
+        assert window["asr_settled"] is False and window["ms"] < 1500
+        stages = {stage["name"]: stage for stage in window["trace"]["stages"]}
+        assert {"database", "services", "api_server", "recovery", ASR, VAD, SLM, "calibration"} <= set(stages)
+        assert stages[ASR]["duration_ms"] >= 1400 and stages[ASR]["thread"] == "startup-asr"
+        assert set(window["readiness"].values()) == {"ready"}
+
+    def test_time_to_window_does_not_depend_on_model_size(self, tmp_path, monkeypatch):
+        small = self._start(tmp_path, monkeypatch, 0.1)["ms"]
+        large = self._start(tmp_path, monkeypatch, 1.5)["ms"]
+
+        assert large < small + 500
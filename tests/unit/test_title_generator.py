@@ -19,6 +19,7 @@ from src.core.constants import TitleGeneration
 from src.core.title_generator import TitleGenerator
 from src.database.db import TranscriptDB
 from src.refinement.providers import GenerationTaskKind, ReasoningPolicy
+from src.services.slm_scheduler import SLMJobPriority, SLMScheduler
 from src.services.slm_types import SLMState
 
 # ---------------------------------------------------------------------------
@@ -33,11 +34,24 @@ def db(tmp_path: Path) -> Generator[TranscriptDB, None, None]:
     database.close()
 
 
+_SCHEDULERS: list[SLMScheduler] = []
+
+
+@pytest.fixture()
+def scheduler() -> Generator[SLMScheduler, None, None]:
+    sched = SLMScheduler(idle_backfill_s=0.0)
+    _SCHEDULERS.append(sched)
+    yield sched
+    _SCHEDULERS.remove(sched)
+    sched.shutdown()
+
+
 @pytest.fixture()
-def mock_slm() -> MagicMock:
+def mock_slm(scheduler) -> MagicMock:
     slm = MagicMock()
     slm.state = SLMState.READY
     slm.generate_custom_sync.return_value = "Generated Title"
+    slm.submit_job.side_effect = lambda fn, **kw: scheduler.submit(fn, **kw)
     return slm
 
 
@@ -63,11 +77,10 @@ def generator(db, mock_slm, emitted_events) -> TitleGenerator:
 # ---------------------------------------------------------------------------
 
 
-def _wait_for_threads(prefix: str, timeout: float = 5.0) -> None:
-    """Wait for all background threads with the given name prefix to finish."""
-    for t in threading.enumerate():
-        if t.name.startswith(prefix) and t.is_alive():
-            t.join(timeout=timeout)
+def _wait_for_jobs(timeout: float = 5.0) -> None:
+    """Wait for every queued title job on the test schedulers to finish."""
+    for sched in list(_SCHEDULERS):
+        sched.wait_idle(timeout=timeout)
 
 
 # ---------------------------------------------------------------------------
@@ -81,14 +94,14 @@ class TestScheduleGuards:
     def test_text_too_short_skips(self, generator, mock_slm):
         """Text shorter than MIN_TEXT_CHARS is not scheduled."""
         generator.schedule(1, "x" * (TitleGeneration.MIN_TEXT_CHARS - 1))
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
         mock_slm.generate_custom_sync.assert_not_called()
 
     def test_text_at_minimum_length_proceeds(self, generator, mock_slm, db, emitted_events):
         """Text exactly at MIN_TEXT_CHARS should be scheduled."""
         t = db.add_transcript(raw_text="x" * TitleGeneration.MIN_TEXT_CHARS, duration_ms=1000)
         generator.schedule(t.id, "x" * TitleGeneration.MIN_TEXT_CHARS)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
         mock_slm.generate_custom_sync.assert_called_once()
 
     def test_slm_none_skips(self, db, emitted_events):
@@ -99,7 +112,7 @@ class TestScheduleGuards:
             event_emitter=lambda *a: emitted_events.append(a),
         )
         gen.schedule(1, "x" * 200)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
         assert len(emitted_events) == 0
 
     def test_busy_slm_still_queues_title_generation(self, generator, mock_slm, db):
@@ -109,31 +122,46 @@ class TestScheduleGuards:
         mock_slm.generate_custom_sync.return_value = "Queued Title"
 
         generator.schedule(t.id, "x" * 200)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
 
         mock_slm.generate_custom_sync.assert_called_once()
         assert db.get_transcript(t.id).display_name == "Queued Title"
 
-    def test_duplicate_transcript_id_skips(self, generator, mock_slm, db):
-        """A second schedule() for the same transcript ID is rejected while in-flight."""
-        # Block the first call so the second hits the dedup guard
-        barrier = threading.Event()
-        original_generate = mock_slm.generate_custom_sync
+    def test_rescheduling_a_queued_transcript_supersedes_it(self, generator, mock_slm, scheduler, db):
+        """A second schedule() for a transcript whose job has not started replaces that job."""
+        busy = threading.Event()
+        scheduler.submit(lambda: busy.wait(timeout=5), priority=SLMJobPriority.INTERACTIVE_REFINE)
+
+        t = db.add_transcript(raw_text="x" * 200, duration_ms=1000)
+        generator.schedule(t.id, "a" * 200)
+        generator.schedule(t.id, "b" * 200)
+        busy.set()
+        _wait_for_jobs()
+
+        mock_slm.generate_custom_sync.assert_called_once()
+        assert mock_slm.generate_custom_sync.call_args.kwargs["user_prompt"] == "b" * 200
+
+    def test_rescheduling_while_titling_queues_another_pass(self, generator, mock_slm, db):
+        """Text that changes while a title is being generated is titled again afterwards."""
+        started, release = threading.Event(), threading.Event()
+        prompts: list[str] = []
 
         def slow_generate(**kwargs):
-            barrier.wait(timeout=5)
-            return original_generate(**kwargs)
+            prompts.append(kwargs["user_prompt"])
+            started.set()
+            release.wait(timeout=5)
+            return "Generated Title"
 
-        mock_slm.generate_custom_sync = slow_generate
+        mock_slm.generate_custom_sync.side_effect = slow_generate
 
         t = db.add_transcript(raw_text="x" * 200, duration_ms=1000)
-        generator.schedule(t.id, "x" * 200)
-        generator.schedule(t.id, "x" * 200)  # should be rejected
-        barrier.set()
-        _wait_for_threads("title-gen-")
+        generator.schedule(t.id, "a" * 200)
+        assert started.wait(timeout=5)
+        generator.schedule(t.id, "b" * 200)
+        release.set()
+        _wait_for_jobs()
 
-        # Only one call should have gone through
-        assert original_generate.call_count == 1
+        assert prompts == ["a" * 200, "b" * 200]
 
 
 # ---------------------------------------------------------------------------
@@ -150,7 +178,7 @@ class TestGenerateTask:
         mock_slm.generate_custom_sync.return_value = "My Great Title"
 
         generator.schedule(t.id, "x" * 200)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
 
         refreshed = db.get_transcript(t.id)
         assert refreshed.display_name == "My Great Title"
@@ -165,7 +193,7 @@ class TestGenerateTask:
         mock_slm.generate_custom_sync.return_value = ""
 
         generator.schedule(t.id, "x" * 200)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
 
         refreshed = db.get_transcript(t.id)
         assert refreshed.display_name is None
@@ -177,7 +205,7 @@ class TestGenerateTask:
         mock_slm.generate_custom_sync.return_value = '"Quoted Title"'
 
         generator.schedule(t.id, "x" * 200)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
 
         assert db.get_transcript(t.id).display_name == "Quoted Title"
 
@@ -187,7 +215,7 @@ class TestGenerateTask:
         mock_slm.generate_custom_sync.return_value = "Good Title\nBut this is junk"
 
         generator.schedule(t.id, "x" * 200)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
 
         assert db.get_transcript(t.id).display_name == "Good Title"
 
@@ -200,7 +228,7 @@ class TestGenerateTask:
         )
 
         generator.schedule(t.id, "x" * 200)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
 
         assert db.get_transcript(t.id).display_name is None
         assert len([e for et, e in emitted_events if et == "transcript_updated"]) == 0
@@ -223,27 +251,21 @@ class TestGenerateTask:
         )
 
         gen.schedule(1, "x" * 200)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
         # Should not crash, no event emitted
         assert len([e for et, e in emitted_events if et == "transcript_updated"]) == 0
 
-    def test_pending_set_cleared_after_generation(self, generator, mock_slm, db):
-        """The transcript ID is removed from _pending after generation completes."""
-        t = db.add_transcript(raw_text="x" * 200, duration_ms=1000)
-        generator.schedule(t.id, "x" * 200)
-        _wait_for_threads("title-gen-")
-
-        assert t.id not in generator._pending
-
-    def test_pending_set_cleared_on_exception(self, generator, mock_slm, db):
-        """The transcript ID is removed from _pending even if generation throws."""
+    def test_failed_generation_can_be_scheduled_again(self, generator, mock_slm, db):
+        """A transcript whose title job failed is titled by the next schedule()."""
         t = db.add_transcript(raw_text="x" * 200, duration_ms=1000)
-        mock_slm.generate_custom_sync.side_effect = RuntimeError("boom")
+        mock_slm.generate_custom_sync.side_effect = [RuntimeError("boom"), "Second Try"]
 
         generator.schedule(t.id, "x" * 200)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
+        generator.schedule(t.id, "x" * 200)
+        _wait_for_jobs()
 
-        assert t.id not in generator._pending
+        assert db.get_transcript(t.id).display_name == "Second Try"
 
     def test_long_text_truncated_to_max(self, generator, mock_slm, db, emitted_events):
         """Input text longer than MAX_TEXT_CHARS is truncated before SLM call."""
@@ -251,7 +273,7 @@ class TestGenerateTask:
         t = db.add_transcript(raw_text=huge_text, duration_ms=1000)
 
         generator.schedule(t.id, huge_text)
-        _wait_for_threads("title-gen-")
+        _wait_for_jobs()
 
         call_kwargs = mock_slm.generate_custom_sync.call_args
         passed_text = call_kwargs.kwargs["user_prompt"]
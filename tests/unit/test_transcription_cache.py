@@ -0,0 +1,226 @@
+"""
+Transcription result cache tests.
+
+Covers the SQLite LRU store (keying, eviction, hashing) and how
+RecordingSession consults it: re-transcription, imports and recovery skip
+ASR on a hit and record the cached provenance, dictation never looks it up.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.core.handlers.recording_handlers import RecordingSession
+from src.core.settings import VociferousSettings
+from src.database.db import TranscriptDB
+from src.services.asr_scheduler import ASRJobPriority
+from src.services.audio_import import ImportTranscription
+from src.services.transcription_cache import (
+    CachedTranscription,
+    TranscriptionCacheKey,
+    TranscriptionResultCache,
+    hash_audio,
+    hash_file,
+)
+from src.services.transcription_service import describe_transcription_capture
+
+
+def _settings(**model) -> VociferousSettings:
+    settings = VociferousSettings()
+    return settings.model_copy(update={"model": settings.model.model_copy(update=model)})
+
+
+def _key(digest: str = "a" * 64, settings: VociferousSettings | None = None) -> TranscriptionCacheKey:
+    settings = settings or VociferousSettings()
+    return TranscriptionCacheKey.build(digest, settings, describe_transcription_capture(settings))
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    store = TranscriptionResultCache(tmp_path / "results.sqlite3")
+    yield store
+    store.close()
+
+
+class TestTranscriptionResultCache:
+    def test_round_trip_keeps_text_and_durations(self, cache):
+        cache.put(_key(), CachedTranscription("Hello there.", 900, 1200, 350), max_entries=10)
+
+        assert cache.get(_key()) == CachedTranscription("Hello there.", 900, 1200, 350)
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 0}
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"model": "small-en"},
+            {"compute_type": "float16"},
+            {"language": "de"},
+            {"initial_prompt": "Use medical terminology."},
+            {"batch_size": 4},
+            {"provider": "groq"},
+        ],
+    )
+    def test_any_model_setting_change_misses(self, cache, change):
+        cache.put(_key(), CachedTranscription("Hello."), max_entries=10)
+
+        assert cache.get(_key(settings=_settings(**change))) is None
+
+    def test_other_audio_or_vad_sensitivity_misses(self, cache):
+        cache.put(_key(), CachedTranscription("Hello."), max_entries=10)
+
+        assert cache.get(_key("b" * 64)) is None
+        assert cache.get(dataclasses.replace(_key(), vad_sensitivity="high")) is None
+        assert cache.get(dataclasses.replace(_key(), audio_source="file")) is None
+
+    def test_least_recently_used_entries_are_evicted(self, cache):
+        cache.put(_key("a"), CachedTranscription("A"), max_entries=2)
+        cache.put(_key("b"), CachedTranscription("B"), max_entries=2)
+        assert cache.get(_key("a")) is not None  # "b" is now least recently used
+
+        cache.put(_key("c"), CachedTranscription("C"), max_entries=2)
+
+        assert len(cache) == 2
+        assert cache.get(_key("b")) is None
+        assert cache.get(_key("a")) is not None and cache.get(_key("c")) is not None
+
+    def test_zero_max_entries_stores_nothing(self, cache):
+        cache.put(_key(), CachedTranscription("Hello."), max_entries=0)
+
+        assert len(cache) == 0
+
+    def test_hashes_depend_only_on_content(self, tmp_path):
+        audio = np.arange(32_000, dtype=np.int16)
+        assert hash_audio(audio) == hash_audio(audio.copy())
+        assert hash_audio(audio[::2]) == hash_audio(np.ascontiguousarray(audio[::2]))
+        assert hash_audio(audio) != hash_audio(audio[:-1])
+
+        first, second = tmp_path / "a.wav", tmp_path / "b.wav"
+        first.write_bytes(b"x" * 3_000_000)
+        second.write_bytes(b"x" * 3_000_000)
+        assert hash_file(first) == hash_file(second)
+
+
+# ---------------------------------------------------------------------------
+# RecordingSession integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def db(tmp_path):
+    database = TranscriptDB(db_path=tmp_path / "cache_test.db")
+    yield database
+    database.close()
+
+
+@pytest.fixture()
+def session(db, cache):
+    settings = VociferousSettings()
+    sess = RecordingSession(
+        audio_service_provider=lambda: None,
+        settings_provider=lambda: settings,
+        db_provider=lambda: db,
+        event_bus_emit=MagicMock(),
+        shutdown_event=threading.Event(),
+        insight_manager_provider=lambda: None,
+        transcription_cache=cache,
+    )
+    sess._asr_model = MagicMock()
+    sess._audio_pipeline = MagicMock()
+    yield sess
+    sess.asr_scheduler.shutdown()
+
+
+def _join(prefix: str) -> None:
+    for thread in threading.enumerate():
+        if thread.name.startswith(prefix) and thread.is_alive():
+            thread.join(timeout=5)
+
+
+class TestRecordingSessionCache:
+    def test_second_retranscription_is_served_from_cache_and_flagged(self, session, db, cache):
+        transcript = db.add_transcript(raw_text="original", duration_ms=2000)
+        session._audio_cache = MagicMock()
+        session._audio_cache.get_path.return_value = Path("/tmp/cached.wav")
+        audio = np.full(32_000, 7, dtype=np.int16)
+
+        with (
+            patch("src.core.handlers.recording_handlers._decode_audio_file_to_int16", return_value=audio),
+            patch("src.services.transcription_service.transcribe", return_value=("Retranscribed.", 1800, 900)) as asr,
+        ):
+            for _ in range(2):
+                session.handle_retranscribe(SimpleNamespace(transcript_id=transcript.id))
+                _join("retranscribe")
+
+        assert asr.call_count == 1
+        refreshed = db.get_transcript(transcript.id)
+        assert refreshed.normalized_text == "Retranscribed."
+        assert refreshed.retranscription_count == 2
+        assert refreshed.last_retranscription_cached is True
+        assert refreshed.last_retranscription_time_ms == 0
+        assert refreshed.last_retranscription_model_id == VociferousSettings().model.model
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_recovery_hits_the_cache_but_dictation_does_not(self, session, db, cache):
+        audio = np.full(16_000, 3, dtype=np.int16)
+
+        with patch("src.services.transcription_service.transcribe", return_value=("Recovered.", 900, 400)) as asr:
+            session._transcribe_and_store(audio, asr_priority=ASRJobPriority.RECOVERY)
+            session._transcribe_and_store(audio, asr_priority=ASRJobPriority.RECOVERY)
+            session._transcribe_and_store(audio)
+
+        assert asr.call_count == 2
+        stored, _ = db.recent(limit=10)
+        assert sorted(t.transcription_cached for t in stored) == [False, False, True]
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_reimported_file_skips_asr(self, session, db, tmp_path):
+        path = tmp_path / "talk.wav"
+        path.write_bytes(b"same bytes")
+        result = ImportTranscription("Imported.", 4_000, 700, 5_000)
+
+        with patch("src.services.audio_import.transcribe_audio_file", return_value=result) as stream:
+            for _ in range(2):
+                session.handle_import(SimpleNamespace(file_path=str(path)))
+                _join("audio-import")
+
+        assert stream.call_count == 1
+        stored, _ = db.recent(limit=10)
+        assert sorted((t.transcription_cached, t.transcription_time_ms, t.duration_ms) for t in stored) == [
+            (False, 700, 5_000),
+            (True, 0, 5_000),
+        ]
+
+    def test_import_job_decodes_only_uncached_files_and_keeps_order(self, session, db, cache, tmp_path):
+        files = [tmp_path / name for name in ("one.wav", "two.wav", "three.wav")]
+        for index, path in enumerate(files):
+            path.write_bytes(f"audio {index}".encode())
+        settings = VociferousSettings()
+        capture = describe_transcription_capture(settings, local_model=session._asr_model)
+        for index in (0, 2):
+            key = TranscriptionCacheKey.build(hash_file(files[index]), settings, capture, audio_source="file")
+            cache.put(key, CachedTranscription(f"Cached {index}.", 1_000, 2_000, 300), max_entries=10)
+
+        def fake_stream(paths, settings, model, pipeline, *, on_progress, should_stop, asr_scheduler):
+            assert paths == [str(files[1])]
+            yield 0, ImportTranscription("Decoded 1.", 1_000, 500, 2_000)
+
+        with patch("src.services.audio_import.transcribe_audio_files", side_effect=fake_stream):
+            job_id = session.handle_import_batch(
+                SimpleNamespace(file_paths=tuple(str(p) for p in files), file_names=(), cleanup_source=False)
+            )["job_id"]
+            _join("audio-import")
+
+        job = db.get_import_job(job_id)
+        assert job.status == "completed"
+        stored = [db.get_transcript(file.transcript_id) for file in job.files]
+        assert [t.raw_text for t in stored] == ["Cached 0.", "Decoded 1.", "Cached 2."]
+        assert [t.transcription_cached for t in stored] == [True, False, True]
+        assert stored[0].id < stored[1].id < stored[2].id
+        assert len(cache) == 3
@@ -0,0 +1,139 @@
+"""Tests for src.services.transcription.long_form — batched decoding of long local audio."""
+
+from __future__ import annotations
+
+import sys
+import types
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.services.audio_pipeline import CleanSpeech
+from src.services.transcription.long_form import (
+    batched_pipeline,
+    speech_windows,
+    split_long_segments,
+    use_batched_decoding,
+)
+from src.services.transcription_service import transcribe
+
+SR = 16_000
+
+
+def _with_model(settings, **update):
+    return settings.model_copy(update={"model": settings.model.model_copy(update=update)})
+
+
+def _segment(seconds: float, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(int(seconds * SR)) / SR
+    return (amplitude * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+
+
+class TestUseBatchedDecoding:
+    def test_threshold_and_batch_size_gate_batching(self, fresh_settings):
+        settings = _with_model(fresh_settings, batched_min_seconds=60.0, batch_size=8)
+        assert use_batched_decoding(settings, 60 * SR) is True
+        assert use_batched_decoding(settings, 59 * SR) is False
+        assert use_batched_decoding(_with_model(settings, batched_min_seconds=0.0), 600 * SR) is False
+        assert use_batched_decoding(_with_model(settings, batch_size=1), 600 * SR) is False
+
+
+class TestSpeechWindows:
+    def test_short_segments_are_packed_into_windows(self):
+        parts, bounds, offset = [], [], 0
+        for _ in range(10):
+            parts += [_segment(8.0), np.zeros(int(0.3 * SR), dtype=np.float32)]
+            bounds.append((offset, offset + 8 * SR))
+            offset += 8 * SR + int(0.3 * SR)
+        audio = np.concatenate(parts)
+
+        windows = speech_windows(audio, bounds)
+
+        # Three 8 s segments fit a 30 s window; ten need four windows.
+        assert len(windows) == 4
+        assert windows[0]["start"] == 0.0 and windows[-1]["end"] == pytest.approx(len(audio) / SR)
+        assert all(w["end"] - w["start"] <= 30.0 for w in windows)
+        assert all(a["end"] == b["start"] for a, b in zip(windows, windows[1:]))
+
+    def test_long_segment_is_cut_at_its_quietest_frame(self):
+        audio = _segment(50.0)
+        dip = slice(int(27.0 * SR), int(27.2 * SR))
+        audio[dip] *= 0.01
+
+        pieces = split_long_segments(audio, [(0, len(audio))], 30 * SR, search_samples=5 * SR)
+
+        assert len(pieces) == 2
+        cut = pieces[0][1]
+        assert dip.start <= cut < dip.stop
+        assert pieces[1] == (cut, len(audio))
+
+    def test_without_bounds_the_recording_is_one_segment(self):
+        windows = speech_windows(_segment(70.0), None)
+        assert len(windows) == 3
+        assert all(w["end"] - w["start"] <= 30.0 for w in windows)
+
+
+class TestBatchedPipelineCache:
+    def test_pipeline_is_created_once_per_model(self, monkeypatch):
+        created = []
+
+        class DummyBatched:
+            def __init__(self, model):
+                created.append(model)
+
+        fake_module = types.SimpleNamespace(BatchedInferencePipeline=DummyBatched)
+        monkeypatch.setitem(sys.modules, "faster_whisper", fake_module)
+        model = types.SimpleNamespace()
+
+        assert batched_pipeline(model) is batched_pipeline(model)
+        assert created == [model]
+
+
+class TestTranscribeRouting:
+    @staticmethod
+    def _pipeline(seconds: float) -> MagicMock:
+        pipeline = MagicMock()
+        pipeline.process_speech.side_effect = lambda audio, **kw: CleanSpeech(
+            audio.astype(np.float32) / 32768.0, [(0, int(seconds * SR))]
+        )
+        return pipeline
+
+    @staticmethod
+    def _segments(text: str, end: float) -> tuple:
+        seg = MagicMock()
+        seg.text = text
+        seg.end = end
+        return iter([seg]), MagicMock()
+
+    def test_long_audio_uses_batched_pipeline(self, fresh_settings):
+        settings = _with_model(fresh_settings, batched_min_seconds=60.0, batch_size=4)
+        model = MagicMock()
+        batched = MagicMock()
+        batched.transcribe.return_value = self._segments("Long form.", 90.0)
+        model._vociferous_batched_pipeline = batched
+        audio = (np.ones(90 * SR) * 1000).astype(np.int16)
+
+        text, speech_ms, _ = transcribe(audio, settings, local_model=model, audio_pipeline=self._pipeline(90))
+
+        model.transcribe.assert_not_called()
+        _, kwargs = batched.transcribe.call_args
+        assert kwargs["batch_size"] == 4
+        assert kwargs["vad_filter"] is False
+        assert kwargs["beam_size"] == 5
+        windows = kwargs["clip_timestamps"]
+        assert windows[0]["start"] == 0.0 and windows[-1]["end"] == 90.0
+        assert all(w["end"] - w["start"] <= 30.0 for w in windows)
+        assert text.strip() == "Long form."
+        assert speech_ms == 90_000
+
+    def test_short_audio_stays_sequential(self, fresh_settings):
+        settings = _with_model(fresh_settings, batched_min_seconds=60.0)
+        model = MagicMock()
+        model.transcribe.return_value = self._segments("Short.", 5.0)
+        audio = (np.ones(5 * SR) * 1000).astype(np.int16)
+
+        transcribe(audio, settings, local_model=model, audio_pipeline=self._pipeline(5))
+
+        model.transcribe.assert_called_once()
+        assert "clip_timestamps" not in model.transcribe.call_args.kwargs
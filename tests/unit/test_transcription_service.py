@@ -11,6 +11,7 @@ import pytest
 from src.core.cuda_runtime import CudaRuntimeStatus
 from src.core.exceptions import EngineError
 from src.core.settings import ModelSettings, get_settings
+from src.services.audio_pipeline import CleanSpeech
 from src.services.transcription_service import (
     OpenAICompatibleTranscriptionProvider,
     _merge_segment_texts,
@@ -179,8 +180,8 @@ class TestTranscribeKwargs:
     def _make_fake_pipeline() -> MagicMock:
         """Return a mock AudioPipeline that passes audio through."""
         pipeline = MagicMock()
-        # process() must return valid float32 audio, not None
-        pipeline.process.side_effect = lambda audio, **kw: audio.astype(np.float32)
+        # process_speech() must return valid float32 audio, not None
+        pipeline.process_speech.side_effect = lambda audio, **kw: CleanSpeech(audio.astype(np.float32), [(0, len(audio))])
         return pipeline
 
     def test_initial_prompt_is_passed(self, fresh_settings):
@@ -218,9 +219,14 @@ class TestExternalTranscriptionProvider:
     VALID_GROQ_KEY = "gsk_test_secret_123456789012345678901234567890"
 
     @staticmethod
-    def _settings_with_provider(fresh_settings, provider: str = "groq"):
+    def _settings_with_provider(fresh_settings, provider: str = "groq", **overrides):
         provider_settings = getattr(fresh_settings.model, provider).model_copy(
-            update={"model_id": "whisper-large-v3-turbo", "model_list_enabled": False, "api_key": TestExternalTranscriptionProvider.VALID_GROQ_KEY}
+            update={
+                "model_id": "whisper-large-v3-turbo",
+                "model_list_enabled": False,
+                "api_key": TestExternalTranscriptionProvider.VALID_GROQ_KEY,
+                **overrides,
+            }
         )
         return fresh_settings.model_copy(
             update={
@@ -234,7 +240,7 @@ class TestExternalTranscriptionProvider:
         )
 
     def test_external_provider_posts_wav_to_audio_transcriptions(self, fresh_settings):
-        settings = self._settings_with_provider(fresh_settings)
+        settings = self._settings_with_provider(fresh_settings, upload_format="wav")
         captured: dict[str, object] = {}
 
         class DummyResponse:
@@ -408,7 +414,7 @@ class TestTranscriptionTimingLogs:
     @staticmethod
     def _make_fake_pipeline() -> MagicMock:
         pipeline = MagicMock()
-        pipeline.process.side_effect = lambda audio, **kw: audio.astype(np.float32)
+        pipeline.process_speech.side_effect = lambda audio, **kw: CleanSpeech(audio.astype(np.float32), [(0, len(audio))])
         return pipeline
 
     def test_slow_asr_run_logs_warning_context(self, fresh_settings, caplog):
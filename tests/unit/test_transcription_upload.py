@@ -0,0 +1,276 @@
+"""
+Compressed uploads and chunked fan-out for external transcription.
+
+Upload encoding (FLAC / Opus / WAV fallback), chunk planning at speech
+segment boundaries, ordered stitching of concurrently transcribed pieces,
+and end-to-end latency against a local stub server.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+import threading
+import time
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from src.services.transcription.upload import encode_upload, plan_upload_chunks, wav_bytes
+from src.services.transcription_service import OpenAICompatibleTranscriptionProvider
+
+SR = 16_000
+VALID_GROQ_KEY = "gsk_test_secret_123456789012345678901234567890"
+
+
+def _speech_like(seconds: float, *, amplitude: float = 0.3, seed: int = 0) -> np.ndarray:
+    t = np.arange(int(seconds * SR)) / SR
+    rng = np.random.default_rng(seed)
+    tone = amplitude * np.sin(2 * np.pi * 180 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t))
+    return (tone + rng.normal(0, 0.002, len(t))).astype(np.float32)
+
+
+def _segmented(segment_amplitudes: list[float], *, segment_s: float = 2.0, gap_s: float = 0.3):
+    """Concatenate constant-amplitude segments with quiet gaps; return audio and bounds."""
+    parts: list[np.ndarray] = []
+    bounds: list[tuple[int, int]] = []
+    offset = 0
+    for index, amplitude in enumerate(segment_amplitudes):
+        if index:
+            gap = np.zeros(int(gap_s * SR), dtype=np.float32)
+            parts.append(gap)
+            offset += len(gap)
+        segment = np.full(int(segment_s * SR), amplitude, dtype=np.float32)
+        parts.append(segment)
+        bounds.append((offset, offset + len(segment)))
+        offset += len(segment)
+    return np.concatenate(parts), bounds
+
+
+def _provider(fresh_settings, **overrides):
+    """A Groq provider (not loaded) and the settings it was built from."""
+    groq = fresh_settings.model.groq.model_copy(
+        update={
+            "model_id": "whisper-large-v3-turbo",
+            "model_list_enabled": False,
+            "api_key": VALID_GROQ_KEY,
+            **overrides,
+        }
+    )
+    settings = fresh_settings.model_copy(
+        update={"model": fresh_settings.model.model_copy(update={"provider": "groq", "groq": groq})}
+    )
+    return OpenAICompatibleTranscriptionProvider(settings), settings
+
+
+class TestEncodeUpload:
+    def test_flac_is_lossless_and_smaller_than_wav(self):
+        import av
+
+        audio = _speech_like(10.0)
+        upload = encode_upload(audio, "flac")
+
+        assert upload.as_file()[0] == "speech.flac"
+        assert upload.data.startswith(b"fLaC")
+        assert len(upload.data) < len(wav_bytes(audio)) * 0.75
+
+        with av.open(io.BytesIO(upload.data)) as container:
+            decoded = np.concatenate([frame.to_ndarray().reshape(-1) for frame in container.decode(audio=0)])
+        assert np.array_equal(decoded, (np.clip(audio, -1.0, 1.0) * 32767.0).astype(np.int16))
+
+    def test_opus_is_ogg_and_much_smaller_than_wav(self):
+        audio = _speech_like(10.0)
+        upload = encode_upload(audio, "opus")
+
+        assert upload.content_type == "audio/ogg"
+        assert upload.data.startswith(b"OggS")
+        assert len(upload.data) < len(wav_bytes(audio)) / 8
+
+    def test_missing_pyav_falls_back_to_wav(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "av", None)
+        upload = encode_upload(_speech_like(1.0), "flac")
+
+        assert upload.format == "wav"
+        assert upload.data.startswith(b"RIFF")
+
+    def test_unknown_format_falls_back_to_wav(self):
+        assert encode_upload(_speech_like(1.0), "mp3").format == "wav"
+
+
+class TestPlanUploadChunks:
+    def test_short_audio_is_one_piece(self):
+        assert plan_upload_chunks(SR * 5, [(0, SR * 5)], SR * 10) == [(0, SR * 5)]
+
+    def test_cuts_fall_midway_through_gaps_and_pack_greedily(self):
+        bounds = [(0, 100), (120, 200), (220, 300), (320, 400)]
+        # Gaps are centred on 110, 210 and 310; 250 samples fit two segments.
+        assert plan_upload_chunks(400, bounds, 250) == [(0, 210), (210, 400)]
+
+    def test_pieces_never_split_a_segment_when_a_gap_fits(self):
+        audio, bounds = _segmented([0.1] * 12)
+        pieces = plan_upload_chunks(len(audio), bounds, 5 * SR)
+
+        assert pieces[0][0] == 0 and pieces[-1][1] == len(audio)
+        assert all(end == nxt for (_, end), (nxt, _) in zip(pieces, pieces[1:]))
+        assert all(end - start <= 5 * SR for start, end in pieces)
+        for _, end in pieces[:-1]:
+            assert not any(seg_start < end < seg_end for seg_start, seg_end in bounds)
+
+    def test_overlong_segment_is_cut_at_fixed_intervals(self):
+        assert plan_upload_chunks(250, [(0, 250)], 100) == [(0, 100), (100, 200), (200, 250)]
+        assert plan_upload_chunks(250, None, 100) == [(0, 100), (100, 200), (200, 250)]
+
+
+class _PieceClient:
+    """Fake httpx client: answers each WAV piece with the segments it contains."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.calls += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            with wave.open(io.BytesIO(kwargs["files"]["file"][1])) as wav:
+                samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+            levels = sorted({round(int(value) / 32767 * 100) for value in samples if value > 100})
+            # Earlier pieces answer last, so completion order is scrambled.
+            time.sleep(max(0.0, 0.1 - 0.01 * (levels[0] if levels else 0)))
+            text = " ".join(f"s{level}." for level in levels)
+            return _JsonResponse({"text": text, "duration": len(samples) / SR})
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class _JsonResponse:
+    status_code = 200
+    headers = {"content-type": "application/json"}
+
+    def __init__(self, body: dict) -> None:
+        self._body = body
+        self.text = json.dumps(body)
+
+    def json(self):
+        return self._body
+
+
+class TestChunkedTranscription:
+    def test_long_speech_fans_out_and_stitches_in_order(self, fresh_settings):
+        provider, settings = _provider(fresh_settings, upload_format="wav", max_chunk_seconds=5.0, upload_concurrency=3)
+        client = _PieceClient()
+        provider._client = client
+        audio, bounds = _segmented([(index + 1) / 100 for index in range(8)])
+
+        text, speech_ms, _ = provider.transcribe(audio, settings, segment_bounds=bounds)
+
+        assert client.calls == 4
+        assert 1 < client.max_in_flight <= 3
+        assert text.split() == [f"S{level}." for level in range(1, 9)]
+        assert speech_ms == pytest.approx(len(audio) / SR * 1000, abs=5)
+
+    def test_oversized_encoded_piece_is_split_again(self, fresh_settings):
+        provider, settings = _provider(fresh_settings, upload_format="wav", max_upload_bytes=100_000)
+        client = _PieceClient()
+        provider._client = client
+        audio, bounds = _segmented([0.01, 0.02, 0.03])
+
+        text, _, _ = provider.transcribe(audio, settings, segment_bounds=bounds)
+
+        # 2 s segments are ~64 KB of WAV each; every piece must fit in 100 KB.
+        assert client.calls == 3
+        assert text.split() == ["S1.", "S2.", "S3."]
+
+    def test_failed_piece_fails_the_recording(self, fresh_settings):
+        provider, settings = _provider(fresh_settings, upload_format="wav", max_chunk_seconds=2.5, max_retries=0)
+        audio, bounds = _segmented([0.01, 0.02, 0.03])
+
+        class FailingSecondPiece(_PieceClient):
+            def request(self, method, url, **kwargs):
+                response = super().request(method, url, **kwargs)
+                if "s2." in response.text:
+                    response.status_code = 422
+                return response
+
+        provider._client = FailingSecondPiece()
+        with pytest.raises(RuntimeError, match="could not transcribe"):
+            provider.transcribe(audio, settings, segment_bounds=bounds)
+
+
+class _TranscriptionStub:
+    """Local audio/transcriptions endpoint simulating a fixed-bandwidth uplink."""
+
+    def __init__(self, uplink_bytes_per_s: float) -> None:
+        self.uploaded = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:  # noqa: ANN002
+                pass
+
+            def do_POST(self) -> None:  # noqa: N802
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                stub.uploaded += len(body)
+                time.sleep(len(body) / uplink_bytes_per_s + 0.02)
+                data = json.dumps({"text": "Piece.", "duration": 1.0}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def __enter__(self) -> "_TranscriptionStub":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:  # noqa: ANN002
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestUploadLatency:
+    @pytest.mark.parametrize("minutes", [1, 10, 30])
+    def test_end_to_end_latency_against_stub(self, fresh_settings, minutes, record_property):
+        segment_s = 20.0
+        speech = _speech_like(segment_s)
+        gap = np.zeros(int(0.3 * SR), dtype=np.float32)
+        count = int(minutes * 60 // (segment_s + 0.3))
+        audio = np.concatenate([part for _ in range(count) for part in (speech, gap)])
+        step = len(speech) + len(gap)
+        bounds = [(index * step, index * step + len(speech)) for index in range(count)]
+
+        latency: dict[str, float] = {}
+        uploaded: dict[str, int] = {}
+        # ~20 MB/s uplink keeps the 30-minute WAV baseline to a few seconds.
+        with _TranscriptionStub(uplink_bytes_per_s=20e6) as stub:
+            for fmt in ("wav", "flac"):
+                provider, settings = _provider(fresh_settings, base_url=stub.base_url, upload_format=fmt)
+                stub.uploaded = 0
+                start = time.perf_counter()
+                text, _, _ = provider.transcribe(audio, settings, segment_bounds=bounds)
+                latency[fmt] = time.perf_counter() - start
+                uploaded[fmt] = stub.uploaded
+                assert text.split().count("Piece.") == len(plan_upload_chunks(len(audio), bounds, 600 * SR))
+
+        for fmt in latency:
+            record_property(f"{minutes}min_{fmt}_latency_ms", round(latency[fmt] * 1000))
+            record_property(f"{minutes}min_{fmt}_upload_bytes", uploaded[fmt])
+        assert uploaded["flac"] < uploaded["wav"] * 0.75
@@ -0,0 +1,111 @@
+"""
+Two-pass dictation tests.
+
+With ``model.two_pass`` on, a dictation is decoded greedily and stored at
+once; the same cleaned speech is then decoded with the full beam search in
+the background, and the transcript updated only when that changes the text.
+"""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.core.handlers.recording_handlers import RecordingSession
+from src.core.settings import VociferousSettings
+from src.database.db import TranscriptDB
+from src.services.transcription_service import DRAFT_BEAM_SIZE
+
+
+def _settings(*, auto_refine: bool = False, **model) -> VociferousSettings:
+    settings = VociferousSettings()
+    return settings.model_copy(
+        update={
+            "model": settings.model.model_copy(update={"two_pass": True, **model}),
+            "output": settings.output.model_copy(update={"auto_refine": auto_refine}),
+            "refinement": settings.refinement.model_copy(update={"enabled": auto_refine}),
+        }
+    )
+
+
+@pytest.fixture()
+def db(tmp_path):
+    database = TranscriptDB(db_path=tmp_path / "two_pass.db")
+    yield database
+    database.close()
+
+
+def _session(db: TranscriptDB, settings: VociferousSettings) -> RecordingSession:
+    sess = RecordingSession(
+        audio_service_provider=lambda: None,
+        settings_provider=lambda: settings,
+        db_provider=lambda: db,
+        event_bus_emit=MagicMock(),
+        shutdown_event=threading.Event(),
+        insight_manager_provider=lambda: None,
+    )
+    sess._asr_model = MagicMock()
+    sess._audio_pipeline = MagicMock()
+    return sess
+
+
+def _draft(audio, settings, local_model, audio_pipeline, between_segments=None, beam_size=None, on_speech=None):
+    assert beam_size == DRAFT_BEAM_SIZE
+    on_speech(np.ones(16_000, dtype=np.float32), [(0, 16_000)])
+    return "Their going home.", 1000, 300
+
+
+class TestTwoPassDictation:
+    def test_greedy_draft_stored_then_revised_from_the_same_speech(self, db):
+        session = _session(db, _settings())
+        try:
+            with (
+                patch("src.services.transcription_service.transcribe", side_effect=_draft),
+                patch(
+                    "src.services.transcription_service.transcribe_speech",
+                    return_value=("They're going home.", 1000, 900),
+                ) as accurate,
+            ):
+                session._transcribe_and_store(np.zeros(16_000 * 3, dtype=np.int16))
+                assert session.asr_scheduler.wait_idle(5)
+        finally:
+            session.asr_scheduler.shutdown()
+
+        clean_audio = accurate.call_args.args[0]
+        assert len(clean_audio) == 16_000 and accurate.call_args.kwargs["segment_bounds"] == [(0, 16_000)]
+        assert "beam_size" not in accurate.call_args.kwargs
+        transcript = db.recent(limit=1)[0][0]
+        assert transcript.raw_text == "Their going home."
+        assert transcript.normalized_text == "They're going home." and transcript.retranscription_count == 1
+        events = [call.args[0] for call in session._emit.call_args_list]
+        assert events.count("transcript_updated") == 1
+
+    def test_unchanged_text_leaves_the_draft_alone(self, db):
+        session = _session(db, _settings())
+        try:
+            with (
+                patch("src.services.transcription_service.transcribe", side_effect=_draft),
+                patch(
+                    "src.services.transcription_service.transcribe_speech",
+                    return_value=("Their going home.", 1000, 900),
+                ),
+            ):
+                session._transcribe_and_store(np.zeros(16_000 * 3, dtype=np.int16))
+                assert session.asr_scheduler.wait_idle(5)
+        finally:
+            session.asr_scheduler.shutdown()
+
+        transcript = db.recent(limit=1)[0][0]
+        assert transcript.retranscription_count == 0
+        assert "transcript_updated" not in [call.args[0] for call in session._emit.call_args_list]
+
+    @pytest.mark.parametrize(
+        "settings",
+        [_settings(two_pass=False), _settings(auto_refine=True), _settings(provider="groq")],
+        ids=["disabled", "auto_refine", "remote"],
+    )
+    def test_single_full_decode_otherwise(self, db, settings):
+        assert not RecordingSession._two_pass(settings)
@@ -0,0 +1,200 @@
+"""
+Post-load warm-up tests.
+
+The warm-up passes themselves (decode options, cancellation, external
+providers, non-fatal failures) and how the loaders run them: ASR in the
+lowest scheduler lane before ``ready`` is emitted, the SLM as a preemptible
+bulk job before the state becomes READY.
+"""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.core.handlers.recording_handlers import RecordingSession
+from src.core.refinement.validation import validate_slm_ready
+from src.core.settings import VociferousSettings
+from src.refinement.engine import GenerationCancelled
+from src.services.asr_scheduler import ASRJobPriority, ASRScheduler
+from src.services.slm_runtime import SLMRuntime
+from src.services.slm_types import SLMState
+from src.services.transcription_service import OpenAICompatibleTranscriptionProvider
+from src.services.warmup import warm_up_asr, warm_up_slm, warm_up_vad, warmup_noise
+
+
+def _settings(**residency) -> VociferousSettings:
+    settings = VociferousSettings()
+    return settings.model_copy(update={"residency": settings.residency.model_copy(update=residency)})
+
+
+class FakeWhisper:
+    def __init__(self, segments: int = 3) -> None:
+        self.calls: list[dict] = []
+        self.consumed = 0
+        self.segments = segments
+        self.threads: list[str] = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append({"samples": len(audio), "dtype": audio.dtype, **options})
+        self.threads.append(threading.current_thread().name)
+
+        def segments():
+            for index in range(self.segments):
+                self.consumed += 1
+                yield SimpleNamespace(text=f"noise {index}", end=0.5)
+
+        return segments(), None
+
+
+class TestWarmupPasses:
+    def test_noise_is_one_quiet_second(self):
+        noise = warmup_noise()
+
+        assert len(noise) == 16_000 and abs(noise).max() <= 32
+
+    def test_asr_decodes_noise_with_the_real_options(self):
+        model = FakeWhisper()
+
+        result = warm_up_asr(model, _settings())
+
+        call = model.calls[0]
+        assert call["samples"] == 16_000 and str(call["dtype"]) == "float32"
+        assert call["beam_size"] == 5 and call["language"] == "en"
+        assert model.consumed == 3
+        assert result.cancelled is False and result.error is None and result.ms >= 0
+
+    def test_asr_stops_at_the_next_segment_when_asked(self):
+        model = FakeWhisper(segments=5)
+        calls = iter([False, True])
+
+        result = warm_up_asr(model, _settings(), should_stop=lambda: next(calls, True))
+
+        assert result.cancelled is True
+        assert model.consumed == 1
+
+    def test_external_asr_and_slm_providers_are_skipped(self):
+        asr = MagicMock(spec=OpenAICompatibleTranscriptionProvider)
+        slm = MagicMock()
+        slm.get_runtime_summary.return_value = {"resolved_device": "external"}
+
+        assert warm_up_asr(asr, _settings()) is None
+        assert warm_up_slm(slm) is None
+        slm.generate_custom.assert_not_called()
+
+    def test_failures_are_recorded_not_raised(self):
+        model = MagicMock()
+        model.transcribe.side_effect = RuntimeError("CUDA out of memory")
+
+        result = warm_up_asr(model, _settings())
+
+        assert result.error == "CUDA out of memory" and result.cancelled is False
+
+    def test_vad_runs_the_full_pipeline(self):
+        pipeline = MagicMock()
+
+        result = warm_up_vad(pipeline)
+
+        (audio,), kwargs = pipeline.process.call_args
+        assert len(audio) == 16_000 and kwargs == {"sample_rate": 16_000}
+        assert result.cancelled is False
+
+    def test_slm_generation_is_cancellable(self):
+        provider = MagicMock()
+        provider.supports_cancellation = True
+        provider.get_runtime_summary.return_value = {"resolved_device": "cpu"}
+
+        def generate_custom(**kwargs):
+            assert kwargs["max_tokens"] == 4 and kwargs["temperature"] == 0.0
+            if kwargs["should_cancel"]():
+                raise GenerationCancelled("stopped")
+
+        provider.generate_custom.side_effect = generate_custom
+
+        assert warm_up_slm(provider).cancelled is False
+        assert warm_up_slm(provider, should_stop=iter([False, True]).__next__).cancelled is True
+
+
+class TestSchedulerCancellation:
+    def test_urgent_pending_sees_work_from_a_more_urgent_lane(self):
+        scheduler = ASRScheduler()
+        started, release = threading.Event(), threading.Event()
+        seen: list[bool] = []
+
+        def warmup_job():
+            started.set()
+            release.wait(5)
+            seen.append(scheduler.urgent_pending())
+
+        try:
+            warmup = scheduler.submit(warmup_job, priority=ASRJobPriority.IMPORT, label="warmup")
+            started.wait(5)
+            assert scheduler.urgent_pending() is False  # nothing queued yet
+            dictation = scheduler.submit(lambda: "text", priority=ASRJobPriority.DICTATION, label="dictation")
+            release.set()
+            warmup.result(timeout=5)
+            assert dictation.result(timeout=5) == "text"
+            assert seen == [True]
+        finally:
+            scheduler.shutdown()
+
+
+class TestLoaders:
+    def _session(self, settings: VociferousSettings, emit: MagicMock) -> RecordingSession:
+        return RecordingSession(
+            audio_service_provider=lambda: None,
+            settings_provider=lambda: settings,
+            db_provider=lambda: None,
+            event_bus_emit=emit,
+            shutdown_event=threading.Event(),
+            insight_manager_provider=lambda: None,
+        )
+
+    def test_asr_warms_up_on_the_scheduler_before_reporting_ready(self):
+        model = FakeWhisper()
+        model._vociferous_runtime_summary = {"model_id": "fake"}
+        order: list[tuple[str, int]] = []
+        emit = MagicMock(side_effect=lambda *_: order.append(("emit", model.consumed)))
+        session = self._session(_settings(), emit)
+        try:
+            with patch("src.services.transcription_service.create_local_model", return_value=model):
+                session.load_asr_model()
+
+            assert order == [("emit", 3)]  # ready only after the warm-up decoded
+            assert model.threads == ["asr-scheduler"]
+            summary = session.get_asr_runtime_summary()
+            assert summary["warmup_cancelled"] is False and summary["warmup_ms"] >= 0
+        finally:
+            session.asr_scheduler.shutdown()
+
+    def test_asr_warmup_can_be_turned_off(self):
+        model = FakeWhisper()
+        session = self._session(_settings(warmup_after_load=False), MagicMock())
+        try:
+            with patch("src.services.transcription_service.create_local_model", return_value=model):
+                session.load_asr_model()
+
+            assert model.calls == []
+        finally:
+            session.asr_scheduler.shutdown()
+
+    def test_slm_accepts_refinement_while_warming_up_and_records_the_duration(self, fresh_settings):
+        runtime = SLMRuntime(settings_provider=lambda: fresh_settings)
+        provider = MagicMock()
+        provider.supports_cancellation = True
+        provider.get_runtime_summary.return_value = {"provider": "local_ct2", "resolved_device": "cpu"}
+        during: list[tuple[SLMState, str | None]] = []
+
+        def generate_custom(**kwargs):
+            during.append((runtime.state, validate_slm_ready(runtime)[1]))
+
+        provider.generate_custom.side_effect = generate_custom
+        runtime.state = SLMState.LOADING
+        with patch("src.services.slm_runtime.make_refinement_provider", return_value=provider):
+            runtime._load_model_task()
+
+        assert during == [(SLMState.LOADING, None)]
+        assert runtime.state is SLMState.READY and runtime.is_warming_up is False
+        assert runtime.get_runtime_summary()["warmup_ms"] >= 0
+        assert runtime.get_scheduler_metrics()["completed"] == 1